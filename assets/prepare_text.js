@@ -1,9 +1,10 @@
 /**
- * Shared text preparation logic used by both the worker and the main-thread fallback.
+ * Shared text preparation logic used by the worker, both for single requests and for the worker pool.
  *
  * @param {Object} p
  * @param {string|null} p.generatorName - Name of the string generator, or null for custom text
  * @param {number|null} p.limit - Maximum string length for generated strings
+ * @param {boolean} [p.exact] - Whether to generate a prefix of exactly p.limit letters instead of the largest fitting order
  * @param {string|null} p.customText - Custom text (when generatorName is null)
  * @param {string} p.placeholder - Placeholder text when no text is available
  * @param {string} p.transformSelection - Transform to apply ('none', 'custom', or a DS name)
@@ -12,9 +13,10 @@
  * @param {string} p.prepend - Text to prepend
  * @param {string} p.append - Text to append
  * @param {boolean} p.dollar - Whether to append null terminator
+ * @param {Object} [cache] - ResultCache reused for the transform, if given
  * @returns {{ text: string, generator_order: number|null }}
  */
-function prepare_text(p) {
+function prepare_text(p, cache) {
 	let text, generator_order = null;
 
 	// Step 1: Generate or use provided text
@@ -23,16 +25,21 @@ function prepare_text(p) {
 		if (!gen) {
 			return { text: '', generator_order: null };
 		}
-		const lengths = generator_lengths[p.generatorName];
-		let order = -1;
-		if (lengths) {
-			for (let i = 0; i < lengths.length; i++) {
-				if (lengths[i] <= p.limit) order = i;
-				else break;
+		const prefix = string_generator_prefixes[p.generatorName];
+		if (p.exact && prefix) {
+			text = prefix(p.limit);
+		} else {
+			const lengths = generator_lengths[p.generatorName];
+			let order = -1;
+			if (lengths) {
+				for (let i = 0; i < lengths.length; i++) {
+					if (lengths[i] <= p.limit) order = i;
+					else break;
+				}
 			}
+			text = order >= 0 ? gen(order) : '';
+			generator_order = order;
 		}
-		text = order >= 0 ? gen(order) : '';
-		generator_order = order;
 	} else {
 		text = p.customText || '';
 	}
@@ -42,7 +49,7 @@ function prepare_text(p) {
 	// Step 2: Apply transform
 	const sel = p.transformSelection;
 	if (sel && sel !== 'none' && sel !== 'custom') {
-		const tDS = build_ds(text, structure_flags[sel]);
+		const tDS = build_ds(text, structure_flag_set([sel]), undefined, cache);
 		if (tDS && tDS[sel] !== undefined) text = tDS[sel];
 	} else if (sel === 'custom' && p.customTransformActive && p.customFnSource) {
 		var ret = '';
@@ -319,7 +319,23 @@ function orderToSlider(order, lengths) {
 	return Math.round(order / (lengths.length - 1) * SLIDER_MAX);
 }
 
+// With exact lengths, the slider covers the lengths 1 to GENERATOR_MAX_LENGTH on a logarithmic scale.
+const GENERATOR_MAX_LENGTH = 1 << 22;
+
+function exactLengthEnabled() {
+	return !!options_list && options_list.enabled("exactlength") && !!string_generator_prefixes[qa_generate_string_list.value];
+}
+
+function sliderToLength(sliderVal) {
+	return Math.max(1, Math.round(Math.pow(GENERATOR_MAX_LENGTH, sliderVal / SLIDER_MAX)));
+}
+
+function lengthToSlider(length) {
+	return Math.round(Math.log(Math.max(1, Math.min(length, GENERATOR_MAX_LENGTH))) / Math.log(GENERATOR_MAX_LENGTH) * SLIDER_MAX);
+}
+
 function currentLimit() {
+	if (exactLengthEnabled()) return sliderToLength(parseInt(qa_generate_string_range.value));
 	const lengths = currentGeneratorLengths();
 	if (!lengths) return null;
 	return lengths[sliderToOrder(parseInt(qa_generate_string_range.value), lengths)];
@@ -328,7 +344,7 @@ function currentLimit() {
 function updateOrderLabel() {
 	if (!qa_generate_string_order) return;
 	const lengths = currentGeneratorLengths();
-	if (!lengths) {
+	if (!lengths || exactLengthEnabled()) {
 		qa_generate_string_order.textContent = '';
 		return;
 	}
@@ -341,6 +357,12 @@ function updateSliderForGenerator(targetLength) {
 	if (!lengths) return;
 	qa_generate_string_range.min = 0;
 	qa_generate_string_range.max = SLIDER_MAX;
+	if (exactLengthEnabled()) {
+		qa_generate_string_range.value = lengthToSlider(targetLength);
+		qa_generate_string_rank.innerHTML = currentLimit();
+		updateOrderLabel();
+		return;
+	}
 	const order = orderForLength(lengths, targetLength);
 	qa_generate_string_range.value = orderToSlider(order, lengths);
 	qa_generate_string_rank.innerHTML = lengths[order];
@@ -348,56 +370,123 @@ function updateSliderForGenerator(targetLength) {
 }
 
 
-function prettify_row(ds_text, dsName, varDs, varSep, varBase, do_padding) {
+// Formats the columns [start, end) of a row, or the whole row if no window is given; windows are padded like the whole row.
+function prettify_row(ds_text, dsName, varDs, varSep, varBase, do_padding, start, end) {
+	const length = varDs.length;
+	const n = ds_text.length;
+	if (start !== undefined) {
+		varDs = qa_slice(varDs, start, end);
+		ds_text = ds_text.substring(start, end);
+	}
 	if (structures_list.isIndex(dsName)) {
 		if (varBase != 0) {
 			varDs = increment_array(varDs);
 		}
-		varDs = replace_invalid_position(varDs, varBase + ds_text.length);
+		varDs = replace_invalid_position(varDs, varBase + n);
 	}
 	const ds_htmlname = ds_name2html[dsName] ? ds_name2html[dsName] : dsName;
 	if (structures_list.isString(dsName)) {
 		varDs = varDs.split('\0').join("$");
 	}
-	if (!do_padding) { return { 'name': ds_htmlname, 'data': varDs }; }
+	if (!do_padding) {
+		// the exporters recognize factorizations by their boolean entries
+		if (structures_list.isFactorization(dsName) && ArrayBuffer.isView(varDs)) varDs = Array.from(varDs, Boolean);
+		return { 'name': ds_htmlname, 'data': varDs };
+	}
 
 	if (structures_list.isString(dsName)) {
 		if (options_list.enabled("whitespace")) {
 			varDs = encodeWhitespaces(varDs);
 		}
-		varDs = prettify_string(varDs, varSep, varBase, options_list.enabled("tabularize"));
+		varDs = prettify_string(varDs, varSep, varBase, options_list.enabled("tabularize"), length);
 	} else if (structures_list.isFactorization(dsName)) {
 		if (options_list.enabled("facttext")) {
-			varDs = prettify_factorization(options_list.enabled("whitespace") ? encodeWhitespaces(ds_text) : ds_text, varDs, varSep, varBase);
+			varDs = prettify_factorization(options_list.enabled("whitespace") ? encodeWhitespaces(ds_text) : ds_text, varDs, varSep, varBase, length);
 		} else {
-			varDs = prettify_array(varDs.map((b) => b ? 1 : 0), varSep, varBase);
+			varDs = prettify_array(Array.from(varDs, (b) => b ? 1 : 0), varSep, varBase, length);
 		}
 	} else {
-		varDs = prettify_array(varDs, varSep, varBase);
+		varDs = prettify_array(varDs, varSep, varBase, length);
 	}
 	return { 'name': ds_htmlname, 'data': varDs };
 }
 
-function fill_updates(DS) {
-	const varSep = decodeWhitespaces(qa_separator_input.value);
+function qa_slice(value, start, end) {
+	if (typeof value === 'string') return value.substring(start, end);
+	return ArrayBuffer.isView(value) ? value.subarray(start, end) : value.slice(start, end);
+}
+
+// Texts longer than this are shown in a window of columns that fits the width of the output area.
+const QA_WINDOW_MIN_LENGTH = 1024;
+// The structures currently shown; the window slider and the download read them.
+var qa_shown_DS = null;
+var qa_char_width = 0;
+
+// Number of columns of width `cell` (plus separator) that fit next to the row names.
+function qa_window_columns(cell, sep, pad) {
+	if (qa_char_width === 0) {
+		const context = document.createElement('canvas').getContext('2d');
+		if (context) {
+			context.font = window.getComputedStyle(qa_ds_output).font;
+			qa_char_width = context.measureText('0123456789').width / 10;
+		}
+		if (!qa_char_width) qa_char_width = 8;
+	}
+	const chars = Math.floor(qa_ds_output.clientWidth / qa_char_width) - pad - 4;
+	return Math.max(8, Math.floor(chars / (cell + sep.length)));
+}
 
+// Width of the longest name of an enabled structure.
+function qa_row_name_pad() {
 	let pad = 0;
 	structures_list.forEachEnabled(function (dsName) {
 		const ds_htmlname = ds_name2html[dsName] ? ds_name2html[dsName] : dsName;
 		if (ds_htmlname.length > pad) pad = ds_htmlname.length;
 	});
+	return pad;
+}
 
-	const varBase = options_list.enabled("baseone") ? 1 : 0;
-
+// Rows of the enabled structures, restricted to the columns [start, end) if given.
+function qa_collect_rows(DS, varSep, varBase, do_padding, start, end) {
 	const rows = [];
 	structures_list.forEachEnabled(function (dsName) {
 		let varDs = DS[dsName];
+		// While results are streaming in, unfinished structures are marked in plain output and left out of the exporters.
+		if (DS['__partial'] && varDs === undefined) {
+			if (do_padding) rows.push({ 'name': ds_name2html[dsName] ? ds_name2html[dsName] : dsName, 'data': '…' });
+			return;
+		}
 		if (!varDs) {
 			rows.push("Function " + dsName + ": not defined");
 			return;
 		}
-		rows.push(prettify_row(DS['text'], dsName, varDs, varSep, varBase, qa_output_select.value == 'plain'));
+		rows.push(prettify_row(DS['text'], dsName, varDs, varSep, varBase, do_padding, start, end));
 	});
+	return rows;
+}
+
+function fill_updates(DS) {
+	qa_shown_DS = DS;
+	const varSep = decodeWhitespaces(qa_separator_input.value);
+	const pad = qa_row_name_pad();
+	const varBase = options_list.enabled("baseone") ? 1 : 0;
+
+	// Only the columns inside the window are formatted, so the cost depends on what is visible, not on n.
+	const n = DS['text'].length;
+	let start, end;
+	if (n > QA_WINDOW_MIN_LENGTH) {
+		const columns = Math.min(n, qa_window_columns(String(n + varBase - 1).length, varSep, pad));
+		qa_window_range.max = n - columns;
+		start = Math.min(Number(qa_window_range.value), n - columns);
+		end = start + columns;
+		qa_window_label.textContent = `columns ${start + varBase}–${end - 1 + varBase} of ${n}`
+			+ (qa_output_select.value == 'plain' ? '' : ' (download for the whole table)');
+		qa_window.classList.remove('qa-hidden');
+	} else {
+		qa_window.classList.add('qa-hidden');
+	}
+
+	const rows = qa_collect_rows(DS, varSep, varBase, qa_output_select.value == 'plain', start, end);
 
 	if (qa_output_select.value == 'plain') {
 		const result = rows.map((row) => { return pad_right(row.name + ":", ' ', pad + 2) + row.data; });
@@ -444,7 +533,7 @@ function fill_updates(DS) {
 			let varDs = DS["counter_" + dsName];
 			const ds_htmlname = counter_name2html[dsName] ? counter_name2html[dsName] : dsName;
 			if (varDs === undefined) {
-				result.push(dsName + ": not defined");
+				result.push(DS['__partial'] ? ds_htmlname + ": " + wrapVal('…') : dsName + ": not defined");
 			} else {
 				result.push(ds_htmlname + ": " + wrapVal(varDs));
 			}
@@ -455,6 +544,59 @@ function fill_updates(DS) {
 	updateTextAreas();
 }
 
+// Yields the whole table of DS in the given format, one plain row or a few thousand cells at a time.
+function* qa_export_chunks(DS, format) {
+	const varSep = decodeWhitespaces(qa_separator_input.value);
+	const varBase = options_list.enabled("baseone") ? 1 : 0;
+	if (format == 'plain') {
+		const pad = qa_row_name_pad();
+		const names = [];
+		structures_list.forEachEnabled(function (dsName) { names.push(dsName); });
+		let first = true;
+		for (const dsName of names) {
+			if (!DS[dsName]) continue;
+			const row = prettify_row(DS['text'], dsName, DS[dsName], varSep, varBase, true);
+			yield (first ? '' : '\n') + pad_right(row.name + ":", ' ', pad + 2) + row.data;
+			first = false;
+		}
+		return;
+	}
+	const rows = qa_collect_rows(DS, varSep, varBase, false);
+	if (format == 'latex') yield* export_latex_chunks(rows);
+	else if (format == 'markdown') yield* export_markdown_chunks(rows);
+	else yield* export_csv_chunks(rows);
+}
+
+const QA_EXPORT_EXTENSIONS = { plain: 'txt', latex: 'tex', markdown: 'md', csv: 'csv' };
+
+// Writes the shown structures in the selected format into a downloaded file. The chunks are
+// produced in slices of a few milliseconds, so the page stays responsive for large texts.
+function qa_download_export() {
+	if (qa_shown_DS === null || qa_shown_DS['__partial']) return;
+	const format = qa_output_select.value;
+	const chunks = qa_export_chunks(qa_shown_DS, format);
+	const parts = [];
+	qa_download_button.disabled = true;
+	function step() {
+		const deadline = performance.now() + 12;
+		for (let next = chunks.next(); !next.done; next = chunks.next()) {
+			parts.push(next.value);
+			if (performance.now() > deadline) {
+				setTimeout(step, 0);
+				return;
+			}
+		}
+		const url = URL.createObjectURL(new Blob(parts, { type: 'text/plain;charset=utf-8' }));
+		const link = document.createElement('a');
+		link.href = url;
+		link.download = 'quickarrays.' + QA_EXPORT_EXTENSIONS[format];
+		link.click();
+		setTimeout(() => URL.revokeObjectURL(url), 0);
+		qa_download_button.disabled = false;
+	}
+	step();
+}
+
 var qa_worker = null;
 var qa_is_loaded = false;
 var qa_timeout_id = null;
@@ -465,53 +607,45 @@ function updateArrays() {
 	}
 
 	update_history();
-	if (qa_worker !== null) {
-		clearTimeout(qa_timeout_id);
-		qa_timeout_id = null;
-		qa_worker.terminate()
-		qa_worker = null;
-		if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
-		qa_computation_status.textContent = `Killed due to more recent request.`
-	}
 	qa_separator_input.value = encodeWhitespaces(qa_separator_input.value);
 	updateWhitespaces();
 
 
-	let enabled_flag = 0;
+	// Only the named structures and counters are returned; their dependencies are built and dropped inside build_ds.
+	const enabled_names = [];
 	structures_list.forEachEnabled(function (dsName) {
-		enabled_flag |= structure_flags[dsName];
+		enabled_names.push(dsName);
 	});
 	counters_list.forEachEnabled(function (dsName) {
-		if (structure_flags[dsName]) {
-			enabled_flag |= structure_flags[dsName];
-		}
-		const countername = "counter_" + dsName;
-		if (structure_flags[countername]) {
-			enabled_flag |= structure_flags[countername];
-		}
+		enabled_names.push("counter_" + dsName);
 	});
 
 	// Always compute n and sigma
-	if (structure_flags.counter_n) enabled_flag |= structure_flags.counter_n;
-	if (structure_flags.counter_sigma) enabled_flag |= structure_flags.counter_sigma;
+	enabled_names.push("counter_n");
+	enabled_names.push("counter_sigma");
 
 	// In auto mode, enable counters whose associated structures are currently enabled
 	if (qa_counter_automatic.checked) {
+		structures_list.forEachEnabled(function (dsName) {
+			enabled_names.push("counter_" + dsName);
+		});
 		for (const dsName in counter_structures) {
 			const associated = counter_structures[dsName];
 			if (!associated.some(s => structures_list.enabled(s))) continue;
-			const flag = structure_flags["counter_" + dsName];
-			if (flag) enabled_flag |= flag;
+			enabled_names.push("counter_" + dsName);
 		}
 	}
+	// Unknown names are ignored, so counters without a count_ function simply drop out.
+	const enabled_flags = structure_flag_set(enabled_names);
 
-	// Build params — shared between worker and fallback path
+	// Build params — shared between the single worker and the worker pool
 	const transformSelection = qa_transform_list.value;
 	let workerParams;
 	if (qa_generate_string_list.value !== 'custom') {
 		workerParams = {
 			generatorName: qa_generate_string_list.value,
 			limit: currentLimit(),
+			exact: exactLengthEnabled(),
 			customText: null,
 			placeholder: qa_text.placeholder,
 		};
@@ -532,84 +666,349 @@ function updateArrays() {
 	workerParams.prepend = qa_prepend_input.value;
 	workerParams.append = qa_append_input.value;
 	workerParams.dollar = options_list.enabled("dollar");
-	workerParams.enabled_flag = enabled_flag;
+	workerParams.persist = options_list.enabled("persist");
+	workerParams.enabled_flags = enabled_flags;
+	// timing and heap sampling cost time and one message per structure, so they are opt-in
+	workerParams.profile = options_list.enabled("profile");
 
-	const script_elements = document.querySelectorAll('script[type="text/js-worker"]');
-	if (!script_elements || !script_elements[0].innerHTML) {
+	// The structures are only built in workers, so the page does not load the algorithms.
+	if (document.querySelectorAll('script[type="text/js-worker"]').length === 0) {
 		qa_computation_status.textContent = `⚠️ Warning: No worker scripts found!`;
 		qa_timeout_range.disabled = true;
-		const prepared = prepare_text(workerParams);
-		if (prepared.transformError) {
-			alert("Error in transformation: " + prepared.transformError);
-			setTransformActive(false);
-		}
-		if (qa_generate_string_order) {
-			qa_generate_string_order.textContent = prepared.generator_order !== null ? '(order ' + prepared.generator_order + ')' : '';
-		}
-		const DS = build_ds(prepared.text, enabled_flag);
-		DS['text'] = prepared.text;
-		fill_updates(DS);
 		return;
 	}
 
-	const blob = new Blob(
-		Array.prototype.map.call(
-			document.querySelectorAll("script[type='text/js-worker']"),
-			(script) => script.textContent,
-		),
-		{ type: "text/javascript" },
-	);
+	qa_cancel_partial();
+	if (options_list.enabled("parallel")) {
+		qa_parallel_request(workerParams, enabled_flags);
+		return;
+	}
+	if (qa_pool_request !== null) qa_pool_cancel();
+
+	if (qa_worker === null) qa_spawn_worker();
+	// A newer request supersedes the pending one; the worker skips it or its result is discarded.
+	workerParams.generation = ++qa_generation;
+	qa_request = { generation: workerParams.generation, params: workerParams, time_now: Date.now(), partial_profile: [], DS: { __partial: true } };
+	show_profile(qa_request.partial_profile);
+	qa_post_request(qa_request);
+}
 
-	// Creating a new global "worker" variable from all our "text/js-worker" scripts.
-	const blobURL = window.URL.createObjectURL(blob);
+// The worker is compiled once from all "text/js-worker" scripts and kept alive across requests.
+// Scripts given by their src instead of inline code are loaded by the worker itself.
+var qa_worker_url = null;
+// Generation of the newest request; results of older generations are stale.
+var qa_generation = 0;
+// Generation the worker is currently computing, or -1 if it is idle.
+var qa_worker_running = -1;
+// The newest request still waiting for its result: { generation, params, time_now, partial_profile, DS },
+// where DS collects the structures streamed in so far.
+var qa_request = null;
+
+function qa_worker_blob_url() {
+	if (qa_worker_url === null) {
+		const blob = new Blob(
+			Array.prototype.map.call(
+				document.querySelectorAll("script[type='text/js-worker']"),
+				(script) => script.textContent || `importScripts(${JSON.stringify(script.src)});\n`,
+			),
+			{ type: "text/javascript" },
+		);
+		qa_worker_url = window.URL.createObjectURL(blob);
+	}
+	return qa_worker_url;
+}
+
+function qa_spawn_worker() {
+	qa_worker = new Worker(qa_worker_blob_url());
+	qa_worker_running = -1;
+	qa_worker.onmessage = qa_worker_message;
+	qa_worker.onerror = qa_worker_error;
+}
+
+function qa_post_request(request) {
+	clearTimeout(qa_timeout_id);
 	const timeout_seconds = Number(qa_timeout_range.value);
 	qa_computation_status.textContent = `Computing... (timeout: ${timeout_seconds}s)`;
-
-	const time_now = Date.now();
+	if (qa_loading_spinner) qa_loading_spinner.classList.add('qa-spinning');
 	qa_timeout_id = timeout_seconds > 0
-		? setTimeout(() => {
-			qa_worker.terminate()
-			qa_worker = null;
-			if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
-			qa_computation_status.textContent = `Killed after ${timeout_seconds}s`
-			qa_ds_output.value = `Timeout: killed after ${timeout_seconds}s.\n(limit can be adjusted below)`;
-		updateTextArea(qa_ds_output);
+		? setTimeout(() => qa_worker_timeout(request, timeout_seconds), timeout_seconds * 1000)
+		: null;
+	qa_worker.postMessage(request.params);
+}
+
+// Hard-terminates the worker and pre-spawns a fresh one. If the worker was still busy with
+// a stale request, the current request gets a new worker and a new timeout instead of failing.
+function qa_worker_timeout(request, timeout_seconds) {
+	qa_timeout_id = null;
+	const busy_with_stale = qa_worker_running !== -1 && qa_worker_running !== request.generation;
+	qa_worker.terminate();
+	qa_spawn_worker();
+	if (busy_with_stale) {
+		qa_post_request(request);
+		return;
+	}
+	qa_request = null;
+	qa_show_killed(timeout_seconds, request.partial_profile, '(killed while building the next structure)', request.DS);
+}
+
+// Structures finished before the timeout stay on screen; only the unfinished ones are marked.
+function qa_show_killed(timeout_seconds, profile, note, DS) {
+	qa_cancel_partial();
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `Killed after ${timeout_seconds}s`
+	show_profile(profile, note);
+	if (DS && DS['text'] !== undefined) {
+		fill_updates(DS);
+		qa_computation_status.textContent += ', showing the finished structures';
 		qa_counter_output.querySelectorAll('.qa-counter-value').forEach(span => {
-			span.textContent = '?';
+			if (span.textContent === '…') span.textContent = '?';
 		});
-		}, timeout_seconds * 1000)
-		: null
+		return;
+	}
+	qa_ds_output.value = `Timeout: killed after ${timeout_seconds}s.\n(limit can be adjusted below)`;
+	updateTextArea(qa_ds_output);
+	qa_counter_output.querySelectorAll('.qa-counter-value').forEach(span => {
+		span.textContent = '?';
+	});
+}
+
+function qa_worker_error(error) {
+	error.preventDefault();
+	const failed = qa_request !== null && qa_worker_running === qa_request.generation;
+	qa_worker_running = -1;
+	if (!failed) return;
+	clearTimeout(qa_timeout_id);
+	qa_request = null;
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `Error during computation: ${error.message}`;
+}
 
-	qa_worker = new Worker(blobURL); //
+function qa_worker_message(event) {
+	const data = event.data;
+	if (data.__started !== undefined) {
+		qa_worker_running = data.__started;
+		return;
+	}
+	const current = qa_request !== null && data.__generation === qa_request.generation;
+	if (data.__profile_entry) {
+		if (current) qa_request.partial_profile.push(data.__profile_entry);
+		return;
+	}
+	if (data.__text !== undefined) {
+		if (current) qa_request.DS['text'] = data.__text;
+		return;
+	}
+	if (data.__result !== undefined) {
+		if (!current) return;
+		qa_request.DS[data.__result] = data.value;
+		qa_render_partial(qa_request.DS);
+		return;
+	}
+	qa_worker_running = -1;
+	if (!current) return;
+
+	const time_now = qa_request.time_now;
+	const DS = Object.assign(qa_request.DS, data);
+	delete DS['__partial'];
+	qa_request = null;
+	qa_show_result(DS, time_now);
+}
+
+var qa_partial_timer = null;
+var qa_partial_DS = null;
+
+// Renders the structures received so far, at most once per 100ms.
+function qa_render_partial(DS) {
+	qa_partial_DS = DS;
+	if (qa_partial_timer !== null) return;
+	qa_partial_timer = setTimeout(() => {
+		qa_partial_timer = null;
+		if (qa_partial_DS !== null && qa_partial_DS['text'] !== undefined) fill_updates(qa_partial_DS);
+	}, 100);
+}
+
+function qa_cancel_partial() {
+	clearTimeout(qa_partial_timer);
+	qa_partial_timer = null;
+	qa_partial_DS = null;
+}
+
+// Shows a finished computation: the structures of DS plus its __-prefixed bookkeeping fields.
+function qa_show_result(DS, time_now) {
+	clearTimeout(qa_timeout_id);
+	qa_cancel_partial();
+	show_profile(DS['__profile']);
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `✅ Computation finished in ${((Date.now() - time_now) / 1000).toFixed(2)}s`;
+
+	if (DS['__transformError']) {
+		alert("Error in transformation: " + DS['__transformError']);
+		setTransformActive(false);
+	}
+	if (qa_generate_string_order) {
+		const order = DS['__generator_order'];
+		qa_generate_string_order.textContent = order !== null ? '(order ' + order + ')' : '';
+	}
+	fill_updates(DS);
+}
+
+// Parallel mode: the page schedules the structures of a request over a pool of
+// navigator.hardwareConcurrency workers, starting each structure as soon as its dependencies are built.
+// The text and integer-array results live in SharedArrayBuffers when the page is cross-origin isolated;
+// otherwise they are copied to the workers by structured cloning.
+var qa_pool = [];
+// The parallel request in flight: { generation, enabled_flags, time_now, DS } while its text is prepared,
+// then also { text, waiting, consumers, values, requested, running, done, total }.
+var qa_pool_request = null;
+
+function qa_pool_worker(slot) {
+	const entry = { worker: new Worker(qa_worker_blob_url()), task: null };
+	entry.worker.onmessage = (event) => qa_pool_message(entry, event.data);
+	entry.worker.onerror = (error) => qa_pool_error(entry, error);
+	qa_pool[slot] = entry;
+}
+
+// Drops the request in flight; workers still busy with it are replaced by fresh ones.
+function qa_pool_cancel() {
+	qa_pool_request = null;
+	for (let i = 0; i < qa_pool.length; i++) {
+		if (qa_pool[i].task === null) continue;
+		qa_pool[i].worker.terminate();
+		qa_pool_worker(i);
+	}
+}
+
+function qa_parallel_request(params, enabled_flags) {
+	qa_pool_cancel();
+	clearTimeout(qa_timeout_id);
+	// A computation of the single worker still running is stale from now on.
+	qa_request = null;
+	const request = { generation: ++qa_generation, enabled_flags: enabled_flags, profile: params.profile, time_now: Date.now(), DS: null };
+	qa_pool_request = request;
+
+	const timeout_seconds = Number(qa_timeout_range.value);
+	qa_computation_status.textContent = `Computing... (timeout: ${timeout_seconds}s)`;
 	if (qa_loading_spinner) qa_loading_spinner.classList.add('qa-spinning');
+	qa_timeout_id = timeout_seconds > 0
+		? setTimeout(() => qa_pool_timeout(request, timeout_seconds), timeout_seconds * 1000)
+		: null;
+
+	const size = Math.max(1, navigator.hardwareConcurrency || 1);
+	for (let i = qa_pool.length; i < size; i++) qa_pool_worker(i);
+	// The text is prepared by a worker too, since generators and transforms are not loaded by the page.
+	const entry = qa_pool[0];
+	entry.task = 'text';
+	entry.worker.postMessage({ __prepare: params, __generation: request.generation });
+}
 
-	qa_worker.onerror = (error) => {
-		clearTimeout(qa_timeout_id);
-		qa_worker.terminate();
-		qa_worker = null;
-		if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
-		qa_computation_status.textContent = `Error during computation: ${error.message}`;
-	};
-	qa_worker.postMessage(workerParams);
-	qa_worker.onmessage = (event) => {
-		clearTimeout(qa_timeout_id);
-		const DS = event.data;
-		qa_worker.terminate();
-		qa_worker = null;
-		if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
-		qa_computation_status.textContent = `✅ Computation finished in ${((Date.now() - time_now) / 1000).toFixed(2)}s`;
-
-		if (DS['__transformError']) {
-			alert("Error in transformation: " + DS['__transformError']);
-			setTransformActive(false);
-		}
-		if (qa_generate_string_order) {
-			const order = DS['__generator_order'];
-			qa_generate_string_order.textContent = order !== null ? '(order ' + order + ')' : '';
-		}
-		fill_updates(DS);
-	};
+// Schedules the structures of a request once its text is prepared.
+function qa_pool_prepared(request, prepared) {
+	const text = prepared.text;
+	const DS = { text: text, __generator_order: prepared.generator_order, __profile: [], __partial: true };
+	request.DS = DS;
+	if (prepared.transformError) DS['__transformError'] = prepared.transformError;
+	if (text.length === 0) {
+		qa_pool_request = null;
+		delete DS['__partial'];
+		qa_show_result(DS, request.time_now);
+		return;
+	}
+	DS['counter_text'] = prepared.counter_text;
+
+	// Structures in construction order, and how many of them consume each structure.
+	const need = structure_closure_of(request.enabled_flags);
+	const waiting = [];
+	const consumers = {};
+	for (const name in structure_flags) {
+		const flag = structure_flags[name];
+		if (!(need[flag[0]] & flag[1])) continue;
+		waiting.push(name);
+		consumers[name] = 0;
+		for (const dep of structure_dependencies[name]) consumers[dep]++;
+	}
+
+	let task_text = text;
+	if (window.crossOriginIsolated && typeof SharedArrayBuffer !== 'undefined') {
+		task_text = new Uint16Array(new SharedArrayBuffer(2 * text.length));
+		for (let i = 0; i < text.length; i++) task_text[i] = text.charCodeAt(i);
+	}
+
+	Object.assign(request, {
+		text: task_text, waiting: waiting, consumers: consumers, values: {},
+		requested: request.enabled_flags, running: 0, done: 0, total: waiting.length,
+	});
+	show_profile(DS['__profile']);
+	qa_pool_dispatch(request);
+}
+
+// Hands every structure whose dependencies are built to an idle worker.
+function qa_pool_dispatch(request) {
+	for (let i = 0; i < request.waiting.length;) {
+		const name = request.waiting[i];
+		const deps = structure_dependencies[name];
+		if (!deps.every((dep) => dep in request.values)) { i++; continue; }
+		const entry = qa_pool.find((e) => e.task === null);
+		if (!entry) return;
+		request.waiting.splice(i, 1);
+		const inputs = {};
+		for (const dep of deps) inputs[dep] = request.values[dep];
+		entry.task = name;
+		request.running++;
+		entry.worker.postMessage({ __task: name, __generation: request.generation, text: request.text, inputs: inputs, profile: request.profile });
+	}
+	if (request.running === 0) {
+		qa_pool_request = null;
+		delete request.DS['__partial'];
+		qa_show_result(request.DS, request.time_now);
+	}
+}
+
+// Merges a finished structure and releases the inputs no remaining task consumes.
+function qa_pool_message(entry, data) {
+	entry.task = null;
+	const request = qa_pool_request;
+	if (request === null || data.__generation !== request.generation) return;
+	if (data.__prepared !== undefined) {
+		qa_pool_prepared(request, data.__prepared);
+		return;
+	}
+	request.running--;
+	request.done++;
+	if (data.__profile_entry) {
+		request.DS['__profile'].push(data.__profile_entry);
+		show_profile(request.DS['__profile']);
+	}
+
+	const name = data.__task;
+	const flag = structure_flags[name];
+	if (request.requested[flag[0]] & flag[1]) {
+		request.DS[name] = data.value;
+		qa_render_partial(request.DS);
+	}
+	if (request.consumers[name] > 0) request.values[name] = data.value;
+	for (const dep of structure_dependencies[name]) {
+		if (--request.consumers[dep] === 0) delete request.values[dep];
+	}
+	qa_computation_status.textContent = `Computing... (${request.done}/${request.total} structures)`;
+	qa_pool_dispatch(request);
+}
+
+function qa_pool_error(entry, error) {
+	error.preventDefault();
+	if (entry.task === null || qa_pool_request === null) return;
+	qa_pool_cancel();
+	clearTimeout(qa_timeout_id);
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `Error during computation: ${error.message}`;
+}
 
+function qa_pool_timeout(request, timeout_seconds) {
+	qa_timeout_id = null;
+	if (qa_pool_request !== request) return;
+	const running = qa_pool.filter((e) => e.task !== null).map((e) => e.task);
+	qa_pool_cancel();
+	const profile = request.DS ? request.DS['__profile'] : [];
+	qa_show_killed(timeout_seconds, profile, '(killed while building ' + running.join(', ') + ')', request.DS);
 }
 
 // groupName: shared Sortable group name (string)
@@ -660,9 +1059,27 @@ var qa_tutorial_cite;
 var qa_tutorial_wikipedia;
 var qa_output_select;
 
+var qa_window;
+var qa_window_range;
+var qa_window_label;
+var qa_download_button;
+
 var qa_timeout_range;
 var qa_timeout_value;
 var qa_computation_status;
+var qa_profile;
+var qa_profile_output;
+
+// Shows the per-structure costs recorded by build_ds; `note` is appended when the computation did not finish.
+function show_profile(profile, note) {
+	if (!qa_profile) return;
+	if (!profile || profile.length === 0) {
+		qa_profile.classList.add('qa-hidden');
+		return;
+	}
+	qa_profile_output.textContent = format_profile(profile) + (note ? '\n' + note : '');
+	qa_profile.classList.remove('qa-hidden');
+}
 
 function qa_html_to_text(html) {
 	const el = document.createElement('div');
@@ -690,14 +1107,33 @@ function qa_populate_tutorial_select() {
 	if (prev) qa_tutorial_select.value = prev;
 }
 
+// MathJax is loaded on first use, i.e., when a tutorial shows math that was not prerendered at build time.
+const QA_MATHJAX_URL = 'https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js';
+const QA_TEX_RE = /\\\(|\\\[/;
+var qa_mathjax = null;
+
+function qa_typeset(element) {
+	if (qa_mathjax === null) {
+		qa_mathjax = new Promise((resolve, reject) => {
+			window.MathJax = { startup: { typeset: false } };
+			const script = document.createElement('script');
+			script.src = QA_MATHJAX_URL;
+			script.async = true;
+			script.onload = () => MathJax.startup.promise.then(resolve, reject);
+			script.onerror = () => { qa_mathjax = null; reject(new Error('cannot load MathJax')); };
+			document.head.appendChild(script);
+		});
+	}
+	qa_mathjax.then(() => MathJax.typesetPromise([element])).catch((error) => console.warn(error));
+}
+
 function update_tutorial(id, name) {
 	if (tutorials[id] === undefined) { return; }
 	const tutorial = tutorials[id];
 	qa_tutorial_title.innerHTML = tutorial.title;
 	qa_tutorial_content.innerHTML = tutorial.content;
-	if (typeof MathJax !== 'undefined') {
-		MathJax.typeset([qa_tutorial_content]);
-	}
+	// Math prerendered at build time is SVG already; only TeX left over needs MathJax.
+	if (QA_TEX_RE.test(tutorial.content)) qa_typeset(qa_tutorial_content);
 	if (tutorial.oeis !== undefined) {
 		qa_tutorial_oeis.style.display = "block";
 		qa_tutorial_oeis.innerHTML = "Converges to OEIS sequence " + tutorial.oeis;
@@ -747,8 +1183,18 @@ window.onload = function () {
 		update_history();
 	};
 	qa_computation_status = document.getElementById('qa-computation-status');
+	qa_profile = document.getElementById('qa-profile');
+	qa_profile_output = document.getElementById('qa-profile-output');
 
 	qa_output_select = document.getElementById('qa-output-select');
+	qa_download_button = document.getElementById('qa-download-button');
+	qa_download_button.onclick = qa_download_export;
+	qa_window = document.getElementById('qa-window');
+	qa_window_range = document.getElementById('qa-window-range');
+	qa_window_label = document.getElementById('qa-window-label');
+	qa_window_range.oninput = () => {
+		if (qa_shown_DS !== null) fill_updates(qa_shown_DS);
+	};
 
 	qa_counter_itemlists = document.getElementById('qa-counter-itemlists');
 	qa_counter_automatic = document.getElementById('qa-counter-automatic');
@@ -908,6 +1354,12 @@ window.onload = function () {
 		}
 	});
 
+	// the slider maps to other lengths with exact lengths, so keep the current length when toggling them
+	document.querySelector('.qa-option-cbx[data-opt="exactlength"]').addEventListener('change', function () {
+		updateSliderForGenerator(parseInt(qa_generate_string_rank.innerHTML) || 16);
+		updateArrays();
+	});
+
 	qa_transform_list.addEventListener('change', function () {
 		setTransformActive(false);
 		updateArrays();
@@ -1,15 +1,206 @@
-self.onmessage = function (e) {
-    const p = e.data;
-    const prepared = prepare_text(p);
+// Index arrays are built as Int32Arrays and factorizations as Uint8Arrays, so their buffers are
+// transferred as they are. Returns the value to post and its transfer list. With `shared`, integer
+// arrays are put into SharedArrayBuffers, which need no transfer. Views into a larger or shared
+// buffer are cloned, which copies their elements in one piece.
+function transport(value, shared) {
+    if (!ArrayBuffer.isView(value) || value.length === 0) return [value, []];
+    if (shared && value instanceof Int32Array) {
+        const ints = new Int32Array(new SharedArrayBuffer(value.byteLength));
+        ints.set(value);
+        return [ints, []];
+    }
+    if (!(value.buffer instanceof ArrayBuffer) || value.byteLength !== value.buffer.byteLength) return [value, []];
+    return [value, [value.buffer]];
+}
+
+// Built structures are kept across requests, so enabling one more structure or changing only
+// the output options rebuilds nothing that is still cached. The capacity counts array elements.
+const result_cache = result_cache_create(1 << 24);
+
+// With p.persist, requested structures of at least PERSIST_MIN_LENGTH elements are also stored
+// in IndexedDB, so reloading the page with the same text skips building them again.
+const PERSIST_MIN_LENGTH = 1 << 12;
+const PERSIST_MAX_ENTRIES = 256;
+var persist_db = null;
+var persisted_keys = new Set();
+
+// Resolves to the opened database, or to null where IndexedDB is unavailable.
+function persist_open() {
+    if (persist_db === null) {
+        persist_db = new Promise((resolve) => {
+            if (typeof indexedDB === 'undefined') { resolve(null); return; }
+            const request = indexedDB.open('quickarrays-results', 1);
+            request.onupgradeneeded = () => {
+                request.result.createObjectStore('results', { keyPath: 'key' }).createIndex('stored', 'stored');
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => resolve(null);
+        });
+    }
+    return persist_db;
+}
+
+// Moves the persisted structures among `names` of `text` into the result cache.
+function persist_load(text, names) {
+    return persist_open().then((db) => new Promise((resolve) => {
+        const missing = names.filter((name) => result_cache_get(result_cache, text, name) === undefined);
+        if (db === null || missing.length === 0) { resolve(); return; }
+        const hash = text_hash(text);
+        const transaction = db.transaction('results', 'readonly');
+        transaction.oncomplete = transaction.onerror = () => resolve();
+        const store = transaction.objectStore('results');
+        missing.forEach((name) => {
+            const request = store.get(hash + '\n' + name);
+            request.onsuccess = () => {
+                if (request.result === undefined) return;
+                persisted_keys.add(request.result.key);
+                result_cache_set(result_cache, text, name, request.result.value);
+            };
+        });
+    }));
+}
+
+// Stores the large structures of a result and drops the oldest entries beyond PERSIST_MAX_ENTRIES.
+function persist_store(text, result) {
+    persist_open().then((db) => {
+        if (db === null) return;
+        const hash = text_hash(text);
+        const transaction = db.transaction('results', 'readwrite');
+        const store = transaction.objectStore('results');
+        for (const name in result) {
+            const value = result[name];
+            const key = hash + '\n' + name;
+            if (name === 'text' || name.startsWith('__') || persisted_keys.has(key)) continue;
+            if (value === null || typeof value.length !== 'number' || value.length < PERSIST_MIN_LENGTH) continue;
+            store.put({ key: key, value: value, stored: Date.now() });
+            persisted_keys.add(key);
+        }
+        const count = store.count();
+        count.onsuccess = () => {
+            let excess = count.result - PERSIST_MAX_ENTRIES;
+            if (excess <= 0) return;
+            store.index('stored').openCursor().onsuccess = (event) => {
+                const cursor = event.target.result;
+                if (!cursor || excess-- <= 0) return;
+                persisted_keys.delete(cursor.value.key);
+                cursor.delete();
+                cursor.continue();
+            };
+        };
+    });
+}
+
+function structure_names(flags) {
+    return Object.keys(structure_flags).filter((name) => flags[structure_flags[name][0]] & structure_flags[name][1]);
+}
+
+// Requests carry a generation number. Only the newest request received so far is computed,
+// so a burst of requests while a computation runs collapses into a single follow-up computation.
+var pending_request = null;
+// generation of the newest request received, which a request resumed after waiting for IndexedDB must still be
+var latest_generation = null;
+
+function run_pending_request() {
+    const p = pending_request;
+    pending_request = null;
+    if (p === null) return;
+    self.postMessage({ __started: p.generation });
+
+    const prepared = prepare_text(p, result_cache);
 
     if (prepared.text.length === 0) {
-        self.postMessage({ text: '', __generator_order: prepared.generator_order });
+        self.postMessage({ text: '', __generator_order: prepared.generator_order, __generation: p.generation });
         return;
     }
+    if (!p.persist) {
+        build_request(p, prepared);
+        return;
+    }
+    persist_load(prepared.text, structure_names(structure_closure_of(p.enabled_flags))).then(() => {
+        // a newer request arrived while loading, so this one is stale
+        if (p.generation !== latest_generation) return;
+        persist_store(prepared.text, build_request(p, prepared));
+    }).catch((error) => {
+        // rethrown outside the promise so that it reaches the page's onerror like a synchronous failure
+        setTimeout(() => { throw error; });
+    });
+}
+
+// Builds and posts the structures of a request; returns the posted result.
+function build_request(p, prepared) {
+    // Each profile entry and each requested structure is posted as soon as it is ready, so the page
+    // renders results progressively and keeps the finished ones when a later structure times out.
+    const profile = p.profile ? [] : undefined;
+    if (profile) {
+        profile.push = function (entry) {
+            self.postMessage({ __profile_entry: entry, __generation: p.generation });
+            return Array.prototype.push.call(this, entry);
+        };
+    }
+    self.postMessage({ __text: prepared.text, __generation: p.generation });
+    const result = build_ds(prepared.text, p.enabled_flags, profile, result_cache, function (name, value) {
+        // Not transferred: the result cache and the structures built later still read the value,
+        // and cloning a typed array copies its buffer in one piece.
+        self.postMessage({ __result: name, value: value, __generation: p.generation });
+    });
+    // The structures were already posted; the final message only closes the request.
+    const finished = { text: prepared.text, __finished: true, __generator_order: prepared.generator_order, __generation: p.generation };
+    // a plain copy, since the overridden push is not cloneable
+    if (profile) finished['__profile'] = profile.slice();
+    if (prepared.transformError) finished['__transformError'] = prepared.transformError;
+    self.postMessage(finished);
+    return result;
+}
+
+// Parallel mode: the page has one worker of a pool prepare the text ({ __prepare: params, __generation }),
+// schedules the dependency graph over the pool and sends single structures as tasks { __task, __generation, text, inputs, profile }. Task results that are integer
+// arrays go back in SharedArrayBuffer-backed Int32Arrays when the page is cross-origin isolated,
+// so the page and every later task read them without copying. Other typed arrays are transferred,
+// since a task keeps nothing.
+var task_text = null;
+var task_text_source = null;
+
+// The text arrives as a string or as UTF-16 code units in shared memory; decoded once per text.
+function decode_task_text(source) {
+    if (typeof source === 'string') return source;
+    if (source !== task_text_source) {
+        const chunks = [];
+        for (let i = 0; i < source.length; i += 8192) {
+            chunks.push(String.fromCharCode.apply(null, source.subarray(i, i + 8192)));
+        }
+        task_text = chunks.join('');
+        task_text_source = source;
+    }
+    return task_text;
+}
 
-    const result = build_ds(prepared.text, p.enabled_flag);
-    result['text'] = prepared.text;
-    result['__generator_order'] = prepared.generator_order;
-    if (prepared.transformError) result['__transformError'] = prepared.transformError;
-    self.postMessage(result);
+function run_task(t) {
+    const text = decode_task_text(t.text);
+    const profile = t.profile ? [] : null;
+    const start_time = profile ? profile_now() : 0, start_heap = profile ? profile_heap() : 0;
+    const value = structure_builders[t.__task](text, text.length, t.inputs);
+    if (profile) profile_record(profile, t.__task, value, start_time, start_heap);
+    const shared = self.crossOriginIsolated && typeof SharedArrayBuffer !== 'undefined';
+    const [posted, transfer] = transport(value, shared);
+    const message = { __task: t.__task, __generation: t.__generation, value: posted };
+    if (profile) message.__profile_entry = profile[0];
+    self.postMessage(message, transfer);
+}
+
+self.onmessage = function (e) {
+    if (e.data.__prepare !== undefined) {
+        // the text of a parallel request; counter_text is reported here since the page lacks number_of_runs
+        const prepared = prepare_text(e.data.__prepare, result_cache);
+        if (prepared.text.length > 0) prepared.counter_text = number_of_runs(prepared.text);
+        self.postMessage({ __prepared: prepared, __generation: e.data.__generation });
+        return;
+    }
+    if (e.data.__task !== undefined) {
+        run_task(e.data);
+        return;
+    }
+    const scheduled = pending_request !== null;
+    pending_request = e.data;
+    latest_generation = e.data.generation;
+    if (!scheduled) setTimeout(run_pending_request, 0);
 };
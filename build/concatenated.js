@@ -0,0 +1,2694 @@
+var x_18007 = 1;
+
+var x_26826 = 1;
+
+var x_28455 = 1;
+
+var structure_flags = {
+	counter_n: [0, 1 << 0],
+	counter_sigma: [0, 1 << 1],
+	suffix_array: [0, 1 << 2],
+	border_array: [0, 1 << 3],
+	first_array: [0, 1 << 4],
+	index_array: [0, 1 << 5],
+	rotation_array: [0, 1 << 6],
+	sl_string: [0, 1 << 7],
+	lpf_array: [0, 1 << 8],
+	lpnf_array: [0, 1 << 9],
+	lnf_array: [0, 1 << 10],
+	necklace_conjugate_transform: [0, 1 << 11],
+	invert_transform: [0, 1 << 12],
+	revert_transform: [0, 1 << 13],
+	lz78_factorization: [0, 1 << 14],
+	lzw_factorization: [0, 1 << 15],
+	odd_maximal_palindromic_length_array: [0, 1 << 16],
+	even_maximal_palindromic_length_array: [0, 1 << 17],
+	lzend_factorization: [0, 1 << 18],
+	gamma_factorization: [0, 1 << 19],
+	inverse_suffix_array: [0, 1 << 20],
+	lcp_array: [0, 1 << 21],
+	counter_period: [0, 1 << 22],
+	counter_exponent: [0, 1 << 23],
+	counter_regularity: [0, 1 << 24],
+	bw_transform: [0, 1 << 25],
+	lzss_factorization: [0, 1 << 26],
+	lz77_factorization: [0, 1 << 27],
+	lzssno_factorization: [0, 1 << 28],
+	reverse_lzss_factorization: [0, 1 << 29],
+	counter_necklace_conjugate_transform: [0, 1 << 30],
+	counter_invert_transform: [0, 1 << 31],
+	counter_revert_transform: [1, 1 << 0],
+	counter_lz78_factorization: [1, 1 << 1],
+	counter_lzw_factorization: [1, 1 << 2],
+	counter_lzend_factorization: [1, 1 << 3],
+	counter_gamma_factorization: [1, 1 << 4],
+	phi_array: [1, 1 << 5],
+	inverse_phi_array: [1, 1 << 6],
+	psi_array: [1, 1 << 7],
+	lyndon_factorization: [1, 1 << 8],
+	nss_array: [1, 1 << 9],
+	pss_array: [1, 1 << 10],
+	counter_lcp_array: [1, 1 << 11],
+	plcp_array: [1, 1 << 12],
+	substring_complexity: [1, 1 << 13],
+	lf_array: [1, 1 << 14],
+	counter_bw_transform: [1, 1 << 15],
+	counter_lzss_factorization: [1, 1 << 16],
+	counter_lz77_factorization: [1, 1 << 17],
+	counter_lzssno_factorization: [1, 1 << 18],
+	counter_reverse_lzss_factorization: [1, 1 << 19],
+	circular_suffix_array: [1, 1 << 20],
+	necklace_factorization: [1, 1 << 21],
+	counter_lyndon_factorization: [1, 1 << 22],
+	lyndon_array: [1, 1 << 23],
+	lexparse_factorization: [1, 1 << 24],
+	counter_delta: [1, 1 << 25],
+	counter_delta_argmax: [1, 1 << 26],
+	inverse_circular_suffix_array: [1, 1 << 27],
+	bbw_indices: [1, 1 << 28],
+	counter_necklace_factorization: [1, 1 << 29],
+	counter_lexparse_factorization: [1, 1 << 30],
+	bbw_transform: [1, 1 << 31],
+	inverse_bbw_transform: [2, 1 << 0],
+	counter_bbw_transform: [2, 1 << 1],
+	counter_inverse_bbw_transform: [2, 1 << 2]
+};
+// === Dependency closure: flag words of each structure and everything it is built from ===
+var structure_closure = {
+	counter_n: [0x00000001, 0x00000000, 0x00000000],
+	counter_sigma: [0x00000002, 0x00000000, 0x00000000],
+	suffix_array: [0x00000004, 0x00000000, 0x00000000],
+	border_array: [0x00000008, 0x00000000, 0x00000000],
+	first_array: [0x00000010, 0x00000000, 0x00000000],
+	index_array: [0x00000020, 0x00000000, 0x00000000],
+	rotation_array: [0x00000040, 0x00000000, 0x00000000],
+	sl_string: [0x00000080, 0x00000000, 0x00000000],
+	lpf_array: [0x00000100, 0x00000000, 0x00000000],
+	lpnf_array: [0x00000200, 0x00000000, 0x00000000],
+	lnf_array: [0x00000400, 0x00000000, 0x00000000],
+	necklace_conjugate_transform: [0x00000800, 0x00000000, 0x00000000],
+	invert_transform: [0x00001000, 0x00000000, 0x00000000],
+	revert_transform: [0x00002000, 0x00000000, 0x00000000],
+	lz78_factorization: [0x00004000, 0x00000000, 0x00000000],
+	lzw_factorization: [0x00008000, 0x00000000, 0x00000000],
+	odd_maximal_palindromic_length_array: [0x00010000, 0x00000000, 0x00000000],
+	even_maximal_palindromic_length_array: [0x00020000, 0x00000000, 0x00000000],
+	lzend_factorization: [0x00040000, 0x00000000, 0x00000000],
+	gamma_factorization: [0x00080000, 0x00000000, 0x00000000],
+	inverse_suffix_array: [0x00100004, 0x00000000, 0x00000000],
+	lcp_array: [0x00200004, 0x00000000, 0x00000000],
+	counter_period: [0x00400008, 0x00000000, 0x00000000],
+	counter_exponent: [0x00800008, 0x00000000, 0x00000000],
+	counter_regularity: [0x01000008, 0x00000000, 0x00000000],
+	bw_transform: [0x02000040, 0x00000000, 0x00000000],
+	lzss_factorization: [0x04000100, 0x00000000, 0x00000000],
+	lz77_factorization: [0x08000100, 0x00000000, 0x00000000],
+	lzssno_factorization: [0x10000200, 0x00000000, 0x00000000],
+	reverse_lzss_factorization: [0x20000400, 0x00000000, 0x00000000],
+	counter_necklace_conjugate_transform: [0x40000800, 0x00000000, 0x00000000],
+	counter_invert_transform: [0x80001000, 0x00000000, 0x00000000],
+	counter_revert_transform: [0x00002000, 0x00000001, 0x00000000],
+	counter_lz78_factorization: [0x00004000, 0x00000002, 0x00000000],
+	counter_lzw_factorization: [0x00008000, 0x00000004, 0x00000000],
+	counter_lzend_factorization: [0x00040000, 0x00000008, 0x00000000],
+	counter_gamma_factorization: [0x00080000, 0x00000010, 0x00000000],
+	phi_array: [0x00100004, 0x00000020, 0x00000000],
+	inverse_phi_array: [0x00100004, 0x00000040, 0x00000000],
+	psi_array: [0x00100004, 0x00000080, 0x00000000],
+	lyndon_factorization: [0x00100004, 0x00000100, 0x00000000],
+	nss_array: [0x00100004, 0x00000200, 0x00000000],
+	pss_array: [0x00100004, 0x00000400, 0x00000000],
+	counter_lcp_array: [0x00200004, 0x00000800, 0x00000000],
+	plcp_array: [0x00300004, 0x00001000, 0x00000000],
+	substring_complexity: [0x00200004, 0x00002000, 0x00000000],
+	lf_array: [0x02000050, 0x00004000, 0x00000000],
+	counter_bw_transform: [0x02000040, 0x00008000, 0x00000000],
+	counter_lzss_factorization: [0x04000100, 0x00010000, 0x00000000],
+	counter_lz77_factorization: [0x08000100, 0x00020000, 0x00000000],
+	counter_lzssno_factorization: [0x10000200, 0x00040000, 0x00000000],
+	counter_reverse_lzss_factorization: [0x20000400, 0x00080000, 0x00000000],
+	circular_suffix_array: [0x00100004, 0x00100100, 0x00000000],
+	necklace_factorization: [0x00100004, 0x00200100, 0x00000000],
+	counter_lyndon_factorization: [0x00100004, 0x00400100, 0x00000000],
+	lyndon_array: [0x00100004, 0x00800200, 0x00000000],
+	lexparse_factorization: [0x00300004, 0x01001000, 0x00000000],
+	counter_delta: [0x00200004, 0x02002000, 0x00000000],
+	counter_delta_argmax: [0x00200004, 0x04002000, 0x00000000],
+	inverse_circular_suffix_array: [0x00100004, 0x08100100, 0x00000000],
+	bbw_indices: [0x00100004, 0x10100100, 0x00000000],
+	counter_necklace_factorization: [0x00100004, 0x20200100, 0x00000000],
+	counter_lexparse_factorization: [0x00300004, 0x41001000, 0x00000000],
+	bbw_transform: [0x00100004, 0x90100100, 0x00000000],
+	inverse_bbw_transform: [0x00100004, 0x90100100, 0x00000001],
+	counter_bbw_transform: [0x00100004, 0x90100100, 0x00000002],
+	counter_inverse_bbw_transform: [0x00100004, 0x90100100, 0x00000005]
+};
+// Returns the flag words selecting the given structure names; unknown names are ignored.
+function structure_flag_set(names) {
+	var flags = [0x00000000, 0x00000000, 0x00000000];
+	for (var i = 0; i < names.length; i++) {
+		var flag = structure_flags[names[i]];
+		if (flag) flags[flag[0]] |= flag[1];
+	}
+	return flags;
+}
+// Returns the flag words of the given structures together with everything they are built from.
+function structure_closure_of(flags) {
+	var need = [0x00000000, 0x00000000, 0x00000000];
+	for (var name in structure_flags) {
+		var flag = structure_flags[name];
+		if (!(flags[flag[0]] & flag[1])) continue;
+		var deps = structure_closure[name];
+		for (var w = 0; w < deps.length; w++) need[w] |= deps[w];
+	}
+	return need;
+}
+// === Direct dependencies of each structure, in construction order ===
+var structure_dependencies = {
+	counter_n: [],
+	counter_sigma: [],
+	suffix_array: [],
+	border_array: [],
+	first_array: [],
+	index_array: [],
+	rotation_array: [],
+	sl_string: [],
+	lpf_array: [],
+	lpnf_array: [],
+	lnf_array: [],
+	necklace_conjugate_transform: [],
+	invert_transform: [],
+	revert_transform: [],
+	lz78_factorization: [],
+	lzw_factorization: [],
+	odd_maximal_palindromic_length_array: [],
+	even_maximal_palindromic_length_array: [],
+	lzend_factorization: [],
+	gamma_factorization: [],
+	inverse_suffix_array: ['suffix_array'],
+	lcp_array: ['suffix_array'],
+	counter_period: ['border_array'],
+	counter_exponent: ['border_array'],
+	counter_regularity: ['border_array'],
+	bw_transform: ['rotation_array'],
+	lzss_factorization: ['lpf_array'],
+	lz77_factorization: ['lpf_array'],
+	lzssno_factorization: ['lpnf_array'],
+	reverse_lzss_factorization: ['lnf_array'],
+	counter_necklace_conjugate_transform: ['necklace_conjugate_transform'],
+	counter_invert_transform: ['invert_transform'],
+	counter_revert_transform: ['revert_transform'],
+	counter_lz78_factorization: ['lz78_factorization'],
+	counter_lzw_factorization: ['lzw_factorization'],
+	counter_lzend_factorization: ['lzend_factorization'],
+	counter_gamma_factorization: ['gamma_factorization'],
+	phi_array: ['suffix_array', 'inverse_suffix_array'],
+	inverse_phi_array: ['suffix_array', 'inverse_suffix_array'],
+	psi_array: ['suffix_array', 'inverse_suffix_array'],
+	lyndon_factorization: ['inverse_suffix_array'],
+	nss_array: ['inverse_suffix_array'],
+	pss_array: ['inverse_suffix_array'],
+	counter_lcp_array: ['lcp_array'],
+	plcp_array: ['inverse_suffix_array', 'lcp_array'],
+	substring_complexity: ['lcp_array'],
+	lf_array: ['first_array', 'bw_transform'],
+	counter_bw_transform: ['bw_transform'],
+	counter_lzss_factorization: ['lzss_factorization'],
+	counter_lz77_factorization: ['lz77_factorization'],
+	counter_lzssno_factorization: ['lzssno_factorization'],
+	counter_reverse_lzss_factorization: ['reverse_lzss_factorization'],
+	circular_suffix_array: ['lyndon_factorization'],
+	necklace_factorization: ['lyndon_factorization'],
+	counter_lyndon_factorization: ['lyndon_factorization'],
+	lyndon_array: ['nss_array'],
+	lexparse_factorization: ['plcp_array'],
+	counter_delta: ['substring_complexity'],
+	counter_delta_argmax: ['substring_complexity'],
+	inverse_circular_suffix_array: ['circular_suffix_array'],
+	bbw_indices: ['lyndon_factorization', 'circular_suffix_array'],
+	counter_necklace_factorization: ['necklace_factorization'],
+	counter_lexparse_factorization: ['lexparse_factorization'],
+	bbw_transform: ['bbw_indices'],
+	inverse_bbw_transform: ['bbw_transform'],
+	counter_bbw_transform: ['bbw_transform'],
+	counter_inverse_bbw_transform: ['inverse_bbw_transform']
+};
+const citations = {};
+function create_morphism(images, start, coding) {
+    const table = [];
+    for(const letter in images){
+        table[letter.charCodeAt(0)] = Uint16Array.from(images[letter].split(''), (c)=>c.charCodeAt(0));
+    }
+    let coding_table = null;
+    if (coding) {
+        coding_table = [];
+        for(const letter in coding)coding_table[letter.charCodeAt(0)] = coding[letter].charCodeAt(0);
+    }
+    let first = start.charCodeAt(0);
+    let prolongable = 0;
+    while(table[first][0] != first && prolongable < table.length){
+        first = table[first][0];
+        ++prolongable;
+    }
+    return {
+        images: table,
+        coding: coding_table,
+        orders: [
+            Uint16Array.of(start.charCodeAt(0))
+        ],
+        prolongable: prolongable
+    };
+}
+function morphism_expand(m, word, limit) {
+    const images = m.images;
+    let length = 0;
+    let end = 0;
+    while(end < word.length && length < limit)length += images[word[end++]].length;
+    const result = new Uint16Array(Math.min(length, limit));
+    let pos = 0;
+    for(let i = 0; i < end; ++i){
+        const image = images[word[i]];
+        for(let j = 0; j < image.length && pos < result.length; ++j)result[pos++] = image[j];
+    }
+    return result;
+}
+function morphism_order(m, k) {
+    const orders = m.orders;
+    while(orders.length <= k)orders.push(morphism_expand(m, orders[orders.length - 1], Infinity));
+    return orders[Math.max(0, k)];
+}
+function morphism_prefix(m, length) {
+    morphism_order(m, m.prolongable);
+    const orders = m.orders;
+    for(let k = m.prolongable; k < orders.length; ++k){
+        if (orders[k].length >= length) return orders[k].subarray(0, Math.max(0, length));
+    }
+    let word = orders[orders.length - 1];
+    for(let stalled = 0; word.length < length && stalled < m.images.length;){
+        const next = morphism_expand(m, word, length);
+        stalled = next.length > word.length ? 0 : stalled + 1;
+        word = next;
+    }
+    return word;
+}
+function units_to_string(units, coding) {
+    if (coding) {
+        const coded = new Uint16Array(units.length);
+        for(let i = 0; i < units.length; ++i)coded[i] = coding[units[i]];
+        units = coded;
+    }
+    const chunks = [];
+    for(let i = 0; i < units.length; i += 1 << 14){
+        chunks.push(String.fromCharCode.apply(null, units.subarray(i, i + (1 << 14))));
+    }
+    return chunks.join('');
+}
+function morphic_prefix(m, length) {
+    return units_to_string(morphism_prefix(m, length), m.coding);
+}
+const FIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'a'
+}, 'b');
+function prefix_fibonacci_word(length) {
+    return morphic_prefix(FIBONACCI_MORPHISM, length);
+}
+const TRIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'a'
+}, 'a');
+function prefix_tribonacci_word(length) {
+    return morphic_prefix(TRIBONACCI_MORPHISM, length);
+}
+const THUE_MORSE_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ba'
+}, 'a');
+function prefix_thue_morse_word(length) {
+    return morphic_prefix(THUE_MORSE_MORPHISM, length);
+}
+const MEPHISTO_WALTZ_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'bba'
+}, 'a');
+function prefix_mephisto_waltz_word(length) {
+    return morphic_prefix(MEPHISTO_WALTZ_MORPHISM, length);
+}
+const VTM_MORPHISM = create_morphism({
+    a: 'abc',
+    b: 'ac',
+    c: 'b'
+}, 'a');
+function prefix_vtm_word(length) {
+    return morphic_prefix(VTM_MORPHISM, length);
+}
+const SIERPINSKI_MORPHISM = create_morphism({
+    a: 'aba',
+    b: 'bbb'
+}, 'a');
+function prefix_sierpinski_word(length) {
+    return morphic_prefix(SIERPINSKI_MORPHISM, length);
+}
+const PELL_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'a'
+}, 'a');
+function prefix_pell_word(length) {
+    return morphic_prefix(PELL_MORPHISM, length);
+}
+const CHACON_MORPHISM = create_morphism({
+    a: 'aaba',
+    b: 'b'
+}, 'a');
+function prefix_chacon_word(length) {
+    return morphic_prefix(CHACON_MORPHISM, length);
+}
+const VON_NEUMANN_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'b'
+}, 'a');
+function prefix_von_neumann_word(length) {
+    return morphic_prefix(VON_NEUMANN_MORPHISM, length);
+}
+const RUDIN_SHAPIRO_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'db',
+    d: 'dc'
+}, 'a', {
+    a: 'a',
+    b: 'a',
+    c: 'b',
+    d: 'b'
+});
+function prefix_rudin_shapiro_word(length) {
+    return morphic_prefix(RUDIN_SHAPIRO_MORPHISM, length);
+}
+const BAUM_SWEET_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'cb',
+    c: 'bd',
+    d: 'dd'
+}, 'a', {
+    a: 'a',
+    b: 'b',
+    c: 'a',
+    d: 'a'
+});
+function prefix_baum_sweet_word(length) {
+    return morphic_prefix(BAUM_SWEET_MORPHISM, length);
+}
+function kolakoski_units(length) {
+    const units = new Uint16Array(Math.max(0, length));
+    const seed = [
+        97,
+        98,
+        98
+    ];
+    let pos = 0;
+    for(; pos < units.length && pos < seed.length; ++pos)units[pos] = seed[pos];
+    for(let run = 2; pos < units.length; ++run){
+        const letter = run % 2 == 0 ? 97 : 98;
+        units[pos++] = letter;
+        if (units[run] == 98 && pos < units.length) units[pos++] = letter;
+    }
+    return units;
+}
+function prefix_kolakoski_word(length) {
+    return units_to_string(kolakoski_units(length), null);
+}
+const generator_lengths = {"fibonacci_word":[1,1,2,3,5,8,13,21,34,55,89,144,233,377,610,987,1597,2584,4181,6765,10946,17711,28657],"tribonacci_word":[1,2,4,7,13,24,44,81,149,274,504,927,1705,3136,5768,10609,19513],"thue_morse_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"mephisto_waltz_word":[1,3,9,27,81,243,729,2187,6561,19683],"vtm_word":[1,3,6,12,24,48,96,192,384,768,1536,3072,6144,12288,24576],"sierpinski_word":[1,3,9,27,81,243,729,2187,6561,19683],"pell_word":[1,3,7,17,41,99,239,577,1393,3363,8119,19601],"chacon_word":[1,4,13,40,121,364,1093,3280,9841,29524],"von_neumann_word":[1,3,7,15,31,63,127,255,511,1023,2047,4095,8191,16383,32767],"rudin_shapiro_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"baum_sweet_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"kolakoski_word":[2,3,5,7,10,15,23,34,50,75,113,170,255,382,574,863,1293,1937,2903,4353,6526,9789,14688,22029]};
+const string_generator_prefixes = {
+	'fibonacci_word': prefix_fibonacci_word,
+	'tribonacci_word': prefix_tribonacci_word,
+	'thue_morse_word': prefix_thue_morse_word,
+	'mephisto_waltz_word': prefix_mephisto_waltz_word,
+	'vtm_word': prefix_vtm_word,
+	'sierpinski_word': prefix_sierpinski_word,
+	'pell_word': prefix_pell_word,
+	'chacon_word': prefix_chacon_word,
+	'von_neumann_word': prefix_von_neumann_word,
+	'rudin_shapiro_word': prefix_rudin_shapiro_word,
+	'baum_sweet_word': prefix_baum_sweet_word,
+	'kolakoski_word': prefix_kolakoski_word,
+};
+const tutorials = {};
+tutorials['fibonacci_word'] = {
+	'title' : 'Fibonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to a \\} \\) on the letter \'b\'',
+	'oeis' : 'A003849',
+	'wikipedia' : 'Fibonacci_word'
+};
+tutorials['tribonacci_word'] = {
+	'title' : 'Tribonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A080843',
+	'wikipedia' : 'Tribonacci_word'
+};
+tutorials['thue_morse_word'] = {
+	'title' : 'Thue-Morse',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ba \\} \\) on the letter \'a\'',
+	'oeis' : 'A010060',
+	'wikipedia' : 'Thue-Morse_sequence'
+};
+tutorials['mephisto_waltz_word'] = {
+	'title' : 'Mephisto-Waltz',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to bba \\} \\) on the letter \'a\'',
+	'oeis' : 'A064990',
+	'cite' : 'allouche03automatic'
+};
+tutorials['vtm_word'] = {
+	'title' : 'vtm',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to abc, b \\to ac, c \\to b \\} \\) on the letter \'a\''
+};
+tutorials['sierpinski_word'] = {
+	'title' : 'Sierpinski',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aba, b \\to bbb \\} \\) on the letter \'a\'',
+	'oeis' : 'A316829'
+};
+tutorials['pell_word'] = {
+	'title' : 'Pell',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A171588',
+	'wikipedia' : 'Pell_number'
+};
+tutorials['chacon_word'] = {
+	'title' : 'Chacon',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aaba, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A049320'
+};
+tutorials['von_neumann_word'] = {
+	'title' : 'Neumannn',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A308187'
+};
+tutorials['rudin_shapiro_word'] = {
+	'title' : 'Rudin-Shapiro',
+	'content' : 'Morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to db, d \\to dc \\} \\) followed by the coding \\( \\{ a,b \\to a; c,d \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A020987',
+	'wikipedia' : 'Rudin–Shapiro_sequence'
+};
+tutorials['baum_sweet_word'] = {
+	'title' : 'Baum-Sweet',
+	'content' : 'Word defined by setting the \\(j\\)-th letter to \'b\' if the binary representation of \\(j\\) contains no block of consecutive 0s of odd length, and to \'a\' otherwise.',
+	'oeis' : 'A086747',
+	'wikipedia' : 'Baum–Sweet_sequence'
+};
+tutorials['kolakoski_word'] = {
+	'title' : 'Kolakoski',
+	'content' : 'Self-generating word over the alphabet {a,b} where \'a\' represents 1 and \'b\' represents 2. The word starts with "ab" and the lengths of consecutive runs are given by the word itself.',
+	'oeis' : 'A000002',
+	'wikipedia' : 'Kolakoski_sequence'
+};
+tutorials['sigma'] = {
+	'title' : '&sigma;',
+	'content' : 'The effective alphabet size of a string is the number of distinct symbols it contains.'
+};
+tutorials['period'] = {
+	'title' : 'p',
+	'content' : 'The shortest period of a string is the smallest positive integer such that the string is a prefix of an infinite repetition of the prefix of that length. Concretely, the shortest period \\(p\\) of the text \\(T\\) is the length of the shortest prefix \\(P\\) of \\(T\\) such that \\(T\\) is a prefix of \\(P^{k}\\) for some integer \\(k \\geq 1\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+tutorials['exponent'] = {
+	'title' : 'e',
+	'content' : 'The exponent of a string is the division of the string\'s length by its shortest period, representing how many times the shortest period needs to be repeated to form the string. Formally, the exponent of the text \\(T\\) is defined as the length of \\(T\\) divided by the length of its shortest period \\(p\\), i.e., \\(\\frac{|T|}{p}\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+tutorials['regularity'] = {
+	'title' : 'R',
+	'content' : 'The regularity type of a string classifies it based on its periodic structure. A string can be categorized as unbordered, primitive, square, or non-primitive based on its borders and periods. Specifically, a string is unbordered if it has no proper border, primitive if it cannot be expressed as a repetition of a smaller substring, square if it is formed by repeating a substring exactly twice, and non-primitive if it can be expressed as a repetition of a smaller substring more than twice.'
+};
+tutorials['suffix_array'] = {
+	'title' : 'SA',
+	'content' : 'The suffix array sorts the entry indices of a string based on the lexicographical order of their corresponding suffixes. Formally, the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the suffixes of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{SA}[i]..n] \\prec T[\\mathsf{SA}[i+1]..n]\\) for all text positions \\(i \\in [1..n-1]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+tutorials['border_array'] = {
+	'title' : 'B',
+	'content' : 'The border array of a string stores the lengths of the longest borders for each prefix of the string. A border of a string is defined as a substring that is both a proper prefix and a proper suffix. Formally, the border array \\(\\mathsf{B}\\) for a text \\(T[1..n]\\) is an array where each entry \\(\\mathsf{B}[i]\\) represents the length of the longest border of the prefix \\(T[1..i]\\), i.e., \\(\\mathsf{B}[i]\\) is the largest integer \\(k \\le i-1\\) such that \\(T[1..k] = T[i-k+1..i]\\). By definition, \\(\\mathsf{B}[0] = 0\\).',
+	'wikipedia' : 'Knuth–Morris–Pratt_algorithm'
+};
+tutorials['bw_transform'] = {
+	'title' : 'BWT',
+	'content' : 'The Burrows-Wheeler Transform (BWT) is a reversible transformation that rearranges the characters of a string based on the lexicographical order of its cyclic rotations. Formally, given a text \\(T[1..n]\\) and its rotation array \\(\\mathsf{Rot}\\), the BWT \\(\\mathsf{BWT}[1..n]\\) is defined such that \\(\\mathsf{BWT}[i] = T[(\\mathsf{Rot}[i] + n - 1) \\mod n]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['first_array'] = {
+	'title' : 'F',
+	'content' : 'The First Column Array represents the first column of the sorted rotations of a string, which is obtained by sorting the characters of the string in lexicographical order. Formally, for a given text \\(T[1..n]\\), the First Column Array \\(\\mathsf{F}\\) is defined as the sorted sequence of characters in \\(T\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['index_array'] = {
+	'title' : 'i',
+	'content' : 'The index array contains a sequence of integers from \\(1\\) to \\(n\\), where \\(n\\) is the length of the input text \\(T[1..n]\\). Formally, the index array \\(\\mathsf{i}\\) is defined such that \\(\\mathsf{i}[j] = j\\) for each \\(j \\in [1..n]\\).'
+};
+tutorials['rotation_array'] = {
+	'title' : 'Rot',
+	'content' : 'The rotation array sorts the entry indices of a string based on the lexicographical order of their corresponding cyclic rotations. Formally, the rotation array \\(\\mathsf{Rot}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the cyclic rotations of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{Rot}[i]..n]T[1..\\mathsf{Rot}[i]-1] \\prec T[\\mathsf{Rot}[i+1]..n]T[1..\\mathsf{Rot}[i+1]-1]\\) for all text positions \\(i \\in [1..n-1]\\), where $\\prec$ is a total order by assigning lower ranks to lexicographically smaller strings and uses the text position \\(i\\) for tie-breaking.'
+};
+tutorials['inverse_suffix_array'] = {
+	'title' : 'ISA',
+	'content' : 'The inverse suffix array provides a mapping from each starting index of the suffixes of a string back to their respective positions in the suffix array. Formally, given the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\), the inverse suffix array \\(\\mathsf{ISA}\\) is defined such that \\(\\mathsf{ISA}[\\mathsf{SA}[i]] = i\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+tutorials['phi_array'] = {
+	'title' : '&Phi;',
+	'content' : 'The Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically preceding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Phi array \\(\\mathsf{\\Phi}\\) is defined such that \\(\\mathsf{\\Phi}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] - 1]\\) if \\(\\mathsf{ISA}[i] > 0\\), and \\(\\mathsf{\\Phi}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = 0\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp'
+};
+tutorials['inverse_phi_array'] = {
+	'title' : '&Phi;&#8315;&#185;',
+	'content' : 'The inverse Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically succeeding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the inverse Phi array \\(\\mathsf{\\Phi}^{-1}\\) is defined such that \\(\\mathsf{\\Phi}^{-1}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] + 1]\\) if \\(\\mathsf{ISA}[i] \\le n-1 \\), and \\(\\mathsf{\\Phi}^{-1}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = n \\), for each \\(i \\in [1..n]\\).'
+};
+tutorials['lcp_array'] = {
+	'title' : 'LCP',
+	'content' : 'The Longest Common Prefix (LCP) array stores the lengths of the longest common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given text \\(T[1..n]\\) and its suffix array \\(\\mathsf{SA}\\), the LCP array \\(\\mathsf{LCP}[1..n]\\) is defined such that \\(\\mathsf{LCP}[1] = 0\\) and \\(\\mathsf{LCP}[i] = \\text{lcp}(T[\\mathsf{SA}[i]..n], T[\\mathsf{SA}[i-1]..n])\\) for each \\(i \\in [2..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['lcp_array'] = {
+	'title' : '&Sigma; LCP',
+	'content' : 'The sum of the Longest Common Prefix (LCP) array values provides a measure of the total length of common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given LCP array \\(\\mathsf{LCP}[1..n]\\), the sum \\(\\Sigma \\mathsf{LCP}\\) is defined as \\(\\sum_{i=1}^{n} \\mathsf{LCP}[i]\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['plcp_array'] = {
+	'title' : 'PLCP',
+	'content' : 'The Permuted Longest Common Prefix (PLCP) array reorders the values of the Longest Common Prefix (LCP) array based on the respective positions in the string. Formally, for the inverse suffix array \\(\\mathsf{ISA}\\) and LCP array \\(\\mathsf{LCP}\\) of the text \\(T[1..n]\\), the PLCP array \\(\\mathsf{PLCP}[1..n]\\) is defined such that \\(\\mathsf{PLCP}[i] = \\mathsf{LCP}[\\mathsf{ISA}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['psi_array'] = {
+	'title' : '&Psi;',
+	'content' : 'The Psi array provides a mapping inside the suffix array that advances by one text position. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Psi array \\(\\mathsf{\\Psi}\\) is defined such that \\(\\mathsf{\\Psi}[i] = \\mathsf{ISA}[\\mathsf{SA}[i] + 1]\\) if \\(\\mathsf{SA}[i] + 1 < n\\), and \\(\\mathsf{\\Psi}[i] = \\bot\\) if \\(\\mathsf{SA}[i] + 1 = n\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'grossi05csa'
+};
+tutorials['lyndon_factorization'] = {
+	'title' : 'LynF',
+	'content' : 'The Lyndon factorization of a string decomposes it into a sequence of Lyndon words in lexicographically non-increasing order, where a Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations.',
+	'cite' : 'chen58lyndon'
+};
+tutorials['delta'] = {
+	'title' : '&delta;',
+	'content' : 'The substring complexity measure quantifies the maximum ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the maximum value of \\(\\frac{\\mathsf{SC}[k]}{k}\\) for \\(k \\in [1..n]\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['delta_argmax'] = {
+	'title' : 'max &delta;',
+	'content' : 'The substring complexity measure length identifies the substring length that maximizes the ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the length \\(k\\) that maximizes \\(\\frac{\\mathsf{SC}[k]}{k}\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['substring_complexity'] = {
+	'title' : 'SC',
+	'content' : 'The substring complexity array quantifies the number of distinct substrings of various lengths within a string. Given the Longest Common Prefix (LCP) array of a string, the substring complexity array \\(\\mathsf{SC}[1..n]\\) is defined such that for each length \\(k \\in [1..n]\\), \\(\\mathsf{SC}[k]\\) represents the count of distinct substrings of length \\(k\\). The computation leverages the LCP values to efficiently determine the number of new substrings introduced at each length.',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['lf_array'] = {
+	'title' : 'LF',
+	'content' : 'The Last-to-First (LF) mapping array identifies characters from the last column with those from the first column of the Burrows-Wheeler Transform (BWT) that orginated from the same text position. Given the first column \\(\\mathsf{F}\\) and \\(\\textsf{BWT}\\), the LF mapping array \\(\\mathsf{LF}[1..n]\\) is defined such that \\(\\mathsf{LF}[i] = \\text{select}(\\textsf{F}, \\textsf{BWT}[i], \\text{rank}(\\textsf{BWT}, \\textsf{BWT}[i], i))\\) for each \\(i \\in [1..n]\\), where \\(\\text{rank}(\\textsf{BWT}, c, i)\\) counts the occurrences of character \\(c\\) in the prefix \\(\\textsf{BWT}[1..i]\\), and \\(\\text{select}(\\textsf{F}, c, r)\\) finds the position of the \\(r\\)-th occurrence of character \\(c\\) in \\(\\textsf{F}\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['sl_string'] = {
+	'title' : 'S/L',
+	'content' : 'The S/L type string classifies each character in a string as either S-type or L-type based on the lexicographic order of the suffixes starting at those characters. A character at position \\(i\\) is classified as S-type if the suffix starting at \\(i\\) is lexicographically smaller than the suffix starting at \\(i+1\\), and L-type if it is larger. If the suffixes are equal, the type is determined by the type of the suffix starting at \\(i+1\\). Additionally, an S-type character that is the first character or immediately preceded by an L-type character is marked as S*-type.',
+	'cite' : 'nong11sais'
+};
+tutorials['lpf_array'] = {
+	'title' : 'LPF',
+	'content' : 'The Longest Previous Factor (LPF) array stores the length of the longest prefix of each suffix of a string that matches a substring starting at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPF array \\(\\mathsf{LPF}[1..n]\\) is defined such that \\(\\mathsf{LPF}[i] = \\max_{j \\in [1..i-1]} \\text{lcp}(T[i..n], T[j..n])\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+tutorials['lpnf_array'] = {
+	'title' : 'LPnF',
+	'content' : 'The Longest Previous Non-Overlapping Factor (LPnF) array stores the length of the longest prefix of each suffix of a string that matches a substring ending at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPnF array \\(\\mathsf{LPnF}[1..n]\\) is defined such that \\(\\mathsf{LPnF}[i] = \\max_{j \\in [1..i-1]} \\min(i-j,\\text{lcp}(T[i..n], T[j..n]))\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+tutorials['lnf_array'] = {
+	'title' : 'LNF',
+	'content' : 'The Longest Next Factor (LNF) array is the LPF array of the reversed text.'
+};
+tutorials['lzss_factorization'] = {
+	'title' : 'LZSS',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski (LZSS) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring with an earlier starting position. The factorization is constructed greedily by selecting the longest previous factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+tutorials['lzssno_factorization'] = {
+	'title' : 'LZSSno',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski non-overlapping (LZSSno) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring ending at an earlier positition. The factorization is constructed greedily by selecting the longest previous non-overlapping factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\min(i-j, \\text{lcp}(T[i..n], T[j..n])) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+tutorials['lz77_factorization'] = {
+	'title' : 'LZ77',
+	'content' : 'The Lempel-Ziv-77  (LZ77) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring starting at a prior position within the same string. The factorization is constructed greedily by selecting the longest previous factor at each position in the string, with an additional character appended to the factor. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) + 1 \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'ziv77lz'
+};
+tutorials['reverse_lzss_factorization'] = {
+	'title' : 'rLZSS',
+	'content' : 'The Reverse Lempel-Ziv-Storer-Szymanski (rLZSS) factorization of a string is the LZSS factorization of the reversed string obtained by reading the string in reversed order.',
+	'cite' : 'storer82lzss'
+};
+tutorials['lexparse_factorization'] = {
+	'title' : 'LexParse',
+	'content' : 'The lexicographic parse (lexparse) decomposes a string into a sequence of factors based on the permuted longest common prefix (PLCP) array. Each factor is determined by the longest prefix of the suffix starting at the current position that matches a substring starting at a lexicographically smaller suffix position. Formally, for a given text \\(T[1..n]\\) and its PLCP array \\(\\mathsf{PLCP}[1..n]\\), the length of the factor starting at position \\(i\\) is \\(\\mathsf{PLCP}[i]\\) or 1 if \\(\\mathsf{PLCP}[i] = 0\\).',
+	'cite' : 'navarro21approximation'
+};
+tutorials['nss_array'] = {
+	'title' : 'NSS',
+	'content' : 'The Next Smaller Suffix (NSS) array identifies the subsequent suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the NSS array \\(\\mathsf{NSS}[1..n]\\) is defined such that \\(\\mathsf{NSS}[i] = \\min \\{ j > i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{NSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+tutorials['pss_array'] = {
+	'title' : 'PSS',
+	'content' : 'The Previous Smaller Suffix (PSS) array identifies the preceding suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the PSS array \\(\\mathsf{PSS}[1..n]\\) is defined such that \\(\\mathsf{PSS}[i] = \\max \\{ j < i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{PSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+tutorials['lyndon_array'] = {
+	'title' : 'Lyndon',
+	'content' : 'The Lyndon array stores the lengths of the longest Lyndon words starting at each position in a string. A Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations. Given the Next Smaller Suffix (NSS) array \\(\\mathsf{NSS}[1..n]\\) of a text \\(T[1..n]\\), the Lyndon array \\(\\mathsf{Lyndon}[1..n]\\) is defined such that \\(\\mathsf{Lyndon}[i] = \\mathsf{NSS}[i] - i\\) if \\(\\mathsf{NSS}[i] \\neq \\bot\\), and \\(\\mathsf{Lyndon}[i] = n - i + 1\\) otherwise, for each \\(i \\in [1..n]\\).',
+	'cite' : 'franek16algorithms'
+};
+tutorials['necklace_conjugate_transform'] = {
+	'title' : 'min-rot(T)',
+	'content' : 'The necklace conjugate of a string is the lexicographically smallest string that can be obtained by rotating the original string. This involves generating all possible rotations (conjugates) of the string and selecting the smallest one in lexicographic order.'
+};
+tutorials['invert_transform'] = {
+	'title' : 'inv(T)',
+	'content' : 'The invert transform of a string maps each character to its complementary character based on the effective alphabet of the string. Specifically, given a string that contains \\(s\\) distinct symbols, it swaps the \\(i\\)-th smallest symbol with the \\((s - i + 1)\\)-th smallest one, for every \\(i \\in \\{1,\\dots,s\\}\\).'
+};
+tutorials['revert_transform'] = {
+	'title' : 'rev(T)',
+	'content' : 'The revert transform of a string is obtained by reversing the order of its characters. Given a text \\(T[1..n]\\), the revert transform \\(\\mathsf{Revert}(T)\\) produces the string \\(T[n] T[n-1] \\ldots T[1]\\), where the characters are arranged in the opposite order, effectively reading the string backwards.'
+};
+tutorials['circular_suffix_array'] = {
+	'title' : 'CSA',
+	'content' : 'The Circular Suffix Array (CSA) of a string is a permutation of text positions that assigns a rank to each cyclic rotation (conjugate) of the Lyndon factors of the string based on the omega order. Given a text \\(T[1..n]\\) and its Lyndon factorization, the CSA \\(\\mathsf{CSA}[1..n]\\) is defined such that \\(\\mathsf{CSA}[i]\\) gives the starting position in \\(T\\) of the \\(i\\)-th smallest conjugate in \\(\\omega\\)-order among all conjugates of the Lyndon factors of \\(T\\).',
+	'cite' : 'hon13spaceefficient'
+};
+tutorials['inverse_circular_suffix_array'] = {
+	'title' : 'CISA',
+	'content' : 'The inverse circular suffix array (ICSA) is the reverse permutation of the circular suffix array (CSA).',
+	'cite' : 'hon13spaceefficient'
+};
+tutorials['bbw_indices'] = {
+	'title' : 'BBWTi',
+	'content' : 'The Bijective Burrows-Wheeler Transform Indices (BBWTi) array stores the text positions of the circular sufix array (CSA) decremented by one, but mapping positions at the beginning of Lyndon factors to the end of the respective Lyndon factor.',
+	'cite' : 'bannai25survey'
+};
+tutorials['bbw_transform'] = {
+	'title' : 'BBWT',
+	'content' : 'The Bijective Burrows-Wheeler Transform (BBWT) of a string rearranges the characters of the original string based on the Bijective Burrows-Wheeler Transform Indices (BBWTi). Given a text \\(T[1..n]\\) and its BBWTi array \\(\\mathsf{BBWTi}[1..n]\\), the BBWT \\(\\mathsf{BBWT}[1..n]\\) is defined such that \\(\\mathsf{BBWT}[i] = T[\\mathsf{BBWTi}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'bannai25survey'
+};
+tutorials['inverse_bbw_transform'] = {
+	'title' : 'BBWT&#8315;&#185;',
+	'content' : 'The inverse Bijective Burrows-Wheeler Transform (inverse BBWT), also called the Gessel-Reutenauer transformation, applies the LF-mapping on the cycles in the BBWT to extract all Lyndon words, which sorted in lexicographically descreing order recovers the original text.',
+	'cite' : 'bannai25survey'
+};
+tutorials['lz78_factorization'] = {
+	'title' : 'LZ78',
+	'content' : 'The Lempel-Ziv-78 (LZ78) factorization decomposes a string into a sequence of factors based on previously seen substrings. Each factor consists of a reference to the longest previously seen factor (or zero if none exists) followed by a new character.',
+	'cite' : 'ziv78lz'
+};
+tutorials['lzw_factorization'] = {
+	'title' : 'LZW',
+	'content' : 'The Lempel-Ziv-Welch (LZW) factorization decomposes a string into a sequence of factors by building a dictionary of previously seen substrings. Each factor is the longest prefix of the remaining text that exists in the dictionary, followed by the next character.',
+	'cite' : 'welch84lzw'
+};
+tutorials['necklace_factorization'] = {
+	'title' : 'NeckF',
+	'content' : 'The Necklace factorization is the Lyndon factorization colliding all equal Lyndon factors to a single factor that is a necklace. The number of factors is the number of distinct Lyndon factors.',
+	'cite' : 'chen58lyndon'
+};
+tutorials['odd_maximal_palindromic_length_array'] = {
+	'title' : 'o-pali',
+	'content' : 'The odd maximal palindromic length array (o-pali) stores at each position the length of the left arm of the longest odd-length palindromic substring centered at that position, excluding the position itself in the length measurement. Hence, a palindrome of length \\(2k+1\\) contributes \\(k\\) to the o-pali array at its center position.',
+	'cite' : 'manacher75new'
+};
+tutorials['even_maximal_palindromic_length_array'] = {
+	'title' : 'e-pali',
+	'content' : 'The even maximal palindromic length array (e-pali) stores at each position the length of the longest even-length palindromic substring centered between that and its preding position.',
+	'cite' : 'manacher75new'
+};
+tutorials['lzend_factorization'] = {
+	'title' : 'LZend',
+	'content' : 'The LZ-end factorization is a restriction of the Lempel-Ziv 77 factorization where each new factor, omitting its last new character, must be the longest possible prefix of the remaining text that also appears ending exactly at the end of a previous factor, or just a single character if no such match exists.',
+	'cite' : 'kreft13lzend'
+};
+tutorials['gamma_factorization'] = {
+	'title' : '&Gamma;',
+	'content' : 'A string attractor is a set of positions in a string such that every distinct substring has at least one occurrence that crosses one of these positions. The smallest string attractor size is the minimum number of positions needed to form such a set. Here, \\(\\Gamma\\) is the leftmost such smallest string attractor, i.e., the one that has the lexicographically smallest sequence of positions.',
+	'cite' : 'kempa18stringattractors'
+};
+function pad_right(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return text + pad_char.repeat(times);
+}
+function pad_left(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return pad_char.repeat(times) + text;
+}
+function increment_array(array, inc = 1) {
+    return Array.from(array, (x)=>x + inc);
+}
+function replace_invalid_position(array, max_length) {
+    return Array.from(array, (x)=>x >= max_length ? '-' : x);
+}
+function prettify_string(text, sep = " ", base = 0, do_tabularize = true, length = text.length) {
+    text = text.split('\0').join("$");
+    const width = do_tabularize ? String(length + base - 1).length : 0;
+    let effectiveSep = sep;
+    if (!do_tabularize) {
+        effectiveSep = '';
+    }
+    return text.split('').map((x)=>pad_left(x, ' ', width)).join(effectiveSep);
+}
+function prettify_array(array, sep = " ", base = 0, length = array.length) {
+    const maxIndexValue = Math.max(0, length + base - 1);
+    const width = ("" + maxIndexValue).toString().length;
+    return Array.from(array, (x)=>pad_left("" + x, ' ', width)).join(sep);
+}
+function prettify_factorization(text, factorization, sep = " ", base = 0, length = text.length) {
+    const n = text.length;
+    const width = String(Math.max(0, length + base - 1)).length;
+    let result = "";
+    for(let i = 0; i < n; ++i){
+        const elementToDisplay = i === n - 1 && text[i] === '\0' ? '$' : text[i];
+        result += pad_left(elementToDisplay, ' ', width);
+        result += factorization[i] ? '|' + sep.substring(1) : sep;
+    }
+    return result;
+}
+function encodeWhitespaces(text) {
+    return text.replace(/\r/g, '\u240d').replace(/\n/g, '\u21b5').replace(/\t/g, '\u2409').replace(/\v/g, '\u240b').replace(/\f/g, '\u240c').replace(/ /g, '\u23b5');
+}
+function decodeWhitespaces(text) {
+    return text.replace(/\u240d/g, '\r').replace(/\u21b5/g, '\n').replace(/\u2409/g, '\t').replace(/\u240b/g, '\v').replace(/\u240c/g, '\f').replace(/\u23b5/g, ' ');
+}
+function repeat(str, n) {
+    let r = "";
+    while(n-- > 0)r += str;
+    return r;
+}
+function escapeLatex(s) {
+    return String(s).replace(/\\/g, "\\textbackslash{}").replace(/([#$%&_{}])/g, "\\$1");
+}
+function isBoolRow(row) {
+    return typeof row.data[0] === "boolean";
+}
+function isStringRow(row) {
+    return typeof row.data[0] === "string";
+}
+function partitionsFromBool(boolArr) {
+    const parts = [];
+    let len = 0;
+    for(let i = 0; i < boolArr.length; i++){
+        len++;
+        if (boolArr[i]) {
+            parts.push(len);
+            len = 0;
+        }
+    }
+    return parts;
+}
+function* export_latex_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required");
+    }
+    const T = tRow.data;
+    yield `\\begin{tabular}{l|${"c".repeat(n)}}\n\\hline`;
+    for (const row of rows){
+        let line = `\n${escapeLatex(row.name)} & `;
+        let cells = 0;
+        if (isBoolRow(row)) {
+            const parts = partitionsFromBool(row.data);
+            let pos = 0;
+            for(let p = 0; p < parts.length; p++){
+                const k = parts[p];
+                let text = "";
+                for(let i = 0; i < k; i++){
+                    text += escapeLatex(T[pos++]);
+                }
+                line += `\\multicolumn{${k}}{c}{${text}}`;
+                if (p !== parts.length - 1) line += " & ";
+                cells += k;
+                if (cells >= chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        } else {
+            for(let i = 0; i < n; i++){
+                line += escapeLatex(row.data[i]);
+                if (i !== n - 1) line += " & ";
+                if (++cells === chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        }
+        yield line + " \\\\";
+    }
+    yield "\n\\hline\n\\end{tabular}";
+}
+function export_latex(rows) {
+    return Array.from(export_latex_chunks(rows)).join("");
+}
+function* export_markdown_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required for boolean partitions");
+    }
+    const T = tRow.data;
+    let line = "| ";
+    for(let i = 0; i < n; i++){
+        line += "|" + String(i + 1);
+        if ((i + 1) % chunk_cells === 0) {
+            yield line;
+            line = "";
+        }
+    }
+    yield line + "|\n|" + repeat("---|", n + 1);
+    for (const row of rows){
+        line = "\n|" + row.name + "|";
+        if (isBoolRow(row)) {
+            for(let i = 0; i < n; i++){
+                line += T[i];
+                if (row.data[i]) line += "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+            line += "|";
+        } else {
+            for(let i = 0; i < n; i++){
+                line += String(row.data[i]) + "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+        }
+        yield line;
+    }
+}
+function export_markdown(rows) {
+    return Array.from(export_markdown_chunks(rows)).join("");
+}
+function escape_csv(value) {
+    const s = String(value);
+    if (/[",\n]/.test(s)) {
+        return `"${s.replace(/"/g, '""')}"`;
+    }
+    return s;
+}
+function* export_csv_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    for(let r = 0; r < rows.length; r++){
+        const row = rows[r];
+        let line = (r > 0 ? "\n" : "") + escape_csv(row.name);
+        for(let i = 0; i < n; i++){
+            line += "," + escape_csv(String(row.data[i]));
+            if ((i + 1) % chunk_cells === 0) {
+                yield line;
+                line = "";
+            }
+        }
+        yield line;
+    }
+}
+function export_csv(rows) {
+    return Array.from(export_csv_chunks(rows)).join("");
+}
+function format_profile(profile) {
+    const sorted = [
+        ...profile
+    ].sort((a, b)=>b.time_ms - a.time_ms);
+    const pad = sorted.reduce((max, entry)=>Math.max(max, entry.name.length), 0);
+    return sorted.map((entry)=>{
+        let line = pad_right(entry.name, ' ', pad) + ' ' + pad_left(entry.time_ms.toFixed(1), ' ', 8) + ' ms';
+        if (entry.length !== null) {
+            line += '  len ' + entry.length;
+        }
+        if (entry.heap_delta !== null) {
+            line += '  heap ' + (entry.heap_delta >= 0 ? '+' : '') + (entry.heap_delta / 1024).toFixed(0) + ' KiB';
+        }
+        return line;
+    }).join('\n');
+}
+class ItemList {
+    constructor(enabledParent, disabledParent, onChange, enableDblClick, cssClass, categoryResolver) {
+        this.dictionary = {};
+        this.enParent = enabledParent;
+        this.disParent = disabledParent;
+        this.onChange = onChange;
+        this.enableDblClick = enableDblClick;
+        this.cssClass = cssClass;
+        this.categoryResolver = categoryResolver;
+    }
+    _getDisabledParent(dsName) {
+        if (this.disParent && this.disParent.nodeType) return this.disParent;
+        const el = this.dictionary[dsName];
+        if (!el) return this.disParent && this.disParent.other || null;
+        if (this.categoryResolver) {
+            const category = this.categoryResolver(el);
+            if (category && this.disParent[category]) return this.disParent[category];
+        }
+        return this.disParent.other;
+    }
+    add(domElement) {
+        this.dictionary[domElement.dataset.ds] = domElement;
+        var self = this;
+        domElement.ondblclick = function() { self.toggle(domElement.dataset.ds); };
+    }
+}
+
+ItemList.prototype.getEnabled = function() {
+    var result = "";
+    var enabledNodes = this.enParent.getElementsByClassName(this.cssClass);
+    for(var i = 0; i < enabledNodes.length; i++) {
+        var dsName = enabledNodes[i].dataset.ds;
+        if(this.enabled(dsName))
+            result += dsName + '-';
+    }
+    return result.slice(0, Math.max(0, result.length - 1));
+};
+
+ItemList.prototype.setEnabled = function(dsList) {
+    for(var key in this.dictionary)
+        this.disable(key);
+    var structs = dsList.split('-');
+    for(var i = 0; i < structs.length; i++)
+        this.enable(structs[i]);
+};
+
+ItemList.prototype.enabled = function(dsName) {
+    return this.dictionary[dsName]
+        && this.dictionary[dsName].parentElement == this.enParent;
+};
+
+ItemList.prototype.hasClass = function(dsName, className) {
+    return this.dictionary[dsName]
+        && this.dictionary[dsName].classList.contains(className);
+};
+
+ItemList.prototype.forEachEnabled = function(func) {
+    var enabledNodes = this.enParent.getElementsByClassName(this.cssClass);
+    for(var i = 0; i < enabledNodes.length; i++) {
+        var dsName = enabledNodes[i].dataset.ds;
+        if(this.enabled(dsName)) func(dsName);
+    }
+};
+
+ItemList.prototype.enable = function(dsName) {
+    var el = this.dictionary[dsName];
+    if(el) {
+        this.enParent.appendChild(el);
+        this.onChange();
+    }
+};
+
+ItemList.prototype.disable = function(dsName) {
+    var el = this.dictionary[dsName];
+    var parent = this._getDisabledParent(dsName);
+    if(el && parent) {
+        insertInLexOrder(parent, el, '.' + this.cssClass);
+        this.onChange();
+    }
+};
+
+ItemList.prototype.toggle = function(dsName) {
+    if(this.enabled(dsName)) this.disable(dsName);
+    else this.enable(dsName);
+};
+
+class DataStructureList extends ItemList {
+    constructor(enabledParent, disabledParent, onChange, enableDblClick) {
+        // disabledParent can be a single element or a map { string, index, length, factor, other }
+        super(enabledParent, disabledParent, onChange, enableDblClick, 'qa-structure', el => {
+            if (el.classList.contains('qa-structure-string')) return 'string';
+            if (el.classList.contains('qa-structure-index')) return 'index';
+            if (el.classList.contains('qa-structure-length')) return 'length';
+            if (el.classList.contains('qa-structure-factor')) return 'factor';
+            return null;
+        });
+    }
+}
+
+DataStructureList.prototype.isIndex = function(dsName) { return this.hasClass(dsName, 'qa-structure-index'); };
+DataStructureList.prototype.isLength = function(dsName) { return this.hasClass(dsName, 'qa-structure-length'); };
+DataStructureList.prototype.isString = function(dsName) { return this.hasClass(dsName, 'qa-structure-string'); };
+DataStructureList.prototype.isFactorization = function(dsName) { return this.hasClass(dsName, 'qa-structure-factor'); };
+
+class CounterList extends ItemList {
+    constructor(enabledParent, disabledParent, onChange, enableDblClick) {
+        // disabledParent can be a single element or a map { rle, factor, other }
+        super(enabledParent, disabledParent, onChange, enableDblClick, 'qa-counter', el => {
+            if (el.classList.contains('qa-counter-rle')) return 'rle';
+            if (el.classList.contains('qa-counter-factor')) return 'factor';
+            return null;
+        });
+    }
+}
+
+function OptionList(onChange) {
+    this.dictionary = {};
+    this.onChange = onChange;
+}
+
+OptionList.prototype.add = function(domCheckbox) {
+    this.dictionary[domCheckbox.dataset.opt] = domCheckbox;
+    domCheckbox.onchange = this.onChange;
+};
+
+OptionList.prototype.getEnabled = function() {
+    var result = "";
+    for(var key in this.dictionary)
+        if(this.enabled(key))
+            result += key + '-';
+    return result.substr(0, Math.max(0, result.length - 1));
+};
+
+OptionList.prototype.setEnabled = function(optList) {
+    for(var key in this.dictionary)
+        this.disable(key);
+    var opts = optList.split('-');
+    for(var i = 0; i < opts.length; i++)
+        this.enable(opts[i]);
+};
+
+OptionList.prototype.enabled = function(optName) {
+    return this.dictionary[optName] 
+        && this.dictionary[optName].checked;
+};
+
+OptionList.prototype.enable = function(optName) {
+    var el = this.dictionary[optName];
+    if(el) {
+        el.checked = true;
+        this.onChange();
+    }
+};
+
+OptionList.prototype.disable = function(optName) {
+    var el = this.dictionary[optName];
+    if(el) {
+        el.checked = false;
+        this.onChange();
+    }
+};
+
+OptionList.prototype.toggle = function(optName) {
+    if(this.enabled(optName)) this.disable(optName);
+    else this.enable(optName);
+};
+
+// Legacy URL redirects.
+// Each entry maps an old query string (everything after the ?) to a new one.
+// Add entries at the top of the list; the first match wins.
+
+var LEGACY_URL_REDIRECTS = [
+    {
+        from: "structures=index_array-text-suffix_array-lzss_factorization&options_list=baseone-whitespace-facttext-tabularize&counters=text_runs-delta-sum_of_lcp_array-lzss_factorization_size-bw_transform_runs&generate_string=fibonacci_word&generate_string_range=13&transform=necklace_conjugate_transform&transform_input=true&counter_automatic=0",
+        to: "structures=index_array-text-suffix_array-lzss_factorization&options_list=baseone-whitespace-facttext-tabularize&counters=text-delta-lcp_array-lzss_factorization-bw_transform&generate_string=fibonacci_word&generate_string_range=13&transform=necklace_conjugate_transform&counter_automatic=0",
+    },
+];
+
+function applyLegacyRedirects() {
+    var current = window.location.search.replace(/^\?/, '');
+    for (var i = 0; i < LEGACY_URL_REDIRECTS.length; i++) {
+        if (current === LEGACY_URL_REDIRECTS[i].from) {
+            var newSearch = '?' + LEGACY_URL_REDIRECTS[i].to;
+            window.history.replaceState('', '', window.location.pathname + newSearch);
+            $.query = $.query.load(newSearch);
+            return;
+        }
+    }
+}
+
+function setupShowHide(containerId) {
+	const container = document.getElementById(containerId);
+	if (!container) return;
+	const btn = container.querySelector('.qa-toggle-btn');
+	const colon = container.querySelector('.qa-itemlist-colon');
+	if (!btn) return;
+	let shown = true;
+	function getItems() {
+		return Array.from(container.querySelectorAll(':scope > .qa-item'));
+	}
+	function render() {
+		btn.textContent = shown ? '(hide)' : '(show)';
+		btn.setAttribute('aria-expanded', String(shown));
+		getItems().forEach(el => el.classList.toggle('qa-hidden', !shown));
+		if (colon) colon.classList.toggle('qa-hidden', !shown);
+	}
+	const obs = new MutationObserver(() => {
+		if (!shown) {
+			getItems().forEach(el => el.classList.add('qa-hidden'));
+			if (colon) colon.classList.add('qa-hidden');
+		}
+	});
+	obs.observe(container, { childList: true });
+	btn.addEventListener('click', (e) => {
+		e.preventDefault();
+		e.stopPropagation();
+		shown = !shown;
+		render();
+		if (typeof update_history === 'function') update_history();
+	});
+	render();
+}
+
+function changeVisibility(element, is_visible) {
+	const addClass = is_visible ? 'qa-visible' : 'qa-hidden';
+	const remClass = is_visible ? 'qa-hidden' : 'qa-visible';
+	element.classList.remove(remClass);
+	element.classList.add(addClass);
+}
+
+function getItemSortLabel(el) {
+	const node = Array.from(el.childNodes).find(n => n.nodeType === Node.TEXT_NODE);
+	return (node ? node.textContent : el.textContent).trim().toLowerCase();
+}
+
+function insertInLexOrder(parent, el, selector) {
+	const label = getItemSortLabel(el);
+	const siblings = Array.from(parent.querySelectorAll(':scope > ' + selector));
+	const before = siblings.find(s => s !== el && getItemSortLabel(s) > label);
+	if (before) parent.insertBefore(el, before);
+	else parent.appendChild(el);
+}
+
+function sortChildrenLex(parent, selector) {
+	const items = Array.from(parent.querySelectorAll(':scope > ' + selector));
+	items.sort((a, b) => getItemSortLabel(a).localeCompare(getItemSortLabel(b)));
+	items.forEach(el => parent.appendChild(el));
+}
+
+function getOwnText(element) {
+	let text = '';
+	for (const node of element.childNodes) {
+		// Check if the node is a text node (nodeType === 3)
+		if (node.nodeType === Node.TEXT_NODE) {
+			text += node.textContent;
+		}
+	}
+	return text;
+}
+
+var qa_counter_automatic;
+var qa_counter_itemlists;
+var qa_text;
+var qa_ds_output;
+var qa_counter_output;
+
+var qa_generate_string_list;
+var qa_generate_string_range;
+var qa_generate_string_rank;
+var qa_generate_string_order;
+var qa_generate_string_span;
+var qa_loading_spinner;
+
+var qa_transform_active; // button element
+var qa_transform_active_span;
+var qa_transform_list;
+var qa_transform_input;
+
+function setTransformActive(active) {
+	qa_transform_active.dataset.active = active ? '1' : '0';
+	qa_transform_active.textContent = active ? 'Disable' : 'Enable';
+}
+function isTransformActive() {
+	return qa_transform_active.dataset.active === '1';
+}
+
+var ds_name2html = {};
+var counter_name2html = {};
+// Maps counter dsName → array of structure dsNames that auto-enable it
+var counter_structures = {};
+
+var qa_prepend_input;
+var qa_append_input;
+var qa_separator_input;
+
+var structures_list;
+var counters_list;
+var options_list;
+
+var structures_default;
+var counters_default
+var options_default;
+const separator_default = ' ';
+
+var is_update_requested = true;
+var is_update_ready = true;
+function update_history() {
+	if (!is_update_ready) { is_update_requested = true; }
+	else {
+		is_update_ready = false;
+		update_history_internal();
+		setTimeout(() => {
+			is_update_ready = true;
+			if (is_update_requested) {
+				is_update_requested = false;
+				update_history();
+			}
+		}, 1000);
+	}
+}
+
+var generate_string_default;
+var generate_string_range_default;
+var transform_default;
+var prepend_default;
+var append_default;
+var timeout_default;
+const counter_automatic_default = true;
+
+function update_history_internal() {
+	var newQuery = $.query.empty();
+
+	const text_query = options_list.enabled("whitespace") ? decodeWhitespaces(qa_text.value) : qa_text.value;
+	if (text_query) { newQuery = newQuery.set("text", text_query); }
+
+	const structures_query = structures_list.getEnabled();
+	if (structures_query != structures_default) { newQuery = newQuery.set("structures", structures_query); }
+
+	const options_query = options_list.getEnabled();
+	if (options_query != options_default) { newQuery = newQuery.set("options_list", options_query); }
+
+	const separator_query = decodeWhitespaces(qa_separator_input.value);
+	if (separator_query != separator_default) { newQuery = newQuery.set("sep", separator_query); }
+
+	const counters_query = counters_list.getEnabled();
+	if (counters_query != counters_default) { newQuery = newQuery.set("counters", counters_query); }
+
+	const generate_string_query = qa_generate_string_list.value;
+	if (generate_string_query != generate_string_default) { newQuery = newQuery.set("generate_string", generate_string_query); }
+
+	const generate_string_range_query = currentLimit();
+	if (generate_string_range_query != null && generate_string_range_query != generate_string_range_default) { newQuery = newQuery.set("generate_string_range", generate_string_range_query); }
+
+	const transform_query = qa_transform_list.value;
+	if (transform_query != transform_default) { newQuery = newQuery.set("transform", transform_query); }
+
+	const transform_input_query = qa_transform_input.value;
+	if (transform_input_query != '') {
+		newQuery = newQuery.set("transform_input", transform_input_query);
+	}
+
+	const timeout_query = qa_timeout_range.value;
+	if (timeout_query != timeout_default) {
+		newQuery = newQuery.set("timeout", timeout_query);
+	}
+
+	const prepend_query = qa_prepend_input.value;
+	if (prepend_query != prepend_default) { newQuery = newQuery.set("prepend", prepend_query); }
+
+	const append_query = qa_append_input.value;
+	if (append_query != append_default) { newQuery = newQuery.set("append", append_query); }
+
+	const counter_automatic_query = qa_counter_automatic.checked;
+	if (counter_automatic_query != counter_automatic_default) { newQuery = newQuery.set("counter_automatic", counter_automatic_query ? '1' : '0'); }
+
+	const cvCbx = document.getElementById('qa-compact-view');
+	if (cvCbx) {
+		const cvDefault = !!(window.matchMedia && window.matchMedia('(max-width: 640px)').matches);
+		if (cvCbx.checked !== cvDefault) newQuery = newQuery.set("compact", cvCbx.checked ? '1' : '0');
+	}
+	const advCbx = document.getElementById('qa-show-advanced-options');
+	if (advCbx) {
+		const advDefault = !(window.matchMedia && window.matchMedia('(max-width: 640px)').matches);
+		if (advCbx.checked !== advDefault) newQuery = newQuery.set("adv", advCbx.checked ? '1' : '0');
+	}
+
+	window.history.replaceState("", "", window.location.pathname + newQuery.toString());
+}
+
+function load_history_internal() {
+	// parse configuration from GET url parameters
+	const text_query = $.query.get("text").toString();
+	if (text_query) { qa_text.value = text_query; }
+
+	const counters_query = $.query.get("counters").toString();
+	if (counters_query) { counters_list.setEnabled(counters_query); }
+
+	const structures_query = $.query.get("structures").toString();
+	if (structures_query) { structures_list.setEnabled(structures_query); }
+
+	const options_query = $.query.get("options_list").toString();
+	if (options_query) { options_list.setEnabled(options_query); }
+
+	const sepfrom_query = $.query.get("sep").toString();
+	if (sepfrom_query) { qa_separator_input.value = encodeWhitespaces(sepfrom_query); }
+
+	const generate_string_query = $.query.get("generate_string").toString();
+	if (generate_string_query) { qa_generate_string_list.value = generate_string_query; }
+	if (generate_string_query && generate_string_query != 'custom') {
+		changeVisibility(qa_generate_string_span, true);
+		changeVisibility(qa_text, false);
+	} else {
+		changeVisibility(qa_generate_string_span, false);
+		changeVisibility(qa_text, true);
+	}
+
+	const generate_string_range_query = $.query.get("generate_string_range").toString();
+	if (generate_string_range_query) {
+		updateSliderForGenerator(parseInt(generate_string_range_query));
+	}
+
+
+	const transform_query = $.query.get("transform").toString();
+	if (transform_query) { qa_transform_list.value = transform_query; }
+	if (transform_query == 'custom') {
+		changeVisibility(qa_transform_input, true);
+		changeVisibility(qa_transform_active_span, true);
+	} else {
+		changeVisibility(qa_transform_input, false);
+		changeVisibility(qa_transform_active_span, false);
+	}
+
+	const transform_input_query = $.query.get("transform_input").toString();
+	if (transform_input_query) { qa_transform_input.value = transform_input_query; }
+
+	const timeout_query = $.query.get("timeout").toString();
+	if (timeout_query) { qa_timeout_range.value = timeout_query; qa_timeout_value.textContent = timeout_query; }
+
+	const prepend_query = $.query.get("prepend").toString();
+	if (prepend_query) { qa_prepend_input.value = prepend_query; }
+
+	const append_query = $.query.get("append").toString();
+	if (append_query) { qa_append_input.value = append_query; }
+
+	const counter_automatic_query = $.query.get("counter_automatic").toString();
+	if (counter_automatic_query) { qa_counter_automatic.checked = counter_automatic_query == '1'; }
+	if (qa_counter_automatic.checked) {
+		changeVisibility(qa_counter_itemlists, false);
+	} else {
+		changeVisibility(qa_counter_itemlists, true);
+	}
+}
+
+
+
+function updateTextAreas() {
+	updateTextArea(qa_text);
+	updateTextArea(qa_ds_output);
+}
+
+function updateTextArea(area) {
+	area.style.height = "";
+	area.style.height = (10 + area.scrollHeight) + 'px';
+}
+
+var wasWhitespace = false;
+function updateWhitespaces() {
+	if (options_list.enabled("whitespace")) {
+		const selStart = qa_text.selectionStart;
+		const selEnd = qa_text.selectionEnd;
+		qa_text.value = encodeWhitespaces(qa_text.value);
+		qa_text.selectionStart = selStart;
+		qa_text.selectionEnd = selEnd;
+		wasWhitespace = true;
+	}
+	else if (wasWhitespace) {
+		const selStart = qa_text.selectionStart;
+		const selEnd = qa_text.selectionEnd;
+		qa_text.value = decodeWhitespaces(qa_text.value);
+		qa_text.selectionStart = selStart;
+		qa_text.selectionEnd = selEnd;
+		wasWhitespace = false;
+	}
+}
+
+
+
+const SLIDER_MAX = 1000;
+
+function currentGeneratorLengths() {
+	return generator_lengths[qa_generate_string_list.value] || null;
+}
+
+function orderForLength(lengths, target) {
+	let order = 0;
+	for (let i = 0; i < lengths.length; i++) {
+		if (lengths[i] <= target) order = i;
+		else break;
+	}
+	return order;
+}
+
+function sliderToOrder(sliderVal, lengths) {
+	return Math.round(sliderVal / SLIDER_MAX * (lengths.length - 1));
+}
+
+function orderToSlider(order, lengths) {
+	if (lengths.length <= 1) return 0;
+	return Math.round(order / (lengths.length - 1) * SLIDER_MAX);
+}
+
+// With exact lengths, the slider covers the lengths 1 to GENERATOR_MAX_LENGTH on a logarithmic scale.
+const GENERATOR_MAX_LENGTH = 1 << 22;
+
+function exactLengthEnabled() {
+	return !!options_list && options_list.enabled("exactlength") && !!string_generator_prefixes[qa_generate_string_list.value];
+}
+
+function sliderToLength(sliderVal) {
+	return Math.max(1, Math.round(Math.pow(GENERATOR_MAX_LENGTH, sliderVal / SLIDER_MAX)));
+}
+
+function lengthToSlider(length) {
+	return Math.round(Math.log(Math.max(1, Math.min(length, GENERATOR_MAX_LENGTH))) / Math.log(GENERATOR_MAX_LENGTH) * SLIDER_MAX);
+}
+
+function currentLimit() {
+	if (exactLengthEnabled()) return sliderToLength(parseInt(qa_generate_string_range.value));
+	const lengths = currentGeneratorLengths();
+	if (!lengths) return null;
+	return lengths[sliderToOrder(parseInt(qa_generate_string_range.value), lengths)];
+}
+
+function updateOrderLabel() {
+	if (!qa_generate_string_order) return;
+	const lengths = currentGeneratorLengths();
+	if (!lengths || exactLengthEnabled()) {
+		qa_generate_string_order.textContent = '';
+		return;
+	}
+	const order = sliderToOrder(parseInt(qa_generate_string_range.value), lengths);
+	qa_generate_string_order.textContent = '(order ' + order + ')';
+}
+
+function updateSliderForGenerator(targetLength) {
+	const lengths = currentGeneratorLengths();
+	if (!lengths) return;
+	qa_generate_string_range.min = 0;
+	qa_generate_string_range.max = SLIDER_MAX;
+	if (exactLengthEnabled()) {
+		qa_generate_string_range.value = lengthToSlider(targetLength);
+		qa_generate_string_rank.innerHTML = currentLimit();
+		updateOrderLabel();
+		return;
+	}
+	const order = orderForLength(lengths, targetLength);
+	qa_generate_string_range.value = orderToSlider(order, lengths);
+	qa_generate_string_rank.innerHTML = lengths[order];
+	updateOrderLabel();
+}
+
+
+// Formats the columns [start, end) of a row, or the whole row if no window is given; windows are padded like the whole row.
+function prettify_row(ds_text, dsName, varDs, varSep, varBase, do_padding, start, end) {
+	const length = varDs.length;
+	const n = ds_text.length;
+	if (start !== undefined) {
+		varDs = qa_slice(varDs, start, end);
+		ds_text = ds_text.substring(start, end);
+	}
+	if (structures_list.isIndex(dsName)) {
+		if (varBase != 0) {
+			varDs = increment_array(varDs);
+		}
+		varDs = replace_invalid_position(varDs, varBase + n);
+	}
+	const ds_htmlname = ds_name2html[dsName] ? ds_name2html[dsName] : dsName;
+	if (structures_list.isString(dsName)) {
+		varDs = varDs.split('\0').join("$");
+	}
+	if (!do_padding) {
+		// the exporters recognize factorizations by their boolean entries
+		if (structures_list.isFactorization(dsName) && ArrayBuffer.isView(varDs)) varDs = Array.from(varDs, Boolean);
+		return { 'name': ds_htmlname, 'data': varDs };
+	}
+
+	if (structures_list.isString(dsName)) {
+		if (options_list.enabled("whitespace")) {
+			varDs = encodeWhitespaces(varDs);
+		}
+		varDs = prettify_string(varDs, varSep, varBase, options_list.enabled("tabularize"), length);
+	} else if (structures_list.isFactorization(dsName)) {
+		if (options_list.enabled("facttext")) {
+			varDs = prettify_factorization(options_list.enabled("whitespace") ? encodeWhitespaces(ds_text) : ds_text, varDs, varSep, varBase, length);
+		} else {
+			varDs = prettify_array(Array.from(varDs, (b) => b ? 1 : 0), varSep, varBase, length);
+		}
+	} else {
+		varDs = prettify_array(varDs, varSep, varBase, length);
+	}
+	return { 'name': ds_htmlname, 'data': varDs };
+}
+
+function qa_slice(value, start, end) {
+	if (typeof value === 'string') return value.substring(start, end);
+	return ArrayBuffer.isView(value) ? value.subarray(start, end) : value.slice(start, end);
+}
+
+// Texts longer than this are shown in a window of columns that fits the width of the output area.
+const QA_WINDOW_MIN_LENGTH = 1024;
+// The structures currently shown; the window slider and the download read them.
+var qa_shown_DS = null;
+var qa_char_width = 0;
+
+// Number of columns of width `cell` (plus separator) that fit next to the row names.
+function qa_window_columns(cell, sep, pad) {
+	if (qa_char_width === 0) {
+		const context = document.createElement('canvas').getContext('2d');
+		if (context) {
+			context.font = window.getComputedStyle(qa_ds_output).font;
+			qa_char_width = context.measureText('0123456789').width / 10;
+		}
+		if (!qa_char_width) qa_char_width = 8;
+	}
+	const chars = Math.floor(qa_ds_output.clientWidth / qa_char_width) - pad - 4;
+	return Math.max(8, Math.floor(chars / (cell + sep.length)));
+}
+
+// Width of the longest name of an enabled structure.
+function qa_row_name_pad() {
+	let pad = 0;
+	structures_list.forEachEnabled(function (dsName) {
+		const ds_htmlname = ds_name2html[dsName] ? ds_name2html[dsName] : dsName;
+		if (ds_htmlname.length > pad) pad = ds_htmlname.length;
+	});
+	return pad;
+}
+
+// Rows of the enabled structures, restricted to the columns [start, end) if given.
+function qa_collect_rows(DS, varSep, varBase, do_padding, start, end) {
+	const rows = [];
+	structures_list.forEachEnabled(function (dsName) {
+		let varDs = DS[dsName];
+		// While results are streaming in, unfinished structures are marked in plain output and left out of the exporters.
+		if (DS['__partial'] && varDs === undefined) {
+			if (do_padding) rows.push({ 'name': ds_name2html[dsName] ? ds_name2html[dsName] : dsName, 'data': '…' });
+			return;
+		}
+		if (!varDs) {
+			rows.push("Function " + dsName + ": not defined");
+			return;
+		}
+		rows.push(prettify_row(DS['text'], dsName, varDs, varSep, varBase, do_padding, start, end));
+	});
+	return rows;
+}
+
+function fill_updates(DS) {
+	qa_shown_DS = DS;
+	const varSep = decodeWhitespaces(qa_separator_input.value);
+	const pad = qa_row_name_pad();
+	const varBase = options_list.enabled("baseone") ? 1 : 0;
+
+	// Only the columns inside the window are formatted, so the cost depends on what is visible, not on n.
+	const n = DS['text'].length;
+	let start, end;
+	if (n > QA_WINDOW_MIN_LENGTH) {
+		const columns = Math.min(n, qa_window_columns(String(n + varBase - 1).length, varSep, pad));
+		qa_window_range.max = n - columns;
+		start = Math.min(Number(qa_window_range.value), n - columns);
+		end = start + columns;
+		qa_window_label.textContent = `columns ${start + varBase}–${end - 1 + varBase} of ${n}`
+			+ (qa_output_select.value == 'plain' ? '' : ' (download for the whole table)');
+		qa_window.classList.remove('qa-hidden');
+	} else {
+		qa_window.classList.add('qa-hidden');
+	}
+
+	const rows = qa_collect_rows(DS, varSep, varBase, qa_output_select.value == 'plain', start, end);
+
+	if (qa_output_select.value == 'plain') {
+		const result = rows.map((row) => { return pad_right(row.name + ":", ' ', pad + 2) + row.data; });
+		qa_ds_output.value = result.join('\n');
+	} else if (qa_output_select.value == 'latex') {
+		qa_ds_output.value = export_latex(rows);
+	} else if (qa_output_select.value == 'markdown') {
+		qa_ds_output.value = export_markdown(rows);
+	} else {
+		qa_ds_output.value = export_csv(rows);
+	}
+
+	const result = [];
+
+	const wrapVal = (v) => '<span class="qa-counter-value">' + v + '</span>';
+	if (qa_counter_automatic.checked) {
+		if (DS["counter_n"] !== undefined) result.push("n: " + wrapVal(DS["counter_n"]));
+		if (DS["counter_sigma"] !== undefined) {
+			const sigma_html = counter_name2html["sigma"] || "&sigma;";
+			result.push(sigma_html + ": " + wrapVal(DS["counter_sigma"]));
+		}
+		// Single pass in structure order: emit associated counters and runs/size counters
+		const shownCounters = new Set();
+		structures_list.forEachEnabled(function (dsName) {
+			for (const cName in counter_structures) {
+				if (shownCounters.has(cName)) continue;
+				if (!counter_structures[cName].includes(dsName)) continue;
+				const varDs = DS["counter_" + cName];
+				if (varDs === undefined) continue;
+				result.push((counter_name2html[cName] || cName) + ": " + wrapVal(varDs));
+				shownCounters.add(cName);
+			}
+			if (!shownCounters.has(dsName)) {
+				const varDs = DS["counter_" + dsName];
+				if (varDs !== undefined) {
+					const ds_htmlname = counter_name2html[dsName] ? counter_name2html[dsName] : dsName;
+					result.push(ds_htmlname + ": " + wrapVal(varDs));
+					shownCounters.add(dsName);
+				}
+			}
+		});
+	} else {
+		counters_list.forEachEnabled(function (dsName) {
+			let varDs = DS["counter_" + dsName];
+			const ds_htmlname = counter_name2html[dsName] ? counter_name2html[dsName] : dsName;
+			if (varDs === undefined) {
+				result.push(DS['__partial'] ? ds_htmlname + ": " + wrapVal('…') : dsName + ": not defined");
+			} else {
+				result.push(ds_htmlname + ": " + wrapVal(varDs));
+			}
+		});
+	}
+	qa_counter_output.innerHTML = [...result].map((el) => '<span class="qa-item">' + el + '</span>').join('&nbsp;');
+
+	updateTextAreas();
+}
+
+// Yields the whole table of DS in the given format, one plain row or a few thousand cells at a time.
+function* qa_export_chunks(DS, format) {
+	const varSep = decodeWhitespaces(qa_separator_input.value);
+	const varBase = options_list.enabled("baseone") ? 1 : 0;
+	if (format == 'plain') {
+		const pad = qa_row_name_pad();
+		const names = [];
+		structures_list.forEachEnabled(function (dsName) { names.push(dsName); });
+		let first = true;
+		for (const dsName of names) {
+			if (!DS[dsName]) continue;
+			const row = prettify_row(DS['text'], dsName, DS[dsName], varSep, varBase, true);
+			yield (first ? '' : '\n') + pad_right(row.name + ":", ' ', pad + 2) + row.data;
+			first = false;
+		}
+		return;
+	}
+	const rows = qa_collect_rows(DS, varSep, varBase, false);
+	if (format == 'latex') yield* export_latex_chunks(rows);
+	else if (format == 'markdown') yield* export_markdown_chunks(rows);
+	else yield* export_csv_chunks(rows);
+}
+
+const QA_EXPORT_EXTENSIONS = { plain: 'txt', latex: 'tex', markdown: 'md', csv: 'csv' };
+
+// Writes the shown structures in the selected format into a downloaded file. The chunks are
+// produced in slices of a few milliseconds, so the page stays responsive for large texts.
+function qa_download_export() {
+	if (qa_shown_DS === null || qa_shown_DS['__partial']) return;
+	const format = qa_output_select.value;
+	const chunks = qa_export_chunks(qa_shown_DS, format);
+	const parts = [];
+	qa_download_button.disabled = true;
+	function step() {
+		const deadline = performance.now() + 12;
+		for (let next = chunks.next(); !next.done; next = chunks.next()) {
+			parts.push(next.value);
+			if (performance.now() > deadline) {
+				setTimeout(step, 0);
+				return;
+			}
+		}
+		const url = URL.createObjectURL(new Blob(parts, { type: 'text/plain;charset=utf-8' }));
+		const link = document.createElement('a');
+		link.href = url;
+		link.download = 'quickarrays.' + QA_EXPORT_EXTENSIONS[format];
+		link.click();
+		setTimeout(() => URL.revokeObjectURL(url), 0);
+		qa_download_button.disabled = false;
+	}
+	step();
+}
+
+var qa_worker = null;
+var qa_is_loaded = false;
+var qa_timeout_id = null;
+
+function updateArrays() {
+	if (!qa_is_loaded) {
+		return;
+	}
+
+	update_history();
+	qa_separator_input.value = encodeWhitespaces(qa_separator_input.value);
+	updateWhitespaces();
+
+
+	// Only the named structures and counters are returned; their dependencies are built and dropped inside build_ds.
+	const enabled_names = [];
+	structures_list.forEachEnabled(function (dsName) {
+		enabled_names.push(dsName);
+	});
+	counters_list.forEachEnabled(function (dsName) {
+		enabled_names.push("counter_" + dsName);
+	});
+
+	// Always compute n and sigma
+	enabled_names.push("counter_n");
+	enabled_names.push("counter_sigma");
+
+	// In auto mode, enable counters whose associated structures are currently enabled
+	if (qa_counter_automatic.checked) {
+		structures_list.forEachEnabled(function (dsName) {
+			enabled_names.push("counter_" + dsName);
+		});
+		for (const dsName in counter_structures) {
+			const associated = counter_structures[dsName];
+			if (!associated.some(s => structures_list.enabled(s))) continue;
+			enabled_names.push("counter_" + dsName);
+		}
+	}
+	// Unknown names are ignored, so counters without a count_ function simply drop out.
+	const enabled_flags = structure_flag_set(enabled_names);
+
+	// Build params — shared between the single worker and the worker pool
+	const transformSelection = qa_transform_list.value;
+	let workerParams;
+	if (qa_generate_string_list.value !== 'custom') {
+		workerParams = {
+			generatorName: qa_generate_string_list.value,
+			limit: currentLimit(),
+			exact: exactLengthEnabled(),
+			customText: null,
+			placeholder: qa_text.placeholder,
+		};
+	} else {
+		const rawText = options_list.enabled("whitespace")
+			? decodeWhitespaces(qa_text.value)
+			: qa_text.value;
+		workerParams = {
+			generatorName: null,
+			limit: null,
+			customText: rawText || null,
+			placeholder: qa_text.placeholder,
+		};
+	}
+	workerParams.transformSelection = transformSelection;
+	workerParams.customTransformActive = (transformSelection === 'custom') && isTransformActive();
+	workerParams.customFnSource = (transformSelection === 'custom') ? (qa_transform_input.value || qa_transform_input.placeholder) : null;
+	workerParams.prepend = qa_prepend_input.value;
+	workerParams.append = qa_append_input.value;
+	workerParams.dollar = options_list.enabled("dollar");
+	workerParams.persist = options_list.enabled("persist");
+	workerParams.enabled_flags = enabled_flags;
+	workerParams.profile = true;
+
+	// The structures are only built in workers, so the page does not load the algorithms.
+	if (document.querySelectorAll('script[type="text/js-worker"]').length === 0) {
+		qa_computation_status.textContent = `⚠️ Warning: No worker scripts found!`;
+		qa_timeout_range.disabled = true;
+		return;
+	}
+
+	qa_cancel_partial();
+	if (options_list.enabled("parallel")) {
+		qa_parallel_request(workerParams, enabled_flags);
+		return;
+	}
+	if (qa_pool_request !== null) qa_pool_cancel();
+
+	if (qa_worker === null) qa_spawn_worker();
+	// A newer request supersedes the pending one; the worker skips it or its result is discarded.
+	workerParams.generation = ++qa_generation;
+	qa_request = { generation: workerParams.generation, params: workerParams, time_now: Date.now(), partial_profile: [], DS: { __partial: true } };
+	show_profile(qa_request.partial_profile);
+	qa_post_request(qa_request);
+}
+
+// The worker is compiled once from all "text/js-worker" scripts and kept alive across requests.
+// Scripts given by their src instead of inline code are loaded by the worker itself.
+var qa_worker_url = null;
+// Generation of the newest request; results of older generations are stale.
+var qa_generation = 0;
+// Generation the worker is currently computing, or -1 if it is idle.
+var qa_worker_running = -1;
+// The newest request still waiting for its result: { generation, params, time_now, partial_profile, DS },
+// where DS collects the structures streamed in so far.
+var qa_request = null;
+
+function qa_worker_blob_url() {
+	if (qa_worker_url === null) {
+		const blob = new Blob(
+			Array.prototype.map.call(
+				document.querySelectorAll("script[type='text/js-worker']"),
+				(script) => script.textContent || `importScripts(${JSON.stringify(script.src)});\n`,
+			),
+			{ type: "text/javascript" },
+		);
+		qa_worker_url = window.URL.createObjectURL(blob);
+	}
+	return qa_worker_url;
+}
+
+function qa_spawn_worker() {
+	qa_worker = new Worker(qa_worker_blob_url());
+	qa_worker_running = -1;
+	qa_worker.onmessage = qa_worker_message;
+	qa_worker.onerror = qa_worker_error;
+}
+
+function qa_post_request(request) {
+	clearTimeout(qa_timeout_id);
+	const timeout_seconds = Number(qa_timeout_range.value);
+	qa_computation_status.textContent = `Computing... (timeout: ${timeout_seconds}s)`;
+	if (qa_loading_spinner) qa_loading_spinner.classList.add('qa-spinning');
+	qa_timeout_id = timeout_seconds > 0
+		? setTimeout(() => qa_worker_timeout(request, timeout_seconds), timeout_seconds * 1000)
+		: null;
+	qa_worker.postMessage(request.params);
+}
+
+// Hard-terminates the worker and pre-spawns a fresh one. If the worker was still busy with
+// a stale request, the current request gets a new worker and a new timeout instead of failing.
+function qa_worker_timeout(request, timeout_seconds) {
+	qa_timeout_id = null;
+	const busy_with_stale = qa_worker_running !== -1 && qa_worker_running !== request.generation;
+	qa_worker.terminate();
+	qa_spawn_worker();
+	if (busy_with_stale) {
+		qa_post_request(request);
+		return;
+	}
+	qa_request = null;
+	qa_show_killed(timeout_seconds, request.partial_profile, '(killed while building the next structure)', request.DS);
+}
+
+// Structures finished before the timeout stay on screen; only the unfinished ones are marked.
+function qa_show_killed(timeout_seconds, profile, note, DS) {
+	qa_cancel_partial();
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `Killed after ${timeout_seconds}s`
+	show_profile(profile, note);
+	if (DS && DS['text'] !== undefined) {
+		fill_updates(DS);
+		qa_computation_status.textContent += ', showing the finished structures';
+		qa_counter_output.querySelectorAll('.qa-counter-value').forEach(span => {
+			if (span.textContent === '…') span.textContent = '?';
+		});
+		return;
+	}
+	qa_ds_output.value = `Timeout: killed after ${timeout_seconds}s.\n(limit can be adjusted below)`;
+	updateTextArea(qa_ds_output);
+	qa_counter_output.querySelectorAll('.qa-counter-value').forEach(span => {
+		span.textContent = '?';
+	});
+}
+
+function qa_worker_error(error) {
+	error.preventDefault();
+	const failed = qa_request !== null && qa_worker_running === qa_request.generation;
+	qa_worker_running = -1;
+	if (!failed) return;
+	clearTimeout(qa_timeout_id);
+	qa_request = null;
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `Error during computation: ${error.message}`;
+}
+
+function qa_worker_message(event) {
+	const data = event.data;
+	if (data.__started !== undefined) {
+		qa_worker_running = data.__started;
+		return;
+	}
+	const current = qa_request !== null && data.__generation === qa_request.generation;
+	if (data.__profile_entry) {
+		if (current) qa_request.partial_profile.push(data.__profile_entry);
+		return;
+	}
+	if (data.__text !== undefined) {
+		if (current) qa_request.DS['text'] = data.__text;
+		return;
+	}
+	if (data.__result !== undefined) {
+		if (!current) return;
+		qa_request.DS[data.__result] = data.value;
+		qa_render_partial(qa_request.DS);
+		return;
+	}
+	qa_worker_running = -1;
+	if (!current) return;
+
+	const time_now = qa_request.time_now;
+	const DS = Object.assign(qa_request.DS, data);
+	delete DS['__partial'];
+	qa_request = null;
+	qa_show_result(DS, time_now);
+}
+
+var qa_partial_timer = null;
+var qa_partial_DS = null;
+
+// Renders the structures received so far, at most once per 100ms.
+function qa_render_partial(DS) {
+	qa_partial_DS = DS;
+	if (qa_partial_timer !== null) return;
+	qa_partial_timer = setTimeout(() => {
+		qa_partial_timer = null;
+		if (qa_partial_DS !== null && qa_partial_DS['text'] !== undefined) fill_updates(qa_partial_DS);
+	}, 100);
+}
+
+function qa_cancel_partial() {
+	clearTimeout(qa_partial_timer);
+	qa_partial_timer = null;
+	qa_partial_DS = null;
+}
+
+// Shows a finished computation: the structures of DS plus its __-prefixed bookkeeping fields.
+function qa_show_result(DS, time_now) {
+	clearTimeout(qa_timeout_id);
+	qa_cancel_partial();
+	show_profile(DS['__profile']);
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `✅ Computation finished in ${((Date.now() - time_now) / 1000).toFixed(2)}s`;
+
+	if (DS['__transformError']) {
+		alert("Error in transformation: " + DS['__transformError']);
+		setTransformActive(false);
+	}
+	if (qa_generate_string_order) {
+		const order = DS['__generator_order'];
+		qa_generate_string_order.textContent = order !== null ? '(order ' + order + ')' : '';
+	}
+	fill_updates(DS);
+}
+
+// Parallel mode: the page schedules the structures of a request over a pool of
+// navigator.hardwareConcurrency workers, starting each structure as soon as its dependencies are built.
+// The text and integer-array results live in SharedArrayBuffers when the page is cross-origin isolated;
+// otherwise they are copied to the workers by structured cloning.
+var qa_pool = [];
+// The parallel request in flight: { generation, enabled_flags, time_now, DS } while its text is prepared,
+// then also { text, waiting, consumers, values, requested, running, done, total }.
+var qa_pool_request = null;
+
+function qa_pool_worker(slot) {
+	const entry = { worker: new Worker(qa_worker_blob_url()), task: null };
+	entry.worker.onmessage = (event) => qa_pool_message(entry, event.data);
+	entry.worker.onerror = (error) => qa_pool_error(entry, error);
+	qa_pool[slot] = entry;
+}
+
+// Drops the request in flight; workers still busy with it are replaced by fresh ones.
+function qa_pool_cancel() {
+	qa_pool_request = null;
+	for (let i = 0; i < qa_pool.length; i++) {
+		if (qa_pool[i].task === null) continue;
+		qa_pool[i].worker.terminate();
+		qa_pool_worker(i);
+	}
+}
+
+function qa_parallel_request(params, enabled_flags) {
+	qa_pool_cancel();
+	clearTimeout(qa_timeout_id);
+	// A computation of the single worker still running is stale from now on.
+	qa_request = null;
+	const request = { generation: ++qa_generation, enabled_flags: enabled_flags, time_now: Date.now(), DS: null };
+	qa_pool_request = request;
+
+	const timeout_seconds = Number(qa_timeout_range.value);
+	qa_computation_status.textContent = `Computing... (timeout: ${timeout_seconds}s)`;
+	if (qa_loading_spinner) qa_loading_spinner.classList.add('qa-spinning');
+	qa_timeout_id = timeout_seconds > 0
+		? setTimeout(() => qa_pool_timeout(request, timeout_seconds), timeout_seconds * 1000)
+		: null;
+
+	const size = Math.max(1, navigator.hardwareConcurrency || 1);
+	for (let i = qa_pool.length; i < size; i++) qa_pool_worker(i);
+	// The text is prepared by a worker too, since generators and transforms are not loaded by the page.
+	const entry = qa_pool[0];
+	entry.task = 'text';
+	entry.worker.postMessage({ __prepare: params, __generation: request.generation });
+}
+
+// Schedules the structures of a request once its text is prepared.
+function qa_pool_prepared(request, prepared) {
+	const text = prepared.text;
+	const DS = { text: text, __generator_order: prepared.generator_order, __profile: [], __partial: true };
+	request.DS = DS;
+	if (prepared.transformError) DS['__transformError'] = prepared.transformError;
+	if (text.length === 0) {
+		qa_pool_request = null;
+		delete DS['__partial'];
+		qa_show_result(DS, request.time_now);
+		return;
+	}
+	DS['counter_text'] = prepared.counter_text;
+
+	// Structures in construction order, and how many of them consume each structure.
+	const need = structure_closure_of(request.enabled_flags);
+	const waiting = [];
+	const consumers = {};
+	for (const name in structure_flags) {
+		const flag = structure_flags[name];
+		if (!(need[flag[0]] & flag[1])) continue;
+		waiting.push(name);
+		consumers[name] = 0;
+		for (const dep of structure_dependencies[name]) consumers[dep]++;
+	}
+
+	let task_text = text;
+	if (window.crossOriginIsolated && typeof SharedArrayBuffer !== 'undefined') {
+		task_text = new Uint16Array(new SharedArrayBuffer(2 * text.length));
+		for (let i = 0; i < text.length; i++) task_text[i] = text.charCodeAt(i);
+	}
+
+	Object.assign(request, {
+		text: task_text, waiting: waiting, consumers: consumers, values: {},
+		requested: request.enabled_flags, running: 0, done: 0, total: waiting.length,
+	});
+	show_profile(DS['__profile']);
+	qa_pool_dispatch(request);
+}
+
+// Hands every structure whose dependencies are built to an idle worker.
+function qa_pool_dispatch(request) {
+	for (let i = 0; i < request.waiting.length;) {
+		const name = request.waiting[i];
+		const deps = structure_dependencies[name];
+		if (!deps.every((dep) => dep in request.values)) { i++; continue; }
+		const entry = qa_pool.find((e) => e.task === null);
+		if (!entry) return;
+		request.waiting.splice(i, 1);
+		const inputs = {};
+		for (const dep of deps) inputs[dep] = request.values[dep];
+		entry.task = name;
+		request.running++;
+		entry.worker.postMessage({ __task: name, __generation: request.generation, text: request.text, inputs: inputs });
+	}
+	if (request.running === 0) {
+		qa_pool_request = null;
+		delete request.DS['__partial'];
+		qa_show_result(request.DS, request.time_now);
+	}
+}
+
+// Merges a finished structure and releases the inputs no remaining task consumes.
+function qa_pool_message(entry, data) {
+	entry.task = null;
+	const request = qa_pool_request;
+	if (request === null || data.__generation !== request.generation) return;
+	if (data.__prepared !== undefined) {
+		qa_pool_prepared(request, data.__prepared);
+		return;
+	}
+	request.running--;
+	request.done++;
+	request.DS['__profile'].push(data.__profile_entry);
+	show_profile(request.DS['__profile']);
+
+	const name = data.__task;
+	const flag = structure_flags[name];
+	if (request.requested[flag[0]] & flag[1]) {
+		request.DS[name] = data.value;
+		qa_render_partial(request.DS);
+	}
+	if (request.consumers[name] > 0) request.values[name] = data.value;
+	for (const dep of structure_dependencies[name]) {
+		if (--request.consumers[dep] === 0) delete request.values[dep];
+	}
+	qa_computation_status.textContent = `Computing... (${request.done}/${request.total} structures)`;
+	qa_pool_dispatch(request);
+}
+
+function qa_pool_error(entry, error) {
+	error.preventDefault();
+	if (entry.task === null || qa_pool_request === null) return;
+	qa_pool_cancel();
+	clearTimeout(qa_timeout_id);
+	if (qa_loading_spinner) qa_loading_spinner.classList.remove('qa-spinning');
+	qa_computation_status.textContent = `Error during computation: ${error.message}`;
+}
+
+function qa_pool_timeout(request, timeout_seconds) {
+	qa_timeout_id = null;
+	if (qa_pool_request !== request) return;
+	const running = qa_pool.filter((e) => e.task !== null).map((e) => e.task);
+	qa_pool_cancel();
+	const profile = request.DS ? request.DS['__profile'] : [];
+	qa_show_killed(timeout_seconds, profile, '(killed while building ' + running.join(', ') + ')', request.DS);
+}
+
+// groupName: shared Sortable group name (string)
+// enabledEl: the enabled list DOM element
+// disabledMap: object mapping category keys to DOM elements, e.g. { string: el, index: el, ... }
+// categoryClassFn: function(cat) → CSS class that items in that category carry
+function initDragAndDropGrouped(groupName, enabledEl, disabledMap, categoryClassFn, itemClass) {
+	Sortable.create(enabledEl, {
+		group: { name: groupName, pull: true, put: true },
+		sort: true,
+		draggable: '.qa-item',
+		ghostClass: 'qa-item-ghost',
+		dragClass: 'qa-item-drag',
+		onSort: updateArrays
+	});
+	for (const cat in disabledMap) {
+		const el = disabledMap[cat];
+		if (!el) continue;
+		const cls = categoryClassFn(cat);
+		Sortable.create(el, {
+			group: {
+				name: groupName,
+				put: function (to, from, dragEl) {
+					return from.el === enabledEl && dragEl.classList.contains(cls);
+				}
+			},
+			sort: false,
+			draggable: '.qa-item',
+			ghostClass: 'qa-item-ghost',
+			dragClass: 'qa-item-drag',
+			onAdd: function (evt) {
+				sortChildrenLex(evt.to, '.' + itemClass);
+				updateArrays();
+			}
+		});
+	}
+}
+
+var qa_tutorial_open_button;
+var qa_tutorial_select;
+var qa_tutorial_open_selected_button;
+var qa_tutorial_close_button;
+var qa_tutorial_overlay;
+var qa_tutorial_title;
+var qa_tutorial_content;
+var qa_tutorial_oeis
+var qa_tutorial_cite;
+var qa_tutorial_wikipedia;
+var qa_output_select;
+
+var qa_window;
+var qa_window_range;
+var qa_window_label;
+var qa_download_button;
+
+var qa_timeout_range;
+var qa_timeout_value;
+var qa_computation_status;
+var qa_profile;
+var qa_profile_output;
+
+// Shows the per-structure costs recorded by build_ds; `note` is appended when the computation did not finish.
+function show_profile(profile, note) {
+	if (!qa_profile) return;
+	if (!profile || profile.length === 0) {
+		qa_profile.classList.add('qa-hidden');
+		return;
+	}
+	qa_profile_output.textContent = format_profile(profile) + (note ? '\n' + note : '');
+	qa_profile.classList.remove('qa-hidden');
+}
+
+function qa_html_to_text(html) {
+	const el = document.createElement('div');
+	el.innerHTML = html;
+	return (el.textContent || el.innerText || '').trim();
+}
+
+function qa_populate_tutorial_select() {
+	if (!qa_tutorial_select) return;
+	const ids = Object.keys(tutorials || {});
+	if (ids.length === 0) return;
+	ids.sort((a, b) => {
+		const ta = tutorials[a] && tutorials[a].title ? qa_html_to_text(tutorials[a].title) : a;
+		const tb = tutorials[b] && tutorials[b].title ? qa_html_to_text(tutorials[b].title) : b;
+		return ta.localeCompare(tb);
+	});
+	const prev = qa_tutorial_select.value;
+	qa_tutorial_select.innerHTML = '';
+	for (const id of ids) {
+		const opt = document.createElement('option');
+		opt.value = id;
+		opt.textContent = tutorials[id] && tutorials[id].title ? qa_html_to_text(tutorials[id].title) : id;
+		qa_tutorial_select.appendChild(opt);
+	}
+	if (prev) qa_tutorial_select.value = prev;
+}
+
+// MathJax is loaded on first use, i.e., when a tutorial shows math that was not prerendered at build time.
+const QA_MATHJAX_URL = 'https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js';
+const QA_TEX_RE = /\\\(|\\\[/;
+var qa_mathjax = null;
+
+function qa_typeset(element) {
+	if (qa_mathjax === null) {
+		qa_mathjax = new Promise((resolve, reject) => {
+			window.MathJax = { startup: { typeset: false } };
+			const script = document.createElement('script');
+			script.src = QA_MATHJAX_URL;
+			script.async = true;
+			script.onload = () => MathJax.startup.promise.then(resolve, reject);
+			script.onerror = () => { qa_mathjax = null; reject(new Error('cannot load MathJax')); };
+			document.head.appendChild(script);
+		});
+	}
+	qa_mathjax.then(() => MathJax.typesetPromise([element])).catch((error) => console.warn(error));
+}
+
+function update_tutorial(id, name) {
+	if (tutorials[id] === undefined) { return; }
+	const tutorial = tutorials[id];
+	qa_tutorial_title.innerHTML = tutorial.title;
+	qa_tutorial_content.innerHTML = tutorial.content;
+	// Math prerendered at build time is SVG already; only TeX left over needs MathJax.
+	if (QA_TEX_RE.test(tutorial.content)) qa_typeset(qa_tutorial_content);
+	if (tutorial.oeis !== undefined) {
+		qa_tutorial_oeis.style.display = "block";
+		qa_tutorial_oeis.innerHTML = "Converges to OEIS sequence " + tutorial.oeis;
+		qa_tutorial_oeis.href = "https://oeis.org/" + tutorial.oeis;
+	}
+	else {
+		qa_tutorial_oeis.style.display = "none";
+	}
+	if (tutorial.cite !== undefined) {
+		qa_tutorial_cite.style.display = "block";
+		qa_tutorial_cite.href = tutorial.cite;
+		if (typeof citations !== 'undefined' && citations[tutorial.cite] !== 'undefined') {
+			qa_tutorial_cite.innerHTML = citations[tutorial.cite];
+			qa_tutorial_cite.querySelectorAll('a').forEach(a => a.target = '_blank');
+		}
+	}
+	else {
+		qa_tutorial_cite.style.display = "none";
+	}
+	if (tutorial.wikipedia !== undefined) {
+		qa_tutorial_wikipedia.style.display = "block";
+		qa_tutorial_wikipedia.innerHTML = "Wikipedia Article about " + name;
+		qa_tutorial_wikipedia.href = "https://en.wikipedia.org/wiki/" + tutorial.wikipedia;
+	} else {
+		qa_tutorial_wikipedia.style.display = "none";
+	}
+	qa_populate_tutorial_select();
+	if (qa_tutorial_select) qa_tutorial_select.value = id;
+}
+
+window.onload = function () {
+	qa_tutorial_open_button = document.getElementById('qa-tutorial-open-button');
+	qa_tutorial_select = document.getElementById('qa-tutorial-select');
+	qa_tutorial_open_selected_button = document.getElementById('qa-tutorial-open-selected');
+	qa_tutorial_close_button = document.getElementById('qa-tutorial-close-button');
+	qa_tutorial_overlay = document.getElementById('qa-tutorial-overlay');
+	qa_tutorial_title = document.getElementById('qa-tutorial-title');
+	qa_tutorial_content = document.getElementById('qa-tutorial-content');
+	qa_tutorial_oeis = document.getElementById('qa-tutorial-oeis');
+	qa_tutorial_cite = document.getElementById('qa-tutorial-cite');
+	qa_tutorial_wikipedia = document.getElementById('qa-tutorial-wikipedia');
+
+	qa_timeout_range = document.getElementById('qa-timeout-range');
+	qa_timeout_value = document.getElementById('qa-timeout-value');
+	qa_timeout_range.oninput = () => {
+		qa_timeout_value.textContent = qa_timeout_range.value;
+		update_history();
+	};
+	qa_computation_status = document.getElementById('qa-computation-status');
+	qa_profile = document.getElementById('qa-profile');
+	qa_profile_output = document.getElementById('qa-profile-output');
+
+	qa_output_select = document.getElementById('qa-output-select');
+	qa_download_button = document.getElementById('qa-download-button');
+	qa_download_button.onclick = qa_download_export;
+	qa_window = document.getElementById('qa-window');
+	qa_window_range = document.getElementById('qa-window-range');
+	qa_window_label = document.getElementById('qa-window-label');
+	qa_window_range.oninput = () => {
+		if (qa_shown_DS !== null) fill_updates(qa_shown_DS);
+	};
+
+	qa_counter_itemlists = document.getElementById('qa-counter-itemlists');
+	qa_counter_automatic = document.getElementById('qa-counter-automatic');
+	qa_transform_active = document.getElementById('qa-transform-active');
+	qa_transform_list = document.getElementById('qa-transform-list');
+	qa_transform_input = document.getElementById('qa-transform-input');
+	qa_transform_active_span = document.getElementById('qa-transform-active-span');
+
+	qa_text = document.getElementById('qa-text');
+	qa_ds_output = document.getElementById('qa-ds-output');
+	qa_counter_output = document.getElementById('qa-counter-output');
+	qa_separator_input = document.getElementById('qa-separator-input');
+	qa_prepend_input = document.getElementById('qa-prepend-input');
+	qa_append_input = document.getElementById('qa-append-input');
+
+	qa_generate_string_list = document.getElementById('qa-generate-string-list');
+	qa_generate_string_range = document.getElementById('qa-generate-string-range');
+	qa_generate_string_rank = document.getElementById('qa-generate-string-rank');
+	qa_generate_string_order = document.getElementById('qa-generate-string-order');
+	qa_generate_string_span = document.getElementById('qa-generate-string-span');
+	qa_loading_spinner = document.getElementById('qa-loading-spinner');
+
+	timeout_default = qa_timeout_range.value;
+	qa_separator_input.value = encodeWhitespaces(separator_default);
+	generate_string_default = qa_generate_string_list.value;
+	updateSliderForGenerator(16);
+	generate_string_range_default = currentLimit();
+	transform_default = qa_transform_list.value;
+	prepend_default = qa_prepend_input.value;
+	append_default = qa_append_input.value;
+
+	const ds_list_enabled = document.getElementById('qa-structures-enabled');
+	const ds_list_disabled = {
+		string: document.getElementById('qa-structures-disabled-string'),
+		index: document.getElementById('qa-structures-disabled-index'),
+		length: document.getElementById('qa-structures-disabled-length'),
+		factor: document.getElementById('qa-structures-disabled-factor'),
+		other: document.getElementById('qa-structures-disabled-other'),
+	};
+
+	// Distribute source items into category sections
+	(function () {
+		const src = document.getElementById('qa-structures-disabled-source');
+		if (!src) return;
+		Array.from(src.querySelectorAll('.qa-structure')).forEach(el => {
+			if (el.classList.contains('qa-structure-string')) ds_list_disabled.string.appendChild(el);
+			else if (el.classList.contains('qa-structure-index')) ds_list_disabled.index.appendChild(el);
+			else if (el.classList.contains('qa-structure-length')) ds_list_disabled.length.appendChild(el);
+			else if (el.classList.contains('qa-structure-factor')) ds_list_disabled.factor.appendChild(el);
+			else ds_list_disabled.other.appendChild(el);
+		});
+		src.remove();
+		for (const cat in ds_list_disabled) {
+			if (ds_list_disabled[cat]) sortChildrenLex(ds_list_disabled[cat], '.qa-structure');
+		}
+	})();
+
+	const counter_list_enabled = document.getElementById('qa-counter-enabled');
+	const counter_list_disabled = {
+		rle: document.getElementById('qa-counter-disabled-rle'),
+		factor: document.getElementById('qa-counter-disabled-factor'),
+		other: document.getElementById('qa-counter-disabled-other'),
+	};
+
+	// Distribute counter source items into category sections
+	(function () {
+		const src = document.getElementById('qa-counter-disabled-source');
+		if (!src) return;
+		Array.from(src.querySelectorAll('.qa-counter')).forEach(el => {
+			if (el.classList.contains('qa-counter-rle')) counter_list_disabled.rle.appendChild(el);
+			else if (el.classList.contains('qa-counter-factor')) counter_list_disabled.factor.appendChild(el);
+			else counter_list_disabled.other.appendChild(el);
+		});
+		src.remove();
+		for (const cat in counter_list_disabled) {
+			if (counter_list_disabled[cat]) sortChildrenLex(counter_list_disabled[cat], '.qa-counter');
+		}
+	})();
+
+	// initalize data structure settings container
+	structures_list = new DataStructureList(ds_list_enabled, ds_list_disabled, updateArrays, true);
+	document.querySelectorAll(".qa-structure").forEach((elem) => { structures_list.add(elem); });
+	structures_default = structures_list.getEnabled();
+
+	// initialize counter settings container
+	counters_list = new CounterList(counter_list_enabled, counter_list_disabled, updateArrays, true);
+	document.querySelectorAll(".qa-counter").forEach((elem) => { counters_list.add(elem); });
+	counters_default = counters_list.getEnabled();
+
+	// initialize option settings container
+	options_list = new OptionList(updateArrays);
+	document.querySelectorAll(".qa-option-cbx").forEach((elem) => { options_list.add(elem); });
+	options_default = options_list.getEnabled();
+
+	initDragAndDropGrouped('qa-structs', ds_list_enabled, ds_list_disabled, cat => 'qa-structure-' + cat, 'qa-structure');
+	initDragAndDropGrouped('qa-counters', counter_list_enabled, counter_list_disabled, cat => 'qa-counter-' + cat, 'qa-counter');
+
+	applyLegacyRedirects();
+	load_history_internal();
+
+	//tutorial
+	qa_populate_tutorial_select();
+	if (qa_tutorial_open_selected_button) {
+		qa_tutorial_open_selected_button.onclick = function () {
+			if (qa_tutorial_select && qa_tutorial_select.selectedIndex >= 0) {
+				update_tutorial(
+					qa_tutorial_select.value,
+					qa_tutorial_select.options[qa_tutorial_select.selectedIndex].textContent
+				);
+			}
+			qa_tutorial_overlay.style.display = "block";
+		};
+	}
+	qa_tutorial_close_button.onclick = function () { qa_tutorial_overlay.style.display = "none"; }
+	// Close the pop-up when clicking anywhere outside the box
+	window.onclick = function (event) {
+		if (event.target == qa_tutorial_overlay) {
+			qa_tutorial_overlay.style.display = "none";
+		}
+	}
+
+	document.querySelectorAll(".qa-item").forEach((elem) => {
+		if (tutorials[elem.dataset.ds] === undefined) { return; }
+		elem.onmouseover = function () {
+			update_tutorial(elem.dataset.ds, elem.innerHTML);
+		};
+	});
+
+
+	const triggering = [qa_prepend_input, qa_append_input, qa_transform_list, qa_generate_string_list, qa_output_select];
+	for (const idx in triggering) {
+		triggering[idx].addEventListener('change', function () {
+			updateArrays();
+		});
+		triggering[idx].addEventListener('input', function () {
+			updateArrays();
+		});
+	}
+	qa_transform_active.addEventListener('click', function () {
+		setTransformActive(!isTransformActive());
+		updateArrays();
+	});
+	qa_counter_automatic.addEventListener('change', function () {
+		changeVisibility(qa_counter_itemlists, !qa_counter_automatic.checked);
+		updateArrays();
+	});
+
+
+	let _lastLimit = null;
+	qa_generate_string_range.addEventListener('input', function () {
+		const limit = currentLimit();
+		qa_generate_string_rank.innerHTML = limit !== null ? limit : '';
+		updateOrderLabel();
+		if (limit !== _lastLimit) {
+			_lastLimit = limit;
+			updateArrays();
+		}
+	});
+
+	// the slider maps to other lengths with exact lengths, so keep the current length when toggling them
+	document.querySelector('.qa-option-cbx[data-opt="exactlength"]').addEventListener('change', function () {
+		updateSliderForGenerator(parseInt(qa_generate_string_rank.innerHTML) || 16);
+		updateArrays();
+	});
+
+	qa_transform_list.addEventListener('change', function () {
+		setTransformActive(false);
+		updateArrays();
+	});
+
+	qa_generate_string_list.addEventListener('change', function () {
+		const is_visible = this.value != 'custom';
+		changeVisibility(qa_generate_string_span, is_visible);
+		changeVisibility(qa_text, !is_visible);
+		const selectedIndex = this.selectedIndex;
+		const selectedInnerHTML = this.options[selectedIndex].innerHTML;
+		update_tutorial(this.value, selectedInnerHTML);
+		const currentLength = parseInt(qa_generate_string_rank.innerHTML) || 16;
+		updateSliderForGenerator(currentLength);
+		updateArrays();
+	});
+
+	qa_transform_list.addEventListener('change', function () {
+		const is_visible = this.value == 'custom';
+		changeVisibility(qa_transform_input, is_visible);
+		changeVisibility(qa_transform_active_span, is_visible);
+		const selectedIndex = this.selectedIndex;
+		const selectedInnerHTML = this.options[selectedIndex].innerHTML;
+		update_tutorial(this.value, selectedInnerHTML);
+		updateArrays();
+	});
+	qa_transform_input.addEventListener('input', function () {
+		setTransformActive(false);
+		updateArrays();
+	});
+	qa_transform_input.addEventListener('change', function () {
+		setTransformActive(false);
+		updateArrays();
+	});
+
+	setupShowHide('qa-structures-enabled');
+	setupShowHide('qa-structures-disabled-string');
+	setupShowHide('qa-structures-disabled-index');
+	setupShowHide('qa-structures-disabled-length');
+	setupShowHide('qa-structures-disabled-factor');
+	setupShowHide('qa-structures-disabled-other');
+	setupShowHide('qa-counter-enabled');
+	setupShowHide('qa-counter-disabled-rle');
+	setupShowHide('qa-counter-disabled-factor');
+	setupShowHide('qa-counter-disabled-other');
+
+	// Compact view
+	(function () {
+		const DESC_NORMAL = 'Choose your data structures and factorizations (drag and drop or double-click):<br />\n        You can use drag and drop to reorder your selection!';
+		const DESC_COMPACT = 'Choose your data structures and factorizations (use the dropdown to add; double-click to remove):<br />\n        You can use drag and drop to reorder your selection!';
+		const DISABLED_IDS = ['qa-structures-disabled-string', 'qa-structures-disabled-index', 'qa-structures-disabled-length', 'qa-structures-disabled-factor', 'qa-structures-disabled-other'];
+
+		function structureGroup(el) {
+			if (!el) return 'other';
+			if (el.classList.contains('qa-structure-string')) return 'string';
+			if (el.classList.contains('qa-structure-index')) return 'index';
+			if (el.classList.contains('qa-structure-length')) return 'length';
+			if (el.classList.contains('qa-structure-factor')) return 'factor';
+			return 'other';
+		}
+
+		const GROUP_TITLES = { string: 'String transforms', index: 'Index permutations', length: 'Length arrays', factor: 'Factorizations', other: 'Other' };
+
+		function getLabel(el) {
+			const node = Array.from(el.childNodes).find(n => n.nodeType === Node.TEXT_NODE);
+			return (node ? node.textContent : el.textContent).trim();
+		}
+
+		function rebuildDropdown() {
+			const select = document.getElementById('qa-structures-add-select');
+			if (!select || !window.structures_list) return;
+			const placeholder = select.querySelector('option[value=""]');
+			select.innerHTML = '';
+			if (placeholder) select.appendChild(placeholder);
+			if (placeholder) placeholder.selected = true;
+			const groups = { string: [], index: [], length: [], factor: [], other: [] };
+			for (const ds in structures_list.dictionary) {
+				if (!structures_list.dictionary.hasOwnProperty(ds)) continue;
+				if (structures_list.enabled(ds)) continue;
+				const el = structures_list.dictionary[ds];
+				groups[structureGroup(el)].push(el);
+			}
+			for (const k in groups) groups[k].sort((a, b) => getLabel(a).localeCompare(getLabel(b)));
+			['string', 'index', 'length', 'factor', 'other'].forEach(key => {
+				if (!groups[key].length) return;
+				const og = document.createElement('optgroup');
+				og.label = GROUP_TITLES[key] || key;
+				groups[key].forEach(el => {
+					const opt = document.createElement('option');
+					opt.value = el.dataset.ds;
+					opt.textContent = getLabel(el);
+					og.appendChild(opt);
+				});
+				select.appendChild(og);
+			});
+		}
+
+		function setCompactView(on) {
+			const desc = document.getElementById('qa-structures-description');
+			const controls = document.getElementById('qa-structures-compact-controls');
+			const box = document.getElementById('qa-structures-box');
+			if (box) box.classList.toggle('qa-compact-on', on);
+			if (desc) desc.innerHTML = on ? DESC_COMPACT : DESC_NORMAL;
+			if (controls) controls.classList.toggle('qa-hidden', !on);
+			DISABLED_IDS.forEach(id => {
+				const el = document.getElementById(id);
+				if (el) el.classList.toggle('qa-hidden', on);
+			});
+			if (on) rebuildDropdown();
+		}
+
+		const cbx = document.getElementById('qa-compact-view');
+		const select = document.getElementById('qa-structures-add-select');
+		if (!cbx || !select) return;
+
+		// Keep dropdown in sync when structures change
+		const origUpdateArrays = window.updateArrays;
+		window.updateArrays = function () {
+			const r = origUpdateArrays.apply(this, arguments);
+			if (cbx.checked) rebuildDropdown();
+			return r;
+		};
+
+		let rebuildPending = false;
+		const scheduleRebuild = () => {
+			if (!cbx.checked) return;
+			if (rebuildPending) return;
+			rebuildPending = true;
+			requestAnimationFrame(() => { rebuildPending = false; rebuildDropdown(); });
+		};
+		const watchEls = [ds_list_enabled, ...DISABLED_IDS.map(id => document.getElementById(id))].filter(Boolean);
+		const obs = new MutationObserver(scheduleRebuild);
+		watchEls.forEach(el => obs.observe(el, { childList: true }));
+		const structuresBox = document.getElementById('qa-structures-box');
+		if (structuresBox) structuresBox.addEventListener('dblclick', scheduleRebuild, true);
+
+		cbx.addEventListener('change', () => {
+			setCompactView(cbx.checked);
+			if (typeof update_history === 'function') update_history();
+		});
+
+		select.addEventListener('change', () => {
+			const ds = select.value;
+			if (!ds || !window.structures_list) return;
+			structures_list.enable(ds);
+			const placeholder = select.querySelector('option[value=""]');
+			if (placeholder) placeholder.selected = true;
+			rebuildDropdown();
+		});
+
+		// Initial state from URL or screen width
+		const urlCompact = $.query.get('compact').toString();
+		const defaultOn = !!(window.matchMedia && window.matchMedia('(max-width: 640px)').matches);
+		const initialOn = urlCompact === '1' ? true : urlCompact === '0' ? false : defaultOn;
+		cbx.checked = initialOn;
+		setCompactView(initialOn);
+	})();
+
+	// Show/hide advanced options
+	(function () {
+		function applyAdvanced(on) {
+			document.querySelectorAll('.qa-advanced-option').forEach(el => {
+				el.classList.toggle('qa-hidden', !on);
+			});
+		}
+		const cbx = document.getElementById('qa-show-advanced-options');
+		if (!cbx) return;
+		const urlAdv = $.query.get('adv').toString();
+		const defaultOn = !(window.matchMedia && window.matchMedia('(max-width: 640px)').matches);
+		const initialOn = urlAdv === '1' ? true : urlAdv === '0' ? false : defaultOn;
+		cbx.checked = initialOn;
+		applyAdvanced(initialOn);
+		cbx.addEventListener('change', () => {
+			applyAdvanced(cbx.checked);
+			if (typeof update_history === 'function') update_history();
+		});
+	})();
+
+	document.querySelectorAll(".qa-structure").forEach((elem) => { ds_name2html[elem.dataset.ds] = getOwnText(elem); });
+	document.querySelectorAll(".qa-counter").forEach((elem) => {
+		const ds = elem.dataset.ds;
+		counter_name2html[ds] = getOwnText(elem);
+		const structs = elem.dataset.structures;
+		if (structs) counter_structures[ds] = structs.split(',').map(s => s.trim()).filter(Boolean);
+	});
+
+	// update output while typing
+	qa_text.oninput = updateArrays;
+	qa_text.onpropertychange = updateArrays;
+	qa_separator_input.oninput = updateArrays;
+	qa_separator_input.onpropertychange = updateArrays;
+
+	update_history_internal();
+	qa_is_loaded = true;
+	updateArrays();
+};
@@ -0,0 +1 @@
+../../assets/counter_list.js
\ No newline at end of file
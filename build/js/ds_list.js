@@ -0,0 +1 @@
+../../assets/ds_list.js
\ No newline at end of file
@@ -0,0 +1 @@
+var x_28455 = 1;
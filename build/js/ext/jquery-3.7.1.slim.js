@@ -0,0 +1 @@
+var x_18007 = 1;
@@ -0,0 +1 @@
+var x_26826 = 1;
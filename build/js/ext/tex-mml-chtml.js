@@ -0,0 +1 @@
+var x_29120 = 1;
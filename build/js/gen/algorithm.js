@@ -0,0 +1,4118 @@
+"use strict";
+function assert_eq(a, b, message) {
+    const is_list = (x)=>Array.isArray(x) || ArrayBuffer.isView(x);
+    let equal = false;
+    if (is_list(a) && is_list(b)) {
+        equal = a.length === b.length && Array.prototype.every.call(a, (v, i)=>v === b[i] || typeof b[i] === 'boolean' && v === +b[i]);
+    } else {
+        equal = a === b;
+    }
+    if (!equal) {
+        const aStr = is_list(a) ? `[${Array.from(a)}]` : a;
+        const bStr = is_list(b) ? `[${Array.from(b)}]` : b;
+        throw new Error(`Assertion Failed: ${message}. Expected "${bStr}", but got "${aStr}"`);
+    }
+}
+class AlgorithmError extends Error {
+    algorithm;
+    input;
+    constructor(message, algorithm, input){
+        super(message), this.algorithm = algorithm, this.input = input;
+        this.name = 'AlgorithmError';
+    }
+}
+function count_n(text) {
+    return text.length;
+}
+export function test_n() {
+    assert_eq(count_n(""), 0, "Length of empty string");
+    assert_eq(count_n("four"), 4, "Length of 'four'");
+}
+function count_sigma(text) {
+    if (!text) {
+        return 0;
+    }
+    return new Set(text).size;
+}
+export function test_sigma() {
+    assert_eq(count_sigma("abab"), 2, "Alphabet size of 'abab'");
+    assert_eq(count_sigma("abcde"), 5, "Alphabet size of 'abcde'");
+    assert_eq(count_sigma("aaaaa"), 1, "Alphabet size of 'aaaaa'");
+    assert_eq(count_sigma("ababa"), 2, "Alphabet size of 'ababa'");
+    assert_eq(count_sigma("a"), 1, "Alphabet size of 'a'");
+    assert_eq(count_sigma(""), 0, "Alphabet size of empty string");
+}
+function count_period(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 0;
+    }
+    const last_border = border_array[border_array.length - 1];
+    return border_array.length - last_border;
+}
+export function test_period() {
+    assert_eq(count_period([
+        0,
+        0,
+        1,
+        2
+    ]), 2, "Period of 'abab'");
+    assert_eq(count_period([
+        0,
+        0,
+        0,
+        0,
+        0
+    ]), 5, "Period of 'abcde'");
+    assert_eq(count_period([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), 1, "Period of 'aaaaa'");
+    assert_eq(count_period([
+        0,
+        0,
+        1,
+        2,
+        3
+    ]), 2, "Period of 'ababa'");
+    assert_eq(count_period([
+        0
+    ]), 1, "Period of 'a'");
+    assert_eq(count_period([]), 0, "Period of empty string");
+}
+function count_exponent(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 0;
+    }
+    const period = count_period(border_array);
+    return border_array.length / period;
+}
+export function test_exponent() {
+    assert_eq(count_exponent([
+        0,
+        0,
+        1,
+        2
+    ]), 2, "Exponent of 'abab'");
+    assert_eq(count_exponent([
+        0,
+        0,
+        0,
+        0,
+        0
+    ]), 1, "Exponent of 'abcde'");
+    assert_eq(count_exponent([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), 5, "Exponent of 'aaaaa'");
+    assert_eq(count_exponent([
+        0,
+        0,
+        1,
+        2,
+        3
+    ]), 2.5, "Exponent of 'ababa'");
+    assert_eq(count_exponent([
+        0
+    ]), 1, "Exponent of 'a'");
+    assert_eq(count_exponent([]), 0, "Exponent of empty string");
+}
+function count_regularity(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 'empty';
+    }
+    const n = border_array.length;
+    const last_border = border_array[n - 1];
+    const period = count_period(border_array);
+    const exponent = count_exponent(border_array);
+    if (exponent > 1 && n % period == 0) {
+        if (exponent == 2) {
+            return 'square';
+        }
+        return 'non-primitive';
+    }
+    if (last_border == 0) {
+        return 'unbordered';
+    }
+    return 'primitive';
+}
+export function test_regularity() {
+    assert_eq(count_regularity([
+        0,
+        0,
+        0,
+        0,
+        0
+    ]), 'unbordered', "Regularity of 'abcde'");
+    assert_eq(count_regularity([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), 'non-primitive', "Regularity of 'aaaaa'");
+    assert_eq(count_regularity([
+        0,
+        0,
+        1,
+        2,
+        3
+    ]), 'primitive', "Regularity of 'ababa'");
+    assert_eq(count_regularity([
+        0,
+        0,
+        1,
+        2
+    ]), 'square', "Regularity of 'abab'");
+    assert_eq(count_regularity([
+        0
+    ]), 'unbordered', "Regularity of 'a'");
+    assert_eq(count_regularity([]), 'empty', "Regularity of empty string");
+}
+function effective_alphabet_ranks(text) {
+    const n = text.length;
+    let max_code = -1;
+    for(let i = 0; i < n; ++i){
+        max_code = Math.max(max_code, text.charCodeAt(i));
+    }
+    const rank_of = new Int32Array(max_code + 1);
+    for(let i = 0; i < n; ++i){
+        rank_of[text.charCodeAt(i)] = 1;
+    }
+    let sigma = 0;
+    for(let c = 0; c < rank_of.length; ++c){
+        if (rank_of[c] !== 0) {
+            rank_of[c] = sigma++;
+        }
+    }
+    const ranks = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        ranks[i] = rank_of[text.charCodeAt(i)];
+    }
+    return [
+        ranks,
+        sigma
+    ];
+}
+export function test_effective_alphabet_ranks() {
+    const [ranks, sigma] = effective_alphabet_ranks("banana");
+    assert_eq(Array.from(ranks), [
+        1,
+        0,
+        2,
+        0,
+        2,
+        0
+    ], "Ranks of 'banana'");
+    assert_eq(sigma, 3, "Alphabet size of 'banana'");
+    assert_eq(effective_alphabet_ranks("")[1], 0, "Alphabet size of empty string");
+    assert_eq(Array.from(effective_alphabet_ranks("b\0a")[0]), [
+        2,
+        0,
+        1
+    ], "Ranks of 'b\\0a'");
+}
+function suffix_sort(s, upper) {
+    const n = s.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    if (n === 1) {
+        return Int32Array.of(0);
+    }
+    if (n === 2) {
+        return s[0] < s[1] ? Int32Array.of(0, 1) : Int32Array.of(1, 0);
+    }
+    const sa = new Int32Array(n);
+    const is_s = new Uint8Array(n);
+    for(let i = n - 2; i >= 0; --i){
+        is_s[i] = s[i] === s[i + 1] ? is_s[i + 1] : s[i] < s[i + 1] ? 1 : 0;
+    }
+    const sum_l = new Int32Array(upper + 2);
+    const sum_s = new Int32Array(upper + 2);
+    for(let i = 0; i < n; ++i){
+        if (is_s[i] === 0) {
+            sum_s[s[i]]++;
+        } else {
+            sum_l[s[i] + 1]++;
+        }
+    }
+    for(let c = 0; c <= upper; ++c){
+        sum_s[c] += sum_l[c];
+        if (c < upper) {
+            sum_l[c + 1] += sum_s[c];
+        }
+    }
+    const buf = new Int32Array(upper + 2);
+    function induce(lms) {
+        sa.fill(-1);
+        buf.set(sum_s);
+        for(let k = 0; k < lms.length; ++k){
+            const d = lms[k];
+            if (d !== n) {
+                sa[buf[s[d]]++] = d;
+            }
+        }
+        buf.set(sum_l);
+        sa[buf[s[n - 1]]++] = n - 1;
+        for(let i = 0; i < n; ++i){
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 0) {
+                sa[buf[s[v - 1]]++] = v - 1;
+            }
+        }
+        buf.set(sum_l);
+        for(let i = n - 1; i >= 0; --i){
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 1) {
+                sa[--buf[s[v - 1] + 1]] = v - 1;
+            }
+        }
+    }
+    const lms_map = new Int32Array(n + 1).fill(-1);
+    let m = 0;
+    for(let i = 1; i < n; ++i){
+        if (is_s[i - 1] === 0 && is_s[i] === 1) {
+            lms_map[i] = m++;
+        }
+    }
+    const lms = new Int32Array(m);
+    for(let i = 1, k = 0; i < n; ++i){
+        if (is_s[i - 1] === 0 && is_s[i] === 1) {
+            lms[k++] = i;
+        }
+    }
+    induce(lms);
+    if (m > 0) {
+        const sorted_lms = new Int32Array(m);
+        for(let i = 0, k = 0; i < n; ++i){
+            if (lms_map[sa[i]] !== -1) {
+                sorted_lms[k++] = sa[i];
+            }
+        }
+        const rec_s = new Int32Array(m);
+        let rec_upper = 0;
+        rec_s[lms_map[sorted_lms[0]]] = 0;
+        for(let i = 1; i < m; ++i){
+            let l = sorted_lms[i - 1];
+            let r = sorted_lms[i];
+            const end_l = lms_map[l] + 1 < m ? lms[lms_map[l] + 1] : n;
+            const end_r = lms_map[r] + 1 < m ? lms[lms_map[r] + 1] : n;
+            let same = true;
+            if (end_l - l !== end_r - r) {
+                same = false;
+            } else {
+                while(l < end_l && s[l] === s[r]){
+                    l++;
+                    r++;
+                }
+                if (l === n || s[l] !== s[r]) {
+                    same = false;
+                }
+            }
+            if (!same) {
+                rec_upper++;
+            }
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper;
+        }
+        const rec_sa = suffix_sort(rec_s, rec_upper);
+        for(let i = 0; i < m; ++i){
+            sorted_lms[i] = lms[rec_sa[i]];
+        }
+        induce(sorted_lms);
+    }
+    return sa;
+}
+export function test_suffix_sort() {
+    function naive_suffix_array(text) {
+        return [
+            ...Array(text.length).keys()
+        ].sort((a, b)=>{
+            const sa = text.substring(a);
+            const sb = text.substring(b);
+            return sa < sb ? -1 : sa > sb ? 1 : 0;
+        });
+    }
+    function test_helper(text) {
+        const [ranks, sigma] = effective_alphabet_ranks(text);
+        assert_eq(Array.from(suffix_sort(ranks, Math.max(0, sigma - 1))), naive_suffix_array(text), `SA-IS of '${text}'`);
+    }
+    [
+        "",
+        "a",
+        "aa",
+        "ab",
+        "ba",
+        "banana",
+        "abracadabra",
+        "mississippi",
+        "aaaaaaaaaa",
+        "abababab",
+        "Banana",
+        "ab\0ba\0"
+    ].forEach(test_helper);
+    test_helper("abaababaabaababaababaabaababaabaab");
+    test_helper("abbabaabbaababbabaababbaabbabaab");
+    for(let i = 0; i < 50; ++i){
+        test_helper(random_ternary_string(1 + i * 7));
+    }
+}
+function cyclic_sort(s, sigma, next) {
+    const n = s.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    const order = new Int32Array(n);
+    const count = new Int32Array(Math.max(n, sigma) + 1);
+    let rank = new Int32Array(n);
+    let buf = new Int32Array(n);
+    function sort_by_rank(input, classes) {
+        count.fill(0, 0, classes + 1);
+        for(let i = 0; i < n; ++i){
+            count[rank[i] + 1]++;
+        }
+        for(let c = 0; c < classes; ++c){
+            count[c + 1] += count[c];
+        }
+        for(let j = 0; j < n; ++j){
+            const i = input[j];
+            order[count[rank[i]]++] = i;
+        }
+    }
+    rank.set(s);
+    for(let i = 0; i < n; ++i){
+        buf[i] = i;
+    }
+    sort_by_rank(buf, sigma);
+    let classes = 0;
+    for(let j = 0; j < n; ++j){
+        if (j > 0 && s[order[j]] !== s[order[j - 1]]) {
+            classes++;
+        }
+        rank[order[j]] = classes;
+    }
+    classes++;
+    let jump = Int32Array.from(next);
+    let inv_jump = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        inv_jump[jump[i]] = i;
+    }
+    let jump_buf = new Int32Array(n);
+    for(let k = 1; classes < n && k < 2 * n; k <<= 1){
+        for(let j = 0; j < n; ++j){
+            buf[j] = inv_jump[order[j]];
+        }
+        sort_by_rank(buf, classes);
+        let c = 0;
+        buf[order[0]] = 0;
+        for(let j = 1; j < n; ++j){
+            const a = order[j - 1];
+            const b = order[j];
+            if (rank[a] !== rank[b] || rank[jump[a]] !== rank[jump[b]]) {
+                c++;
+            }
+            buf[b] = c;
+        }
+        classes = c + 1;
+        [rank, buf] = [
+            buf,
+            rank
+        ];
+        for(let i = 0; i < n; ++i){
+            jump_buf[i] = jump[jump[i]];
+        }
+        [jump, jump_buf] = [
+            jump_buf,
+            jump
+        ];
+        for(let i = 0; i < n; ++i){
+            inv_jump[jump[i]] = i;
+        }
+    }
+    for(let i = 0; i < n; ++i){
+        buf[i] = i;
+    }
+    sort_by_rank(buf, classes);
+    return order;
+}
+function factor_successors(factorization, n) {
+    const next = new Int32Array(n);
+    let factor_start = 0;
+    for(let i = 0; i < n; ++i){
+        if (factorization[i] || i === n - 1) {
+            next[i] = factor_start;
+            factor_start = i + 1;
+        } else {
+            next[i] = i + 1;
+        }
+    }
+    return next;
+}
+export function test_cyclic_sort() {
+    function naive_rotation_array(text) {
+        return [
+            ...Array(text.length).keys()
+        ].sort((a, b)=>{
+            const ra = conjugate_string(text, a);
+            const rb = conjugate_string(text, b);
+            return ra < rb ? -1 : ra > rb ? 1 : a - b;
+        });
+    }
+    function naive_circular_suffix_array(text, factorization) {
+        const conjugates = [];
+        let factor_start = 0;
+        for (const factor of phrases_from_factorizations(text, factorization)){
+            for(let i = 0; i < factor.length; ++i){
+                conjugates.push([
+                    factor_start + i,
+                    conjugate_string(factor, i)
+                ]);
+            }
+            factor_start += factor.length;
+        }
+        return conjugates.sort((a, b)=>omega_order(a[1], b[1]) || a[0] - b[0]).map((c)=>c[0]);
+    }
+    function test_helper(text) {
+        assert_eq(construct_rotation_array(text), naive_rotation_array(text), `Rotation array of '${text}'`);
+        const lyndon_factorization = construct_lyndon_factorization(text, construct_inverse_suffix_array(construct_suffix_array(text)));
+        assert_eq(construct_circular_suffix_array(text, lyndon_factorization), naive_circular_suffix_array(text, lyndon_factorization), `CSA of '${text}'`);
+    }
+    [
+        "a",
+        "ab",
+        "ba",
+        "aa",
+        "abab",
+        "baba",
+        "banana",
+        "mississippi",
+        "abcabcabc",
+        "bababab",
+        "aabaabaab"
+    ].forEach(test_helper);
+    for(let i = 0; i < 50; ++i){
+        test_helper(random_ternary_string(1 + i * 5));
+    }
+    assert_eq(Array.from(factor_successors([
+        false,
+        true,
+        false,
+        false,
+        true
+    ], 5)), [
+        1,
+        0,
+        3,
+        4,
+        2
+    ], "Successors of two factors");
+    assert_eq(Array.from(factor_successors([
+        false,
+        false,
+        false
+    ], 3)), [
+        1,
+        2,
+        0
+    ], "Successors of an unterminated factor");
+}
+function construct_suffix_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return suffix_sort(ranks, sigma - 1);
+}
+export function test_suffix_array() {
+    assert_eq(construct_suffix_array("banana"), [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ], "Suffix array of 'banana'");
+    assert_eq(construct_suffix_array("abracadabra"), [
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ], "Suffix array of 'abracadabra'");
+    assert_eq(construct_suffix_array(""), [], "Suffix array of empty string");
+    assert_eq(construct_suffix_array("a"), [
+        0
+    ], "Suffix array of 'a'");
+    assert_eq(construct_suffix_array("aaaaa"), [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "Suffix array of 'aaaaa'");
+    assert_eq(construct_suffix_array("abcde"), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Suffix array of 'abcde'");
+    assert_eq(construct_suffix_array("mississippi"), [
+        10,
+        7,
+        4,
+        1,
+        0,
+        9,
+        8,
+        6,
+        3,
+        5,
+        2
+    ], "Suffix array of 'mississippi'");
+}
+function construct_border_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const border = new Int32Array(n);
+    border[0] = 0;
+    for(let i = 1; i < n; i++){
+        let j = border[i - 1];
+        while(j > 0 && text[i] !== text[j]){
+            j = border[j - 1];
+        }
+        if (text[i] === text[j]) {
+            j++;
+        }
+        border[i] = j;
+    }
+    return border;
+}
+export function test_border_array() {
+    assert_eq(construct_border_array("ababa"), [
+        0,
+        0,
+        1,
+        2,
+        3
+    ], "Border array of 'ababa'");
+    assert_eq(construct_border_array("aaaa"), [
+        0,
+        1,
+        2,
+        3
+    ], "Border array of 'aaaa'");
+    assert_eq(construct_border_array("abcd"), [
+        0,
+        0,
+        0,
+        0
+    ], "Border array of 'abcd'");
+    assert_eq(construct_border_array(""), [], "Border array of empty string");
+    assert_eq(construct_border_array("a"), [
+        0
+    ], "Border array of 'a'");
+    assert_eq(construct_border_array("abcababc"), [
+        0,
+        0,
+        0,
+        1,
+        2,
+        1,
+        2,
+        3
+    ], "Border array of 'abcababc'");
+}
+function construct_bw_transform(text, rotation_array) {
+    if (!text) {
+        return "";
+    }
+    if (text.length !== rotation_array.length) {
+        throw new AlgorithmError('Invalid input: text must be a string and rotation_array must be an array', 'BWT', {
+            text,
+            rotation_array
+        });
+    }
+    const n = text.length;
+    let result = "";
+    for(let i = 0; i < n; i++){
+        result += text[(rotation_array[i] + n - 1) % n];
+    }
+    return result;
+}
+export function test_bw_transform() {
+    assert_eq(construct_bw_transform("banana", [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]), "nnbaaa", "BWT of 'banana'");
+    assert_eq(construct_bw_transform("abracadabra", [
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ]), "rdarcaaaabb", "BWT of 'abracadabra'");
+    assert_eq(construct_bw_transform("", []), "", "BWT of empty string");
+    assert_eq(construct_bw_transform("a", [
+        0
+    ]), "a", "BWT of 'a'");
+    assert_eq(construct_bw_transform("aaaaa", [
+        4,
+        3,
+        2,
+        1,
+        0
+    ]), "aaaaa", "BWT of 'aaaaa'");
+    assert_eq(construct_bw_transform("abcde", [
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), "eabcd", "BWT of 'abcde'");
+}
+function construct_first_array(text) {
+    if (!text) {
+        return "";
+    }
+    return [
+        ...text
+    ].sort().join('');
+}
+export function test_first_array() {
+    assert_eq(construct_first_array("annb$aa"), "$aaabnn", "First array of 'annb$aa'");
+    assert_eq(construct_first_array("ard$rcaaaabb"), "$aaaaabbcdrr", "First array of 'ard$rcaaaabb'");
+    assert_eq(construct_first_array(""), "", "First array of empty string");
+    assert_eq(construct_first_array("a"), "a", "First array of 'a'");
+    assert_eq(construct_first_array("aaaaa"), "aaaaa", "First array of 'aaaaa'");
+    assert_eq(construct_first_array("eabcd"), "abcde", "First array of 'eabcd'");
+}
+function construct_index_array(n) {
+    if (!n || n <= 0) {
+        return new Int32Array(0);
+    }
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = i;
+    }
+    return result;
+}
+export function test_index_array() {
+    assert_eq(construct_index_array(5), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Index array of length 5");
+    assert_eq(construct_index_array(0), [], "Index array of length 0");
+    assert_eq(construct_index_array(1), [
+        0
+    ], "Index array of length 1");
+    assert_eq(construct_index_array(10), [
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+        7,
+        8,
+        9
+    ], "Index array of length 10");
+}
+function construct_rotation_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    const next = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        next[i] = (i + 1) % n;
+    }
+    return cyclic_sort(ranks, sigma, next);
+}
+export function test_rotation_array() {
+    assert_eq(construct_rotation_array("banana"), [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ], "Rotation array of 'banana'");
+    assert_eq(construct_rotation_array("abracadabra"), [
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ], "Rotation array of 'abracadabra'");
+    assert_eq(construct_rotation_array(""), [], "Rotation array of empty string");
+    assert_eq(construct_rotation_array("a"), [
+        0
+    ], "Rotation array of 'a'");
+    assert_eq(construct_rotation_array("aaaaa"), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Rotation array of 'aaaaa'");
+    assert_eq(construct_rotation_array("edcba"), [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "Rotation array of 'edcba'");
+    assert_eq(construct_rotation_array("abcde"), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Rotation array of 'abcde'");
+}
+function construct_inverse_suffix_array(suffix_array) {
+    if (!suffix_array) {
+        return new Int32Array(0);
+    }
+    const result = new Int32Array(suffix_array.length);
+    for(let i = 0; i < suffix_array.length; i++){
+        result[suffix_array[i]] = i;
+    }
+    return result;
+}
+export function test_inverse_suffix_array() {
+    assert_eq(construct_inverse_suffix_array([
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]), [
+        3,
+        2,
+        5,
+        1,
+        4,
+        0
+    ], "Inverse suffix array of 'banana'");
+    assert_eq(construct_inverse_suffix_array([
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ]), [
+        2,
+        6,
+        10,
+        3,
+        7,
+        4,
+        8,
+        1,
+        5,
+        9,
+        0
+    ], "Inverse suffix array of 'abracadabra'");
+    assert_eq(construct_inverse_suffix_array([]), [], "Inverse suffix array of empty array");
+    assert_eq(construct_inverse_suffix_array([
+        0
+    ]), [
+        0
+    ], "Inverse suffix array of [0]");
+    assert_eq(construct_inverse_suffix_array([
+        4,
+        3,
+        2,
+        1,
+        0
+    ]), [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "Inverse suffix array of [4,3,2,1,0]");
+    assert_eq(construct_inverse_suffix_array([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Inverse suffix array of [0,1,2,3,4]");
+}
+function construct_phi_array(suffix_array, inverse_suffix_array) {
+    const n = suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        if (inverse_suffix_array[i] !== 0) {
+            result[i] = suffix_array[inverse_suffix_array[i] - 1];
+        } else {
+            result[i] = n;
+        }
+    }
+    return result;
+}
+export function test_phi_array() {
+    function test_helper(text) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        const phi_array = construct_phi_array(suffix_array, inverse_suffix_array);
+        return phi_array;
+    }
+    assert_eq(test_helper("banana"), [
+        1,
+        3,
+        4,
+        5,
+        0,
+        6
+    ], "Phi array of 'banana'");
+    assert_eq(test_helper("abracadabra"), [
+        7,
+        8,
+        9,
+        0,
+        1,
+        3,
+        4,
+        10,
+        5,
+        6,
+        11
+    ], "Phi array of 'abracadabra'");
+    assert_eq(test_helper(""), [], "Phi array of empty string");
+    assert_eq(test_helper("a"), [
+        1
+    ], "Phi array of 'a'");
+    assert_eq(test_helper("aaaaa"), [
+        1,
+        2,
+        3,
+        4,
+        5
+    ], "Phi array of 'aaaaa'");
+    assert_eq(test_helper("abcde"), [
+        5,
+        0,
+        1,
+        2,
+        3
+    ], "Phi array of 'abcde'");
+    assert_eq(test_helper("edcba"), [
+        1,
+        2,
+        3,
+        4,
+        5
+    ], "Phi array of 'edcba'");
+}
+function construct_inverse_phi_array(suffix_array, inverse_suffix_array) {
+    if (!suffix_array || !inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        if (inverse_suffix_array[i] + 1 !== n) {
+            result[i] = suffix_array[inverse_suffix_array[i] + 1];
+        } else {
+            result[i] = n;
+        }
+    }
+    return result;
+}
+export function test_inverse_phi_array() {
+    function test_helper(text) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        const inverse_phi_array = construct_inverse_phi_array(suffix_array, inverse_suffix_array);
+        return inverse_phi_array;
+    }
+    assert_eq(test_helper("banana"), [
+        4,
+        0,
+        6,
+        1,
+        2,
+        3
+    ], "Inverse Phi array of 'banana'");
+    assert_eq(test_helper("abracadabra"), [
+        3,
+        4,
+        11,
+        5,
+        6,
+        8,
+        9,
+        0,
+        1,
+        2,
+        7
+    ], "Inverse Phi array of 'abracadabra'");
+    assert_eq(test_helper("a"), [
+        1
+    ], "Inverse Phi array of 'a'");
+    assert_eq(test_helper("aaaaa"), [
+        5,
+        0,
+        1,
+        2,
+        3
+    ], "Inverse Phi array of 'aaaaa'");
+    assert_eq(test_helper("abcde"), [
+        1,
+        2,
+        3,
+        4,
+        5
+    ], "Inverse Phi array of 'abcde'");
+    assert_eq(test_helper("edcba"), [
+        5,
+        0,
+        1,
+        2,
+        3
+    ], "Inverse Phi array of 'edcba'");
+    assert_eq(test_helper(""), [], "Inverse Phi array of empty string");
+}
+function lcp_query(text, index1, index2) {
+    if (!text || index1 < 0 || index2 < 0 || index1 >= text.length || index2 >= text.length) {
+        return 0;
+    }
+    let lcp = 0;
+    const maxLength = Math.min(text.length - index1, text.length - index2);
+    for(let k = 0; k < maxLength; ++k){
+        if (text[index1 + k] === text[index2 + k]) {
+            lcp++;
+        } else {
+            break;
+        }
+    }
+    return lcp;
+}
+export function test_lcp_query() {
+    assert_eq(lcp_query("banana", 1, 3), 3, "LCP of suffixes starting at 1 and 3 in 'banana'");
+    assert_eq(lcp_query("abracadabra", 0, 3), 1, "LCP of suffixes starting at 0 and 3 in 'abracadabra'");
+    assert_eq(lcp_query("aaaaa", 0, 2), 3, "LCP of suffixes starting at 0 and 2 in 'aaaaa'");
+    assert_eq(lcp_query("abcde", 1, 3), 0, "LCP of suffixes starting at 1 and 3 in 'abcde'");
+    assert_eq(lcp_query("mississippi", 2, 5), 3, "LCP of suffixes starting at 2 and 5 in 'mississippi'");
+    assert_eq(lcp_query("hello", 0, 0), 5, "LCP of suffixes starting at 0 and 0 in 'hello'");
+    assert_eq(lcp_query("", 0, 0), 0, "LCP of suffixes in empty string");
+}
+function build_range_min_table(values) {
+    const n = values.length;
+    const levels = [
+        Int32Array.from(values)
+    ];
+    for(let width = 1; 2 * width <= n; width *= 2){
+        const prev = levels[levels.length - 1];
+        const level = new Int32Array(n - 2 * width + 1);
+        for(let i = 0; i < level.length; i++){
+            level[i] = Math.min(prev[i], prev[i + width]);
+        }
+        levels.push(level);
+    }
+    return levels;
+}
+function range_min_query(levels, left, right) {
+    const level = 31 - Math.clz32(right - left + 1);
+    const table = levels[level];
+    return Math.min(table[left], table[right - (1 << level) + 1]);
+}
+export function test_range_min_query() {
+    function test_helper(values) {
+        const levels = build_range_min_table(values);
+        for(let left = 0; left < values.length; left++){
+            for(let right = left; right < values.length; right++){
+                assert_eq(range_min_query(levels, left, right), Math.min(...values.slice(left, right + 1)), `Minimum of [${left}..${right}] in [${values}]`);
+            }
+        }
+    }
+    test_helper([
+        0
+    ]);
+    test_helper([
+        3,
+        1,
+        4,
+        1,
+        5,
+        9,
+        2,
+        6,
+        5,
+        3,
+        5
+    ]);
+    test_helper([
+        5,
+        4,
+        3,
+        2,
+        1,
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+        7,
+        8,
+        9,
+        10,
+        11
+    ]);
+    for(let i = 0; i < 10; i++){
+        test_helper([
+            ...random_ternary_string(1 + i * 7)
+        ].map((c)=>c.charCodeAt(0)));
+    }
+}
+function construct_lcp_array(text, suffix_array, inverse_suffix_array) {
+    if (!text || !suffix_array || !inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    const result = new Int32Array(n);
+    let lcp = 0;
+    for(let i = 0; i < n; i++){
+        const rank = inverse_suffix_array[i];
+        if (rank === 0) {
+            lcp = 0;
+            continue;
+        }
+        const j = suffix_array[rank - 1];
+        while(i + lcp < n && j + lcp < n && text.charCodeAt(i + lcp) === text.charCodeAt(j + lcp)){
+            lcp++;
+        }
+        result[rank] = lcp;
+        if (lcp > 0) {
+            lcp--;
+        }
+    }
+    return result;
+}
+export function test_lcp_array() {
+    function test_helper(text, suffix_array) {
+        return construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array));
+    }
+    assert_eq(test_helper("banana", [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]), [
+        0,
+        1,
+        3,
+        0,
+        0,
+        2
+    ], "LCP array of 'banana'");
+    assert_eq(test_helper("abracadabra", [
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ]), [
+        0,
+        1,
+        4,
+        1,
+        1,
+        0,
+        3,
+        0,
+        0,
+        0,
+        2
+    ], "LCP array of 'abracadabra'");
+    assert_eq(test_helper("", []), [], "LCP array of empty string");
+    assert_eq(test_helper("a", [
+        0
+    ]), [
+        0
+    ], "LCP array of 'a'");
+    assert_eq(test_helper("aaaaa", [
+        4,
+        3,
+        2,
+        1,
+        0
+    ]), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "LCP array of 'aaaaa'");
+    assert_eq(test_helper("abcde", [
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "LCP array of 'abcde'");
+    for(let i = 0; i < 20; i++){
+        const text = random_ternary_string(1 + i * 11);
+        const suffix_array = construct_suffix_array(text);
+        const naive = suffix_array.map((pos, rank)=>rank === 0 ? 0 : lcp_query(text, pos, suffix_array[rank - 1]));
+        assert_eq(test_helper(text, suffix_array), naive, `LCP array of '${text}'`);
+    }
+}
+function count_lcp_array(lcp_array) {
+    if (!lcp_array) {
+        return 0;
+    }
+    let sum = 0;
+    for(let i = 0; i < lcp_array.length; i++){
+        sum += lcp_array[i];
+    }
+    return sum;
+}
+export function test_sum_lcp_array() {
+    assert_eq(count_lcp_array([
+        0,
+        1,
+        3,
+        0,
+        0,
+        2
+    ]), 6, "Sum of LCP array of 'banana'");
+    assert_eq(count_lcp_array([
+        0,
+        1,
+        4,
+        1,
+        1,
+        0,
+        3,
+        0,
+        0,
+        0,
+        2
+    ]), 12, "Sum of LCP array of 'abracadabra'");
+    assert_eq(count_lcp_array([]), 0, "Sum of LCP array of empty string");
+    assert_eq(count_lcp_array([
+        0
+    ]), 0, "Sum of LCP array of 'a'");
+    assert_eq(count_lcp_array([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), 10, "Sum of LCP array of 'aaaaa'");
+    assert_eq(count_lcp_array([
+        0,
+        0,
+        0,
+        0,
+        0
+    ]), 0, "Sum of LCP array of 'abcde'");
+}
+function construct_plcp_array(inverse_suffix_array, lcp_array) {
+    if (!inverse_suffix_array || !lcp_array) {
+        return new Int32Array(0);
+    }
+    if (inverse_suffix_array.length !== lcp_array.length) {
+        throw new AlgorithmError("Inverse suffix array and LCP array must have the same length.", "PLCP", {
+            inverse_suffix_array,
+            lcp_array
+        });
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = lcp_array[inverse_suffix_array[i]];
+    }
+    return result;
+}
+export function test_plcp_array() {
+    function test_helper(text) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        const lcp_array = construct_lcp_array(text, suffix_array, inverse_suffix_array);
+        return construct_plcp_array(inverse_suffix_array, lcp_array);
+    }
+    assert_eq(test_helper("banana"), [
+        0,
+        3,
+        2,
+        1,
+        0,
+        0
+    ], "PLCP array of 'banana'");
+    assert_eq(test_helper("abracadabra"), [
+        4,
+        3,
+        2,
+        1,
+        0,
+        1,
+        0,
+        1,
+        0,
+        0,
+        0
+    ], "PLCP array of 'abracadabra'");
+    assert_eq(test_helper(""), [], "PLCP array of empty string");
+    assert_eq(test_helper("a"), [
+        0
+    ], "PLCP array of 'a'");
+    assert_eq(test_helper("aaaaa"), [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "PLCP array of 'aaaaa'");
+    assert_eq(test_helper("abcde"), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "PLCP array of 'abcde'");
+}
+function construct_psi_array(suffix_array, inverse_suffix_array) {
+    if (!suffix_array || !inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = suffix_array[i] + 1 < n ? inverse_suffix_array[suffix_array[i] + 1] : n;
+    }
+    return result;
+}
+export function test_psi_array() {
+    function test_helper(text) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        return construct_psi_array(suffix_array, inverse_suffix_array);
+    }
+    assert_eq(test_helper("banana"), [
+        6,
+        4,
+        5,
+        2,
+        0,
+        1
+    ], "Psi array of 'banana'");
+    assert_eq(test_helper("abracadabra"), [
+        11,
+        5,
+        6,
+        7,
+        8,
+        9,
+        10,
+        4,
+        1,
+        0,
+        3
+    ], "Psi array of 'abracadabra'");
+    assert_eq(test_helper(""), [], "Psi array of empty string");
+    assert_eq(test_helper("a"), [
+        1
+    ], "Psi array of 'a'");
+    assert_eq(test_helper("aaaaa"), [
+        5,
+        0,
+        1,
+        2,
+        3
+    ], "Psi array of 'aaaaa'");
+    assert_eq(test_helper("abcde"), [
+        1,
+        2,
+        3,
+        4,
+        5
+    ], "Psi array of 'abcde'");
+    assert_eq(test_helper("edcba"), [
+        5,
+        0,
+        1,
+        2,
+        3
+    ], "Psi array of 'edcba'");
+}
+function construct_lyndon_factorization(text, inverse_suffix_array) {
+    if (!text || !inverse_suffix_array) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    if (n === 0) {
+        return new Uint8Array(0);
+    }
+    const result = new Uint8Array(n);
+    if (inverse_suffix_array.length < n) {
+        throw new AlgorithmError(`Inverse suffix array (inverse_suffix_array) must have a length of at least text.length (${n}), but got ${inverse_suffix_array.length}.`, "LynF", {
+            text,
+            inverse_suffix_array
+        });
+    }
+    let inverse_suffix_arrayval = inverse_suffix_array[0];
+    for(let i = 0; i + 1 < n; ++i){
+        if (inverse_suffix_arrayval > inverse_suffix_array[i + 1]) {
+            result[i] = 1;
+            inverse_suffix_arrayval = inverse_suffix_array[i + 1];
+        }
+    }
+    result[n - 1] = 1;
+    return result;
+}
+export function test_lyndon_factorization() {
+    function test_helper(text) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        return construct_lyndon_factorization(text, inverse_suffix_array);
+    }
+    assert_eq(test_helper("banana"), [
+        true,
+        false,
+        true,
+        false,
+        true,
+        true
+    ], "Lyndon factorization of 'banana'");
+    assert_eq(test_helper("abracadabra"), [
+        false,
+        false,
+        false,
+        false,
+        false,
+        false,
+        true,
+        false,
+        false,
+        true,
+        true
+    ], "Lyndon factorization of 'abracadabra'");
+    assert_eq(test_helper("aaaaa"), [
+        true,
+        true,
+        true,
+        true,
+        true
+    ], "Lyndon factorization of 'aaaaa'");
+    assert_eq(test_helper("abcde"), [
+        false,
+        false,
+        false,
+        false,
+        true
+    ], "Lyndon factorization of 'abcde'");
+}
+function delta(substring_complexity) {
+    if (substring_complexity.length === 0) {
+        throw new AlgorithmError("Input array 'substring_complexity' cannot be empty.", "delta", {
+            substring_complexity
+        });
+    }
+    let bestlength = 1;
+    let bestval = substring_complexity[0];
+    for(let i = 1; i < substring_complexity.length; ++i){
+        const currentRatio = substring_complexity[i] / (i + 1);
+        if (currentRatio > bestval) {
+            bestlength = i + 1;
+            bestval = currentRatio;
+        }
+    }
+    return [
+        bestlength,
+        bestval
+    ];
+}
+function count_delta(substring_complexity) {
+    if (!substring_complexity) {
+        return 0;
+    }
+    return delta(substring_complexity)[1];
+}
+export function test_delta() {
+    assert_eq(count_delta([
+        3,
+        3,
+        3,
+        3,
+        2,
+        1
+    ]), 3, "Delta of substring complexity [3, 3, 3, 3, 2, 1]");
+    assert_eq(count_delta([
+        5,
+        8,
+        9,
+        10,
+        12
+    ]), 5, "Delta of substring complexity [5, 8, 9, 10, 12]");
+    assert_eq(count_delta([
+        1,
+        1,
+        1,
+        1
+    ]), 1, "Delta of substring complexity [1, 1, 1, 1]");
+    assert_eq(count_delta([
+        2,
+        4,
+        6,
+        8
+    ]), 2, "Delta of substring complexity [2, 4, 6, 8]");
+    assert_eq(count_delta([
+        1
+    ]), 1, "Delta of substring complexity [1]");
+}
+function count_delta_argmax(substring_complexity) {
+    if (!substring_complexity) {
+        return 0;
+    }
+    return delta(substring_complexity)[0];
+}
+export function test_delta_argmax() {
+    assert_eq(count_delta_argmax([
+        3,
+        3,
+        3,
+        3,
+        2,
+        1
+    ]), 1, "Delta argmax of substring complexity [3, 3, 3, 3, 2, 1]");
+    assert_eq(count_delta_argmax([
+        1,
+        1,
+        1,
+        1
+    ]), 1, "Delta argmax of substring complexity [1, 1, 1, 1]");
+    assert_eq(count_delta_argmax([
+        2,
+        10,
+        6,
+        8
+    ]), 2, "Delta argmax of substring complexity [2, 10, 6, 8]");
+    assert_eq(count_delta_argmax([
+        2,
+        3,
+        20,
+        8
+    ]), 3, "Delta argmax of substring complexity [2, 3, 20, 8]");
+    assert_eq(count_delta_argmax([
+        1
+    ]), 1, "Delta argmax of substring complexity [1]");
+}
+function construct_substring_complexity(lcp_array) {
+    if (!lcp_array) {
+        return new Int32Array(0);
+    }
+    const n = lcp_array.length;
+    const ret = new Int32Array(n);
+    const c = new Map();
+    for(let i = 0; i < n; i++){
+        c.set(lcp_array[i], (c.get(lcp_array[i]) || 0) + 1);
+    }
+    let count = 0;
+    for(let i = n; i >= 1; --i){
+        count += 1;
+        if (c.has(i)) {
+            count -= c.get(i);
+        }
+        ret[i - 1] = count;
+    }
+    return ret;
+}
+export function test_substring_complexity() {
+    function test_helper(text) {
+        const suffix_array = construct_rotation_array(text);
+        const lcp_array = construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array));
+        const substring_complexity = construct_substring_complexity(lcp_array);
+        return substring_complexity;
+    }
+    assert_eq(test_helper("banana"), [
+        3,
+        3,
+        3,
+        3,
+        2,
+        1
+    ], "Substring complexity of 'banana'");
+}
+function conjugate_string(text, shift) {
+    if (!text) {
+        return "";
+    }
+    if (shift < 0 || shift > text.length) {
+        throw new AlgorithmError("Shift value must be between 0 and the length of the string.", "conjugate_string", {
+            text,
+            shift
+        });
+    }
+    if (text.length === 0 || shift === 0) {
+        return text;
+    }
+    return text.substring(shift) + text.substring(0, shift);
+}
+export function test_conjugate_string() {
+    assert_eq(conjugate_string("abcde", 2), "cdeab", "Conjugate 'abcde' by 2");
+    assert_eq(conjugate_string("hello", 0), "hello", "Conjugate 'hello' by 0");
+    assert_eq(conjugate_string("rotation", 3), "ationrot", "Conjugate 'rotation' by 3");
+    assert_eq(conjugate_string("a", 1), "a", "Conjugate 'a' by 1");
+    assert_eq(conjugate_string("", 0), "", "Conjugate empty string by 0");
+}
+function select_query(text, pattern, nth) {
+    if (!text) {
+        return -1;
+    }
+    if (nth <= 0) {
+        throw new AlgorithmError("The 'nth' parameter must be a positive integer for 1-based indexing.", "select_query", {
+            text,
+            pattern,
+            nth
+        });
+    }
+    let pos = -1;
+    for(let k = 0; k < nth; ++k){
+        if (typeof text === 'string') {
+            pos = text.indexOf(pattern, pos + 1);
+        } else {
+            pos = text.indexOf(pattern, pos + 1);
+        }
+        if (pos === -1) {
+            return -1;
+        }
+    }
+    return pos;
+}
+export function test_select_query() {
+    assert_eq(select_query("", "a", 1), -1, "1st occurrence of 'a' in empty string (not found)");
+    assert_eq(select_query("banana", "a", 1), 1, "1st occurrence of 'a' in 'banana'");
+    assert_eq(select_query("banana", "a", 2), 3, "2nd occurrence of 'a' in 'banana'");
+    assert_eq(select_query("banana", "a", 3), 5, "3rd occurrence of 'a' in 'banana'");
+    assert_eq(select_query("banana", "a", 4), -1, "4th occurrence of 'a' in 'banana' (not found)");
+    assert_eq(select_query("abracadabra", "abra", 1), 0, "1st occurrence of 'abra' in 'abracadabra'");
+    assert_eq(select_query("abracadabra", "abra", 2), 7, "2nd occurrence of 'abra' in 'abracadabra'");
+    assert_eq(select_query("abracadabra", "xyz", 1), -1, "1st occurrence of 'xyz' in 'abracadabra' (not found)");
+    assert_eq(select_query("aaaaa", "aa", 2), 1, "2nd occurrence of 'aa' in 'aaaaa'");
+    assert_eq(select_query("aaaaa", "aa", 3), 2, "3rd occurrence of 'aa' in 'aaaaa'");
+    assert_eq(select_query("aaaaa", "aa", 4), 3, "4th occurrence of 'aa' in 'aaaaa'");
+    assert_eq(select_query("aaaaa", "aa", 5), -1, "5th occurrence of 'aa' in 'aaaaa' (not found)");
+}
+function rank_query(text, pattern, index) {
+    if (!text) {
+        return 0;
+    }
+    const prefix = text.slice(0, index);
+    return [
+        ...prefix
+    ].filter((c)=>c === pattern).length;
+}
+export function test_rank_query() {
+    assert_eq(rank_query("banana", "a", 6), 3, "Count of 'a' in 'banana'");
+    assert_eq(rank_query("banana", "a", 3), 1, "Count of 'a' in 'ban'");
+    assert_eq(rank_query("100101", "1", 6), 3, "Count of '1' in '100101'");
+    assert_eq(rank_query("100101", "0", 4), 2, "Count of '0' in '1001'");
+    assert_eq(rank_query("aaaaa", "a", 5), 5, "Count of 'a' in 'aaaaa'");
+    assert_eq(rank_query("aaaaa", "a", 3), 3, "Count of 'a' in 'aaa'");
+    assert_eq(rank_query("aaaaa", "a", 0), 0, "Count of 'a' in ''");
+    assert_eq(rank_query("", "a", 0), 0, "Count of 'a' in empty string");
+    assert_eq(rank_query("hello", "z", 5), 0, "Count of 'z' in 'hello'");
+}
+function popcount32(x) {
+    x = x - (x >>> 1 & 0x55555555);
+    x = (x & 0x33333333) + (x >>> 2 & 0x33333333);
+    x = x + (x >>> 4) & 0x0f0f0f0f;
+    return Math.imul(x, 0x01010101) >>> 24;
+}
+function build_bit_rank_select(bits) {
+    const n = bits.length;
+    const words = new Uint32Array(n + 31 >>> 5);
+    for(let i = 0; i < n; ++i){
+        if (bits[i]) {
+            words[i >>> 5] |= 1 << (i & 31);
+        }
+    }
+    const word_ranks = new Int32Array(words.length + 1);
+    for(let w = 0; w < words.length; ++w){
+        word_ranks[w + 1] = word_ranks[w] + popcount32(words[w]);
+    }
+    return {
+        words,
+        word_ranks
+    };
+}
+function bit_rank(rs, index) {
+    if (index <= 0) {
+        return 0;
+    }
+    const word = index >>> 5;
+    if (word >= rs.words.length) {
+        return rs.word_ranks[rs.words.length];
+    }
+    const offset = index & 31;
+    return rs.word_ranks[word] + (offset === 0 ? 0 : popcount32(rs.words[word] & 0xffffffff >>> 32 - offset));
+}
+function bit_select(rs, nth) {
+    const words = rs.words.length;
+    if (nth <= 0 || nth > rs.word_ranks[words]) {
+        return -1;
+    }
+    let low = 0;
+    let high = words - 1;
+    while(low < high){
+        const mid = low + high + 1 >>> 1;
+        if (rs.word_ranks[mid] < nth) {
+            low = mid;
+        } else {
+            high = mid - 1;
+        }
+    }
+    let word = rs.words[low];
+    for(let k = nth - rs.word_ranks[low]; k > 1; --k){
+        word &= word - 1;
+    }
+    return (low << 5) + 31 - Math.clz32(word & -word);
+}
+function build_char_rank_select(text) {
+    const n = text.length;
+    const occurrences = new Map();
+    const local_ranks = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let positions = occurrences.get(text[i]);
+        if (positions === undefined) {
+            positions = [];
+            occurrences.set(text[i], positions);
+        }
+        local_ranks[i] = positions.length;
+        positions.push(i);
+    }
+    return {
+        occurrences,
+        local_ranks
+    };
+}
+function char_rank(rs, c, index) {
+    const positions = rs.occurrences.get(c);
+    if (positions === undefined) {
+        return 0;
+    }
+    let low = 0;
+    let high = positions.length;
+    while(low < high){
+        const mid = low + high >>> 1;
+        if (positions[mid] < index) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+function char_select(rs, c, nth) {
+    const positions = rs.occurrences.get(c);
+    if (positions === undefined || nth <= 0 || nth > positions.length) {
+        return -1;
+    }
+    return positions[nth - 1];
+}
+export function test_rank_select_support() {
+    function test_bits(bits) {
+        const rs = build_bit_rank_select(bits);
+        for(let i = 0; i <= bits.length + 1; ++i){
+            assert_eq(bit_rank(rs, i), rank_query(bits, true, i), `Bit rank ${i} of [${bits}]`);
+        }
+        for(let k = 1; k <= bits.length + 1; ++k){
+            assert_eq(bit_select(rs, k), select_query(bits, true, k), `Bit select ${k} of [${bits}]`);
+        }
+    }
+    function test_chars(text) {
+        const rs = build_char_rank_select(text);
+        for (const c of [
+            "a",
+            "b",
+            "c",
+            "z"
+        ]){
+            for(let i = 0; i <= text.length; ++i){
+                assert_eq(char_rank(rs, c, i), rank_query(text, c, i), `Rank of '${c}' up to ${i} in '${text}'`);
+            }
+            for(let k = 1; k <= text.length + 1; ++k){
+                assert_eq(char_select(rs, c, k), select_query(text, c, k), `Select ${k} of '${c}' in '${text}'`);
+            }
+        }
+        for(let i = 0; i < text.length; ++i){
+            assert_eq(rs.local_ranks[i], rank_query(text, text[i], i), `Local rank ${i} in '${text}'`);
+        }
+    }
+    test_bits([]);
+    test_bits([
+        false,
+        false,
+        false
+    ]);
+    test_bits([
+        true,
+        false,
+        true,
+        true,
+        false
+    ]);
+    for(let k = 0; k < 10; ++k){
+        test_bits([
+            ...random_ternary_string(1 + k * 13)
+        ].map((c)=>c === 'a'));
+        test_chars(random_ternary_string(k * 7));
+    }
+    assert_eq(popcount32(0xffffffff), 32, "Population count of a full word");
+}
+function construct_lf_array(first_array, bw_transform) {
+    if (!first_array || !bw_transform) {
+        return new Int32Array(0);
+    }
+    if (first_array.length !== bw_transform.length) {
+        throw new AlgorithmError("First array and BWT must have the same length.", "LF", {
+            first_array,
+            bw_transform
+        });
+    }
+    const n = first_array.length;
+    const result = new Int32Array(n);
+    const bwt_rs = build_char_rank_select(bw_transform);
+    const first_rs = build_char_rank_select(first_array);
+    for(let i = 0; i < n; ++i){
+        const c = bw_transform[i];
+        const crank = bwt_rs.local_ranks[i] + 1;
+        result[i] = char_select(first_rs, c, crank);
+    }
+    return result;
+}
+export function test_lf_array() {
+    function test_helper(text) {
+        const rotation_array = construct_rotation_array(text);
+        const bw_transform = construct_bw_transform(text, rotation_array);
+        const first_array = construct_first_array(bw_transform);
+        return construct_lf_array(first_array, bw_transform);
+    }
+    assert_eq(test_helper("banana"), [
+        4,
+        5,
+        3,
+        0,
+        1,
+        2
+    ], "LF array of 'banana'");
+    assert_eq(test_helper("abracadabra"), [
+        9,
+        8,
+        0,
+        10,
+        7,
+        1,
+        2,
+        3,
+        4,
+        5,
+        6
+    ], "LF array of 'abracadabra'");
+    assert_eq(test_helper("a"), [
+        0
+    ], "LF array of 'a'");
+    assert_eq(test_helper("aaaaa"), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "LF array of 'aaaaa'");
+    assert_eq(test_helper("abcde"), [
+        4,
+        0,
+        1,
+        2,
+        3
+    ], "LF array of 'abcde'");
+    assert_eq(test_helper("edcba"), [
+        1,
+        2,
+        3,
+        4,
+        0
+    ], "LF array of 'edcba'");
+    assert_eq(test_helper(""), [], "LF array of empty string");
+}
+function construct_sl_string(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const result = new Array(n);
+    let type = 'S';
+    result[n - 1] = type;
+    for(let i = n - 2; i >= 0; --i){
+        if (text[i + 1] > text[i]) {
+            type = 'S';
+        } else if (text[i + 1] < text[i]) {
+            type = 'L';
+            if (result[i + 1] == 'S') {
+                result[i + 1] = 'S*';
+            }
+        }
+        result[i] = type;
+    }
+    if (result[0] == 'S') {
+        result[0] = 'S*';
+    }
+    return result;
+}
+export function test_sl_string() {
+    assert_eq(construct_sl_string("banana"), [
+        'L',
+        'S*',
+        'L',
+        'S*',
+        'L',
+        'S*'
+    ], "SL string of 'banana'");
+    assert_eq(construct_sl_string("abracadabra"), [
+        'S*',
+        'S',
+        'L',
+        'S*',
+        'L',
+        'S*',
+        'L',
+        'S*',
+        'S',
+        'L',
+        'S*'
+    ], "SL string of 'abracadabra'");
+    assert_eq(construct_sl_string("aaaaa"), [
+        'S*',
+        'S',
+        'S',
+        'S',
+        'S'
+    ], "SL string of 'aaaaa'");
+    assert_eq(construct_sl_string("abcde"), [
+        'S*',
+        'S',
+        'S',
+        'S',
+        'S'
+    ], "SL string of 'abcde'");
+    assert_eq(construct_sl_string("edcba"), [
+        'L',
+        'L',
+        'L',
+        'L',
+        'S*'
+    ], "SL string of 'edcba'");
+    assert_eq(construct_sl_string("a"), [
+        'S*'
+    ], "SL string of 'a'");
+    assert_eq(construct_sl_string(""), [], "SL string of empty string");
+}
+function construct_lpf_array(suffix_array, lcp_array) {
+    if (!suffix_array || !lcp_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const stack = new Int32Array(n);
+    const stack_lcp = new Int32Array(n);
+    const previous_lcp = new Int32Array(n);
+    let top = 0;
+    for(let r = 0; r < n; r++){
+        let lcp = r > 0 ? lcp_array[r] : 0;
+        while(top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]){
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        previous_lcp[r] = top > 0 ? lcp : 0;
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+    const result = new Int32Array(n);
+    top = 0;
+    for(let r = n - 1; r >= 0; r--){
+        let lcp = r + 1 < n ? lcp_array[r + 1] : 0;
+        while(top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]){
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        result[suffix_array[r]] = Math.max(previous_lcp[r], top > 0 ? lcp : 0);
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+    return result;
+}
+function lpf_array_of(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const suffix_array = construct_suffix_array(text);
+    return construct_lpf_array(suffix_array, construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array)));
+}
+export function test_lpf_array() {
+    assert_eq(lpf_array_of("banana"), [
+        0,
+        0,
+        0,
+        3,
+        2,
+        1
+    ], "LPF array of 'banana'");
+    assert_eq(lpf_array_of("abracadabra"), [
+        0,
+        0,
+        0,
+        1,
+        0,
+        1,
+        0,
+        4,
+        3,
+        2,
+        1
+    ], "LPF array of 'abracadabra'");
+    assert_eq(lpf_array_of("aaaaa"), [
+        0,
+        4,
+        3,
+        2,
+        1
+    ], "LPF array of 'aaaaa'");
+    assert_eq(lpf_array_of(""), [], "LPF array of empty string");
+    assert_eq(lpf_array_of("a"), [
+        0
+    ], "LPF array of 'a'");
+    assert_eq(lpf_array_of("abcde"), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "LPF array of 'abcde'");
+    for(let k = 0; k < 30; k++){
+        const text = random_ternary_string(1 + k * 5);
+        const naive = [
+            ...text
+        ].map((_, i)=>Math.max(0, ...[
+                ...Array(i).keys()
+            ].map((j)=>lcp_query(text, i, j))));
+        assert_eq(lpf_array_of(text), naive, `LPF array of '${text}'`);
+    }
+}
+function construct_lpnf_array(suffix_array, inverse_suffix_array, lcp_array) {
+    if (!suffix_array || !inverse_suffix_array || !lcp_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const lcp_table = build_range_min_table(lcp_array);
+    const sa_table = build_range_min_table(suffix_array);
+    function has_previous_occurrence(i, length) {
+        if (length > i || i + length > n) {
+            return false;
+        }
+        const rank = inverse_suffix_array[i];
+        let low = 0;
+        let high = rank;
+        while(low < high){
+            const mid = low + high >>> 1;
+            if (range_min_query(lcp_table, mid + 1, rank) >= length) {
+                high = mid;
+            } else {
+                low = mid + 1;
+            }
+        }
+        const left = low;
+        low = rank;
+        high = n - 1;
+        while(low < high){
+            const mid = low + high + 1 >>> 1;
+            if (range_min_query(lcp_table, rank + 1, mid) >= length) {
+                low = mid;
+            } else {
+                high = mid - 1;
+            }
+        }
+        return range_min_query(sa_table, left, low) <= i - length;
+    }
+    const result = new Int32Array(n);
+    let length = 0;
+    for(let i = 0; i < n; i++){
+        length = Math.max(length - 1, 0);
+        while(has_previous_occurrence(i, length + 1)){
+            length++;
+        }
+        result[i] = length;
+    }
+    return result;
+}
+function lpnf_array_of(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const suffix_array = construct_suffix_array(text);
+    const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+    return construct_lpnf_array(suffix_array, inverse_suffix_array, construct_lcp_array(text, suffix_array, inverse_suffix_array));
+}
+export function test_lpnf_array() {
+    assert_eq(lpnf_array_of("banana"), [
+        0,
+        0,
+        0,
+        2,
+        2,
+        1
+    ], "LPnF array of 'banana'");
+    assert_eq(lpnf_array_of("abracadabra"), [
+        0,
+        0,
+        0,
+        1,
+        0,
+        1,
+        0,
+        4,
+        3,
+        2,
+        1
+    ], "LPnF array of 'abracadabra'");
+    assert_eq(lpnf_array_of("aaaaa"), [
+        0,
+        1,
+        2,
+        2,
+        1
+    ], "LPnF array of 'aaaaa'");
+    assert_eq(lpnf_array_of(""), [], "LPnF array of empty string");
+    assert_eq(lpnf_array_of("a"), [
+        0
+    ], "LPnF array of 'a'");
+    assert_eq(lpnf_array_of("abcde"), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "LPnF array of 'abcde'");
+    for(let k = 0; k < 30; k++){
+        const text = random_ternary_string(1 + k * 5);
+        const naive = [
+            ...text
+        ].map((_, i)=>Math.max(0, ...[
+                ...Array(i).keys()
+            ].map((j)=>Math.min(i - j, lcp_query(text, i, j)))));
+        assert_eq(lpnf_array_of(text), naive, `LPnF array of '${text}'`);
+    }
+}
+function construct_lnf_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const revtext = text.split('').reverse().join('');
+    const lpfarray = lpf_array_of(revtext);
+    return lpfarray.reverse();
+}
+export function test_lnf_array() {
+    assert_eq(construct_lnf_array("banana"), [
+        0,
+        1,
+        2,
+        3,
+        0,
+        0
+    ], "LNF array of 'banana'");
+    assert_eq(construct_lnf_array("abracadabra"), [
+        1,
+        2,
+        3,
+        4,
+        0,
+        1,
+        0,
+        1,
+        0,
+        0,
+        0
+    ], "LNF array of 'abracadabra'");
+    assert_eq(construct_lnf_array("aaaaa"), [
+        1,
+        2,
+        3,
+        4,
+        0
+    ], "LNF array of 'aaaaa'");
+    assert_eq(construct_lnf_array(""), [], "LNF array of empty string");
+    assert_eq(construct_lnf_array("a"), [
+        0
+    ], "LNF array of 'a'");
+    assert_eq(construct_lnf_array("abcde"), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "LNF array of 'abcde'");
+}
+function greedy_factorize(factor_array) {
+    if (!factor_array) {
+        return new Uint8Array(0);
+    }
+    const n = factor_array.length;
+    if (n === 0) {
+        return new Uint8Array(0);
+    }
+    const result = new Uint8Array(n);
+    for(let i = 0; i < n;){
+        const currentFactor = factor_array[i];
+        let distance = currentFactor === 0 ? 1 : currentFactor;
+        result[i + distance - 1] = 1;
+        i += distance;
+    }
+    return result;
+}
+function construct_lzss_factorization(lpf_array) {
+    return greedy_factorize(lpf_array);
+}
+export function test_lzss_factorization() {
+    function test_helper(text, expected) {
+        const lpf_array = lpf_array_of(text);
+        const lzss_factorization = construct_lzss_factorization(lpf_array);
+        assert_eq(lzss_factorization, expected, `LZSS factorization test for '${text}'`);
+    }
+    test_helper("banana", [
+        true,
+        true,
+        true,
+        false,
+        false,
+        true
+    ]);
+    test_helper("abracadabra", [
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("aaaaa", [
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("abcde", [
+        true,
+        true,
+        true,
+        true,
+        true
+    ]);
+    test_helper("", []);
+    test_helper("a", [
+        true
+    ]);
+}
+function construct_lzssno_factorization(lpnf_array) {
+    return greedy_factorize(lpnf_array);
+}
+export function test_lzssno_factorization() {
+    function test_helper(text, expected) {
+        const lpnf_array = lpnf_array_of(text);
+        const lzssno_factorization = construct_lzssno_factorization(lpnf_array);
+        assert_eq(lzssno_factorization, expected, `LZSSno factorization test for '${text}'`);
+    }
+    test_helper("banana", [
+        true,
+        true,
+        true,
+        false,
+        true,
+        true
+    ]);
+    test_helper("abracadabra", [
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("aaaaa", [
+        true,
+        true,
+        false,
+        true,
+        true
+    ]);
+    test_helper("abcde", [
+        true,
+        true,
+        true,
+        true,
+        true
+    ]);
+    test_helper("", []);
+    test_helper("a", [
+        true
+    ]);
+}
+function greedy_factorize_with_new_letter(factor_array) {
+    if (!factor_array) {
+        return new Uint8Array(0);
+    }
+    const n = factor_array.length;
+    if (n === 0) {
+        return new Uint8Array(0);
+    }
+    const result = new Uint8Array(n);
+    for(let i = 0; i < n;){
+        const currentFactor = factor_array[i];
+        let distance = currentFactor === 0 ? 1 : Math.min(currentFactor + 1, n - i);
+        result[i + distance - 1] = 1;
+        i += distance;
+    }
+    return result;
+}
+function construct_lz77_factorization(lpf_array) {
+    return greedy_factorize_with_new_letter(lpf_array);
+}
+export function test_lz77_factorization() {
+    function test_helper(text, expected) {
+        const lpf_array = lpf_array_of(text);
+        const lz77_factorization = construct_lz77_factorization(lpf_array);
+        assert_eq(lz77_factorization, expected, `LZ77 factorization test for '${text}'`);
+    }
+    test_helper("banana", [
+        true,
+        true,
+        true,
+        false,
+        false,
+        true
+    ]);
+    test_helper("abracadabra", [
+        true,
+        true,
+        true,
+        false,
+        true,
+        false,
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("aaaaa", [
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("abcde", [
+        true,
+        true,
+        true,
+        true,
+        true
+    ]);
+    test_helper("", []);
+    test_helper("a", [
+        true
+    ]);
+}
+function construct_reverse_lzss_factorization(lnf_array) {
+    if (!lnf_array) {
+        return new Uint8Array(0);
+    }
+    const copied_lnf_array = Int32Array.from(lnf_array).reverse();
+    return greedy_factorize(copied_lnf_array);
+}
+export function test_reverse_lzss_factorization() {
+    function test_helper(text, expected) {
+        const lpf_array = construct_lnf_array(text);
+        const lzss_factorization = construct_reverse_lzss_factorization(lpf_array);
+        assert_eq(lzss_factorization, expected, `LZSS factorization test for '${text}'`);
+    }
+    test_helper("ananab", [
+        true,
+        true,
+        true,
+        false,
+        false,
+        true
+    ]);
+    test_helper("arbadacarba", [
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("aaaaa", [
+        true,
+        false,
+        false,
+        false,
+        true
+    ]);
+    test_helper("abcde", [
+        true,
+        true,
+        true,
+        true,
+        true
+    ]);
+    test_helper("", []);
+    test_helper("a", [
+        true
+    ]);
+}
+function construct_lexparse_factorization(plcp_array) {
+    return greedy_factorize(plcp_array);
+}
+export function test_lexparse_factorization() {
+    function test_helper(text, expected) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        const lcp_array = construct_lcp_array(text, suffix_array, inverse_suffix_array);
+        const plcp_array = construct_plcp_array(inverse_suffix_array, lcp_array);
+        const lexparse_factorization = construct_lexparse_factorization(plcp_array);
+        assert_eq(lexparse_factorization, expected, `LexParse factorization test for '${text}'`);
+    }
+    test_helper("banana", [
+        true,
+        false,
+        false,
+        true,
+        true,
+        true
+    ]);
+    test_helper("abracadabra", [
+        false,
+        false,
+        false,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true
+    ]);
+    test_helper("aaaaa", [
+        false,
+        false,
+        false,
+        true,
+        true
+    ]);
+    test_helper("abcde", [
+        true,
+        true,
+        true,
+        true,
+        true
+    ]);
+    test_helper("", []);
+    test_helper("a", [
+        true
+    ]);
+}
+function construct_nss_array(inverse_suffix_array) {
+    if (!inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let nss = i + 1;
+        while(nss < n && inverse_suffix_array[nss] > inverse_suffix_array[i]){
+            ++nss;
+        }
+        result[i] = nss >= n ? n : nss;
+    }
+    return result;
+}
+export function test_nss_array() {
+    assert_eq(construct_nss_array([
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]), [
+        1,
+        2,
+        3,
+        6,
+        5,
+        6
+    ], "NSS array of inverse suffix array [5, 3, 1, 0, 4, 2]");
+    assert_eq(construct_nss_array([
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ]), [
+        1,
+        2,
+        11,
+        6,
+        6,
+        6,
+        11,
+        10,
+        10,
+        10,
+        11
+    ], "NSS array of inverse suffix array [10, 7, 0, 3, 5, 8, 1, 4, 6, 9, 2]");
+    assert_eq(construct_nss_array([]), [], "NSS array of empty inverse suffix array");
+    assert_eq(construct_nss_array([
+        0
+    ]), [
+        1
+    ], "NSS array of inverse suffix array [0]");
+    assert_eq(construct_nss_array([
+        1,
+        0
+    ]), [
+        1,
+        2
+    ], "NSS array of inverse suffix array [1, 0]");
+    assert_eq(construct_nss_array([
+        0,
+        1
+    ]), [
+        2,
+        2
+    ], "NSS array of inverse suffix array [0, 1]");
+    assert_eq(construct_nss_array([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), [
+        5,
+        5,
+        5,
+        5,
+        5
+    ], "NSS array of inverse suffix array [0, 1, 2, 3, 4]");
+    assert_eq(construct_nss_array([
+        4,
+        3,
+        2,
+        1,
+        0
+    ]), [
+        1,
+        2,
+        3,
+        4,
+        5
+    ], "NSS array of inverse suffix array [4, 3, 2, 1, 0]");
+}
+function construct_pss_array(inverse_suffix_array) {
+    if (!inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let pss = i - 1;
+        while(pss >= 0 && inverse_suffix_array[pss] > inverse_suffix_array[i]){
+            --pss;
+        }
+        result[i] = pss < 0 ? n : pss;
+    }
+    return result;
+}
+export function test_pss_array() {
+    assert_eq(construct_pss_array([
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]), [
+        6,
+        6,
+        6,
+        6,
+        3,
+        3
+    ], "PSS array of inverse suffix array [5, 3, 1, 0, 4, 2]");
+    assert_eq(construct_pss_array([
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ]), [
+        11,
+        11,
+        11,
+        2,
+        3,
+        4,
+        2,
+        6,
+        7,
+        8,
+        6
+    ], "PSS array of inverse suffix array [10, 7, 0, 3, 5, 8, 1, 4, 6, 9, 2]");
+    assert_eq(construct_pss_array([]), [], "PSS array of empty inverse suffix array");
+    assert_eq(construct_pss_array([
+        0
+    ]), [
+        1
+    ], "PSS array of inverse suffix array [0]");
+    assert_eq(construct_pss_array([
+        1,
+        0
+    ]), [
+        2,
+        2
+    ], "PSS array of inverse suffix array [1, 0]");
+    assert_eq(construct_pss_array([
+        0,
+        1
+    ]), [
+        2,
+        0
+    ], "PSS array of inverse suffix array [0, 1]");
+    assert_eq(construct_pss_array([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), [
+        5,
+        0,
+        1,
+        2,
+        3
+    ], "PSS array of inverse suffix array [0, 1, 2, 3, 4]");
+    assert_eq(construct_pss_array([
+        4,
+        3,
+        2,
+        1,
+        0
+    ]), [
+        5,
+        5,
+        5,
+        5,
+        5
+    ], "PSS array of inverse suffix array [4, 3, 2, 1, 0]");
+}
+function construct_lyndon_array(nss_array) {
+    if (!nss_array) {
+        return new Int32Array(0);
+    }
+    const n = nss_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        result[i] = nss_array[i] === n ? n - i : nss_array[i] - i;
+    }
+    return result;
+}
+export function test_lyndon_array() {
+    assert_eq(construct_lyndon_array([
+        1,
+        2,
+        3,
+        6,
+        5,
+        6
+    ]), [
+        1,
+        1,
+        1,
+        3,
+        1,
+        1
+    ], "Lyndon array from NSS [1,2,3,6,5,6]");
+    assert_eq(construct_lyndon_array([
+        1,
+        2,
+        11,
+        6,
+        6,
+        6,
+        11,
+        10,
+        10,
+        10,
+        11
+    ]), [
+        1,
+        1,
+        9,
+        3,
+        2,
+        1,
+        5,
+        3,
+        2,
+        1,
+        1
+    ], "Lyndon array from NSS [1,2,11,6,6,6,11,10,10,10,11]");
+    assert_eq(construct_lyndon_array([]), [], "Lyndon array from empty NSS");
+    assert_eq(construct_lyndon_array([
+        1
+    ]), [
+        1
+    ], "Lyndon array from NSS [1]");
+    assert_eq(construct_lyndon_array([
+        1,
+        2
+    ]), [
+        1,
+        1
+    ], "Lyndon array from NSS [1,2]");
+    assert_eq(construct_lyndon_array([
+        2,
+        2
+    ]), [
+        2,
+        1
+    ], "Lyndon array from NSS [2,2]");
+    assert_eq(construct_lyndon_array([
+        5,
+        5,
+        5,
+        5,
+        5
+    ]), [
+        5,
+        4,
+        3,
+        2,
+        1
+    ], "Lyndon array from NSS [5,5,5,5,5]");
+    assert_eq(construct_lyndon_array([
+        1,
+        2,
+        3,
+        4,
+        5
+    ]), [
+        1,
+        1,
+        1,
+        1,
+        1
+    ], "Lyndon array from NSS [1,2,3,4,5]");
+}
+function least_rotation(text) {
+    const n = text.length;
+    let i = 0;
+    let j = 1;
+    let k = 0;
+    while(i < n && j < n && k < n){
+        const a = text.charCodeAt((i + k) % n);
+        const b = text.charCodeAt((j + k) % n);
+        if (a === b) {
+            ++k;
+            continue;
+        }
+        if (a > b) {
+            i += k + 1;
+        } else {
+            j += k + 1;
+        }
+        if (i === j) {
+            ++j;
+        }
+        k = 0;
+    }
+    return Math.min(i, j);
+}
+export function test_least_rotation() {
+    assert_eq(least_rotation(""), 0, "Least rotation of empty string");
+    assert_eq(least_rotation("a"), 0, "Least rotation of 'a'");
+    assert_eq(least_rotation("banana"), 5, "Least rotation of 'banana'");
+    assert_eq(least_rotation("baba"), 1, "Least rotation of 'baba'");
+    assert_eq(least_rotation("a".repeat(1000)), 0, "Least rotation of a unary string");
+    for (const text of [
+        "abracadabra",
+        "mississippi",
+        "cabcab",
+        "bbbab",
+        "zyxzyxa"
+    ]){
+        assert_eq(least_rotation(text), construct_rotation_array(text)[0], `Least rotation of '${text}'`);
+    }
+}
+function construct_necklace_conjugate_transform(text) {
+    if (!text) {
+        return "";
+    }
+    return conjugate_string(text, least_rotation(text));
+}
+export function test_necklace_conjugate_transform() {
+    assert_eq(construct_necklace_conjugate_transform("bca"), "abc", "Necklace conjugate of 'bca'");
+    assert_eq(construct_necklace_conjugate_transform("cab"), "abc", "Necklace conjugate of 'cab'");
+    assert_eq(construct_necklace_conjugate_transform("abc"), "abc", "Necklace conjugate of 'abc'");
+    assert_eq(construct_necklace_conjugate_transform("aaaa"), "aaaa", "Necklace conjugate of 'aaaa'");
+    assert_eq(construct_necklace_conjugate_transform("abab"), "abab", "Necklace conjugate of 'abab'");
+    assert_eq(construct_necklace_conjugate_transform("baba"), "abab", "Necklace conjugate of 'baba'");
+    assert_eq(construct_necklace_conjugate_transform(""), "", "Necklace conjugate of empty string");
+    assert_eq(construct_necklace_conjugate_transform("a"), "a", "Necklace conjugate of 'a'");
+}
+function construct_invert_transform(text) {
+    if (!text) return "";
+    const alphabet = Array.from(new Set([
+        ...text
+    ])).sort();
+    const sigma = alphabet.length;
+    const map = new Map();
+    for(let r = 0; r < sigma; r++){
+        map.set(alphabet[r], alphabet[sigma - 1 - r]);
+    }
+    return [
+        ...text
+    ].map((c)=>map.get(c) ?? c).join("");
+}
+export function test_invert_transform() {
+    assert_eq(construct_invert_transform("abc"), "cba", "Invert transform of 'abc'");
+    assert_eq(construct_invert_transform("hello"), "lohhe", "Invert transform of 'hello'");
+    assert_eq(construct_invert_transform("abcdxyz"), "zyxdcba", "Invert transform of 'abcdxyz'");
+    assert_eq(construct_invert_transform("aaaa"), "aaaa", "Invert transform of 'aaaa'");
+    assert_eq(construct_invert_transform(""), "", "Invert transform of empty string");
+    assert_eq(construct_invert_transform("a"), "a", "Invert transform of 'a'");
+}
+function construct_revert_transform(text) {
+    if (!text) {
+        return "";
+    }
+    return text.split('').reverse().join('');
+}
+export function test_revert_transform() {
+    assert_eq(construct_revert_transform("abc"), "cba", "Revert transform of 'abc'");
+    assert_eq(construct_revert_transform("hello"), "olleh", "Revert transform of 'hello'");
+    assert_eq(construct_revert_transform("abcdxyz"), "zyxdcba", "Revert transform of 'abcdxyz'");
+    assert_eq(construct_revert_transform("aaaa"), "aaaa", "Revert transform of 'aaaa'");
+    assert_eq(construct_revert_transform(""), "", "Revert transform of empty string");
+    assert_eq(construct_revert_transform("a"), "a", "Revert transform of 'a'");
+}
+function phrases_from_factorizations(text, factorization) {
+    if (!text || !factorization) {
+        return [];
+    }
+    const n = text.length;
+    const phrases = [];
+    let old_pos = 0;
+    for(let i = 0; i < n; ++i){
+        if (factorization[i]) {
+            let factor = text.slice(old_pos, i + 1);
+            old_pos = i + 1;
+            phrases.push(factor);
+        }
+    }
+    return phrases;
+}
+function omega_order(strA, strB) {
+    if (strA === undefined || strB === undefined) {
+        throw new AlgorithmError("Undefined string input(s) for omega order comparison.", "OmegaOrder", {
+            strA,
+            strB
+        });
+    }
+    if (strA === strB) {
+        return 0;
+    }
+    const maxLength = Math.max(strA.length, strB.length) * 3;
+    for(let i = 0; i < maxLength; ++i){
+        if (strA[i % strA.length] < strB[i % strB.length]) {
+            return -1;
+        }
+        if (strA[i % strA.length] > strB[i % strB.length]) {
+            return +1;
+        }
+    }
+    return strA.length < strB.length ? -1 : +1;
+}
+export function test_omega_order() {
+    assert_eq(omega_order("abc", "bca"), -1, "'abc' < 'bca'");
+    assert_eq(omega_order("bca", "abc"), 1, "'bca' > 'abc'");
+    assert_eq(omega_order("abab", "abab"), 0, "'abab' == 'abab'");
+    assert_eq(omega_order("a", "aa"), -1, "'a' < 'aa'");
+    assert_eq(omega_order("", "a"), -1, "'' < 'a'");
+    assert_eq(omega_order("a", ""), 1, "'a' > ''");
+    assert_eq(omega_order("aa", "a"), 1, "'aa' > 'a'");
+    assert_eq(omega_order("abcd", "abce"), -1, "'abcd' < 'abce'");
+    assert_eq(omega_order("abce", "abcd"), 1, "'abce' > 'abcd'");
+}
+function construct_circular_suffix_array(text, lyndon_factorization) {
+    if (!text || !lyndon_factorization) {
+        return new Int32Array(0);
+    }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return cyclic_sort(ranks, sigma, factor_successors(lyndon_factorization, text.length));
+}
+export function test_circular_suffix_array() {
+    function test_helper(input, expected, description) {
+        const isa = construct_inverse_suffix_array(construct_suffix_array(input));
+        const lyndonFactorization = construct_lyndon_factorization(input, isa);
+        const csa = construct_circular_suffix_array(input, lyndonFactorization);
+        assert_eq(csa, expected, description);
+    }
+    test_helper("banana", [
+        5,
+        1,
+        3,
+        0,
+        2,
+        4
+    ], "Circular suffix array of 'banana'");
+    test_helper("abracadabra", [
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ], "Circular suffix array of 'abracadabra'");
+    test_helper("", [], "Circular suffix array of empty string");
+    test_helper("a", [
+        0
+    ], "Circular suffix array of 'a'");
+    test_helper("aaaaa", [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Circular suffix array of 'aaaaa'");
+    test_helper("edcba", [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "Circular suffix array of 'edcba'");
+    test_helper("abcde", [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Circular suffix array of 'abcde'");
+}
+function construct_inverse_circular_suffix_array(circular_suffix_array) {
+    if (!circular_suffix_array) {
+        return new Int32Array(0);
+    }
+    return construct_inverse_suffix_array(circular_suffix_array);
+}
+export function test_inverse_circular_suffix_array() {
+    assert_eq(construct_inverse_circular_suffix_array([
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]), [
+        3,
+        2,
+        5,
+        1,
+        4,
+        0
+    ], "Inverse circular suffix array of 'banana'");
+    assert_eq(construct_inverse_circular_suffix_array([
+        10,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1,
+        4,
+        6,
+        9,
+        2
+    ]), [
+        2,
+        6,
+        10,
+        3,
+        7,
+        4,
+        8,
+        1,
+        5,
+        9,
+        0
+    ], "Inverse circular suffix array of 'abracadabra'");
+    assert_eq(construct_inverse_circular_suffix_array([]), [], "Inverse circular suffix array of empty array");
+    assert_eq(construct_inverse_circular_suffix_array([
+        0
+    ]), [
+        0
+    ], "Inverse circular suffix array of [0]");
+    assert_eq(construct_inverse_circular_suffix_array([
+        4,
+        3,
+        2,
+        1,
+        0
+    ]), [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "Inverse circular suffix array of [4,3,2,1,0]");
+    assert_eq(construct_inverse_circular_suffix_array([
+        0,
+        1,
+        2,
+        3,
+        4
+    ]), [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "Inverse circular suffix array of [0,1,2,3,4]");
+}
+function construct_bbw_indices(lyndon_factorization, circular_suffix_array) {
+    if (!lyndon_factorization || !circular_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = circular_suffix_array.length;
+    const next = factor_successors(lyndon_factorization, n);
+    const previous = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        previous[next[i]] = i;
+    }
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        result[i] = previous[circular_suffix_array[i]];
+    }
+    return result;
+}
+export function test_bbw_indices() {
+    function test_helper(input, expected, description) {
+        const isa = construct_inverse_suffix_array(construct_suffix_array(input));
+        const lyndonFactorization = construct_lyndon_factorization(input, isa);
+        const csa = construct_circular_suffix_array(input, lyndonFactorization);
+        const bbwt_indices = construct_bbw_indices(lyndonFactorization, csa);
+        assert_eq(bbwt_indices, expected, description);
+    }
+    test_helper("banana", [
+        5,
+        2,
+        4,
+        0,
+        1,
+        3
+    ], "BBWTi of 'banana'");
+    test_helper("abracadabra", [
+        10,
+        9,
+        6,
+        2,
+        4,
+        7,
+        0,
+        3,
+        5,
+        8,
+        1
+    ], "BBWTi of 'abracadabra'");
+    test_helper("", [], "BBWTi of empty string");
+    test_helper("a", [
+        0
+    ], "BBWTi of 'a'");
+    test_helper("edcba", [
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "BBWTi of 'edcba'");
+    test_helper("abcde", [
+        4,
+        0,
+        1,
+        2,
+        3
+    ], "BBWTi of 'abcde'");
+    test_helper("aaaaa", [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "BBWTi of 'aaaaa'");
+}
+function construct_bbw_transform(text, bbw_indices) {
+    if (!text || !bbw_indices) {
+        return "";
+    }
+    return [
+        ...bbw_indices
+    ].map((pos)=>text[pos]).join('');
+}
+export function test_bbw_transform() {
+    function test_helper(input, expected, description) {
+        const isa = construct_inverse_suffix_array(construct_suffix_array(input));
+        const lyndonFactorization = construct_lyndon_factorization(input, isa);
+        const csa = construct_circular_suffix_array(input, lyndonFactorization);
+        const bbwt_indices = construct_bbw_indices(lyndonFactorization, csa);
+        const bbwTransform = construct_bbw_transform(input, bbwt_indices);
+        assert_eq(bbwTransform, expected, description);
+    }
+    test_helper("banana", "annbaa", "BBWT of 'banana'");
+    test_helper("abracadabra", "ardrcaaaabb", "BBWT of 'abracadabra'");
+    test_helper("", "", "BBWT of empty string");
+    test_helper("a", "a", "BBWT of 'a'");
+    test_helper("edcba", "abcde", "BBWT of 'edcba'");
+    test_helper("abcde", "eabcd", "BBWT of 'abcde'");
+}
+function construct_inverse_bbw_transform(bbw_transform) {
+    if (!bbw_transform) {
+        return "";
+    }
+    let n = bbw_transform.length;
+    var farray = construct_first_array(bbw_transform);
+    const farray_rs = build_char_rank_select(farray);
+    const bbwt_rs = build_char_rank_select(bbw_transform);
+    var marking = new Array(n).fill(0);
+    var conjugates = [];
+    for(let bbwt_init_position = 0; bbwt_init_position < n; ++bbwt_init_position){
+        let conjugate = [];
+        if (marking[bbwt_init_position] == true) {
+            continue;
+        }
+        var pos = bbwt_init_position;
+        while(marking[pos] == false){
+            marking[pos] = true;
+            conjugate.push(bbw_transform[pos]);
+            let cur_char = farray[pos];
+            let character_number = farray_rs.local_ranks[pos] + 1;
+            pos = char_select(bbwt_rs, cur_char, character_number);
+            if (pos === -1) {
+                throw new AlgorithmError('character_number exceeds occurrences in inverse BBWT', 'construct_inverse_bbw_transform', bbw_transform);
+            }
+        }
+        const cycle = conjugate.join('');
+        conjugates.push(conjugate_string(cycle, least_rotation(cycle)));
+    }
+    conjugates.sort();
+    conjugates.reverse();
+    return conjugates.join('');
+}
+export function test_inverse_bbw_transform() {
+    assert_eq(construct_inverse_bbw_transform("annbaa"), "banana", "Inverse BBWT of 'annbaa'");
+    assert_eq(construct_inverse_bbw_transform("ardrcaaaabb"), "abracadabra", "Inverse BBWT of 'ardrcaaaabb'");
+    assert_eq(construct_inverse_bbw_transform(""), "", "Inverse BBWT of empty string");
+    assert_eq(construct_inverse_bbw_transform("a"), "a", "Inverse BBWT of 'a'");
+    assert_eq(construct_inverse_bbw_transform("abcde"), "edcba", "Inverse BBWT of 'abcde'");
+    assert_eq(construct_inverse_bbw_transform("eabcd"), "abcde", "Inverse BBWT of 'eabcd'");
+    assert_eq(construct_inverse_bbw_transform("b".repeat(100000)), "b".repeat(100000), "Inverse BBWT of a long unary string");
+    for (const text of [
+        "ab".repeat(20000),
+        "aab".repeat(20000),
+        "abaab".repeat(10000) + "a"
+    ]){
+        const isa = construct_inverse_suffix_array(construct_suffix_array(text));
+        const lyndon_factorization = construct_lyndon_factorization(text, isa);
+        const csa = construct_circular_suffix_array(text, lyndon_factorization);
+        const bbw_transform = construct_bbw_transform(text, construct_bbw_indices(lyndon_factorization, csa));
+        assert_eq(construct_inverse_bbw_transform(bbw_transform), text, `Inverse BBWT of a long periodic string of length ${text.length}`);
+    }
+}
+function random_ternary_string(length) {
+    const ternaryChars = 'abc';
+    let result = '';
+    for(let i = 0; i < length; i++){
+        const randomIndex = Math.floor(Math.random() * ternaryChars.length);
+        result += ternaryChars.charAt(randomIndex);
+    }
+    return result;
+}
+export function test_bbwt_random() {
+    for(let i = 0; i < 20; ++i){
+        const randomString = random_ternary_string(2 + i);
+        const isa = construct_inverse_suffix_array(construct_suffix_array(randomString));
+        const lyndonFactorization = construct_lyndon_factorization(randomString, isa);
+        const csa = construct_circular_suffix_array(randomString, lyndonFactorization);
+        const bbwt_indices = construct_bbw_indices(lyndonFactorization, csa);
+        const bbwTransform = construct_bbw_transform(randomString, bbwt_indices);
+        const invertedString = construct_inverse_bbw_transform(bbwTransform);
+        assert_eq(invertedString, randomString, `Inverse BBWT of random string '${randomString}'`);
+    }
+}
+export function test_phi_array_identity() {
+    function test_helper(text) {
+        const suffix_array = construct_suffix_array(text);
+        const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+        const phi_array = construct_phi_array(suffix_array, inverse_suffix_array);
+        const inverse_phi_array = construct_inverse_phi_array(suffix_array, inverse_suffix_array);
+        for(let i = 0; i < text.length; i++){
+            if (phi_array[i] === text.length || inverse_phi_array[i] === text.length) {
+                continue;
+            }
+            const phi_of_inverse_phi = inverse_phi_array[phi_array[i]];
+            assert_eq(phi_of_inverse_phi, i, `Phi and Inverse Phi identity failed for index ${i} in text '${text}'`);
+            const inverse_phi_of_phi = phi_array[inverse_phi_array[i]];
+            assert_eq(inverse_phi_of_phi, i, `Phi and Inverse Phi identity failed for index ${i} in text '${text}'`);
+        }
+    }
+    test_helper("banana");
+    test_helper("abracadabra");
+    test_helper("a");
+    test_helper("aaaaa");
+    test_helper("abcde");
+    test_helper("edcba");
+    test_helper("");
+    for(let i = 0; i < 20; ++i){
+        const randomString = random_ternary_string(2 + i);
+        test_helper(randomString);
+    }
+}
+export function test_error_handling() {
+    try {
+        construct_bw_transform("abc", [
+            1,
+            2
+        ]);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        conjugate_string("hello", -1);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        conjugate_string("hello", 10);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        select_query("banana", "a", 0);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        select_query("banana", "a", -1);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        construct_plcp_array([
+            1,
+            2,
+            3
+        ], [
+            1,
+            2
+        ]);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        construct_lf_array("abc", "ab");
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        construct_lyndon_factorization("hello", [
+            1,
+            2
+        ]);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        delta([]);
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+    try {
+        omega_order(undefined, "abc");
+        throw new Error("Should have thrown AlgorithmError");
+    } catch (e) {
+        if (!(e instanceof AlgorithmError)) {
+            throw new Error("Expected AlgorithmError");
+        }
+    }
+}
+export function test_boundary_conditions() {
+    const largeArray = new Array(1000).fill(0).map((_, i)=>i < 500 ? i : 500);
+    const result1 = count_period(largeArray);
+    assert_eq(result1 > 0, true, "count_period should handle large arrays");
+    assert_eq(construct_suffix_array("aaaaaaaaaa"), [
+        9,
+        8,
+        7,
+        6,
+        5,
+        4,
+        3,
+        2,
+        1,
+        0
+    ], "Suffix array of repeated chars");
+    const longString = "ab".repeat(500);
+    const result2 = construct_border_array(longString);
+    assert_eq(result2.length, 1000, "Border array of long string");
+    const result3 = construct_suffix_array("!@#$%");
+    assert_eq(result3.length, 5, "Suffix array with special chars");
+    assert_eq(construct_rotation_array("bbbb"), [
+        0,
+        1,
+        2,
+        3
+    ], "Rotation array of repeated char");
+    assert_eq(lcp_query("hello", -1, 0), 0, "LCP with negative index1");
+    assert_eq(lcp_query("hello", 0, -1), 0, "LCP with negative index2");
+    assert_eq(lcp_query("hello", 10, 0), 0, "LCP with index1 > length");
+    assert_eq(lcp_query("hello", 0, 10), 0, "LCP with index2 > length");
+    assert_eq(rank_query("hello", "l", 0), 0, "Rank query at index 0");
+    assert_eq(rank_query("hello", "l", 5), 2, "Rank query at end");
+    assert_eq(construct_index_array(0), [], "Index array with 0 length");
+    assert_eq(construct_index_array(-5), [], "Index array with negative length");
+}
+export function test_null_undefined_inputs() {
+    assert_eq(count_period(null), 0, "count_period with null");
+    assert_eq(count_exponent(null), 0, "count_exponent with null");
+    assert_eq(count_regularity(null), 'empty', "count_regularity with null");
+    assert_eq(construct_suffix_array(null), [], "construct_suffix_array with null");
+    assert_eq(construct_border_array(null), [], "construct_border_array with null");
+    assert_eq(construct_bw_transform(null, null), "", "construct_bw_transform with null");
+    assert_eq(construct_first_array(null), "", "construct_first_array with null");
+    assert_eq(construct_rotation_array(null), [], "construct_rotation_array with null");
+    assert_eq(construct_inverse_suffix_array(null), [], "construct_inverse_suffix_array with null");
+    assert_eq(construct_lcp_array(null, null, null), [], "construct_lcp_array with null");
+    assert_eq(count_lcp_array(null), 0, "count_lcp_array with null");
+    assert_eq(construct_plcp_array(null, null), [], "construct_plcp_array with null");
+    assert_eq(construct_psi_array(null, null), [], "construct_psi_array with null");
+    assert_eq(construct_lyndon_factorization(null, null), [], "construct_lyndon_factorization with null");
+    assert_eq(count_delta(null), 0, "count_delta with null");
+    assert_eq(count_delta_argmax(null), 0, "count_delta_argmax with null");
+    assert_eq(construct_substring_complexity(null), [], "construct_substring_complexity with null");
+    assert_eq(conjugate_string(null, 0), "", "conjugate_string with null");
+    assert_eq(select_query(null, "a", 1), -1, "select_query with null");
+    assert_eq(rank_query(null, "a", 0), 0, "rank_query with null");
+    assert_eq(construct_lf_array(null, null), [], "construct_lf_array with null");
+    assert_eq(construct_sl_string(null), [], "construct_sl_string with null");
+    assert_eq(construct_lpf_array(null, null), [], "construct_lpf_array with null");
+    assert_eq(construct_lpnf_array(null, null, null), [], "construct_lpnf_array with null");
+    assert_eq(construct_lnf_array(null), [], "construct_lnf_array with null");
+    assert_eq(construct_nss_array(null), [], "construct_nss_array with null");
+    assert_eq(construct_pss_array(null), [], "construct_pss_array with null");
+    assert_eq(construct_lyndon_array(null), [], "construct_lyndon_array with null");
+    assert_eq(construct_necklace_conjugate_transform(null), "", "construct_necklace_conjugate_transform with null");
+    assert_eq(construct_invert_transform(null), "", "construct_invert_transform with null");
+    assert_eq(construct_revert_transform(null), "", "construct_revert_transform with null");
+    assert_eq(construct_circular_suffix_array(null, null), [], "construct_circular_suffix_array with null");
+    assert_eq(construct_inverse_circular_suffix_array(null), [], "construct_inverse_circular_suffix_array with null");
+    assert_eq(construct_bbw_indices(null, null), [], "construct_bbw_indices with null");
+    assert_eq(construct_bbw_transform(null, null), "", "construct_bbw_transform with null");
+    assert_eq(construct_inverse_bbw_transform(null), "", "construct_inverse_bbw_transform with null");
+    assert_eq(lcp_query(null, 0, 0), 0, "lcp_query with null");
+    assert_eq(construct_inverse_phi_array(null, null), [], "construct_inverse_phi_array with null");
+}
+export function test_complex_integration() {
+    const unicode = "café";
+    const sa = construct_suffix_array(unicode);
+    const isa = construct_inverse_suffix_array(sa);
+    const lcp = construct_lcp_array(unicode, sa, isa);
+    assert_eq(sa.length, unicode.length, "SA length matches");
+    assert_eq(isa.length, unicode.length, "ISA length matches");
+    assert_eq(lcp.length, unicode.length, "LCP length matches");
+    const text = "mississippi";
+    const ra = construct_rotation_array(text);
+    const bwt = construct_bw_transform(text, ra);
+    assert_eq(bwt.length, text.length, "BWT length matches");
+    const texts = [
+        "banana",
+        "abracadabra",
+        "aaaaa",
+        "abcde"
+    ];
+    texts.forEach((t)=>{
+        const sa2 = construct_suffix_array(t);
+        const isa2 = construct_inverse_suffix_array(sa2);
+        const lf = construct_lyndon_factorization(t, isa2);
+        assert_eq(lf.length, t.length, `LF length matches for ${t}`);
+        assert_eq(lf.filter((x)=>x).length > 0, true, `At least one factor end for ${t}`);
+    });
+    const testStrings = [
+        "a",
+        "ab",
+        "abc",
+        "aaa",
+        "abab"
+    ];
+    testStrings.forEach((t)=>{
+        const sa3 = construct_suffix_array(t);
+        const isa3 = construct_inverse_suffix_array(sa3);
+        const lf3 = construct_lyndon_factorization(t, isa3);
+        const csa = construct_circular_suffix_array(t, lf3);
+        const bbwti = construct_bbw_indices(lf3, csa);
+        const bbwt3 = construct_bbw_transform(t, bbwti);
+        const recovered = construct_inverse_bbw_transform(bbwt3);
+        assert_eq(recovered, t, `BBWT round trip for ${t}`);
+    });
+}
+function construct_lz78_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const factorization = new Uint8Array(n);
+    const dictionary = new Map();
+    let currentIndex = 0;
+    while(currentIndex < n){
+        let currentSubstring = "";
+        for(let j = currentIndex; j < n; j++){
+            currentSubstring += text[j];
+            if (!dictionary.has(currentSubstring)) {
+                break;
+            }
+        }
+        const newFactor = currentSubstring;
+        dictionary.set(newFactor, currentIndex);
+        factorization[currentIndex + newFactor.length - 1] = 1;
+        currentIndex += newFactor.length;
+    }
+    return factorization;
+}
+export function test_lz78_factorization() {
+    assert_eq(construct_lz78_factorization("ababc"), [
+        true,
+        true,
+        false,
+        true,
+        true
+    ], "LZ78 factorization of 'ababc'");
+    assert_eq(construct_lz78_factorization("aaaaa"), [
+        true,
+        false,
+        true,
+        false,
+        true
+    ], "LZ78 factorization of 'aaaaa'");
+    assert_eq(construct_lz78_factorization("banana"), [
+        true,
+        true,
+        true,
+        false,
+        true,
+        true
+    ], "LZ78 factorization of 'banana'");
+    assert_eq(construct_lz78_factorization("abracadabra"), [
+        true,
+        true,
+        true,
+        false,
+        true,
+        false,
+        true,
+        false,
+        true,
+        false,
+        true
+    ], "LZ78 factorization of 'abracadabra'");
+    assert_eq(construct_lz78_factorization(""), [], "LZ78 factorization of empty string");
+    assert_eq(construct_lz78_factorization("a"), [
+        true
+    ], "LZ78 factorization of 'a'");
+    assert_eq(construct_lz78_factorization("abcde"), [
+        true,
+        true,
+        true,
+        true,
+        true
+    ], "LZ78 factorization of 'abcde'");
+    assert_eq(construct_lz78_factorization("edcba"), [
+        true,
+        true,
+        true,
+        true,
+        true
+    ], "LZ78 factorization of 'edcba'");
+    assert_eq(construct_lz78_factorization(null), [], "LZ78 factorization of null input");
+}
+function construct_lzw_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const factorization = new Uint8Array(n);
+    const dictionary = new Map();
+    for(let i = 0; i < n; i++){
+        const char = text[i];
+        if (!dictionary.has(char)) {
+            dictionary.set(char, dictionary.size);
+        }
+    }
+    for(let i = 0; i < n;){
+        let s = "";
+        for(let j = i; j < n; j++){
+            s += text[j];
+            if (!dictionary.has(s)) {
+                s = s.slice(0, -1);
+                break;
+            }
+        }
+        let endpos = i + s.length - 1;
+        if (endpos >= n) {
+            factorization[n - 1] = 1;
+            break;
+        }
+        if (s.length == 0) {
+            throw new AlgorithmError("LZW factorization failed to find a valid substring.", "construct_lzw_factorization", {
+                text
+            });
+        }
+        factorization[endpos] = 1;
+        if (i + s.length < n) {
+            s += text[i + s.length];
+        }
+        if (!dictionary.has(s)) {
+            dictionary.set(s, dictionary.size);
+        }
+        i = endpos + 1;
+    }
+    return factorization;
+}
+export function test_lzw_factorization() {
+    assert_eq(construct_lzw_factorization("ababc"), [
+        true,
+        true,
+        false,
+        true,
+        true
+    ], "LZW factorization of 'ababc'");
+    assert_eq(construct_lzw_factorization("aaaaa"), [
+        true,
+        false,
+        true,
+        false,
+        true
+    ], "LZW factorization of 'aaaaa'");
+    assert_eq(construct_lzw_factorization("banana"), [
+        true,
+        true,
+        true,
+        false,
+        true,
+        true
+    ], "LZW factorization of 'banana'");
+    assert_eq(construct_lzw_factorization("abracadabra"), [
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        true,
+        false,
+        true,
+        false,
+        true
+    ], "LZW factorization of 'abracadabra'");
+    assert_eq(construct_lzw_factorization(""), [], "LZW factorization of empty string");
+    assert_eq(construct_lzw_factorization("a"), [
+        true
+    ], "LZW factorization of 'a'");
+    assert_eq(construct_lzw_factorization("abcde"), [
+        true,
+        true,
+        true,
+        true,
+        true
+    ], "LZW factorization of 'abcde'");
+    assert_eq(construct_lzw_factorization("edcba"), [
+        true,
+        true,
+        true,
+        true,
+        true
+    ], "LZW factorization of 'edcba'");
+    assert_eq(construct_lzw_factorization(null), [], "LZW factorization of null input");
+}
+function construct_necklace_factorization(text, lyndon_factorization) {
+    if (!text || !lyndon_factorization) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const necklace_factorization = new Uint8Array(n);
+    let factor_start = 0;
+    let last_factor = "";
+    while(factor_start < n){
+        let factor_end = factor_start;
+        while(factor_end < n && !lyndon_factorization[factor_end]){
+            factor_end++;
+        }
+        const current_factor = text.slice(factor_start, factor_end + 1);
+        if (current_factor === last_factor) {
+            necklace_factorization[factor_start - 1] = 0;
+            necklace_factorization[factor_end] = 1;
+            factor_start = factor_end + 1;
+            continue;
+        }
+        last_factor = current_factor;
+        necklace_factorization[factor_end] = 1;
+        factor_start = factor_end + 1;
+    }
+    return necklace_factorization;
+}
+export function test_necklace_factorization() {
+    function test_helper(input, expected, description) {
+        const isa = construct_inverse_suffix_array(construct_suffix_array(input));
+        const lyndonFactorization = construct_lyndon_factorization(input, isa);
+        const necklaceFactorization = construct_necklace_factorization(input, lyndonFactorization);
+        assert_eq(necklaceFactorization, expected, description);
+    }
+    test_helper("banana", [
+        true,
+        false,
+        false,
+        false,
+        true,
+        true
+    ], "Necklace factorization of 'banana'");
+    test_helper("abracadabra", [
+        false,
+        false,
+        false,
+        false,
+        false,
+        false,
+        true,
+        false,
+        false,
+        true,
+        true
+    ], "Necklace factorization of 'abracadabra'");
+    test_helper("", [], "Necklace factorization of empty string");
+    test_helper("a", [
+        true
+    ], "Necklace factorization of 'a'");
+    test_helper("aaaaa", [
+        false,
+        false,
+        false,
+        false,
+        true
+    ], "Necklace factorization of 'aaaaa'");
+    test_helper("edcba", [
+        true,
+        true,
+        true,
+        true,
+        true
+    ], "Necklace factorization of 'edcba'");
+    test_helper("abcde", [
+        false,
+        false,
+        false,
+        false,
+        true
+    ], "Necklace factorization of 'abcde'");
+}
+function construct_odd_maximal_palindromic_length_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const o_pali = new Int32Array(n);
+    let center = 0;
+    let right = 0;
+    for(let i = 0; i < n; i++){
+        let mirror = 2 * center - i;
+        if (i < right) {
+            o_pali[i] = Math.min(right - i, o_pali[mirror]);
+        }
+        while(i - o_pali[i] - 1 >= 0 && i + o_pali[i] + 1 < n && text[i - o_pali[i] - 1] === text[i + o_pali[i] + 1]){
+            o_pali[i]++;
+        }
+        if (i + o_pali[i] > right) {
+            center = i;
+            right = i + o_pali[i];
+        }
+    }
+    return o_pali;
+}
+export function test_odd_maximal_palindromic_length_array() {
+    assert_eq(construct_odd_maximal_palindromic_length_array("ababa"), [
+        0,
+        1,
+        2,
+        1,
+        0
+    ], "o-pali of 'ababa'");
+    assert_eq(construct_odd_maximal_palindromic_length_array("racecar"), [
+        0,
+        0,
+        0,
+        3,
+        0,
+        0,
+        0
+    ], "o-pali of 'racecar'");
+    assert_eq(construct_odd_maximal_palindromic_length_array(""), [], "o-pali of empty string");
+    assert_eq(construct_odd_maximal_palindromic_length_array("a"), [
+        0
+    ], "o-pali of 'a'");
+    assert_eq(construct_odd_maximal_palindromic_length_array("abcde"), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "o-pali of 'abcde'");
+}
+function construct_even_maximal_palindromic_length_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const e_pali = new Int32Array(n);
+    let center = 0;
+    let right = 0;
+    for(let i = 0; i < n; i++){
+        let mirror = 2 * center - i + 1;
+        if (i < right) {
+            e_pali[i] = Math.min(right - i, e_pali[mirror]);
+        }
+        while(i - e_pali[i] - 1 >= 0 && i + e_pali[i] < n && text[i - e_pali[i] - 1] === text[i + e_pali[i]]){
+            e_pali[i]++;
+        }
+        if (i + e_pali[i] > right) {
+            center = i - 1;
+            right = i + e_pali[i];
+        }
+    }
+    return e_pali;
+}
+export function test_even_maximal_palindromic_length_array() {
+    assert_eq(construct_even_maximal_palindromic_length_array("abba"), [
+        0,
+        0,
+        2,
+        0
+    ], "e-pali of 'abba'");
+    assert_eq(construct_even_maximal_palindromic_length_array("noon"), [
+        0,
+        0,
+        2,
+        0
+    ], "e-pali of 'noon'");
+    assert_eq(construct_even_maximal_palindromic_length_array(""), [], "e-pali of empty string");
+    assert_eq(construct_even_maximal_palindromic_length_array("a"), [
+        0
+    ], "e-pali of 'a'");
+    assert_eq(construct_even_maximal_palindromic_length_array("abcde"), [
+        0,
+        0,
+        0,
+        0,
+        0
+    ], "e-pali of 'abcde'");
+}
+function get_lzend_reference(text, substring, factorization) {
+    let startIndex = 0;
+    while((startIndex = text.indexOf(substring, startIndex)) !== -1){
+        if (factorization[startIndex + substring.length - 1]) {
+            return startIndex;
+        }
+        startIndex += substring.length;
+    }
+    return -1;
+}
+function construct_lzend_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const factorization = new Uint8Array(n);
+    for(let i = 0; i < n;){
+        let factor = "";
+        let s = "";
+        const prefix = text.slice(0, i);
+        for(let j = i; j < n; j++){
+            s += text[j];
+            if (prefix.indexOf(s) === -1) {
+                break;
+            }
+            if (get_lzend_reference(prefix, s, factorization) !== -1) {
+                factor = s;
+            }
+        }
+        if (!factor) {
+            factor = text[i];
+        } else {
+            factor += text[i + factor.length - 1];
+        }
+        let endpos = i + factor.length - 1;
+        if (endpos >= n) {
+            factorization[n - 1] = 1;
+            break;
+        }
+        factorization[endpos] = 1;
+        i = endpos + 1;
+    }
+    return factorization;
+}
+export function test_lzend_factorization() {
+    assert_eq(construct_lzend_factorization("alabar_a_la_alabarda$"), [
+        true,
+        true,
+        false,
+        true,
+        false,
+        true,
+        true,
+        false,
+        true,
+        false,
+        true,
+        false,
+        true,
+        false,
+        false,
+        false,
+        false,
+        false,
+        true,
+        false,
+        true
+    ], "LZ-end factorization of 'alabar_a_la_alabarda$'");
+    assert_eq(construct_lzend_factorization("ababc"), [
+        true,
+        true,
+        false,
+        false,
+        true
+    ], "LZ-end factorization of 'ababc'");
+    assert_eq(construct_lzend_factorization("aaaaa"), [
+        true,
+        false,
+        true,
+        false,
+        true
+    ], "LZ-end factorization of 'aaaaa'");
+    assert_eq(construct_lzend_factorization("banana"), [
+        true,
+        true,
+        true,
+        false,
+        false,
+        true
+    ], "LZ-end factorization of 'banana'");
+}
+function is_stringattractor(text, attractor) {
+    const n = text.length;
+    const marked = new Array(n).fill(false);
+    for (const p of attractor){
+        if (p >= 0 && p < n) {
+            marked[p] = true;
+        }
+    }
+    const attractor_rs = build_bit_rank_select(marked);
+    for(let i = 0; i < n; i++){
+        let s = '';
+        for(let j = i; j < n; j++){
+            s += text[j];
+            let hit = false;
+            for(let k = 0; k + s.length <= n; k++){
+                if (text.slice(k, k + s.length) === s && bit_rank(attractor_rs, k + s.length) > bit_rank(attractor_rs, k)) {
+                    hit = true;
+                }
+                if (hit) break;
+            }
+            if (!hit) return false;
+        }
+    }
+    return true;
+}
+function construct_gamma_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const freq = new Map();
+    for(let i = 0; i < n; i++){
+        let s = '';
+        for(let j = i; j < n; j++){
+            s += text[j];
+            freq.set(s, (freq.get(s) || 0) + 1);
+        }
+    }
+    const minimal = [];
+    for (const [s, f] of freq.entries()){
+        let minimalFlag = true;
+        for(let i = 0; i < s.length && minimalFlag; i++){
+            const t = s.slice(0, i) + s.slice(i + 1);
+            if (t.length > 0 && freq.get(t) <= f) {
+                minimalFlag = false;
+            }
+        }
+        if (minimalFlag) minimal.push(s);
+    }
+    const hits = minimal.map((s)=>{
+        const set = new Set();
+        for(let i = 0; i + s.length <= n; i++){
+            if (text.slice(i, i + s.length) === s) {
+                for(let p = i; p < i + s.length; p++){
+                    set.add(p);
+                }
+            }
+        }
+        return set;
+    });
+    const positions = [
+        ...Array(n).keys()
+    ];
+    function backtrack(idx, chosen, best) {
+        if (best.size > 0 && chosen.size >= best.size) return new Set();
+        let ok = true;
+        for (const h of hits){
+            let covered = false;
+            for (const p of chosen){
+                if (h.has(p)) {
+                    covered = true;
+                    break;
+                }
+            }
+            if (!covered) {
+                ok = false;
+                break;
+            }
+        }
+        if (ok) {
+            return new Set(chosen);
+        }
+        if (idx === positions.length) {
+            return new Set();
+        }
+        chosen.add(positions[idx]);
+        var res = backtrack(idx + 1, chosen, best);
+        best = res.size > 0 ? res : best;
+        chosen.delete(positions[idx]);
+        var res = backtrack(idx + 1, chosen, best);
+        best = res.size > 0 ? res : best;
+        return best;
+    }
+    const ret = backtrack(0, new Set(), new Set());
+    const result = new Uint8Array(n);
+    ret.forEach((val)=>result[val] = 1);
+    return result;
+}
+function factorization_to_positions(factorization) {
+    const positions = [];
+    for(let i = 0; i < factorization.length; i++){
+        if (factorization[i]) {
+            positions.push(i);
+        }
+    }
+    return positions;
+}
+export function test_gamma_factorization() {
+    function test_helper(text, exp_attr) {
+        const attractor_fact = construct_gamma_factorization(text);
+        const attractor = factorization_to_positions(attractor_fact);
+        assert_eq(is_stringattractor(text, attractor), true, `Valid attractor '${attractor}' for text '${text}'`);
+        assert_eq(attractor, exp_attr, `Expected gamma size for text '${text}'`);
+    }
+    test_helper('a', [
+        0
+    ]);
+    test_helper('banana', [
+        0,
+        1,
+        2
+    ]);
+    test_helper('ananas', [
+        0,
+        1,
+        5
+    ]);
+    test_helper('abracadabra', [
+        0,
+        1,
+        2,
+        4,
+        6
+    ]);
+    test_helper('mississippi', [
+        0,
+        5,
+        7,
+        9
+    ]);
+    test_helper('', []);
+    test_helper('aaaa', [
+        0
+    ]);
+    test_helper('abcde', [
+        0,
+        1,
+        2,
+        3,
+        4
+    ]);
+    test_helper('edcba', [
+        0,
+        1,
+        2,
+        3,
+        4
+    ]);
+    test_helper('abab', [
+        0,
+        1
+    ]);
+}
+
@@ -0,0 +1,1510 @@
+// === Structure flags ===
+// Each structure owns one bit of a word array: [word index, bit mask].
+var structure_flag_words = 3;
+var structure_flags = {
+	counter_n: [0, 1 << 0],
+	counter_sigma: [0, 1 << 1],
+	suffix_array: [0, 1 << 2],
+	border_array: [0, 1 << 3],
+	first_array: [0, 1 << 4],
+	index_array: [0, 1 << 5],
+	rotation_array: [0, 1 << 6],
+	sl_string: [0, 1 << 7],
+	lnf_array: [0, 1 << 8],
+	necklace_conjugate_transform: [0, 1 << 9],
+	invert_transform: [0, 1 << 10],
+	revert_transform: [0, 1 << 11],
+	lz78_factorization: [0, 1 << 12],
+	lzw_factorization: [0, 1 << 13],
+	odd_maximal_palindromic_length_array: [0, 1 << 14],
+	even_maximal_palindromic_length_array: [0, 1 << 15],
+	lzend_factorization: [0, 1 << 16],
+	gamma_factorization: [0, 1 << 17],
+	inverse_suffix_array: [0, 1 << 18],
+	counter_period: [0, 1 << 19],
+	counter_exponent: [0, 1 << 20],
+	counter_regularity: [0, 1 << 21],
+	bw_transform: [0, 1 << 22],
+	reverse_lzss_factorization: [0, 1 << 23],
+	counter_necklace_conjugate_transform: [0, 1 << 24],
+	counter_invert_transform: [0, 1 << 25],
+	counter_revert_transform: [0, 1 << 26],
+	counter_lz78_factorization: [0, 1 << 27],
+	counter_lzw_factorization: [0, 1 << 28],
+	counter_lzend_factorization: [0, 1 << 29],
+	counter_gamma_factorization: [0, 1 << 30],
+	phi_array: [0, 1 << 31],
+	inverse_phi_array: [1, 1 << 0],
+	lcp_array: [1, 1 << 1],
+	psi_array: [1, 1 << 2],
+	lyndon_factorization: [1, 1 << 3],
+	nss_array: [1, 1 << 4],
+	pss_array: [1, 1 << 5],
+	lf_array: [1, 1 << 6],
+	counter_bw_transform: [1, 1 << 7],
+	counter_reverse_lzss_factorization: [1, 1 << 8],
+	counter_lcp_array: [1, 1 << 9],
+	plcp_array: [1, 1 << 10],
+	substring_complexity: [1, 1 << 11],
+	lpf_array: [1, 1 << 12],
+	lpnf_array: [1, 1 << 13],
+	circular_suffix_array: [1, 1 << 14],
+	necklace_factorization: [1, 1 << 15],
+	counter_lyndon_factorization: [1, 1 << 16],
+	lyndon_array: [1, 1 << 17],
+	lexparse_factorization: [1, 1 << 18],
+	counter_delta: [1, 1 << 19],
+	counter_delta_argmax: [1, 1 << 20],
+	lzss_factorization: [1, 1 << 21],
+	lz77_factorization: [1, 1 << 22],
+	lzssno_factorization: [1, 1 << 23],
+	inverse_circular_suffix_array: [1, 1 << 24],
+	bbw_indices: [1, 1 << 25],
+	counter_necklace_factorization: [1, 1 << 26],
+	counter_lexparse_factorization: [1, 1 << 27],
+	counter_lzss_factorization: [1, 1 << 28],
+	counter_lz77_factorization: [1, 1 << 29],
+	counter_lzssno_factorization: [1, 1 << 30],
+	bbw_transform: [1, 1 << 31],
+	inverse_bbw_transform: [2, 1 << 0],
+	counter_bbw_transform: [2, 1 << 1],
+	counter_inverse_bbw_transform: [2, 1 << 2]
+};
+
+// === Dependency closure: flag words of each structure and everything it is built from ===
+var structure_closure = {
+	counter_n: [0x00000001, 0x00000000, 0x00000000],
+	counter_sigma: [0x00000002, 0x00000000, 0x00000000],
+	suffix_array: [0x00000004, 0x00000000, 0x00000000],
+	border_array: [0x00000008, 0x00000000, 0x00000000],
+	first_array: [0x00000010, 0x00000000, 0x00000000],
+	index_array: [0x00000020, 0x00000000, 0x00000000],
+	rotation_array: [0x00000040, 0x00000000, 0x00000000],
+	sl_string: [0x00000080, 0x00000000, 0x00000000],
+	lnf_array: [0x00000100, 0x00000000, 0x00000000],
+	necklace_conjugate_transform: [0x00000200, 0x00000000, 0x00000000],
+	invert_transform: [0x00000400, 0x00000000, 0x00000000],
+	revert_transform: [0x00000800, 0x00000000, 0x00000000],
+	lz78_factorization: [0x00001000, 0x00000000, 0x00000000],
+	lzw_factorization: [0x00002000, 0x00000000, 0x00000000],
+	odd_maximal_palindromic_length_array: [0x00004000, 0x00000000, 0x00000000],
+	even_maximal_palindromic_length_array: [0x00008000, 0x00000000, 0x00000000],
+	lzend_factorization: [0x00010000, 0x00000000, 0x00000000],
+	gamma_factorization: [0x00020000, 0x00000000, 0x00000000],
+	inverse_suffix_array: [0x00040004, 0x00000000, 0x00000000],
+	counter_period: [0x00080008, 0x00000000, 0x00000000],
+	counter_exponent: [0x00100008, 0x00000000, 0x00000000],
+	counter_regularity: [0x00200008, 0x00000000, 0x00000000],
+	bw_transform: [0x00400040, 0x00000000, 0x00000000],
+	reverse_lzss_factorization: [0x00800100, 0x00000000, 0x00000000],
+	counter_necklace_conjugate_transform: [0x01000200, 0x00000000, 0x00000000],
+	counter_invert_transform: [0x02000400, 0x00000000, 0x00000000],
+	counter_revert_transform: [0x04000800, 0x00000000, 0x00000000],
+	counter_lz78_factorization: [0x08001000, 0x00000000, 0x00000000],
+	counter_lzw_factorization: [0x10002000, 0x00000000, 0x00000000],
+	counter_lzend_factorization: [0x20010000, 0x00000000, 0x00000000],
+	counter_gamma_factorization: [0x40020000, 0x00000000, 0x00000000],
+	phi_array: [0x80040004, 0x00000000, 0x00000000],
+	inverse_phi_array: [0x00040004, 0x00000001, 0x00000000],
+	lcp_array: [0x00040004, 0x00000002, 0x00000000],
+	psi_array: [0x00040004, 0x00000004, 0x00000000],
+	lyndon_factorization: [0x00040004, 0x00000008, 0x00000000],
+	nss_array: [0x00040004, 0x00000010, 0x00000000],
+	pss_array: [0x00040004, 0x00000020, 0x00000000],
+	lf_array: [0x00400050, 0x00000040, 0x00000000],
+	counter_bw_transform: [0x00400040, 0x00000080, 0x00000000],
+	counter_reverse_lzss_factorization: [0x00800100, 0x00000100, 0x00000000],
+	counter_lcp_array: [0x00040004, 0x00000202, 0x00000000],
+	plcp_array: [0x00040004, 0x00000402, 0x00000000],
+	substring_complexity: [0x00040004, 0x00000802, 0x00000000],
+	lpf_array: [0x00040004, 0x00001002, 0x00000000],
+	lpnf_array: [0x00040004, 0x00002002, 0x00000000],
+	circular_suffix_array: [0x00040004, 0x00004008, 0x00000000],
+	necklace_factorization: [0x00040004, 0x00008008, 0x00000000],
+	counter_lyndon_factorization: [0x00040004, 0x00010008, 0x00000000],
+	lyndon_array: [0x00040004, 0x00020010, 0x00000000],
+	lexparse_factorization: [0x00040004, 0x00040402, 0x00000000],
+	counter_delta: [0x00040004, 0x00080802, 0x00000000],
+	counter_delta_argmax: [0x00040004, 0x00100802, 0x00000000],
+	lzss_factorization: [0x00040004, 0x00201002, 0x00000000],
+	lz77_factorization: [0x00040004, 0x00401002, 0x00000000],
+	lzssno_factorization: [0x00040004, 0x00802002, 0x00000000],
+	inverse_circular_suffix_array: [0x00040004, 0x01004008, 0x00000000],
+	bbw_indices: [0x00040004, 0x02004008, 0x00000000],
+	counter_necklace_factorization: [0x00040004, 0x04008008, 0x00000000],
+	counter_lexparse_factorization: [0x00040004, 0x08040402, 0x00000000],
+	counter_lzss_factorization: [0x00040004, 0x10201002, 0x00000000],
+	counter_lz77_factorization: [0x00040004, 0x20401002, 0x00000000],
+	counter_lzssno_factorization: [0x00040004, 0x40802002, 0x00000000],
+	bbw_transform: [0x00040004, 0x82004008, 0x00000000],
+	inverse_bbw_transform: [0x00040004, 0x82004008, 0x00000001],
+	counter_bbw_transform: [0x00040004, 0x82004008, 0x00000002],
+	counter_inverse_bbw_transform: [0x00040004, 0x82004008, 0x00000005]
+};
+
+// Returns the flag words selecting the given structure names; unknown names are ignored.
+function structure_flag_set(names) {
+	var flags = [0x00000000, 0x00000000, 0x00000000];
+	for (var i = 0; i < names.length; i++) {
+		var flag = structure_flags[names[i]];
+		if (flag) flags[flag[0]] |= flag[1];
+	}
+	return flags;
+}
+
+// Returns the flag words of the given structures together with everything they are built from.
+function structure_closure_of(flags) {
+	var need = [0x00000000, 0x00000000, 0x00000000];
+	for (var name in structure_flags) {
+		var flag = structure_flags[name];
+		if (!(flags[flag[0]] & flag[1])) continue;
+		var deps = structure_closure[name];
+		for (var w = 0; w < deps.length; w++) need[w] |= deps[w];
+	}
+	return need;
+}
+
+// === Direct dependencies of each structure, in construction order ===
+var structure_dependencies = {
+	counter_n: [],
+	counter_sigma: [],
+	suffix_array: [],
+	border_array: [],
+	first_array: [],
+	index_array: [],
+	rotation_array: [],
+	sl_string: [],
+	lnf_array: [],
+	necklace_conjugate_transform: [],
+	invert_transform: [],
+	revert_transform: [],
+	lz78_factorization: [],
+	lzw_factorization: [],
+	odd_maximal_palindromic_length_array: [],
+	even_maximal_palindromic_length_array: [],
+	lzend_factorization: [],
+	gamma_factorization: [],
+	inverse_suffix_array: ['suffix_array'],
+	counter_period: ['border_array'],
+	counter_exponent: ['border_array'],
+	counter_regularity: ['border_array'],
+	bw_transform: ['rotation_array'],
+	reverse_lzss_factorization: ['lnf_array'],
+	counter_necklace_conjugate_transform: ['necklace_conjugate_transform'],
+	counter_invert_transform: ['invert_transform'],
+	counter_revert_transform: ['revert_transform'],
+	counter_lz78_factorization: ['lz78_factorization'],
+	counter_lzw_factorization: ['lzw_factorization'],
+	counter_lzend_factorization: ['lzend_factorization'],
+	counter_gamma_factorization: ['gamma_factorization'],
+	phi_array: ['suffix_array', 'inverse_suffix_array'],
+	inverse_phi_array: ['suffix_array', 'inverse_suffix_array'],
+	lcp_array: ['suffix_array', 'inverse_suffix_array'],
+	psi_array: ['suffix_array', 'inverse_suffix_array'],
+	lyndon_factorization: ['inverse_suffix_array'],
+	nss_array: ['inverse_suffix_array'],
+	pss_array: ['inverse_suffix_array'],
+	lf_array: ['first_array', 'bw_transform'],
+	counter_bw_transform: ['bw_transform'],
+	counter_reverse_lzss_factorization: ['reverse_lzss_factorization'],
+	counter_lcp_array: ['lcp_array'],
+	plcp_array: ['inverse_suffix_array', 'lcp_array'],
+	substring_complexity: ['lcp_array'],
+	lpf_array: ['suffix_array', 'lcp_array'],
+	lpnf_array: ['suffix_array', 'inverse_suffix_array', 'lcp_array'],
+	circular_suffix_array: ['lyndon_factorization'],
+	necklace_factorization: ['lyndon_factorization'],
+	counter_lyndon_factorization: ['lyndon_factorization'],
+	lyndon_array: ['nss_array'],
+	lexparse_factorization: ['plcp_array'],
+	counter_delta: ['substring_complexity'],
+	counter_delta_argmax: ['substring_complexity'],
+	lzss_factorization: ['lpf_array'],
+	lz77_factorization: ['lpf_array'],
+	lzssno_factorization: ['lpnf_array'],
+	inverse_circular_suffix_array: ['circular_suffix_array'],
+	bbw_indices: ['lyndon_factorization', 'circular_suffix_array'],
+	counter_necklace_factorization: ['necklace_factorization'],
+	counter_lexparse_factorization: ['lexparse_factorization'],
+	counter_lzss_factorization: ['lzss_factorization'],
+	counter_lz77_factorization: ['lz77_factorization'],
+	counter_lzssno_factorization: ['lzssno_factorization'],
+	bbw_transform: ['bbw_indices'],
+	inverse_bbw_transform: ['bbw_transform'],
+	counter_bbw_transform: ['bbw_transform'],
+	counter_inverse_bbw_transform: ['inverse_bbw_transform']
+};
+
+// Builds one structure from the text and its direct dependencies, given by name in `inputs`.
+var structure_builders = {
+	counter_n: function (var_text, var_n, inputs) { return count_n(var_text); },
+	counter_sigma: function (var_text, var_n, inputs) { return count_sigma(var_text); },
+	suffix_array: function (var_text, var_n, inputs) { return construct_suffix_array(var_text); },
+	border_array: function (var_text, var_n, inputs) { return construct_border_array(var_text); },
+	first_array: function (var_text, var_n, inputs) { return construct_first_array(var_text); },
+	index_array: function (var_text, var_n, inputs) { return construct_index_array(var_n); },
+	rotation_array: function (var_text, var_n, inputs) { return construct_rotation_array(var_text); },
+	sl_string: function (var_text, var_n, inputs) { return construct_sl_string(var_text); },
+	lnf_array: function (var_text, var_n, inputs) { return construct_lnf_array(var_text); },
+	necklace_conjugate_transform: function (var_text, var_n, inputs) { return construct_necklace_conjugate_transform(var_text); },
+	invert_transform: function (var_text, var_n, inputs) { return construct_invert_transform(var_text); },
+	revert_transform: function (var_text, var_n, inputs) { return construct_revert_transform(var_text); },
+	lz78_factorization: function (var_text, var_n, inputs) { return construct_lz78_factorization(var_text); },
+	lzw_factorization: function (var_text, var_n, inputs) { return construct_lzw_factorization(var_text); },
+	odd_maximal_palindromic_length_array: function (var_text, var_n, inputs) { return construct_odd_maximal_palindromic_length_array(var_text); },
+	even_maximal_palindromic_length_array: function (var_text, var_n, inputs) { return construct_even_maximal_palindromic_length_array(var_text); },
+	lzend_factorization: function (var_text, var_n, inputs) { return construct_lzend_factorization(var_text); },
+	gamma_factorization: function (var_text, var_n, inputs) { return construct_gamma_factorization(var_text); },
+	inverse_suffix_array: function (var_text, var_n, inputs) { return construct_inverse_suffix_array(inputs.suffix_array); },
+	counter_period: function (var_text, var_n, inputs) { return count_period(inputs.border_array); },
+	counter_exponent: function (var_text, var_n, inputs) { return count_exponent(inputs.border_array); },
+	counter_regularity: function (var_text, var_n, inputs) { return count_regularity(inputs.border_array); },
+	bw_transform: function (var_text, var_n, inputs) { return construct_bw_transform(var_text, inputs.rotation_array); },
+	reverse_lzss_factorization: function (var_text, var_n, inputs) { return construct_reverse_lzss_factorization(inputs.lnf_array); },
+	counter_necklace_conjugate_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.necklace_conjugate_transform); },
+	counter_invert_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.invert_transform); },
+	counter_revert_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.revert_transform); },
+	counter_lz78_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lz78_factorization); },
+	counter_lzw_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzw_factorization); },
+	counter_lzend_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzend_factorization); },
+	counter_gamma_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.gamma_factorization); },
+	phi_array: function (var_text, var_n, inputs) { return construct_phi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	inverse_phi_array: function (var_text, var_n, inputs) { return construct_inverse_phi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	lcp_array: function (var_text, var_n, inputs) { return construct_lcp_array(var_text, inputs.suffix_array, inputs.inverse_suffix_array); },
+	psi_array: function (var_text, var_n, inputs) { return construct_psi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	lyndon_factorization: function (var_text, var_n, inputs) { return construct_lyndon_factorization(var_text, inputs.inverse_suffix_array); },
+	nss_array: function (var_text, var_n, inputs) { return construct_nss_array(inputs.inverse_suffix_array); },
+	pss_array: function (var_text, var_n, inputs) { return construct_pss_array(inputs.inverse_suffix_array); },
+	lf_array: function (var_text, var_n, inputs) { return construct_lf_array(inputs.first_array, inputs.bw_transform); },
+	counter_bw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.bw_transform); },
+	counter_reverse_lzss_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.reverse_lzss_factorization); },
+	counter_lcp_array: function (var_text, var_n, inputs) { return count_lcp_array(inputs.lcp_array); },
+	plcp_array: function (var_text, var_n, inputs) { return construct_plcp_array(inputs.inverse_suffix_array, inputs.lcp_array); },
+	substring_complexity: function (var_text, var_n, inputs) { return construct_substring_complexity(inputs.lcp_array); },
+	lpf_array: function (var_text, var_n, inputs) { return construct_lpf_array(inputs.suffix_array, inputs.lcp_array); },
+	lpnf_array: function (var_text, var_n, inputs) { return construct_lpnf_array(inputs.suffix_array, inputs.inverse_suffix_array, inputs.lcp_array); },
+	circular_suffix_array: function (var_text, var_n, inputs) { return construct_circular_suffix_array(var_text, inputs.lyndon_factorization); },
+	necklace_factorization: function (var_text, var_n, inputs) { return construct_necklace_factorization(var_text, inputs.lyndon_factorization); },
+	counter_lyndon_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lyndon_factorization); },
+	lyndon_array: function (var_text, var_n, inputs) { return construct_lyndon_array(inputs.nss_array); },
+	lexparse_factorization: function (var_text, var_n, inputs) { return construct_lexparse_factorization(inputs.plcp_array); },
+	counter_delta: function (var_text, var_n, inputs) { return count_delta(inputs.substring_complexity); },
+	counter_delta_argmax: function (var_text, var_n, inputs) { return count_delta_argmax(inputs.substring_complexity); },
+	lzss_factorization: function (var_text, var_n, inputs) { return construct_lzss_factorization(inputs.lpf_array); },
+	lz77_factorization: function (var_text, var_n, inputs) { return construct_lz77_factorization(inputs.lpf_array); },
+	lzssno_factorization: function (var_text, var_n, inputs) { return construct_lzssno_factorization(inputs.lpnf_array); },
+	inverse_circular_suffix_array: function (var_text, var_n, inputs) { return construct_inverse_circular_suffix_array(inputs.circular_suffix_array); },
+	bbw_indices: function (var_text, var_n, inputs) { return construct_bbw_indices(inputs.lyndon_factorization, inputs.circular_suffix_array); },
+	counter_necklace_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.necklace_factorization); },
+	counter_lexparse_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lexparse_factorization); },
+	counter_lzss_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzss_factorization); },
+	counter_lz77_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lz77_factorization); },
+	counter_lzssno_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzssno_factorization); },
+	bbw_transform: function (var_text, var_n, inputs) { return construct_bbw_transform(var_text, inputs.bbw_indices); },
+	inverse_bbw_transform: function (var_text, var_n, inputs) { return construct_inverse_bbw_transform(inputs.bbw_transform); },
+	counter_bbw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.bbw_transform); },
+	counter_inverse_bbw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.inverse_bbw_transform); }
+};
+
+// === Builder ===
+// flags: flag words from structure_flag_set; omitted to build all structures.
+// profile: optional array receiving the time, output length and heap delta of each construction.
+// cache: optional ResultCache; cached structures are reused, and their dependencies are not built.
+// on_result: optional callback receiving (name, value) of each requested structure as soon as it is ready.
+function build_ds(text, flags, profile, cache, on_result) {
+	const n = text.length;
+
+	// storage
+	const var_text = text;
+	const var_n = text.length;
+	var var_counter_n;
+	var var_counter_sigma;
+	var var_suffix_array;
+	var var_border_array;
+	var var_first_array;
+	var var_index_array;
+	var var_rotation_array;
+	var var_sl_string;
+	var var_lnf_array;
+	var var_necklace_conjugate_transform;
+	var var_invert_transform;
+	var var_revert_transform;
+	var var_lz78_factorization;
+	var var_lzw_factorization;
+	var var_odd_maximal_palindromic_length_array;
+	var var_even_maximal_palindromic_length_array;
+	var var_lzend_factorization;
+	var var_gamma_factorization;
+	var var_inverse_suffix_array;
+	var var_counter_period;
+	var var_counter_exponent;
+	var var_counter_regularity;
+	var var_bw_transform;
+	var var_reverse_lzss_factorization;
+	var var_counter_necklace_conjugate_transform;
+	var var_counter_invert_transform;
+	var var_counter_revert_transform;
+	var var_counter_lz78_factorization;
+	var var_counter_lzw_factorization;
+	var var_counter_lzend_factorization;
+	var var_counter_gamma_factorization;
+	var var_phi_array;
+	var var_inverse_phi_array;
+	var var_lcp_array;
+	var var_psi_array;
+	var var_lyndon_factorization;
+	var var_nss_array;
+	var var_pss_array;
+	var var_lf_array;
+	var var_counter_bw_transform;
+	var var_counter_reverse_lzss_factorization;
+	var var_counter_lcp_array;
+	var var_plcp_array;
+	var var_substring_complexity;
+	var var_lpf_array;
+	var var_lpnf_array;
+	var var_circular_suffix_array;
+	var var_necklace_factorization;
+	var var_counter_lyndon_factorization;
+	var var_lyndon_array;
+	var var_lexparse_factorization;
+	var var_counter_delta;
+	var var_counter_delta_argmax;
+	var var_lzss_factorization;
+	var var_lz77_factorization;
+	var var_lzssno_factorization;
+	var var_inverse_circular_suffix_array;
+	var var_bbw_indices;
+	var var_counter_necklace_factorization;
+	var var_counter_lexparse_factorization;
+	var var_counter_lzss_factorization;
+	var var_counter_lz77_factorization;
+	var var_counter_lzssno_factorization;
+	var var_bbw_transform;
+	var var_inverse_bbw_transform;
+	var var_counter_bbw_transform;
+	var var_counter_inverse_bbw_transform;
+
+	// a needed structure missing from the cache needs its direct dependencies
+	var need = flags === undefined ? [0xffffffff, 0xffffffff, 0x00000007] : flags.slice();
+	if (need[2] & (1 << 2)) {
+		if (cache) var_counter_inverse_bbw_transform = result_cache_get(cache, text, 'counter_inverse_bbw_transform');
+		if (var_counter_inverse_bbw_transform === undefined) { need[2] |= 0x00000001; }
+	}
+	if (need[2] & (1 << 1)) {
+		if (cache) var_counter_bbw_transform = result_cache_get(cache, text, 'counter_bbw_transform');
+		if (var_counter_bbw_transform === undefined) { need[1] |= 0x80000000; }
+	}
+	if (need[2] & (1 << 0)) {
+		if (cache) var_inverse_bbw_transform = result_cache_get(cache, text, 'inverse_bbw_transform');
+		if (var_inverse_bbw_transform === undefined) { need[1] |= 0x80000000; }
+	}
+	if (need[1] & (1 << 31)) {
+		if (cache) var_bbw_transform = result_cache_get(cache, text, 'bbw_transform');
+		if (var_bbw_transform === undefined) { need[1] |= 0x02000000; }
+	}
+	if (need[1] & (1 << 30)) {
+		if (cache) var_counter_lzssno_factorization = result_cache_get(cache, text, 'counter_lzssno_factorization');
+		if (var_counter_lzssno_factorization === undefined) { need[1] |= 0x00800000; }
+	}
+	if (need[1] & (1 << 29)) {
+		if (cache) var_counter_lz77_factorization = result_cache_get(cache, text, 'counter_lz77_factorization');
+		if (var_counter_lz77_factorization === undefined) { need[1] |= 0x00400000; }
+	}
+	if (need[1] & (1 << 28)) {
+		if (cache) var_counter_lzss_factorization = result_cache_get(cache, text, 'counter_lzss_factorization');
+		if (var_counter_lzss_factorization === undefined) { need[1] |= 0x00200000; }
+	}
+	if (need[1] & (1 << 27)) {
+		if (cache) var_counter_lexparse_factorization = result_cache_get(cache, text, 'counter_lexparse_factorization');
+		if (var_counter_lexparse_factorization === undefined) { need[1] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 26)) {
+		if (cache) var_counter_necklace_factorization = result_cache_get(cache, text, 'counter_necklace_factorization');
+		if (var_counter_necklace_factorization === undefined) { need[1] |= 0x00008000; }
+	}
+	if (need[1] & (1 << 25)) {
+		if (cache) var_bbw_indices = result_cache_get(cache, text, 'bbw_indices');
+		if (var_bbw_indices === undefined) { need[1] |= 0x00004008; }
+	}
+	if (need[1] & (1 << 24)) {
+		if (cache) var_inverse_circular_suffix_array = result_cache_get(cache, text, 'inverse_circular_suffix_array');
+		if (var_inverse_circular_suffix_array === undefined) { need[1] |= 0x00004000; }
+	}
+	if (need[1] & (1 << 23)) {
+		if (cache) var_lzssno_factorization = result_cache_get(cache, text, 'lzssno_factorization');
+		if (var_lzssno_factorization === undefined) { need[1] |= 0x00002000; }
+	}
+	if (need[1] & (1 << 22)) {
+		if (cache) var_lz77_factorization = result_cache_get(cache, text, 'lz77_factorization');
+		if (var_lz77_factorization === undefined) { need[1] |= 0x00001000; }
+	}
+	if (need[1] & (1 << 21)) {
+		if (cache) var_lzss_factorization = result_cache_get(cache, text, 'lzss_factorization');
+		if (var_lzss_factorization === undefined) { need[1] |= 0x00001000; }
+	}
+	if (need[1] & (1 << 20)) {
+		if (cache) var_counter_delta_argmax = result_cache_get(cache, text, 'counter_delta_argmax');
+		if (var_counter_delta_argmax === undefined) { need[1] |= 0x00000800; }
+	}
+	if (need[1] & (1 << 19)) {
+		if (cache) var_counter_delta = result_cache_get(cache, text, 'counter_delta');
+		if (var_counter_delta === undefined) { need[1] |= 0x00000800; }
+	}
+	if (need[1] & (1 << 18)) {
+		if (cache) var_lexparse_factorization = result_cache_get(cache, text, 'lexparse_factorization');
+		if (var_lexparse_factorization === undefined) { need[1] |= 0x00000400; }
+	}
+	if (need[1] & (1 << 17)) {
+		if (cache) var_lyndon_array = result_cache_get(cache, text, 'lyndon_array');
+		if (var_lyndon_array === undefined) { need[1] |= 0x00000010; }
+	}
+	if (need[1] & (1 << 16)) {
+		if (cache) var_counter_lyndon_factorization = result_cache_get(cache, text, 'counter_lyndon_factorization');
+		if (var_counter_lyndon_factorization === undefined) { need[1] |= 0x00000008; }
+	}
+	if (need[1] & (1 << 15)) {
+		if (cache) var_necklace_factorization = result_cache_get(cache, text, 'necklace_factorization');
+		if (var_necklace_factorization === undefined) { need[1] |= 0x00000008; }
+	}
+	if (need[1] & (1 << 14)) {
+		if (cache) var_circular_suffix_array = result_cache_get(cache, text, 'circular_suffix_array');
+		if (var_circular_suffix_array === undefined) { need[1] |= 0x00000008; }
+	}
+	if (need[1] & (1 << 13)) {
+		if (cache) var_lpnf_array = result_cache_get(cache, text, 'lpnf_array');
+		if (var_lpnf_array === undefined) { need[0] |= 0x00040004; need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 12)) {
+		if (cache) var_lpf_array = result_cache_get(cache, text, 'lpf_array');
+		if (var_lpf_array === undefined) { need[0] |= 0x00000004; need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 11)) {
+		if (cache) var_substring_complexity = result_cache_get(cache, text, 'substring_complexity');
+		if (var_substring_complexity === undefined) { need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 10)) {
+		if (cache) var_plcp_array = result_cache_get(cache, text, 'plcp_array');
+		if (var_plcp_array === undefined) { need[0] |= 0x00040000; need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 9)) {
+		if (cache) var_counter_lcp_array = result_cache_get(cache, text, 'counter_lcp_array');
+		if (var_counter_lcp_array === undefined) { need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 8)) {
+		if (cache) var_counter_reverse_lzss_factorization = result_cache_get(cache, text, 'counter_reverse_lzss_factorization');
+		if (var_counter_reverse_lzss_factorization === undefined) { need[0] |= 0x00800000; }
+	}
+	if (need[1] & (1 << 7)) {
+		if (cache) var_counter_bw_transform = result_cache_get(cache, text, 'counter_bw_transform');
+		if (var_counter_bw_transform === undefined) { need[0] |= 0x00400000; }
+	}
+	if (need[1] & (1 << 6)) {
+		if (cache) var_lf_array = result_cache_get(cache, text, 'lf_array');
+		if (var_lf_array === undefined) { need[0] |= 0x00400010; }
+	}
+	if (need[1] & (1 << 5)) {
+		if (cache) var_pss_array = result_cache_get(cache, text, 'pss_array');
+		if (var_pss_array === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 4)) {
+		if (cache) var_nss_array = result_cache_get(cache, text, 'nss_array');
+		if (var_nss_array === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 3)) {
+		if (cache) var_lyndon_factorization = result_cache_get(cache, text, 'lyndon_factorization');
+		if (var_lyndon_factorization === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 2)) {
+		if (cache) var_psi_array = result_cache_get(cache, text, 'psi_array');
+		if (var_psi_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[1] & (1 << 1)) {
+		if (cache) var_lcp_array = result_cache_get(cache, text, 'lcp_array');
+		if (var_lcp_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[1] & (1 << 0)) {
+		if (cache) var_inverse_phi_array = result_cache_get(cache, text, 'inverse_phi_array');
+		if (var_inverse_phi_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[0] & (1 << 31)) {
+		if (cache) var_phi_array = result_cache_get(cache, text, 'phi_array');
+		if (var_phi_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[0] & (1 << 30)) {
+		if (cache) var_counter_gamma_factorization = result_cache_get(cache, text, 'counter_gamma_factorization');
+		if (var_counter_gamma_factorization === undefined) { need[0] |= 0x00020000; }
+	}
+	if (need[0] & (1 << 29)) {
+		if (cache) var_counter_lzend_factorization = result_cache_get(cache, text, 'counter_lzend_factorization');
+		if (var_counter_lzend_factorization === undefined) { need[0] |= 0x00010000; }
+	}
+	if (need[0] & (1 << 28)) {
+		if (cache) var_counter_lzw_factorization = result_cache_get(cache, text, 'counter_lzw_factorization');
+		if (var_counter_lzw_factorization === undefined) { need[0] |= 0x00002000; }
+	}
+	if (need[0] & (1 << 27)) {
+		if (cache) var_counter_lz78_factorization = result_cache_get(cache, text, 'counter_lz78_factorization');
+		if (var_counter_lz78_factorization === undefined) { need[0] |= 0x00001000; }
+	}
+	if (need[0] & (1 << 26)) {
+		if (cache) var_counter_revert_transform = result_cache_get(cache, text, 'counter_revert_transform');
+		if (var_counter_revert_transform === undefined) { need[0] |= 0x00000800; }
+	}
+	if (need[0] & (1 << 25)) {
+		if (cache) var_counter_invert_transform = result_cache_get(cache, text, 'counter_invert_transform');
+		if (var_counter_invert_transform === undefined) { need[0] |= 0x00000400; }
+	}
+	if (need[0] & (1 << 24)) {
+		if (cache) var_counter_necklace_conjugate_transform = result_cache_get(cache, text, 'counter_necklace_conjugate_transform');
+		if (var_counter_necklace_conjugate_transform === undefined) { need[0] |= 0x00000200; }
+	}
+	if (need[0] & (1 << 23)) {
+		if (cache) var_reverse_lzss_factorization = result_cache_get(cache, text, 'reverse_lzss_factorization');
+		if (var_reverse_lzss_factorization === undefined) { need[0] |= 0x00000100; }
+	}
+	if (need[0] & (1 << 22)) {
+		if (cache) var_bw_transform = result_cache_get(cache, text, 'bw_transform');
+		if (var_bw_transform === undefined) { need[0] |= 0x00000040; }
+	}
+	if (need[0] & (1 << 21)) {
+		if (cache) var_counter_regularity = result_cache_get(cache, text, 'counter_regularity');
+		if (var_counter_regularity === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 20)) {
+		if (cache) var_counter_exponent = result_cache_get(cache, text, 'counter_exponent');
+		if (var_counter_exponent === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 19)) {
+		if (cache) var_counter_period = result_cache_get(cache, text, 'counter_period');
+		if (var_counter_period === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 18)) {
+		if (cache) var_inverse_suffix_array = result_cache_get(cache, text, 'inverse_suffix_array');
+		if (var_inverse_suffix_array === undefined) { need[0] |= 0x00000004; }
+	}
+	if (need[0] & (1 << 17)) {
+		if (cache) var_gamma_factorization = result_cache_get(cache, text, 'gamma_factorization');
+	}
+	if (need[0] & (1 << 16)) {
+		if (cache) var_lzend_factorization = result_cache_get(cache, text, 'lzend_factorization');
+	}
+	if (need[0] & (1 << 15)) {
+		if (cache) var_even_maximal_palindromic_length_array = result_cache_get(cache, text, 'even_maximal_palindromic_length_array');
+	}
+	if (need[0] & (1 << 14)) {
+		if (cache) var_odd_maximal_palindromic_length_array = result_cache_get(cache, text, 'odd_maximal_palindromic_length_array');
+	}
+	if (need[0] & (1 << 13)) {
+		if (cache) var_lzw_factorization = result_cache_get(cache, text, 'lzw_factorization');
+	}
+	if (need[0] & (1 << 12)) {
+		if (cache) var_lz78_factorization = result_cache_get(cache, text, 'lz78_factorization');
+	}
+	if (need[0] & (1 << 11)) {
+		if (cache) var_revert_transform = result_cache_get(cache, text, 'revert_transform');
+	}
+	if (need[0] & (1 << 10)) {
+		if (cache) var_invert_transform = result_cache_get(cache, text, 'invert_transform');
+	}
+	if (need[0] & (1 << 9)) {
+		if (cache) var_necklace_conjugate_transform = result_cache_get(cache, text, 'necklace_conjugate_transform');
+	}
+	if (need[0] & (1 << 8)) {
+		if (cache) var_lnf_array = result_cache_get(cache, text, 'lnf_array');
+	}
+	if (need[0] & (1 << 7)) {
+		if (cache) var_sl_string = result_cache_get(cache, text, 'sl_string');
+	}
+	if (need[0] & (1 << 6)) {
+		if (cache) var_rotation_array = result_cache_get(cache, text, 'rotation_array');
+	}
+	if (need[0] & (1 << 5)) {
+		if (cache) var_index_array = result_cache_get(cache, text, 'index_array');
+	}
+	if (need[0] & (1 << 4)) {
+		if (cache) var_first_array = result_cache_get(cache, text, 'first_array');
+	}
+	if (need[0] & (1 << 3)) {
+		if (cache) var_border_array = result_cache_get(cache, text, 'border_array');
+	}
+	if (need[0] & (1 << 2)) {
+		if (cache) var_suffix_array = result_cache_get(cache, text, 'suffix_array');
+	}
+	if (need[0] & (1 << 1)) {
+		if (cache) var_counter_sigma = result_cache_get(cache, text, 'counter_sigma');
+	}
+	if (need[0] & (1 << 0)) {
+		if (cache) var_counter_n = result_cache_get(cache, text, 'counter_n');
+	}
+
+	// construction
+	var requested = flags === undefined ? need : flags;
+	var result = { counter_text: number_of_runs(var_text) };
+	if (on_result) on_result('counter_text', result.counter_text);
+	var start_time = 0, start_heap = 0;
+	if (need[0] & (1 << 0)) {
+		if (var_counter_n === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_n = count_n(var_text);
+			if (profile) profile_record(profile, 'counter_n', var_counter_n, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_n', var_counter_n);
+		}
+		if (requested[0] & (1 << 0)) {
+			result.counter_n = var_counter_n;
+			if (on_result) on_result('counter_n', var_counter_n);
+		}
+	}
+	if (need[0] & (1 << 1)) {
+		if (var_counter_sigma === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_sigma = count_sigma(var_text);
+			if (profile) profile_record(profile, 'counter_sigma', var_counter_sigma, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_sigma', var_counter_sigma);
+		}
+		if (requested[0] & (1 << 1)) {
+			result.counter_sigma = var_counter_sigma;
+			if (on_result) on_result('counter_sigma', var_counter_sigma);
+		}
+	}
+	if (need[0] & (1 << 2)) {
+		if (var_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_suffix_array = construct_suffix_array(var_text);
+			if (profile) profile_record(profile, 'suffix_array', var_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'suffix_array', var_suffix_array);
+		}
+		if (requested[0] & (1 << 2)) {
+			result.suffix_array = var_suffix_array;
+			if (on_result) on_result('suffix_array', var_suffix_array);
+		}
+	}
+	if (need[0] & (1 << 3)) {
+		if (var_border_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_border_array = construct_border_array(var_text);
+			if (profile) profile_record(profile, 'border_array', var_border_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'border_array', var_border_array);
+		}
+		if (requested[0] & (1 << 3)) {
+			result.border_array = var_border_array;
+			if (on_result) on_result('border_array', var_border_array);
+		}
+	}
+	if (need[0] & (1 << 4)) {
+		if (var_first_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_first_array = construct_first_array(var_text);
+			if (profile) profile_record(profile, 'first_array', var_first_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'first_array', var_first_array);
+		}
+		if (requested[0] & (1 << 4)) {
+			result.first_array = var_first_array;
+			if (on_result) on_result('first_array', var_first_array);
+		}
+	}
+	if (need[0] & (1 << 5)) {
+		if (var_index_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_index_array = construct_index_array(var_n);
+			if (profile) profile_record(profile, 'index_array', var_index_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'index_array', var_index_array);
+		}
+		if (requested[0] & (1 << 5)) {
+			result.index_array = var_index_array;
+			if (on_result) on_result('index_array', var_index_array);
+		}
+	}
+	if (need[0] & (1 << 6)) {
+		if (var_rotation_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_rotation_array = construct_rotation_array(var_text);
+			if (profile) profile_record(profile, 'rotation_array', var_rotation_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'rotation_array', var_rotation_array);
+		}
+		if (requested[0] & (1 << 6)) {
+			result.rotation_array = var_rotation_array;
+			if (on_result) on_result('rotation_array', var_rotation_array);
+		}
+	}
+	if (need[0] & (1 << 7)) {
+		if (var_sl_string === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_sl_string = construct_sl_string(var_text);
+			if (profile) profile_record(profile, 'sl_string', var_sl_string, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'sl_string', var_sl_string);
+		}
+		if (requested[0] & (1 << 7)) {
+			result.sl_string = var_sl_string;
+			if (on_result) on_result('sl_string', var_sl_string);
+		}
+	}
+	if (need[0] & (1 << 8)) {
+		if (var_lnf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lnf_array = construct_lnf_array(var_text);
+			if (profile) profile_record(profile, 'lnf_array', var_lnf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lnf_array', var_lnf_array);
+		}
+		if (requested[0] & (1 << 8)) {
+			result.lnf_array = var_lnf_array;
+			if (on_result) on_result('lnf_array', var_lnf_array);
+		}
+	}
+	if (need[0] & (1 << 9)) {
+		if (var_necklace_conjugate_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_necklace_conjugate_transform = construct_necklace_conjugate_transform(var_text);
+			if (profile) profile_record(profile, 'necklace_conjugate_transform', var_necklace_conjugate_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'necklace_conjugate_transform', var_necklace_conjugate_transform);
+		}
+		if (requested[0] & (1 << 9)) {
+			result.necklace_conjugate_transform = var_necklace_conjugate_transform;
+			if (on_result) on_result('necklace_conjugate_transform', var_necklace_conjugate_transform);
+		}
+	}
+	if (need[0] & (1 << 10)) {
+		if (var_invert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_invert_transform = construct_invert_transform(var_text);
+			if (profile) profile_record(profile, 'invert_transform', var_invert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'invert_transform', var_invert_transform);
+		}
+		if (requested[0] & (1 << 10)) {
+			result.invert_transform = var_invert_transform;
+			if (on_result) on_result('invert_transform', var_invert_transform);
+		}
+	}
+	if (need[0] & (1 << 11)) {
+		if (var_revert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_revert_transform = construct_revert_transform(var_text);
+			if (profile) profile_record(profile, 'revert_transform', var_revert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'revert_transform', var_revert_transform);
+		}
+		if (requested[0] & (1 << 11)) {
+			result.revert_transform = var_revert_transform;
+			if (on_result) on_result('revert_transform', var_revert_transform);
+		}
+	}
+	if (need[0] & (1 << 12)) {
+		if (var_lz78_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lz78_factorization = construct_lz78_factorization(var_text);
+			if (profile) profile_record(profile, 'lz78_factorization', var_lz78_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lz78_factorization', var_lz78_factorization);
+		}
+		if (requested[0] & (1 << 12)) {
+			result.lz78_factorization = var_lz78_factorization;
+			if (on_result) on_result('lz78_factorization', var_lz78_factorization);
+		}
+	}
+	if (need[0] & (1 << 13)) {
+		if (var_lzw_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzw_factorization = construct_lzw_factorization(var_text);
+			if (profile) profile_record(profile, 'lzw_factorization', var_lzw_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzw_factorization', var_lzw_factorization);
+		}
+		if (requested[0] & (1 << 13)) {
+			result.lzw_factorization = var_lzw_factorization;
+			if (on_result) on_result('lzw_factorization', var_lzw_factorization);
+		}
+	}
+	if (need[0] & (1 << 14)) {
+		if (var_odd_maximal_palindromic_length_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_odd_maximal_palindromic_length_array = construct_odd_maximal_palindromic_length_array(var_text);
+			if (profile) profile_record(profile, 'odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array);
+		}
+		if (requested[0] & (1 << 14)) {
+			result.odd_maximal_palindromic_length_array = var_odd_maximal_palindromic_length_array;
+			if (on_result) on_result('odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array);
+		}
+	}
+	if (need[0] & (1 << 15)) {
+		if (var_even_maximal_palindromic_length_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_even_maximal_palindromic_length_array = construct_even_maximal_palindromic_length_array(var_text);
+			if (profile) profile_record(profile, 'even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array);
+		}
+		if (requested[0] & (1 << 15)) {
+			result.even_maximal_palindromic_length_array = var_even_maximal_palindromic_length_array;
+			if (on_result) on_result('even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array);
+		}
+	}
+	if (need[0] & (1 << 16)) {
+		if (var_lzend_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzend_factorization = construct_lzend_factorization(var_text);
+			if (profile) profile_record(profile, 'lzend_factorization', var_lzend_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzend_factorization', var_lzend_factorization);
+		}
+		if (requested[0] & (1 << 16)) {
+			result.lzend_factorization = var_lzend_factorization;
+			if (on_result) on_result('lzend_factorization', var_lzend_factorization);
+		}
+	}
+	if (need[0] & (1 << 17)) {
+		if (var_gamma_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_gamma_factorization = construct_gamma_factorization(var_text);
+			if (profile) profile_record(profile, 'gamma_factorization', var_gamma_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'gamma_factorization', var_gamma_factorization);
+		}
+		if (requested[0] & (1 << 17)) {
+			result.gamma_factorization = var_gamma_factorization;
+			if (on_result) on_result('gamma_factorization', var_gamma_factorization);
+		}
+	}
+	if (need[0] & (1 << 18)) {
+		if (var_inverse_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_suffix_array = construct_inverse_suffix_array(var_suffix_array);
+			if (profile) profile_record(profile, 'inverse_suffix_array', var_inverse_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_suffix_array', var_inverse_suffix_array);
+		}
+		if (requested[0] & (1 << 18)) {
+			result.inverse_suffix_array = var_inverse_suffix_array;
+			if (on_result) on_result('inverse_suffix_array', var_inverse_suffix_array);
+		}
+		if (!((need[0] & (1 << 31)) || (need[1] & (1 << 0)) || (need[1] & (1 << 1)) || (need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+	}
+	if (need[0] & (1 << 19)) {
+		if (var_counter_period === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_period = count_period(var_border_array);
+			if (profile) profile_record(profile, 'counter_period', var_counter_period, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_period', var_counter_period);
+		}
+		if (requested[0] & (1 << 19)) {
+			result.counter_period = var_counter_period;
+			if (on_result) on_result('counter_period', var_counter_period);
+		}
+		if (!((need[0] & (1 << 20)) || (need[0] & (1 << 21)))) var_border_array = undefined;
+	}
+	if (need[0] & (1 << 20)) {
+		if (var_counter_exponent === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_exponent = count_exponent(var_border_array);
+			if (profile) profile_record(profile, 'counter_exponent', var_counter_exponent, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_exponent', var_counter_exponent);
+		}
+		if (requested[0] & (1 << 20)) {
+			result.counter_exponent = var_counter_exponent;
+			if (on_result) on_result('counter_exponent', var_counter_exponent);
+		}
+		if (!((need[0] & (1 << 21)))) var_border_array = undefined;
+	}
+	if (need[0] & (1 << 21)) {
+		if (var_counter_regularity === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_regularity = count_regularity(var_border_array);
+			if (profile) profile_record(profile, 'counter_regularity', var_counter_regularity, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_regularity', var_counter_regularity);
+		}
+		if (requested[0] & (1 << 21)) {
+			result.counter_regularity = var_counter_regularity;
+			if (on_result) on_result('counter_regularity', var_counter_regularity);
+		}
+		var_border_array = undefined;
+	}
+	if (need[0] & (1 << 22)) {
+		if (var_bw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bw_transform = construct_bw_transform(var_text, var_rotation_array);
+			if (profile) profile_record(profile, 'bw_transform', var_bw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bw_transform', var_bw_transform);
+		}
+		if (requested[0] & (1 << 22)) {
+			result.bw_transform = var_bw_transform;
+			if (on_result) on_result('bw_transform', var_bw_transform);
+		}
+		var_rotation_array = undefined;
+	}
+	if (need[0] & (1 << 23)) {
+		if (var_reverse_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_reverse_lzss_factorization = construct_reverse_lzss_factorization(var_lnf_array);
+			if (profile) profile_record(profile, 'reverse_lzss_factorization', var_reverse_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'reverse_lzss_factorization', var_reverse_lzss_factorization);
+		}
+		if (requested[0] & (1 << 23)) {
+			result.reverse_lzss_factorization = var_reverse_lzss_factorization;
+			if (on_result) on_result('reverse_lzss_factorization', var_reverse_lzss_factorization);
+		}
+		var_lnf_array = undefined;
+	}
+	if (need[0] & (1 << 24)) {
+		if (var_counter_necklace_conjugate_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_necklace_conjugate_transform = number_of_runs(var_necklace_conjugate_transform);
+			if (profile) profile_record(profile, 'counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform);
+		}
+		if (requested[0] & (1 << 24)) {
+			result.counter_necklace_conjugate_transform = var_counter_necklace_conjugate_transform;
+			if (on_result) on_result('counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform);
+		}
+		var_necklace_conjugate_transform = undefined;
+	}
+	if (need[0] & (1 << 25)) {
+		if (var_counter_invert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_invert_transform = number_of_runs(var_invert_transform);
+			if (profile) profile_record(profile, 'counter_invert_transform', var_counter_invert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_invert_transform', var_counter_invert_transform);
+		}
+		if (requested[0] & (1 << 25)) {
+			result.counter_invert_transform = var_counter_invert_transform;
+			if (on_result) on_result('counter_invert_transform', var_counter_invert_transform);
+		}
+		var_invert_transform = undefined;
+	}
+	if (need[0] & (1 << 26)) {
+		if (var_counter_revert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_revert_transform = number_of_runs(var_revert_transform);
+			if (profile) profile_record(profile, 'counter_revert_transform', var_counter_revert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_revert_transform', var_counter_revert_transform);
+		}
+		if (requested[0] & (1 << 26)) {
+			result.counter_revert_transform = var_counter_revert_transform;
+			if (on_result) on_result('counter_revert_transform', var_counter_revert_transform);
+		}
+		var_revert_transform = undefined;
+	}
+	if (need[0] & (1 << 27)) {
+		if (var_counter_lz78_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lz78_factorization = number_of_factors(var_lz78_factorization);
+			if (profile) profile_record(profile, 'counter_lz78_factorization', var_counter_lz78_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lz78_factorization', var_counter_lz78_factorization);
+		}
+		if (requested[0] & (1 << 27)) {
+			result.counter_lz78_factorization = var_counter_lz78_factorization;
+			if (on_result) on_result('counter_lz78_factorization', var_counter_lz78_factorization);
+		}
+		var_lz78_factorization = undefined;
+	}
+	if (need[0] & (1 << 28)) {
+		if (var_counter_lzw_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzw_factorization = number_of_factors(var_lzw_factorization);
+			if (profile) profile_record(profile, 'counter_lzw_factorization', var_counter_lzw_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzw_factorization', var_counter_lzw_factorization);
+		}
+		if (requested[0] & (1 << 28)) {
+			result.counter_lzw_factorization = var_counter_lzw_factorization;
+			if (on_result) on_result('counter_lzw_factorization', var_counter_lzw_factorization);
+		}
+		var_lzw_factorization = undefined;
+	}
+	if (need[0] & (1 << 29)) {
+		if (var_counter_lzend_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzend_factorization = number_of_factors(var_lzend_factorization);
+			if (profile) profile_record(profile, 'counter_lzend_factorization', var_counter_lzend_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzend_factorization', var_counter_lzend_factorization);
+		}
+		if (requested[0] & (1 << 29)) {
+			result.counter_lzend_factorization = var_counter_lzend_factorization;
+			if (on_result) on_result('counter_lzend_factorization', var_counter_lzend_factorization);
+		}
+		var_lzend_factorization = undefined;
+	}
+	if (need[0] & (1 << 30)) {
+		if (var_counter_gamma_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_gamma_factorization = number_of_factors(var_gamma_factorization);
+			if (profile) profile_record(profile, 'counter_gamma_factorization', var_counter_gamma_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_gamma_factorization', var_counter_gamma_factorization);
+		}
+		if (requested[0] & (1 << 30)) {
+			result.counter_gamma_factorization = var_counter_gamma_factorization;
+			if (on_result) on_result('counter_gamma_factorization', var_counter_gamma_factorization);
+		}
+		var_gamma_factorization = undefined;
+	}
+	if (need[0] & (1 << 31)) {
+		if (var_phi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_phi_array = construct_phi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'phi_array', var_phi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'phi_array', var_phi_array);
+		}
+		if (requested[0] & (1 << 31)) {
+			result.phi_array = var_phi_array;
+			if (on_result) on_result('phi_array', var_phi_array);
+		}
+		if (!((need[1] & (1 << 0)) || (need[1] & (1 << 1)) || (need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 0)) || (need[1] & (1 << 1)) || (need[1] & (1 << 10)) || (need[1] & (1 << 2)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 0)) {
+		if (var_inverse_phi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_phi_array = construct_inverse_phi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'inverse_phi_array', var_inverse_phi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_phi_array', var_inverse_phi_array);
+		}
+		if (requested[1] & (1 << 0)) {
+			result.inverse_phi_array = var_inverse_phi_array;
+			if (on_result) on_result('inverse_phi_array', var_inverse_phi_array);
+		}
+		if (!((need[1] & (1 << 1)) || (need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 1)) || (need[1] & (1 << 10)) || (need[1] & (1 << 2)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 1)) {
+		if (var_lcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lcp_array = construct_lcp_array(var_text, var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'lcp_array', var_lcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lcp_array', var_lcp_array);
+		}
+		if (requested[1] & (1 << 1)) {
+			result.lcp_array = var_lcp_array;
+			if (on_result) on_result('lcp_array', var_lcp_array);
+		}
+		if (!((need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 2)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 2)) {
+		if (var_psi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_psi_array = construct_psi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'psi_array', var_psi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'psi_array', var_psi_array);
+		}
+		if (requested[1] & (1 << 2)) {
+			result.psi_array = var_psi_array;
+			if (on_result) on_result('psi_array', var_psi_array);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 3)) {
+		if (var_lyndon_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lyndon_factorization = construct_lyndon_factorization(var_text, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'lyndon_factorization', var_lyndon_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lyndon_factorization', var_lyndon_factorization);
+		}
+		if (requested[1] & (1 << 3)) {
+			result.lyndon_factorization = var_lyndon_factorization;
+			if (on_result) on_result('lyndon_factorization', var_lyndon_factorization);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 4)) {
+		if (var_nss_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_nss_array = construct_nss_array(var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'nss_array', var_nss_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'nss_array', var_nss_array);
+		}
+		if (requested[1] & (1 << 4)) {
+			result.nss_array = var_nss_array;
+			if (on_result) on_result('nss_array', var_nss_array);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 13)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 5)) {
+		if (var_pss_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_pss_array = construct_pss_array(var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'pss_array', var_pss_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'pss_array', var_pss_array);
+		}
+		if (requested[1] & (1 << 5)) {
+			result.pss_array = var_pss_array;
+			if (on_result) on_result('pss_array', var_pss_array);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 13)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 6)) {
+		if (var_lf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lf_array = construct_lf_array(var_first_array, var_bw_transform);
+			if (profile) profile_record(profile, 'lf_array', var_lf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lf_array', var_lf_array);
+		}
+		if (requested[1] & (1 << 6)) {
+			result.lf_array = var_lf_array;
+			if (on_result) on_result('lf_array', var_lf_array);
+		}
+		var_first_array = undefined;
+		if (!((need[1] & (1 << 7)))) var_bw_transform = undefined;
+	}
+	if (need[1] & (1 << 7)) {
+		if (var_counter_bw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_bw_transform = number_of_runs(var_bw_transform);
+			if (profile) profile_record(profile, 'counter_bw_transform', var_counter_bw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_bw_transform', var_counter_bw_transform);
+		}
+		if (requested[1] & (1 << 7)) {
+			result.counter_bw_transform = var_counter_bw_transform;
+			if (on_result) on_result('counter_bw_transform', var_counter_bw_transform);
+		}
+		var_bw_transform = undefined;
+	}
+	if (need[1] & (1 << 8)) {
+		if (var_counter_reverse_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_reverse_lzss_factorization = number_of_factors(var_reverse_lzss_factorization);
+			if (profile) profile_record(profile, 'counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization);
+		}
+		if (requested[1] & (1 << 8)) {
+			result.counter_reverse_lzss_factorization = var_counter_reverse_lzss_factorization;
+			if (on_result) on_result('counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization);
+		}
+		var_reverse_lzss_factorization = undefined;
+	}
+	if (need[1] & (1 << 9)) {
+		if (var_counter_lcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lcp_array = count_lcp_array(var_lcp_array);
+			if (profile) profile_record(profile, 'counter_lcp_array', var_counter_lcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lcp_array', var_counter_lcp_array);
+		}
+		if (requested[1] & (1 << 9)) {
+			result.counter_lcp_array = var_counter_lcp_array;
+			if (on_result) on_result('counter_lcp_array', var_counter_lcp_array);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 11)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 10)) {
+		if (var_plcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_plcp_array = construct_plcp_array(var_inverse_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'plcp_array', var_plcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'plcp_array', var_plcp_array);
+		}
+		if (requested[1] & (1 << 10)) {
+			result.plcp_array = var_plcp_array;
+			if (on_result) on_result('plcp_array', var_plcp_array);
+		}
+		if (!((need[1] & (1 << 13)))) var_inverse_suffix_array = undefined;
+		if (!((need[1] & (1 << 11)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 11)) {
+		if (var_substring_complexity === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_substring_complexity = construct_substring_complexity(var_lcp_array);
+			if (profile) profile_record(profile, 'substring_complexity', var_substring_complexity, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'substring_complexity', var_substring_complexity);
+		}
+		if (requested[1] & (1 << 11)) {
+			result.substring_complexity = var_substring_complexity;
+			if (on_result) on_result('substring_complexity', var_substring_complexity);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 12)) {
+		if (var_lpf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lpf_array = construct_lpf_array(var_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'lpf_array', var_lpf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lpf_array', var_lpf_array);
+		}
+		if (requested[1] & (1 << 12)) {
+			result.lpf_array = var_lpf_array;
+			if (on_result) on_result('lpf_array', var_lpf_array);
+		}
+		if (!((need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 13)) {
+		if (var_lpnf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lpnf_array = construct_lpnf_array(var_suffix_array, var_inverse_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'lpnf_array', var_lpnf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lpnf_array', var_lpnf_array);
+		}
+		if (requested[1] & (1 << 13)) {
+			result.lpnf_array = var_lpnf_array;
+			if (on_result) on_result('lpnf_array', var_lpnf_array);
+		}
+		var_suffix_array = undefined;
+		var_inverse_suffix_array = undefined;
+		var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 14)) {
+		if (var_circular_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_circular_suffix_array = construct_circular_suffix_array(var_text, var_lyndon_factorization);
+			if (profile) profile_record(profile, 'circular_suffix_array', var_circular_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'circular_suffix_array', var_circular_suffix_array);
+		}
+		if (requested[1] & (1 << 14)) {
+			result.circular_suffix_array = var_circular_suffix_array;
+			if (on_result) on_result('circular_suffix_array', var_circular_suffix_array);
+		}
+		if (!((need[1] & (1 << 25)) || (need[1] & (1 << 15)) || (need[1] & (1 << 16)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 15)) {
+		if (var_necklace_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_necklace_factorization = construct_necklace_factorization(var_text, var_lyndon_factorization);
+			if (profile) profile_record(profile, 'necklace_factorization', var_necklace_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'necklace_factorization', var_necklace_factorization);
+		}
+		if (requested[1] & (1 << 15)) {
+			result.necklace_factorization = var_necklace_factorization;
+			if (on_result) on_result('necklace_factorization', var_necklace_factorization);
+		}
+		if (!((need[1] & (1 << 25)) || (need[1] & (1 << 16)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 16)) {
+		if (var_counter_lyndon_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lyndon_factorization = number_of_factors(var_lyndon_factorization);
+			if (profile) profile_record(profile, 'counter_lyndon_factorization', var_counter_lyndon_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lyndon_factorization', var_counter_lyndon_factorization);
+		}
+		if (requested[1] & (1 << 16)) {
+			result.counter_lyndon_factorization = var_counter_lyndon_factorization;
+			if (on_result) on_result('counter_lyndon_factorization', var_counter_lyndon_factorization);
+		}
+		if (!((need[1] & (1 << 25)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 17)) {
+		if (var_lyndon_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lyndon_array = construct_lyndon_array(var_nss_array);
+			if (profile) profile_record(profile, 'lyndon_array', var_lyndon_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lyndon_array', var_lyndon_array);
+		}
+		if (requested[1] & (1 << 17)) {
+			result.lyndon_array = var_lyndon_array;
+			if (on_result) on_result('lyndon_array', var_lyndon_array);
+		}
+		var_nss_array = undefined;
+	}
+	if (need[1] & (1 << 18)) {
+		if (var_lexparse_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lexparse_factorization = construct_lexparse_factorization(var_plcp_array);
+			if (profile) profile_record(profile, 'lexparse_factorization', var_lexparse_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lexparse_factorization', var_lexparse_factorization);
+		}
+		if (requested[1] & (1 << 18)) {
+			result.lexparse_factorization = var_lexparse_factorization;
+			if (on_result) on_result('lexparse_factorization', var_lexparse_factorization);
+		}
+		var_plcp_array = undefined;
+	}
+	if (need[1] & (1 << 19)) {
+		if (var_counter_delta === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_delta = count_delta(var_substring_complexity);
+			if (profile) profile_record(profile, 'counter_delta', var_counter_delta, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_delta', var_counter_delta);
+		}
+		if (requested[1] & (1 << 19)) {
+			result.counter_delta = var_counter_delta;
+			if (on_result) on_result('counter_delta', var_counter_delta);
+		}
+		if (!((need[1] & (1 << 20)))) var_substring_complexity = undefined;
+	}
+	if (need[1] & (1 << 20)) {
+		if (var_counter_delta_argmax === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_delta_argmax = count_delta_argmax(var_substring_complexity);
+			if (profile) profile_record(profile, 'counter_delta_argmax', var_counter_delta_argmax, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_delta_argmax', var_counter_delta_argmax);
+		}
+		if (requested[1] & (1 << 20)) {
+			result.counter_delta_argmax = var_counter_delta_argmax;
+			if (on_result) on_result('counter_delta_argmax', var_counter_delta_argmax);
+		}
+		var_substring_complexity = undefined;
+	}
+	if (need[1] & (1 << 21)) {
+		if (var_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzss_factorization = construct_lzss_factorization(var_lpf_array);
+			if (profile) profile_record(profile, 'lzss_factorization', var_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzss_factorization', var_lzss_factorization);
+		}
+		if (requested[1] & (1 << 21)) {
+			result.lzss_factorization = var_lzss_factorization;
+			if (on_result) on_result('lzss_factorization', var_lzss_factorization);
+		}
+		if (!((need[1] & (1 << 22)))) var_lpf_array = undefined;
+	}
+	if (need[1] & (1 << 22)) {
+		if (var_lz77_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lz77_factorization = construct_lz77_factorization(var_lpf_array);
+			if (profile) profile_record(profile, 'lz77_factorization', var_lz77_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lz77_factorization', var_lz77_factorization);
+		}
+		if (requested[1] & (1 << 22)) {
+			result.lz77_factorization = var_lz77_factorization;
+			if (on_result) on_result('lz77_factorization', var_lz77_factorization);
+		}
+		var_lpf_array = undefined;
+	}
+	if (need[1] & (1 << 23)) {
+		if (var_lzssno_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzssno_factorization = construct_lzssno_factorization(var_lpnf_array);
+			if (profile) profile_record(profile, 'lzssno_factorization', var_lzssno_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzssno_factorization', var_lzssno_factorization);
+		}
+		if (requested[1] & (1 << 23)) {
+			result.lzssno_factorization = var_lzssno_factorization;
+			if (on_result) on_result('lzssno_factorization', var_lzssno_factorization);
+		}
+		var_lpnf_array = undefined;
+	}
+	if (need[1] & (1 << 24)) {
+		if (var_inverse_circular_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_circular_suffix_array = construct_inverse_circular_suffix_array(var_circular_suffix_array);
+			if (profile) profile_record(profile, 'inverse_circular_suffix_array', var_inverse_circular_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_circular_suffix_array', var_inverse_circular_suffix_array);
+		}
+		if (requested[1] & (1 << 24)) {
+			result.inverse_circular_suffix_array = var_inverse_circular_suffix_array;
+			if (on_result) on_result('inverse_circular_suffix_array', var_inverse_circular_suffix_array);
+		}
+		if (!((need[1] & (1 << 25)))) var_circular_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 25)) {
+		if (var_bbw_indices === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bbw_indices = construct_bbw_indices(var_lyndon_factorization, var_circular_suffix_array);
+			if (profile) profile_record(profile, 'bbw_indices', var_bbw_indices, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bbw_indices', var_bbw_indices);
+		}
+		if (requested[1] & (1 << 25)) {
+			result.bbw_indices = var_bbw_indices;
+			if (on_result) on_result('bbw_indices', var_bbw_indices);
+		}
+		var_lyndon_factorization = undefined;
+		var_circular_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 26)) {
+		if (var_counter_necklace_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_necklace_factorization = number_of_factors(var_necklace_factorization);
+			if (profile) profile_record(profile, 'counter_necklace_factorization', var_counter_necklace_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_necklace_factorization', var_counter_necklace_factorization);
+		}
+		if (requested[1] & (1 << 26)) {
+			result.counter_necklace_factorization = var_counter_necklace_factorization;
+			if (on_result) on_result('counter_necklace_factorization', var_counter_necklace_factorization);
+		}
+		var_necklace_factorization = undefined;
+	}
+	if (need[1] & (1 << 27)) {
+		if (var_counter_lexparse_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lexparse_factorization = number_of_factors(var_lexparse_factorization);
+			if (profile) profile_record(profile, 'counter_lexparse_factorization', var_counter_lexparse_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lexparse_factorization', var_counter_lexparse_factorization);
+		}
+		if (requested[1] & (1 << 27)) {
+			result.counter_lexparse_factorization = var_counter_lexparse_factorization;
+			if (on_result) on_result('counter_lexparse_factorization', var_counter_lexparse_factorization);
+		}
+		var_lexparse_factorization = undefined;
+	}
+	if (need[1] & (1 << 28)) {
+		if (var_counter_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzss_factorization = number_of_factors(var_lzss_factorization);
+			if (profile) profile_record(profile, 'counter_lzss_factorization', var_counter_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzss_factorization', var_counter_lzss_factorization);
+		}
+		if (requested[1] & (1 << 28)) {
+			result.counter_lzss_factorization = var_counter_lzss_factorization;
+			if (on_result) on_result('counter_lzss_factorization', var_counter_lzss_factorization);
+		}
+		var_lzss_factorization = undefined;
+	}
+	if (need[1] & (1 << 29)) {
+		if (var_counter_lz77_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lz77_factorization = number_of_factors(var_lz77_factorization);
+			if (profile) profile_record(profile, 'counter_lz77_factorization', var_counter_lz77_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lz77_factorization', var_counter_lz77_factorization);
+		}
+		if (requested[1] & (1 << 29)) {
+			result.counter_lz77_factorization = var_counter_lz77_factorization;
+			if (on_result) on_result('counter_lz77_factorization', var_counter_lz77_factorization);
+		}
+		var_lz77_factorization = undefined;
+	}
+	if (need[1] & (1 << 30)) {
+		if (var_counter_lzssno_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzssno_factorization = number_of_factors(var_lzssno_factorization);
+			if (profile) profile_record(profile, 'counter_lzssno_factorization', var_counter_lzssno_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzssno_factorization', var_counter_lzssno_factorization);
+		}
+		if (requested[1] & (1 << 30)) {
+			result.counter_lzssno_factorization = var_counter_lzssno_factorization;
+			if (on_result) on_result('counter_lzssno_factorization', var_counter_lzssno_factorization);
+		}
+		var_lzssno_factorization = undefined;
+	}
+	if (need[1] & (1 << 31)) {
+		if (var_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bbw_transform = construct_bbw_transform(var_text, var_bbw_indices);
+			if (profile) profile_record(profile, 'bbw_transform', var_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bbw_transform', var_bbw_transform);
+		}
+		if (requested[1] & (1 << 31)) {
+			result.bbw_transform = var_bbw_transform;
+			if (on_result) on_result('bbw_transform', var_bbw_transform);
+		}
+		var_bbw_indices = undefined;
+	}
+	if (need[2] & (1 << 0)) {
+		if (var_inverse_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_bbw_transform = construct_inverse_bbw_transform(var_bbw_transform);
+			if (profile) profile_record(profile, 'inverse_bbw_transform', var_inverse_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_bbw_transform', var_inverse_bbw_transform);
+		}
+		if (requested[2] & (1 << 0)) {
+			result.inverse_bbw_transform = var_inverse_bbw_transform;
+			if (on_result) on_result('inverse_bbw_transform', var_inverse_bbw_transform);
+		}
+		if (!((need[2] & (1 << 1)))) var_bbw_transform = undefined;
+	}
+	if (need[2] & (1 << 1)) {
+		if (var_counter_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_bbw_transform = number_of_runs(var_bbw_transform);
+			if (profile) profile_record(profile, 'counter_bbw_transform', var_counter_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_bbw_transform', var_counter_bbw_transform);
+		}
+		if (requested[2] & (1 << 1)) {
+			result.counter_bbw_transform = var_counter_bbw_transform;
+			if (on_result) on_result('counter_bbw_transform', var_counter_bbw_transform);
+		}
+		var_bbw_transform = undefined;
+	}
+	if (need[2] & (1 << 2)) {
+		if (var_counter_inverse_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_inverse_bbw_transform = number_of_runs(var_inverse_bbw_transform);
+			if (profile) profile_record(profile, 'counter_inverse_bbw_transform', var_counter_inverse_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_inverse_bbw_transform', var_counter_inverse_bbw_transform);
+		}
+		if (requested[2] & (1 << 2)) {
+			result.counter_inverse_bbw_transform = var_counter_inverse_bbw_transform;
+			if (on_result) on_result('counter_inverse_bbw_transform', var_counter_inverse_bbw_transform);
+		}
+		var_inverse_bbw_transform = undefined;
+	}
+	return result;
+}
@@ -0,0 +1 @@
+const citations = {};
\ No newline at end of file
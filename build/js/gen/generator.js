@@ -0,0 +1,422 @@
+"use strict";
+function assert_eq(a, b, message) {
+    let equal = false;
+    if (Array.isArray(a) && Array.isArray(b)) {
+        equal = a.length === b.length && a.every((v, i)=>v === b[i]);
+    } else {
+        equal = a === b;
+    }
+    if (!equal) {
+        const aStr = Array.isArray(a) ? `[${a}]` : a;
+        const bStr = Array.isArray(b) ? `[${b}]` : b;
+        throw new Error(`Assertion Failed: ${message}. Expected "${bStr}", but got "${aStr}"`);
+    }
+}
+function create_morphism(images, start, coding) {
+    const table = [];
+    for(const letter in images){
+        table[letter.charCodeAt(0)] = Uint16Array.from(images[letter].split(''), (c)=>c.charCodeAt(0));
+    }
+    let coding_table = null;
+    if (coding) {
+        coding_table = [];
+        for(const letter in coding)coding_table[letter.charCodeAt(0)] = coding[letter].charCodeAt(0);
+    }
+    let first = start.charCodeAt(0);
+    let prolongable = 0;
+    while(table[first][0] != first && prolongable < table.length){
+        first = table[first][0];
+        ++prolongable;
+    }
+    return {
+        images: table,
+        coding: coding_table,
+        orders: [
+            Uint16Array.of(start.charCodeAt(0))
+        ],
+        prolongable: prolongable
+    };
+}
+function morphism_expand(m, word, limit) {
+    const images = m.images;
+    let length = 0;
+    let end = 0;
+    while(end < word.length && length < limit)length += images[word[end++]].length;
+    const result = new Uint16Array(Math.min(length, limit));
+    let pos = 0;
+    for(let i = 0; i < end; ++i){
+        const image = images[word[i]];
+        for(let j = 0; j < image.length && pos < result.length; ++j)result[pos++] = image[j];
+    }
+    return result;
+}
+function morphism_order(m, k) {
+    const orders = m.orders;
+    while(orders.length <= k)orders.push(morphism_expand(m, orders[orders.length - 1], Infinity));
+    return orders[Math.max(0, k)];
+}
+function morphism_prefix(m, length) {
+    morphism_order(m, m.prolongable);
+    const orders = m.orders;
+    for(let k = m.prolongable; k < orders.length; ++k){
+        if (orders[k].length >= length) return orders[k].subarray(0, Math.max(0, length));
+    }
+    let word = orders[orders.length - 1];
+    for(let stalled = 0; word.length < length && stalled < m.images.length;){
+        const next = morphism_expand(m, word, length);
+        stalled = next.length > word.length ? 0 : stalled + 1;
+        word = next;
+    }
+    return word;
+}
+function units_to_string(units, coding) {
+    if (coding) {
+        const coded = new Uint16Array(units.length);
+        for(let i = 0; i < units.length; ++i)coded[i] = coding[units[i]];
+        units = coded;
+    }
+    const chunks = [];
+    for(let i = 0; i < units.length; i += 1 << 14){
+        chunks.push(String.fromCharCode.apply(null, units.subarray(i, i + (1 << 14))));
+    }
+    return chunks.join('');
+}
+function morphic_word(m, k) {
+    return units_to_string(morphism_order(m, k), m.coding);
+}
+function morphic_prefix(m, length) {
+    return units_to_string(morphism_prefix(m, length), m.coding);
+}
+const FIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'a'
+}, 'b');
+function generate_fibonacci_word(k) {
+    return morphic_word(FIBONACCI_MORPHISM, k);
+}
+function prefix_fibonacci_word(length) {
+    return morphic_prefix(FIBONACCI_MORPHISM, length);
+}
+export function test_fibonacci_word() {
+    assert_eq(generate_fibonacci_word(0), "b", "Fibonacci Word 0");
+    assert_eq(generate_fibonacci_word(1), "a", "Fibonacci Word 1");
+    assert_eq(generate_fibonacci_word(2), "ab", "Fibonacci Word 2");
+    assert_eq(generate_fibonacci_word(3), "aba", "Fibonacci Word 3");
+    assert_eq(generate_fibonacci_word(4), "abaab", "Fibonacci Word 4");
+    assert_eq(generate_fibonacci_word(5), "abaababa", "Fibonacci Word 5");
+    assert_eq(generate_fibonacci_word(6), "abaababaabaab", "Fibonacci Word 6");
+}
+const TRIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'a'
+}, 'a');
+function generate_tribonacci_word(k) {
+    return morphic_word(TRIBONACCI_MORPHISM, k);
+}
+function prefix_tribonacci_word(length) {
+    return morphic_prefix(TRIBONACCI_MORPHISM, length);
+}
+export function test_tribonacci_word() {
+    assert_eq(generate_tribonacci_word(0), "a", "Tribonacci Word 0");
+    assert_eq(generate_tribonacci_word(1), "ab", "Tribonacci Word 1");
+    assert_eq(generate_tribonacci_word(2), "abac", "Tribonacci Word 2");
+    assert_eq(generate_tribonacci_word(3), "abacaba", "Tribonacci Word 3");
+    assert_eq(generate_tribonacci_word(4), "abacabaabacab", "Tribonacci Word 4");
+    assert_eq(generate_tribonacci_word(5), "abacabaabacababacabaabac", "Tribonacci Word 5");
+    assert_eq(generate_tribonacci_word(6), "abacabaabacababacabaabacabacabaabacababacaba", "Tribonacci Word 6");
+}
+const THUE_MORSE_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ba'
+}, 'a');
+function generate_thue_morse_word(k) {
+    return morphic_word(THUE_MORSE_MORPHISM, k);
+}
+function prefix_thue_morse_word(length) {
+    return morphic_prefix(THUE_MORSE_MORPHISM, length);
+}
+export function test_thue_morse_word() {
+    assert_eq(generate_thue_morse_word(0), "a", "Thue-Morse Word 0");
+    assert_eq(generate_thue_morse_word(1), "ab", "Thue-Morse Word 1");
+    assert_eq(generate_thue_morse_word(2), "abba", "Thue-Morse Word 2");
+    assert_eq(generate_thue_morse_word(3), "abbabaab", "Thue-Morse Word 3");
+    assert_eq(generate_thue_morse_word(4), "abbabaabbaababba", "Thue-Morse Word 4");
+}
+const MEPHISTO_WALTZ_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'bba'
+}, 'a');
+function generate_mephisto_waltz_word(k) {
+    return morphic_word(MEPHISTO_WALTZ_MORPHISM, k);
+}
+function prefix_mephisto_waltz_word(length) {
+    return morphic_prefix(MEPHISTO_WALTZ_MORPHISM, length);
+}
+export function test_mephisto_waltz_word() {
+    assert_eq(generate_mephisto_waltz_word(0), "a", "Mephisto-Waltz Word 0");
+    assert_eq(generate_mephisto_waltz_word(1), "aab", "Mephisto-Waltz Word 1");
+    assert_eq(generate_mephisto_waltz_word(2), "aabaabbba", "Mephisto-Waltz Word 2");
+    assert_eq(generate_mephisto_waltz_word(3), "aabaabbbaaabaabbbabbabbaaab", "Mephisto-Waltz Word 3");
+    assert_eq(generate_mephisto_waltz_word(4), "aabaabbbaaabaabbbabbabbaaabaabaabbbaaabaabbbabbabbaaabbbabbaaabbbabbaaabaabaabbba", "Mephisto-Waltz Word 4");
+}
+const VTM_MORPHISM = create_morphism({
+    a: 'abc',
+    b: 'ac',
+    c: 'b'
+}, 'a');
+function generate_vtm_word(k) {
+    return morphic_word(VTM_MORPHISM, k);
+}
+function prefix_vtm_word(length) {
+    return morphic_prefix(VTM_MORPHISM, length);
+}
+export function test_vtm_word() {
+    assert_eq(generate_vtm_word(0), "a", "vtm Word 0");
+    assert_eq(generate_vtm_word(1), "abc", "vtm Word 1");
+    assert_eq(generate_vtm_word(2), "abcacb", "vtm Word 2");
+    assert_eq(generate_vtm_word(3), "abcacbabcbac", "vtm Word 2");
+    assert_eq(generate_vtm_word(4), "abcacbabcbacabcacbacabcb", "vtm Word 3");
+    assert_eq(generate_vtm_word(5), "abcacbabcbacabcacbacabcbabcacbabcbacabcbabcacbac", "vtm Word 4");
+}
+const SIERPINSKI_MORPHISM = create_morphism({
+    a: 'aba',
+    b: 'bbb'
+}, 'a');
+function generate_sierpinski_word(k) {
+    return morphic_word(SIERPINSKI_MORPHISM, k);
+}
+function prefix_sierpinski_word(length) {
+    return morphic_prefix(SIERPINSKI_MORPHISM, length);
+}
+export function test_sierpinski_word() {
+    assert_eq(generate_sierpinski_word(0), "a", "Sierpinski Word 0");
+    assert_eq(generate_sierpinski_word(1), "aba", "Sierpinski Word 1");
+    assert_eq(generate_sierpinski_word(2), "ababbbaba", "Sierpinski Word 2");
+    assert_eq(generate_sierpinski_word(3), "ababbbababbbbbbbbbababbbaba", "Sierpinski Word 3");
+    assert_eq(generate_sierpinski_word(4), "ababbbababbbbbbbbbababbbababbbbbbbbbbbbbbbbbbbbbbbbbbbababbbababbbbbbbbbababbbaba", "Sierpinski Word 4");
+}
+const PELL_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'a'
+}, 'a');
+function generate_pell_word(k) {
+    return morphic_word(PELL_MORPHISM, k);
+}
+function prefix_pell_word(length) {
+    return morphic_prefix(PELL_MORPHISM, length);
+}
+export function test_pell_word() {
+    assert_eq(generate_pell_word(0), "a", "Pell Word 0");
+    assert_eq(generate_pell_word(1), "aab", "Pell Word 1");
+    assert_eq(generate_pell_word(2), "aabaaba", "Pell Word 2");
+    assert_eq(generate_pell_word(3), "aabaabaaabaabaaab", "Pell Word 3");
+    assert_eq(generate_pell_word(4), "aabaabaaabaabaaabaabaabaaabaabaaabaabaaba", "Pell Word 4");
+}
+const CHACON_MORPHISM = create_morphism({
+    a: 'aaba',
+    b: 'b'
+}, 'a');
+function generate_chacon_word(k) {
+    return morphic_word(CHACON_MORPHISM, k);
+}
+function prefix_chacon_word(length) {
+    return morphic_prefix(CHACON_MORPHISM, length);
+}
+export function test_chacon_word() {
+    assert_eq(generate_chacon_word(0), "a", "Chacon Word 0");
+    assert_eq(generate_chacon_word(1), "aaba", "Chacon Word 1");
+    assert_eq(generate_chacon_word(2), "aabaaababaaba", "Chacon Word 2");
+    assert_eq(generate_chacon_word(3), "aabaaababaabaaabaaababaababaabaaababaaba", "Chacon Word 3");
+}
+const VON_NEUMANN_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'b'
+}, 'a');
+function generate_von_neumann_word(k) {
+    return morphic_word(VON_NEUMANN_MORPHISM, k);
+}
+function prefix_von_neumann_word(length) {
+    return morphic_prefix(VON_NEUMANN_MORPHISM, length);
+}
+export function test_von_neumann_word() {
+    assert_eq(generate_von_neumann_word(0), "a", "von Neumann Word 0");
+    assert_eq(generate_von_neumann_word(1), "aab", "von Neumann Word 1");
+    assert_eq(generate_von_neumann_word(2), "aabaabb", "von Neumann Word 2");
+    assert_eq(generate_von_neumann_word(3), "aabaabbaabaabbb", "von Neumann Word 3");
+    assert_eq(generate_von_neumann_word(4), "aabaabbaabaabbbaabaabbaabaabbbb", "von Neumann Word 4");
+    assert_eq(generate_von_neumann_word(5), "aabaabbaabaabbbaabaabbaabaabbbbaabaabbaabaabbbaabaabbaabaabbbbb", "von Neumann Word 5");
+}
+const RUDIN_SHAPIRO_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'db',
+    d: 'dc'
+}, 'a', {
+    a: 'a',
+    b: 'a',
+    c: 'b',
+    d: 'b'
+});
+function generate_rudin_shapiro_word(k) {
+    return morphic_word(RUDIN_SHAPIRO_MORPHISM, k);
+}
+function prefix_rudin_shapiro_word(length) {
+    return morphic_prefix(RUDIN_SHAPIRO_MORPHISM, length);
+}
+export function test_rudin_shapiro_word() {
+    assert_eq(generate_rudin_shapiro_word(0), "a", "Rudin-Shapiro Word 0");
+    assert_eq(generate_rudin_shapiro_word(1), "aa", "Rudin-Shapiro Word 1");
+    assert_eq(generate_rudin_shapiro_word(2), "aaab", "Rudin-Shapiro Word 2");
+    assert_eq(generate_rudin_shapiro_word(3), "aaabaaba", "Rudin-Shapiro Word 3");
+    assert_eq(generate_rudin_shapiro_word(4), "aaabaabaaaabbbab", "Rudin-Shapiro Word 4");
+    assert_eq(generate_rudin_shapiro_word(5), "aaabaabaaaabbbabaaabaababbbaaaba", "Rudin-Shapiro Word 5");
+}
+const BAUM_SWEET_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'cb',
+    c: 'bd',
+    d: 'dd'
+}, 'a', {
+    a: 'a',
+    b: 'b',
+    c: 'a',
+    d: 'a'
+});
+function generate_baum_sweet_word(k) {
+    return morphic_word(BAUM_SWEET_MORPHISM, k);
+}
+function prefix_baum_sweet_word(length) {
+    return morphic_prefix(BAUM_SWEET_MORPHISM, length);
+}
+export function test_baum_sweet_word() {
+    assert_eq(generate_baum_sweet_word(0), "a", "Baum-Sweet Word 0");
+    assert_eq(generate_baum_sweet_word(1), "ab", "Baum-Sweet Word 1");
+    assert_eq(generate_baum_sweet_word(2), "abab", "Baum-Sweet Word 2");
+    assert_eq(generate_baum_sweet_word(3), "ababbaab", "Baum-Sweet Word 3");
+    assert_eq(generate_baum_sweet_word(4), "ababbaababaabaab", "Baum-Sweet Word 4");
+}
+function generate_kolakoski_word(k) {
+    let word = kolakoski_units(2);
+    for(let i = 0; i < k; ++i){
+        let length = 0;
+        for(let j = 0; j < word.length; ++j)length += word[j] == 97 ? 1 : 2;
+        word = kolakoski_units(length);
+    }
+    return units_to_string(word, null);
+}
+function kolakoski_units(length) {
+    const units = new Uint16Array(Math.max(0, length));
+    const seed = [
+        97,
+        98,
+        98
+    ];
+    let pos = 0;
+    for(; pos < units.length && pos < seed.length; ++pos)units[pos] = seed[pos];
+    for(let run = 2; pos < units.length; ++run){
+        const letter = run % 2 == 0 ? 97 : 98;
+        units[pos++] = letter;
+        if (units[run] == 98 && pos < units.length) units[pos++] = letter;
+    }
+    return units;
+}
+function prefix_kolakoski_word(length) {
+    return units_to_string(kolakoski_units(length), null);
+}
+export function test_kolakoski_word() {
+    assert_eq(generate_kolakoski_word(0), "ab", "Kolakoski Word 0");
+    assert_eq(generate_kolakoski_word(1), "abb", "Kolakoski Word 1");
+    assert_eq(generate_kolakoski_word(2), "abbaa", "Kolakoski Word 2");
+    assert_eq(generate_kolakoski_word(3), "abbaaba", "Kolakoski Word 3");
+    assert_eq(generate_kolakoski_word(4), "abbaababba", "Kolakoski Word 4");
+}
+export function test_generator_edge_cases() {
+    assert_eq(generate_fibonacci_word(-5), "b", "Fibonacci with negative input");
+    assert_eq(generate_tribonacci_word(-5), "a", "Tribonacci with negative input");
+    assert_eq(generate_thue_morse_word(-5), "a", "Thue-Morse with negative input");
+    assert_eq(generate_mephisto_waltz_word(-5), "a", "Mephisto-Waltz with negative input");
+    assert_eq(generate_vtm_word(-5), "a", "VTM with negative input");
+    assert_eq(generate_sierpinski_word(-5), "a", "Sierpinski with negative input");
+    assert_eq(generate_pell_word(-5), "a", "Pell with negative input");
+    assert_eq(generate_chacon_word(-5), "a", "Chacon with negative input");
+    assert_eq(generate_von_neumann_word(-5), "a", "von Neumann with negative input");
+    assert_eq(generate_rudin_shapiro_word(-5), "a", "Rudin-Shapiro with negative input");
+    assert_eq(generate_baum_sweet_word(-5), "a", "Baum-Sweet with negative input");
+    assert_eq(generate_kolakoski_word(-5), "ab", "Kolakoski with negative input");
+    const fib7 = generate_fibonacci_word(7);
+    assert_eq(fib7.length > 0, true, "Fibonacci Word 7 generated");
+    const thue5 = generate_thue_morse_word(5);
+    assert_eq(thue5.length, 32, "Thue-Morse Word 5 has correct length");
+}
+export function test_generator_prefixes() {
+    const generators = [
+        [
+            generate_fibonacci_word,
+            prefix_fibonacci_word
+        ],
+        [
+            generate_tribonacci_word,
+            prefix_tribonacci_word
+        ],
+        [
+            generate_thue_morse_word,
+            prefix_thue_morse_word
+        ],
+        [
+            generate_mephisto_waltz_word,
+            prefix_mephisto_waltz_word
+        ],
+        [
+            generate_vtm_word,
+            prefix_vtm_word
+        ],
+        [
+            generate_sierpinski_word,
+            prefix_sierpinski_word
+        ],
+        [
+            generate_pell_word,
+            prefix_pell_word
+        ],
+        [
+            generate_chacon_word,
+            prefix_chacon_word
+        ],
+        [
+            generate_von_neumann_word,
+            prefix_von_neumann_word
+        ],
+        [
+            generate_rudin_shapiro_word,
+            prefix_rudin_shapiro_word
+        ],
+        [
+            generate_baum_sweet_word,
+            prefix_baum_sweet_word
+        ],
+        [
+            generate_kolakoski_word,
+            prefix_kolakoski_word
+        ]
+    ];
+    for (const [generate, prefix] of generators){
+        const word = generate(8);
+        for (const length of [
+            0,
+            1,
+            2,
+            5,
+            17,
+            word.length - 1,
+            word.length
+        ]){
+            assert_eq(prefix(length), word.substring(0, length), `Prefix of length ${length} of ${word.substring(0, 8)}`);
+        }
+    }
+    const long_prefix = prefix_thue_morse_word(1000);
+    assert_eq(long_prefix.length, 1000, "Thue-Morse prefix has the requested length");
+    assert_eq(long_prefix, generate_thue_morse_word(10).substring(0, 1000), "Thue-Morse prefix matches order 10");
+    assert_eq(generate_fibonacci_word(3), "aba", "Fibonacci Word 3 after memoizing higher orders");
+}
+
@@ -0,0 +1 @@
+const generator_lengths = {"fibonacci_word":[1,1,2,3,5,8,13,21,34,55,89,144,233,377,610,987,1597,2584,4181,6765,10946,17711,28657],"tribonacci_word":[1,2,4,7,13,24,44,81,149,274,504,927,1705,3136,5768,10609,19513],"thue_morse_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"mephisto_waltz_word":[1,3,9,27,81,243,729,2187,6561,19683],"vtm_word":[1,3,6,12,24,48,96,192,384,768,1536,3072,6144,12288,24576],"sierpinski_word":[1,3,9,27,81,243,729,2187,6561,19683],"pell_word":[1,3,7,17,41,99,239,577,1393,3363,8119,19601],"chacon_word":[1,4,13,40,121,364,1093,3280,9841,29524],"von_neumann_word":[1,3,7,15,31,63,127,255,511,1023,2047,4095,8191,16383,32767],"rudin_shapiro_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"baum_sweet_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"kolakoski_word":[2,3,5,7,10,15,23,34,50,75,113,170,255,382,574,863,1293,1937,2903,4353,6526,9789,14688,22029]};
@@ -0,0 +1,28 @@
+const string_generators = {
+	'fibonacci_word': generate_fibonacci_word,
+	'tribonacci_word': generate_tribonacci_word,
+	'thue_morse_word': generate_thue_morse_word,
+	'mephisto_waltz_word': generate_mephisto_waltz_word,
+	'vtm_word': generate_vtm_word,
+	'sierpinski_word': generate_sierpinski_word,
+	'pell_word': generate_pell_word,
+	'chacon_word': generate_chacon_word,
+	'von_neumann_word': generate_von_neumann_word,
+	'rudin_shapiro_word': generate_rudin_shapiro_word,
+	'baum_sweet_word': generate_baum_sweet_word,
+	'kolakoski_word': generate_kolakoski_word,
+};
+const string_generator_prefixes = {
+	'fibonacci_word': prefix_fibonacci_word,
+	'tribonacci_word': prefix_tribonacci_word,
+	'thue_morse_word': prefix_thue_morse_word,
+	'mephisto_waltz_word': prefix_mephisto_waltz_word,
+	'vtm_word': prefix_vtm_word,
+	'sierpinski_word': prefix_sierpinski_word,
+	'pell_word': prefix_pell_word,
+	'chacon_word': prefix_chacon_word,
+	'von_neumann_word': prefix_von_neumann_word,
+	'rudin_shapiro_word': prefix_rudin_shapiro_word,
+	'baum_sweet_word': prefix_baum_sweet_word,
+	'kolakoski_word': prefix_kolakoski_word,
+};
\ No newline at end of file
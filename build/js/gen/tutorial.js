@@ -0,0 +1,366 @@
+const tutorials = {};
+tutorials['fibonacci_word'] = {
+	'title' : 'Fibonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to a \\} \\) on the letter \'b\'',
+	'oeis' : 'A003849',
+	'wikipedia' : 'Fibonacci_word'
+};
+
+tutorials['tribonacci_word'] = {
+	'title' : 'Tribonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A080843',
+	'wikipedia' : 'Tribonacci_word'
+};
+
+tutorials['thue_morse_word'] = {
+	'title' : 'Thue-Morse',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ba \\} \\) on the letter \'a\'',
+	'oeis' : 'A010060',
+	'wikipedia' : 'Thue-Morse_sequence'
+};
+
+tutorials['mephisto_waltz_word'] = {
+	'title' : 'Mephisto-Waltz',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to bba \\} \\) on the letter \'a\'',
+	'oeis' : 'A064990',
+	'cite' : 'allouche03automatic'
+};
+
+tutorials['vtm_word'] = {
+	'title' : 'vtm',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to abc, b \\to ac, c \\to b \\} \\) on the letter \'a\''
+};
+
+tutorials['sierpinski_word'] = {
+	'title' : 'Sierpinski',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aba, b \\to bbb \\} \\) on the letter \'a\'',
+	'oeis' : 'A316829'
+};
+
+tutorials['pell_word'] = {
+	'title' : 'Pell',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A171588',
+	'wikipedia' : 'Pell_number'
+};
+
+tutorials['chacon_word'] = {
+	'title' : 'Chacon',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aaba, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A049320'
+};
+
+tutorials['von_neumann_word'] = {
+	'title' : 'Neumannn',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A308187'
+};
+
+tutorials['rudin_shapiro_word'] = {
+	'title' : 'Rudin-Shapiro',
+	'content' : 'Morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to db, d \\to dc \\} \\) followed by the coding \\( \\{ a,b \\to a; c,d \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A020987',
+	'wikipedia' : 'Rudin–Shapiro_sequence'
+};
+
+tutorials['baum_sweet_word'] = {
+	'title' : 'Baum-Sweet',
+	'content' : 'Word defined by setting the \\(j\\)-th letter to \'b\' if the binary representation of \\(j\\) contains no block of consecutive 0s of odd length, and to \'a\' otherwise.',
+	'oeis' : 'A086747',
+	'wikipedia' : 'Baum–Sweet_sequence'
+};
+
+tutorials['kolakoski_word'] = {
+	'title' : 'Kolakoski',
+	'content' : 'Self-generating word over the alphabet {a,b} where \'a\' represents 1 and \'b\' represents 2. The word starts with "ab" and the lengths of consecutive runs are given by the word itself.',
+	'oeis' : 'A000002',
+	'wikipedia' : 'Kolakoski_sequence'
+};
+
+tutorials['sigma'] = {
+	'title' : '&sigma;',
+	'content' : 'The effective alphabet size of a string is the number of distinct symbols it contains.'
+};
+
+tutorials['period'] = {
+	'title' : 'p',
+	'content' : 'The shortest period of a string is the smallest positive integer such that the string is a prefix of an infinite repetition of the prefix of that length. Concretely, the shortest period \\(p\\) of the text \\(T\\) is the length of the shortest prefix \\(P\\) of \\(T\\) such that \\(T\\) is a prefix of \\(P^{k}\\) for some integer \\(k \\geq 1\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+
+tutorials['exponent'] = {
+	'title' : 'e',
+	'content' : 'The exponent of a string is the division of the string\'s length by its shortest period, representing how many times the shortest period needs to be repeated to form the string. Formally, the exponent of the text \\(T\\) is defined as the length of \\(T\\) divided by the length of its shortest period \\(p\\), i.e., \\(\\frac{|T|}{p}\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+
+tutorials['regularity'] = {
+	'title' : 'R',
+	'content' : 'The regularity type of a string classifies it based on its periodic structure. A string can be categorized as unbordered, primitive, square, or non-primitive based on its borders and periods. Specifically, a string is unbordered if it has no proper border, primitive if it cannot be expressed as a repetition of a smaller substring, square if it is formed by repeating a substring exactly twice, and non-primitive if it can be expressed as a repetition of a smaller substring more than twice.'
+};
+
+tutorials['suffix_array'] = {
+	'title' : 'SA',
+	'content' : 'The suffix array sorts the entry indices of a string based on the lexicographical order of their corresponding suffixes. Formally, the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the suffixes of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{SA}[i]..n] \\prec T[\\mathsf{SA}[i+1]..n]\\) for all text positions \\(i \\in [1..n-1]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+
+tutorials['border_array'] = {
+	'title' : 'B',
+	'content' : 'The border array of a string stores the lengths of the longest borders for each prefix of the string. A border of a string is defined as a substring that is both a proper prefix and a proper suffix. Formally, the border array \\(\\mathsf{B}\\) for a text \\(T[1..n]\\) is an array where each entry \\(\\mathsf{B}[i]\\) represents the length of the longest border of the prefix \\(T[1..i]\\), i.e., \\(\\mathsf{B}[i]\\) is the largest integer \\(k \\le i-1\\) such that \\(T[1..k] = T[i-k+1..i]\\). By definition, \\(\\mathsf{B}[0] = 0\\).',
+	'wikipedia' : 'Knuth–Morris–Pratt_algorithm'
+};
+
+tutorials['bw_transform'] = {
+	'title' : 'BWT',
+	'content' : 'The Burrows-Wheeler Transform (BWT) is a reversible transformation that rearranges the characters of a string based on the lexicographical order of its cyclic rotations. Formally, given a text \\(T[1..n]\\) and its rotation array \\(\\mathsf{Rot}\\), the BWT \\(\\mathsf{BWT}[1..n]\\) is defined such that \\(\\mathsf{BWT}[i] = T[(\\mathsf{Rot}[i] + n - 1) \\mod n]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+
+tutorials['first_array'] = {
+	'title' : 'F',
+	'content' : 'The First Column Array represents the first column of the sorted rotations of a string, which is obtained by sorting the characters of the string in lexicographical order. Formally, for a given text \\(T[1..n]\\), the First Column Array \\(\\mathsf{F}\\) is defined as the sorted sequence of characters in \\(T\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+
+tutorials['index_array'] = {
+	'title' : 'i',
+	'content' : 'The index array contains a sequence of integers from \\(1\\) to \\(n\\), where \\(n\\) is the length of the input text \\(T[1..n]\\). Formally, the index array \\(\\mathsf{i}\\) is defined such that \\(\\mathsf{i}[j] = j\\) for each \\(j \\in [1..n]\\).'
+};
+
+tutorials['rotation_array'] = {
+	'title' : 'Rot',
+	'content' : 'The rotation array sorts the entry indices of a string based on the lexicographical order of their corresponding cyclic rotations. Formally, the rotation array \\(\\mathsf{Rot}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the cyclic rotations of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{Rot}[i]..n]T[1..\\mathsf{Rot}[i]-1] \\prec T[\\mathsf{Rot}[i+1]..n]T[1..\\mathsf{Rot}[i+1]-1]\\) for all text positions \\(i \\in [1..n-1]\\), where $\\prec$ is a total order by assigning lower ranks to lexicographically smaller strings and uses the text position \\(i\\) for tie-breaking.'
+};
+
+tutorials['inverse_suffix_array'] = {
+	'title' : 'ISA',
+	'content' : 'The inverse suffix array provides a mapping from each starting index of the suffixes of a string back to their respective positions in the suffix array. Formally, given the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\), the inverse suffix array \\(\\mathsf{ISA}\\) is defined such that \\(\\mathsf{ISA}[\\mathsf{SA}[i]] = i\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+
+tutorials['phi_array'] = {
+	'title' : '&Phi;',
+	'content' : 'The Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically preceding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Phi array \\(\\mathsf{\\Phi}\\) is defined such that \\(\\mathsf{\\Phi}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] - 1]\\) if \\(\\mathsf{ISA}[i] > 0\\), and \\(\\mathsf{\\Phi}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = 0\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp'
+};
+
+tutorials['inverse_phi_array'] = {
+	'title' : '&Phi;&#8315;&#185;',
+	'content' : 'The inverse Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically succeeding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the inverse Phi array \\(\\mathsf{\\Phi}^{-1}\\) is defined such that \\(\\mathsf{\\Phi}^{-1}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] + 1]\\) if \\(\\mathsf{ISA}[i] \\le n-1 \\), and \\(\\mathsf{\\Phi}^{-1}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = n \\), for each \\(i \\in [1..n]\\).'
+};
+
+tutorials['lcp_array'] = {
+	'title' : 'LCP',
+	'content' : 'The Longest Common Prefix (LCP) array stores the lengths of the longest common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given text \\(T[1..n]\\) and its suffix array \\(\\mathsf{SA}\\), the LCP array \\(\\mathsf{LCP}[1..n]\\) is defined such that \\(\\mathsf{LCP}[1] = 0\\) and \\(\\mathsf{LCP}[i] = \\text{lcp}(T[\\mathsf{SA}[i]..n], T[\\mathsf{SA}[i-1]..n])\\) for each \\(i \\in [2..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+
+tutorials['lcp_array'] = {
+	'title' : '&Sigma; LCP',
+	'content' : 'The sum of the Longest Common Prefix (LCP) array values provides a measure of the total length of common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given LCP array \\(\\mathsf{LCP}[1..n]\\), the sum \\(\\Sigma \\mathsf{LCP}\\) is defined as \\(\\sum_{i=1}^{n} \\mathsf{LCP}[i]\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+
+tutorials['plcp_array'] = {
+	'title' : 'PLCP',
+	'content' : 'The Permuted Longest Common Prefix (PLCP) array reorders the values of the Longest Common Prefix (LCP) array based on the respective positions in the string. Formally, for the inverse suffix array \\(\\mathsf{ISA}\\) and LCP array \\(\\mathsf{LCP}\\) of the text \\(T[1..n]\\), the PLCP array \\(\\mathsf{PLCP}[1..n]\\) is defined such that \\(\\mathsf{PLCP}[i] = \\mathsf{LCP}[\\mathsf{ISA}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+
+tutorials['psi_array'] = {
+	'title' : '&Psi;',
+	'content' : 'The Psi array provides a mapping inside the suffix array that advances by one text position. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Psi array \\(\\mathsf{\\Psi}\\) is defined such that \\(\\mathsf{\\Psi}[i] = \\mathsf{ISA}[\\mathsf{SA}[i] + 1]\\) if \\(\\mathsf{SA}[i] + 1 < n\\), and \\(\\mathsf{\\Psi}[i] = \\bot\\) if \\(\\mathsf{SA}[i] + 1 = n\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'grossi05csa'
+};
+
+tutorials['lyndon_factorization'] = {
+	'title' : 'LynF',
+	'content' : 'The Lyndon factorization of a string decomposes it into a sequence of Lyndon words in lexicographically non-increasing order, where a Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations.',
+	'cite' : 'chen58lyndon'
+};
+
+tutorials['delta'] = {
+	'title' : '&delta;',
+	'content' : 'The substring complexity measure quantifies the maximum ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the maximum value of \\(\\frac{\\mathsf{SC}[k]}{k}\\) for \\(k \\in [1..n]\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+
+tutorials['delta_argmax'] = {
+	'title' : 'max &delta;',
+	'content' : 'The substring complexity measure length identifies the substring length that maximizes the ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the length \\(k\\) that maximizes \\(\\frac{\\mathsf{SC}[k]}{k}\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+
+tutorials['substring_complexity'] = {
+	'title' : 'SC',
+	'content' : 'The substring complexity array quantifies the number of distinct substrings of various lengths within a string. Given the Longest Common Prefix (LCP) array of a string, the substring complexity array \\(\\mathsf{SC}[1..n]\\) is defined such that for each length \\(k \\in [1..n]\\), \\(\\mathsf{SC}[k]\\) represents the count of distinct substrings of length \\(k\\). The computation leverages the LCP values to efficiently determine the number of new substrings introduced at each length.',
+	'cite' : 'raskhodnikova13sublinear'
+};
+
+tutorials['lf_array'] = {
+	'title' : 'LF',
+	'content' : 'The Last-to-First (LF) mapping array identifies characters from the last column with those from the first column of the Burrows-Wheeler Transform (BWT) that orginated from the same text position. Given the first column \\(\\mathsf{F}\\) and \\(\\textsf{BWT}\\), the LF mapping array \\(\\mathsf{LF}[1..n]\\) is defined such that \\(\\mathsf{LF}[i] = \\text{select}(\\textsf{F}, \\textsf{BWT}[i], \\text{rank}(\\textsf{BWT}, \\textsf{BWT}[i], i))\\) for each \\(i \\in [1..n]\\), where \\(\\text{rank}(\\textsf{BWT}, c, i)\\) counts the occurrences of character \\(c\\) in the prefix \\(\\textsf{BWT}[1..i]\\), and \\(\\text{select}(\\textsf{F}, c, r)\\) finds the position of the \\(r\\)-th occurrence of character \\(c\\) in \\(\\textsf{F}\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+
+tutorials['sl_string'] = {
+	'title' : 'S/L',
+	'content' : 'The S/L type string classifies each character in a string as either S-type or L-type based on the lexicographic order of the suffixes starting at those characters. A character at position \\(i\\) is classified as S-type if the suffix starting at \\(i\\) is lexicographically smaller than the suffix starting at \\(i+1\\), and L-type if it is larger. If the suffixes are equal, the type is determined by the type of the suffix starting at \\(i+1\\). Additionally, an S-type character that is the first character or immediately preceded by an L-type character is marked as S*-type.',
+	'cite' : 'nong11sais'
+};
+
+tutorials['lpf_array'] = {
+	'title' : 'LPF',
+	'content' : 'The Longest Previous Factor (LPF) array stores the length of the longest prefix of each suffix of a string that matches a substring starting at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPF array \\(\\mathsf{LPF}[1..n]\\) is defined such that \\(\\mathsf{LPF}[i] = \\max_{j \\in [1..i-1]} \\text{lcp}(T[i..n], T[j..n])\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+
+tutorials['lpnf_array'] = {
+	'title' : 'LPnF',
+	'content' : 'The Longest Previous Non-Overlapping Factor (LPnF) array stores the length of the longest prefix of each suffix of a string that matches a substring ending at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPnF array \\(\\mathsf{LPnF}[1..n]\\) is defined such that \\(\\mathsf{LPnF}[i] = \\max_{j \\in [1..i-1]} \\min(i-j,\\text{lcp}(T[i..n], T[j..n]))\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+
+tutorials['lnf_array'] = {
+	'title' : 'LNF',
+	'content' : 'The Longest Next Factor (LNF) array is the LPF array of the reversed text.'
+};
+
+tutorials['lzss_factorization'] = {
+	'title' : 'LZSS',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski (LZSS) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring with an earlier starting position. The factorization is constructed greedily by selecting the longest previous factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+
+tutorials['lzssno_factorization'] = {
+	'title' : 'LZSSno',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski non-overlapping (LZSSno) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring ending at an earlier positition. The factorization is constructed greedily by selecting the longest previous non-overlapping factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\min(i-j, \\text{lcp}(T[i..n], T[j..n])) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+
+tutorials['lz77_factorization'] = {
+	'title' : 'LZ77',
+	'content' : 'The Lempel-Ziv-77  (LZ77) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring starting at a prior position within the same string. The factorization is constructed greedily by selecting the longest previous factor at each position in the string, with an additional character appended to the factor. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) + 1 \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'ziv77lz'
+};
+
+tutorials['reverse_lzss_factorization'] = {
+	'title' : 'rLZSS',
+	'content' : 'The Reverse Lempel-Ziv-Storer-Szymanski (rLZSS) factorization of a string is the LZSS factorization of the reversed string obtained by reading the string in reversed order.',
+	'cite' : 'storer82lzss'
+};
+
+tutorials['lexparse_factorization'] = {
+	'title' : 'LexParse',
+	'content' : 'The lexicographic parse (lexparse) decomposes a string into a sequence of factors based on the permuted longest common prefix (PLCP) array. Each factor is determined by the longest prefix of the suffix starting at the current position that matches a substring starting at a lexicographically smaller suffix position. Formally, for a given text \\(T[1..n]\\) and its PLCP array \\(\\mathsf{PLCP}[1..n]\\), the length of the factor starting at position \\(i\\) is \\(\\mathsf{PLCP}[i]\\) or 1 if \\(\\mathsf{PLCP}[i] = 0\\).',
+	'cite' : 'navarro21approximation'
+};
+
+tutorials['nss_array'] = {
+	'title' : 'NSS',
+	'content' : 'The Next Smaller Suffix (NSS) array identifies the subsequent suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the NSS array \\(\\mathsf{NSS}[1..n]\\) is defined such that \\(\\mathsf{NSS}[i] = \\min \\{ j > i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{NSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+
+tutorials['pss_array'] = {
+	'title' : 'PSS',
+	'content' : 'The Previous Smaller Suffix (PSS) array identifies the preceding suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the PSS array \\(\\mathsf{PSS}[1..n]\\) is defined such that \\(\\mathsf{PSS}[i] = \\max \\{ j < i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{PSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+
+tutorials['lyndon_array'] = {
+	'title' : 'Lyndon',
+	'content' : 'The Lyndon array stores the lengths of the longest Lyndon words starting at each position in a string. A Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations. Given the Next Smaller Suffix (NSS) array \\(\\mathsf{NSS}[1..n]\\) of a text \\(T[1..n]\\), the Lyndon array \\(\\mathsf{Lyndon}[1..n]\\) is defined such that \\(\\mathsf{Lyndon}[i] = \\mathsf{NSS}[i] - i\\) if \\(\\mathsf{NSS}[i] \\neq \\bot\\), and \\(\\mathsf{Lyndon}[i] = n - i + 1\\) otherwise, for each \\(i \\in [1..n]\\).',
+	'cite' : 'franek16algorithms'
+};
+
+tutorials['necklace_conjugate_transform'] = {
+	'title' : 'min-rot(T)',
+	'content' : 'The necklace conjugate of a string is the lexicographically smallest string that can be obtained by rotating the original string. This involves generating all possible rotations (conjugates) of the string and selecting the smallest one in lexicographic order.'
+};
+
+tutorials['invert_transform'] = {
+	'title' : 'inv(T)',
+	'content' : 'The invert transform of a string maps each character to its complementary character based on the effective alphabet of the string. Specifically, given a string that contains \\(s\\) distinct symbols, it swaps the \\(i\\)-th smallest symbol with the \\((s - i + 1)\\)-th smallest one, for every \\(i \\in \\{1,\\dots,s\\}\\).'
+};
+
+tutorials['revert_transform'] = {
+	'title' : 'rev(T)',
+	'content' : 'The revert transform of a string is obtained by reversing the order of its characters. Given a text \\(T[1..n]\\), the revert transform \\(\\mathsf{Revert}(T)\\) produces the string \\(T[n] T[n-1] \\ldots T[1]\\), where the characters are arranged in the opposite order, effectively reading the string backwards.'
+};
+
+tutorials['circular_suffix_array'] = {
+	'title' : 'CSA',
+	'content' : 'The Circular Suffix Array (CSA) of a string is a permutation of text positions that assigns a rank to each cyclic rotation (conjugate) of the Lyndon factors of the string based on the omega order. Given a text \\(T[1..n]\\) and its Lyndon factorization, the CSA \\(\\mathsf{CSA}[1..n]\\) is defined such that \\(\\mathsf{CSA}[i]\\) gives the starting position in \\(T\\) of the \\(i\\)-th smallest conjugate in \\(\\omega\\)-order among all conjugates of the Lyndon factors of \\(T\\).',
+	'cite' : 'hon13spaceefficient'
+};
+
+tutorials['inverse_circular_suffix_array'] = {
+	'title' : 'CISA',
+	'content' : 'The inverse circular suffix array (ICSA) is the reverse permutation of the circular suffix array (CSA).',
+	'cite' : 'hon13spaceefficient'
+};
+
+tutorials['bbw_indices'] = {
+	'title' : 'BBWTi',
+	'content' : 'The Bijective Burrows-Wheeler Transform Indices (BBWTi) array stores the text positions of the circular sufix array (CSA) decremented by one, but mapping positions at the beginning of Lyndon factors to the end of the respective Lyndon factor.',
+	'cite' : 'bannai25survey'
+};
+
+tutorials['bbw_transform'] = {
+	'title' : 'BBWT',
+	'content' : 'The Bijective Burrows-Wheeler Transform (BBWT) of a string rearranges the characters of the original string based on the Bijective Burrows-Wheeler Transform Indices (BBWTi). Given a text \\(T[1..n]\\) and its BBWTi array \\(\\mathsf{BBWTi}[1..n]\\), the BBWT \\(\\mathsf{BBWT}[1..n]\\) is defined such that \\(\\mathsf{BBWT}[i] = T[\\mathsf{BBWTi}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'bannai25survey'
+};
+
+tutorials['inverse_bbw_transform'] = {
+	'title' : 'BBWT&#8315;&#185;',
+	'content' : 'The inverse Bijective Burrows-Wheeler Transform (inverse BBWT), also called the Gessel-Reutenauer transformation, applies the LF-mapping on the cycles in the BBWT to extract all Lyndon words, which sorted in lexicographically descreing order recovers the original text.',
+	'cite' : 'bannai25survey'
+};
+
+tutorials['lz78_factorization'] = {
+	'title' : 'LZ78',
+	'content' : 'The Lempel-Ziv-78 (LZ78) factorization decomposes a string into a sequence of factors based on previously seen substrings. Each factor consists of a reference to the longest previously seen factor (or zero if none exists) followed by a new character.',
+	'cite' : 'ziv78lz'
+};
+
+tutorials['lzw_factorization'] = {
+	'title' : 'LZW',
+	'content' : 'The Lempel-Ziv-Welch (LZW) factorization decomposes a string into a sequence of factors by building a dictionary of previously seen substrings. Each factor is the longest prefix of the remaining text that exists in the dictionary, followed by the next character.',
+	'cite' : 'welch84lzw'
+};
+
+tutorials['necklace_factorization'] = {
+	'title' : 'NeckF',
+	'content' : 'The Necklace factorization is the Lyndon factorization colliding all equal Lyndon factors to a single factor that is a necklace. The number of factors is the number of distinct Lyndon factors.',
+	'cite' : 'chen58lyndon'
+};
+
+tutorials['odd_maximal_palindromic_length_array'] = {
+	'title' : 'o-pali',
+	'content' : 'The odd maximal palindromic length array (o-pali) stores at each position the length of the left arm of the longest odd-length palindromic substring centered at that position, excluding the position itself in the length measurement. Hence, a palindrome of length \\(2k+1\\) contributes \\(k\\) to the o-pali array at its center position.',
+	'cite' : 'manacher75new'
+};
+
+tutorials['even_maximal_palindromic_length_array'] = {
+	'title' : 'e-pali',
+	'content' : 'The even maximal palindromic length array (e-pali) stores at each position the length of the longest even-length palindromic substring centered between that and its preding position.',
+	'cite' : 'manacher75new'
+};
+
+tutorials['lzend_factorization'] = {
+	'title' : 'LZend',
+	'content' : 'The LZ-end factorization is a restriction of the Lempel-Ziv 77 factorization where each new factor, omitting its last new character, must be the longest possible prefix of the remaining text that also appears ending exactly at the end of a previous factor, or just a single character if no such match exists.',
+	'cite' : 'kreft13lzend'
+};
+
+tutorials['gamma_factorization'] = {
+	'title' : '&Gamma;',
+	'content' : 'A string attractor is a set of positions in a string such that every distinct substring has at least one occurrence that crosses one of these positions. The smallest string attractor size is the minimum number of positions needed to form such a set. Here, \\(\\Gamma\\) is the leftmost such smallest string attractor, i.e., the one that has the lexicographically smallest sequence of positions.',
+	'cite' : 'kempa18stringattractors'
+};
@@ -0,0 +1,1001 @@
+"use strict";
+function assert_eq(a, b, message) {
+    let equal = false;
+    if (Array.isArray(a) && Array.isArray(b)) {
+        equal = a.length === b.length && a.every((v, i)=>v === b[i]);
+    } else {
+        equal = a === b;
+    }
+    if (!equal) {
+        const aStr = Array.isArray(a) ? `[${a}]` : a;
+        const bStr = Array.isArray(b) ? `[${b}]` : b;
+        throw new Error(`Assertion Failed: ${message}. Expected "${bStr}", but got "${aStr}"`);
+    }
+}
+function number_of_runs(text) {
+    if (!text) {
+        return 0;
+    }
+    let runs = 1;
+    let runchar = text[0];
+    for(let i = 1; i < text.length; ++i){
+        if (text[i] !== runchar) {
+            runs++;
+            runchar = text[i];
+        }
+    }
+    return runs;
+}
+export function test_number_of_runs() {
+    assert_eq(number_of_runs(""), 0, "Test 1: Empty string should return 0 runs.");
+    assert_eq(number_of_runs("a"), 1, "Test 2: Single character string should return 1 run.");
+    assert_eq(number_of_runs("aaaaa"), 1, "Test 3: String with all same characters should return 1 run.");
+    assert_eq(number_of_runs("abc"), 3, "Test 4: String with all unique characters should return length.");
+    assert_eq(number_of_runs("aaabbc"), 3, "Test 5: Mixed runs (aaa, bb, c).");
+    assert_eq(number_of_runs("ababa"), 5, "Test 6: Alternating characters (a, b, a, b, a).");
+    assert_eq(number_of_runs("mississippi"), 8, "Test 7: Complex word (m, i, ss, i, ss, i, pp, i).");
+    assert_eq(number_of_runs("Hello World"), 10, "Test 8: String with spaces and mixed cases.");
+    assert_eq(number_of_runs("112233"), 3, "Test 9: Numeric string with runs.");
+    assert_eq(number_of_runs("$$$$"), 1, "Test 10: Special characters all same.");
+    assert_eq(number_of_runs("!@#$"), 4, "Test 11: Special characters all different.");
+    assert_eq(number_of_runs("  a b  c"), 6, "Test 12: Multiple spaces and single characters.");
+}
+function number_of_factors(factorization) {
+    if (!factorization) {
+        return 0;
+    }
+    let count = 0;
+    for(let i = 0; i < factorization.length; ++i){
+        if (factorization[i]) {
+            ++count;
+        }
+    }
+    return count;
+}
+export function test_number_of_factors() {
+    assert_eq(number_of_factors([]), 0, "Test Case 1: Empty array should return 0.");
+    assert_eq(number_of_factors([
+        false,
+        false,
+        false
+    ]), 0, "Test Case 2: Array with all false should return 0.");
+    assert_eq(number_of_factors([
+        true,
+        true,
+        true
+    ]), 3, "Test Case 3: Array with all true should return the count of elements.");
+    assert_eq(number_of_factors([
+        true
+    ]), 1, "Test Case 4: Single true element should return 1.");
+    assert_eq(number_of_factors([
+        false
+    ]), 0, "Test Case 5: Single false element should return 0.");
+    assert_eq(number_of_factors([
+        true,
+        false,
+        true,
+        true,
+        false
+    ]), 3, "Test Case 6: Mixed values (true, false) should count only true.");
+    assert_eq(number_of_factors([
+        false,
+        true,
+        false,
+        true,
+        false,
+        true,
+        false
+    ]), 3, "Test Case 7: Alternating values should count true correctly.");
+    assert_eq(number_of_factors([
+        true,
+        false,
+        false,
+        false,
+        false
+    ]), 1, "Test Case 8: True at the beginning of the array.");
+    assert_eq(number_of_factors([
+        false,
+        false,
+        false,
+        false,
+        true
+    ]), 1, "Test Case 9: True at the end of the array.");
+    assert_eq(number_of_factors([
+        false,
+        true,
+        false,
+        false,
+        false
+    ]), 1, "Test Case 10: True in the middle of the array.");
+    assert_eq(number_of_factors([
+        true,
+        true,
+        false,
+        true,
+        true,
+        false,
+        true
+    ]), 5, "Test Case 11: Multiple blocks of true values.");
+    assert_eq(number_of_factors(Uint8Array.of(1, 0, 1, 1, 0)), 3, "Test Case 12: Uint8Array factorization.");
+    assert_eq(number_of_factors(new Uint8Array(0)), 0, "Test Case 13: Empty Uint8Array.");
+}
+function pad_right(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return text + pad_char.repeat(times);
+}
+function pad_left(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return pad_char.repeat(times) + text;
+}
+export function test_padFunctions() {
+    assert_eq(pad_right("abc", "x", 5), "abcxx", "pad_right - basic padding");
+    assert_eq(pad_right("", "x", 3), "xxx", "pad_right - empty string, basic padding");
+    assert_eq(pad_right("abc", "xy", 7), "abcxyxy", "pad_right - multi-character padding");
+    assert_eq(pad_right("abc", " ", 5), "abc  ", "pad_right - space character padding");
+    assert_eq(pad_right("abc", "x", 3), "abc", "pad_right - no padding needed (exact length)");
+    assert_eq(pad_right("abc", "x", 2), "abc", "pad_right - no padding needed (already longer)");
+    assert_eq(pad_right("hello", "-", 5), "hello", "pad_right - already at target length");
+    assert_eq(pad_right("hello", "-", 3), "hello", "pad_right - string longer than target");
+    assert_eq(pad_right("a", "b", 1), "a", "pad_right - single char, target 1");
+    assert_eq(pad_right("", "0", 0), "", "pad_right - empty string, target 0");
+    assert_eq(pad_right("abc", "", 5), "abc", "pad_right - empty char, padding needed (should return original due to fix)");
+    assert_eq(pad_right("", "", 3), "", "pad_right - empty str, empty char, padding needed (should return original due to fix)");
+    assert_eq(pad_right("test", "", 4), "test", "pad_right - empty char, exact length (no padding needed anyway)");
+    assert_eq(pad_right("test", "", 2), "test", "pad_right - empty char, already longer (no padding needed anyway)");
+    assert_eq(pad_left("abc", "x", 5), "xxabc", "pad_left - basic padding");
+    assert_eq(pad_left("", "x", 3), "xxx", "pad_left - empty string, basic padding");
+    assert_eq(pad_left("abc", "xy", 7), "xyxyabc", "pad_left - multi-character padding");
+    assert_eq(pad_left("abc", " ", 5), "  abc", "pad_left - space character padding");
+    assert_eq(pad_left("abc", "x", 3), "abc", "pad_left - no padding needed (exact length)");
+    assert_eq(pad_left("abc", "x", 2), "abc", "pad_left - no padding needed (already longer)");
+    assert_eq(pad_left("hello", "-", 5), "hello", "pad_left - already at target length");
+    assert_eq(pad_left("hello", "-", 3), "hello", "pad_left - string longer than target");
+    assert_eq(pad_left("a", "b", 1), "a", "pad_left - single char, target 1");
+    assert_eq(pad_left("", "0", 0), "", "pad_left - empty string, target 0");
+    assert_eq(pad_left("abc", "", 5), "abc", "pad_left - empty char, padding needed (should return original due to fix)");
+    assert_eq(pad_left("", "", 3), "", "pad_left - empty str, empty char, padding needed (should return original due to fix)");
+    assert_eq(pad_left("test", "", 4), "test", "pad_left - empty char, exact length (no padding needed anyway)");
+    assert_eq(pad_left("test", "", 2), "test", "pad_left - empty char, already longer (no padding needed anyway)");
+}
+function increment_array(array, inc = 1) {
+    return Array.from(array, (x)=>x + inc);
+}
+export function test_increment_array() {
+    assert_eq(increment_array([
+        1,
+        2,
+        3
+    ], 1), [
+        2,
+        3,
+        4
+    ], "Test Case 1 Failed: Basic increment by 1");
+    assert_eq(increment_array([
+        10,
+        20
+    ]), [
+        11,
+        21
+    ], "Test Case 2 Failed: Default increment");
+    assert_eq(increment_array([
+        1,
+        2,
+        3
+    ], 5), [
+        6,
+        7,
+        8
+    ], "Test Case 3 Failed: Increment by 5");
+    assert_eq(increment_array([
+        5,
+        6,
+        7
+    ], -2), [
+        3,
+        4,
+        5
+    ], "Test Case 4 Failed: Decrement by 2");
+    assert_eq(increment_array([
+        1,
+        2,
+        3
+    ], 0), [
+        1,
+        2,
+        3
+    ], "Test Case 5 Failed: Increment by zero");
+    assert_eq(increment_array([], 10), [], "Test Case 6 Failed: Empty array");
+    assert_eq(increment_array([
+        1.5,
+        2.5,
+        3.0
+    ], 0.5), [
+        2.0,
+        3.0,
+        3.5
+    ], "Test Case 7 Failed: Floating point numbers");
+    assert_eq(increment_array([
+        -5,
+        0,
+        5
+    ], 2), [
+        -3,
+        2,
+        7
+    ], "Test Case 8 Failed: Mixed positive and negative numbers");
+    const largeNumberArray = [
+        Number.MAX_SAFE_INTEGER - 1,
+        Number.MAX_SAFE_INTEGER
+    ];
+    const expectedLargeNumberArray = [
+        Number.MAX_SAFE_INTEGER,
+        Number.MAX_SAFE_INTEGER + 1
+    ];
+    assert_eq(increment_array(largeNumberArray, 1), expectedLargeNumberArray, "Test Case 9 Failed: Large numbers");
+    assert_eq(increment_array([
+        7
+    ], 3), [
+        10
+    ], "Test Case 10 Failed: Single element array");
+    assert_eq(increment_array(Int32Array.of(0, 4, 2)), [
+        1,
+        5,
+        3
+    ], "Test Case 11 Failed: Int32Array input");
+}
+function replace_invalid_position(array, max_length) {
+    return Array.from(array, (x)=>x >= max_length ? '-' : x);
+}
+export function test_replace_invalid_position() {
+    assert_eq(replace_invalid_position([
+        1,
+        2,
+        3
+    ], 5), [
+        1,
+        2,
+        3
+    ], "Test Case 1 Failed: No invalid positions.");
+    assert_eq(replace_invalid_position([
+        5,
+        6,
+        7
+    ], 5), [
+        '-',
+        '-',
+        '-'
+    ], "Test Case 2 Failed: All invalid positions.");
+    assert_eq(replace_invalid_position([
+        1,
+        5,
+        3,
+        6,
+        0
+    ], 5), [
+        1,
+        '-',
+        3,
+        '-',
+        0
+    ], "Test Case 3 Failed: Mixed positions.");
+    assert_eq(replace_invalid_position([], 5), [], "Test Case 4 Failed: Empty array.");
+    assert_eq(replace_invalid_position([
+        1,
+        2,
+        0
+    ], 0), [
+        '-',
+        '-',
+        '-'
+    ], "Test Case 5 Failed: max_length is 0.");
+    assert_eq(replace_invalid_position([
+        1,
+        2,
+        -1
+    ], 5), [
+        1,
+        2,
+        -1
+    ], "Test Case 6 Failed: max_length is negative.");
+    assert_eq(replace_invalid_position([
+        -1,
+        -5,
+        0,
+        5,
+        10
+    ], 5), [
+        -1,
+        -5,
+        0,
+        '-',
+        '-'
+    ], "Test Case 7 Failed: Negative numbers in array.");
+    assert_eq(replace_invalid_position([
+        4,
+        5,
+        6
+    ], 5), [
+        4,
+        '-',
+        '-'
+    ], "Test Case 8 Failed: Exact match with max_length.");
+    assert_eq(replace_invalid_position([
+        1.5,
+        4.2,
+        5.0,
+        5.1
+    ], 5.0), [
+        1.5,
+        4.2,
+        '-',
+        '-'
+    ], "Test Case 9 Failed: Floating point numbers.");
+    assert_eq(replace_invalid_position([
+        1000,
+        99999,
+        100000
+    ], 100000), [
+        1000,
+        99999,
+        '-'
+    ], "Test Case 10 Failed: Large numbers.");
+    assert_eq(replace_invalid_position(Int32Array.of(3, 1, 0), 3), [
+        '-',
+        1,
+        0
+    ], "Test Case 11 Failed: Int32Array input.");
+}
+function prettify_string(text, sep = " ", base = 0, do_tabularize = true, length = text.length) {
+    text = text.split('\0').join("$");
+    const width = do_tabularize ? String(length + base - 1).length : 0;
+    let effectiveSep = sep;
+    if (!do_tabularize) {
+        effectiveSep = '';
+    }
+    return text.split('').map((x)=>pad_left(x, ' ', width)).join(effectiveSep);
+}
+export function test_prettify_string() {
+    assert_eq(prettify_string("abc"), "a b c", "Test Case 1 Failed: Basic default");
+    assert_eq(prettify_string("hello"), "h e l l o", "Test Case 1.1 Failed: Basic default 2");
+    assert_eq(prettify_string("abc", "-", 0, false), "abc", "Test Case 2 Failed: doTabularize=false, sep ignored");
+    assert_eq(prettify_string("hello", "---", 10, false), "hello", "Test Case 2.1 Failed: doTabularize=false with custom sep");
+    assert_eq(prettify_string("abc", "_"), "a_b_c", "Test Case 3 Failed: Custom separator");
+    assert_eq(prettify_string("12345", "--"), "1--2--3--4--5", "Test Case 3.1 Failed: Custom separator multiple chars");
+    assert_eq(prettify_string("abc", " ", 0), "a b c", "Test Case 4 Failed: base=0, width=1");
+    assert_eq(prettify_string("abc", " ", 10), " a  b  c", "Test Case 4.1 Failed: base=10, width=2");
+    assert_eq(prettify_string("abc", " ", 100), "  a   b   c", "Test Case 4.2 Failed: base=100, width=3");
+    assert_eq(prettify_string(""), "", "Test Case 5 Failed: Empty string");
+    assert_eq(prettify_string("", "_", 10, true), "", "Test Case 5.1 Failed: Empty string with params");
+    assert_eq(prettify_string("", "_", 10, false), "", "Test Case 5.2 Failed: Empty string, no tabularize");
+    assert_eq(prettify_string("a\0b\0c"), "a $ b $ c", "Test Case 6 Failed: String with null characters (first replaced)");
+    assert_eq(prettify_string("\0test"), "$ t e s t", "Test Case 6.1 Failed: Null at start");
+    assert_eq(prettify_string("test\0"), "t e s t $", "Test Case 6.2 Failed: Null at end");
+    assert_eq(prettify_string("\0\0\0"), "$ $ $", "Test Case 6.3 Failed: Multiple nulls");
+    assert_eq(prettify_string("a"), "a", "Test Case 7 Failed: Single character");
+    assert_eq(prettify_string("a", "-", 10), " a", "Test Case 7.1 Failed: Single character with base=10 (width=2)");
+    assert_eq(prettify_string("a", "-", 0, false), "a", "Test Case 7.2 Failed: Single character, no tabularize");
+    assert_eq(prettify_string("a", " ", -10, true), "  a", "Test Case 8 Failed: Single char, negative base, width=3");
+    assert_eq(prettify_string("bc", " ", 0, true, 11), " b  c", "Test Case 9 Failed: Window of a row of length 11");
+}
+function prettify_array(array, sep = " ", base = 0, length = array.length) {
+    const maxIndexValue = Math.max(0, length + base - 1);
+    const width = ("" + maxIndexValue).toString().length;
+    return Array.from(array, (x)=>pad_left("" + x, ' ', width)).join(sep);
+}
+export function test_prettify_array() {
+    assert_eq(prettify_array([
+        1,
+        22,
+        333
+    ]), "1 22 333", "Test 1 Failed: Basic numbers");
+    assert_eq(prettify_array([
+        1,
+        22,
+        333
+    ], "-"), "1-22-333", "Test 2 Failed: Custom separator");
+    assert_eq(prettify_array([
+        1,
+        22,
+        333
+    ], " ", 1), "1 22 333", "Test 3 Failed: Custom base 1");
+    assert_eq(prettify_array([
+        1,
+        22,
+        333
+    ], " ", 10), " 1 22 333", "Test 3.1 Failed: Custom base 10");
+    assert_eq(prettify_array([]), "", "Test 5 Failed: Empty array");
+    assert_eq(prettify_array([], "-", 10), "", "Test 5.1 Failed: Empty array with custom params");
+    assert_eq(prettify_array([
+        123
+    ]), "123", "Test 6 Failed: Single element");
+    assert_eq(prettify_array([
+        5
+    ]), "5", "Test 6.1 Failed: Single digit single element");
+    assert_eq(prettify_array(Int32Array.of(1, 22, 333)), "1 22 333", "Test 7 Failed: Int32Array input");
+    assert_eq(prettify_array([
+        4,
+        5
+    ], " ", 0, 100), " 4  5", "Test 8 Failed: Window of a row of length 100");
+}
+function prettify_factorization(text, factorization, sep = " ", base = 0, length = text.length) {
+    const n = text.length;
+    const width = String(Math.max(0, length + base - 1)).length;
+    let result = "";
+    for(let i = 0; i < n; ++i){
+        const elementToDisplay = i === n - 1 && text[i] === '\0' ? '$' : text[i];
+        result += pad_left(elementToDisplay, ' ', width);
+        result += factorization[i] ? '|' + sep.substring(1) : sep;
+    }
+    return result;
+}
+export function test_prettify_factorization() {
+    assert_eq(prettify_factorization([
+        "a",
+        "b",
+        "c"
+    ], [
+        false,
+        true,
+        false
+    ]), "a b|c ", "Case 1: Basic functionality");
+    assert_eq(prettify_factorization([
+        "x",
+        "y",
+        "z"
+    ], [
+        true,
+        true,
+        true
+    ]), "x|y|z|", "Case 2: All factors end");
+    assert_eq(prettify_factorization([
+        "1",
+        "2",
+        "3"
+    ], [
+        false,
+        false,
+        false
+    ]), "1 2 3 ", "Case 3: No factors end");
+    assert_eq(prettify_factorization([
+        "single"
+    ], [
+        true
+    ]), "single|", "Case 4: Single element, factor ends");
+    assert_eq(prettify_factorization([
+        "single"
+    ], [
+        false
+    ]), "single ", "Case 5: Single element, factor does not end");
+    assert_eq(prettify_factorization([], []), "", "Case 6: Empty text array");
+    assert_eq(prettify_factorization([
+        "a",
+        "b",
+        "\0"
+    ], [
+        false,
+        false,
+        true
+    ]), "a b $|", "Case 7: Null character at last position");
+    assert_eq(prettify_factorization([
+        "a",
+        "\0",
+        "c"
+    ], [
+        false,
+        true,
+        false
+    ]), "a \0|c ", "Case 8: Null character not at last position");
+    assert_eq(prettify_factorization([
+        "x",
+        "y"
+    ], [
+        false,
+        true
+    ], " -=- "), "x -=- y|-=- ", "Case 9: Custom multi-character separator");
+    assert_eq(prettify_factorization([
+        "p",
+        "q"
+    ], [
+        false,
+        true
+    ], "x"), "pxq|", "Case 10: Custom single-character separator");
+    assert_eq(prettify_factorization([
+        "m",
+        "n"
+    ], [
+        false,
+        true
+    ], ""), "mn|", "Case 11: Empty separator");
+    assert_eq(prettify_factorization([
+        "a",
+        "b",
+        "c"
+    ], Uint8Array.of(0, 1, 0)), "a b|c ", "Case 12: Uint8Array factorization");
+    assert_eq(prettify_factorization([
+        "a",
+        "b"
+    ], [
+        true,
+        false
+    ], " ", 0, 20), " a| b ", "Case 13: Window of a row of length 20");
+}
+function encodeWhitespaces(text) {
+    return text.replace(/\r/g, '\u240d').replace(/\n/g, '\u21b5').replace(/\t/g, '\u2409').replace(/\v/g, '\u240b').replace(/\f/g, '\u240c').replace(/ /g, '\u23b5');
+}
+function decodeWhitespaces(text) {
+    return text.replace(/\u240d/g, '\r').replace(/\u21b5/g, '\n').replace(/\u2409/g, '\t').replace(/\u240b/g, '\v').replace(/\u240c/g, '\f').replace(/\u23b5/g, ' ');
+}
+export function test_whitespace_encoding_decoding() {
+    assert_eq(decodeWhitespaces(""), "", "Test 1: Empty string decode");
+    const noWhitespaceText = "HelloWorld";
+    assert_eq(encodeWhitespaces(noWhitespaceText), noWhitespaceText, "Test 2: No whitespaces encode");
+    const spacesText = "   ";
+    assert_eq(encodeWhitespaces(spacesText), "\u23b5\u23b5\u23b5", "Test 3: Only spaces encode");
+    assert_eq(decodeWhitespaces("\u23b5\u23b5\u23b5"), spacesText, "Test 3: Only spaces decode");
+    const mixedWhitespaceText = "Line1\r\nLine2\tTabbed\vVertical\fFormFeed ";
+    const encodedMixed = encodeWhitespaces(mixedWhitespaceText);
+    const expectedEncoded = "Line1\u240d\u21b5Line2\u2409Tabbed\u240bVertical\u240cFormFeed\u23b5";
+    assert_eq(encodedMixed, expectedEncoded, "Test 4: Mixed whitespaces encode");
+    assert_eq(decodeWhitespaces(expectedEncoded), mixedWhitespaceText, "Test 4: Mixed whitespaces decode");
+    const consecutiveWhitespaceText = " \t\n\r\v\f ";
+    const encodedConsecutive = encodeWhitespaces(consecutiveWhitespaceText);
+    const expectedEncodedConsecutive = "\u23b5\u2409\u21b5\u240d\u240b\u240c\u23b5";
+    assert_eq(encodedConsecutive, expectedEncodedConsecutive, "Test 5: Consecutive whitespaces encode");
+    assert_eq(decodeWhitespaces(expectedEncodedConsecutive), consecutiveWhitespaceText, "Test 5: Consecutive whitespaces decode");
+    const originalText = "Sample text with \r\n various \t whitespace \v characters\f.";
+    const encodedText = encodeWhitespaces(originalText);
+    const decodedText = decodeWhitespaces(encodedText);
+    assert_eq(decodedText, originalText, "Test 6: Round-trip encoding and decoding");
+}
+export function test_utility_edge_cases() {
+    const longString = "a".repeat(10000);
+    assert_eq(number_of_runs(longString), 1, "Long string of same character");
+    const alternating = "ababababab";
+    assert_eq(number_of_runs(alternating), 10, "Alternating characters");
+    const largeArray = new Array(10000).fill(false);
+    largeArray[100] = true;
+    largeArray[500] = true;
+    largeArray[9999] = true;
+    assert_eq(number_of_factors(largeArray), 3, "Large array with few true values");
+    assert_eq(pad_right("hello", "", 10), "hello", "pad_right with empty char");
+    assert_eq(pad_left("hello", "", 10), "hello", "pad_left with empty char");
+    assert_eq(pad_right("hi", "ab", 6), "hiabab", "pad_right with multi-char");
+    assert_eq(pad_left("hi", "ab", 6), "ababhi", "pad_left with multi-char");
+    const result = increment_array([
+        Number.MAX_SAFE_INTEGER
+    ], 1);
+    assert_eq(result[0], Number.MAX_SAFE_INTEGER + 1, "Increment very large number");
+    const validResult = replace_invalid_position([
+        0,
+        1,
+        2,
+        3,
+        4
+    ], 10);
+    assert_eq(validResult, [
+        0,
+        1,
+        2,
+        3,
+        4
+    ], "All valid positions");
+    const withNull = prettify_string("a\0b\0c");
+    assert_eq(withNull.includes("$"), true, "Null characters replaced");
+    const mixedResult = prettify_array([
+        1,
+        "two",
+        3
+    ]);
+    assert_eq(mixedResult.includes("two"), true, "Mixed types handled");
+    const allWhitespace = encodeWhitespaces(" \t\n\r\v\f");
+    assert_eq(allWhitespace.includes(" "), false, "No spaces in encoded");
+    assert_eq(allWhitespace.includes("\t"), false, "No tabs in encoded");
+    assert_eq(allWhitespace.includes("\n"), false, "No newlines in encoded");
+    const original = "hello\tworld\n";
+    const encoded = encodeWhitespaces(original);
+    const decoded = decodeWhitespaces(encoded);
+    assert_eq(decoded, original, "Round trip whitespace encoding");
+    assert_eq(prettify_factorization([], []), "", "Empty factorization");
+    assert_eq(prettify_factorization([
+        "a"
+    ], [
+        true
+    ]), "a|", "Single element factorization");
+}
+function repeat(str, n) {
+    let r = "";
+    while(n-- > 0)r += str;
+    return r;
+}
+function escapeLatex(s) {
+    return String(s).replace(/\\/g, "\\textbackslash{}").replace(/([#$%&_{}])/g, "\\$1");
+}
+function isBoolRow(row) {
+    return typeof row.data[0] === "boolean";
+}
+function isStringRow(row) {
+    return typeof row.data[0] === "string";
+}
+function partitionsFromBool(boolArr) {
+    const parts = [];
+    let len = 0;
+    for(let i = 0; i < boolArr.length; i++){
+        len++;
+        if (boolArr[i]) {
+            parts.push(len);
+            len = 0;
+        }
+    }
+    return parts;
+}
+function* export_latex_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required");
+    }
+    const T = tRow.data;
+    yield `\\begin{tabular}{l|${"c".repeat(n)}}\n\\hline`;
+    for (const row of rows){
+        let line = `\n${escapeLatex(row.name)} & `;
+        let cells = 0;
+        if (isBoolRow(row)) {
+            const parts = partitionsFromBool(row.data);
+            let pos = 0;
+            for(let p = 0; p < parts.length; p++){
+                const k = parts[p];
+                let text = "";
+                for(let i = 0; i < k; i++){
+                    text += escapeLatex(T[pos++]);
+                }
+                line += `\\multicolumn{${k}}{c}{${text}}`;
+                if (p !== parts.length - 1) line += " & ";
+                cells += k;
+                if (cells >= chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        } else {
+            for(let i = 0; i < n; i++){
+                line += escapeLatex(row.data[i]);
+                if (i !== n - 1) line += " & ";
+                if (++cells === chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        }
+        yield line + " \\\\";
+    }
+    yield "\n\\hline\n\\end{tabular}";
+}
+function export_latex(rows) {
+    return Array.from(export_latex_chunks(rows)).join("");
+}
+function* export_markdown_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required for boolean partitions");
+    }
+    const T = tRow.data;
+    let line = "| ";
+    for(let i = 0; i < n; i++){
+        line += "|" + String(i + 1);
+        if ((i + 1) % chunk_cells === 0) {
+            yield line;
+            line = "";
+        }
+    }
+    yield line + "|\n|" + repeat("---|", n + 1);
+    for (const row of rows){
+        line = "\n|" + row.name + "|";
+        if (isBoolRow(row)) {
+            for(let i = 0; i < n; i++){
+                line += T[i];
+                if (row.data[i]) line += "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+            line += "|";
+        } else {
+            for(let i = 0; i < n; i++){
+                line += String(row.data[i]) + "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+        }
+        yield line;
+    }
+}
+function export_markdown(rows) {
+    return Array.from(export_markdown_chunks(rows)).join("");
+}
+function escape_csv(value) {
+    const s = String(value);
+    if (/[",\n]/.test(s)) {
+        return `"${s.replace(/"/g, '""')}"`;
+    }
+    return s;
+}
+function* export_csv_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    for(let r = 0; r < rows.length; r++){
+        const row = rows[r];
+        let line = (r > 0 ? "\n" : "") + escape_csv(row.name);
+        for(let i = 0; i < n; i++){
+            line += "," + escape_csv(String(row.data[i]));
+            if ((i + 1) % chunk_cells === 0) {
+                yield line;
+                line = "";
+            }
+        }
+        yield line;
+    }
+}
+function export_csv(rows) {
+    return Array.from(export_csv_chunks(rows)).join("");
+}
+export function test_export_formats() {
+    const rows = [
+        {
+            name: "T",
+            data: [
+                "a",
+                "b",
+                "c",
+                "d",
+                "e"
+            ]
+        },
+        {
+            name: "F",
+            data: [
+                true,
+                false,
+                true,
+                true,
+                false
+            ]
+        },
+        {
+            name: "N",
+            data: [
+                1,
+                2,
+                3,
+                4,
+                5
+            ]
+        },
+        {
+            name: "S",
+            data: [
+                "one",
+                "two",
+                "three",
+                "four",
+                "five"
+            ]
+        }
+    ];
+    const expectedLatex = `\\begin{tabular}{l|ccccc}
+\\hline
+T & a & b & c & d & e \\\\
+F & \\multicolumn{1}{c}{a} & \\multicolumn{2}{c}{bc} & \\multicolumn{1}{c}{d} \\\\
+N & 1 & 2 & 3 & 4 & 5 \\\\
+S & one & two & three & four & five \\\\
+\\hline
+\\end{tabular}`;
+    const expectedMarkdown = `| |1|2|3|4|5|
+|---|---|---|---|---|---|
+|T|a|b|c|d|e|
+|F|a|bc|d|e|
+|N|1|2|3|4|5|
+|S|one|two|three|four|five|`;
+    const expectedCSV = `T,a,b,c,d,e
+F,true,false,true,true,false
+N,1,2,3,4,5
+S,one,two,three,four,five`;
+    assert_eq(export_latex(rows), expectedLatex, "LaTeX export failed");
+    assert_eq(export_markdown(rows), expectedMarkdown, "Markdown export failed");
+    assert_eq(export_csv(rows), expectedCSV, "CSV export failed");
+    assert_eq(Array.from(export_latex_chunks(rows, 2)).join(""), expectedLatex, "Chunked LaTeX export failed");
+    assert_eq(Array.from(export_markdown_chunks(rows, 2)).join(""), expectedMarkdown, "Chunked markdown export failed");
+    assert_eq(Array.from(export_csv_chunks(rows, 2)).join(""), expectedCSV, "Chunked CSV export failed");
+    assert_eq(Array.from(export_csv_chunks(rows, 2)).length, 12, "CSV rows are split into chunks of two cells");
+}
+function profile_now() {
+    return typeof performance !== 'undefined' ? performance.now() : Date.now();
+}
+function profile_heap() {
+    const env = globalThis;
+    if (env.process && typeof env.process.memoryUsage === 'function') {
+        return env.process.memoryUsage().heapUsed;
+    }
+    if (env.performance && env.performance.memory) {
+        return env.performance.memory.usedJSHeapSize;
+    }
+    return NaN;
+}
+function profile_record(profile, name, value, start_time, start_heap) {
+    const heap = profile_heap();
+    profile.push({
+        name: name,
+        time_ms: profile_now() - start_time,
+        length: value !== null && value !== undefined && typeof value.length === 'number' ? value.length : null,
+        heap_delta: isNaN(heap) || isNaN(start_heap) ? null : heap - start_heap
+    });
+}
+function format_profile(profile) {
+    const sorted = [
+        ...profile
+    ].sort((a, b)=>b.time_ms - a.time_ms);
+    const pad = sorted.reduce((max, entry)=>Math.max(max, entry.name.length), 0);
+    return sorted.map((entry)=>{
+        let line = pad_right(entry.name, ' ', pad) + ' ' + pad_left(entry.time_ms.toFixed(1), ' ', 8) + ' ms';
+        if (entry.length !== null) {
+            line += '  len ' + entry.length;
+        }
+        if (entry.heap_delta !== null) {
+            line += '  heap ' + (entry.heap_delta >= 0 ? '+' : '') + (entry.heap_delta / 1024).toFixed(0) + ' KiB';
+        }
+        return line;
+    }).join('\n');
+}
+export function test_profile() {
+    const profile = [];
+    profile_record(profile, "suffix_array", [
+        2,
+        1,
+        0
+    ], profile_now(), profile_heap());
+    profile_record(profile, "counter_n", 3, profile_now(), NaN);
+    assert_eq(profile.length, 2, "Two profile entries");
+    assert_eq(profile[0].length, 3, "Length of an array structure");
+    assert_eq(profile[1].length, null, "Length of a counter");
+    assert_eq(profile[1].heap_delta, null, "Heap delta without a start value");
+    assert_eq(profile[0].time_ms >= 0, true, "Non-negative time");
+    const formatted = format_profile([
+        {
+            name: "n",
+            time_ms: 0.04,
+            length: null,
+            heap_delta: null
+        },
+        {
+            name: "lpf_array",
+            time_ms: 12.5,
+            length: 100,
+            heap_delta: 2048
+        }
+    ]);
+    assert_eq(formatted, "lpf_array     12.5 ms  len 100  heap +2 KiB\nn              0.0 ms", "Formatted profile");
+}
+function text_hash(text) {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193;
+    for(let i = 0; i < text.length; ++i){
+        const c = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x01000193) ^ h2 >>> 15;
+    }
+    return text.length + ':' + (h1 >>> 0).toString(16) + (h2 >>> 0).toString(16);
+}
+function result_cache_create(capacity) {
+    return {
+        entries: new Map(),
+        size: 0,
+        capacity: capacity,
+        last_text: null,
+        last_key: ''
+    };
+}
+function result_cache_key(cache, text, name) {
+    if (cache.last_text !== text) {
+        cache.last_key = text_hash(text);
+        cache.last_text = text;
+    }
+    return cache.last_key + '\n' + name;
+}
+function result_cache_get(cache, text, name) {
+    const key = result_cache_key(cache, text, name);
+    const entry = cache.entries.get(key);
+    if (entry === undefined || entry.text !== text) {
+        return undefined;
+    }
+    cache.entries.delete(key);
+    cache.entries.set(key, entry);
+    return entry.value;
+}
+function result_cache_set(cache, text, name, value) {
+    if (value === undefined) {
+        return;
+    }
+    const key = result_cache_key(cache, text, name);
+    const size = value !== null && typeof value.length === 'number' ? Math.max(1, value.length) : 1;
+    const old = cache.entries.get(key);
+    if (old !== undefined) {
+        cache.entries.delete(key);
+        cache.size -= old.size;
+    }
+    if (size > cache.capacity) {
+        return;
+    }
+    while(cache.size + size > cache.capacity){
+        const oldest = cache.entries.keys().next().value;
+        cache.size -= cache.entries.get(oldest).size;
+        cache.entries.delete(oldest);
+    }
+    cache.entries.set(key, {
+        text: text,
+        value: value,
+        size: size
+    });
+    cache.size += size;
+}
+export function test_result_cache() {
+    assert_eq(text_hash("banana"), text_hash("ban" + "ana"), "Equal texts hash equally");
+    assert_eq(text_hash("banana") === text_hash("bananb"), false, "Different texts hash differently");
+    const cache = result_cache_create(9);
+    result_cache_set(cache, "banana", "suffix_array", [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ]);
+    result_cache_set(cache, "banana", "counter_n", 6);
+    assert_eq(result_cache_get(cache, "banana", "suffix_array"), [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ], "Cached structure");
+    assert_eq(result_cache_get(cache, "banana", "lcp_array"), undefined, "Missing structure");
+    assert_eq(result_cache_get(cache, "ananas", "suffix_array"), undefined, "Other text");
+    assert_eq(cache.size, 7, "Size counts elements");
+    result_cache_set(cache, "banana", "border_array", [
+        0,
+        0,
+        0
+    ]);
+    assert_eq(result_cache_get(cache, "banana", "counter_n"), undefined, "Least recently used is evicted");
+    assert_eq(result_cache_get(cache, "banana", "border_array"), [
+        0,
+        0,
+        0
+    ], "New structure is cached");
+    result_cache_set(cache, "banana", "border_array", [
+        0,
+        0
+    ]);
+    assert_eq(cache.size, 8, "Replacing a structure updates the size");
+    result_cache_set(cache, "banana", "lcp_array", new Array(10).fill(0));
+    assert_eq(result_cache_get(cache, "banana", "lcp_array"), undefined, "Oversized structures are not cached");
+    assert_eq(result_cache_get(cache, "banana", "suffix_array"), [
+        5,
+        3,
+        1,
+        0,
+        4,
+        2
+    ], "Oversized structures evict nothing");
+}
+
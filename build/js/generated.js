@@ -0,0 +1,3787 @@
+class AlgorithmError extends Error {
+    algorithm;
+    input;
+    constructor(message, algorithm, input){
+        super(message), this.algorithm = algorithm, this.input = input;
+        this.name = 'AlgorithmError';
+    }
+}
+function count_n(text) {
+    return text.length;
+}
+function count_sigma(text) {
+    if (!text) {
+        return 0;
+    }
+    return new Set(text).size;
+}
+function count_period(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 0;
+    }
+    const last_border = border_array[border_array.length - 1];
+    return border_array.length - last_border;
+}
+function count_exponent(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 0;
+    }
+    const period = count_period(border_array);
+    return border_array.length / period;
+}
+function count_regularity(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 'empty';
+    }
+    const n = border_array.length;
+    const last_border = border_array[n - 1];
+    const period = count_period(border_array);
+    const exponent = count_exponent(border_array);
+    if (exponent > 1 && n % period == 0) {
+        if (exponent == 2) {
+            return 'square';
+        }
+        return 'non-primitive';
+    }
+    if (last_border == 0) {
+        return 'unbordered';
+    }
+    return 'primitive';
+}
+function effective_alphabet_ranks(text) {
+    const n = text.length;
+    let max_code = -1;
+    for(let i = 0; i < n; ++i){
+        max_code = Math.max(max_code, text.charCodeAt(i));
+    }
+    const rank_of = new Int32Array(max_code + 1);
+    for(let i = 0; i < n; ++i){
+        rank_of[text.charCodeAt(i)] = 1;
+    }
+    let sigma = 0;
+    for(let c = 0; c < rank_of.length; ++c){
+        if (rank_of[c] !== 0) {
+            rank_of[c] = sigma++;
+        }
+    }
+    const ranks = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        ranks[i] = rank_of[text.charCodeAt(i)];
+    }
+    return [
+        ranks,
+        sigma
+    ];
+}
+function suffix_sort(s, upper) {
+    const n = s.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    if (n === 1) {
+        return Int32Array.of(0);
+    }
+    if (n === 2) {
+        return s[0] < s[1] ? Int32Array.of(0, 1) : Int32Array.of(1, 0);
+    }
+    const sa = new Int32Array(n);
+    const is_s = new Uint8Array(n);
+    for(let i = n - 2; i >= 0; --i){
+        is_s[i] = s[i] === s[i + 1] ? is_s[i + 1] : s[i] < s[i + 1] ? 1 : 0;
+    }
+    const sum_l = new Int32Array(upper + 2);
+    const sum_s = new Int32Array(upper + 2);
+    for(let i = 0; i < n; ++i){
+        if (is_s[i] === 0) {
+            sum_s[s[i]]++;
+        } else {
+            sum_l[s[i] + 1]++;
+        }
+    }
+    for(let c = 0; c <= upper; ++c){
+        sum_s[c] += sum_l[c];
+        if (c < upper) {
+            sum_l[c + 1] += sum_s[c];
+        }
+    }
+    const buf = new Int32Array(upper + 2);
+    function induce(lms) {
+        sa.fill(-1);
+        buf.set(sum_s);
+        for(let k = 0; k < lms.length; ++k){
+            const d = lms[k];
+            if (d !== n) {
+                sa[buf[s[d]]++] = d;
+            }
+        }
+        buf.set(sum_l);
+        sa[buf[s[n - 1]]++] = n - 1;
+        for(let i = 0; i < n; ++i){
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 0) {
+                sa[buf[s[v - 1]]++] = v - 1;
+            }
+        }
+        buf.set(sum_l);
+        for(let i = n - 1; i >= 0; --i){
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 1) {
+                sa[--buf[s[v - 1] + 1]] = v - 1;
+            }
+        }
+    }
+    const lms_map = new Int32Array(n + 1).fill(-1);
+    let m = 0;
+    for(let i = 1; i < n; ++i){
+        if (is_s[i - 1] === 0 && is_s[i] === 1) {
+            lms_map[i] = m++;
+        }
+    }
+    const lms = new Int32Array(m);
+    for(let i = 1, k = 0; i < n; ++i){
+        if (is_s[i - 1] === 0 && is_s[i] === 1) {
+            lms[k++] = i;
+        }
+    }
+    induce(lms);
+    if (m > 0) {
+        const sorted_lms = new Int32Array(m);
+        for(let i = 0, k = 0; i < n; ++i){
+            if (lms_map[sa[i]] !== -1) {
+                sorted_lms[k++] = sa[i];
+            }
+        }
+        const rec_s = new Int32Array(m);
+        let rec_upper = 0;
+        rec_s[lms_map[sorted_lms[0]]] = 0;
+        for(let i = 1; i < m; ++i){
+            let l = sorted_lms[i - 1];
+            let r = sorted_lms[i];
+            const end_l = lms_map[l] + 1 < m ? lms[lms_map[l] + 1] : n;
+            const end_r = lms_map[r] + 1 < m ? lms[lms_map[r] + 1] : n;
+            let same = true;
+            if (end_l - l !== end_r - r) {
+                same = false;
+            } else {
+                while(l < end_l && s[l] === s[r]){
+                    l++;
+                    r++;
+                }
+                if (l === n || s[l] !== s[r]) {
+                    same = false;
+                }
+            }
+            if (!same) {
+                rec_upper++;
+            }
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper;
+        }
+        const rec_sa = suffix_sort(rec_s, rec_upper);
+        for(let i = 0; i < m; ++i){
+            sorted_lms[i] = lms[rec_sa[i]];
+        }
+        induce(sorted_lms);
+    }
+    return sa;
+}
+function cyclic_sort(s, sigma, next) {
+    const n = s.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    const order = new Int32Array(n);
+    const count = new Int32Array(Math.max(n, sigma) + 1);
+    let rank = new Int32Array(n);
+    let buf = new Int32Array(n);
+    function sort_by_rank(input, classes) {
+        count.fill(0, 0, classes + 1);
+        for(let i = 0; i < n; ++i){
+            count[rank[i] + 1]++;
+        }
+        for(let c = 0; c < classes; ++c){
+            count[c + 1] += count[c];
+        }
+        for(let j = 0; j < n; ++j){
+            const i = input[j];
+            order[count[rank[i]]++] = i;
+        }
+    }
+    rank.set(s);
+    for(let i = 0; i < n; ++i){
+        buf[i] = i;
+    }
+    sort_by_rank(buf, sigma);
+    let classes = 0;
+    for(let j = 0; j < n; ++j){
+        if (j > 0 && s[order[j]] !== s[order[j - 1]]) {
+            classes++;
+        }
+        rank[order[j]] = classes;
+    }
+    classes++;
+    let jump = Int32Array.from(next);
+    let inv_jump = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        inv_jump[jump[i]] = i;
+    }
+    let jump_buf = new Int32Array(n);
+    for(let k = 1; classes < n && k < 2 * n; k <<= 1){
+        for(let j = 0; j < n; ++j){
+            buf[j] = inv_jump[order[j]];
+        }
+        sort_by_rank(buf, classes);
+        let c = 0;
+        buf[order[0]] = 0;
+        for(let j = 1; j < n; ++j){
+            const a = order[j - 1];
+            const b = order[j];
+            if (rank[a] !== rank[b] || rank[jump[a]] !== rank[jump[b]]) {
+                c++;
+            }
+            buf[b] = c;
+        }
+        classes = c + 1;
+        [rank, buf] = [
+            buf,
+            rank
+        ];
+        for(let i = 0; i < n; ++i){
+            jump_buf[i] = jump[jump[i]];
+        }
+        [jump, jump_buf] = [
+            jump_buf,
+            jump
+        ];
+        for(let i = 0; i < n; ++i){
+            inv_jump[jump[i]] = i;
+        }
+    }
+    for(let i = 0; i < n; ++i){
+        buf[i] = i;
+    }
+    sort_by_rank(buf, classes);
+    return order;
+}
+function factor_successors(factorization, n) {
+    const next = new Int32Array(n);
+    let factor_start = 0;
+    for(let i = 0; i < n; ++i){
+        if (factorization[i] || i === n - 1) {
+            next[i] = factor_start;
+            factor_start = i + 1;
+        } else {
+            next[i] = i + 1;
+        }
+    }
+    return next;
+}
+function construct_suffix_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return suffix_sort(ranks, sigma - 1);
+}
+function construct_border_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const border = new Int32Array(n);
+    border[0] = 0;
+    for(let i = 1; i < n; i++){
+        let j = border[i - 1];
+        while(j > 0 && text[i] !== text[j]){
+            j = border[j - 1];
+        }
+        if (text[i] === text[j]) {
+            j++;
+        }
+        border[i] = j;
+    }
+    return border;
+}
+function construct_bw_transform(text, rotation_array) {
+    if (!text) {
+        return "";
+    }
+    if (text.length !== rotation_array.length) {
+        throw new AlgorithmError('Invalid input: text must be a string and rotation_array must be an array', 'BWT', {
+            text,
+            rotation_array
+        });
+    }
+    const n = text.length;
+    let result = "";
+    for(let i = 0; i < n; i++){
+        result += text[(rotation_array[i] + n - 1) % n];
+    }
+    return result;
+}
+function construct_first_array(text) {
+    if (!text) {
+        return "";
+    }
+    return [
+        ...text
+    ].sort().join('');
+}
+function construct_index_array(n) {
+    if (!n || n <= 0) {
+        return new Int32Array(0);
+    }
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = i;
+    }
+    return result;
+}
+function construct_rotation_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    const next = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        next[i] = (i + 1) % n;
+    }
+    return cyclic_sort(ranks, sigma, next);
+}
+function construct_inverse_suffix_array(suffix_array) {
+    if (!suffix_array) {
+        return new Int32Array(0);
+    }
+    const result = new Int32Array(suffix_array.length);
+    for(let i = 0; i < suffix_array.length; i++){
+        result[suffix_array[i]] = i;
+    }
+    return result;
+}
+function construct_phi_array(suffix_array, inverse_suffix_array) {
+    const n = suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        if (inverse_suffix_array[i] !== 0) {
+            result[i] = suffix_array[inverse_suffix_array[i] - 1];
+        } else {
+            result[i] = n;
+        }
+    }
+    return result;
+}
+function construct_inverse_phi_array(suffix_array, inverse_suffix_array) {
+    if (!suffix_array || !inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        if (inverse_suffix_array[i] + 1 !== n) {
+            result[i] = suffix_array[inverse_suffix_array[i] + 1];
+        } else {
+            result[i] = n;
+        }
+    }
+    return result;
+}
+function lcp_query(text, index1, index2) {
+    if (!text || index1 < 0 || index2 < 0 || index1 >= text.length || index2 >= text.length) {
+        return 0;
+    }
+    let lcp = 0;
+    const maxLength = Math.min(text.length - index1, text.length - index2);
+    for(let k = 0; k < maxLength; ++k){
+        if (text[index1 + k] === text[index2 + k]) {
+            lcp++;
+        } else {
+            break;
+        }
+    }
+    return lcp;
+}
+function build_range_min_table(values) {
+    const n = values.length;
+    const levels = [
+        Int32Array.from(values)
+    ];
+    for(let width = 1; 2 * width <= n; width *= 2){
+        const prev = levels[levels.length - 1];
+        const level = new Int32Array(n - 2 * width + 1);
+        for(let i = 0; i < level.length; i++){
+            level[i] = Math.min(prev[i], prev[i + width]);
+        }
+        levels.push(level);
+    }
+    return levels;
+}
+function range_min_query(levels, left, right) {
+    const level = 31 - Math.clz32(right - left + 1);
+    const table = levels[level];
+    return Math.min(table[left], table[right - (1 << level) + 1]);
+}
+function construct_lcp_array(text, suffix_array, inverse_suffix_array) {
+    if (!text || !suffix_array || !inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    const result = new Int32Array(n);
+    let lcp = 0;
+    for(let i = 0; i < n; i++){
+        const rank = inverse_suffix_array[i];
+        if (rank === 0) {
+            lcp = 0;
+            continue;
+        }
+        const j = suffix_array[rank - 1];
+        while(i + lcp < n && j + lcp < n && text.charCodeAt(i + lcp) === text.charCodeAt(j + lcp)){
+            lcp++;
+        }
+        result[rank] = lcp;
+        if (lcp > 0) {
+            lcp--;
+        }
+    }
+    return result;
+}
+function count_lcp_array(lcp_array) {
+    if (!lcp_array) {
+        return 0;
+    }
+    let sum = 0;
+    for(let i = 0; i < lcp_array.length; i++){
+        sum += lcp_array[i];
+    }
+    return sum;
+}
+function construct_plcp_array(inverse_suffix_array, lcp_array) {
+    if (!inverse_suffix_array || !lcp_array) {
+        return new Int32Array(0);
+    }
+    if (inverse_suffix_array.length !== lcp_array.length) {
+        throw new AlgorithmError("Inverse suffix array and LCP array must have the same length.", "PLCP", {
+            inverse_suffix_array,
+            lcp_array
+        });
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = lcp_array[inverse_suffix_array[i]];
+    }
+    return result;
+}
+function construct_psi_array(suffix_array, inverse_suffix_array) {
+    if (!suffix_array || !inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = suffix_array[i] + 1 < n ? inverse_suffix_array[suffix_array[i] + 1] : n;
+    }
+    return result;
+}
+function construct_lyndon_factorization(text, inverse_suffix_array) {
+    if (!text || !inverse_suffix_array) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    if (n === 0) {
+        return new Uint8Array(0);
+    }
+    const result = new Uint8Array(n);
+    if (inverse_suffix_array.length < n) {
+        throw new AlgorithmError(`Inverse suffix array (inverse_suffix_array) must have a length of at least text.length (${n}), but got ${inverse_suffix_array.length}.`, "LynF", {
+            text,
+            inverse_suffix_array
+        });
+    }
+    let inverse_suffix_arrayval = inverse_suffix_array[0];
+    for(let i = 0; i + 1 < n; ++i){
+        if (inverse_suffix_arrayval > inverse_suffix_array[i + 1]) {
+            result[i] = 1;
+            inverse_suffix_arrayval = inverse_suffix_array[i + 1];
+        }
+    }
+    result[n - 1] = 1;
+    return result;
+}
+function delta(substring_complexity) {
+    if (substring_complexity.length === 0) {
+        throw new AlgorithmError("Input array 'substring_complexity' cannot be empty.", "delta", {
+            substring_complexity
+        });
+    }
+    let bestlength = 1;
+    let bestval = substring_complexity[0];
+    for(let i = 1; i < substring_complexity.length; ++i){
+        const currentRatio = substring_complexity[i] / (i + 1);
+        if (currentRatio > bestval) {
+            bestlength = i + 1;
+            bestval = currentRatio;
+        }
+    }
+    return [
+        bestlength,
+        bestval
+    ];
+}
+function count_delta(substring_complexity) {
+    if (!substring_complexity) {
+        return 0;
+    }
+    return delta(substring_complexity)[1];
+}
+function count_delta_argmax(substring_complexity) {
+    if (!substring_complexity) {
+        return 0;
+    }
+    return delta(substring_complexity)[0];
+}
+function construct_substring_complexity(lcp_array) {
+    if (!lcp_array) {
+        return new Int32Array(0);
+    }
+    const n = lcp_array.length;
+    const ret = new Int32Array(n);
+    const c = new Map();
+    for(let i = 0; i < n; i++){
+        c.set(lcp_array[i], (c.get(lcp_array[i]) || 0) + 1);
+    }
+    let count = 0;
+    for(let i = n; i >= 1; --i){
+        count += 1;
+        if (c.has(i)) {
+            count -= c.get(i);
+        }
+        ret[i - 1] = count;
+    }
+    return ret;
+}
+function conjugate_string(text, shift) {
+    if (!text) {
+        return "";
+    }
+    if (shift < 0 || shift > text.length) {
+        throw new AlgorithmError("Shift value must be between 0 and the length of the string.", "conjugate_string", {
+            text,
+            shift
+        });
+    }
+    if (text.length === 0 || shift === 0) {
+        return text;
+    }
+    return text.substring(shift) + text.substring(0, shift);
+}
+function select_query(text, pattern, nth) {
+    if (!text) {
+        return -1;
+    }
+    if (nth <= 0) {
+        throw new AlgorithmError("The 'nth' parameter must be a positive integer for 1-based indexing.", "select_query", {
+            text,
+            pattern,
+            nth
+        });
+    }
+    let pos = -1;
+    for(let k = 0; k < nth; ++k){
+        if (typeof text === 'string') {
+            pos = text.indexOf(pattern, pos + 1);
+        } else {
+            pos = text.indexOf(pattern, pos + 1);
+        }
+        if (pos === -1) {
+            return -1;
+        }
+    }
+    return pos;
+}
+function rank_query(text, pattern, index) {
+    if (!text) {
+        return 0;
+    }
+    const prefix = text.slice(0, index);
+    return [
+        ...prefix
+    ].filter((c)=>c === pattern).length;
+}
+function popcount32(x) {
+    x = x - (x >>> 1 & 0x55555555);
+    x = (x & 0x33333333) + (x >>> 2 & 0x33333333);
+    x = x + (x >>> 4) & 0x0f0f0f0f;
+    return Math.imul(x, 0x01010101) >>> 24;
+}
+function build_bit_rank_select(bits) {
+    const n = bits.length;
+    const words = new Uint32Array(n + 31 >>> 5);
+    for(let i = 0; i < n; ++i){
+        if (bits[i]) {
+            words[i >>> 5] |= 1 << (i & 31);
+        }
+    }
+    const word_ranks = new Int32Array(words.length + 1);
+    for(let w = 0; w < words.length; ++w){
+        word_ranks[w + 1] = word_ranks[w] + popcount32(words[w]);
+    }
+    return {
+        words,
+        word_ranks
+    };
+}
+function bit_rank(rs, index) {
+    if (index <= 0) {
+        return 0;
+    }
+    const word = index >>> 5;
+    if (word >= rs.words.length) {
+        return rs.word_ranks[rs.words.length];
+    }
+    const offset = index & 31;
+    return rs.word_ranks[word] + (offset === 0 ? 0 : popcount32(rs.words[word] & 0xffffffff >>> 32 - offset));
+}
+function bit_select(rs, nth) {
+    const words = rs.words.length;
+    if (nth <= 0 || nth > rs.word_ranks[words]) {
+        return -1;
+    }
+    let low = 0;
+    let high = words - 1;
+    while(low < high){
+        const mid = low + high + 1 >>> 1;
+        if (rs.word_ranks[mid] < nth) {
+            low = mid;
+        } else {
+            high = mid - 1;
+        }
+    }
+    let word = rs.words[low];
+    for(let k = nth - rs.word_ranks[low]; k > 1; --k){
+        word &= word - 1;
+    }
+    return (low << 5) + 31 - Math.clz32(word & -word);
+}
+function build_char_rank_select(text) {
+    const n = text.length;
+    const occurrences = new Map();
+    const local_ranks = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let positions = occurrences.get(text[i]);
+        if (positions === undefined) {
+            positions = [];
+            occurrences.set(text[i], positions);
+        }
+        local_ranks[i] = positions.length;
+        positions.push(i);
+    }
+    return {
+        occurrences,
+        local_ranks
+    };
+}
+function char_rank(rs, c, index) {
+    const positions = rs.occurrences.get(c);
+    if (positions === undefined) {
+        return 0;
+    }
+    let low = 0;
+    let high = positions.length;
+    while(low < high){
+        const mid = low + high >>> 1;
+        if (positions[mid] < index) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+function char_select(rs, c, nth) {
+    const positions = rs.occurrences.get(c);
+    if (positions === undefined || nth <= 0 || nth > positions.length) {
+        return -1;
+    }
+    return positions[nth - 1];
+}
+function construct_lf_array(first_array, bw_transform) {
+    if (!first_array || !bw_transform) {
+        return new Int32Array(0);
+    }
+    if (first_array.length !== bw_transform.length) {
+        throw new AlgorithmError("First array and BWT must have the same length.", "LF", {
+            first_array,
+            bw_transform
+        });
+    }
+    const n = first_array.length;
+    const result = new Int32Array(n);
+    const bwt_rs = build_char_rank_select(bw_transform);
+    const first_rs = build_char_rank_select(first_array);
+    for(let i = 0; i < n; ++i){
+        const c = bw_transform[i];
+        const crank = bwt_rs.local_ranks[i] + 1;
+        result[i] = char_select(first_rs, c, crank);
+    }
+    return result;
+}
+function construct_sl_string(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const result = new Array(n);
+    let type = 'S';
+    result[n - 1] = type;
+    for(let i = n - 2; i >= 0; --i){
+        if (text[i + 1] > text[i]) {
+            type = 'S';
+        } else if (text[i + 1] < text[i]) {
+            type = 'L';
+            if (result[i + 1] == 'S') {
+                result[i + 1] = 'S*';
+            }
+        }
+        result[i] = type;
+    }
+    if (result[0] == 'S') {
+        result[0] = 'S*';
+    }
+    return result;
+}
+function construct_lpf_array(suffix_array, lcp_array) {
+    if (!suffix_array || !lcp_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const stack = new Int32Array(n);
+    const stack_lcp = new Int32Array(n);
+    const previous_lcp = new Int32Array(n);
+    let top = 0;
+    for(let r = 0; r < n; r++){
+        let lcp = r > 0 ? lcp_array[r] : 0;
+        while(top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]){
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        previous_lcp[r] = top > 0 ? lcp : 0;
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+    const result = new Int32Array(n);
+    top = 0;
+    for(let r = n - 1; r >= 0; r--){
+        let lcp = r + 1 < n ? lcp_array[r + 1] : 0;
+        while(top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]){
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        result[suffix_array[r]] = Math.max(previous_lcp[r], top > 0 ? lcp : 0);
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+    return result;
+}
+function lpf_array_of(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const suffix_array = construct_suffix_array(text);
+    return construct_lpf_array(suffix_array, construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array)));
+}
+function construct_lpnf_array(suffix_array, inverse_suffix_array, lcp_array) {
+    if (!suffix_array || !inverse_suffix_array || !lcp_array) {
+        return new Int32Array(0);
+    }
+    const n = suffix_array.length;
+    const lcp_table = build_range_min_table(lcp_array);
+    const sa_table = build_range_min_table(suffix_array);
+    function has_previous_occurrence(i, length) {
+        if (length > i || i + length > n) {
+            return false;
+        }
+        const rank = inverse_suffix_array[i];
+        let low = 0;
+        let high = rank;
+        while(low < high){
+            const mid = low + high >>> 1;
+            if (range_min_query(lcp_table, mid + 1, rank) >= length) {
+                high = mid;
+            } else {
+                low = mid + 1;
+            }
+        }
+        const left = low;
+        low = rank;
+        high = n - 1;
+        while(low < high){
+            const mid = low + high + 1 >>> 1;
+            if (range_min_query(lcp_table, rank + 1, mid) >= length) {
+                low = mid;
+            } else {
+                high = mid - 1;
+            }
+        }
+        return range_min_query(sa_table, left, low) <= i - length;
+    }
+    const result = new Int32Array(n);
+    let length = 0;
+    for(let i = 0; i < n; i++){
+        length = Math.max(length - 1, 0);
+        while(has_previous_occurrence(i, length + 1)){
+            length++;
+        }
+        result[i] = length;
+    }
+    return result;
+}
+function lpnf_array_of(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const suffix_array = construct_suffix_array(text);
+    const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+    return construct_lpnf_array(suffix_array, inverse_suffix_array, construct_lcp_array(text, suffix_array, inverse_suffix_array));
+}
+function construct_lnf_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const revtext = text.split('').reverse().join('');
+    const lpfarray = lpf_array_of(revtext);
+    return lpfarray.reverse();
+}
+function greedy_factorize(factor_array) {
+    if (!factor_array) {
+        return new Uint8Array(0);
+    }
+    const n = factor_array.length;
+    if (n === 0) {
+        return new Uint8Array(0);
+    }
+    const result = new Uint8Array(n);
+    for(let i = 0; i < n;){
+        const currentFactor = factor_array[i];
+        let distance = currentFactor === 0 ? 1 : currentFactor;
+        result[i + distance - 1] = 1;
+        i += distance;
+    }
+    return result;
+}
+function construct_lzss_factorization(lpf_array) {
+    return greedy_factorize(lpf_array);
+}
+function construct_lzssno_factorization(lpnf_array) {
+    return greedy_factorize(lpnf_array);
+}
+function greedy_factorize_with_new_letter(factor_array) {
+    if (!factor_array) {
+        return new Uint8Array(0);
+    }
+    const n = factor_array.length;
+    if (n === 0) {
+        return new Uint8Array(0);
+    }
+    const result = new Uint8Array(n);
+    for(let i = 0; i < n;){
+        const currentFactor = factor_array[i];
+        let distance = currentFactor === 0 ? 1 : Math.min(currentFactor + 1, n - i);
+        result[i + distance - 1] = 1;
+        i += distance;
+    }
+    return result;
+}
+function construct_lz77_factorization(lpf_array) {
+    return greedy_factorize_with_new_letter(lpf_array);
+}
+function construct_reverse_lzss_factorization(lnf_array) {
+    if (!lnf_array) {
+        return new Uint8Array(0);
+    }
+    const copied_lnf_array = Int32Array.from(lnf_array).reverse();
+    return greedy_factorize(copied_lnf_array);
+}
+function construct_lexparse_factorization(plcp_array) {
+    return greedy_factorize(plcp_array);
+}
+function construct_nss_array(inverse_suffix_array) {
+    if (!inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let nss = i + 1;
+        while(nss < n && inverse_suffix_array[nss] > inverse_suffix_array[i]){
+            ++nss;
+        }
+        result[i] = nss >= n ? n : nss;
+    }
+    return result;
+}
+function construct_pss_array(inverse_suffix_array) {
+    if (!inverse_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let pss = i - 1;
+        while(pss >= 0 && inverse_suffix_array[pss] > inverse_suffix_array[i]){
+            --pss;
+        }
+        result[i] = pss < 0 ? n : pss;
+    }
+    return result;
+}
+function construct_lyndon_array(nss_array) {
+    if (!nss_array) {
+        return new Int32Array(0);
+    }
+    const n = nss_array.length;
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        result[i] = nss_array[i] === n ? n - i : nss_array[i] - i;
+    }
+    return result;
+}
+function least_rotation(text) {
+    const n = text.length;
+    let i = 0;
+    let j = 1;
+    let k = 0;
+    while(i < n && j < n && k < n){
+        const a = text.charCodeAt((i + k) % n);
+        const b = text.charCodeAt((j + k) % n);
+        if (a === b) {
+            ++k;
+            continue;
+        }
+        if (a > b) {
+            i += k + 1;
+        } else {
+            j += k + 1;
+        }
+        if (i === j) {
+            ++j;
+        }
+        k = 0;
+    }
+    return Math.min(i, j);
+}
+function construct_necklace_conjugate_transform(text) {
+    if (!text) {
+        return "";
+    }
+    return conjugate_string(text, least_rotation(text));
+}
+function construct_invert_transform(text) {
+    if (!text) return "";
+    const alphabet = Array.from(new Set([
+        ...text
+    ])).sort();
+    const sigma = alphabet.length;
+    const map = new Map();
+    for(let r = 0; r < sigma; r++){
+        map.set(alphabet[r], alphabet[sigma - 1 - r]);
+    }
+    return [
+        ...text
+    ].map((c)=>map.get(c) ?? c).join("");
+}
+function construct_revert_transform(text) {
+    if (!text) {
+        return "";
+    }
+    return text.split('').reverse().join('');
+}
+function phrases_from_factorizations(text, factorization) {
+    if (!text || !factorization) {
+        return [];
+    }
+    const n = text.length;
+    const phrases = [];
+    let old_pos = 0;
+    for(let i = 0; i < n; ++i){
+        if (factorization[i]) {
+            let factor = text.slice(old_pos, i + 1);
+            old_pos = i + 1;
+            phrases.push(factor);
+        }
+    }
+    return phrases;
+}
+function omega_order(strA, strB) {
+    if (strA === undefined || strB === undefined) {
+        throw new AlgorithmError("Undefined string input(s) for omega order comparison.", "OmegaOrder", {
+            strA,
+            strB
+        });
+    }
+    if (strA === strB) {
+        return 0;
+    }
+    const maxLength = Math.max(strA.length, strB.length) * 3;
+    for(let i = 0; i < maxLength; ++i){
+        if (strA[i % strA.length] < strB[i % strB.length]) {
+            return -1;
+        }
+        if (strA[i % strA.length] > strB[i % strB.length]) {
+            return +1;
+        }
+    }
+    return strA.length < strB.length ? -1 : +1;
+}
+function construct_circular_suffix_array(text, lyndon_factorization) {
+    if (!text || !lyndon_factorization) {
+        return new Int32Array(0);
+    }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return cyclic_sort(ranks, sigma, factor_successors(lyndon_factorization, text.length));
+}
+function construct_inverse_circular_suffix_array(circular_suffix_array) {
+    if (!circular_suffix_array) {
+        return new Int32Array(0);
+    }
+    return construct_inverse_suffix_array(circular_suffix_array);
+}
+function construct_bbw_indices(lyndon_factorization, circular_suffix_array) {
+    if (!lyndon_factorization || !circular_suffix_array) {
+        return new Int32Array(0);
+    }
+    const n = circular_suffix_array.length;
+    const next = factor_successors(lyndon_factorization, n);
+    const previous = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        previous[next[i]] = i;
+    }
+    const result = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        result[i] = previous[circular_suffix_array[i]];
+    }
+    return result;
+}
+function construct_bbw_transform(text, bbw_indices) {
+    if (!text || !bbw_indices) {
+        return "";
+    }
+    return [
+        ...bbw_indices
+    ].map((pos)=>text[pos]).join('');
+}
+function construct_inverse_bbw_transform(bbw_transform) {
+    if (!bbw_transform) {
+        return "";
+    }
+    let n = bbw_transform.length;
+    var farray = construct_first_array(bbw_transform);
+    const farray_rs = build_char_rank_select(farray);
+    const bbwt_rs = build_char_rank_select(bbw_transform);
+    var marking = new Array(n).fill(0);
+    var conjugates = [];
+    for(let bbwt_init_position = 0; bbwt_init_position < n; ++bbwt_init_position){
+        let conjugate = [];
+        if (marking[bbwt_init_position] == true) {
+            continue;
+        }
+        var pos = bbwt_init_position;
+        while(marking[pos] == false){
+            marking[pos] = true;
+            conjugate.push(bbw_transform[pos]);
+            let cur_char = farray[pos];
+            let character_number = farray_rs.local_ranks[pos] + 1;
+            pos = char_select(bbwt_rs, cur_char, character_number);
+            if (pos === -1) {
+                throw new AlgorithmError('character_number exceeds occurrences in inverse BBWT', 'construct_inverse_bbw_transform', bbw_transform);
+            }
+        }
+        const cycle = conjugate.join('');
+        conjugates.push(conjugate_string(cycle, least_rotation(cycle)));
+    }
+    conjugates.sort();
+    conjugates.reverse();
+    return conjugates.join('');
+}
+function random_ternary_string(length) {
+    const ternaryChars = 'abc';
+    let result = '';
+    for(let i = 0; i < length; i++){
+        const randomIndex = Math.floor(Math.random() * ternaryChars.length);
+        result += ternaryChars.charAt(randomIndex);
+    }
+    return result;
+}
+function construct_lz78_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const factorization = new Uint8Array(n);
+    const dictionary = new Map();
+    let currentIndex = 0;
+    while(currentIndex < n){
+        let currentSubstring = "";
+        for(let j = currentIndex; j < n; j++){
+            currentSubstring += text[j];
+            if (!dictionary.has(currentSubstring)) {
+                break;
+            }
+        }
+        const newFactor = currentSubstring;
+        dictionary.set(newFactor, currentIndex);
+        factorization[currentIndex + newFactor.length - 1] = 1;
+        currentIndex += newFactor.length;
+    }
+    return factorization;
+}
+function construct_lzw_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const factorization = new Uint8Array(n);
+    const dictionary = new Map();
+    for(let i = 0; i < n; i++){
+        const char = text[i];
+        if (!dictionary.has(char)) {
+            dictionary.set(char, dictionary.size);
+        }
+    }
+    for(let i = 0; i < n;){
+        let s = "";
+        for(let j = i; j < n; j++){
+            s += text[j];
+            if (!dictionary.has(s)) {
+                s = s.slice(0, -1);
+                break;
+            }
+        }
+        let endpos = i + s.length - 1;
+        if (endpos >= n) {
+            factorization[n - 1] = 1;
+            break;
+        }
+        if (s.length == 0) {
+            throw new AlgorithmError("LZW factorization failed to find a valid substring.", "construct_lzw_factorization", {
+                text
+            });
+        }
+        factorization[endpos] = 1;
+        if (i + s.length < n) {
+            s += text[i + s.length];
+        }
+        if (!dictionary.has(s)) {
+            dictionary.set(s, dictionary.size);
+        }
+        i = endpos + 1;
+    }
+    return factorization;
+}
+function construct_necklace_factorization(text, lyndon_factorization) {
+    if (!text || !lyndon_factorization) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const necklace_factorization = new Uint8Array(n);
+    let factor_start = 0;
+    let last_factor = "";
+    while(factor_start < n){
+        let factor_end = factor_start;
+        while(factor_end < n && !lyndon_factorization[factor_end]){
+            factor_end++;
+        }
+        const current_factor = text.slice(factor_start, factor_end + 1);
+        if (current_factor === last_factor) {
+            necklace_factorization[factor_start - 1] = 0;
+            necklace_factorization[factor_end] = 1;
+            factor_start = factor_end + 1;
+            continue;
+        }
+        last_factor = current_factor;
+        necklace_factorization[factor_end] = 1;
+        factor_start = factor_end + 1;
+    }
+    return necklace_factorization;
+}
+function construct_odd_maximal_palindromic_length_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const o_pali = new Int32Array(n);
+    let center = 0;
+    let right = 0;
+    for(let i = 0; i < n; i++){
+        let mirror = 2 * center - i;
+        if (i < right) {
+            o_pali[i] = Math.min(right - i, o_pali[mirror]);
+        }
+        while(i - o_pali[i] - 1 >= 0 && i + o_pali[i] + 1 < n && text[i - o_pali[i] - 1] === text[i + o_pali[i] + 1]){
+            o_pali[i]++;
+        }
+        if (i + o_pali[i] > right) {
+            center = i;
+            right = i + o_pali[i];
+        }
+    }
+    return o_pali;
+}
+function construct_even_maximal_palindromic_length_array(text) {
+    if (!text) {
+        return new Int32Array(0);
+    }
+    const n = text.length;
+    const e_pali = new Int32Array(n);
+    let center = 0;
+    let right = 0;
+    for(let i = 0; i < n; i++){
+        let mirror = 2 * center - i + 1;
+        if (i < right) {
+            e_pali[i] = Math.min(right - i, e_pali[mirror]);
+        }
+        while(i - e_pali[i] - 1 >= 0 && i + e_pali[i] < n && text[i - e_pali[i] - 1] === text[i + e_pali[i]]){
+            e_pali[i]++;
+        }
+        if (i + e_pali[i] > right) {
+            center = i - 1;
+            right = i + e_pali[i];
+        }
+    }
+    return e_pali;
+}
+function get_lzend_reference(text, substring, factorization) {
+    let startIndex = 0;
+    while((startIndex = text.indexOf(substring, startIndex)) !== -1){
+        if (factorization[startIndex + substring.length - 1]) {
+            return startIndex;
+        }
+        startIndex += substring.length;
+    }
+    return -1;
+}
+function construct_lzend_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const factorization = new Uint8Array(n);
+    for(let i = 0; i < n;){
+        let factor = "";
+        let s = "";
+        const prefix = text.slice(0, i);
+        for(let j = i; j < n; j++){
+            s += text[j];
+            if (prefix.indexOf(s) === -1) {
+                break;
+            }
+            if (get_lzend_reference(prefix, s, factorization) !== -1) {
+                factor = s;
+            }
+        }
+        if (!factor) {
+            factor = text[i];
+        } else {
+            factor += text[i + factor.length - 1];
+        }
+        let endpos = i + factor.length - 1;
+        if (endpos >= n) {
+            factorization[n - 1] = 1;
+            break;
+        }
+        factorization[endpos] = 1;
+        i = endpos + 1;
+    }
+    return factorization;
+}
+function is_stringattractor(text, attractor) {
+    const n = text.length;
+    const marked = new Array(n).fill(false);
+    for (const p of attractor){
+        if (p >= 0 && p < n) {
+            marked[p] = true;
+        }
+    }
+    const attractor_rs = build_bit_rank_select(marked);
+    for(let i = 0; i < n; i++){
+        let s = '';
+        for(let j = i; j < n; j++){
+            s += text[j];
+            let hit = false;
+            for(let k = 0; k + s.length <= n; k++){
+                if (text.slice(k, k + s.length) === s && bit_rank(attractor_rs, k + s.length) > bit_rank(attractor_rs, k)) {
+                    hit = true;
+                }
+                if (hit) break;
+            }
+            if (!hit) return false;
+        }
+    }
+    return true;
+}
+function construct_gamma_factorization(text) {
+    if (!text) {
+        return new Uint8Array(0);
+    }
+    const n = text.length;
+    const freq = new Map();
+    for(let i = 0; i < n; i++){
+        let s = '';
+        for(let j = i; j < n; j++){
+            s += text[j];
+            freq.set(s, (freq.get(s) || 0) + 1);
+        }
+    }
+    const minimal = [];
+    for (const [s, f] of freq.entries()){
+        let minimalFlag = true;
+        for(let i = 0; i < s.length && minimalFlag; i++){
+            const t = s.slice(0, i) + s.slice(i + 1);
+            if (t.length > 0 && freq.get(t) <= f) {
+                minimalFlag = false;
+            }
+        }
+        if (minimalFlag) minimal.push(s);
+    }
+    const hits = minimal.map((s)=>{
+        const set = new Set();
+        for(let i = 0; i + s.length <= n; i++){
+            if (text.slice(i, i + s.length) === s) {
+                for(let p = i; p < i + s.length; p++){
+                    set.add(p);
+                }
+            }
+        }
+        return set;
+    });
+    const positions = [
+        ...Array(n).keys()
+    ];
+    function backtrack(idx, chosen, best) {
+        if (best.size > 0 && chosen.size >= best.size) return new Set();
+        let ok = true;
+        for (const h of hits){
+            let covered = false;
+            for (const p of chosen){
+                if (h.has(p)) {
+                    covered = true;
+                    break;
+                }
+            }
+            if (!covered) {
+                ok = false;
+                break;
+            }
+        }
+        if (ok) {
+            return new Set(chosen);
+        }
+        if (idx === positions.length) {
+            return new Set();
+        }
+        chosen.add(positions[idx]);
+        var res = backtrack(idx + 1, chosen, best);
+        best = res.size > 0 ? res : best;
+        chosen.delete(positions[idx]);
+        var res = backtrack(idx + 1, chosen, best);
+        best = res.size > 0 ? res : best;
+        return best;
+    }
+    const ret = backtrack(0, new Set(), new Set());
+    const result = new Uint8Array(n);
+    ret.forEach((val)=>result[val] = 1);
+    return result;
+}
+function factorization_to_positions(factorization) {
+    const positions = [];
+    for(let i = 0; i < factorization.length; i++){
+        if (factorization[i]) {
+            positions.push(i);
+        }
+    }
+    return positions;
+}
+// === Structure flags ===
+// Each structure owns one bit of a word array: [word index, bit mask].
+var structure_flag_words = 3;
+var structure_flags = {
+	counter_n: [0, 1 << 0],
+	counter_sigma: [0, 1 << 1],
+	suffix_array: [0, 1 << 2],
+	border_array: [0, 1 << 3],
+	first_array: [0, 1 << 4],
+	index_array: [0, 1 << 5],
+	rotation_array: [0, 1 << 6],
+	sl_string: [0, 1 << 7],
+	lnf_array: [0, 1 << 8],
+	necklace_conjugate_transform: [0, 1 << 9],
+	invert_transform: [0, 1 << 10],
+	revert_transform: [0, 1 << 11],
+	lz78_factorization: [0, 1 << 12],
+	lzw_factorization: [0, 1 << 13],
+	odd_maximal_palindromic_length_array: [0, 1 << 14],
+	even_maximal_palindromic_length_array: [0, 1 << 15],
+	lzend_factorization: [0, 1 << 16],
+	gamma_factorization: [0, 1 << 17],
+	inverse_suffix_array: [0, 1 << 18],
+	counter_period: [0, 1 << 19],
+	counter_exponent: [0, 1 << 20],
+	counter_regularity: [0, 1 << 21],
+	bw_transform: [0, 1 << 22],
+	reverse_lzss_factorization: [0, 1 << 23],
+	counter_necklace_conjugate_transform: [0, 1 << 24],
+	counter_invert_transform: [0, 1 << 25],
+	counter_revert_transform: [0, 1 << 26],
+	counter_lz78_factorization: [0, 1 << 27],
+	counter_lzw_factorization: [0, 1 << 28],
+	counter_lzend_factorization: [0, 1 << 29],
+	counter_gamma_factorization: [0, 1 << 30],
+	phi_array: [0, 1 << 31],
+	inverse_phi_array: [1, 1 << 0],
+	lcp_array: [1, 1 << 1],
+	psi_array: [1, 1 << 2],
+	lyndon_factorization: [1, 1 << 3],
+	nss_array: [1, 1 << 4],
+	pss_array: [1, 1 << 5],
+	lf_array: [1, 1 << 6],
+	counter_bw_transform: [1, 1 << 7],
+	counter_reverse_lzss_factorization: [1, 1 << 8],
+	counter_lcp_array: [1, 1 << 9],
+	plcp_array: [1, 1 << 10],
+	substring_complexity: [1, 1 << 11],
+	lpf_array: [1, 1 << 12],
+	lpnf_array: [1, 1 << 13],
+	circular_suffix_array: [1, 1 << 14],
+	necklace_factorization: [1, 1 << 15],
+	counter_lyndon_factorization: [1, 1 << 16],
+	lyndon_array: [1, 1 << 17],
+	lexparse_factorization: [1, 1 << 18],
+	counter_delta: [1, 1 << 19],
+	counter_delta_argmax: [1, 1 << 20],
+	lzss_factorization: [1, 1 << 21],
+	lz77_factorization: [1, 1 << 22],
+	lzssno_factorization: [1, 1 << 23],
+	inverse_circular_suffix_array: [1, 1 << 24],
+	bbw_indices: [1, 1 << 25],
+	counter_necklace_factorization: [1, 1 << 26],
+	counter_lexparse_factorization: [1, 1 << 27],
+	counter_lzss_factorization: [1, 1 << 28],
+	counter_lz77_factorization: [1, 1 << 29],
+	counter_lzssno_factorization: [1, 1 << 30],
+	bbw_transform: [1, 1 << 31],
+	inverse_bbw_transform: [2, 1 << 0],
+	counter_bbw_transform: [2, 1 << 1],
+	counter_inverse_bbw_transform: [2, 1 << 2]
+};
+// === Dependency closure: flag words of each structure and everything it is built from ===
+var structure_closure = {
+	counter_n: [0x00000001, 0x00000000, 0x00000000],
+	counter_sigma: [0x00000002, 0x00000000, 0x00000000],
+	suffix_array: [0x00000004, 0x00000000, 0x00000000],
+	border_array: [0x00000008, 0x00000000, 0x00000000],
+	first_array: [0x00000010, 0x00000000, 0x00000000],
+	index_array: [0x00000020, 0x00000000, 0x00000000],
+	rotation_array: [0x00000040, 0x00000000, 0x00000000],
+	sl_string: [0x00000080, 0x00000000, 0x00000000],
+	lnf_array: [0x00000100, 0x00000000, 0x00000000],
+	necklace_conjugate_transform: [0x00000200, 0x00000000, 0x00000000],
+	invert_transform: [0x00000400, 0x00000000, 0x00000000],
+	revert_transform: [0x00000800, 0x00000000, 0x00000000],
+	lz78_factorization: [0x00001000, 0x00000000, 0x00000000],
+	lzw_factorization: [0x00002000, 0x00000000, 0x00000000],
+	odd_maximal_palindromic_length_array: [0x00004000, 0x00000000, 0x00000000],
+	even_maximal_palindromic_length_array: [0x00008000, 0x00000000, 0x00000000],
+	lzend_factorization: [0x00010000, 0x00000000, 0x00000000],
+	gamma_factorization: [0x00020000, 0x00000000, 0x00000000],
+	inverse_suffix_array: [0x00040004, 0x00000000, 0x00000000],
+	counter_period: [0x00080008, 0x00000000, 0x00000000],
+	counter_exponent: [0x00100008, 0x00000000, 0x00000000],
+	counter_regularity: [0x00200008, 0x00000000, 0x00000000],
+	bw_transform: [0x00400040, 0x00000000, 0x00000000],
+	reverse_lzss_factorization: [0x00800100, 0x00000000, 0x00000000],
+	counter_necklace_conjugate_transform: [0x01000200, 0x00000000, 0x00000000],
+	counter_invert_transform: [0x02000400, 0x00000000, 0x00000000],
+	counter_revert_transform: [0x04000800, 0x00000000, 0x00000000],
+	counter_lz78_factorization: [0x08001000, 0x00000000, 0x00000000],
+	counter_lzw_factorization: [0x10002000, 0x00000000, 0x00000000],
+	counter_lzend_factorization: [0x20010000, 0x00000000, 0x00000000],
+	counter_gamma_factorization: [0x40020000, 0x00000000, 0x00000000],
+	phi_array: [0x80040004, 0x00000000, 0x00000000],
+	inverse_phi_array: [0x00040004, 0x00000001, 0x00000000],
+	lcp_array: [0x00040004, 0x00000002, 0x00000000],
+	psi_array: [0x00040004, 0x00000004, 0x00000000],
+	lyndon_factorization: [0x00040004, 0x00000008, 0x00000000],
+	nss_array: [0x00040004, 0x00000010, 0x00000000],
+	pss_array: [0x00040004, 0x00000020, 0x00000000],
+	lf_array: [0x00400050, 0x00000040, 0x00000000],
+	counter_bw_transform: [0x00400040, 0x00000080, 0x00000000],
+	counter_reverse_lzss_factorization: [0x00800100, 0x00000100, 0x00000000],
+	counter_lcp_array: [0x00040004, 0x00000202, 0x00000000],
+	plcp_array: [0x00040004, 0x00000402, 0x00000000],
+	substring_complexity: [0x00040004, 0x00000802, 0x00000000],
+	lpf_array: [0x00040004, 0x00001002, 0x00000000],
+	lpnf_array: [0x00040004, 0x00002002, 0x00000000],
+	circular_suffix_array: [0x00040004, 0x00004008, 0x00000000],
+	necklace_factorization: [0x00040004, 0x00008008, 0x00000000],
+	counter_lyndon_factorization: [0x00040004, 0x00010008, 0x00000000],
+	lyndon_array: [0x00040004, 0x00020010, 0x00000000],
+	lexparse_factorization: [0x00040004, 0x00040402, 0x00000000],
+	counter_delta: [0x00040004, 0x00080802, 0x00000000],
+	counter_delta_argmax: [0x00040004, 0x00100802, 0x00000000],
+	lzss_factorization: [0x00040004, 0x00201002, 0x00000000],
+	lz77_factorization: [0x00040004, 0x00401002, 0x00000000],
+	lzssno_factorization: [0x00040004, 0x00802002, 0x00000000],
+	inverse_circular_suffix_array: [0x00040004, 0x01004008, 0x00000000],
+	bbw_indices: [0x00040004, 0x02004008, 0x00000000],
+	counter_necklace_factorization: [0x00040004, 0x04008008, 0x00000000],
+	counter_lexparse_factorization: [0x00040004, 0x08040402, 0x00000000],
+	counter_lzss_factorization: [0x00040004, 0x10201002, 0x00000000],
+	counter_lz77_factorization: [0x00040004, 0x20401002, 0x00000000],
+	counter_lzssno_factorization: [0x00040004, 0x40802002, 0x00000000],
+	bbw_transform: [0x00040004, 0x82004008, 0x00000000],
+	inverse_bbw_transform: [0x00040004, 0x82004008, 0x00000001],
+	counter_bbw_transform: [0x00040004, 0x82004008, 0x00000002],
+	counter_inverse_bbw_transform: [0x00040004, 0x82004008, 0x00000005]
+};
+// Returns the flag words selecting the given structure names; unknown names are ignored.
+function structure_flag_set(names) {
+	var flags = [0x00000000, 0x00000000, 0x00000000];
+	for (var i = 0; i < names.length; i++) {
+		var flag = structure_flags[names[i]];
+		if (flag) flags[flag[0]] |= flag[1];
+	}
+	return flags;
+}
+// Returns the flag words of the given structures together with everything they are built from.
+function structure_closure_of(flags) {
+	var need = [0x00000000, 0x00000000, 0x00000000];
+	for (var name in structure_flags) {
+		var flag = structure_flags[name];
+		if (!(flags[flag[0]] & flag[1])) continue;
+		var deps = structure_closure[name];
+		for (var w = 0; w < deps.length; w++) need[w] |= deps[w];
+	}
+	return need;
+}
+// === Direct dependencies of each structure, in construction order ===
+var structure_dependencies = {
+	counter_n: [],
+	counter_sigma: [],
+	suffix_array: [],
+	border_array: [],
+	first_array: [],
+	index_array: [],
+	rotation_array: [],
+	sl_string: [],
+	lnf_array: [],
+	necklace_conjugate_transform: [],
+	invert_transform: [],
+	revert_transform: [],
+	lz78_factorization: [],
+	lzw_factorization: [],
+	odd_maximal_palindromic_length_array: [],
+	even_maximal_palindromic_length_array: [],
+	lzend_factorization: [],
+	gamma_factorization: [],
+	inverse_suffix_array: ['suffix_array'],
+	counter_period: ['border_array'],
+	counter_exponent: ['border_array'],
+	counter_regularity: ['border_array'],
+	bw_transform: ['rotation_array'],
+	reverse_lzss_factorization: ['lnf_array'],
+	counter_necklace_conjugate_transform: ['necklace_conjugate_transform'],
+	counter_invert_transform: ['invert_transform'],
+	counter_revert_transform: ['revert_transform'],
+	counter_lz78_factorization: ['lz78_factorization'],
+	counter_lzw_factorization: ['lzw_factorization'],
+	counter_lzend_factorization: ['lzend_factorization'],
+	counter_gamma_factorization: ['gamma_factorization'],
+	phi_array: ['suffix_array', 'inverse_suffix_array'],
+	inverse_phi_array: ['suffix_array', 'inverse_suffix_array'],
+	lcp_array: ['suffix_array', 'inverse_suffix_array'],
+	psi_array: ['suffix_array', 'inverse_suffix_array'],
+	lyndon_factorization: ['inverse_suffix_array'],
+	nss_array: ['inverse_suffix_array'],
+	pss_array: ['inverse_suffix_array'],
+	lf_array: ['first_array', 'bw_transform'],
+	counter_bw_transform: ['bw_transform'],
+	counter_reverse_lzss_factorization: ['reverse_lzss_factorization'],
+	counter_lcp_array: ['lcp_array'],
+	plcp_array: ['inverse_suffix_array', 'lcp_array'],
+	substring_complexity: ['lcp_array'],
+	lpf_array: ['suffix_array', 'lcp_array'],
+	lpnf_array: ['suffix_array', 'inverse_suffix_array', 'lcp_array'],
+	circular_suffix_array: ['lyndon_factorization'],
+	necklace_factorization: ['lyndon_factorization'],
+	counter_lyndon_factorization: ['lyndon_factorization'],
+	lyndon_array: ['nss_array'],
+	lexparse_factorization: ['plcp_array'],
+	counter_delta: ['substring_complexity'],
+	counter_delta_argmax: ['substring_complexity'],
+	lzss_factorization: ['lpf_array'],
+	lz77_factorization: ['lpf_array'],
+	lzssno_factorization: ['lpnf_array'],
+	inverse_circular_suffix_array: ['circular_suffix_array'],
+	bbw_indices: ['lyndon_factorization', 'circular_suffix_array'],
+	counter_necklace_factorization: ['necklace_factorization'],
+	counter_lexparse_factorization: ['lexparse_factorization'],
+	counter_lzss_factorization: ['lzss_factorization'],
+	counter_lz77_factorization: ['lz77_factorization'],
+	counter_lzssno_factorization: ['lzssno_factorization'],
+	bbw_transform: ['bbw_indices'],
+	inverse_bbw_transform: ['bbw_transform'],
+	counter_bbw_transform: ['bbw_transform'],
+	counter_inverse_bbw_transform: ['inverse_bbw_transform']
+};
+// Builds one structure from the text and its direct dependencies, given by name in `inputs`.
+var structure_builders = {
+	counter_n: function (var_text, var_n, inputs) { return count_n(var_text); },
+	counter_sigma: function (var_text, var_n, inputs) { return count_sigma(var_text); },
+	suffix_array: function (var_text, var_n, inputs) { return construct_suffix_array(var_text); },
+	border_array: function (var_text, var_n, inputs) { return construct_border_array(var_text); },
+	first_array: function (var_text, var_n, inputs) { return construct_first_array(var_text); },
+	index_array: function (var_text, var_n, inputs) { return construct_index_array(var_n); },
+	rotation_array: function (var_text, var_n, inputs) { return construct_rotation_array(var_text); },
+	sl_string: function (var_text, var_n, inputs) { return construct_sl_string(var_text); },
+	lnf_array: function (var_text, var_n, inputs) { return construct_lnf_array(var_text); },
+	necklace_conjugate_transform: function (var_text, var_n, inputs) { return construct_necklace_conjugate_transform(var_text); },
+	invert_transform: function (var_text, var_n, inputs) { return construct_invert_transform(var_text); },
+	revert_transform: function (var_text, var_n, inputs) { return construct_revert_transform(var_text); },
+	lz78_factorization: function (var_text, var_n, inputs) { return construct_lz78_factorization(var_text); },
+	lzw_factorization: function (var_text, var_n, inputs) { return construct_lzw_factorization(var_text); },
+	odd_maximal_palindromic_length_array: function (var_text, var_n, inputs) { return construct_odd_maximal_palindromic_length_array(var_text); },
+	even_maximal_palindromic_length_array: function (var_text, var_n, inputs) { return construct_even_maximal_palindromic_length_array(var_text); },
+	lzend_factorization: function (var_text, var_n, inputs) { return construct_lzend_factorization(var_text); },
+	gamma_factorization: function (var_text, var_n, inputs) { return construct_gamma_factorization(var_text); },
+	inverse_suffix_array: function (var_text, var_n, inputs) { return construct_inverse_suffix_array(inputs.suffix_array); },
+	counter_period: function (var_text, var_n, inputs) { return count_period(inputs.border_array); },
+	counter_exponent: function (var_text, var_n, inputs) { return count_exponent(inputs.border_array); },
+	counter_regularity: function (var_text, var_n, inputs) { return count_regularity(inputs.border_array); },
+	bw_transform: function (var_text, var_n, inputs) { return construct_bw_transform(var_text, inputs.rotation_array); },
+	reverse_lzss_factorization: function (var_text, var_n, inputs) { return construct_reverse_lzss_factorization(inputs.lnf_array); },
+	counter_necklace_conjugate_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.necklace_conjugate_transform); },
+	counter_invert_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.invert_transform); },
+	counter_revert_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.revert_transform); },
+	counter_lz78_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lz78_factorization); },
+	counter_lzw_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzw_factorization); },
+	counter_lzend_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzend_factorization); },
+	counter_gamma_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.gamma_factorization); },
+	phi_array: function (var_text, var_n, inputs) { return construct_phi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	inverse_phi_array: function (var_text, var_n, inputs) { return construct_inverse_phi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	lcp_array: function (var_text, var_n, inputs) { return construct_lcp_array(var_text, inputs.suffix_array, inputs.inverse_suffix_array); },
+	psi_array: function (var_text, var_n, inputs) { return construct_psi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	lyndon_factorization: function (var_text, var_n, inputs) { return construct_lyndon_factorization(var_text, inputs.inverse_suffix_array); },
+	nss_array: function (var_text, var_n, inputs) { return construct_nss_array(inputs.inverse_suffix_array); },
+	pss_array: function (var_text, var_n, inputs) { return construct_pss_array(inputs.inverse_suffix_array); },
+	lf_array: function (var_text, var_n, inputs) { return construct_lf_array(inputs.first_array, inputs.bw_transform); },
+	counter_bw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.bw_transform); },
+	counter_reverse_lzss_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.reverse_lzss_factorization); },
+	counter_lcp_array: function (var_text, var_n, inputs) { return count_lcp_array(inputs.lcp_array); },
+	plcp_array: function (var_text, var_n, inputs) { return construct_plcp_array(inputs.inverse_suffix_array, inputs.lcp_array); },
+	substring_complexity: function (var_text, var_n, inputs) { return construct_substring_complexity(inputs.lcp_array); },
+	lpf_array: function (var_text, var_n, inputs) { return construct_lpf_array(inputs.suffix_array, inputs.lcp_array); },
+	lpnf_array: function (var_text, var_n, inputs) { return construct_lpnf_array(inputs.suffix_array, inputs.inverse_suffix_array, inputs.lcp_array); },
+	circular_suffix_array: function (var_text, var_n, inputs) { return construct_circular_suffix_array(var_text, inputs.lyndon_factorization); },
+	necklace_factorization: function (var_text, var_n, inputs) { return construct_necklace_factorization(var_text, inputs.lyndon_factorization); },
+	counter_lyndon_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lyndon_factorization); },
+	lyndon_array: function (var_text, var_n, inputs) { return construct_lyndon_array(inputs.nss_array); },
+	lexparse_factorization: function (var_text, var_n, inputs) { return construct_lexparse_factorization(inputs.plcp_array); },
+	counter_delta: function (var_text, var_n, inputs) { return count_delta(inputs.substring_complexity); },
+	counter_delta_argmax: function (var_text, var_n, inputs) { return count_delta_argmax(inputs.substring_complexity); },
+	lzss_factorization: function (var_text, var_n, inputs) { return construct_lzss_factorization(inputs.lpf_array); },
+	lz77_factorization: function (var_text, var_n, inputs) { return construct_lz77_factorization(inputs.lpf_array); },
+	lzssno_factorization: function (var_text, var_n, inputs) { return construct_lzssno_factorization(inputs.lpnf_array); },
+	inverse_circular_suffix_array: function (var_text, var_n, inputs) { return construct_inverse_circular_suffix_array(inputs.circular_suffix_array); },
+	bbw_indices: function (var_text, var_n, inputs) { return construct_bbw_indices(inputs.lyndon_factorization, inputs.circular_suffix_array); },
+	counter_necklace_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.necklace_factorization); },
+	counter_lexparse_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lexparse_factorization); },
+	counter_lzss_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzss_factorization); },
+	counter_lz77_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lz77_factorization); },
+	counter_lzssno_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzssno_factorization); },
+	bbw_transform: function (var_text, var_n, inputs) { return construct_bbw_transform(var_text, inputs.bbw_indices); },
+	inverse_bbw_transform: function (var_text, var_n, inputs) { return construct_inverse_bbw_transform(inputs.bbw_transform); },
+	counter_bbw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.bbw_transform); },
+	counter_inverse_bbw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.inverse_bbw_transform); }
+};
+// === Builder ===
+// flags: flag words from structure_flag_set; omitted to build all structures.
+// profile: optional array receiving the time, output length and heap delta of each construction.
+// cache: optional ResultCache; cached structures are reused, and their dependencies are not built.
+// on_result: optional callback receiving (name, value) of each requested structure as soon as it is ready.
+function build_ds(text, flags, profile, cache, on_result) {
+	const n = text.length;
+	// storage
+	const var_text = text;
+	const var_n = text.length;
+	var var_counter_n;
+	var var_counter_sigma;
+	var var_suffix_array;
+	var var_border_array;
+	var var_first_array;
+	var var_index_array;
+	var var_rotation_array;
+	var var_sl_string;
+	var var_lnf_array;
+	var var_necklace_conjugate_transform;
+	var var_invert_transform;
+	var var_revert_transform;
+	var var_lz78_factorization;
+	var var_lzw_factorization;
+	var var_odd_maximal_palindromic_length_array;
+	var var_even_maximal_palindromic_length_array;
+	var var_lzend_factorization;
+	var var_gamma_factorization;
+	var var_inverse_suffix_array;
+	var var_counter_period;
+	var var_counter_exponent;
+	var var_counter_regularity;
+	var var_bw_transform;
+	var var_reverse_lzss_factorization;
+	var var_counter_necklace_conjugate_transform;
+	var var_counter_invert_transform;
+	var var_counter_revert_transform;
+	var var_counter_lz78_factorization;
+	var var_counter_lzw_factorization;
+	var var_counter_lzend_factorization;
+	var var_counter_gamma_factorization;
+	var var_phi_array;
+	var var_inverse_phi_array;
+	var var_lcp_array;
+	var var_psi_array;
+	var var_lyndon_factorization;
+	var var_nss_array;
+	var var_pss_array;
+	var var_lf_array;
+	var var_counter_bw_transform;
+	var var_counter_reverse_lzss_factorization;
+	var var_counter_lcp_array;
+	var var_plcp_array;
+	var var_substring_complexity;
+	var var_lpf_array;
+	var var_lpnf_array;
+	var var_circular_suffix_array;
+	var var_necklace_factorization;
+	var var_counter_lyndon_factorization;
+	var var_lyndon_array;
+	var var_lexparse_factorization;
+	var var_counter_delta;
+	var var_counter_delta_argmax;
+	var var_lzss_factorization;
+	var var_lz77_factorization;
+	var var_lzssno_factorization;
+	var var_inverse_circular_suffix_array;
+	var var_bbw_indices;
+	var var_counter_necklace_factorization;
+	var var_counter_lexparse_factorization;
+	var var_counter_lzss_factorization;
+	var var_counter_lz77_factorization;
+	var var_counter_lzssno_factorization;
+	var var_bbw_transform;
+	var var_inverse_bbw_transform;
+	var var_counter_bbw_transform;
+	var var_counter_inverse_bbw_transform;
+	// a needed structure missing from the cache needs its direct dependencies
+	var need = flags === undefined ? [0xffffffff, 0xffffffff, 0x00000007] : flags.slice();
+	if (need[2] & (1 << 2)) {
+		if (cache) var_counter_inverse_bbw_transform = result_cache_get(cache, text, 'counter_inverse_bbw_transform');
+		if (var_counter_inverse_bbw_transform === undefined) { need[2] |= 0x00000001; }
+	}
+	if (need[2] & (1 << 1)) {
+		if (cache) var_counter_bbw_transform = result_cache_get(cache, text, 'counter_bbw_transform');
+		if (var_counter_bbw_transform === undefined) { need[1] |= 0x80000000; }
+	}
+	if (need[2] & (1 << 0)) {
+		if (cache) var_inverse_bbw_transform = result_cache_get(cache, text, 'inverse_bbw_transform');
+		if (var_inverse_bbw_transform === undefined) { need[1] |= 0x80000000; }
+	}
+	if (need[1] & (1 << 31)) {
+		if (cache) var_bbw_transform = result_cache_get(cache, text, 'bbw_transform');
+		if (var_bbw_transform === undefined) { need[1] |= 0x02000000; }
+	}
+	if (need[1] & (1 << 30)) {
+		if (cache) var_counter_lzssno_factorization = result_cache_get(cache, text, 'counter_lzssno_factorization');
+		if (var_counter_lzssno_factorization === undefined) { need[1] |= 0x00800000; }
+	}
+	if (need[1] & (1 << 29)) {
+		if (cache) var_counter_lz77_factorization = result_cache_get(cache, text, 'counter_lz77_factorization');
+		if (var_counter_lz77_factorization === undefined) { need[1] |= 0x00400000; }
+	}
+	if (need[1] & (1 << 28)) {
+		if (cache) var_counter_lzss_factorization = result_cache_get(cache, text, 'counter_lzss_factorization');
+		if (var_counter_lzss_factorization === undefined) { need[1] |= 0x00200000; }
+	}
+	if (need[1] & (1 << 27)) {
+		if (cache) var_counter_lexparse_factorization = result_cache_get(cache, text, 'counter_lexparse_factorization');
+		if (var_counter_lexparse_factorization === undefined) { need[1] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 26)) {
+		if (cache) var_counter_necklace_factorization = result_cache_get(cache, text, 'counter_necklace_factorization');
+		if (var_counter_necklace_factorization === undefined) { need[1] |= 0x00008000; }
+	}
+	if (need[1] & (1 << 25)) {
+		if (cache) var_bbw_indices = result_cache_get(cache, text, 'bbw_indices');
+		if (var_bbw_indices === undefined) { need[1] |= 0x00004008; }
+	}
+	if (need[1] & (1 << 24)) {
+		if (cache) var_inverse_circular_suffix_array = result_cache_get(cache, text, 'inverse_circular_suffix_array');
+		if (var_inverse_circular_suffix_array === undefined) { need[1] |= 0x00004000; }
+	}
+	if (need[1] & (1 << 23)) {
+		if (cache) var_lzssno_factorization = result_cache_get(cache, text, 'lzssno_factorization');
+		if (var_lzssno_factorization === undefined) { need[1] |= 0x00002000; }
+	}
+	if (need[1] & (1 << 22)) {
+		if (cache) var_lz77_factorization = result_cache_get(cache, text, 'lz77_factorization');
+		if (var_lz77_factorization === undefined) { need[1] |= 0x00001000; }
+	}
+	if (need[1] & (1 << 21)) {
+		if (cache) var_lzss_factorization = result_cache_get(cache, text, 'lzss_factorization');
+		if (var_lzss_factorization === undefined) { need[1] |= 0x00001000; }
+	}
+	if (need[1] & (1 << 20)) {
+		if (cache) var_counter_delta_argmax = result_cache_get(cache, text, 'counter_delta_argmax');
+		if (var_counter_delta_argmax === undefined) { need[1] |= 0x00000800; }
+	}
+	if (need[1] & (1 << 19)) {
+		if (cache) var_counter_delta = result_cache_get(cache, text, 'counter_delta');
+		if (var_counter_delta === undefined) { need[1] |= 0x00000800; }
+	}
+	if (need[1] & (1 << 18)) {
+		if (cache) var_lexparse_factorization = result_cache_get(cache, text, 'lexparse_factorization');
+		if (var_lexparse_factorization === undefined) { need[1] |= 0x00000400; }
+	}
+	if (need[1] & (1 << 17)) {
+		if (cache) var_lyndon_array = result_cache_get(cache, text, 'lyndon_array');
+		if (var_lyndon_array === undefined) { need[1] |= 0x00000010; }
+	}
+	if (need[1] & (1 << 16)) {
+		if (cache) var_counter_lyndon_factorization = result_cache_get(cache, text, 'counter_lyndon_factorization');
+		if (var_counter_lyndon_factorization === undefined) { need[1] |= 0x00000008; }
+	}
+	if (need[1] & (1 << 15)) {
+		if (cache) var_necklace_factorization = result_cache_get(cache, text, 'necklace_factorization');
+		if (var_necklace_factorization === undefined) { need[1] |= 0x00000008; }
+	}
+	if (need[1] & (1 << 14)) {
+		if (cache) var_circular_suffix_array = result_cache_get(cache, text, 'circular_suffix_array');
+		if (var_circular_suffix_array === undefined) { need[1] |= 0x00000008; }
+	}
+	if (need[1] & (1 << 13)) {
+		if (cache) var_lpnf_array = result_cache_get(cache, text, 'lpnf_array');
+		if (var_lpnf_array === undefined) { need[0] |= 0x00040004; need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 12)) {
+		if (cache) var_lpf_array = result_cache_get(cache, text, 'lpf_array');
+		if (var_lpf_array === undefined) { need[0] |= 0x00000004; need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 11)) {
+		if (cache) var_substring_complexity = result_cache_get(cache, text, 'substring_complexity');
+		if (var_substring_complexity === undefined) { need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 10)) {
+		if (cache) var_plcp_array = result_cache_get(cache, text, 'plcp_array');
+		if (var_plcp_array === undefined) { need[0] |= 0x00040000; need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 9)) {
+		if (cache) var_counter_lcp_array = result_cache_get(cache, text, 'counter_lcp_array');
+		if (var_counter_lcp_array === undefined) { need[1] |= 0x00000002; }
+	}
+	if (need[1] & (1 << 8)) {
+		if (cache) var_counter_reverse_lzss_factorization = result_cache_get(cache, text, 'counter_reverse_lzss_factorization');
+		if (var_counter_reverse_lzss_factorization === undefined) { need[0] |= 0x00800000; }
+	}
+	if (need[1] & (1 << 7)) {
+		if (cache) var_counter_bw_transform = result_cache_get(cache, text, 'counter_bw_transform');
+		if (var_counter_bw_transform === undefined) { need[0] |= 0x00400000; }
+	}
+	if (need[1] & (1 << 6)) {
+		if (cache) var_lf_array = result_cache_get(cache, text, 'lf_array');
+		if (var_lf_array === undefined) { need[0] |= 0x00400010; }
+	}
+	if (need[1] & (1 << 5)) {
+		if (cache) var_pss_array = result_cache_get(cache, text, 'pss_array');
+		if (var_pss_array === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 4)) {
+		if (cache) var_nss_array = result_cache_get(cache, text, 'nss_array');
+		if (var_nss_array === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 3)) {
+		if (cache) var_lyndon_factorization = result_cache_get(cache, text, 'lyndon_factorization');
+		if (var_lyndon_factorization === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 2)) {
+		if (cache) var_psi_array = result_cache_get(cache, text, 'psi_array');
+		if (var_psi_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[1] & (1 << 1)) {
+		if (cache) var_lcp_array = result_cache_get(cache, text, 'lcp_array');
+		if (var_lcp_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[1] & (1 << 0)) {
+		if (cache) var_inverse_phi_array = result_cache_get(cache, text, 'inverse_phi_array');
+		if (var_inverse_phi_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[0] & (1 << 31)) {
+		if (cache) var_phi_array = result_cache_get(cache, text, 'phi_array');
+		if (var_phi_array === undefined) { need[0] |= 0x00040004; }
+	}
+	if (need[0] & (1 << 30)) {
+		if (cache) var_counter_gamma_factorization = result_cache_get(cache, text, 'counter_gamma_factorization');
+		if (var_counter_gamma_factorization === undefined) { need[0] |= 0x00020000; }
+	}
+	if (need[0] & (1 << 29)) {
+		if (cache) var_counter_lzend_factorization = result_cache_get(cache, text, 'counter_lzend_factorization');
+		if (var_counter_lzend_factorization === undefined) { need[0] |= 0x00010000; }
+	}
+	if (need[0] & (1 << 28)) {
+		if (cache) var_counter_lzw_factorization = result_cache_get(cache, text, 'counter_lzw_factorization');
+		if (var_counter_lzw_factorization === undefined) { need[0] |= 0x00002000; }
+	}
+	if (need[0] & (1 << 27)) {
+		if (cache) var_counter_lz78_factorization = result_cache_get(cache, text, 'counter_lz78_factorization');
+		if (var_counter_lz78_factorization === undefined) { need[0] |= 0x00001000; }
+	}
+	if (need[0] & (1 << 26)) {
+		if (cache) var_counter_revert_transform = result_cache_get(cache, text, 'counter_revert_transform');
+		if (var_counter_revert_transform === undefined) { need[0] |= 0x00000800; }
+	}
+	if (need[0] & (1 << 25)) {
+		if (cache) var_counter_invert_transform = result_cache_get(cache, text, 'counter_invert_transform');
+		if (var_counter_invert_transform === undefined) { need[0] |= 0x00000400; }
+	}
+	if (need[0] & (1 << 24)) {
+		if (cache) var_counter_necklace_conjugate_transform = result_cache_get(cache, text, 'counter_necklace_conjugate_transform');
+		if (var_counter_necklace_conjugate_transform === undefined) { need[0] |= 0x00000200; }
+	}
+	if (need[0] & (1 << 23)) {
+		if (cache) var_reverse_lzss_factorization = result_cache_get(cache, text, 'reverse_lzss_factorization');
+		if (var_reverse_lzss_factorization === undefined) { need[0] |= 0x00000100; }
+	}
+	if (need[0] & (1 << 22)) {
+		if (cache) var_bw_transform = result_cache_get(cache, text, 'bw_transform');
+		if (var_bw_transform === undefined) { need[0] |= 0x00000040; }
+	}
+	if (need[0] & (1 << 21)) {
+		if (cache) var_counter_regularity = result_cache_get(cache, text, 'counter_regularity');
+		if (var_counter_regularity === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 20)) {
+		if (cache) var_counter_exponent = result_cache_get(cache, text, 'counter_exponent');
+		if (var_counter_exponent === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 19)) {
+		if (cache) var_counter_period = result_cache_get(cache, text, 'counter_period');
+		if (var_counter_period === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 18)) {
+		if (cache) var_inverse_suffix_array = result_cache_get(cache, text, 'inverse_suffix_array');
+		if (var_inverse_suffix_array === undefined) { need[0] |= 0x00000004; }
+	}
+	if (need[0] & (1 << 17)) {
+		if (cache) var_gamma_factorization = result_cache_get(cache, text, 'gamma_factorization');
+	}
+	if (need[0] & (1 << 16)) {
+		if (cache) var_lzend_factorization = result_cache_get(cache, text, 'lzend_factorization');
+	}
+	if (need[0] & (1 << 15)) {
+		if (cache) var_even_maximal_palindromic_length_array = result_cache_get(cache, text, 'even_maximal_palindromic_length_array');
+	}
+	if (need[0] & (1 << 14)) {
+		if (cache) var_odd_maximal_palindromic_length_array = result_cache_get(cache, text, 'odd_maximal_palindromic_length_array');
+	}
+	if (need[0] & (1 << 13)) {
+		if (cache) var_lzw_factorization = result_cache_get(cache, text, 'lzw_factorization');
+	}
+	if (need[0] & (1 << 12)) {
+		if (cache) var_lz78_factorization = result_cache_get(cache, text, 'lz78_factorization');
+	}
+	if (need[0] & (1 << 11)) {
+		if (cache) var_revert_transform = result_cache_get(cache, text, 'revert_transform');
+	}
+	if (need[0] & (1 << 10)) {
+		if (cache) var_invert_transform = result_cache_get(cache, text, 'invert_transform');
+	}
+	if (need[0] & (1 << 9)) {
+		if (cache) var_necklace_conjugate_transform = result_cache_get(cache, text, 'necklace_conjugate_transform');
+	}
+	if (need[0] & (1 << 8)) {
+		if (cache) var_lnf_array = result_cache_get(cache, text, 'lnf_array');
+	}
+	if (need[0] & (1 << 7)) {
+		if (cache) var_sl_string = result_cache_get(cache, text, 'sl_string');
+	}
+	if (need[0] & (1 << 6)) {
+		if (cache) var_rotation_array = result_cache_get(cache, text, 'rotation_array');
+	}
+	if (need[0] & (1 << 5)) {
+		if (cache) var_index_array = result_cache_get(cache, text, 'index_array');
+	}
+	if (need[0] & (1 << 4)) {
+		if (cache) var_first_array = result_cache_get(cache, text, 'first_array');
+	}
+	if (need[0] & (1 << 3)) {
+		if (cache) var_border_array = result_cache_get(cache, text, 'border_array');
+	}
+	if (need[0] & (1 << 2)) {
+		if (cache) var_suffix_array = result_cache_get(cache, text, 'suffix_array');
+	}
+	if (need[0] & (1 << 1)) {
+		if (cache) var_counter_sigma = result_cache_get(cache, text, 'counter_sigma');
+	}
+	if (need[0] & (1 << 0)) {
+		if (cache) var_counter_n = result_cache_get(cache, text, 'counter_n');
+	}
+	// construction
+	var requested = flags === undefined ? need : flags;
+	var result = { counter_text: number_of_runs(var_text) };
+	if (on_result) on_result('counter_text', result.counter_text);
+	var start_time = 0, start_heap = 0;
+	if (need[0] & (1 << 0)) {
+		if (var_counter_n === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_n = count_n(var_text);
+			if (profile) profile_record(profile, 'counter_n', var_counter_n, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_n', var_counter_n);
+		}
+		if (requested[0] & (1 << 0)) {
+			result.counter_n = var_counter_n;
+			if (on_result) on_result('counter_n', var_counter_n);
+		}
+	}
+	if (need[0] & (1 << 1)) {
+		if (var_counter_sigma === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_sigma = count_sigma(var_text);
+			if (profile) profile_record(profile, 'counter_sigma', var_counter_sigma, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_sigma', var_counter_sigma);
+		}
+		if (requested[0] & (1 << 1)) {
+			result.counter_sigma = var_counter_sigma;
+			if (on_result) on_result('counter_sigma', var_counter_sigma);
+		}
+	}
+	if (need[0] & (1 << 2)) {
+		if (var_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_suffix_array = construct_suffix_array(var_text);
+			if (profile) profile_record(profile, 'suffix_array', var_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'suffix_array', var_suffix_array);
+		}
+		if (requested[0] & (1 << 2)) {
+			result.suffix_array = var_suffix_array;
+			if (on_result) on_result('suffix_array', var_suffix_array);
+		}
+	}
+	if (need[0] & (1 << 3)) {
+		if (var_border_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_border_array = construct_border_array(var_text);
+			if (profile) profile_record(profile, 'border_array', var_border_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'border_array', var_border_array);
+		}
+		if (requested[0] & (1 << 3)) {
+			result.border_array = var_border_array;
+			if (on_result) on_result('border_array', var_border_array);
+		}
+	}
+	if (need[0] & (1 << 4)) {
+		if (var_first_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_first_array = construct_first_array(var_text);
+			if (profile) profile_record(profile, 'first_array', var_first_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'first_array', var_first_array);
+		}
+		if (requested[0] & (1 << 4)) {
+			result.first_array = var_first_array;
+			if (on_result) on_result('first_array', var_first_array);
+		}
+	}
+	if (need[0] & (1 << 5)) {
+		if (var_index_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_index_array = construct_index_array(var_n);
+			if (profile) profile_record(profile, 'index_array', var_index_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'index_array', var_index_array);
+		}
+		if (requested[0] & (1 << 5)) {
+			result.index_array = var_index_array;
+			if (on_result) on_result('index_array', var_index_array);
+		}
+	}
+	if (need[0] & (1 << 6)) {
+		if (var_rotation_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_rotation_array = construct_rotation_array(var_text);
+			if (profile) profile_record(profile, 'rotation_array', var_rotation_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'rotation_array', var_rotation_array);
+		}
+		if (requested[0] & (1 << 6)) {
+			result.rotation_array = var_rotation_array;
+			if (on_result) on_result('rotation_array', var_rotation_array);
+		}
+	}
+	if (need[0] & (1 << 7)) {
+		if (var_sl_string === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_sl_string = construct_sl_string(var_text);
+			if (profile) profile_record(profile, 'sl_string', var_sl_string, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'sl_string', var_sl_string);
+		}
+		if (requested[0] & (1 << 7)) {
+			result.sl_string = var_sl_string;
+			if (on_result) on_result('sl_string', var_sl_string);
+		}
+	}
+	if (need[0] & (1 << 8)) {
+		if (var_lnf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lnf_array = construct_lnf_array(var_text);
+			if (profile) profile_record(profile, 'lnf_array', var_lnf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lnf_array', var_lnf_array);
+		}
+		if (requested[0] & (1 << 8)) {
+			result.lnf_array = var_lnf_array;
+			if (on_result) on_result('lnf_array', var_lnf_array);
+		}
+	}
+	if (need[0] & (1 << 9)) {
+		if (var_necklace_conjugate_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_necklace_conjugate_transform = construct_necklace_conjugate_transform(var_text);
+			if (profile) profile_record(profile, 'necklace_conjugate_transform', var_necklace_conjugate_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'necklace_conjugate_transform', var_necklace_conjugate_transform);
+		}
+		if (requested[0] & (1 << 9)) {
+			result.necklace_conjugate_transform = var_necklace_conjugate_transform;
+			if (on_result) on_result('necklace_conjugate_transform', var_necklace_conjugate_transform);
+		}
+	}
+	if (need[0] & (1 << 10)) {
+		if (var_invert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_invert_transform = construct_invert_transform(var_text);
+			if (profile) profile_record(profile, 'invert_transform', var_invert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'invert_transform', var_invert_transform);
+		}
+		if (requested[0] & (1 << 10)) {
+			result.invert_transform = var_invert_transform;
+			if (on_result) on_result('invert_transform', var_invert_transform);
+		}
+	}
+	if (need[0] & (1 << 11)) {
+		if (var_revert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_revert_transform = construct_revert_transform(var_text);
+			if (profile) profile_record(profile, 'revert_transform', var_revert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'revert_transform', var_revert_transform);
+		}
+		if (requested[0] & (1 << 11)) {
+			result.revert_transform = var_revert_transform;
+			if (on_result) on_result('revert_transform', var_revert_transform);
+		}
+	}
+	if (need[0] & (1 << 12)) {
+		if (var_lz78_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lz78_factorization = construct_lz78_factorization(var_text);
+			if (profile) profile_record(profile, 'lz78_factorization', var_lz78_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lz78_factorization', var_lz78_factorization);
+		}
+		if (requested[0] & (1 << 12)) {
+			result.lz78_factorization = var_lz78_factorization;
+			if (on_result) on_result('lz78_factorization', var_lz78_factorization);
+		}
+	}
+	if (need[0] & (1 << 13)) {
+		if (var_lzw_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzw_factorization = construct_lzw_factorization(var_text);
+			if (profile) profile_record(profile, 'lzw_factorization', var_lzw_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzw_factorization', var_lzw_factorization);
+		}
+		if (requested[0] & (1 << 13)) {
+			result.lzw_factorization = var_lzw_factorization;
+			if (on_result) on_result('lzw_factorization', var_lzw_factorization);
+		}
+	}
+	if (need[0] & (1 << 14)) {
+		if (var_odd_maximal_palindromic_length_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_odd_maximal_palindromic_length_array = construct_odd_maximal_palindromic_length_array(var_text);
+			if (profile) profile_record(profile, 'odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array);
+		}
+		if (requested[0] & (1 << 14)) {
+			result.odd_maximal_palindromic_length_array = var_odd_maximal_palindromic_length_array;
+			if (on_result) on_result('odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array);
+		}
+	}
+	if (need[0] & (1 << 15)) {
+		if (var_even_maximal_palindromic_length_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_even_maximal_palindromic_length_array = construct_even_maximal_palindromic_length_array(var_text);
+			if (profile) profile_record(profile, 'even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array);
+		}
+		if (requested[0] & (1 << 15)) {
+			result.even_maximal_palindromic_length_array = var_even_maximal_palindromic_length_array;
+			if (on_result) on_result('even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array);
+		}
+	}
+	if (need[0] & (1 << 16)) {
+		if (var_lzend_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzend_factorization = construct_lzend_factorization(var_text);
+			if (profile) profile_record(profile, 'lzend_factorization', var_lzend_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzend_factorization', var_lzend_factorization);
+		}
+		if (requested[0] & (1 << 16)) {
+			result.lzend_factorization = var_lzend_factorization;
+			if (on_result) on_result('lzend_factorization', var_lzend_factorization);
+		}
+	}
+	if (need[0] & (1 << 17)) {
+		if (var_gamma_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_gamma_factorization = construct_gamma_factorization(var_text);
+			if (profile) profile_record(profile, 'gamma_factorization', var_gamma_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'gamma_factorization', var_gamma_factorization);
+		}
+		if (requested[0] & (1 << 17)) {
+			result.gamma_factorization = var_gamma_factorization;
+			if (on_result) on_result('gamma_factorization', var_gamma_factorization);
+		}
+	}
+	if (need[0] & (1 << 18)) {
+		if (var_inverse_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_suffix_array = construct_inverse_suffix_array(var_suffix_array);
+			if (profile) profile_record(profile, 'inverse_suffix_array', var_inverse_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_suffix_array', var_inverse_suffix_array);
+		}
+		if (requested[0] & (1 << 18)) {
+			result.inverse_suffix_array = var_inverse_suffix_array;
+			if (on_result) on_result('inverse_suffix_array', var_inverse_suffix_array);
+		}
+		if (!((need[0] & (1 << 31)) || (need[1] & (1 << 0)) || (need[1] & (1 << 1)) || (need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+	}
+	if (need[0] & (1 << 19)) {
+		if (var_counter_period === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_period = count_period(var_border_array);
+			if (profile) profile_record(profile, 'counter_period', var_counter_period, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_period', var_counter_period);
+		}
+		if (requested[0] & (1 << 19)) {
+			result.counter_period = var_counter_period;
+			if (on_result) on_result('counter_period', var_counter_period);
+		}
+		if (!((need[0] & (1 << 20)) || (need[0] & (1 << 21)))) var_border_array = undefined;
+	}
+	if (need[0] & (1 << 20)) {
+		if (var_counter_exponent === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_exponent = count_exponent(var_border_array);
+			if (profile) profile_record(profile, 'counter_exponent', var_counter_exponent, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_exponent', var_counter_exponent);
+		}
+		if (requested[0] & (1 << 20)) {
+			result.counter_exponent = var_counter_exponent;
+			if (on_result) on_result('counter_exponent', var_counter_exponent);
+		}
+		if (!((need[0] & (1 << 21)))) var_border_array = undefined;
+	}
+	if (need[0] & (1 << 21)) {
+		if (var_counter_regularity === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_regularity = count_regularity(var_border_array);
+			if (profile) profile_record(profile, 'counter_regularity', var_counter_regularity, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_regularity', var_counter_regularity);
+		}
+		if (requested[0] & (1 << 21)) {
+			result.counter_regularity = var_counter_regularity;
+			if (on_result) on_result('counter_regularity', var_counter_regularity);
+		}
+		var_border_array = undefined;
+	}
+	if (need[0] & (1 << 22)) {
+		if (var_bw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bw_transform = construct_bw_transform(var_text, var_rotation_array);
+			if (profile) profile_record(profile, 'bw_transform', var_bw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bw_transform', var_bw_transform);
+		}
+		if (requested[0] & (1 << 22)) {
+			result.bw_transform = var_bw_transform;
+			if (on_result) on_result('bw_transform', var_bw_transform);
+		}
+		var_rotation_array = undefined;
+	}
+	if (need[0] & (1 << 23)) {
+		if (var_reverse_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_reverse_lzss_factorization = construct_reverse_lzss_factorization(var_lnf_array);
+			if (profile) profile_record(profile, 'reverse_lzss_factorization', var_reverse_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'reverse_lzss_factorization', var_reverse_lzss_factorization);
+		}
+		if (requested[0] & (1 << 23)) {
+			result.reverse_lzss_factorization = var_reverse_lzss_factorization;
+			if (on_result) on_result('reverse_lzss_factorization', var_reverse_lzss_factorization);
+		}
+		var_lnf_array = undefined;
+	}
+	if (need[0] & (1 << 24)) {
+		if (var_counter_necklace_conjugate_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_necklace_conjugate_transform = number_of_runs(var_necklace_conjugate_transform);
+			if (profile) profile_record(profile, 'counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform);
+		}
+		if (requested[0] & (1 << 24)) {
+			result.counter_necklace_conjugate_transform = var_counter_necklace_conjugate_transform;
+			if (on_result) on_result('counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform);
+		}
+		var_necklace_conjugate_transform = undefined;
+	}
+	if (need[0] & (1 << 25)) {
+		if (var_counter_invert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_invert_transform = number_of_runs(var_invert_transform);
+			if (profile) profile_record(profile, 'counter_invert_transform', var_counter_invert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_invert_transform', var_counter_invert_transform);
+		}
+		if (requested[0] & (1 << 25)) {
+			result.counter_invert_transform = var_counter_invert_transform;
+			if (on_result) on_result('counter_invert_transform', var_counter_invert_transform);
+		}
+		var_invert_transform = undefined;
+	}
+	if (need[0] & (1 << 26)) {
+		if (var_counter_revert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_revert_transform = number_of_runs(var_revert_transform);
+			if (profile) profile_record(profile, 'counter_revert_transform', var_counter_revert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_revert_transform', var_counter_revert_transform);
+		}
+		if (requested[0] & (1 << 26)) {
+			result.counter_revert_transform = var_counter_revert_transform;
+			if (on_result) on_result('counter_revert_transform', var_counter_revert_transform);
+		}
+		var_revert_transform = undefined;
+	}
+	if (need[0] & (1 << 27)) {
+		if (var_counter_lz78_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lz78_factorization = number_of_factors(var_lz78_factorization);
+			if (profile) profile_record(profile, 'counter_lz78_factorization', var_counter_lz78_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lz78_factorization', var_counter_lz78_factorization);
+		}
+		if (requested[0] & (1 << 27)) {
+			result.counter_lz78_factorization = var_counter_lz78_factorization;
+			if (on_result) on_result('counter_lz78_factorization', var_counter_lz78_factorization);
+		}
+		var_lz78_factorization = undefined;
+	}
+	if (need[0] & (1 << 28)) {
+		if (var_counter_lzw_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzw_factorization = number_of_factors(var_lzw_factorization);
+			if (profile) profile_record(profile, 'counter_lzw_factorization', var_counter_lzw_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzw_factorization', var_counter_lzw_factorization);
+		}
+		if (requested[0] & (1 << 28)) {
+			result.counter_lzw_factorization = var_counter_lzw_factorization;
+			if (on_result) on_result('counter_lzw_factorization', var_counter_lzw_factorization);
+		}
+		var_lzw_factorization = undefined;
+	}
+	if (need[0] & (1 << 29)) {
+		if (var_counter_lzend_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzend_factorization = number_of_factors(var_lzend_factorization);
+			if (profile) profile_record(profile, 'counter_lzend_factorization', var_counter_lzend_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzend_factorization', var_counter_lzend_factorization);
+		}
+		if (requested[0] & (1 << 29)) {
+			result.counter_lzend_factorization = var_counter_lzend_factorization;
+			if (on_result) on_result('counter_lzend_factorization', var_counter_lzend_factorization);
+		}
+		var_lzend_factorization = undefined;
+	}
+	if (need[0] & (1 << 30)) {
+		if (var_counter_gamma_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_gamma_factorization = number_of_factors(var_gamma_factorization);
+			if (profile) profile_record(profile, 'counter_gamma_factorization', var_counter_gamma_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_gamma_factorization', var_counter_gamma_factorization);
+		}
+		if (requested[0] & (1 << 30)) {
+			result.counter_gamma_factorization = var_counter_gamma_factorization;
+			if (on_result) on_result('counter_gamma_factorization', var_counter_gamma_factorization);
+		}
+		var_gamma_factorization = undefined;
+	}
+	if (need[0] & (1 << 31)) {
+		if (var_phi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_phi_array = construct_phi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'phi_array', var_phi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'phi_array', var_phi_array);
+		}
+		if (requested[0] & (1 << 31)) {
+			result.phi_array = var_phi_array;
+			if (on_result) on_result('phi_array', var_phi_array);
+		}
+		if (!((need[1] & (1 << 0)) || (need[1] & (1 << 1)) || (need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 0)) || (need[1] & (1 << 1)) || (need[1] & (1 << 10)) || (need[1] & (1 << 2)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 0)) {
+		if (var_inverse_phi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_phi_array = construct_inverse_phi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'inverse_phi_array', var_inverse_phi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_phi_array', var_inverse_phi_array);
+		}
+		if (requested[1] & (1 << 0)) {
+			result.inverse_phi_array = var_inverse_phi_array;
+			if (on_result) on_result('inverse_phi_array', var_inverse_phi_array);
+		}
+		if (!((need[1] & (1 << 1)) || (need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 1)) || (need[1] & (1 << 10)) || (need[1] & (1 << 2)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 1)) {
+		if (var_lcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lcp_array = construct_lcp_array(var_text, var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'lcp_array', var_lcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lcp_array', var_lcp_array);
+		}
+		if (requested[1] & (1 << 1)) {
+			result.lcp_array = var_lcp_array;
+			if (on_result) on_result('lcp_array', var_lcp_array);
+		}
+		if (!((need[1] & (1 << 2)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 2)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 2)) {
+		if (var_psi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_psi_array = construct_psi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'psi_array', var_psi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'psi_array', var_psi_array);
+		}
+		if (requested[1] & (1 << 2)) {
+			result.psi_array = var_psi_array;
+			if (on_result) on_result('psi_array', var_psi_array);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 3)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 3)) {
+		if (var_lyndon_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lyndon_factorization = construct_lyndon_factorization(var_text, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'lyndon_factorization', var_lyndon_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lyndon_factorization', var_lyndon_factorization);
+		}
+		if (requested[1] & (1 << 3)) {
+			result.lyndon_factorization = var_lyndon_factorization;
+			if (on_result) on_result('lyndon_factorization', var_lyndon_factorization);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 13)) || (need[1] & (1 << 4)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 4)) {
+		if (var_nss_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_nss_array = construct_nss_array(var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'nss_array', var_nss_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'nss_array', var_nss_array);
+		}
+		if (requested[1] & (1 << 4)) {
+			result.nss_array = var_nss_array;
+			if (on_result) on_result('nss_array', var_nss_array);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 13)) || (need[1] & (1 << 5)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 5)) {
+		if (var_pss_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_pss_array = construct_pss_array(var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'pss_array', var_pss_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'pss_array', var_pss_array);
+		}
+		if (requested[1] & (1 << 5)) {
+			result.pss_array = var_pss_array;
+			if (on_result) on_result('pss_array', var_pss_array);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 13)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 6)) {
+		if (var_lf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lf_array = construct_lf_array(var_first_array, var_bw_transform);
+			if (profile) profile_record(profile, 'lf_array', var_lf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lf_array', var_lf_array);
+		}
+		if (requested[1] & (1 << 6)) {
+			result.lf_array = var_lf_array;
+			if (on_result) on_result('lf_array', var_lf_array);
+		}
+		var_first_array = undefined;
+		if (!((need[1] & (1 << 7)))) var_bw_transform = undefined;
+	}
+	if (need[1] & (1 << 7)) {
+		if (var_counter_bw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_bw_transform = number_of_runs(var_bw_transform);
+			if (profile) profile_record(profile, 'counter_bw_transform', var_counter_bw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_bw_transform', var_counter_bw_transform);
+		}
+		if (requested[1] & (1 << 7)) {
+			result.counter_bw_transform = var_counter_bw_transform;
+			if (on_result) on_result('counter_bw_transform', var_counter_bw_transform);
+		}
+		var_bw_transform = undefined;
+	}
+	if (need[1] & (1 << 8)) {
+		if (var_counter_reverse_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_reverse_lzss_factorization = number_of_factors(var_reverse_lzss_factorization);
+			if (profile) profile_record(profile, 'counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization);
+		}
+		if (requested[1] & (1 << 8)) {
+			result.counter_reverse_lzss_factorization = var_counter_reverse_lzss_factorization;
+			if (on_result) on_result('counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization);
+		}
+		var_reverse_lzss_factorization = undefined;
+	}
+	if (need[1] & (1 << 9)) {
+		if (var_counter_lcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lcp_array = count_lcp_array(var_lcp_array);
+			if (profile) profile_record(profile, 'counter_lcp_array', var_counter_lcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lcp_array', var_counter_lcp_array);
+		}
+		if (requested[1] & (1 << 9)) {
+			result.counter_lcp_array = var_counter_lcp_array;
+			if (on_result) on_result('counter_lcp_array', var_counter_lcp_array);
+		}
+		if (!((need[1] & (1 << 10)) || (need[1] & (1 << 11)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 10)) {
+		if (var_plcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_plcp_array = construct_plcp_array(var_inverse_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'plcp_array', var_plcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'plcp_array', var_plcp_array);
+		}
+		if (requested[1] & (1 << 10)) {
+			result.plcp_array = var_plcp_array;
+			if (on_result) on_result('plcp_array', var_plcp_array);
+		}
+		if (!((need[1] & (1 << 13)))) var_inverse_suffix_array = undefined;
+		if (!((need[1] & (1 << 11)) || (need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 11)) {
+		if (var_substring_complexity === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_substring_complexity = construct_substring_complexity(var_lcp_array);
+			if (profile) profile_record(profile, 'substring_complexity', var_substring_complexity, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'substring_complexity', var_substring_complexity);
+		}
+		if (requested[1] & (1 << 11)) {
+			result.substring_complexity = var_substring_complexity;
+			if (on_result) on_result('substring_complexity', var_substring_complexity);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 12)) {
+		if (var_lpf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lpf_array = construct_lpf_array(var_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'lpf_array', var_lpf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lpf_array', var_lpf_array);
+		}
+		if (requested[1] & (1 << 12)) {
+			result.lpf_array = var_lpf_array;
+			if (on_result) on_result('lpf_array', var_lpf_array);
+		}
+		if (!((need[1] & (1 << 13)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 13)) {
+		if (var_lpnf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lpnf_array = construct_lpnf_array(var_suffix_array, var_inverse_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'lpnf_array', var_lpnf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lpnf_array', var_lpnf_array);
+		}
+		if (requested[1] & (1 << 13)) {
+			result.lpnf_array = var_lpnf_array;
+			if (on_result) on_result('lpnf_array', var_lpnf_array);
+		}
+		var_suffix_array = undefined;
+		var_inverse_suffix_array = undefined;
+		var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 14)) {
+		if (var_circular_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_circular_suffix_array = construct_circular_suffix_array(var_text, var_lyndon_factorization);
+			if (profile) profile_record(profile, 'circular_suffix_array', var_circular_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'circular_suffix_array', var_circular_suffix_array);
+		}
+		if (requested[1] & (1 << 14)) {
+			result.circular_suffix_array = var_circular_suffix_array;
+			if (on_result) on_result('circular_suffix_array', var_circular_suffix_array);
+		}
+		if (!((need[1] & (1 << 25)) || (need[1] & (1 << 15)) || (need[1] & (1 << 16)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 15)) {
+		if (var_necklace_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_necklace_factorization = construct_necklace_factorization(var_text, var_lyndon_factorization);
+			if (profile) profile_record(profile, 'necklace_factorization', var_necklace_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'necklace_factorization', var_necklace_factorization);
+		}
+		if (requested[1] & (1 << 15)) {
+			result.necklace_factorization = var_necklace_factorization;
+			if (on_result) on_result('necklace_factorization', var_necklace_factorization);
+		}
+		if (!((need[1] & (1 << 25)) || (need[1] & (1 << 16)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 16)) {
+		if (var_counter_lyndon_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lyndon_factorization = number_of_factors(var_lyndon_factorization);
+			if (profile) profile_record(profile, 'counter_lyndon_factorization', var_counter_lyndon_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lyndon_factorization', var_counter_lyndon_factorization);
+		}
+		if (requested[1] & (1 << 16)) {
+			result.counter_lyndon_factorization = var_counter_lyndon_factorization;
+			if (on_result) on_result('counter_lyndon_factorization', var_counter_lyndon_factorization);
+		}
+		if (!((need[1] & (1 << 25)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 17)) {
+		if (var_lyndon_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lyndon_array = construct_lyndon_array(var_nss_array);
+			if (profile) profile_record(profile, 'lyndon_array', var_lyndon_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lyndon_array', var_lyndon_array);
+		}
+		if (requested[1] & (1 << 17)) {
+			result.lyndon_array = var_lyndon_array;
+			if (on_result) on_result('lyndon_array', var_lyndon_array);
+		}
+		var_nss_array = undefined;
+	}
+	if (need[1] & (1 << 18)) {
+		if (var_lexparse_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lexparse_factorization = construct_lexparse_factorization(var_plcp_array);
+			if (profile) profile_record(profile, 'lexparse_factorization', var_lexparse_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lexparse_factorization', var_lexparse_factorization);
+		}
+		if (requested[1] & (1 << 18)) {
+			result.lexparse_factorization = var_lexparse_factorization;
+			if (on_result) on_result('lexparse_factorization', var_lexparse_factorization);
+		}
+		var_plcp_array = undefined;
+	}
+	if (need[1] & (1 << 19)) {
+		if (var_counter_delta === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_delta = count_delta(var_substring_complexity);
+			if (profile) profile_record(profile, 'counter_delta', var_counter_delta, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_delta', var_counter_delta);
+		}
+		if (requested[1] & (1 << 19)) {
+			result.counter_delta = var_counter_delta;
+			if (on_result) on_result('counter_delta', var_counter_delta);
+		}
+		if (!((need[1] & (1 << 20)))) var_substring_complexity = undefined;
+	}
+	if (need[1] & (1 << 20)) {
+		if (var_counter_delta_argmax === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_delta_argmax = count_delta_argmax(var_substring_complexity);
+			if (profile) profile_record(profile, 'counter_delta_argmax', var_counter_delta_argmax, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_delta_argmax', var_counter_delta_argmax);
+		}
+		if (requested[1] & (1 << 20)) {
+			result.counter_delta_argmax = var_counter_delta_argmax;
+			if (on_result) on_result('counter_delta_argmax', var_counter_delta_argmax);
+		}
+		var_substring_complexity = undefined;
+	}
+	if (need[1] & (1 << 21)) {
+		if (var_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzss_factorization = construct_lzss_factorization(var_lpf_array);
+			if (profile) profile_record(profile, 'lzss_factorization', var_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzss_factorization', var_lzss_factorization);
+		}
+		if (requested[1] & (1 << 21)) {
+			result.lzss_factorization = var_lzss_factorization;
+			if (on_result) on_result('lzss_factorization', var_lzss_factorization);
+		}
+		if (!((need[1] & (1 << 22)))) var_lpf_array = undefined;
+	}
+	if (need[1] & (1 << 22)) {
+		if (var_lz77_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lz77_factorization = construct_lz77_factorization(var_lpf_array);
+			if (profile) profile_record(profile, 'lz77_factorization', var_lz77_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lz77_factorization', var_lz77_factorization);
+		}
+		if (requested[1] & (1 << 22)) {
+			result.lz77_factorization = var_lz77_factorization;
+			if (on_result) on_result('lz77_factorization', var_lz77_factorization);
+		}
+		var_lpf_array = undefined;
+	}
+	if (need[1] & (1 << 23)) {
+		if (var_lzssno_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzssno_factorization = construct_lzssno_factorization(var_lpnf_array);
+			if (profile) profile_record(profile, 'lzssno_factorization', var_lzssno_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzssno_factorization', var_lzssno_factorization);
+		}
+		if (requested[1] & (1 << 23)) {
+			result.lzssno_factorization = var_lzssno_factorization;
+			if (on_result) on_result('lzssno_factorization', var_lzssno_factorization);
+		}
+		var_lpnf_array = undefined;
+	}
+	if (need[1] & (1 << 24)) {
+		if (var_inverse_circular_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_circular_suffix_array = construct_inverse_circular_suffix_array(var_circular_suffix_array);
+			if (profile) profile_record(profile, 'inverse_circular_suffix_array', var_inverse_circular_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_circular_suffix_array', var_inverse_circular_suffix_array);
+		}
+		if (requested[1] & (1 << 24)) {
+			result.inverse_circular_suffix_array = var_inverse_circular_suffix_array;
+			if (on_result) on_result('inverse_circular_suffix_array', var_inverse_circular_suffix_array);
+		}
+		if (!((need[1] & (1 << 25)))) var_circular_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 25)) {
+		if (var_bbw_indices === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bbw_indices = construct_bbw_indices(var_lyndon_factorization, var_circular_suffix_array);
+			if (profile) profile_record(profile, 'bbw_indices', var_bbw_indices, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bbw_indices', var_bbw_indices);
+		}
+		if (requested[1] & (1 << 25)) {
+			result.bbw_indices = var_bbw_indices;
+			if (on_result) on_result('bbw_indices', var_bbw_indices);
+		}
+		var_lyndon_factorization = undefined;
+		var_circular_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 26)) {
+		if (var_counter_necklace_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_necklace_factorization = number_of_factors(var_necklace_factorization);
+			if (profile) profile_record(profile, 'counter_necklace_factorization', var_counter_necklace_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_necklace_factorization', var_counter_necklace_factorization);
+		}
+		if (requested[1] & (1 << 26)) {
+			result.counter_necklace_factorization = var_counter_necklace_factorization;
+			if (on_result) on_result('counter_necklace_factorization', var_counter_necklace_factorization);
+		}
+		var_necklace_factorization = undefined;
+	}
+	if (need[1] & (1 << 27)) {
+		if (var_counter_lexparse_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lexparse_factorization = number_of_factors(var_lexparse_factorization);
+			if (profile) profile_record(profile, 'counter_lexparse_factorization', var_counter_lexparse_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lexparse_factorization', var_counter_lexparse_factorization);
+		}
+		if (requested[1] & (1 << 27)) {
+			result.counter_lexparse_factorization = var_counter_lexparse_factorization;
+			if (on_result) on_result('counter_lexparse_factorization', var_counter_lexparse_factorization);
+		}
+		var_lexparse_factorization = undefined;
+	}
+	if (need[1] & (1 << 28)) {
+		if (var_counter_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzss_factorization = number_of_factors(var_lzss_factorization);
+			if (profile) profile_record(profile, 'counter_lzss_factorization', var_counter_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzss_factorization', var_counter_lzss_factorization);
+		}
+		if (requested[1] & (1 << 28)) {
+			result.counter_lzss_factorization = var_counter_lzss_factorization;
+			if (on_result) on_result('counter_lzss_factorization', var_counter_lzss_factorization);
+		}
+		var_lzss_factorization = undefined;
+	}
+	if (need[1] & (1 << 29)) {
+		if (var_counter_lz77_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lz77_factorization = number_of_factors(var_lz77_factorization);
+			if (profile) profile_record(profile, 'counter_lz77_factorization', var_counter_lz77_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lz77_factorization', var_counter_lz77_factorization);
+		}
+		if (requested[1] & (1 << 29)) {
+			result.counter_lz77_factorization = var_counter_lz77_factorization;
+			if (on_result) on_result('counter_lz77_factorization', var_counter_lz77_factorization);
+		}
+		var_lz77_factorization = undefined;
+	}
+	if (need[1] & (1 << 30)) {
+		if (var_counter_lzssno_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzssno_factorization = number_of_factors(var_lzssno_factorization);
+			if (profile) profile_record(profile, 'counter_lzssno_factorization', var_counter_lzssno_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzssno_factorization', var_counter_lzssno_factorization);
+		}
+		if (requested[1] & (1 << 30)) {
+			result.counter_lzssno_factorization = var_counter_lzssno_factorization;
+			if (on_result) on_result('counter_lzssno_factorization', var_counter_lzssno_factorization);
+		}
+		var_lzssno_factorization = undefined;
+	}
+	if (need[1] & (1 << 31)) {
+		if (var_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bbw_transform = construct_bbw_transform(var_text, var_bbw_indices);
+			if (profile) profile_record(profile, 'bbw_transform', var_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bbw_transform', var_bbw_transform);
+		}
+		if (requested[1] & (1 << 31)) {
+			result.bbw_transform = var_bbw_transform;
+			if (on_result) on_result('bbw_transform', var_bbw_transform);
+		}
+		var_bbw_indices = undefined;
+	}
+	if (need[2] & (1 << 0)) {
+		if (var_inverse_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_bbw_transform = construct_inverse_bbw_transform(var_bbw_transform);
+			if (profile) profile_record(profile, 'inverse_bbw_transform', var_inverse_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_bbw_transform', var_inverse_bbw_transform);
+		}
+		if (requested[2] & (1 << 0)) {
+			result.inverse_bbw_transform = var_inverse_bbw_transform;
+			if (on_result) on_result('inverse_bbw_transform', var_inverse_bbw_transform);
+		}
+		if (!((need[2] & (1 << 1)))) var_bbw_transform = undefined;
+	}
+	if (need[2] & (1 << 1)) {
+		if (var_counter_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_bbw_transform = number_of_runs(var_bbw_transform);
+			if (profile) profile_record(profile, 'counter_bbw_transform', var_counter_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_bbw_transform', var_counter_bbw_transform);
+		}
+		if (requested[2] & (1 << 1)) {
+			result.counter_bbw_transform = var_counter_bbw_transform;
+			if (on_result) on_result('counter_bbw_transform', var_counter_bbw_transform);
+		}
+		var_bbw_transform = undefined;
+	}
+	if (need[2] & (1 << 2)) {
+		if (var_counter_inverse_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_inverse_bbw_transform = number_of_runs(var_inverse_bbw_transform);
+			if (profile) profile_record(profile, 'counter_inverse_bbw_transform', var_counter_inverse_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_inverse_bbw_transform', var_counter_inverse_bbw_transform);
+		}
+		if (requested[2] & (1 << 2)) {
+			result.counter_inverse_bbw_transform = var_counter_inverse_bbw_transform;
+			if (on_result) on_result('counter_inverse_bbw_transform', var_counter_inverse_bbw_transform);
+		}
+		var_inverse_bbw_transform = undefined;
+	}
+	return result;
+}
+const citations = {};
+function create_morphism(images, start, coding) {
+    const table = [];
+    for(const letter in images){
+        table[letter.charCodeAt(0)] = Uint16Array.from(images[letter].split(''), (c)=>c.charCodeAt(0));
+    }
+    let coding_table = null;
+    if (coding) {
+        coding_table = [];
+        for(const letter in coding)coding_table[letter.charCodeAt(0)] = coding[letter].charCodeAt(0);
+    }
+    let first = start.charCodeAt(0);
+    let prolongable = 0;
+    while(table[first][0] != first && prolongable < table.length){
+        first = table[first][0];
+        ++prolongable;
+    }
+    return {
+        images: table,
+        coding: coding_table,
+        orders: [
+            Uint16Array.of(start.charCodeAt(0))
+        ],
+        prolongable: prolongable
+    };
+}
+function morphism_expand(m, word, limit) {
+    const images = m.images;
+    let length = 0;
+    let end = 0;
+    while(end < word.length && length < limit)length += images[word[end++]].length;
+    const result = new Uint16Array(Math.min(length, limit));
+    let pos = 0;
+    for(let i = 0; i < end; ++i){
+        const image = images[word[i]];
+        for(let j = 0; j < image.length && pos < result.length; ++j)result[pos++] = image[j];
+    }
+    return result;
+}
+function morphism_order(m, k) {
+    const orders = m.orders;
+    while(orders.length <= k)orders.push(morphism_expand(m, orders[orders.length - 1], Infinity));
+    return orders[Math.max(0, k)];
+}
+function morphism_prefix(m, length) {
+    morphism_order(m, m.prolongable);
+    const orders = m.orders;
+    for(let k = m.prolongable; k < orders.length; ++k){
+        if (orders[k].length >= length) return orders[k].subarray(0, Math.max(0, length));
+    }
+    let word = orders[orders.length - 1];
+    for(let stalled = 0; word.length < length && stalled < m.images.length;){
+        const next = morphism_expand(m, word, length);
+        stalled = next.length > word.length ? 0 : stalled + 1;
+        word = next;
+    }
+    return word;
+}
+function units_to_string(units, coding) {
+    if (coding) {
+        const coded = new Uint16Array(units.length);
+        for(let i = 0; i < units.length; ++i)coded[i] = coding[units[i]];
+        units = coded;
+    }
+    const chunks = [];
+    for(let i = 0; i < units.length; i += 1 << 14){
+        chunks.push(String.fromCharCode.apply(null, units.subarray(i, i + (1 << 14))));
+    }
+    return chunks.join('');
+}
+function morphic_word(m, k) {
+    return units_to_string(morphism_order(m, k), m.coding);
+}
+function morphic_prefix(m, length) {
+    return units_to_string(morphism_prefix(m, length), m.coding);
+}
+const FIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'a'
+}, 'b');
+function generate_fibonacci_word(k) {
+    return morphic_word(FIBONACCI_MORPHISM, k);
+}
+function prefix_fibonacci_word(length) {
+    return morphic_prefix(FIBONACCI_MORPHISM, length);
+}
+const TRIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'a'
+}, 'a');
+function generate_tribonacci_word(k) {
+    return morphic_word(TRIBONACCI_MORPHISM, k);
+}
+function prefix_tribonacci_word(length) {
+    return morphic_prefix(TRIBONACCI_MORPHISM, length);
+}
+const THUE_MORSE_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ba'
+}, 'a');
+function generate_thue_morse_word(k) {
+    return morphic_word(THUE_MORSE_MORPHISM, k);
+}
+function prefix_thue_morse_word(length) {
+    return morphic_prefix(THUE_MORSE_MORPHISM, length);
+}
+const MEPHISTO_WALTZ_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'bba'
+}, 'a');
+function generate_mephisto_waltz_word(k) {
+    return morphic_word(MEPHISTO_WALTZ_MORPHISM, k);
+}
+function prefix_mephisto_waltz_word(length) {
+    return morphic_prefix(MEPHISTO_WALTZ_MORPHISM, length);
+}
+const VTM_MORPHISM = create_morphism({
+    a: 'abc',
+    b: 'ac',
+    c: 'b'
+}, 'a');
+function generate_vtm_word(k) {
+    return morphic_word(VTM_MORPHISM, k);
+}
+function prefix_vtm_word(length) {
+    return morphic_prefix(VTM_MORPHISM, length);
+}
+const SIERPINSKI_MORPHISM = create_morphism({
+    a: 'aba',
+    b: 'bbb'
+}, 'a');
+function generate_sierpinski_word(k) {
+    return morphic_word(SIERPINSKI_MORPHISM, k);
+}
+function prefix_sierpinski_word(length) {
+    return morphic_prefix(SIERPINSKI_MORPHISM, length);
+}
+const PELL_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'a'
+}, 'a');
+function generate_pell_word(k) {
+    return morphic_word(PELL_MORPHISM, k);
+}
+function prefix_pell_word(length) {
+    return morphic_prefix(PELL_MORPHISM, length);
+}
+const CHACON_MORPHISM = create_morphism({
+    a: 'aaba',
+    b: 'b'
+}, 'a');
+function generate_chacon_word(k) {
+    return morphic_word(CHACON_MORPHISM, k);
+}
+function prefix_chacon_word(length) {
+    return morphic_prefix(CHACON_MORPHISM, length);
+}
+const VON_NEUMANN_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'b'
+}, 'a');
+function generate_von_neumann_word(k) {
+    return morphic_word(VON_NEUMANN_MORPHISM, k);
+}
+function prefix_von_neumann_word(length) {
+    return morphic_prefix(VON_NEUMANN_MORPHISM, length);
+}
+const RUDIN_SHAPIRO_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'db',
+    d: 'dc'
+}, 'a', {
+    a: 'a',
+    b: 'a',
+    c: 'b',
+    d: 'b'
+});
+function generate_rudin_shapiro_word(k) {
+    return morphic_word(RUDIN_SHAPIRO_MORPHISM, k);
+}
+function prefix_rudin_shapiro_word(length) {
+    return morphic_prefix(RUDIN_SHAPIRO_MORPHISM, length);
+}
+const BAUM_SWEET_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'cb',
+    c: 'bd',
+    d: 'dd'
+}, 'a', {
+    a: 'a',
+    b: 'b',
+    c: 'a',
+    d: 'a'
+});
+function generate_baum_sweet_word(k) {
+    return morphic_word(BAUM_SWEET_MORPHISM, k);
+}
+function prefix_baum_sweet_word(length) {
+    return morphic_prefix(BAUM_SWEET_MORPHISM, length);
+}
+function generate_kolakoski_word(k) {
+    let word = kolakoski_units(2);
+    for(let i = 0; i < k; ++i){
+        let length = 0;
+        for(let j = 0; j < word.length; ++j)length += word[j] == 97 ? 1 : 2;
+        word = kolakoski_units(length);
+    }
+    return units_to_string(word, null);
+}
+function kolakoski_units(length) {
+    const units = new Uint16Array(Math.max(0, length));
+    const seed = [
+        97,
+        98,
+        98
+    ];
+    let pos = 0;
+    for(; pos < units.length && pos < seed.length; ++pos)units[pos] = seed[pos];
+    for(let run = 2; pos < units.length; ++run){
+        const letter = run % 2 == 0 ? 97 : 98;
+        units[pos++] = letter;
+        if (units[run] == 98 && pos < units.length) units[pos++] = letter;
+    }
+    return units;
+}
+function prefix_kolakoski_word(length) {
+    return units_to_string(kolakoski_units(length), null);
+}
+const generator_lengths = {"fibonacci_word":[1,1,2,3,5,8,13,21,34,55,89,144,233,377,610,987,1597,2584,4181,6765,10946,17711,28657],"tribonacci_word":[1,2,4,7,13,24,44,81,149,274,504,927,1705,3136,5768,10609,19513],"thue_morse_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"mephisto_waltz_word":[1,3,9,27,81,243,729,2187,6561,19683],"vtm_word":[1,3,6,12,24,48,96,192,384,768,1536,3072,6144,12288,24576],"sierpinski_word":[1,3,9,27,81,243,729,2187,6561,19683],"pell_word":[1,3,7,17,41,99,239,577,1393,3363,8119,19601],"chacon_word":[1,4,13,40,121,364,1093,3280,9841,29524],"von_neumann_word":[1,3,7,15,31,63,127,255,511,1023,2047,4095,8191,16383,32767],"rudin_shapiro_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"baum_sweet_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"kolakoski_word":[2,3,5,7,10,15,23,34,50,75,113,170,255,382,574,863,1293,1937,2903,4353,6526,9789,14688,22029]};
+const string_generators = {
+	'fibonacci_word': generate_fibonacci_word,
+	'tribonacci_word': generate_tribonacci_word,
+	'thue_morse_word': generate_thue_morse_word,
+	'mephisto_waltz_word': generate_mephisto_waltz_word,
+	'vtm_word': generate_vtm_word,
+	'sierpinski_word': generate_sierpinski_word,
+	'pell_word': generate_pell_word,
+	'chacon_word': generate_chacon_word,
+	'von_neumann_word': generate_von_neumann_word,
+	'rudin_shapiro_word': generate_rudin_shapiro_word,
+	'baum_sweet_word': generate_baum_sweet_word,
+	'kolakoski_word': generate_kolakoski_word,
+};
+const string_generator_prefixes = {
+	'fibonacci_word': prefix_fibonacci_word,
+	'tribonacci_word': prefix_tribonacci_word,
+	'thue_morse_word': prefix_thue_morse_word,
+	'mephisto_waltz_word': prefix_mephisto_waltz_word,
+	'vtm_word': prefix_vtm_word,
+	'sierpinski_word': prefix_sierpinski_word,
+	'pell_word': prefix_pell_word,
+	'chacon_word': prefix_chacon_word,
+	'von_neumann_word': prefix_von_neumann_word,
+	'rudin_shapiro_word': prefix_rudin_shapiro_word,
+	'baum_sweet_word': prefix_baum_sweet_word,
+	'kolakoski_word': prefix_kolakoski_word,
+};
+const tutorials = {};
+tutorials['fibonacci_word'] = {
+	'title' : 'Fibonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to a \\} \\) on the letter \'b\'',
+	'oeis' : 'A003849',
+	'wikipedia' : 'Fibonacci_word'
+};
+tutorials['tribonacci_word'] = {
+	'title' : 'Tribonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A080843',
+	'wikipedia' : 'Tribonacci_word'
+};
+tutorials['thue_morse_word'] = {
+	'title' : 'Thue-Morse',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ba \\} \\) on the letter \'a\'',
+	'oeis' : 'A010060',
+	'wikipedia' : 'Thue-Morse_sequence'
+};
+tutorials['mephisto_waltz_word'] = {
+	'title' : 'Mephisto-Waltz',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to bba \\} \\) on the letter \'a\'',
+	'oeis' : 'A064990',
+	'cite' : 'allouche03automatic'
+};
+tutorials['vtm_word'] = {
+	'title' : 'vtm',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to abc, b \\to ac, c \\to b \\} \\) on the letter \'a\''
+};
+tutorials['sierpinski_word'] = {
+	'title' : 'Sierpinski',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aba, b \\to bbb \\} \\) on the letter \'a\'',
+	'oeis' : 'A316829'
+};
+tutorials['pell_word'] = {
+	'title' : 'Pell',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A171588',
+	'wikipedia' : 'Pell_number'
+};
+tutorials['chacon_word'] = {
+	'title' : 'Chacon',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aaba, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A049320'
+};
+tutorials['von_neumann_word'] = {
+	'title' : 'Neumannn',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A308187'
+};
+tutorials['rudin_shapiro_word'] = {
+	'title' : 'Rudin-Shapiro',
+	'content' : 'Morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to db, d \\to dc \\} \\) followed by the coding \\( \\{ a,b \\to a; c,d \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A020987',
+	'wikipedia' : 'Rudin–Shapiro_sequence'
+};
+tutorials['baum_sweet_word'] = {
+	'title' : 'Baum-Sweet',
+	'content' : 'Word defined by setting the \\(j\\)-th letter to \'b\' if the binary representation of \\(j\\) contains no block of consecutive 0s of odd length, and to \'a\' otherwise.',
+	'oeis' : 'A086747',
+	'wikipedia' : 'Baum–Sweet_sequence'
+};
+tutorials['kolakoski_word'] = {
+	'title' : 'Kolakoski',
+	'content' : 'Self-generating word over the alphabet {a,b} where \'a\' represents 1 and \'b\' represents 2. The word starts with "ab" and the lengths of consecutive runs are given by the word itself.',
+	'oeis' : 'A000002',
+	'wikipedia' : 'Kolakoski_sequence'
+};
+tutorials['sigma'] = {
+	'title' : '&sigma;',
+	'content' : 'The effective alphabet size of a string is the number of distinct symbols it contains.'
+};
+tutorials['period'] = {
+	'title' : 'p',
+	'content' : 'The shortest period of a string is the smallest positive integer such that the string is a prefix of an infinite repetition of the prefix of that length. Concretely, the shortest period \\(p\\) of the text \\(T\\) is the length of the shortest prefix \\(P\\) of \\(T\\) such that \\(T\\) is a prefix of \\(P^{k}\\) for some integer \\(k \\geq 1\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+tutorials['exponent'] = {
+	'title' : 'e',
+	'content' : 'The exponent of a string is the division of the string\'s length by its shortest period, representing how many times the shortest period needs to be repeated to form the string. Formally, the exponent of the text \\(T\\) is defined as the length of \\(T\\) divided by the length of its shortest period \\(p\\), i.e., \\(\\frac{|T|}{p}\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+tutorials['regularity'] = {
+	'title' : 'R',
+	'content' : 'The regularity type of a string classifies it based on its periodic structure. A string can be categorized as unbordered, primitive, square, or non-primitive based on its borders and periods. Specifically, a string is unbordered if it has no proper border, primitive if it cannot be expressed as a repetition of a smaller substring, square if it is formed by repeating a substring exactly twice, and non-primitive if it can be expressed as a repetition of a smaller substring more than twice.'
+};
+tutorials['suffix_array'] = {
+	'title' : 'SA',
+	'content' : 'The suffix array sorts the entry indices of a string based on the lexicographical order of their corresponding suffixes. Formally, the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the suffixes of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{SA}[i]..n] \\prec T[\\mathsf{SA}[i+1]..n]\\) for all text positions \\(i \\in [1..n-1]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+tutorials['border_array'] = {
+	'title' : 'B',
+	'content' : 'The border array of a string stores the lengths of the longest borders for each prefix of the string. A border of a string is defined as a substring that is both a proper prefix and a proper suffix. Formally, the border array \\(\\mathsf{B}\\) for a text \\(T[1..n]\\) is an array where each entry \\(\\mathsf{B}[i]\\) represents the length of the longest border of the prefix \\(T[1..i]\\), i.e., \\(\\mathsf{B}[i]\\) is the largest integer \\(k \\le i-1\\) such that \\(T[1..k] = T[i-k+1..i]\\). By definition, \\(\\mathsf{B}[0] = 0\\).',
+	'wikipedia' : 'Knuth–Morris–Pratt_algorithm'
+};
+tutorials['bw_transform'] = {
+	'title' : 'BWT',
+	'content' : 'The Burrows-Wheeler Transform (BWT) is a reversible transformation that rearranges the characters of a string based on the lexicographical order of its cyclic rotations. Formally, given a text \\(T[1..n]\\) and its rotation array \\(\\mathsf{Rot}\\), the BWT \\(\\mathsf{BWT}[1..n]\\) is defined such that \\(\\mathsf{BWT}[i] = T[(\\mathsf{Rot}[i] + n - 1) \\mod n]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['first_array'] = {
+	'title' : 'F',
+	'content' : 'The First Column Array represents the first column of the sorted rotations of a string, which is obtained by sorting the characters of the string in lexicographical order. Formally, for a given text \\(T[1..n]\\), the First Column Array \\(\\mathsf{F}\\) is defined as the sorted sequence of characters in \\(T\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['index_array'] = {
+	'title' : 'i',
+	'content' : 'The index array contains a sequence of integers from \\(1\\) to \\(n\\), where \\(n\\) is the length of the input text \\(T[1..n]\\). Formally, the index array \\(\\mathsf{i}\\) is defined such that \\(\\mathsf{i}[j] = j\\) for each \\(j \\in [1..n]\\).'
+};
+tutorials['rotation_array'] = {
+	'title' : 'Rot',
+	'content' : 'The rotation array sorts the entry indices of a string based on the lexicographical order of their corresponding cyclic rotations. Formally, the rotation array \\(\\mathsf{Rot}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the cyclic rotations of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{Rot}[i]..n]T[1..\\mathsf{Rot}[i]-1] \\prec T[\\mathsf{Rot}[i+1]..n]T[1..\\mathsf{Rot}[i+1]-1]\\) for all text positions \\(i \\in [1..n-1]\\), where $\\prec$ is a total order by assigning lower ranks to lexicographically smaller strings and uses the text position \\(i\\) for tie-breaking.'
+};
+tutorials['inverse_suffix_array'] = {
+	'title' : 'ISA',
+	'content' : 'The inverse suffix array provides a mapping from each starting index of the suffixes of a string back to their respective positions in the suffix array. Formally, given the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\), the inverse suffix array \\(\\mathsf{ISA}\\) is defined such that \\(\\mathsf{ISA}[\\mathsf{SA}[i]] = i\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+tutorials['phi_array'] = {
+	'title' : '&Phi;',
+	'content' : 'The Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically preceding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Phi array \\(\\mathsf{\\Phi}\\) is defined such that \\(\\mathsf{\\Phi}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] - 1]\\) if \\(\\mathsf{ISA}[i] > 0\\), and \\(\\mathsf{\\Phi}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = 0\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp'
+};
+tutorials['inverse_phi_array'] = {
+	'title' : '&Phi;&#8315;&#185;',
+	'content' : 'The inverse Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically succeeding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the inverse Phi array \\(\\mathsf{\\Phi}^{-1}\\) is defined such that \\(\\mathsf{\\Phi}^{-1}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] + 1]\\) if \\(\\mathsf{ISA}[i] \\le n-1 \\), and \\(\\mathsf{\\Phi}^{-1}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = n \\), for each \\(i \\in [1..n]\\).'
+};
+tutorials['lcp_array'] = {
+	'title' : 'LCP',
+	'content' : 'The Longest Common Prefix (LCP) array stores the lengths of the longest common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given text \\(T[1..n]\\) and its suffix array \\(\\mathsf{SA}\\), the LCP array \\(\\mathsf{LCP}[1..n]\\) is defined such that \\(\\mathsf{LCP}[1] = 0\\) and \\(\\mathsf{LCP}[i] = \\text{lcp}(T[\\mathsf{SA}[i]..n], T[\\mathsf{SA}[i-1]..n])\\) for each \\(i \\in [2..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['lcp_array'] = {
+	'title' : '&Sigma; LCP',
+	'content' : 'The sum of the Longest Common Prefix (LCP) array values provides a measure of the total length of common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given LCP array \\(\\mathsf{LCP}[1..n]\\), the sum \\(\\Sigma \\mathsf{LCP}\\) is defined as \\(\\sum_{i=1}^{n} \\mathsf{LCP}[i]\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['plcp_array'] = {
+	'title' : 'PLCP',
+	'content' : 'The Permuted Longest Common Prefix (PLCP) array reorders the values of the Longest Common Prefix (LCP) array based on the respective positions in the string. Formally, for the inverse suffix array \\(\\mathsf{ISA}\\) and LCP array \\(\\mathsf{LCP}\\) of the text \\(T[1..n]\\), the PLCP array \\(\\mathsf{PLCP}[1..n]\\) is defined such that \\(\\mathsf{PLCP}[i] = \\mathsf{LCP}[\\mathsf{ISA}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['psi_array'] = {
+	'title' : '&Psi;',
+	'content' : 'The Psi array provides a mapping inside the suffix array that advances by one text position. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Psi array \\(\\mathsf{\\Psi}\\) is defined such that \\(\\mathsf{\\Psi}[i] = \\mathsf{ISA}[\\mathsf{SA}[i] + 1]\\) if \\(\\mathsf{SA}[i] + 1 < n\\), and \\(\\mathsf{\\Psi}[i] = \\bot\\) if \\(\\mathsf{SA}[i] + 1 = n\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'grossi05csa'
+};
+tutorials['lyndon_factorization'] = {
+	'title' : 'LynF',
+	'content' : 'The Lyndon factorization of a string decomposes it into a sequence of Lyndon words in lexicographically non-increasing order, where a Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations.',
+	'cite' : 'chen58lyndon'
+};
+tutorials['delta'] = {
+	'title' : '&delta;',
+	'content' : 'The substring complexity measure quantifies the maximum ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the maximum value of \\(\\frac{\\mathsf{SC}[k]}{k}\\) for \\(k \\in [1..n]\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['delta_argmax'] = {
+	'title' : 'max &delta;',
+	'content' : 'The substring complexity measure length identifies the substring length that maximizes the ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the length \\(k\\) that maximizes \\(\\frac{\\mathsf{SC}[k]}{k}\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['substring_complexity'] = {
+	'title' : 'SC',
+	'content' : 'The substring complexity array quantifies the number of distinct substrings of various lengths within a string. Given the Longest Common Prefix (LCP) array of a string, the substring complexity array \\(\\mathsf{SC}[1..n]\\) is defined such that for each length \\(k \\in [1..n]\\), \\(\\mathsf{SC}[k]\\) represents the count of distinct substrings of length \\(k\\). The computation leverages the LCP values to efficiently determine the number of new substrings introduced at each length.',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['lf_array'] = {
+	'title' : 'LF',
+	'content' : 'The Last-to-First (LF) mapping array identifies characters from the last column with those from the first column of the Burrows-Wheeler Transform (BWT) that orginated from the same text position. Given the first column \\(\\mathsf{F}\\) and \\(\\textsf{BWT}\\), the LF mapping array \\(\\mathsf{LF}[1..n]\\) is defined such that \\(\\mathsf{LF}[i] = \\text{select}(\\textsf{F}, \\textsf{BWT}[i], \\text{rank}(\\textsf{BWT}, \\textsf{BWT}[i], i))\\) for each \\(i \\in [1..n]\\), where \\(\\text{rank}(\\textsf{BWT}, c, i)\\) counts the occurrences of character \\(c\\) in the prefix \\(\\textsf{BWT}[1..i]\\), and \\(\\text{select}(\\textsf{F}, c, r)\\) finds the position of the \\(r\\)-th occurrence of character \\(c\\) in \\(\\textsf{F}\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['sl_string'] = {
+	'title' : 'S/L',
+	'content' : 'The S/L type string classifies each character in a string as either S-type or L-type based on the lexicographic order of the suffixes starting at those characters. A character at position \\(i\\) is classified as S-type if the suffix starting at \\(i\\) is lexicographically smaller than the suffix starting at \\(i+1\\), and L-type if it is larger. If the suffixes are equal, the type is determined by the type of the suffix starting at \\(i+1\\). Additionally, an S-type character that is the first character or immediately preceded by an L-type character is marked as S*-type.',
+	'cite' : 'nong11sais'
+};
+tutorials['lpf_array'] = {
+	'title' : 'LPF',
+	'content' : 'The Longest Previous Factor (LPF) array stores the length of the longest prefix of each suffix of a string that matches a substring starting at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPF array \\(\\mathsf{LPF}[1..n]\\) is defined such that \\(\\mathsf{LPF}[i] = \\max_{j \\in [1..i-1]} \\text{lcp}(T[i..n], T[j..n])\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+tutorials['lpnf_array'] = {
+	'title' : 'LPnF',
+	'content' : 'The Longest Previous Non-Overlapping Factor (LPnF) array stores the length of the longest prefix of each suffix of a string that matches a substring ending at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPnF array \\(\\mathsf{LPnF}[1..n]\\) is defined such that \\(\\mathsf{LPnF}[i] = \\max_{j \\in [1..i-1]} \\min(i-j,\\text{lcp}(T[i..n], T[j..n]))\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+tutorials['lnf_array'] = {
+	'title' : 'LNF',
+	'content' : 'The Longest Next Factor (LNF) array is the LPF array of the reversed text.'
+};
+tutorials['lzss_factorization'] = {
+	'title' : 'LZSS',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski (LZSS) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring with an earlier starting position. The factorization is constructed greedily by selecting the longest previous factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+tutorials['lzssno_factorization'] = {
+	'title' : 'LZSSno',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski non-overlapping (LZSSno) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring ending at an earlier positition. The factorization is constructed greedily by selecting the longest previous non-overlapping factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\min(i-j, \\text{lcp}(T[i..n], T[j..n])) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+tutorials['lz77_factorization'] = {
+	'title' : 'LZ77',
+	'content' : 'The Lempel-Ziv-77  (LZ77) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring starting at a prior position within the same string. The factorization is constructed greedily by selecting the longest previous factor at each position in the string, with an additional character appended to the factor. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) + 1 \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'ziv77lz'
+};
+tutorials['reverse_lzss_factorization'] = {
+	'title' : 'rLZSS',
+	'content' : 'The Reverse Lempel-Ziv-Storer-Szymanski (rLZSS) factorization of a string is the LZSS factorization of the reversed string obtained by reading the string in reversed order.',
+	'cite' : 'storer82lzss'
+};
+tutorials['lexparse_factorization'] = {
+	'title' : 'LexParse',
+	'content' : 'The lexicographic parse (lexparse) decomposes a string into a sequence of factors based on the permuted longest common prefix (PLCP) array. Each factor is determined by the longest prefix of the suffix starting at the current position that matches a substring starting at a lexicographically smaller suffix position. Formally, for a given text \\(T[1..n]\\) and its PLCP array \\(\\mathsf{PLCP}[1..n]\\), the length of the factor starting at position \\(i\\) is \\(\\mathsf{PLCP}[i]\\) or 1 if \\(\\mathsf{PLCP}[i] = 0\\).',
+	'cite' : 'navarro21approximation'
+};
+tutorials['nss_array'] = {
+	'title' : 'NSS',
+	'content' : 'The Next Smaller Suffix (NSS) array identifies the subsequent suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the NSS array \\(\\mathsf{NSS}[1..n]\\) is defined such that \\(\\mathsf{NSS}[i] = \\min \\{ j > i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{NSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+tutorials['pss_array'] = {
+	'title' : 'PSS',
+	'content' : 'The Previous Smaller Suffix (PSS) array identifies the preceding suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the PSS array \\(\\mathsf{PSS}[1..n]\\) is defined such that \\(\\mathsf{PSS}[i] = \\max \\{ j < i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{PSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+tutorials['lyndon_array'] = {
+	'title' : 'Lyndon',
+	'content' : 'The Lyndon array stores the lengths of the longest Lyndon words starting at each position in a string. A Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations. Given the Next Smaller Suffix (NSS) array \\(\\mathsf{NSS}[1..n]\\) of a text \\(T[1..n]\\), the Lyndon array \\(\\mathsf{Lyndon}[1..n]\\) is defined such that \\(\\mathsf{Lyndon}[i] = \\mathsf{NSS}[i] - i\\) if \\(\\mathsf{NSS}[i] \\neq \\bot\\), and \\(\\mathsf{Lyndon}[i] = n - i + 1\\) otherwise, for each \\(i \\in [1..n]\\).',
+	'cite' : 'franek16algorithms'
+};
+tutorials['necklace_conjugate_transform'] = {
+	'title' : 'min-rot(T)',
+	'content' : 'The necklace conjugate of a string is the lexicographically smallest string that can be obtained by rotating the original string. This involves generating all possible rotations (conjugates) of the string and selecting the smallest one in lexicographic order.'
+};
+tutorials['invert_transform'] = {
+	'title' : 'inv(T)',
+	'content' : 'The invert transform of a string maps each character to its complementary character based on the effective alphabet of the string. Specifically, given a string that contains \\(s\\) distinct symbols, it swaps the \\(i\\)-th smallest symbol with the \\((s - i + 1)\\)-th smallest one, for every \\(i \\in \\{1,\\dots,s\\}\\).'
+};
+tutorials['revert_transform'] = {
+	'title' : 'rev(T)',
+	'content' : 'The revert transform of a string is obtained by reversing the order of its characters. Given a text \\(T[1..n]\\), the revert transform \\(\\mathsf{Revert}(T)\\) produces the string \\(T[n] T[n-1] \\ldots T[1]\\), where the characters are arranged in the opposite order, effectively reading the string backwards.'
+};
+tutorials['circular_suffix_array'] = {
+	'title' : 'CSA',
+	'content' : 'The Circular Suffix Array (CSA) of a string is a permutation of text positions that assigns a rank to each cyclic rotation (conjugate) of the Lyndon factors of the string based on the omega order. Given a text \\(T[1..n]\\) and its Lyndon factorization, the CSA \\(\\mathsf{CSA}[1..n]\\) is defined such that \\(\\mathsf{CSA}[i]\\) gives the starting position in \\(T\\) of the \\(i\\)-th smallest conjugate in \\(\\omega\\)-order among all conjugates of the Lyndon factors of \\(T\\).',
+	'cite' : 'hon13spaceefficient'
+};
+tutorials['inverse_circular_suffix_array'] = {
+	'title' : 'CISA',
+	'content' : 'The inverse circular suffix array (ICSA) is the reverse permutation of the circular suffix array (CSA).',
+	'cite' : 'hon13spaceefficient'
+};
+tutorials['bbw_indices'] = {
+	'title' : 'BBWTi',
+	'content' : 'The Bijective Burrows-Wheeler Transform Indices (BBWTi) array stores the text positions of the circular sufix array (CSA) decremented by one, but mapping positions at the beginning of Lyndon factors to the end of the respective Lyndon factor.',
+	'cite' : 'bannai25survey'
+};
+tutorials['bbw_transform'] = {
+	'title' : 'BBWT',
+	'content' : 'The Bijective Burrows-Wheeler Transform (BBWT) of a string rearranges the characters of the original string based on the Bijective Burrows-Wheeler Transform Indices (BBWTi). Given a text \\(T[1..n]\\) and its BBWTi array \\(\\mathsf{BBWTi}[1..n]\\), the BBWT \\(\\mathsf{BBWT}[1..n]\\) is defined such that \\(\\mathsf{BBWT}[i] = T[\\mathsf{BBWTi}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'bannai25survey'
+};
+tutorials['inverse_bbw_transform'] = {
+	'title' : 'BBWT&#8315;&#185;',
+	'content' : 'The inverse Bijective Burrows-Wheeler Transform (inverse BBWT), also called the Gessel-Reutenauer transformation, applies the LF-mapping on the cycles in the BBWT to extract all Lyndon words, which sorted in lexicographically descreing order recovers the original text.',
+	'cite' : 'bannai25survey'
+};
+tutorials['lz78_factorization'] = {
+	'title' : 'LZ78',
+	'content' : 'The Lempel-Ziv-78 (LZ78) factorization decomposes a string into a sequence of factors based on previously seen substrings. Each factor consists of a reference to the longest previously seen factor (or zero if none exists) followed by a new character.',
+	'cite' : 'ziv78lz'
+};
+tutorials['lzw_factorization'] = {
+	'title' : 'LZW',
+	'content' : 'The Lempel-Ziv-Welch (LZW) factorization decomposes a string into a sequence of factors by building a dictionary of previously seen substrings. Each factor is the longest prefix of the remaining text that exists in the dictionary, followed by the next character.',
+	'cite' : 'welch84lzw'
+};
+tutorials['necklace_factorization'] = {
+	'title' : 'NeckF',
+	'content' : 'The Necklace factorization is the Lyndon factorization colliding all equal Lyndon factors to a single factor that is a necklace. The number of factors is the number of distinct Lyndon factors.',
+	'cite' : 'chen58lyndon'
+};
+tutorials['odd_maximal_palindromic_length_array'] = {
+	'title' : 'o-pali',
+	'content' : 'The odd maximal palindromic length array (o-pali) stores at each position the length of the left arm of the longest odd-length palindromic substring centered at that position, excluding the position itself in the length measurement. Hence, a palindrome of length \\(2k+1\\) contributes \\(k\\) to the o-pali array at its center position.',
+	'cite' : 'manacher75new'
+};
+tutorials['even_maximal_palindromic_length_array'] = {
+	'title' : 'e-pali',
+	'content' : 'The even maximal palindromic length array (e-pali) stores at each position the length of the longest even-length palindromic substring centered between that and its preding position.',
+	'cite' : 'manacher75new'
+};
+tutorials['lzend_factorization'] = {
+	'title' : 'LZend',
+	'content' : 'The LZ-end factorization is a restriction of the Lempel-Ziv 77 factorization where each new factor, omitting its last new character, must be the longest possible prefix of the remaining text that also appears ending exactly at the end of a previous factor, or just a single character if no such match exists.',
+	'cite' : 'kreft13lzend'
+};
+tutorials['gamma_factorization'] = {
+	'title' : '&Gamma;',
+	'content' : 'A string attractor is a set of positions in a string such that every distinct substring has at least one occurrence that crosses one of these positions. The smallest string attractor size is the minimum number of positions needed to form such a set. Here, \\(\\Gamma\\) is the leftmost such smallest string attractor, i.e., the one that has the lexicographically smallest sequence of positions.',
+	'cite' : 'kempa18stringattractors'
+};
+function number_of_runs(text) {
+    if (!text) {
+        return 0;
+    }
+    let runs = 1;
+    let runchar = text[0];
+    for(let i = 1; i < text.length; ++i){
+        if (text[i] !== runchar) {
+            runs++;
+            runchar = text[i];
+        }
+    }
+    return runs;
+}
+function number_of_factors(factorization) {
+    if (!factorization) {
+        return 0;
+    }
+    let count = 0;
+    for(let i = 0; i < factorization.length; ++i){
+        if (factorization[i]) {
+            ++count;
+        }
+    }
+    return count;
+}
+function pad_right(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return text + pad_char.repeat(times);
+}
+function pad_left(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return pad_char.repeat(times) + text;
+}
+function increment_array(array, inc = 1) {
+    return Array.from(array, (x)=>x + inc);
+}
+function replace_invalid_position(array, max_length) {
+    return Array.from(array, (x)=>x >= max_length ? '-' : x);
+}
+function prettify_string(text, sep = " ", base = 0, do_tabularize = true, length = text.length) {
+    text = text.split('\0').join("$");
+    const width = do_tabularize ? String(length + base - 1).length : 0;
+    let effectiveSep = sep;
+    if (!do_tabularize) {
+        effectiveSep = '';
+    }
+    return text.split('').map((x)=>pad_left(x, ' ', width)).join(effectiveSep);
+}
+function prettify_array(array, sep = " ", base = 0, length = array.length) {
+    const maxIndexValue = Math.max(0, length + base - 1);
+    const width = ("" + maxIndexValue).toString().length;
+    return Array.from(array, (x)=>pad_left("" + x, ' ', width)).join(sep);
+}
+function prettify_factorization(text, factorization, sep = " ", base = 0, length = text.length) {
+    const n = text.length;
+    const width = String(Math.max(0, length + base - 1)).length;
+    let result = "";
+    for(let i = 0; i < n; ++i){
+        const elementToDisplay = i === n - 1 && text[i] === '\0' ? '$' : text[i];
+        result += pad_left(elementToDisplay, ' ', width);
+        result += factorization[i] ? '|' + sep.substring(1) : sep;
+    }
+    return result;
+}
+function encodeWhitespaces(text) {
+    return text.replace(/\r/g, '\u240d').replace(/\n/g, '\u21b5').replace(/\t/g, '\u2409').replace(/\v/g, '\u240b').replace(/\f/g, '\u240c').replace(/ /g, '\u23b5');
+}
+function decodeWhitespaces(text) {
+    return text.replace(/\u240d/g, '\r').replace(/\u21b5/g, '\n').replace(/\u2409/g, '\t').replace(/\u240b/g, '\v').replace(/\u240c/g, '\f').replace(/\u23b5/g, ' ');
+}
+function repeat(str, n) {
+    let r = "";
+    while(n-- > 0)r += str;
+    return r;
+}
+function escapeLatex(s) {
+    return String(s).replace(/\\/g, "\\textbackslash{}").replace(/([#$%&_{}])/g, "\\$1");
+}
+function isBoolRow(row) {
+    return typeof row.data[0] === "boolean";
+}
+function isStringRow(row) {
+    return typeof row.data[0] === "string";
+}
+function partitionsFromBool(boolArr) {
+    const parts = [];
+    let len = 0;
+    for(let i = 0; i < boolArr.length; i++){
+        len++;
+        if (boolArr[i]) {
+            parts.push(len);
+            len = 0;
+        }
+    }
+    return parts;
+}
+function* export_latex_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required");
+    }
+    const T = tRow.data;
+    yield `\\begin{tabular}{l|${"c".repeat(n)}}\n\\hline`;
+    for (const row of rows){
+        let line = `\n${escapeLatex(row.name)} & `;
+        let cells = 0;
+        if (isBoolRow(row)) {
+            const parts = partitionsFromBool(row.data);
+            let pos = 0;
+            for(let p = 0; p < parts.length; p++){
+                const k = parts[p];
+                let text = "";
+                for(let i = 0; i < k; i++){
+                    text += escapeLatex(T[pos++]);
+                }
+                line += `\\multicolumn{${k}}{c}{${text}}`;
+                if (p !== parts.length - 1) line += " & ";
+                cells += k;
+                if (cells >= chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        } else {
+            for(let i = 0; i < n; i++){
+                line += escapeLatex(row.data[i]);
+                if (i !== n - 1) line += " & ";
+                if (++cells === chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        }
+        yield line + " \\\\";
+    }
+    yield "\n\\hline\n\\end{tabular}";
+}
+function export_latex(rows) {
+    return Array.from(export_latex_chunks(rows)).join("");
+}
+function* export_markdown_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required for boolean partitions");
+    }
+    const T = tRow.data;
+    let line = "| ";
+    for(let i = 0; i < n; i++){
+        line += "|" + String(i + 1);
+        if ((i + 1) % chunk_cells === 0) {
+            yield line;
+            line = "";
+        }
+    }
+    yield line + "|\n|" + repeat("---|", n + 1);
+    for (const row of rows){
+        line = "\n|" + row.name + "|";
+        if (isBoolRow(row)) {
+            for(let i = 0; i < n; i++){
+                line += T[i];
+                if (row.data[i]) line += "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+            line += "|";
+        } else {
+            for(let i = 0; i < n; i++){
+                line += String(row.data[i]) + "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+        }
+        yield line;
+    }
+}
+function export_markdown(rows) {
+    return Array.from(export_markdown_chunks(rows)).join("");
+}
+function escape_csv(value) {
+    const s = String(value);
+    if (/[",\n]/.test(s)) {
+        return `"${s.replace(/"/g, '""')}"`;
+    }
+    return s;
+}
+function* export_csv_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    for(let r = 0; r < rows.length; r++){
+        const row = rows[r];
+        let line = (r > 0 ? "\n" : "") + escape_csv(row.name);
+        for(let i = 0; i < n; i++){
+            line += "," + escape_csv(String(row.data[i]));
+            if ((i + 1) % chunk_cells === 0) {
+                yield line;
+                line = "";
+            }
+        }
+        yield line;
+    }
+}
+function export_csv(rows) {
+    return Array.from(export_csv_chunks(rows)).join("");
+}
+function profile_now() {
+    return typeof performance !== 'undefined' ? performance.now() : Date.now();
+}
+function profile_heap() {
+    const env = globalThis;
+    if (env.process && typeof env.process.memoryUsage === 'function') {
+        return env.process.memoryUsage().heapUsed;
+    }
+    if (env.performance && env.performance.memory) {
+        return env.performance.memory.usedJSHeapSize;
+    }
+    return NaN;
+}
+function profile_record(profile, name, value, start_time, start_heap) {
+    const heap = profile_heap();
+    profile.push({
+        name: name,
+        time_ms: profile_now() - start_time,
+        length: value !== null && value !== undefined && typeof value.length === 'number' ? value.length : null,
+        heap_delta: isNaN(heap) || isNaN(start_heap) ? null : heap - start_heap
+    });
+}
+function format_profile(profile) {
+    const sorted = [
+        ...profile
+    ].sort((a, b)=>b.time_ms - a.time_ms);
+    const pad = sorted.reduce((max, entry)=>Math.max(max, entry.name.length), 0);
+    return sorted.map((entry)=>{
+        let line = pad_right(entry.name, ' ', pad) + ' ' + pad_left(entry.time_ms.toFixed(1), ' ', 8) + ' ms';
+        if (entry.length !== null) {
+            line += '  len ' + entry.length;
+        }
+        if (entry.heap_delta !== null) {
+            line += '  heap ' + (entry.heap_delta >= 0 ? '+' : '') + (entry.heap_delta / 1024).toFixed(0) + ' KiB';
+        }
+        return line;
+    }).join('\n');
+}
+function text_hash(text) {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193;
+    for(let i = 0; i < text.length; ++i){
+        const c = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x01000193) ^ h2 >>> 15;
+    }
+    return text.length + ':' + (h1 >>> 0).toString(16) + (h2 >>> 0).toString(16);
+}
+function result_cache_create(capacity) {
+    return {
+        entries: new Map(),
+        size: 0,
+        capacity: capacity,
+        last_text: null,
+        last_key: ''
+    };
+}
+function result_cache_key(cache, text, name) {
+    if (cache.last_text !== text) {
+        cache.last_key = text_hash(text);
+        cache.last_text = text;
+    }
+    return cache.last_key + '\n' + name;
+}
+function result_cache_get(cache, text, name) {
+    const key = result_cache_key(cache, text, name);
+    const entry = cache.entries.get(key);
+    if (entry === undefined || entry.text !== text) {
+        return undefined;
+    }
+    cache.entries.delete(key);
+    cache.entries.set(key, entry);
+    return entry.value;
+}
+function result_cache_set(cache, text, name, value) {
+    if (value === undefined) {
+        return;
+    }
+    const key = result_cache_key(cache, text, name);
+    const size = value !== null && typeof value.length === 'number' ? Math.max(1, value.length) : 1;
+    const old = cache.entries.get(key);
+    if (old !== undefined) {
+        cache.entries.delete(key);
+        cache.size -= old.size;
+    }
+    if (size > cache.capacity) {
+        return;
+    }
+    while(cache.size + size > cache.capacity){
+        const oldest = cache.entries.keys().next().value;
+        cache.size -= cache.entries.get(oldest).size;
+        cache.entries.delete(oldest);
+    }
+    cache.entries.set(key, {
+        text: text,
+        value: value,
+        size: size
+    });
+    cache.size += size;
+}
\ No newline at end of file
@@ -0,0 +1,943 @@
+var structure_flags = {
+	counter_n: [0, 1 << 0],
+	counter_sigma: [0, 1 << 1],
+	suffix_array: [0, 1 << 2],
+	border_array: [0, 1 << 3],
+	first_array: [0, 1 << 4],
+	index_array: [0, 1 << 5],
+	rotation_array: [0, 1 << 6],
+	sl_string: [0, 1 << 7],
+	lnf_array: [0, 1 << 8],
+	necklace_conjugate_transform: [0, 1 << 9],
+	invert_transform: [0, 1 << 10],
+	revert_transform: [0, 1 << 11],
+	lz78_factorization: [0, 1 << 12],
+	lzw_factorization: [0, 1 << 13],
+	odd_maximal_palindromic_length_array: [0, 1 << 14],
+	even_maximal_palindromic_length_array: [0, 1 << 15],
+	lzend_factorization: [0, 1 << 16],
+	gamma_factorization: [0, 1 << 17],
+	inverse_suffix_array: [0, 1 << 18],
+	counter_period: [0, 1 << 19],
+	counter_exponent: [0, 1 << 20],
+	counter_regularity: [0, 1 << 21],
+	bw_transform: [0, 1 << 22],
+	reverse_lzss_factorization: [0, 1 << 23],
+	counter_necklace_conjugate_transform: [0, 1 << 24],
+	counter_invert_transform: [0, 1 << 25],
+	counter_revert_transform: [0, 1 << 26],
+	counter_lz78_factorization: [0, 1 << 27],
+	counter_lzw_factorization: [0, 1 << 28],
+	counter_lzend_factorization: [0, 1 << 29],
+	counter_gamma_factorization: [0, 1 << 30],
+	phi_array: [0, 1 << 31],
+	inverse_phi_array: [1, 1 << 0],
+	lcp_array: [1, 1 << 1],
+	psi_array: [1, 1 << 2],
+	lyndon_factorization: [1, 1 << 3],
+	nss_array: [1, 1 << 4],
+	pss_array: [1, 1 << 5],
+	lf_array: [1, 1 << 6],
+	counter_bw_transform: [1, 1 << 7],
+	counter_reverse_lzss_factorization: [1, 1 << 8],
+	counter_lcp_array: [1, 1 << 9],
+	plcp_array: [1, 1 << 10],
+	substring_complexity: [1, 1 << 11],
+	lpf_array: [1, 1 << 12],
+	lpnf_array: [1, 1 << 13],
+	circular_suffix_array: [1, 1 << 14],
+	necklace_factorization: [1, 1 << 15],
+	counter_lyndon_factorization: [1, 1 << 16],
+	lyndon_array: [1, 1 << 17],
+	lexparse_factorization: [1, 1 << 18],
+	counter_delta: [1, 1 << 19],
+	counter_delta_argmax: [1, 1 << 20],
+	lzss_factorization: [1, 1 << 21],
+	lz77_factorization: [1, 1 << 22],
+	lzssno_factorization: [1, 1 << 23],
+	inverse_circular_suffix_array: [1, 1 << 24],
+	bbw_indices: [1, 1 << 25],
+	counter_necklace_factorization: [1, 1 << 26],
+	counter_lexparse_factorization: [1, 1 << 27],
+	counter_lzss_factorization: [1, 1 << 28],
+	counter_lz77_factorization: [1, 1 << 29],
+	counter_lzssno_factorization: [1, 1 << 30],
+	bbw_transform: [1, 1 << 31],
+	inverse_bbw_transform: [2, 1 << 0],
+	counter_bbw_transform: [2, 1 << 1],
+	counter_inverse_bbw_transform: [2, 1 << 2]
+};
+// === Dependency closure: flag words of each structure and everything it is built from ===
+var structure_closure = {
+	counter_n: [0x00000001, 0x00000000, 0x00000000],
+	counter_sigma: [0x00000002, 0x00000000, 0x00000000],
+	suffix_array: [0x00000004, 0x00000000, 0x00000000],
+	border_array: [0x00000008, 0x00000000, 0x00000000],
+	first_array: [0x00000010, 0x00000000, 0x00000000],
+	index_array: [0x00000020, 0x00000000, 0x00000000],
+	rotation_array: [0x00000040, 0x00000000, 0x00000000],
+	sl_string: [0x00000080, 0x00000000, 0x00000000],
+	lnf_array: [0x00000100, 0x00000000, 0x00000000],
+	necklace_conjugate_transform: [0x00000200, 0x00000000, 0x00000000],
+	invert_transform: [0x00000400, 0x00000000, 0x00000000],
+	revert_transform: [0x00000800, 0x00000000, 0x00000000],
+	lz78_factorization: [0x00001000, 0x00000000, 0x00000000],
+	lzw_factorization: [0x00002000, 0x00000000, 0x00000000],
+	odd_maximal_palindromic_length_array: [0x00004000, 0x00000000, 0x00000000],
+	even_maximal_palindromic_length_array: [0x00008000, 0x00000000, 0x00000000],
+	lzend_factorization: [0x00010000, 0x00000000, 0x00000000],
+	gamma_factorization: [0x00020000, 0x00000000, 0x00000000],
+	inverse_suffix_array: [0x00040004, 0x00000000, 0x00000000],
+	counter_period: [0x00080008, 0x00000000, 0x00000000],
+	counter_exponent: [0x00100008, 0x00000000, 0x00000000],
+	counter_regularity: [0x00200008, 0x00000000, 0x00000000],
+	bw_transform: [0x00400040, 0x00000000, 0x00000000],
+	reverse_lzss_factorization: [0x00800100, 0x00000000, 0x00000000],
+	counter_necklace_conjugate_transform: [0x01000200, 0x00000000, 0x00000000],
+	counter_invert_transform: [0x02000400, 0x00000000, 0x00000000],
+	counter_revert_transform: [0x04000800, 0x00000000, 0x00000000],
+	counter_lz78_factorization: [0x08001000, 0x00000000, 0x00000000],
+	counter_lzw_factorization: [0x10002000, 0x00000000, 0x00000000],
+	counter_lzend_factorization: [0x20010000, 0x00000000, 0x00000000],
+	counter_gamma_factorization: [0x40020000, 0x00000000, 0x00000000],
+	phi_array: [0x80040004, 0x00000000, 0x00000000],
+	inverse_phi_array: [0x00040004, 0x00000001, 0x00000000],
+	lcp_array: [0x00040004, 0x00000002, 0x00000000],
+	psi_array: [0x00040004, 0x00000004, 0x00000000],
+	lyndon_factorization: [0x00040004, 0x00000008, 0x00000000],
+	nss_array: [0x00040004, 0x00000010, 0x00000000],
+	pss_array: [0x00040004, 0x00000020, 0x00000000],
+	lf_array: [0x00400050, 0x00000040, 0x00000000],
+	counter_bw_transform: [0x00400040, 0x00000080, 0x00000000],
+	counter_reverse_lzss_factorization: [0x00800100, 0x00000100, 0x00000000],
+	counter_lcp_array: [0x00040004, 0x00000202, 0x00000000],
+	plcp_array: [0x00040004, 0x00000402, 0x00000000],
+	substring_complexity: [0x00040004, 0x00000802, 0x00000000],
+	lpf_array: [0x00040004, 0x00001002, 0x00000000],
+	lpnf_array: [0x00040004, 0x00002002, 0x00000000],
+	circular_suffix_array: [0x00040004, 0x00004008, 0x00000000],
+	necklace_factorization: [0x00040004, 0x00008008, 0x00000000],
+	counter_lyndon_factorization: [0x00040004, 0x00010008, 0x00000000],
+	lyndon_array: [0x00040004, 0x00020010, 0x00000000],
+	lexparse_factorization: [0x00040004, 0x00040402, 0x00000000],
+	counter_delta: [0x00040004, 0x00080802, 0x00000000],
+	counter_delta_argmax: [0x00040004, 0x00100802, 0x00000000],
+	lzss_factorization: [0x00040004, 0x00201002, 0x00000000],
+	lz77_factorization: [0x00040004, 0x00401002, 0x00000000],
+	lzssno_factorization: [0x00040004, 0x00802002, 0x00000000],
+	inverse_circular_suffix_array: [0x00040004, 0x01004008, 0x00000000],
+	bbw_indices: [0x00040004, 0x02004008, 0x00000000],
+	counter_necklace_factorization: [0x00040004, 0x04008008, 0x00000000],
+	counter_lexparse_factorization: [0x00040004, 0x08040402, 0x00000000],
+	counter_lzss_factorization: [0x00040004, 0x10201002, 0x00000000],
+	counter_lz77_factorization: [0x00040004, 0x20401002, 0x00000000],
+	counter_lzssno_factorization: [0x00040004, 0x40802002, 0x00000000],
+	bbw_transform: [0x00040004, 0x82004008, 0x00000000],
+	inverse_bbw_transform: [0x00040004, 0x82004008, 0x00000001],
+	counter_bbw_transform: [0x00040004, 0x82004008, 0x00000002],
+	counter_inverse_bbw_transform: [0x00040004, 0x82004008, 0x00000005]
+};
+// Returns the flag words selecting the given structure names; unknown names are ignored.
+function structure_flag_set(names) {
+	var flags = [0x00000000, 0x00000000, 0x00000000];
+	for (var i = 0; i < names.length; i++) {
+		var flag = structure_flags[names[i]];
+		if (flag) flags[flag[0]] |= flag[1];
+	}
+	return flags;
+}
+// Returns the flag words of the given structures together with everything they are built from.
+function structure_closure_of(flags) {
+	var need = [0x00000000, 0x00000000, 0x00000000];
+	for (var name in structure_flags) {
+		var flag = structure_flags[name];
+		if (!(flags[flag[0]] & flag[1])) continue;
+		var deps = structure_closure[name];
+		for (var w = 0; w < deps.length; w++) need[w] |= deps[w];
+	}
+	return need;
+}
+// === Direct dependencies of each structure, in construction order ===
+var structure_dependencies = {
+	counter_n: [],
+	counter_sigma: [],
+	suffix_array: [],
+	border_array: [],
+	first_array: [],
+	index_array: [],
+	rotation_array: [],
+	sl_string: [],
+	lnf_array: [],
+	necklace_conjugate_transform: [],
+	invert_transform: [],
+	revert_transform: [],
+	lz78_factorization: [],
+	lzw_factorization: [],
+	odd_maximal_palindromic_length_array: [],
+	even_maximal_palindromic_length_array: [],
+	lzend_factorization: [],
+	gamma_factorization: [],
+	inverse_suffix_array: ['suffix_array'],
+	counter_period: ['border_array'],
+	counter_exponent: ['border_array'],
+	counter_regularity: ['border_array'],
+	bw_transform: ['rotation_array'],
+	reverse_lzss_factorization: ['lnf_array'],
+	counter_necklace_conjugate_transform: ['necklace_conjugate_transform'],
+	counter_invert_transform: ['invert_transform'],
+	counter_revert_transform: ['revert_transform'],
+	counter_lz78_factorization: ['lz78_factorization'],
+	counter_lzw_factorization: ['lzw_factorization'],
+	counter_lzend_factorization: ['lzend_factorization'],
+	counter_gamma_factorization: ['gamma_factorization'],
+	phi_array: ['suffix_array', 'inverse_suffix_array'],
+	inverse_phi_array: ['suffix_array', 'inverse_suffix_array'],
+	lcp_array: ['suffix_array', 'inverse_suffix_array'],
+	psi_array: ['suffix_array', 'inverse_suffix_array'],
+	lyndon_factorization: ['inverse_suffix_array'],
+	nss_array: ['inverse_suffix_array'],
+	pss_array: ['inverse_suffix_array'],
+	lf_array: ['first_array', 'bw_transform'],
+	counter_bw_transform: ['bw_transform'],
+	counter_reverse_lzss_factorization: ['reverse_lzss_factorization'],
+	counter_lcp_array: ['lcp_array'],
+	plcp_array: ['inverse_suffix_array', 'lcp_array'],
+	substring_complexity: ['lcp_array'],
+	lpf_array: ['suffix_array', 'lcp_array'],
+	lpnf_array: ['suffix_array', 'inverse_suffix_array', 'lcp_array'],
+	circular_suffix_array: ['lyndon_factorization'],
+	necklace_factorization: ['lyndon_factorization'],
+	counter_lyndon_factorization: ['lyndon_factorization'],
+	lyndon_array: ['nss_array'],
+	lexparse_factorization: ['plcp_array'],
+	counter_delta: ['substring_complexity'],
+	counter_delta_argmax: ['substring_complexity'],
+	lzss_factorization: ['lpf_array'],
+	lz77_factorization: ['lpf_array'],
+	lzssno_factorization: ['lpnf_array'],
+	inverse_circular_suffix_array: ['circular_suffix_array'],
+	bbw_indices: ['lyndon_factorization', 'circular_suffix_array'],
+	counter_necklace_factorization: ['necklace_factorization'],
+	counter_lexparse_factorization: ['lexparse_factorization'],
+	counter_lzss_factorization: ['lzss_factorization'],
+	counter_lz77_factorization: ['lz77_factorization'],
+	counter_lzssno_factorization: ['lzssno_factorization'],
+	bbw_transform: ['bbw_indices'],
+	inverse_bbw_transform: ['bbw_transform'],
+	counter_bbw_transform: ['bbw_transform'],
+	counter_inverse_bbw_transform: ['inverse_bbw_transform']
+};
+const citations = {};
+function create_morphism(images, start, coding) {
+    const table = [];
+    for(const letter in images){
+        table[letter.charCodeAt(0)] = Uint16Array.from(images[letter].split(''), (c)=>c.charCodeAt(0));
+    }
+    let coding_table = null;
+    if (coding) {
+        coding_table = [];
+        for(const letter in coding)coding_table[letter.charCodeAt(0)] = coding[letter].charCodeAt(0);
+    }
+    let first = start.charCodeAt(0);
+    let prolongable = 0;
+    while(table[first][0] != first && prolongable < table.length){
+        first = table[first][0];
+        ++prolongable;
+    }
+    return {
+        images: table,
+        coding: coding_table,
+        orders: [
+            Uint16Array.of(start.charCodeAt(0))
+        ],
+        prolongable: prolongable
+    };
+}
+function morphism_expand(m, word, limit) {
+    const images = m.images;
+    let length = 0;
+    let end = 0;
+    while(end < word.length && length < limit)length += images[word[end++]].length;
+    const result = new Uint16Array(Math.min(length, limit));
+    let pos = 0;
+    for(let i = 0; i < end; ++i){
+        const image = images[word[i]];
+        for(let j = 0; j < image.length && pos < result.length; ++j)result[pos++] = image[j];
+    }
+    return result;
+}
+function morphism_order(m, k) {
+    const orders = m.orders;
+    while(orders.length <= k)orders.push(morphism_expand(m, orders[orders.length - 1], Infinity));
+    return orders[Math.max(0, k)];
+}
+function morphism_prefix(m, length) {
+    morphism_order(m, m.prolongable);
+    const orders = m.orders;
+    for(let k = m.prolongable; k < orders.length; ++k){
+        if (orders[k].length >= length) return orders[k].subarray(0, Math.max(0, length));
+    }
+    let word = orders[orders.length - 1];
+    for(let stalled = 0; word.length < length && stalled < m.images.length;){
+        const next = morphism_expand(m, word, length);
+        stalled = next.length > word.length ? 0 : stalled + 1;
+        word = next;
+    }
+    return word;
+}
+function units_to_string(units, coding) {
+    if (coding) {
+        const coded = new Uint16Array(units.length);
+        for(let i = 0; i < units.length; ++i)coded[i] = coding[units[i]];
+        units = coded;
+    }
+    const chunks = [];
+    for(let i = 0; i < units.length; i += 1 << 14){
+        chunks.push(String.fromCharCode.apply(null, units.subarray(i, i + (1 << 14))));
+    }
+    return chunks.join('');
+}
+function morphic_prefix(m, length) {
+    return units_to_string(morphism_prefix(m, length), m.coding);
+}
+const FIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'a'
+}, 'b');
+function prefix_fibonacci_word(length) {
+    return morphic_prefix(FIBONACCI_MORPHISM, length);
+}
+const TRIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'a'
+}, 'a');
+function prefix_tribonacci_word(length) {
+    return morphic_prefix(TRIBONACCI_MORPHISM, length);
+}
+const THUE_MORSE_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ba'
+}, 'a');
+function prefix_thue_morse_word(length) {
+    return morphic_prefix(THUE_MORSE_MORPHISM, length);
+}
+const MEPHISTO_WALTZ_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'bba'
+}, 'a');
+function prefix_mephisto_waltz_word(length) {
+    return morphic_prefix(MEPHISTO_WALTZ_MORPHISM, length);
+}
+const VTM_MORPHISM = create_morphism({
+    a: 'abc',
+    b: 'ac',
+    c: 'b'
+}, 'a');
+function prefix_vtm_word(length) {
+    return morphic_prefix(VTM_MORPHISM, length);
+}
+const SIERPINSKI_MORPHISM = create_morphism({
+    a: 'aba',
+    b: 'bbb'
+}, 'a');
+function prefix_sierpinski_word(length) {
+    return morphic_prefix(SIERPINSKI_MORPHISM, length);
+}
+const PELL_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'a'
+}, 'a');
+function prefix_pell_word(length) {
+    return morphic_prefix(PELL_MORPHISM, length);
+}
+const CHACON_MORPHISM = create_morphism({
+    a: 'aaba',
+    b: 'b'
+}, 'a');
+function prefix_chacon_word(length) {
+    return morphic_prefix(CHACON_MORPHISM, length);
+}
+const VON_NEUMANN_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'b'
+}, 'a');
+function prefix_von_neumann_word(length) {
+    return morphic_prefix(VON_NEUMANN_MORPHISM, length);
+}
+const RUDIN_SHAPIRO_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'db',
+    d: 'dc'
+}, 'a', {
+    a: 'a',
+    b: 'a',
+    c: 'b',
+    d: 'b'
+});
+function prefix_rudin_shapiro_word(length) {
+    return morphic_prefix(RUDIN_SHAPIRO_MORPHISM, length);
+}
+const BAUM_SWEET_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'cb',
+    c: 'bd',
+    d: 'dd'
+}, 'a', {
+    a: 'a',
+    b: 'b',
+    c: 'a',
+    d: 'a'
+});
+function prefix_baum_sweet_word(length) {
+    return morphic_prefix(BAUM_SWEET_MORPHISM, length);
+}
+function kolakoski_units(length) {
+    const units = new Uint16Array(Math.max(0, length));
+    const seed = [
+        97,
+        98,
+        98
+    ];
+    let pos = 0;
+    for(; pos < units.length && pos < seed.length; ++pos)units[pos] = seed[pos];
+    for(let run = 2; pos < units.length; ++run){
+        const letter = run % 2 == 0 ? 97 : 98;
+        units[pos++] = letter;
+        if (units[run] == 98 && pos < units.length) units[pos++] = letter;
+    }
+    return units;
+}
+function prefix_kolakoski_word(length) {
+    return units_to_string(kolakoski_units(length), null);
+}
+const generator_lengths = {"fibonacci_word":[1,1,2,3,5,8,13,21,34,55,89,144,233,377,610,987,1597,2584,4181,6765,10946,17711,28657],"tribonacci_word":[1,2,4,7,13,24,44,81,149,274,504,927,1705,3136,5768,10609,19513],"thue_morse_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"mephisto_waltz_word":[1,3,9,27,81,243,729,2187,6561,19683],"vtm_word":[1,3,6,12,24,48,96,192,384,768,1536,3072,6144,12288,24576],"sierpinski_word":[1,3,9,27,81,243,729,2187,6561,19683],"pell_word":[1,3,7,17,41,99,239,577,1393,3363,8119,19601],"chacon_word":[1,4,13,40,121,364,1093,3280,9841,29524],"von_neumann_word":[1,3,7,15,31,63,127,255,511,1023,2047,4095,8191,16383,32767],"rudin_shapiro_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"baum_sweet_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"kolakoski_word":[2,3,5,7,10,15,23,34,50,75,113,170,255,382,574,863,1293,1937,2903,4353,6526,9789,14688,22029]};
+const string_generator_prefixes = {
+	'fibonacci_word': prefix_fibonacci_word,
+	'tribonacci_word': prefix_tribonacci_word,
+	'thue_morse_word': prefix_thue_morse_word,
+	'mephisto_waltz_word': prefix_mephisto_waltz_word,
+	'vtm_word': prefix_vtm_word,
+	'sierpinski_word': prefix_sierpinski_word,
+	'pell_word': prefix_pell_word,
+	'chacon_word': prefix_chacon_word,
+	'von_neumann_word': prefix_von_neumann_word,
+	'rudin_shapiro_word': prefix_rudin_shapiro_word,
+	'baum_sweet_word': prefix_baum_sweet_word,
+	'kolakoski_word': prefix_kolakoski_word,
+};
+const tutorials = {};
+tutorials['fibonacci_word'] = {
+	'title' : 'Fibonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to a \\} \\) on the letter \'b\'',
+	'oeis' : 'A003849',
+	'wikipedia' : 'Fibonacci_word'
+};
+tutorials['tribonacci_word'] = {
+	'title' : 'Tribonacci',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A080843',
+	'wikipedia' : 'Tribonacci_word'
+};
+tutorials['thue_morse_word'] = {
+	'title' : 'Thue-Morse',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ba \\} \\) on the letter \'a\'',
+	'oeis' : 'A010060',
+	'wikipedia' : 'Thue-Morse_sequence'
+};
+tutorials['mephisto_waltz_word'] = {
+	'title' : 'Mephisto-Waltz',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to bba \\} \\) on the letter \'a\'',
+	'oeis' : 'A064990',
+	'cite' : 'allouche03automatic'
+};
+tutorials['vtm_word'] = {
+	'title' : 'vtm',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to abc, b \\to ac, c \\to b \\} \\) on the letter \'a\''
+};
+tutorials['sierpinski_word'] = {
+	'title' : 'Sierpinski',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aba, b \\to bbb \\} \\) on the letter \'a\'',
+	'oeis' : 'A316829'
+};
+tutorials['pell_word'] = {
+	'title' : 'Pell',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to a \\} \\) on the letter \'a\'',
+	'oeis' : 'A171588',
+	'wikipedia' : 'Pell_number'
+};
+tutorials['chacon_word'] = {
+	'title' : 'Chacon',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aaba, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A049320'
+};
+tutorials['von_neumann_word'] = {
+	'title' : 'Neumannn',
+	'content' : 'Pure morphic word generated by the morphism \\( \\{ a \\to aab, b \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A308187'
+};
+tutorials['rudin_shapiro_word'] = {
+	'title' : 'Rudin-Shapiro',
+	'content' : 'Morphic word generated by the morphism \\( \\{ a \\to ab, b \\to ac, c \\to db, d \\to dc \\} \\) followed by the coding \\( \\{ a,b \\to a; c,d \\to b \\} \\) on the letter \'a\'',
+	'oeis' : 'A020987',
+	'wikipedia' : 'Rudin–Shapiro_sequence'
+};
+tutorials['baum_sweet_word'] = {
+	'title' : 'Baum-Sweet',
+	'content' : 'Word defined by setting the \\(j\\)-th letter to \'b\' if the binary representation of \\(j\\) contains no block of consecutive 0s of odd length, and to \'a\' otherwise.',
+	'oeis' : 'A086747',
+	'wikipedia' : 'Baum–Sweet_sequence'
+};
+tutorials['kolakoski_word'] = {
+	'title' : 'Kolakoski',
+	'content' : 'Self-generating word over the alphabet {a,b} where \'a\' represents 1 and \'b\' represents 2. The word starts with "ab" and the lengths of consecutive runs are given by the word itself.',
+	'oeis' : 'A000002',
+	'wikipedia' : 'Kolakoski_sequence'
+};
+tutorials['sigma'] = {
+	'title' : '&sigma;',
+	'content' : 'The effective alphabet size of a string is the number of distinct symbols it contains.'
+};
+tutorials['period'] = {
+	'title' : 'p',
+	'content' : 'The shortest period of a string is the smallest positive integer such that the string is a prefix of an infinite repetition of the prefix of that length. Concretely, the shortest period \\(p\\) of the text \\(T\\) is the length of the shortest prefix \\(P\\) of \\(T\\) such that \\(T\\) is a prefix of \\(P^{k}\\) for some integer \\(k \\geq 1\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+tutorials['exponent'] = {
+	'title' : 'e',
+	'content' : 'The exponent of a string is the division of the string\'s length by its shortest period, representing how many times the shortest period needs to be repeated to form the string. Formally, the exponent of the text \\(T\\) is defined as the length of \\(T\\) divided by the length of its shortest period \\(p\\), i.e., \\(\\frac{|T|}{p}\\).',
+	'wikipedia' : 'Periodic_sequence'
+};
+tutorials['regularity'] = {
+	'title' : 'R',
+	'content' : 'The regularity type of a string classifies it based on its periodic structure. A string can be categorized as unbordered, primitive, square, or non-primitive based on its borders and periods. Specifically, a string is unbordered if it has no proper border, primitive if it cannot be expressed as a repetition of a smaller substring, square if it is formed by repeating a substring exactly twice, and non-primitive if it can be expressed as a repetition of a smaller substring more than twice.'
+};
+tutorials['suffix_array'] = {
+	'title' : 'SA',
+	'content' : 'The suffix array sorts the entry indices of a string based on the lexicographical order of their corresponding suffixes. Formally, the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the suffixes of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{SA}[i]..n] \\prec T[\\mathsf{SA}[i+1]..n]\\) for all text positions \\(i \\in [1..n-1]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+tutorials['border_array'] = {
+	'title' : 'B',
+	'content' : 'The border array of a string stores the lengths of the longest borders for each prefix of the string. A border of a string is defined as a substring that is both a proper prefix and a proper suffix. Formally, the border array \\(\\mathsf{B}\\) for a text \\(T[1..n]\\) is an array where each entry \\(\\mathsf{B}[i]\\) represents the length of the longest border of the prefix \\(T[1..i]\\), i.e., \\(\\mathsf{B}[i]\\) is the largest integer \\(k \\le i-1\\) such that \\(T[1..k] = T[i-k+1..i]\\). By definition, \\(\\mathsf{B}[0] = 0\\).',
+	'wikipedia' : 'Knuth–Morris–Pratt_algorithm'
+};
+tutorials['bw_transform'] = {
+	'title' : 'BWT',
+	'content' : 'The Burrows-Wheeler Transform (BWT) is a reversible transformation that rearranges the characters of a string based on the lexicographical order of its cyclic rotations. Formally, given a text \\(T[1..n]\\) and its rotation array \\(\\mathsf{Rot}\\), the BWT \\(\\mathsf{BWT}[1..n]\\) is defined such that \\(\\mathsf{BWT}[i] = T[(\\mathsf{Rot}[i] + n - 1) \\mod n]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['first_array'] = {
+	'title' : 'F',
+	'content' : 'The First Column Array represents the first column of the sorted rotations of a string, which is obtained by sorting the characters of the string in lexicographical order. Formally, for a given text \\(T[1..n]\\), the First Column Array \\(\\mathsf{F}\\) is defined as the sorted sequence of characters in \\(T\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['index_array'] = {
+	'title' : 'i',
+	'content' : 'The index array contains a sequence of integers from \\(1\\) to \\(n\\), where \\(n\\) is the length of the input text \\(T[1..n]\\). Formally, the index array \\(\\mathsf{i}\\) is defined such that \\(\\mathsf{i}[j] = j\\) for each \\(j \\in [1..n]\\).'
+};
+tutorials['rotation_array'] = {
+	'title' : 'Rot',
+	'content' : 'The rotation array sorts the entry indices of a string based on the lexicographical order of their corresponding cyclic rotations. Formally, the rotation array \\(\\mathsf{Rot}\\) of the text \\(T[1..n]\\) is an array of integers representing the starting indices of all the cyclic rotations of \\(T\\), sorted in lexicographical order. It obeys that \\(T[\\mathsf{Rot}[i]..n]T[1..\\mathsf{Rot}[i]-1] \\prec T[\\mathsf{Rot}[i+1]..n]T[1..\\mathsf{Rot}[i+1]-1]\\) for all text positions \\(i \\in [1..n-1]\\), where $\\prec$ is a total order by assigning lower ranks to lexicographically smaller strings and uses the text position \\(i\\) for tie-breaking.'
+};
+tutorials['inverse_suffix_array'] = {
+	'title' : 'ISA',
+	'content' : 'The inverse suffix array provides a mapping from each starting index of the suffixes of a string back to their respective positions in the suffix array. Formally, given the suffix array \\(\\mathsf{SA}\\) of the text \\(T[1..n]\\), the inverse suffix array \\(\\mathsf{ISA}\\) is defined such that \\(\\mathsf{ISA}[\\mathsf{SA}[i]] = i\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'manber93sa',
+	'wikipedia' : 'Suffix_array'
+};
+tutorials['phi_array'] = {
+	'title' : '&Phi;',
+	'content' : 'The Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically preceding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Phi array \\(\\mathsf{\\Phi}\\) is defined such that \\(\\mathsf{\\Phi}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] - 1]\\) if \\(\\mathsf{ISA}[i] > 0\\), and \\(\\mathsf{\\Phi}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = 0\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp'
+};
+tutorials['inverse_phi_array'] = {
+	'title' : '&Phi;&#8315;&#185;',
+	'content' : 'The inverse Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically succeeding suffix. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the inverse Phi array \\(\\mathsf{\\Phi}^{-1}\\) is defined such that \\(\\mathsf{\\Phi}^{-1}[i] = \\mathsf{SA}[\\mathsf{ISA}[i] + 1]\\) if \\(\\mathsf{ISA}[i] \\le n-1 \\), and \\(\\mathsf{\\Phi}^{-1}[i] = \\bot\\) if \\(\\mathsf{ISA}[i] = n \\), for each \\(i \\in [1..n]\\).'
+};
+tutorials['lcp_array'] = {
+	'title' : 'LCP',
+	'content' : 'The Longest Common Prefix (LCP) array stores the lengths of the longest common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given text \\(T[1..n]\\) and its suffix array \\(\\mathsf{SA}\\), the LCP array \\(\\mathsf{LCP}[1..n]\\) is defined such that \\(\\mathsf{LCP}[1] = 0\\) and \\(\\mathsf{LCP}[i] = \\text{lcp}(T[\\mathsf{SA}[i]..n], T[\\mathsf{SA}[i-1]..n])\\) for each \\(i \\in [2..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['lcp_array'] = {
+	'title' : '&Sigma; LCP',
+	'content' : 'The sum of the Longest Common Prefix (LCP) array values provides a measure of the total length of common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given LCP array \\(\\mathsf{LCP}[1..n]\\), the sum \\(\\Sigma \\mathsf{LCP}\\) is defined as \\(\\sum_{i=1}^{n} \\mathsf{LCP}[i]\\).',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['plcp_array'] = {
+	'title' : 'PLCP',
+	'content' : 'The Permuted Longest Common Prefix (PLCP) array reorders the values of the Longest Common Prefix (LCP) array based on the respective positions in the string. Formally, for the inverse suffix array \\(\\mathsf{ISA}\\) and LCP array \\(\\mathsf{LCP}\\) of the text \\(T[1..n]\\), the PLCP array \\(\\mathsf{PLCP}[1..n]\\) is defined such that \\(\\mathsf{PLCP}[i] = \\mathsf{LCP}[\\mathsf{ISA}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'karkkainen09plcp',
+	'wikipedia' : 'Longest_common_prefix_array'
+};
+tutorials['psi_array'] = {
+	'title' : '&Psi;',
+	'content' : 'The Psi array provides a mapping inside the suffix array that advances by one text position. Formally, given the suffix array \\(\\mathsf{SA}\\) and the inverse suffix array \\(\\mathsf{ISA}\\) of the text \\(T[1..n]\\), the Psi array \\(\\mathsf{\\Psi}\\) is defined such that \\(\\mathsf{\\Psi}[i] = \\mathsf{ISA}[\\mathsf{SA}[i] + 1]\\) if \\(\\mathsf{SA}[i] + 1 < n\\), and \\(\\mathsf{\\Psi}[i] = \\bot\\) if \\(\\mathsf{SA}[i] + 1 = n\\), for each \\(i \\in [1..n]\\).',
+	'cite' : 'grossi05csa'
+};
+tutorials['lyndon_factorization'] = {
+	'title' : 'LynF',
+	'content' : 'The Lyndon factorization of a string decomposes it into a sequence of Lyndon words in lexicographically non-increasing order, where a Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations.',
+	'cite' : 'chen58lyndon'
+};
+tutorials['delta'] = {
+	'title' : '&delta;',
+	'content' : 'The substring complexity measure quantifies the maximum ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the maximum value of \\(\\frac{\\mathsf{SC}[k]}{k}\\) for \\(k \\in [1..n]\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['delta_argmax'] = {
+	'title' : 'max &delta;',
+	'content' : 'The substring complexity measure length identifies the substring length that maximizes the ratio of substring complexity to length. Given an array of substring complexities for lengths \\(1\\) to \\(n\\), it computes the length \\(k\\) that maximizes \\(\\frac{\\mathsf{SC}[k]}{k}\\), where \\(\\mathsf{SC}[k]\\) is the substring complexity for length \\(k\\).',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['substring_complexity'] = {
+	'title' : 'SC',
+	'content' : 'The substring complexity array quantifies the number of distinct substrings of various lengths within a string. Given the Longest Common Prefix (LCP) array of a string, the substring complexity array \\(\\mathsf{SC}[1..n]\\) is defined such that for each length \\(k \\in [1..n]\\), \\(\\mathsf{SC}[k]\\) represents the count of distinct substrings of length \\(k\\). The computation leverages the LCP values to efficiently determine the number of new substrings introduced at each length.',
+	'cite' : 'raskhodnikova13sublinear'
+};
+tutorials['lf_array'] = {
+	'title' : 'LF',
+	'content' : 'The Last-to-First (LF) mapping array identifies characters from the last column with those from the first column of the Burrows-Wheeler Transform (BWT) that orginated from the same text position. Given the first column \\(\\mathsf{F}\\) and \\(\\textsf{BWT}\\), the LF mapping array \\(\\mathsf{LF}[1..n]\\) is defined such that \\(\\mathsf{LF}[i] = \\text{select}(\\textsf{F}, \\textsf{BWT}[i], \\text{rank}(\\textsf{BWT}, \\textsf{BWT}[i], i))\\) for each \\(i \\in [1..n]\\), where \\(\\text{rank}(\\textsf{BWT}, c, i)\\) counts the occurrences of character \\(c\\) in the prefix \\(\\textsf{BWT}[1..i]\\), and \\(\\text{select}(\\textsf{F}, c, r)\\) finds the position of the \\(r\\)-th occurrence of character \\(c\\) in \\(\\textsf{F}\\).',
+	'cite' : 'burrows94bwt',
+	'wikipedia' : 'Burrows%E2%80%93Wheeler_transform'
+};
+tutorials['sl_string'] = {
+	'title' : 'S/L',
+	'content' : 'The S/L type string classifies each character in a string as either S-type or L-type based on the lexicographic order of the suffixes starting at those characters. A character at position \\(i\\) is classified as S-type if the suffix starting at \\(i\\) is lexicographically smaller than the suffix starting at \\(i+1\\), and L-type if it is larger. If the suffixes are equal, the type is determined by the type of the suffix starting at \\(i+1\\). Additionally, an S-type character that is the first character or immediately preceded by an L-type character is marked as S*-type.',
+	'cite' : 'nong11sais'
+};
+tutorials['lpf_array'] = {
+	'title' : 'LPF',
+	'content' : 'The Longest Previous Factor (LPF) array stores the length of the longest prefix of each suffix of a string that matches a substring starting at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPF array \\(\\mathsf{LPF}[1..n]\\) is defined such that \\(\\mathsf{LPF}[i] = \\max_{j \\in [1..i-1]} \\text{lcp}(T[i..n], T[j..n])\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+tutorials['lpnf_array'] = {
+	'title' : 'LPnF',
+	'content' : 'The Longest Previous Non-Overlapping Factor (LPnF) array stores the length of the longest prefix of each suffix of a string that matches a substring ending at a prior position within the same string. Formally, for a given text \\(T[1..n]\\), the LPnF array \\(\\mathsf{LPnF}[1..n]\\) is defined such that \\(\\mathsf{LPnF}[i] = \\max_{j \\in [1..i-1]} \\min(i-j,\\text{lcp}(T[i..n], T[j..n]))\\) for each \\(i \\in [1..n]\\), where \\(\\text{lcp}(S_1, S_2)\\) denotes the length of the longest common prefix between the suffixes \\(S_1\\) and \\(S_2\\).'
+};
+tutorials['lnf_array'] = {
+	'title' : 'LNF',
+	'content' : 'The Longest Next Factor (LNF) array is the LPF array of the reversed text.'
+};
+tutorials['lzss_factorization'] = {
+	'title' : 'LZSS',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski (LZSS) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring with an earlier starting position. The factorization is constructed greedily by selecting the longest previous factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+tutorials['lzssno_factorization'] = {
+	'title' : 'LZSSno',
+	'content' : 'The Lempel-Ziv-Storer-Szymanski non-overlapping (LZSSno) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring ending at an earlier positition. The factorization is constructed greedily by selecting the longest previous non-overlapping factor at each position in the string. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\min(i-j, \\text{lcp}(T[i..n], T[j..n])) \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'storer82lzss'
+};
+tutorials['lz77_factorization'] = {
+	'title' : 'LZ77',
+	'content' : 'The Lempel-Ziv-77  (LZ77) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring starting at a prior position within the same string. The factorization is constructed greedily by selecting the longest previous factor at each position in the string, with an additional character appended to the factor. Formally, given a text \\(T[1..n]\\) the length of the factor starting at position \\(i\\) is \\(\\max \\{1\\} \\cup \\{\\text{lcp}(T[i..n], T[j..n]) + 1 \\mid j \\in [1..i-1] \\}\\).',
+	'cite' : 'ziv77lz'
+};
+tutorials['reverse_lzss_factorization'] = {
+	'title' : 'rLZSS',
+	'content' : 'The Reverse Lempel-Ziv-Storer-Szymanski (rLZSS) factorization of a string is the LZSS factorization of the reversed string obtained by reading the string in reversed order.',
+	'cite' : 'storer82lzss'
+};
+tutorials['lexparse_factorization'] = {
+	'title' : 'LexParse',
+	'content' : 'The lexicographic parse (lexparse) decomposes a string into a sequence of factors based on the permuted longest common prefix (PLCP) array. Each factor is determined by the longest prefix of the suffix starting at the current position that matches a substring starting at a lexicographically smaller suffix position. Formally, for a given text \\(T[1..n]\\) and its PLCP array \\(\\mathsf{PLCP}[1..n]\\), the length of the factor starting at position \\(i\\) is \\(\\mathsf{PLCP}[i]\\) or 1 if \\(\\mathsf{PLCP}[i] = 0\\).',
+	'cite' : 'navarro21approximation'
+};
+tutorials['nss_array'] = {
+	'title' : 'NSS',
+	'content' : 'The Next Smaller Suffix (NSS) array identifies the subsequent suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the NSS array \\(\\mathsf{NSS}[1..n]\\) is defined such that \\(\\mathsf{NSS}[i] = \\min \\{ j > i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{NSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+tutorials['pss_array'] = {
+	'title' : 'PSS',
+	'content' : 'The Previous Smaller Suffix (PSS) array identifies the preceding suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \\(\\mathsf{ISA}\\) of a text \\(T[1..n]\\), the PSS array \\(\\mathsf{PSS}[1..n]\\) is defined such that \\(\\mathsf{PSS}[i] = \\max \\{ j < i \\mid \\mathsf{ISA}[j] < \\mathsf{ISA}[i] \\}\\) if such a \\(j\\) exists, and \\(\\mathsf{PSS}[i] = \\bot \\) otherwise, for each \\(i \\in [1..n]\\).'
+};
+tutorials['lyndon_array'] = {
+	'title' : 'Lyndon',
+	'content' : 'The Lyndon array stores the lengths of the longest Lyndon words starting at each position in a string. A Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations. Given the Next Smaller Suffix (NSS) array \\(\\mathsf{NSS}[1..n]\\) of a text \\(T[1..n]\\), the Lyndon array \\(\\mathsf{Lyndon}[1..n]\\) is defined such that \\(\\mathsf{Lyndon}[i] = \\mathsf{NSS}[i] - i\\) if \\(\\mathsf{NSS}[i] \\neq \\bot\\), and \\(\\mathsf{Lyndon}[i] = n - i + 1\\) otherwise, for each \\(i \\in [1..n]\\).',
+	'cite' : 'franek16algorithms'
+};
+tutorials['necklace_conjugate_transform'] = {
+	'title' : 'min-rot(T)',
+	'content' : 'The necklace conjugate of a string is the lexicographically smallest string that can be obtained by rotating the original string. This involves generating all possible rotations (conjugates) of the string and selecting the smallest one in lexicographic order.'
+};
+tutorials['invert_transform'] = {
+	'title' : 'inv(T)',
+	'content' : 'The invert transform of a string maps each character to its complementary character based on the effective alphabet of the string. Specifically, given a string that contains \\(s\\) distinct symbols, it swaps the \\(i\\)-th smallest symbol with the \\((s - i + 1)\\)-th smallest one, for every \\(i \\in \\{1,\\dots,s\\}\\).'
+};
+tutorials['revert_transform'] = {
+	'title' : 'rev(T)',
+	'content' : 'The revert transform of a string is obtained by reversing the order of its characters. Given a text \\(T[1..n]\\), the revert transform \\(\\mathsf{Revert}(T)\\) produces the string \\(T[n] T[n-1] \\ldots T[1]\\), where the characters are arranged in the opposite order, effectively reading the string backwards.'
+};
+tutorials['circular_suffix_array'] = {
+	'title' : 'CSA',
+	'content' : 'The Circular Suffix Array (CSA) of a string is a permutation of text positions that assigns a rank to each cyclic rotation (conjugate) of the Lyndon factors of the string based on the omega order. Given a text \\(T[1..n]\\) and its Lyndon factorization, the CSA \\(\\mathsf{CSA}[1..n]\\) is defined such that \\(\\mathsf{CSA}[i]\\) gives the starting position in \\(T\\) of the \\(i\\)-th smallest conjugate in \\(\\omega\\)-order among all conjugates of the Lyndon factors of \\(T\\).',
+	'cite' : 'hon13spaceefficient'
+};
+tutorials['inverse_circular_suffix_array'] = {
+	'title' : 'CISA',
+	'content' : 'The inverse circular suffix array (ICSA) is the reverse permutation of the circular suffix array (CSA).',
+	'cite' : 'hon13spaceefficient'
+};
+tutorials['bbw_indices'] = {
+	'title' : 'BBWTi',
+	'content' : 'The Bijective Burrows-Wheeler Transform Indices (BBWTi) array stores the text positions of the circular sufix array (CSA) decremented by one, but mapping positions at the beginning of Lyndon factors to the end of the respective Lyndon factor.',
+	'cite' : 'bannai25survey'
+};
+tutorials['bbw_transform'] = {
+	'title' : 'BBWT',
+	'content' : 'The Bijective Burrows-Wheeler Transform (BBWT) of a string rearranges the characters of the original string based on the Bijective Burrows-Wheeler Transform Indices (BBWTi). Given a text \\(T[1..n]\\) and its BBWTi array \\(\\mathsf{BBWTi}[1..n]\\), the BBWT \\(\\mathsf{BBWT}[1..n]\\) is defined such that \\(\\mathsf{BBWT}[i] = T[\\mathsf{BBWTi}[i]]\\) for each \\(i \\in [1..n]\\).',
+	'cite' : 'bannai25survey'
+};
+tutorials['inverse_bbw_transform'] = {
+	'title' : 'BBWT&#8315;&#185;',
+	'content' : 'The inverse Bijective Burrows-Wheeler Transform (inverse BBWT), also called the Gessel-Reutenauer transformation, applies the LF-mapping on the cycles in the BBWT to extract all Lyndon words, which sorted in lexicographically descreing order recovers the original text.',
+	'cite' : 'bannai25survey'
+};
+tutorials['lz78_factorization'] = {
+	'title' : 'LZ78',
+	'content' : 'The Lempel-Ziv-78 (LZ78) factorization decomposes a string into a sequence of factors based on previously seen substrings. Each factor consists of a reference to the longest previously seen factor (or zero if none exists) followed by a new character.',
+	'cite' : 'ziv78lz'
+};
+tutorials['lzw_factorization'] = {
+	'title' : 'LZW',
+	'content' : 'The Lempel-Ziv-Welch (LZW) factorization decomposes a string into a sequence of factors by building a dictionary of previously seen substrings. Each factor is the longest prefix of the remaining text that exists in the dictionary, followed by the next character.',
+	'cite' : 'welch84lzw'
+};
+tutorials['necklace_factorization'] = {
+	'title' : 'NeckF',
+	'content' : 'The Necklace factorization is the Lyndon factorization colliding all equal Lyndon factors to a single factor that is a necklace. The number of factors is the number of distinct Lyndon factors.',
+	'cite' : 'chen58lyndon'
+};
+tutorials['odd_maximal_palindromic_length_array'] = {
+	'title' : 'o-pali',
+	'content' : 'The odd maximal palindromic length array (o-pali) stores at each position the length of the left arm of the longest odd-length palindromic substring centered at that position, excluding the position itself in the length measurement. Hence, a palindrome of length \\(2k+1\\) contributes \\(k\\) to the o-pali array at its center position.',
+	'cite' : 'manacher75new'
+};
+tutorials['even_maximal_palindromic_length_array'] = {
+	'title' : 'e-pali',
+	'content' : 'The even maximal palindromic length array (e-pali) stores at each position the length of the longest even-length palindromic substring centered between that and its preding position.',
+	'cite' : 'manacher75new'
+};
+tutorials['lzend_factorization'] = {
+	'title' : 'LZend',
+	'content' : 'The LZ-end factorization is a restriction of the Lempel-Ziv 77 factorization where each new factor, omitting its last new character, must be the longest possible prefix of the remaining text that also appears ending exactly at the end of a previous factor, or just a single character if no such match exists.',
+	'cite' : 'kreft13lzend'
+};
+tutorials['gamma_factorization'] = {
+	'title' : '&Gamma;',
+	'content' : 'A string attractor is a set of positions in a string such that every distinct substring has at least one occurrence that crosses one of these positions. The smallest string attractor size is the minimum number of positions needed to form such a set. Here, \\(\\Gamma\\) is the leftmost such smallest string attractor, i.e., the one that has the lexicographically smallest sequence of positions.',
+	'cite' : 'kempa18stringattractors'
+};
+function pad_right(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return text + pad_char.repeat(times);
+}
+function pad_left(text, pad_char, length) {
+    if (text.length >= length || pad_char.length === 0) {
+        return text;
+    }
+    const times = Math.ceil((length - text.length) / pad_char.length);
+    return pad_char.repeat(times) + text;
+}
+function increment_array(array, inc = 1) {
+    return Array.from(array, (x)=>x + inc);
+}
+function replace_invalid_position(array, max_length) {
+    return Array.from(array, (x)=>x >= max_length ? '-' : x);
+}
+function prettify_string(text, sep = " ", base = 0, do_tabularize = true, length = text.length) {
+    text = text.split('\0').join("$");
+    const width = do_tabularize ? String(length + base - 1).length : 0;
+    let effectiveSep = sep;
+    if (!do_tabularize) {
+        effectiveSep = '';
+    }
+    return text.split('').map((x)=>pad_left(x, ' ', width)).join(effectiveSep);
+}
+function prettify_array(array, sep = " ", base = 0, length = array.length) {
+    const maxIndexValue = Math.max(0, length + base - 1);
+    const width = ("" + maxIndexValue).toString().length;
+    return Array.from(array, (x)=>pad_left("" + x, ' ', width)).join(sep);
+}
+function prettify_factorization(text, factorization, sep = " ", base = 0, length = text.length) {
+    const n = text.length;
+    const width = String(Math.max(0, length + base - 1)).length;
+    let result = "";
+    for(let i = 0; i < n; ++i){
+        const elementToDisplay = i === n - 1 && text[i] === '\0' ? '$' : text[i];
+        result += pad_left(elementToDisplay, ' ', width);
+        result += factorization[i] ? '|' + sep.substring(1) : sep;
+    }
+    return result;
+}
+function encodeWhitespaces(text) {
+    return text.replace(/\r/g, '\u240d').replace(/\n/g, '\u21b5').replace(/\t/g, '\u2409').replace(/\v/g, '\u240b').replace(/\f/g, '\u240c').replace(/ /g, '\u23b5');
+}
+function decodeWhitespaces(text) {
+    return text.replace(/\u240d/g, '\r').replace(/\u21b5/g, '\n').replace(/\u2409/g, '\t').replace(/\u240b/g, '\v').replace(/\u240c/g, '\f').replace(/\u23b5/g, ' ');
+}
+function repeat(str, n) {
+    let r = "";
+    while(n-- > 0)r += str;
+    return r;
+}
+function escapeLatex(s) {
+    return String(s).replace(/\\/g, "\\textbackslash{}").replace(/([#$%&_{}])/g, "\\$1");
+}
+function isBoolRow(row) {
+    return typeof row.data[0] === "boolean";
+}
+function isStringRow(row) {
+    return typeof row.data[0] === "string";
+}
+function partitionsFromBool(boolArr) {
+    const parts = [];
+    let len = 0;
+    for(let i = 0; i < boolArr.length; i++){
+        len++;
+        if (boolArr[i]) {
+            parts.push(len);
+            len = 0;
+        }
+    }
+    return parts;
+}
+function* export_latex_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required");
+    }
+    const T = tRow.data;
+    yield `\\begin{tabular}{l|${"c".repeat(n)}}\n\\hline`;
+    for (const row of rows){
+        let line = `\n${escapeLatex(row.name)} & `;
+        let cells = 0;
+        if (isBoolRow(row)) {
+            const parts = partitionsFromBool(row.data);
+            let pos = 0;
+            for(let p = 0; p < parts.length; p++){
+                const k = parts[p];
+                let text = "";
+                for(let i = 0; i < k; i++){
+                    text += escapeLatex(T[pos++]);
+                }
+                line += `\\multicolumn{${k}}{c}{${text}}`;
+                if (p !== parts.length - 1) line += " & ";
+                cells += k;
+                if (cells >= chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        } else {
+            for(let i = 0; i < n; i++){
+                line += escapeLatex(row.data[i]);
+                if (i !== n - 1) line += " & ";
+                if (++cells === chunk_cells) {
+                    yield line;
+                    line = "";
+                    cells = 0;
+                }
+            }
+        }
+        yield line + " \\\\";
+    }
+    yield "\n\\hline\n\\end{tabular}";
+}
+function export_latex(rows) {
+    return Array.from(export_latex_chunks(rows)).join("");
+}
+function* export_markdown_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    const tRow = rows.find(isStringRow);
+    if (!tRow) {
+        throw new Error("Row T (string[]) required for boolean partitions");
+    }
+    const T = tRow.data;
+    let line = "| ";
+    for(let i = 0; i < n; i++){
+        line += "|" + String(i + 1);
+        if ((i + 1) % chunk_cells === 0) {
+            yield line;
+            line = "";
+        }
+    }
+    yield line + "|\n|" + repeat("---|", n + 1);
+    for (const row of rows){
+        line = "\n|" + row.name + "|";
+        if (isBoolRow(row)) {
+            for(let i = 0; i < n; i++){
+                line += T[i];
+                if (row.data[i]) line += "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+            line += "|";
+        } else {
+            for(let i = 0; i < n; i++){
+                line += String(row.data[i]) + "|";
+                if ((i + 1) % chunk_cells === 0) {
+                    yield line;
+                    line = "";
+                }
+            }
+        }
+        yield line;
+    }
+}
+function export_markdown(rows) {
+    return Array.from(export_markdown_chunks(rows)).join("");
+}
+function escape_csv(value) {
+    const s = String(value);
+    if (/[",\n]/.test(s)) {
+        return `"${s.replace(/"/g, '""')}"`;
+    }
+    return s;
+}
+function* export_csv_chunks(rows, chunk_cells = 4096) {
+    const n = rows[0].data.length;
+    for(let r = 0; r < rows.length; r++){
+        const row = rows[r];
+        let line = (r > 0 ? "\n" : "") + escape_csv(row.name);
+        for(let i = 0; i < n; i++){
+            line += "," + escape_csv(String(row.data[i]));
+            if ((i + 1) % chunk_cells === 0) {
+                yield line;
+                line = "";
+            }
+        }
+        yield line;
+    }
+}
+function export_csv(rows) {
+    return Array.from(export_csv_chunks(rows)).join("");
+}
+function format_profile(profile) {
+    const sorted = [
+        ...profile
+    ].sort((a, b)=>b.time_ms - a.time_ms);
+    const pad = sorted.reduce((max, entry)=>Math.max(max, entry.name.length), 0);
+    return sorted.map((entry)=>{
+        let line = pad_right(entry.name, ' ', pad) + ' ' + pad_left(entry.time_ms.toFixed(1), ' ', 8) + ' ms';
+        if (entry.length !== null) {
+            line += '  len ' + entry.length;
+        }
+        if (entry.heap_delta !== null) {
+            line += '  heap ' + (entry.heap_delta >= 0 ? '+' : '') + (entry.heap_delta / 1024).toFixed(0) + ' KiB';
+        }
+        return line;
+    }).join('\n');
+}
\ No newline at end of file
@@ -0,0 +1 @@
+../../assets/item_list.js
\ No newline at end of file
@@ -0,0 +1 @@
+../../assets/legacy_redirects.js
\ No newline at end of file
@@ -0,0 +1 @@
+../../assets/prepare_text.js
\ No newline at end of file
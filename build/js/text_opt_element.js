@@ -0,0 +1 @@
+../../assets/text_opt_element.js
\ No newline at end of file
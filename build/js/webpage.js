@@ -0,0 +1 @@
+../../assets/webpage.js
\ No newline at end of file
@@ -0,0 +1 @@
+../../assets/worker.js
\ No newline at end of file
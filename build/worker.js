@@ -0,0 +1,3235 @@
+class AlgorithmError extends Error {
+    algorithm;
+    input;
+    constructor(message, algorithm, input){
+        super(message), this.algorithm = algorithm, this.input = input;
+        this.name = 'AlgorithmError';
+    }
+}
+function count_n(text) {
+    return text.length;
+}
+function count_sigma(text) {
+    if (!text) {
+        return 0;
+    }
+    return new Set(text).size;
+}
+function count_period(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 0;
+    }
+    const last_border = border_array[border_array.length - 1];
+    return border_array.length - last_border;
+}
+function count_exponent(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 0;
+    }
+    const period = count_period(border_array);
+    return border_array.length / period;
+}
+function count_regularity(border_array) {
+    if (!border_array || border_array.length === 0) {
+        return 'empty';
+    }
+    const n = border_array.length;
+    const last_border = border_array[n - 1];
+    const period = count_period(border_array);
+    const exponent = count_exponent(border_array);
+    if (exponent > 1 && n % period == 0) {
+        if (exponent == 2) {
+            return 'square';
+        }
+        return 'non-primitive';
+    }
+    if (last_border == 0) {
+        return 'unbordered';
+    }
+    return 'primitive';
+}
+function effective_alphabet_ranks(text) {
+    const n = text.length;
+    const rank_of = new Int32Array(0x10000);
+    for(let i = 0; i < n; ++i){
+        rank_of[text.charCodeAt(i)] = 1;
+    }
+    let sigma = 0;
+    for(let c = 0; c < rank_of.length; ++c){
+        if (rank_of[c] !== 0) {
+            rank_of[c] = sigma++;
+        }
+    }
+    const ranks = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        ranks[i] = rank_of[text.charCodeAt(i)];
+    }
+    return [
+        ranks,
+        sigma
+    ];
+}
+function suffix_sort(s, upper) {
+    const n = s.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    if (n === 1) {
+        return Int32Array.of(0);
+    }
+    if (n === 2) {
+        return s[0] < s[1] ? Int32Array.of(0, 1) : Int32Array.of(1, 0);
+    }
+    const sa = new Int32Array(n);
+    const is_s = new Uint8Array(n);
+    for(let i = n - 2; i >= 0; --i){
+        is_s[i] = s[i] === s[i + 1] ? is_s[i + 1] : s[i] < s[i + 1] ? 1 : 0;
+    }
+    const sum_l = new Int32Array(upper + 2);
+    const sum_s = new Int32Array(upper + 2);
+    for(let i = 0; i < n; ++i){
+        if (is_s[i] === 0) {
+            sum_s[s[i]]++;
+        } else {
+            sum_l[s[i] + 1]++;
+        }
+    }
+    for(let c = 0; c <= upper; ++c){
+        sum_s[c] += sum_l[c];
+        if (c < upper) {
+            sum_l[c + 1] += sum_s[c];
+        }
+    }
+    const buf = new Int32Array(upper + 2);
+    function induce(lms) {
+        sa.fill(-1);
+        buf.set(sum_s);
+        for(let k = 0; k < lms.length; ++k){
+            const d = lms[k];
+            if (d !== n) {
+                sa[buf[s[d]]++] = d;
+            }
+        }
+        buf.set(sum_l);
+        sa[buf[s[n - 1]]++] = n - 1;
+        for(let i = 0; i < n; ++i){
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 0) {
+                sa[buf[s[v - 1]]++] = v - 1;
+            }
+        }
+        buf.set(sum_l);
+        for(let i = n - 1; i >= 0; --i){
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 1) {
+                sa[--buf[s[v - 1] + 1]] = v - 1;
+            }
+        }
+    }
+    const lms_map = new Int32Array(n + 1).fill(-1);
+    let m = 0;
+    for(let i = 1; i < n; ++i){
+        if (is_s[i - 1] === 0 && is_s[i] === 1) {
+            lms_map[i] = m++;
+        }
+    }
+    const lms = new Int32Array(m);
+    for(let i = 1, k = 0; i < n; ++i){
+        if (is_s[i - 1] === 0 && is_s[i] === 1) {
+            lms[k++] = i;
+        }
+    }
+    induce(lms);
+    if (m > 0) {
+        const sorted_lms = new Int32Array(m);
+        for(let i = 0, k = 0; i < n; ++i){
+            if (lms_map[sa[i]] !== -1) {
+                sorted_lms[k++] = sa[i];
+            }
+        }
+        const rec_s = new Int32Array(m);
+        let rec_upper = 0;
+        rec_s[lms_map[sorted_lms[0]]] = 0;
+        for(let i = 1; i < m; ++i){
+            let l = sorted_lms[i - 1];
+            let r = sorted_lms[i];
+            const end_l = lms_map[l] + 1 < m ? lms[lms_map[l] + 1] : n;
+            const end_r = lms_map[r] + 1 < m ? lms[lms_map[r] + 1] : n;
+            let same = true;
+            if (end_l - l !== end_r - r) {
+                same = false;
+            } else {
+                while(l < end_l && s[l] === s[r]){
+                    l++;
+                    r++;
+                }
+                if (l === n || s[l] !== s[r]) {
+                    same = false;
+                }
+            }
+            if (!same) {
+                rec_upper++;
+            }
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper;
+        }
+        const rec_sa = suffix_sort(rec_s, rec_upper);
+        for(let i = 0; i < m; ++i){
+            sorted_lms[i] = lms[rec_sa[i]];
+        }
+        induce(sorted_lms);
+    }
+    return sa;
+}
+function cyclic_sort(s, sigma, next) {
+    const n = s.length;
+    if (n === 0) {
+        return new Int32Array(0);
+    }
+    const order = new Int32Array(n);
+    const count = new Int32Array(Math.max(n, sigma) + 1);
+    let rank = new Int32Array(n);
+    let buf = new Int32Array(n);
+    function sort_by_rank(input, classes) {
+        count.fill(0, 0, classes + 1);
+        for(let i = 0; i < n; ++i){
+            count[rank[i] + 1]++;
+        }
+        for(let c = 0; c < classes; ++c){
+            count[c + 1] += count[c];
+        }
+        for(let j = 0; j < n; ++j){
+            const i = input[j];
+            order[count[rank[i]]++] = i;
+        }
+    }
+    rank.set(s);
+    for(let i = 0; i < n; ++i){
+        buf[i] = i;
+    }
+    sort_by_rank(buf, sigma);
+    let classes = 0;
+    for(let j = 0; j < n; ++j){
+        if (j > 0 && s[order[j]] !== s[order[j - 1]]) {
+            classes++;
+        }
+        rank[order[j]] = classes;
+    }
+    classes++;
+    let jump = Int32Array.from(next);
+    let inv_jump = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        inv_jump[jump[i]] = i;
+    }
+    let jump_buf = new Int32Array(n);
+    for(let k = 1; classes < n && k < 2 * n; k <<= 1){
+        for(let j = 0; j < n; ++j){
+            buf[j] = inv_jump[order[j]];
+        }
+        sort_by_rank(buf, classes);
+        let c = 0;
+        buf[order[0]] = 0;
+        for(let j = 1; j < n; ++j){
+            const a = order[j - 1];
+            const b = order[j];
+            if (rank[a] !== rank[b] || rank[jump[a]] !== rank[jump[b]]) {
+                c++;
+            }
+            buf[b] = c;
+        }
+        classes = c + 1;
+        [rank, buf] = [
+            buf,
+            rank
+        ];
+        for(let i = 0; i < n; ++i){
+            jump_buf[i] = jump[jump[i]];
+        }
+        [jump, jump_buf] = [
+            jump_buf,
+            jump
+        ];
+        for(let i = 0; i < n; ++i){
+            inv_jump[jump[i]] = i;
+        }
+    }
+    for(let i = 0; i < n; ++i){
+        buf[i] = i;
+    }
+    sort_by_rank(buf, classes);
+    return order;
+}
+function factor_successors(factorization, n) {
+    const next = new Int32Array(n);
+    let factor_start = 0;
+    for(let i = 0; i < n; ++i){
+        if (factorization[i] === true || i === n - 1) {
+            next[i] = factor_start;
+            factor_start = i + 1;
+        } else {
+            next[i] = i + 1;
+        }
+    }
+    return next;
+}
+function construct_suffix_array(text) {
+    if (!text) {
+        return [];
+    }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return Array.from(suffix_sort(ranks, sigma - 1));
+}
+function construct_border_array(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const border = new Array(n);
+    border[0] = 0;
+    for(let i = 1; i < n; i++){
+        let j = border[i - 1];
+        while(j > 0 && text[i] !== text[j]){
+            j = border[j - 1];
+        }
+        if (text[i] === text[j]) {
+            j++;
+        }
+        border[i] = j;
+    }
+    return border;
+}
+function construct_bw_transform(text, rotation_array) {
+    if (!text) {
+        return "";
+    }
+    if (text.length !== rotation_array.length) {
+        throw new AlgorithmError('Invalid input: text must be a string and rotation_array must be an array', 'BWT', {
+            text,
+            rotation_array
+        });
+    }
+    const n = text.length;
+    let result = "";
+    for(let i = 0; i < n; i++){
+        result += text[(rotation_array[i] + n - 1) % n];
+    }
+    return result;
+}
+function construct_first_array(text) {
+    if (!text) {
+        return "";
+    }
+    return [
+        ...text
+    ].sort().join('');
+}
+function construct_index_array(n) {
+    if (!n || n <= 0) {
+        return [];
+    }
+    return Array.from(Array(n).keys());
+}
+function construct_rotation_array(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    const next = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        next[i] = (i + 1) % n;
+    }
+    return Array.from(cyclic_sort(ranks, sigma, next));
+}
+function construct_inverse_suffix_array(suffix_array) {
+    if (!suffix_array) {
+        return [];
+    }
+    const result = new Array(suffix_array.length);
+    for(let i = 0; i < suffix_array.length; i++){
+        result[suffix_array[i]] = i;
+    }
+    return result;
+}
+function construct_phi_array(suffix_array, inverse_suffix_array) {
+    const n = suffix_array.length;
+    const result = new Array(n);
+    for(let i = 0; i < n; i++){
+        if (inverse_suffix_array[i] !== 0) {
+            result[i] = suffix_array[inverse_suffix_array[i] - 1];
+        } else {
+            result[i] = n;
+        }
+    }
+    return result;
+}
+function construct_inverse_phi_array(suffix_array, inverse_suffix_array) {
+    if (!suffix_array || !inverse_suffix_array) {
+        return [];
+    }
+    const n = suffix_array.length;
+    const result = new Array(n);
+    for(let i = 0; i < n; ++i){
+        if (inverse_suffix_array[i] + 1 !== n) {
+            result[i] = suffix_array[inverse_suffix_array[i] + 1];
+        } else {
+            result[i] = n;
+        }
+    }
+    return result;
+}
+function build_range_min_table(values) {
+    const n = values.length;
+    const levels = [
+        Int32Array.from(values)
+    ];
+    for(let width = 1; 2 * width <= n; width *= 2){
+        const prev = levels[levels.length - 1];
+        const level = new Int32Array(n - 2 * width + 1);
+        for(let i = 0; i < level.length; i++){
+            level[i] = Math.min(prev[i], prev[i + width]);
+        }
+        levels.push(level);
+    }
+    return levels;
+}
+function range_min_query(levels, left, right) {
+    const level = 31 - Math.clz32(right - left + 1);
+    const table = levels[level];
+    return Math.min(table[left], table[right - (1 << level) + 1]);
+}
+function construct_lcp_array(text, suffix_array) {
+    if (!text || !suffix_array) {
+        return [];
+    }
+    const n = suffix_array.length;
+    if (n === 0) {
+        return [];
+    }
+    const phi = new Int32Array(n);
+    phi[suffix_array[0]] = -1;
+    for(let i = 1; i < n; i++){
+        phi[suffix_array[i]] = suffix_array[i - 1];
+    }
+    const plcp = new Int32Array(n);
+    let lcp = 0;
+    for(let i = 0; i < n; i++){
+        const j = phi[i];
+        if (j === -1) {
+            lcp = 0;
+            continue;
+        }
+        while(i + lcp < n && j + lcp < n && text[i + lcp] === text[j + lcp]){
+            lcp++;
+        }
+        plcp[i] = lcp;
+        if (lcp > 0) {
+            lcp--;
+        }
+    }
+    const result = new Array(n);
+    for(let i = 0; i < n; i++){
+        result[i] = plcp[suffix_array[i]];
+    }
+    return result;
+}
+function count_lcp_array(lcp_array) {
+    if (!lcp_array) {
+        return 0;
+    }
+    return lcp_array.reduce((a, b)=>a + b, 0);
+}
+function construct_plcp_array(inverse_suffix_array, lcp_array) {
+    if (!inverse_suffix_array || !lcp_array) {
+        return [];
+    }
+    if (inverse_suffix_array.length !== lcp_array.length) {
+        throw new AlgorithmError("Inverse suffix array and LCP array must have the same length.", "PLCP", {
+            inverse_suffix_array,
+            lcp_array
+        });
+    }
+    const n = inverse_suffix_array.length;
+    return [
+        ...new Array(n).keys()
+    ].map((i)=>lcp_array[inverse_suffix_array[i]]);
+}
+function construct_psi_array(suffix_array, inverse_suffix_array) {
+    if (!suffix_array || !inverse_suffix_array) {
+        return [];
+    }
+    const n = suffix_array.length;
+    return [
+        ...new Array(n).keys()
+    ].map((i)=>suffix_array[i] + 1 < n ? inverse_suffix_array[suffix_array[i] + 1] : n);
+}
+function construct_lyndon_factorization(text, inverse_suffix_array) {
+    if (!text || !inverse_suffix_array) {
+        return [];
+    }
+    const n = text.length;
+    if (n === 0) {
+        return [];
+    }
+    const result = new Array(n).fill(false);
+    if (inverse_suffix_array.length < n) {
+        throw new AlgorithmError(`Inverse suffix array (inverse_suffix_array) must have a length of at least text.length (${n}), but got ${inverse_suffix_array.length}.`, "LynF", {
+            text,
+            inverse_suffix_array
+        });
+    }
+    let inverse_suffix_arrayval = inverse_suffix_array[0];
+    for(let i = 0; i + 1 < n; ++i){
+        if (inverse_suffix_arrayval > inverse_suffix_array[i + 1]) {
+            result[i] = true;
+            inverse_suffix_arrayval = inverse_suffix_array[i + 1];
+        }
+    }
+    result[n - 1] = true;
+    return result;
+}
+function delta(substring_complexity) {
+    if (substring_complexity.length === 0) {
+        throw new AlgorithmError("Input array 'substring_complexity' cannot be empty.", "delta", {
+            substring_complexity
+        });
+    }
+    let bestlength = 1;
+    let bestval = substring_complexity[0];
+    for(let i = 1; i < substring_complexity.length; ++i){
+        const currentRatio = substring_complexity[i] / (i + 1);
+        if (currentRatio > bestval) {
+            bestlength = i + 1;
+            bestval = currentRatio;
+        }
+    }
+    return [
+        bestlength,
+        bestval
+    ];
+}
+function count_delta(substring_complexity) {
+    if (!substring_complexity) {
+        return 0;
+    }
+    return delta(substring_complexity)[1];
+}
+function count_delta_argmax(substring_complexity) {
+    if (!substring_complexity) {
+        return 0;
+    }
+    return delta(substring_complexity)[0];
+}
+function construct_substring_complexity(lcp_array) {
+    if (!lcp_array) {
+        return [];
+    }
+    const n = lcp_array.length;
+    const ret = new Array(n);
+    const c = new Map();
+    lcp_array.forEach((ele)=>{
+        c.set(ele, (c.get(ele) || 0) + 1);
+    });
+    let count = 0;
+    for(let i = n; i >= 1; --i){
+        count += 1;
+        if (c.has(i)) {
+            count -= c.get(i);
+        }
+        ret[i - 1] = count;
+    }
+    return ret;
+}
+function conjugate_string(text, shift) {
+    if (!text) {
+        return "";
+    }
+    if (shift < 0 || shift > text.length) {
+        throw new AlgorithmError("Shift value must be between 0 and the length of the string.", "conjugate_string", {
+            text,
+            shift
+        });
+    }
+    if (text.length === 0 || shift === 0) {
+        return text;
+    }
+    return text.substring(shift) + text.substring(0, shift);
+}
+function build_char_rank_select(text) {
+    const n = text.length;
+    const occurrences = new Map();
+    const local_ranks = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        let positions = occurrences.get(text[i]);
+        if (positions === undefined) {
+            positions = [];
+            occurrences.set(text[i], positions);
+        }
+        local_ranks[i] = positions.length;
+        positions.push(i);
+    }
+    return {
+        occurrences,
+        local_ranks
+    };
+}
+function char_select(rs, c, nth) {
+    const positions = rs.occurrences.get(c);
+    if (positions === undefined || nth <= 0 || nth > positions.length) {
+        return -1;
+    }
+    return positions[nth - 1];
+}
+function construct_lf_array(first_array, bw_transform) {
+    if (!first_array || !bw_transform) {
+        return [];
+    }
+    if (first_array.length !== bw_transform.length) {
+        throw new AlgorithmError("First array and BWT must have the same length.", "LF", {
+            first_array,
+            bw_transform
+        });
+    }
+    const n = first_array.length;
+    const result = new Array(n);
+    const bwt_rs = build_char_rank_select(bw_transform);
+    const first_rs = build_char_rank_select(first_array);
+    for(let i = 0; i < n; ++i){
+        const c = bw_transform[i];
+        const crank = bwt_rs.local_ranks[i] + 1;
+        result[i] = char_select(first_rs, c, crank);
+    }
+    return result;
+}
+function construct_sl_string(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const result = new Array(n);
+    let type = 'S';
+    result[n - 1] = type;
+    for(let i = n - 2; i >= 0; --i){
+        if (text[i + 1] > text[i]) {
+            type = 'S';
+        } else if (text[i + 1] < text[i]) {
+            type = 'L';
+            if (result[i + 1] == 'S') {
+                result[i + 1] = 'S*';
+            }
+        }
+        result[i] = type;
+    }
+    if (result[0] == 'S') {
+        result[0] = 'S*';
+    }
+    return result;
+}
+function construct_lpf_array(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const suffix_array = construct_suffix_array(text);
+    const lcp_array = construct_lcp_array(text, suffix_array);
+    const stack = new Int32Array(n);
+    const stack_lcp = new Int32Array(n);
+    const previous_lcp = new Int32Array(n);
+    let top = 0;
+    for(let r = 0; r < n; r++){
+        let lcp = r > 0 ? lcp_array[r] : 0;
+        while(top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]){
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        previous_lcp[r] = top > 0 ? lcp : 0;
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+    const result = new Array(n);
+    top = 0;
+    for(let r = n - 1; r >= 0; r--){
+        let lcp = r + 1 < n ? lcp_array[r + 1] : 0;
+        while(top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]){
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        result[suffix_array[r]] = Math.max(previous_lcp[r], top > 0 ? lcp : 0);
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+    return result;
+}
+function construct_lpnf_array(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const suffix_array = construct_suffix_array(text);
+    const lcp_array = construct_lcp_array(text, suffix_array);
+    const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
+    const lcp_table = build_range_min_table(lcp_array);
+    const sa_table = build_range_min_table(suffix_array);
+    function has_previous_occurrence(i, length) {
+        if (length > i || i + length > n) {
+            return false;
+        }
+        const rank = inverse_suffix_array[i];
+        let low = 0;
+        let high = rank;
+        while(low < high){
+            const mid = low + high >>> 1;
+            if (range_min_query(lcp_table, mid + 1, rank) >= length) {
+                high = mid;
+            } else {
+                low = mid + 1;
+            }
+        }
+        const left = low;
+        low = rank;
+        high = n - 1;
+        while(low < high){
+            const mid = low + high + 1 >>> 1;
+            if (range_min_query(lcp_table, rank + 1, mid) >= length) {
+                low = mid;
+            } else {
+                high = mid - 1;
+            }
+        }
+        return range_min_query(sa_table, left, low) <= i - length;
+    }
+    const result = new Array(n);
+    let length = 0;
+    for(let i = 0; i < n; i++){
+        length = Math.max(length - 1, 0);
+        while(has_previous_occurrence(i, length + 1)){
+            length++;
+        }
+        result[i] = length;
+    }
+    return result;
+}
+function construct_lnf_array(text) {
+    if (!text) {
+        return [];
+    }
+    const revtext = text.split('').reverse().join('');
+    const lpfarray = construct_lpf_array(revtext);
+    const n = lpfarray.length;
+    return [
+        ...new Array(n).keys()
+    ].map((i)=>lpfarray[n - 1 - i]);
+}
+function greedy_factorize(factor_array) {
+    if (!factor_array) {
+        return [];
+    }
+    const n = factor_array.length;
+    if (n === 0) {
+        return [];
+    }
+    const result = new Array(n).fill(false);
+    for(let i = 0; i < n;){
+        const currentFactor = factor_array[i];
+        let distance = currentFactor === 0 ? 1 : currentFactor;
+        result[i + distance - 1] = true;
+        i += distance;
+    }
+    return result;
+}
+function construct_lzss_factorization(lpf_array) {
+    return greedy_factorize(lpf_array);
+}
+function construct_lzssno_factorization(lpnf_array) {
+    return greedy_factorize(lpnf_array);
+}
+function greedy_factorize_with_new_letter(factor_array) {
+    if (!factor_array) {
+        return [];
+    }
+    const n = factor_array.length;
+    if (n === 0) {
+        return [];
+    }
+    const result = new Array(n).fill(false);
+    for(let i = 0; i < n;){
+        const currentFactor = factor_array[i];
+        let distance = currentFactor === 0 ? 1 : Math.min(currentFactor + 1, n - i);
+        result[i + distance - 1] = true;
+        i += distance;
+    }
+    return result;
+}
+function construct_lz77_factorization(lpf_array) {
+    return greedy_factorize_with_new_letter(lpf_array);
+}
+function construct_reverse_lzss_factorization(lnf_array) {
+    if (!lnf_array) {
+        return [];
+    }
+    const copied_lnf_array = lnf_array.slice().reverse();
+    return greedy_factorize(copied_lnf_array);
+}
+function construct_lexparse_factorization(plcp_array) {
+    return greedy_factorize(plcp_array);
+}
+function construct_nss_array(inverse_suffix_array) {
+    if (!inverse_suffix_array) {
+        return [];
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Array(n);
+    for(let i = 0; i < n; ++i){
+        let nss = i + 1;
+        while(nss < n && inverse_suffix_array[nss] > inverse_suffix_array[i]){
+            ++nss;
+        }
+        result[i] = nss >= n ? n : nss;
+    }
+    return result;
+}
+function construct_pss_array(inverse_suffix_array) {
+    if (!inverse_suffix_array) {
+        return [];
+    }
+    const n = inverse_suffix_array.length;
+    const result = new Array(n);
+    for(let i = 0; i < n; ++i){
+        let pss = i - 1;
+        while(pss >= 0 && inverse_suffix_array[pss] > inverse_suffix_array[i]){
+            --pss;
+        }
+        result[i] = pss < 0 ? n : pss;
+    }
+    return result;
+}
+function construct_lyndon_array(nss_array) {
+    if (!nss_array) {
+        return [];
+    }
+    const n = nss_array.length;
+    let result = new Array(n);
+    for(let i = 0; i < n; ++i){
+        result[i] = nss_array[i] === n ? n - i : nss_array[i] - i;
+    }
+    return result;
+}
+function construct_necklace_conjugate_transform(text) {
+    if (!text) {
+        return "";
+    }
+    return conjugate_string(text, construct_rotation_array(text)[0]);
+}
+function construct_invert_transform(text) {
+    if (!text) return "";
+    const alphabet = Array.from(new Set([
+        ...text
+    ])).sort();
+    const sigma = alphabet.length;
+    const map = new Map();
+    for(let r = 0; r < sigma; r++){
+        map.set(alphabet[r], alphabet[sigma - 1 - r]);
+    }
+    return [
+        ...text
+    ].map((c)=>map.get(c) ?? c).join("");
+}
+function construct_revert_transform(text) {
+    if (!text) {
+        return "";
+    }
+    return text.split('').reverse().join('');
+}
+function construct_circular_suffix_array(text, lyndon_factorization) {
+    if (!text || !lyndon_factorization) {
+        return [];
+    }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return Array.from(cyclic_sort(ranks, sigma, factor_successors(lyndon_factorization, text.length)));
+}
+function construct_inverse_circular_suffix_array(circular_suffix_array) {
+    if (!circular_suffix_array) {
+        return [];
+    }
+    return construct_inverse_suffix_array(circular_suffix_array);
+}
+function construct_bbw_indices(lyndon_factorization, circular_suffix_array) {
+    if (!lyndon_factorization || !circular_suffix_array) {
+        return [];
+    }
+    const n = circular_suffix_array.length;
+    const next = factor_successors(lyndon_factorization, n);
+    const previous = new Int32Array(n);
+    for(let i = 0; i < n; ++i){
+        previous[next[i]] = i;
+    }
+    return [
+        ...circular_suffix_array
+    ].map((pos)=>previous[pos]);
+}
+function construct_bbw_transform(text, bbw_indices) {
+    if (!text || !bbw_indices) {
+        return "";
+    }
+    return [
+        ...bbw_indices
+    ].map((pos)=>text[pos]).join('');
+}
+function construct_inverse_bbw_transform(bbw_transform) {
+    if (!bbw_transform) {
+        return "";
+    }
+    let n = bbw_transform.length;
+    var farray = construct_first_array(bbw_transform);
+    const farray_rs = build_char_rank_select(farray);
+    const bbwt_rs = build_char_rank_select(bbw_transform);
+    var marking = new Array(n).fill(0);
+    var conjugates = [];
+    for(let bbwt_init_position = 0; bbwt_init_position < n; ++bbwt_init_position){
+        let conjugate = [];
+        if (marking[bbwt_init_position] == true) {
+            continue;
+        }
+        var pos = bbwt_init_position;
+        while(marking[pos] == false){
+            marking[pos] = true;
+            conjugate.push(bbw_transform[pos]);
+            let cur_char = farray[pos];
+            let character_number = farray_rs.local_ranks[pos] + 1;
+            pos = char_select(bbwt_rs, cur_char, character_number);
+            if (pos === -1) {
+                throw new AlgorithmError('character_number exceeds occurrences in inverse BBWT', 'construct_inverse_bbw_transform', bbw_transform);
+            }
+        }
+        const finalConjugate = construct_necklace_conjugate_transform(conjugate.join(''));
+        conjugates.push(finalConjugate);
+    }
+    conjugates.sort();
+    conjugates.reverse();
+    return conjugates.join('');
+}
+function construct_lz78_factorization(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const factorization = new Array(n).fill(false);
+    const dictionary = new Map();
+    let currentIndex = 0;
+    while(currentIndex < n){
+        let currentSubstring = "";
+        for(let j = currentIndex; j < n; j++){
+            currentSubstring += text[j];
+            if (!dictionary.has(currentSubstring)) {
+                break;
+            }
+        }
+        const newFactor = currentSubstring;
+        dictionary.set(newFactor, currentIndex);
+        factorization[currentIndex + newFactor.length - 1] = true;
+        currentIndex += newFactor.length;
+    }
+    return factorization;
+}
+function construct_lzw_factorization(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const factorization = new Array(n).fill(false);
+    const dictionary = new Map();
+    for(let i = 0; i < n; i++){
+        const char = text[i];
+        if (!dictionary.has(char)) {
+            dictionary.set(char, dictionary.size);
+        }
+    }
+    for(let i = 0; i < n;){
+        let s = "";
+        for(let j = i; j < n; j++){
+            s += text[j];
+            if (!dictionary.has(s)) {
+                s = s.slice(0, -1);
+                break;
+            }
+        }
+        let endpos = i + s.length - 1;
+        if (endpos >= n) {
+            factorization[n - 1] = true;
+            break;
+        }
+        if (s.length == 0) {
+            throw new AlgorithmError("LZW factorization failed to find a valid substring.", "construct_lzw_factorization", {
+                text
+            });
+        }
+        factorization[endpos] = true;
+        if (i + s.length < n) {
+            s += text[i + s.length];
+        }
+        if (!dictionary.has(s)) {
+            dictionary.set(s, dictionary.size);
+        }
+        i = endpos + 1;
+    }
+    return factorization;
+}
+function construct_necklace_factorization(text, lyndon_factorization) {
+    if (!text || !lyndon_factorization) {
+        return [];
+    }
+    const n = text.length;
+    const necklace_factorization = new Array(n).fill(false);
+    let factor_start = 0;
+    let last_factor = "";
+    while(factor_start < n){
+        let factor_end = factor_start;
+        while(factor_end < n && lyndon_factorization[factor_end] == false){
+            factor_end++;
+        }
+        const current_factor = text.slice(factor_start, factor_end + 1);
+        if (current_factor === last_factor) {
+            necklace_factorization[factor_start - 1] = false;
+            necklace_factorization[factor_end] = true;
+            factor_start = factor_end + 1;
+            continue;
+        }
+        last_factor = current_factor;
+        necklace_factorization[factor_end] = true;
+        factor_start = factor_end + 1;
+    }
+    return necklace_factorization;
+}
+function construct_odd_maximal_palindromic_length_array(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const o_pali = new Array(n).fill(0);
+    let center = 0;
+    let right = 0;
+    for(let i = 0; i < n; i++){
+        let mirror = 2 * center - i;
+        if (i < right) {
+            o_pali[i] = Math.min(right - i, o_pali[mirror]);
+        }
+        while(i - o_pali[i] - 1 >= 0 && i + o_pali[i] + 1 < n && text[i - o_pali[i] - 1] === text[i + o_pali[i] + 1]){
+            o_pali[i]++;
+        }
+        if (i + o_pali[i] > right) {
+            center = i;
+            right = i + o_pali[i];
+        }
+    }
+    return o_pali;
+}
+function construct_even_maximal_palindromic_length_array(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const e_pali = new Array(n).fill(0);
+    let center = 0;
+    let right = 0;
+    for(let i = 0; i < n; i++){
+        let mirror = 2 * center - i + 1;
+        if (i < right) {
+            e_pali[i] = Math.min(right - i, e_pali[mirror]);
+        }
+        while(i - e_pali[i] - 1 >= 0 && i + e_pali[i] < n && text[i - e_pali[i] - 1] === text[i + e_pali[i]]){
+            e_pali[i]++;
+        }
+        if (i + e_pali[i] > right) {
+            center = i - 1;
+            right = i + e_pali[i];
+        }
+    }
+    return e_pali;
+}
+function get_lzend_reference(text, substring, factorization) {
+    let startIndex = 0;
+    while((startIndex = text.indexOf(substring, startIndex)) !== -1){
+        if (factorization[startIndex + substring.length - 1]) {
+            return startIndex;
+        }
+        startIndex += substring.length;
+    }
+    return -1;
+}
+function construct_lzend_factorization(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const factorization = new Array(n).fill(false);
+    for(let i = 0; i < n;){
+        let factor = "";
+        let s = "";
+        const prefix = text.slice(0, i);
+        for(let j = i; j < n; j++){
+            s += text[j];
+            if (prefix.indexOf(s) === -1) {
+                break;
+            }
+            if (get_lzend_reference(prefix, s, factorization) !== -1) {
+                factor = s;
+            }
+        }
+        if (!factor) {
+            factor = text[i];
+        } else {
+            factor += text[i + factor.length - 1];
+        }
+        let endpos = i + factor.length - 1;
+        if (endpos >= n) {
+            factorization[n - 1] = true;
+            break;
+        }
+        factorization[endpos] = true;
+        i = endpos + 1;
+    }
+    return factorization;
+}
+function construct_gamma_factorization(text) {
+    if (!text) {
+        return [];
+    }
+    const n = text.length;
+    const freq = new Map();
+    for(let i = 0; i < n; i++){
+        let s = '';
+        for(let j = i; j < n; j++){
+            s += text[j];
+            freq.set(s, (freq.get(s) || 0) + 1);
+        }
+    }
+    const minimal = [];
+    for (const [s, f] of freq.entries()){
+        let minimalFlag = true;
+        for(let i = 0; i < s.length && minimalFlag; i++){
+            const t = s.slice(0, i) + s.slice(i + 1);
+            if (t.length > 0 && freq.get(t) <= f) {
+                minimalFlag = false;
+            }
+        }
+        if (minimalFlag) minimal.push(s);
+    }
+    const hits = minimal.map((s)=>{
+        const set = new Set();
+        for(let i = 0; i + s.length <= n; i++){
+            if (text.slice(i, i + s.length) === s) {
+                for(let p = i; p < i + s.length; p++){
+                    set.add(p);
+                }
+            }
+        }
+        return set;
+    });
+    const positions = [
+        ...Array(n).keys()
+    ];
+    function backtrack(idx, chosen, best) {
+        if (best.size > 0 && chosen.size >= best.size) return new Set();
+        let ok = true;
+        for (const h of hits){
+            let covered = false;
+            for (const p of chosen){
+                if (h.has(p)) {
+                    covered = true;
+                    break;
+                }
+            }
+            if (!covered) {
+                ok = false;
+                break;
+            }
+        }
+        if (ok) {
+            return new Set(chosen);
+        }
+        if (idx === positions.length) {
+            return new Set();
+        }
+        chosen.add(positions[idx]);
+        var res = backtrack(idx + 1, chosen, best);
+        best = res.size > 0 ? res : best;
+        chosen.delete(positions[idx]);
+        var res = backtrack(idx + 1, chosen, best);
+        best = res.size > 0 ? res : best;
+        return best;
+    }
+    const ret = backtrack(0, new Set(), new Set());
+    const result = new Array(n).fill(false);
+    ret.forEach((val)=>result[val] = true);
+    return result;
+}
+var structure_flags = {
+	counter_n: [0, 1 << 0],
+	counter_sigma: [0, 1 << 1],
+	suffix_array: [0, 1 << 2],
+	border_array: [0, 1 << 3],
+	first_array: [0, 1 << 4],
+	index_array: [0, 1 << 5],
+	rotation_array: [0, 1 << 6],
+	sl_string: [0, 1 << 7],
+	lpf_array: [0, 1 << 8],
+	lpnf_array: [0, 1 << 9],
+	lnf_array: [0, 1 << 10],
+	necklace_conjugate_transform: [0, 1 << 11],
+	invert_transform: [0, 1 << 12],
+	revert_transform: [0, 1 << 13],
+	lz78_factorization: [0, 1 << 14],
+	lzw_factorization: [0, 1 << 15],
+	odd_maximal_palindromic_length_array: [0, 1 << 16],
+	even_maximal_palindromic_length_array: [0, 1 << 17],
+	lzend_factorization: [0, 1 << 18],
+	gamma_factorization: [0, 1 << 19],
+	inverse_suffix_array: [0, 1 << 20],
+	lcp_array: [0, 1 << 21],
+	counter_period: [0, 1 << 22],
+	counter_exponent: [0, 1 << 23],
+	counter_regularity: [0, 1 << 24],
+	bw_transform: [0, 1 << 25],
+	lzss_factorization: [0, 1 << 26],
+	lz77_factorization: [0, 1 << 27],
+	lzssno_factorization: [0, 1 << 28],
+	reverse_lzss_factorization: [0, 1 << 29],
+	counter_necklace_conjugate_transform: [0, 1 << 30],
+	counter_invert_transform: [0, 1 << 31],
+	counter_revert_transform: [1, 1 << 0],
+	counter_lz78_factorization: [1, 1 << 1],
+	counter_lzw_factorization: [1, 1 << 2],
+	counter_lzend_factorization: [1, 1 << 3],
+	counter_gamma_factorization: [1, 1 << 4],
+	phi_array: [1, 1 << 5],
+	inverse_phi_array: [1, 1 << 6],
+	psi_array: [1, 1 << 7],
+	lyndon_factorization: [1, 1 << 8],
+	nss_array: [1, 1 << 9],
+	pss_array: [1, 1 << 10],
+	counter_lcp_array: [1, 1 << 11],
+	plcp_array: [1, 1 << 12],
+	substring_complexity: [1, 1 << 13],
+	lf_array: [1, 1 << 14],
+	counter_bw_transform: [1, 1 << 15],
+	counter_lzss_factorization: [1, 1 << 16],
+	counter_lz77_factorization: [1, 1 << 17],
+	counter_lzssno_factorization: [1, 1 << 18],
+	counter_reverse_lzss_factorization: [1, 1 << 19],
+	circular_suffix_array: [1, 1 << 20],
+	necklace_factorization: [1, 1 << 21],
+	counter_lyndon_factorization: [1, 1 << 22],
+	lyndon_array: [1, 1 << 23],
+	lexparse_factorization: [1, 1 << 24],
+	counter_delta: [1, 1 << 25],
+	counter_delta_argmax: [1, 1 << 26],
+	inverse_circular_suffix_array: [1, 1 << 27],
+	bbw_indices: [1, 1 << 28],
+	counter_necklace_factorization: [1, 1 << 29],
+	counter_lexparse_factorization: [1, 1 << 30],
+	bbw_transform: [1, 1 << 31],
+	inverse_bbw_transform: [2, 1 << 0],
+	counter_bbw_transform: [2, 1 << 1],
+	counter_inverse_bbw_transform: [2, 1 << 2]
+};
+// === Dependency closure: flag words of each structure and everything it is built from ===
+var structure_closure = {
+	counter_n: [0x00000001, 0x00000000, 0x00000000],
+	counter_sigma: [0x00000002, 0x00000000, 0x00000000],
+	suffix_array: [0x00000004, 0x00000000, 0x00000000],
+	border_array: [0x00000008, 0x00000000, 0x00000000],
+	first_array: [0x00000010, 0x00000000, 0x00000000],
+	index_array: [0x00000020, 0x00000000, 0x00000000],
+	rotation_array: [0x00000040, 0x00000000, 0x00000000],
+	sl_string: [0x00000080, 0x00000000, 0x00000000],
+	lpf_array: [0x00000100, 0x00000000, 0x00000000],
+	lpnf_array: [0x00000200, 0x00000000, 0x00000000],
+	lnf_array: [0x00000400, 0x00000000, 0x00000000],
+	necklace_conjugate_transform: [0x00000800, 0x00000000, 0x00000000],
+	invert_transform: [0x00001000, 0x00000000, 0x00000000],
+	revert_transform: [0x00002000, 0x00000000, 0x00000000],
+	lz78_factorization: [0x00004000, 0x00000000, 0x00000000],
+	lzw_factorization: [0x00008000, 0x00000000, 0x00000000],
+	odd_maximal_palindromic_length_array: [0x00010000, 0x00000000, 0x00000000],
+	even_maximal_palindromic_length_array: [0x00020000, 0x00000000, 0x00000000],
+	lzend_factorization: [0x00040000, 0x00000000, 0x00000000],
+	gamma_factorization: [0x00080000, 0x00000000, 0x00000000],
+	inverse_suffix_array: [0x00100004, 0x00000000, 0x00000000],
+	lcp_array: [0x00200004, 0x00000000, 0x00000000],
+	counter_period: [0x00400008, 0x00000000, 0x00000000],
+	counter_exponent: [0x00800008, 0x00000000, 0x00000000],
+	counter_regularity: [0x01000008, 0x00000000, 0x00000000],
+	bw_transform: [0x02000040, 0x00000000, 0x00000000],
+	lzss_factorization: [0x04000100, 0x00000000, 0x00000000],
+	lz77_factorization: [0x08000100, 0x00000000, 0x00000000],
+	lzssno_factorization: [0x10000200, 0x00000000, 0x00000000],
+	reverse_lzss_factorization: [0x20000400, 0x00000000, 0x00000000],
+	counter_necklace_conjugate_transform: [0x40000800, 0x00000000, 0x00000000],
+	counter_invert_transform: [0x80001000, 0x00000000, 0x00000000],
+	counter_revert_transform: [0x00002000, 0x00000001, 0x00000000],
+	counter_lz78_factorization: [0x00004000, 0x00000002, 0x00000000],
+	counter_lzw_factorization: [0x00008000, 0x00000004, 0x00000000],
+	counter_lzend_factorization: [0x00040000, 0x00000008, 0x00000000],
+	counter_gamma_factorization: [0x00080000, 0x00000010, 0x00000000],
+	phi_array: [0x00100004, 0x00000020, 0x00000000],
+	inverse_phi_array: [0x00100004, 0x00000040, 0x00000000],
+	psi_array: [0x00100004, 0x00000080, 0x00000000],
+	lyndon_factorization: [0x00100004, 0x00000100, 0x00000000],
+	nss_array: [0x00100004, 0x00000200, 0x00000000],
+	pss_array: [0x00100004, 0x00000400, 0x00000000],
+	counter_lcp_array: [0x00200004, 0x00000800, 0x00000000],
+	plcp_array: [0x00300004, 0x00001000, 0x00000000],
+	substring_complexity: [0x00200004, 0x00002000, 0x00000000],
+	lf_array: [0x02000050, 0x00004000, 0x00000000],
+	counter_bw_transform: [0x02000040, 0x00008000, 0x00000000],
+	counter_lzss_factorization: [0x04000100, 0x00010000, 0x00000000],
+	counter_lz77_factorization: [0x08000100, 0x00020000, 0x00000000],
+	counter_lzssno_factorization: [0x10000200, 0x00040000, 0x00000000],
+	counter_reverse_lzss_factorization: [0x20000400, 0x00080000, 0x00000000],
+	circular_suffix_array: [0x00100004, 0x00100100, 0x00000000],
+	necklace_factorization: [0x00100004, 0x00200100, 0x00000000],
+	counter_lyndon_factorization: [0x00100004, 0x00400100, 0x00000000],
+	lyndon_array: [0x00100004, 0x00800200, 0x00000000],
+	lexparse_factorization: [0x00300004, 0x01001000, 0x00000000],
+	counter_delta: [0x00200004, 0x02002000, 0x00000000],
+	counter_delta_argmax: [0x00200004, 0x04002000, 0x00000000],
+	inverse_circular_suffix_array: [0x00100004, 0x08100100, 0x00000000],
+	bbw_indices: [0x00100004, 0x10100100, 0x00000000],
+	counter_necklace_factorization: [0x00100004, 0x20200100, 0x00000000],
+	counter_lexparse_factorization: [0x00300004, 0x41001000, 0x00000000],
+	bbw_transform: [0x00100004, 0x90100100, 0x00000000],
+	inverse_bbw_transform: [0x00100004, 0x90100100, 0x00000001],
+	counter_bbw_transform: [0x00100004, 0x90100100, 0x00000002],
+	counter_inverse_bbw_transform: [0x00100004, 0x90100100, 0x00000005]
+};
+// Returns the flag words selecting the given structure names; unknown names are ignored.
+function structure_flag_set(names) {
+	var flags = [0x00000000, 0x00000000, 0x00000000];
+	for (var i = 0; i < names.length; i++) {
+		var flag = structure_flags[names[i]];
+		if (flag) flags[flag[0]] |= flag[1];
+	}
+	return flags;
+}
+// Returns the flag words of the given structures together with everything they are built from.
+function structure_closure_of(flags) {
+	var need = [0x00000000, 0x00000000, 0x00000000];
+	for (var name in structure_flags) {
+		var flag = structure_flags[name];
+		if (!(flags[flag[0]] & flag[1])) continue;
+		var deps = structure_closure[name];
+		for (var w = 0; w < deps.length; w++) need[w] |= deps[w];
+	}
+	return need;
+}
+// Builds one structure from the text and its direct dependencies, given by name in `inputs`.
+var structure_builders = {
+	counter_n: function (var_text, var_n, inputs) { return count_n(var_text); },
+	counter_sigma: function (var_text, var_n, inputs) { return count_sigma(var_text); },
+	suffix_array: function (var_text, var_n, inputs) { return construct_suffix_array(var_text); },
+	border_array: function (var_text, var_n, inputs) { return construct_border_array(var_text); },
+	first_array: function (var_text, var_n, inputs) { return construct_first_array(var_text); },
+	index_array: function (var_text, var_n, inputs) { return construct_index_array(var_n); },
+	rotation_array: function (var_text, var_n, inputs) { return construct_rotation_array(var_text); },
+	sl_string: function (var_text, var_n, inputs) { return construct_sl_string(var_text); },
+	lpf_array: function (var_text, var_n, inputs) { return construct_lpf_array(var_text); },
+	lpnf_array: function (var_text, var_n, inputs) { return construct_lpnf_array(var_text); },
+	lnf_array: function (var_text, var_n, inputs) { return construct_lnf_array(var_text); },
+	necklace_conjugate_transform: function (var_text, var_n, inputs) { return construct_necklace_conjugate_transform(var_text); },
+	invert_transform: function (var_text, var_n, inputs) { return construct_invert_transform(var_text); },
+	revert_transform: function (var_text, var_n, inputs) { return construct_revert_transform(var_text); },
+	lz78_factorization: function (var_text, var_n, inputs) { return construct_lz78_factorization(var_text); },
+	lzw_factorization: function (var_text, var_n, inputs) { return construct_lzw_factorization(var_text); },
+	odd_maximal_palindromic_length_array: function (var_text, var_n, inputs) { return construct_odd_maximal_palindromic_length_array(var_text); },
+	even_maximal_palindromic_length_array: function (var_text, var_n, inputs) { return construct_even_maximal_palindromic_length_array(var_text); },
+	lzend_factorization: function (var_text, var_n, inputs) { return construct_lzend_factorization(var_text); },
+	gamma_factorization: function (var_text, var_n, inputs) { return construct_gamma_factorization(var_text); },
+	inverse_suffix_array: function (var_text, var_n, inputs) { return construct_inverse_suffix_array(inputs.suffix_array); },
+	lcp_array: function (var_text, var_n, inputs) { return construct_lcp_array(var_text, inputs.suffix_array); },
+	counter_period: function (var_text, var_n, inputs) { return count_period(inputs.border_array); },
+	counter_exponent: function (var_text, var_n, inputs) { return count_exponent(inputs.border_array); },
+	counter_regularity: function (var_text, var_n, inputs) { return count_regularity(inputs.border_array); },
+	bw_transform: function (var_text, var_n, inputs) { return construct_bw_transform(var_text, inputs.rotation_array); },
+	lzss_factorization: function (var_text, var_n, inputs) { return construct_lzss_factorization(inputs.lpf_array); },
+	lz77_factorization: function (var_text, var_n, inputs) { return construct_lz77_factorization(inputs.lpf_array); },
+	lzssno_factorization: function (var_text, var_n, inputs) { return construct_lzssno_factorization(inputs.lpnf_array); },
+	reverse_lzss_factorization: function (var_text, var_n, inputs) { return construct_reverse_lzss_factorization(inputs.lnf_array); },
+	counter_necklace_conjugate_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.necklace_conjugate_transform); },
+	counter_invert_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.invert_transform); },
+	counter_revert_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.revert_transform); },
+	counter_lz78_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lz78_factorization); },
+	counter_lzw_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzw_factorization); },
+	counter_lzend_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzend_factorization); },
+	counter_gamma_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.gamma_factorization); },
+	phi_array: function (var_text, var_n, inputs) { return construct_phi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	inverse_phi_array: function (var_text, var_n, inputs) { return construct_inverse_phi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	psi_array: function (var_text, var_n, inputs) { return construct_psi_array(inputs.suffix_array, inputs.inverse_suffix_array); },
+	lyndon_factorization: function (var_text, var_n, inputs) { return construct_lyndon_factorization(var_text, inputs.inverse_suffix_array); },
+	nss_array: function (var_text, var_n, inputs) { return construct_nss_array(inputs.inverse_suffix_array); },
+	pss_array: function (var_text, var_n, inputs) { return construct_pss_array(inputs.inverse_suffix_array); },
+	counter_lcp_array: function (var_text, var_n, inputs) { return count_lcp_array(inputs.lcp_array); },
+	plcp_array: function (var_text, var_n, inputs) { return construct_plcp_array(inputs.inverse_suffix_array, inputs.lcp_array); },
+	substring_complexity: function (var_text, var_n, inputs) { return construct_substring_complexity(inputs.lcp_array); },
+	lf_array: function (var_text, var_n, inputs) { return construct_lf_array(inputs.first_array, inputs.bw_transform); },
+	counter_bw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.bw_transform); },
+	counter_lzss_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzss_factorization); },
+	counter_lz77_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lz77_factorization); },
+	counter_lzssno_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lzssno_factorization); },
+	counter_reverse_lzss_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.reverse_lzss_factorization); },
+	circular_suffix_array: function (var_text, var_n, inputs) { return construct_circular_suffix_array(var_text, inputs.lyndon_factorization); },
+	necklace_factorization: function (var_text, var_n, inputs) { return construct_necklace_factorization(var_text, inputs.lyndon_factorization); },
+	counter_lyndon_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lyndon_factorization); },
+	lyndon_array: function (var_text, var_n, inputs) { return construct_lyndon_array(inputs.nss_array); },
+	lexparse_factorization: function (var_text, var_n, inputs) { return construct_lexparse_factorization(inputs.plcp_array); },
+	counter_delta: function (var_text, var_n, inputs) { return count_delta(inputs.substring_complexity); },
+	counter_delta_argmax: function (var_text, var_n, inputs) { return count_delta_argmax(inputs.substring_complexity); },
+	inverse_circular_suffix_array: function (var_text, var_n, inputs) { return construct_inverse_circular_suffix_array(inputs.circular_suffix_array); },
+	bbw_indices: function (var_text, var_n, inputs) { return construct_bbw_indices(inputs.lyndon_factorization, inputs.circular_suffix_array); },
+	counter_necklace_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.necklace_factorization); },
+	counter_lexparse_factorization: function (var_text, var_n, inputs) { return number_of_factors(inputs.lexparse_factorization); },
+	bbw_transform: function (var_text, var_n, inputs) { return construct_bbw_transform(var_text, inputs.bbw_indices); },
+	inverse_bbw_transform: function (var_text, var_n, inputs) { return construct_inverse_bbw_transform(inputs.bbw_transform); },
+	counter_bbw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.bbw_transform); },
+	counter_inverse_bbw_transform: function (var_text, var_n, inputs) { return number_of_runs(inputs.inverse_bbw_transform); }
+};
+// === Builder ===
+// flags: flag words from structure_flag_set; omitted to build all structures.
+// profile: optional array receiving the time, output length and heap delta of each construction.
+// cache: optional ResultCache; cached structures are reused, and their dependencies are not built.
+// on_result: optional callback receiving (name, value) of each requested structure as soon as it is ready.
+function build_ds(text, flags, profile, cache, on_result) {
+	const n = text.length;
+	// storage
+	const var_text = text;
+	const var_n = text.length;
+	var var_counter_n;
+	var var_counter_sigma;
+	var var_suffix_array;
+	var var_border_array;
+	var var_first_array;
+	var var_index_array;
+	var var_rotation_array;
+	var var_sl_string;
+	var var_lpf_array;
+	var var_lpnf_array;
+	var var_lnf_array;
+	var var_necklace_conjugate_transform;
+	var var_invert_transform;
+	var var_revert_transform;
+	var var_lz78_factorization;
+	var var_lzw_factorization;
+	var var_odd_maximal_palindromic_length_array;
+	var var_even_maximal_palindromic_length_array;
+	var var_lzend_factorization;
+	var var_gamma_factorization;
+	var var_inverse_suffix_array;
+	var var_lcp_array;
+	var var_counter_period;
+	var var_counter_exponent;
+	var var_counter_regularity;
+	var var_bw_transform;
+	var var_lzss_factorization;
+	var var_lz77_factorization;
+	var var_lzssno_factorization;
+	var var_reverse_lzss_factorization;
+	var var_counter_necklace_conjugate_transform;
+	var var_counter_invert_transform;
+	var var_counter_revert_transform;
+	var var_counter_lz78_factorization;
+	var var_counter_lzw_factorization;
+	var var_counter_lzend_factorization;
+	var var_counter_gamma_factorization;
+	var var_phi_array;
+	var var_inverse_phi_array;
+	var var_psi_array;
+	var var_lyndon_factorization;
+	var var_nss_array;
+	var var_pss_array;
+	var var_counter_lcp_array;
+	var var_plcp_array;
+	var var_substring_complexity;
+	var var_lf_array;
+	var var_counter_bw_transform;
+	var var_counter_lzss_factorization;
+	var var_counter_lz77_factorization;
+	var var_counter_lzssno_factorization;
+	var var_counter_reverse_lzss_factorization;
+	var var_circular_suffix_array;
+	var var_necklace_factorization;
+	var var_counter_lyndon_factorization;
+	var var_lyndon_array;
+	var var_lexparse_factorization;
+	var var_counter_delta;
+	var var_counter_delta_argmax;
+	var var_inverse_circular_suffix_array;
+	var var_bbw_indices;
+	var var_counter_necklace_factorization;
+	var var_counter_lexparse_factorization;
+	var var_bbw_transform;
+	var var_inverse_bbw_transform;
+	var var_counter_bbw_transform;
+	var var_counter_inverse_bbw_transform;
+	// a needed structure missing from the cache needs its direct dependencies
+	var need = flags === undefined ? [0xffffffff, 0xffffffff, 0x00000007] : flags.slice();
+	if (need[2] & (1 << 2)) {
+		if (cache) var_counter_inverse_bbw_transform = result_cache_get(cache, text, 'counter_inverse_bbw_transform');
+		if (var_counter_inverse_bbw_transform === undefined) { need[2] |= 0x00000001; }
+	}
+	if (need[2] & (1 << 1)) {
+		if (cache) var_counter_bbw_transform = result_cache_get(cache, text, 'counter_bbw_transform');
+		if (var_counter_bbw_transform === undefined) { need[1] |= 0x80000000; }
+	}
+	if (need[2] & (1 << 0)) {
+		if (cache) var_inverse_bbw_transform = result_cache_get(cache, text, 'inverse_bbw_transform');
+		if (var_inverse_bbw_transform === undefined) { need[1] |= 0x80000000; }
+	}
+	if (need[1] & (1 << 31)) {
+		if (cache) var_bbw_transform = result_cache_get(cache, text, 'bbw_transform');
+		if (var_bbw_transform === undefined) { need[1] |= 0x10000000; }
+	}
+	if (need[1] & (1 << 30)) {
+		if (cache) var_counter_lexparse_factorization = result_cache_get(cache, text, 'counter_lexparse_factorization');
+		if (var_counter_lexparse_factorization === undefined) { need[1] |= 0x01000000; }
+	}
+	if (need[1] & (1 << 29)) {
+		if (cache) var_counter_necklace_factorization = result_cache_get(cache, text, 'counter_necklace_factorization');
+		if (var_counter_necklace_factorization === undefined) { need[1] |= 0x00200000; }
+	}
+	if (need[1] & (1 << 28)) {
+		if (cache) var_bbw_indices = result_cache_get(cache, text, 'bbw_indices');
+		if (var_bbw_indices === undefined) { need[1] |= 0x00100100; }
+	}
+	if (need[1] & (1 << 27)) {
+		if (cache) var_inverse_circular_suffix_array = result_cache_get(cache, text, 'inverse_circular_suffix_array');
+		if (var_inverse_circular_suffix_array === undefined) { need[1] |= 0x00100000; }
+	}
+	if (need[1] & (1 << 26)) {
+		if (cache) var_counter_delta_argmax = result_cache_get(cache, text, 'counter_delta_argmax');
+		if (var_counter_delta_argmax === undefined) { need[1] |= 0x00002000; }
+	}
+	if (need[1] & (1 << 25)) {
+		if (cache) var_counter_delta = result_cache_get(cache, text, 'counter_delta');
+		if (var_counter_delta === undefined) { need[1] |= 0x00002000; }
+	}
+	if (need[1] & (1 << 24)) {
+		if (cache) var_lexparse_factorization = result_cache_get(cache, text, 'lexparse_factorization');
+		if (var_lexparse_factorization === undefined) { need[1] |= 0x00001000; }
+	}
+	if (need[1] & (1 << 23)) {
+		if (cache) var_lyndon_array = result_cache_get(cache, text, 'lyndon_array');
+		if (var_lyndon_array === undefined) { need[1] |= 0x00000200; }
+	}
+	if (need[1] & (1 << 22)) {
+		if (cache) var_counter_lyndon_factorization = result_cache_get(cache, text, 'counter_lyndon_factorization');
+		if (var_counter_lyndon_factorization === undefined) { need[1] |= 0x00000100; }
+	}
+	if (need[1] & (1 << 21)) {
+		if (cache) var_necklace_factorization = result_cache_get(cache, text, 'necklace_factorization');
+		if (var_necklace_factorization === undefined) { need[1] |= 0x00000100; }
+	}
+	if (need[1] & (1 << 20)) {
+		if (cache) var_circular_suffix_array = result_cache_get(cache, text, 'circular_suffix_array');
+		if (var_circular_suffix_array === undefined) { need[1] |= 0x00000100; }
+	}
+	if (need[1] & (1 << 19)) {
+		if (cache) var_counter_reverse_lzss_factorization = result_cache_get(cache, text, 'counter_reverse_lzss_factorization');
+		if (var_counter_reverse_lzss_factorization === undefined) { need[0] |= 0x20000000; }
+	}
+	if (need[1] & (1 << 18)) {
+		if (cache) var_counter_lzssno_factorization = result_cache_get(cache, text, 'counter_lzssno_factorization');
+		if (var_counter_lzssno_factorization === undefined) { need[0] |= 0x10000000; }
+	}
+	if (need[1] & (1 << 17)) {
+		if (cache) var_counter_lz77_factorization = result_cache_get(cache, text, 'counter_lz77_factorization');
+		if (var_counter_lz77_factorization === undefined) { need[0] |= 0x08000000; }
+	}
+	if (need[1] & (1 << 16)) {
+		if (cache) var_counter_lzss_factorization = result_cache_get(cache, text, 'counter_lzss_factorization');
+		if (var_counter_lzss_factorization === undefined) { need[0] |= 0x04000000; }
+	}
+	if (need[1] & (1 << 15)) {
+		if (cache) var_counter_bw_transform = result_cache_get(cache, text, 'counter_bw_transform');
+		if (var_counter_bw_transform === undefined) { need[0] |= 0x02000000; }
+	}
+	if (need[1] & (1 << 14)) {
+		if (cache) var_lf_array = result_cache_get(cache, text, 'lf_array');
+		if (var_lf_array === undefined) { need[0] |= 0x02000010; }
+	}
+	if (need[1] & (1 << 13)) {
+		if (cache) var_substring_complexity = result_cache_get(cache, text, 'substring_complexity');
+		if (var_substring_complexity === undefined) { need[0] |= 0x00200000; }
+	}
+	if (need[1] & (1 << 12)) {
+		if (cache) var_plcp_array = result_cache_get(cache, text, 'plcp_array');
+		if (var_plcp_array === undefined) { need[0] |= 0x00300000; }
+	}
+	if (need[1] & (1 << 11)) {
+		if (cache) var_counter_lcp_array = result_cache_get(cache, text, 'counter_lcp_array');
+		if (var_counter_lcp_array === undefined) { need[0] |= 0x00200000; }
+	}
+	if (need[1] & (1 << 10)) {
+		if (cache) var_pss_array = result_cache_get(cache, text, 'pss_array');
+		if (var_pss_array === undefined) { need[0] |= 0x00100000; }
+	}
+	if (need[1] & (1 << 9)) {
+		if (cache) var_nss_array = result_cache_get(cache, text, 'nss_array');
+		if (var_nss_array === undefined) { need[0] |= 0x00100000; }
+	}
+	if (need[1] & (1 << 8)) {
+		if (cache) var_lyndon_factorization = result_cache_get(cache, text, 'lyndon_factorization');
+		if (var_lyndon_factorization === undefined) { need[0] |= 0x00100000; }
+	}
+	if (need[1] & (1 << 7)) {
+		if (cache) var_psi_array = result_cache_get(cache, text, 'psi_array');
+		if (var_psi_array === undefined) { need[0] |= 0x00100004; }
+	}
+	if (need[1] & (1 << 6)) {
+		if (cache) var_inverse_phi_array = result_cache_get(cache, text, 'inverse_phi_array');
+		if (var_inverse_phi_array === undefined) { need[0] |= 0x00100004; }
+	}
+	if (need[1] & (1 << 5)) {
+		if (cache) var_phi_array = result_cache_get(cache, text, 'phi_array');
+		if (var_phi_array === undefined) { need[0] |= 0x00100004; }
+	}
+	if (need[1] & (1 << 4)) {
+		if (cache) var_counter_gamma_factorization = result_cache_get(cache, text, 'counter_gamma_factorization');
+		if (var_counter_gamma_factorization === undefined) { need[0] |= 0x00080000; }
+	}
+	if (need[1] & (1 << 3)) {
+		if (cache) var_counter_lzend_factorization = result_cache_get(cache, text, 'counter_lzend_factorization');
+		if (var_counter_lzend_factorization === undefined) { need[0] |= 0x00040000; }
+	}
+	if (need[1] & (1 << 2)) {
+		if (cache) var_counter_lzw_factorization = result_cache_get(cache, text, 'counter_lzw_factorization');
+		if (var_counter_lzw_factorization === undefined) { need[0] |= 0x00008000; }
+	}
+	if (need[1] & (1 << 1)) {
+		if (cache) var_counter_lz78_factorization = result_cache_get(cache, text, 'counter_lz78_factorization');
+		if (var_counter_lz78_factorization === undefined) { need[0] |= 0x00004000; }
+	}
+	if (need[1] & (1 << 0)) {
+		if (cache) var_counter_revert_transform = result_cache_get(cache, text, 'counter_revert_transform');
+		if (var_counter_revert_transform === undefined) { need[0] |= 0x00002000; }
+	}
+	if (need[0] & (1 << 31)) {
+		if (cache) var_counter_invert_transform = result_cache_get(cache, text, 'counter_invert_transform');
+		if (var_counter_invert_transform === undefined) { need[0] |= 0x00001000; }
+	}
+	if (need[0] & (1 << 30)) {
+		if (cache) var_counter_necklace_conjugate_transform = result_cache_get(cache, text, 'counter_necklace_conjugate_transform');
+		if (var_counter_necklace_conjugate_transform === undefined) { need[0] |= 0x00000800; }
+	}
+	if (need[0] & (1 << 29)) {
+		if (cache) var_reverse_lzss_factorization = result_cache_get(cache, text, 'reverse_lzss_factorization');
+		if (var_reverse_lzss_factorization === undefined) { need[0] |= 0x00000400; }
+	}
+	if (need[0] & (1 << 28)) {
+		if (cache) var_lzssno_factorization = result_cache_get(cache, text, 'lzssno_factorization');
+		if (var_lzssno_factorization === undefined) { need[0] |= 0x00000200; }
+	}
+	if (need[0] & (1 << 27)) {
+		if (cache) var_lz77_factorization = result_cache_get(cache, text, 'lz77_factorization');
+		if (var_lz77_factorization === undefined) { need[0] |= 0x00000100; }
+	}
+	if (need[0] & (1 << 26)) {
+		if (cache) var_lzss_factorization = result_cache_get(cache, text, 'lzss_factorization');
+		if (var_lzss_factorization === undefined) { need[0] |= 0x00000100; }
+	}
+	if (need[0] & (1 << 25)) {
+		if (cache) var_bw_transform = result_cache_get(cache, text, 'bw_transform');
+		if (var_bw_transform === undefined) { need[0] |= 0x00000040; }
+	}
+	if (need[0] & (1 << 24)) {
+		if (cache) var_counter_regularity = result_cache_get(cache, text, 'counter_regularity');
+		if (var_counter_regularity === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 23)) {
+		if (cache) var_counter_exponent = result_cache_get(cache, text, 'counter_exponent');
+		if (var_counter_exponent === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 22)) {
+		if (cache) var_counter_period = result_cache_get(cache, text, 'counter_period');
+		if (var_counter_period === undefined) { need[0] |= 0x00000008; }
+	}
+	if (need[0] & (1 << 21)) {
+		if (cache) var_lcp_array = result_cache_get(cache, text, 'lcp_array');
+		if (var_lcp_array === undefined) { need[0] |= 0x00000004; }
+	}
+	if (need[0] & (1 << 20)) {
+		if (cache) var_inverse_suffix_array = result_cache_get(cache, text, 'inverse_suffix_array');
+		if (var_inverse_suffix_array === undefined) { need[0] |= 0x00000004; }
+	}
+	if (need[0] & (1 << 19)) {
+		if (cache) var_gamma_factorization = result_cache_get(cache, text, 'gamma_factorization');
+	}
+	if (need[0] & (1 << 18)) {
+		if (cache) var_lzend_factorization = result_cache_get(cache, text, 'lzend_factorization');
+	}
+	if (need[0] & (1 << 17)) {
+		if (cache) var_even_maximal_palindromic_length_array = result_cache_get(cache, text, 'even_maximal_palindromic_length_array');
+	}
+	if (need[0] & (1 << 16)) {
+		if (cache) var_odd_maximal_palindromic_length_array = result_cache_get(cache, text, 'odd_maximal_palindromic_length_array');
+	}
+	if (need[0] & (1 << 15)) {
+		if (cache) var_lzw_factorization = result_cache_get(cache, text, 'lzw_factorization');
+	}
+	if (need[0] & (1 << 14)) {
+		if (cache) var_lz78_factorization = result_cache_get(cache, text, 'lz78_factorization');
+	}
+	if (need[0] & (1 << 13)) {
+		if (cache) var_revert_transform = result_cache_get(cache, text, 'revert_transform');
+	}
+	if (need[0] & (1 << 12)) {
+		if (cache) var_invert_transform = result_cache_get(cache, text, 'invert_transform');
+	}
+	if (need[0] & (1 << 11)) {
+		if (cache) var_necklace_conjugate_transform = result_cache_get(cache, text, 'necklace_conjugate_transform');
+	}
+	if (need[0] & (1 << 10)) {
+		if (cache) var_lnf_array = result_cache_get(cache, text, 'lnf_array');
+	}
+	if (need[0] & (1 << 9)) {
+		if (cache) var_lpnf_array = result_cache_get(cache, text, 'lpnf_array');
+	}
+	if (need[0] & (1 << 8)) {
+		if (cache) var_lpf_array = result_cache_get(cache, text, 'lpf_array');
+	}
+	if (need[0] & (1 << 7)) {
+		if (cache) var_sl_string = result_cache_get(cache, text, 'sl_string');
+	}
+	if (need[0] & (1 << 6)) {
+		if (cache) var_rotation_array = result_cache_get(cache, text, 'rotation_array');
+	}
+	if (need[0] & (1 << 5)) {
+		if (cache) var_index_array = result_cache_get(cache, text, 'index_array');
+	}
+	if (need[0] & (1 << 4)) {
+		if (cache) var_first_array = result_cache_get(cache, text, 'first_array');
+	}
+	if (need[0] & (1 << 3)) {
+		if (cache) var_border_array = result_cache_get(cache, text, 'border_array');
+	}
+	if (need[0] & (1 << 2)) {
+		if (cache) var_suffix_array = result_cache_get(cache, text, 'suffix_array');
+	}
+	if (need[0] & (1 << 1)) {
+		if (cache) var_counter_sigma = result_cache_get(cache, text, 'counter_sigma');
+	}
+	if (need[0] & (1 << 0)) {
+		if (cache) var_counter_n = result_cache_get(cache, text, 'counter_n');
+	}
+	// construction
+	var requested = flags === undefined ? need : flags;
+	var result = { counter_text: number_of_runs(var_text) };
+	if (on_result) on_result('counter_text', result.counter_text);
+	var start_time = 0, start_heap = 0;
+	if (need[0] & (1 << 0)) {
+		if (var_counter_n === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_n = count_n(var_text);
+			if (profile) profile_record(profile, 'counter_n', var_counter_n, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_n', var_counter_n);
+		}
+		if (requested[0] & (1 << 0)) {
+			result.counter_n = var_counter_n;
+			if (on_result) on_result('counter_n', var_counter_n);
+		}
+	}
+	if (need[0] & (1 << 1)) {
+		if (var_counter_sigma === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_sigma = count_sigma(var_text);
+			if (profile) profile_record(profile, 'counter_sigma', var_counter_sigma, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_sigma', var_counter_sigma);
+		}
+		if (requested[0] & (1 << 1)) {
+			result.counter_sigma = var_counter_sigma;
+			if (on_result) on_result('counter_sigma', var_counter_sigma);
+		}
+	}
+	if (need[0] & (1 << 2)) {
+		if (var_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_suffix_array = construct_suffix_array(var_text);
+			if (profile) profile_record(profile, 'suffix_array', var_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'suffix_array', var_suffix_array);
+		}
+		if (requested[0] & (1 << 2)) {
+			result.suffix_array = var_suffix_array;
+			if (on_result) on_result('suffix_array', var_suffix_array);
+		}
+	}
+	if (need[0] & (1 << 3)) {
+		if (var_border_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_border_array = construct_border_array(var_text);
+			if (profile) profile_record(profile, 'border_array', var_border_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'border_array', var_border_array);
+		}
+		if (requested[0] & (1 << 3)) {
+			result.border_array = var_border_array;
+			if (on_result) on_result('border_array', var_border_array);
+		}
+	}
+	if (need[0] & (1 << 4)) {
+		if (var_first_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_first_array = construct_first_array(var_text);
+			if (profile) profile_record(profile, 'first_array', var_first_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'first_array', var_first_array);
+		}
+		if (requested[0] & (1 << 4)) {
+			result.first_array = var_first_array;
+			if (on_result) on_result('first_array', var_first_array);
+		}
+	}
+	if (need[0] & (1 << 5)) {
+		if (var_index_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_index_array = construct_index_array(var_n);
+			if (profile) profile_record(profile, 'index_array', var_index_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'index_array', var_index_array);
+		}
+		if (requested[0] & (1 << 5)) {
+			result.index_array = var_index_array;
+			if (on_result) on_result('index_array', var_index_array);
+		}
+	}
+	if (need[0] & (1 << 6)) {
+		if (var_rotation_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_rotation_array = construct_rotation_array(var_text);
+			if (profile) profile_record(profile, 'rotation_array', var_rotation_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'rotation_array', var_rotation_array);
+		}
+		if (requested[0] & (1 << 6)) {
+			result.rotation_array = var_rotation_array;
+			if (on_result) on_result('rotation_array', var_rotation_array);
+		}
+	}
+	if (need[0] & (1 << 7)) {
+		if (var_sl_string === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_sl_string = construct_sl_string(var_text);
+			if (profile) profile_record(profile, 'sl_string', var_sl_string, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'sl_string', var_sl_string);
+		}
+		if (requested[0] & (1 << 7)) {
+			result.sl_string = var_sl_string;
+			if (on_result) on_result('sl_string', var_sl_string);
+		}
+	}
+	if (need[0] & (1 << 8)) {
+		if (var_lpf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lpf_array = construct_lpf_array(var_text);
+			if (profile) profile_record(profile, 'lpf_array', var_lpf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lpf_array', var_lpf_array);
+		}
+		if (requested[0] & (1 << 8)) {
+			result.lpf_array = var_lpf_array;
+			if (on_result) on_result('lpf_array', var_lpf_array);
+		}
+	}
+	if (need[0] & (1 << 9)) {
+		if (var_lpnf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lpnf_array = construct_lpnf_array(var_text);
+			if (profile) profile_record(profile, 'lpnf_array', var_lpnf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lpnf_array', var_lpnf_array);
+		}
+		if (requested[0] & (1 << 9)) {
+			result.lpnf_array = var_lpnf_array;
+			if (on_result) on_result('lpnf_array', var_lpnf_array);
+		}
+	}
+	if (need[0] & (1 << 10)) {
+		if (var_lnf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lnf_array = construct_lnf_array(var_text);
+			if (profile) profile_record(profile, 'lnf_array', var_lnf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lnf_array', var_lnf_array);
+		}
+		if (requested[0] & (1 << 10)) {
+			result.lnf_array = var_lnf_array;
+			if (on_result) on_result('lnf_array', var_lnf_array);
+		}
+	}
+	if (need[0] & (1 << 11)) {
+		if (var_necklace_conjugate_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_necklace_conjugate_transform = construct_necklace_conjugate_transform(var_text);
+			if (profile) profile_record(profile, 'necklace_conjugate_transform', var_necklace_conjugate_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'necklace_conjugate_transform', var_necklace_conjugate_transform);
+		}
+		if (requested[0] & (1 << 11)) {
+			result.necklace_conjugate_transform = var_necklace_conjugate_transform;
+			if (on_result) on_result('necklace_conjugate_transform', var_necklace_conjugate_transform);
+		}
+	}
+	if (need[0] & (1 << 12)) {
+		if (var_invert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_invert_transform = construct_invert_transform(var_text);
+			if (profile) profile_record(profile, 'invert_transform', var_invert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'invert_transform', var_invert_transform);
+		}
+		if (requested[0] & (1 << 12)) {
+			result.invert_transform = var_invert_transform;
+			if (on_result) on_result('invert_transform', var_invert_transform);
+		}
+	}
+	if (need[0] & (1 << 13)) {
+		if (var_revert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_revert_transform = construct_revert_transform(var_text);
+			if (profile) profile_record(profile, 'revert_transform', var_revert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'revert_transform', var_revert_transform);
+		}
+		if (requested[0] & (1 << 13)) {
+			result.revert_transform = var_revert_transform;
+			if (on_result) on_result('revert_transform', var_revert_transform);
+		}
+	}
+	if (need[0] & (1 << 14)) {
+		if (var_lz78_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lz78_factorization = construct_lz78_factorization(var_text);
+			if (profile) profile_record(profile, 'lz78_factorization', var_lz78_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lz78_factorization', var_lz78_factorization);
+		}
+		if (requested[0] & (1 << 14)) {
+			result.lz78_factorization = var_lz78_factorization;
+			if (on_result) on_result('lz78_factorization', var_lz78_factorization);
+		}
+	}
+	if (need[0] & (1 << 15)) {
+		if (var_lzw_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzw_factorization = construct_lzw_factorization(var_text);
+			if (profile) profile_record(profile, 'lzw_factorization', var_lzw_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzw_factorization', var_lzw_factorization);
+		}
+		if (requested[0] & (1 << 15)) {
+			result.lzw_factorization = var_lzw_factorization;
+			if (on_result) on_result('lzw_factorization', var_lzw_factorization);
+		}
+	}
+	if (need[0] & (1 << 16)) {
+		if (var_odd_maximal_palindromic_length_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_odd_maximal_palindromic_length_array = construct_odd_maximal_palindromic_length_array(var_text);
+			if (profile) profile_record(profile, 'odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array);
+		}
+		if (requested[0] & (1 << 16)) {
+			result.odd_maximal_palindromic_length_array = var_odd_maximal_palindromic_length_array;
+			if (on_result) on_result('odd_maximal_palindromic_length_array', var_odd_maximal_palindromic_length_array);
+		}
+	}
+	if (need[0] & (1 << 17)) {
+		if (var_even_maximal_palindromic_length_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_even_maximal_palindromic_length_array = construct_even_maximal_palindromic_length_array(var_text);
+			if (profile) profile_record(profile, 'even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array);
+		}
+		if (requested[0] & (1 << 17)) {
+			result.even_maximal_palindromic_length_array = var_even_maximal_palindromic_length_array;
+			if (on_result) on_result('even_maximal_palindromic_length_array', var_even_maximal_palindromic_length_array);
+		}
+	}
+	if (need[0] & (1 << 18)) {
+		if (var_lzend_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzend_factorization = construct_lzend_factorization(var_text);
+			if (profile) profile_record(profile, 'lzend_factorization', var_lzend_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzend_factorization', var_lzend_factorization);
+		}
+		if (requested[0] & (1 << 18)) {
+			result.lzend_factorization = var_lzend_factorization;
+			if (on_result) on_result('lzend_factorization', var_lzend_factorization);
+		}
+	}
+	if (need[0] & (1 << 19)) {
+		if (var_gamma_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_gamma_factorization = construct_gamma_factorization(var_text);
+			if (profile) profile_record(profile, 'gamma_factorization', var_gamma_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'gamma_factorization', var_gamma_factorization);
+		}
+		if (requested[0] & (1 << 19)) {
+			result.gamma_factorization = var_gamma_factorization;
+			if (on_result) on_result('gamma_factorization', var_gamma_factorization);
+		}
+	}
+	if (need[0] & (1 << 20)) {
+		if (var_inverse_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_suffix_array = construct_inverse_suffix_array(var_suffix_array);
+			if (profile) profile_record(profile, 'inverse_suffix_array', var_inverse_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_suffix_array', var_inverse_suffix_array);
+		}
+		if (requested[0] & (1 << 20)) {
+			result.inverse_suffix_array = var_inverse_suffix_array;
+			if (on_result) on_result('inverse_suffix_array', var_inverse_suffix_array);
+		}
+		if (!((need[1] & (1 << 5)) || (need[1] & (1 << 6)) || (need[0] & (1 << 21)) || (need[1] & (1 << 7)))) var_suffix_array = undefined;
+	}
+	if (need[0] & (1 << 21)) {
+		if (var_lcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lcp_array = construct_lcp_array(var_text, var_suffix_array);
+			if (profile) profile_record(profile, 'lcp_array', var_lcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lcp_array', var_lcp_array);
+		}
+		if (requested[0] & (1 << 21)) {
+			result.lcp_array = var_lcp_array;
+			if (on_result) on_result('lcp_array', var_lcp_array);
+		}
+		if (!((need[1] & (1 << 5)) || (need[1] & (1 << 6)) || (need[1] & (1 << 7)))) var_suffix_array = undefined;
+	}
+	if (need[0] & (1 << 22)) {
+		if (var_counter_period === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_period = count_period(var_border_array);
+			if (profile) profile_record(profile, 'counter_period', var_counter_period, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_period', var_counter_period);
+		}
+		if (requested[0] & (1 << 22)) {
+			result.counter_period = var_counter_period;
+			if (on_result) on_result('counter_period', var_counter_period);
+		}
+		if (!((need[0] & (1 << 23)) || (need[0] & (1 << 24)))) var_border_array = undefined;
+	}
+	if (need[0] & (1 << 23)) {
+		if (var_counter_exponent === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_exponent = count_exponent(var_border_array);
+			if (profile) profile_record(profile, 'counter_exponent', var_counter_exponent, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_exponent', var_counter_exponent);
+		}
+		if (requested[0] & (1 << 23)) {
+			result.counter_exponent = var_counter_exponent;
+			if (on_result) on_result('counter_exponent', var_counter_exponent);
+		}
+		if (!((need[0] & (1 << 24)))) var_border_array = undefined;
+	}
+	if (need[0] & (1 << 24)) {
+		if (var_counter_regularity === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_regularity = count_regularity(var_border_array);
+			if (profile) profile_record(profile, 'counter_regularity', var_counter_regularity, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_regularity', var_counter_regularity);
+		}
+		if (requested[0] & (1 << 24)) {
+			result.counter_regularity = var_counter_regularity;
+			if (on_result) on_result('counter_regularity', var_counter_regularity);
+		}
+		var_border_array = undefined;
+	}
+	if (need[0] & (1 << 25)) {
+		if (var_bw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bw_transform = construct_bw_transform(var_text, var_rotation_array);
+			if (profile) profile_record(profile, 'bw_transform', var_bw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bw_transform', var_bw_transform);
+		}
+		if (requested[0] & (1 << 25)) {
+			result.bw_transform = var_bw_transform;
+			if (on_result) on_result('bw_transform', var_bw_transform);
+		}
+		var_rotation_array = undefined;
+	}
+	if (need[0] & (1 << 26)) {
+		if (var_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzss_factorization = construct_lzss_factorization(var_lpf_array);
+			if (profile) profile_record(profile, 'lzss_factorization', var_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzss_factorization', var_lzss_factorization);
+		}
+		if (requested[0] & (1 << 26)) {
+			result.lzss_factorization = var_lzss_factorization;
+			if (on_result) on_result('lzss_factorization', var_lzss_factorization);
+		}
+		if (!((need[0] & (1 << 27)))) var_lpf_array = undefined;
+	}
+	if (need[0] & (1 << 27)) {
+		if (var_lz77_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lz77_factorization = construct_lz77_factorization(var_lpf_array);
+			if (profile) profile_record(profile, 'lz77_factorization', var_lz77_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lz77_factorization', var_lz77_factorization);
+		}
+		if (requested[0] & (1 << 27)) {
+			result.lz77_factorization = var_lz77_factorization;
+			if (on_result) on_result('lz77_factorization', var_lz77_factorization);
+		}
+		var_lpf_array = undefined;
+	}
+	if (need[0] & (1 << 28)) {
+		if (var_lzssno_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lzssno_factorization = construct_lzssno_factorization(var_lpnf_array);
+			if (profile) profile_record(profile, 'lzssno_factorization', var_lzssno_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lzssno_factorization', var_lzssno_factorization);
+		}
+		if (requested[0] & (1 << 28)) {
+			result.lzssno_factorization = var_lzssno_factorization;
+			if (on_result) on_result('lzssno_factorization', var_lzssno_factorization);
+		}
+		var_lpnf_array = undefined;
+	}
+	if (need[0] & (1 << 29)) {
+		if (var_reverse_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_reverse_lzss_factorization = construct_reverse_lzss_factorization(var_lnf_array);
+			if (profile) profile_record(profile, 'reverse_lzss_factorization', var_reverse_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'reverse_lzss_factorization', var_reverse_lzss_factorization);
+		}
+		if (requested[0] & (1 << 29)) {
+			result.reverse_lzss_factorization = var_reverse_lzss_factorization;
+			if (on_result) on_result('reverse_lzss_factorization', var_reverse_lzss_factorization);
+		}
+		var_lnf_array = undefined;
+	}
+	if (need[0] & (1 << 30)) {
+		if (var_counter_necklace_conjugate_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_necklace_conjugate_transform = number_of_runs(var_necklace_conjugate_transform);
+			if (profile) profile_record(profile, 'counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform);
+		}
+		if (requested[0] & (1 << 30)) {
+			result.counter_necklace_conjugate_transform = var_counter_necklace_conjugate_transform;
+			if (on_result) on_result('counter_necklace_conjugate_transform', var_counter_necklace_conjugate_transform);
+		}
+		var_necklace_conjugate_transform = undefined;
+	}
+	if (need[0] & (1 << 31)) {
+		if (var_counter_invert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_invert_transform = number_of_runs(var_invert_transform);
+			if (profile) profile_record(profile, 'counter_invert_transform', var_counter_invert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_invert_transform', var_counter_invert_transform);
+		}
+		if (requested[0] & (1 << 31)) {
+			result.counter_invert_transform = var_counter_invert_transform;
+			if (on_result) on_result('counter_invert_transform', var_counter_invert_transform);
+		}
+		var_invert_transform = undefined;
+	}
+	if (need[1] & (1 << 0)) {
+		if (var_counter_revert_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_revert_transform = number_of_runs(var_revert_transform);
+			if (profile) profile_record(profile, 'counter_revert_transform', var_counter_revert_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_revert_transform', var_counter_revert_transform);
+		}
+		if (requested[1] & (1 << 0)) {
+			result.counter_revert_transform = var_counter_revert_transform;
+			if (on_result) on_result('counter_revert_transform', var_counter_revert_transform);
+		}
+		var_revert_transform = undefined;
+	}
+	if (need[1] & (1 << 1)) {
+		if (var_counter_lz78_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lz78_factorization = number_of_factors(var_lz78_factorization);
+			if (profile) profile_record(profile, 'counter_lz78_factorization', var_counter_lz78_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lz78_factorization', var_counter_lz78_factorization);
+		}
+		if (requested[1] & (1 << 1)) {
+			result.counter_lz78_factorization = var_counter_lz78_factorization;
+			if (on_result) on_result('counter_lz78_factorization', var_counter_lz78_factorization);
+		}
+		var_lz78_factorization = undefined;
+	}
+	if (need[1] & (1 << 2)) {
+		if (var_counter_lzw_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzw_factorization = number_of_factors(var_lzw_factorization);
+			if (profile) profile_record(profile, 'counter_lzw_factorization', var_counter_lzw_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzw_factorization', var_counter_lzw_factorization);
+		}
+		if (requested[1] & (1 << 2)) {
+			result.counter_lzw_factorization = var_counter_lzw_factorization;
+			if (on_result) on_result('counter_lzw_factorization', var_counter_lzw_factorization);
+		}
+		var_lzw_factorization = undefined;
+	}
+	if (need[1] & (1 << 3)) {
+		if (var_counter_lzend_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzend_factorization = number_of_factors(var_lzend_factorization);
+			if (profile) profile_record(profile, 'counter_lzend_factorization', var_counter_lzend_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzend_factorization', var_counter_lzend_factorization);
+		}
+		if (requested[1] & (1 << 3)) {
+			result.counter_lzend_factorization = var_counter_lzend_factorization;
+			if (on_result) on_result('counter_lzend_factorization', var_counter_lzend_factorization);
+		}
+		var_lzend_factorization = undefined;
+	}
+	if (need[1] & (1 << 4)) {
+		if (var_counter_gamma_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_gamma_factorization = number_of_factors(var_gamma_factorization);
+			if (profile) profile_record(profile, 'counter_gamma_factorization', var_counter_gamma_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_gamma_factorization', var_counter_gamma_factorization);
+		}
+		if (requested[1] & (1 << 4)) {
+			result.counter_gamma_factorization = var_counter_gamma_factorization;
+			if (on_result) on_result('counter_gamma_factorization', var_counter_gamma_factorization);
+		}
+		var_gamma_factorization = undefined;
+	}
+	if (need[1] & (1 << 5)) {
+		if (var_phi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_phi_array = construct_phi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'phi_array', var_phi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'phi_array', var_phi_array);
+		}
+		if (requested[1] & (1 << 5)) {
+			result.phi_array = var_phi_array;
+			if (on_result) on_result('phi_array', var_phi_array);
+		}
+		if (!((need[1] & (1 << 6)) || (need[1] & (1 << 7)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 6)) || (need[1] & (1 << 12)) || (need[1] & (1 << 7)) || (need[1] & (1 << 8)) || (need[1] & (1 << 9)) || (need[1] & (1 << 10)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 6)) {
+		if (var_inverse_phi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_phi_array = construct_inverse_phi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'inverse_phi_array', var_inverse_phi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_phi_array', var_inverse_phi_array);
+		}
+		if (requested[1] & (1 << 6)) {
+			result.inverse_phi_array = var_inverse_phi_array;
+			if (on_result) on_result('inverse_phi_array', var_inverse_phi_array);
+		}
+		if (!((need[1] & (1 << 7)))) var_suffix_array = undefined;
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 7)) || (need[1] & (1 << 8)) || (need[1] & (1 << 9)) || (need[1] & (1 << 10)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 7)) {
+		if (var_psi_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_psi_array = construct_psi_array(var_suffix_array, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'psi_array', var_psi_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'psi_array', var_psi_array);
+		}
+		if (requested[1] & (1 << 7)) {
+			result.psi_array = var_psi_array;
+			if (on_result) on_result('psi_array', var_psi_array);
+		}
+		var_suffix_array = undefined;
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 8)) || (need[1] & (1 << 9)) || (need[1] & (1 << 10)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 8)) {
+		if (var_lyndon_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lyndon_factorization = construct_lyndon_factorization(var_text, var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'lyndon_factorization', var_lyndon_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lyndon_factorization', var_lyndon_factorization);
+		}
+		if (requested[1] & (1 << 8)) {
+			result.lyndon_factorization = var_lyndon_factorization;
+			if (on_result) on_result('lyndon_factorization', var_lyndon_factorization);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 9)) || (need[1] & (1 << 10)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 9)) {
+		if (var_nss_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_nss_array = construct_nss_array(var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'nss_array', var_nss_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'nss_array', var_nss_array);
+		}
+		if (requested[1] & (1 << 9)) {
+			result.nss_array = var_nss_array;
+			if (on_result) on_result('nss_array', var_nss_array);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 10)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 10)) {
+		if (var_pss_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_pss_array = construct_pss_array(var_inverse_suffix_array);
+			if (profile) profile_record(profile, 'pss_array', var_pss_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'pss_array', var_pss_array);
+		}
+		if (requested[1] & (1 << 10)) {
+			result.pss_array = var_pss_array;
+			if (on_result) on_result('pss_array', var_pss_array);
+		}
+		if (!((need[1] & (1 << 12)))) var_inverse_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 11)) {
+		if (var_counter_lcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lcp_array = count_lcp_array(var_lcp_array);
+			if (profile) profile_record(profile, 'counter_lcp_array', var_counter_lcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lcp_array', var_counter_lcp_array);
+		}
+		if (requested[1] & (1 << 11)) {
+			result.counter_lcp_array = var_counter_lcp_array;
+			if (on_result) on_result('counter_lcp_array', var_counter_lcp_array);
+		}
+		if (!((need[1] & (1 << 12)) || (need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 12)) {
+		if (var_plcp_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_plcp_array = construct_plcp_array(var_inverse_suffix_array, var_lcp_array);
+			if (profile) profile_record(profile, 'plcp_array', var_plcp_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'plcp_array', var_plcp_array);
+		}
+		if (requested[1] & (1 << 12)) {
+			result.plcp_array = var_plcp_array;
+			if (on_result) on_result('plcp_array', var_plcp_array);
+		}
+		var_inverse_suffix_array = undefined;
+		if (!((need[1] & (1 << 13)))) var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 13)) {
+		if (var_substring_complexity === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_substring_complexity = construct_substring_complexity(var_lcp_array);
+			if (profile) profile_record(profile, 'substring_complexity', var_substring_complexity, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'substring_complexity', var_substring_complexity);
+		}
+		if (requested[1] & (1 << 13)) {
+			result.substring_complexity = var_substring_complexity;
+			if (on_result) on_result('substring_complexity', var_substring_complexity);
+		}
+		var_lcp_array = undefined;
+	}
+	if (need[1] & (1 << 14)) {
+		if (var_lf_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lf_array = construct_lf_array(var_first_array, var_bw_transform);
+			if (profile) profile_record(profile, 'lf_array', var_lf_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lf_array', var_lf_array);
+		}
+		if (requested[1] & (1 << 14)) {
+			result.lf_array = var_lf_array;
+			if (on_result) on_result('lf_array', var_lf_array);
+		}
+		var_first_array = undefined;
+		if (!((need[1] & (1 << 15)))) var_bw_transform = undefined;
+	}
+	if (need[1] & (1 << 15)) {
+		if (var_counter_bw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_bw_transform = number_of_runs(var_bw_transform);
+			if (profile) profile_record(profile, 'counter_bw_transform', var_counter_bw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_bw_transform', var_counter_bw_transform);
+		}
+		if (requested[1] & (1 << 15)) {
+			result.counter_bw_transform = var_counter_bw_transform;
+			if (on_result) on_result('counter_bw_transform', var_counter_bw_transform);
+		}
+		var_bw_transform = undefined;
+	}
+	if (need[1] & (1 << 16)) {
+		if (var_counter_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzss_factorization = number_of_factors(var_lzss_factorization);
+			if (profile) profile_record(profile, 'counter_lzss_factorization', var_counter_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzss_factorization', var_counter_lzss_factorization);
+		}
+		if (requested[1] & (1 << 16)) {
+			result.counter_lzss_factorization = var_counter_lzss_factorization;
+			if (on_result) on_result('counter_lzss_factorization', var_counter_lzss_factorization);
+		}
+		var_lzss_factorization = undefined;
+	}
+	if (need[1] & (1 << 17)) {
+		if (var_counter_lz77_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lz77_factorization = number_of_factors(var_lz77_factorization);
+			if (profile) profile_record(profile, 'counter_lz77_factorization', var_counter_lz77_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lz77_factorization', var_counter_lz77_factorization);
+		}
+		if (requested[1] & (1 << 17)) {
+			result.counter_lz77_factorization = var_counter_lz77_factorization;
+			if (on_result) on_result('counter_lz77_factorization', var_counter_lz77_factorization);
+		}
+		var_lz77_factorization = undefined;
+	}
+	if (need[1] & (1 << 18)) {
+		if (var_counter_lzssno_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lzssno_factorization = number_of_factors(var_lzssno_factorization);
+			if (profile) profile_record(profile, 'counter_lzssno_factorization', var_counter_lzssno_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lzssno_factorization', var_counter_lzssno_factorization);
+		}
+		if (requested[1] & (1 << 18)) {
+			result.counter_lzssno_factorization = var_counter_lzssno_factorization;
+			if (on_result) on_result('counter_lzssno_factorization', var_counter_lzssno_factorization);
+		}
+		var_lzssno_factorization = undefined;
+	}
+	if (need[1] & (1 << 19)) {
+		if (var_counter_reverse_lzss_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_reverse_lzss_factorization = number_of_factors(var_reverse_lzss_factorization);
+			if (profile) profile_record(profile, 'counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization);
+		}
+		if (requested[1] & (1 << 19)) {
+			result.counter_reverse_lzss_factorization = var_counter_reverse_lzss_factorization;
+			if (on_result) on_result('counter_reverse_lzss_factorization', var_counter_reverse_lzss_factorization);
+		}
+		var_reverse_lzss_factorization = undefined;
+	}
+	if (need[1] & (1 << 20)) {
+		if (var_circular_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_circular_suffix_array = construct_circular_suffix_array(var_text, var_lyndon_factorization);
+			if (profile) profile_record(profile, 'circular_suffix_array', var_circular_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'circular_suffix_array', var_circular_suffix_array);
+		}
+		if (requested[1] & (1 << 20)) {
+			result.circular_suffix_array = var_circular_suffix_array;
+			if (on_result) on_result('circular_suffix_array', var_circular_suffix_array);
+		}
+		if (!((need[1] & (1 << 28)) || (need[1] & (1 << 21)) || (need[1] & (1 << 22)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 21)) {
+		if (var_necklace_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_necklace_factorization = construct_necklace_factorization(var_text, var_lyndon_factorization);
+			if (profile) profile_record(profile, 'necklace_factorization', var_necklace_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'necklace_factorization', var_necklace_factorization);
+		}
+		if (requested[1] & (1 << 21)) {
+			result.necklace_factorization = var_necklace_factorization;
+			if (on_result) on_result('necklace_factorization', var_necklace_factorization);
+		}
+		if (!((need[1] & (1 << 28)) || (need[1] & (1 << 22)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 22)) {
+		if (var_counter_lyndon_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lyndon_factorization = number_of_factors(var_lyndon_factorization);
+			if (profile) profile_record(profile, 'counter_lyndon_factorization', var_counter_lyndon_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lyndon_factorization', var_counter_lyndon_factorization);
+		}
+		if (requested[1] & (1 << 22)) {
+			result.counter_lyndon_factorization = var_counter_lyndon_factorization;
+			if (on_result) on_result('counter_lyndon_factorization', var_counter_lyndon_factorization);
+		}
+		if (!((need[1] & (1 << 28)))) var_lyndon_factorization = undefined;
+	}
+	if (need[1] & (1 << 23)) {
+		if (var_lyndon_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lyndon_array = construct_lyndon_array(var_nss_array);
+			if (profile) profile_record(profile, 'lyndon_array', var_lyndon_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lyndon_array', var_lyndon_array);
+		}
+		if (requested[1] & (1 << 23)) {
+			result.lyndon_array = var_lyndon_array;
+			if (on_result) on_result('lyndon_array', var_lyndon_array);
+		}
+		var_nss_array = undefined;
+	}
+	if (need[1] & (1 << 24)) {
+		if (var_lexparse_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_lexparse_factorization = construct_lexparse_factorization(var_plcp_array);
+			if (profile) profile_record(profile, 'lexparse_factorization', var_lexparse_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'lexparse_factorization', var_lexparse_factorization);
+		}
+		if (requested[1] & (1 << 24)) {
+			result.lexparse_factorization = var_lexparse_factorization;
+			if (on_result) on_result('lexparse_factorization', var_lexparse_factorization);
+		}
+		var_plcp_array = undefined;
+	}
+	if (need[1] & (1 << 25)) {
+		if (var_counter_delta === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_delta = count_delta(var_substring_complexity);
+			if (profile) profile_record(profile, 'counter_delta', var_counter_delta, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_delta', var_counter_delta);
+		}
+		if (requested[1] & (1 << 25)) {
+			result.counter_delta = var_counter_delta;
+			if (on_result) on_result('counter_delta', var_counter_delta);
+		}
+		if (!((need[1] & (1 << 26)))) var_substring_complexity = undefined;
+	}
+	if (need[1] & (1 << 26)) {
+		if (var_counter_delta_argmax === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_delta_argmax = count_delta_argmax(var_substring_complexity);
+			if (profile) profile_record(profile, 'counter_delta_argmax', var_counter_delta_argmax, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_delta_argmax', var_counter_delta_argmax);
+		}
+		if (requested[1] & (1 << 26)) {
+			result.counter_delta_argmax = var_counter_delta_argmax;
+			if (on_result) on_result('counter_delta_argmax', var_counter_delta_argmax);
+		}
+		var_substring_complexity = undefined;
+	}
+	if (need[1] & (1 << 27)) {
+		if (var_inverse_circular_suffix_array === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_circular_suffix_array = construct_inverse_circular_suffix_array(var_circular_suffix_array);
+			if (profile) profile_record(profile, 'inverse_circular_suffix_array', var_inverse_circular_suffix_array, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_circular_suffix_array', var_inverse_circular_suffix_array);
+		}
+		if (requested[1] & (1 << 27)) {
+			result.inverse_circular_suffix_array = var_inverse_circular_suffix_array;
+			if (on_result) on_result('inverse_circular_suffix_array', var_inverse_circular_suffix_array);
+		}
+		if (!((need[1] & (1 << 28)))) var_circular_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 28)) {
+		if (var_bbw_indices === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bbw_indices = construct_bbw_indices(var_lyndon_factorization, var_circular_suffix_array);
+			if (profile) profile_record(profile, 'bbw_indices', var_bbw_indices, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bbw_indices', var_bbw_indices);
+		}
+		if (requested[1] & (1 << 28)) {
+			result.bbw_indices = var_bbw_indices;
+			if (on_result) on_result('bbw_indices', var_bbw_indices);
+		}
+		var_lyndon_factorization = undefined;
+		var_circular_suffix_array = undefined;
+	}
+	if (need[1] & (1 << 29)) {
+		if (var_counter_necklace_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_necklace_factorization = number_of_factors(var_necklace_factorization);
+			if (profile) profile_record(profile, 'counter_necklace_factorization', var_counter_necklace_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_necklace_factorization', var_counter_necklace_factorization);
+		}
+		if (requested[1] & (1 << 29)) {
+			result.counter_necklace_factorization = var_counter_necklace_factorization;
+			if (on_result) on_result('counter_necklace_factorization', var_counter_necklace_factorization);
+		}
+		var_necklace_factorization = undefined;
+	}
+	if (need[1] & (1 << 30)) {
+		if (var_counter_lexparse_factorization === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_lexparse_factorization = number_of_factors(var_lexparse_factorization);
+			if (profile) profile_record(profile, 'counter_lexparse_factorization', var_counter_lexparse_factorization, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_lexparse_factorization', var_counter_lexparse_factorization);
+		}
+		if (requested[1] & (1 << 30)) {
+			result.counter_lexparse_factorization = var_counter_lexparse_factorization;
+			if (on_result) on_result('counter_lexparse_factorization', var_counter_lexparse_factorization);
+		}
+		var_lexparse_factorization = undefined;
+	}
+	if (need[1] & (1 << 31)) {
+		if (var_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_bbw_transform = construct_bbw_transform(var_text, var_bbw_indices);
+			if (profile) profile_record(profile, 'bbw_transform', var_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'bbw_transform', var_bbw_transform);
+		}
+		if (requested[1] & (1 << 31)) {
+			result.bbw_transform = var_bbw_transform;
+			if (on_result) on_result('bbw_transform', var_bbw_transform);
+		}
+		var_bbw_indices = undefined;
+	}
+	if (need[2] & (1 << 0)) {
+		if (var_inverse_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_inverse_bbw_transform = construct_inverse_bbw_transform(var_bbw_transform);
+			if (profile) profile_record(profile, 'inverse_bbw_transform', var_inverse_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'inverse_bbw_transform', var_inverse_bbw_transform);
+		}
+		if (requested[2] & (1 << 0)) {
+			result.inverse_bbw_transform = var_inverse_bbw_transform;
+			if (on_result) on_result('inverse_bbw_transform', var_inverse_bbw_transform);
+		}
+		if (!((need[2] & (1 << 1)))) var_bbw_transform = undefined;
+	}
+	if (need[2] & (1 << 1)) {
+		if (var_counter_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_bbw_transform = number_of_runs(var_bbw_transform);
+			if (profile) profile_record(profile, 'counter_bbw_transform', var_counter_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_bbw_transform', var_counter_bbw_transform);
+		}
+		if (requested[2] & (1 << 1)) {
+			result.counter_bbw_transform = var_counter_bbw_transform;
+			if (on_result) on_result('counter_bbw_transform', var_counter_bbw_transform);
+		}
+		var_bbw_transform = undefined;
+	}
+	if (need[2] & (1 << 2)) {
+		if (var_counter_inverse_bbw_transform === undefined) {
+			if (profile) { start_time = profile_now(); start_heap = profile_heap(); }
+			var_counter_inverse_bbw_transform = number_of_runs(var_inverse_bbw_transform);
+			if (profile) profile_record(profile, 'counter_inverse_bbw_transform', var_counter_inverse_bbw_transform, start_time, start_heap);
+			if (cache) result_cache_set(cache, text, 'counter_inverse_bbw_transform', var_counter_inverse_bbw_transform);
+		}
+		if (requested[2] & (1 << 2)) {
+			result.counter_inverse_bbw_transform = var_counter_inverse_bbw_transform;
+			if (on_result) on_result('counter_inverse_bbw_transform', var_counter_inverse_bbw_transform);
+		}
+		var_inverse_bbw_transform = undefined;
+	}
+	return result;
+}
+function create_morphism(images, start, coding) {
+    const table = [];
+    for(const letter in images){
+        table[letter.charCodeAt(0)] = Uint16Array.from(images[letter].split(''), (c)=>c.charCodeAt(0));
+    }
+    let coding_table = null;
+    if (coding) {
+        coding_table = [];
+        for(const letter in coding)coding_table[letter.charCodeAt(0)] = coding[letter].charCodeAt(0);
+    }
+    let first = start.charCodeAt(0);
+    let prolongable = 0;
+    while(table[first][0] != first && prolongable < table.length){
+        first = table[first][0];
+        ++prolongable;
+    }
+    return {
+        images: table,
+        coding: coding_table,
+        orders: [
+            Uint16Array.of(start.charCodeAt(0))
+        ],
+        prolongable: prolongable
+    };
+}
+function morphism_expand(m, word, limit) {
+    const images = m.images;
+    let length = 0;
+    let end = 0;
+    while(end < word.length && length < limit)length += images[word[end++]].length;
+    const result = new Uint16Array(Math.min(length, limit));
+    let pos = 0;
+    for(let i = 0; i < end; ++i){
+        const image = images[word[i]];
+        for(let j = 0; j < image.length && pos < result.length; ++j)result[pos++] = image[j];
+    }
+    return result;
+}
+function morphism_order(m, k) {
+    const orders = m.orders;
+    while(orders.length <= k)orders.push(morphism_expand(m, orders[orders.length - 1], Infinity));
+    return orders[Math.max(0, k)];
+}
+function morphism_prefix(m, length) {
+    morphism_order(m, m.prolongable);
+    const orders = m.orders;
+    for(let k = m.prolongable; k < orders.length; ++k){
+        if (orders[k].length >= length) return orders[k].subarray(0, Math.max(0, length));
+    }
+    let word = orders[orders.length - 1];
+    for(let stalled = 0; word.length < length && stalled < m.images.length;){
+        const next = morphism_expand(m, word, length);
+        stalled = next.length > word.length ? 0 : stalled + 1;
+        word = next;
+    }
+    return word;
+}
+function units_to_string(units, coding) {
+    if (coding) {
+        const coded = new Uint16Array(units.length);
+        for(let i = 0; i < units.length; ++i)coded[i] = coding[units[i]];
+        units = coded;
+    }
+    const chunks = [];
+    for(let i = 0; i < units.length; i += 1 << 14){
+        chunks.push(String.fromCharCode.apply(null, units.subarray(i, i + (1 << 14))));
+    }
+    return chunks.join('');
+}
+function morphic_word(m, k) {
+    return units_to_string(morphism_order(m, k), m.coding);
+}
+function morphic_prefix(m, length) {
+    return units_to_string(morphism_prefix(m, length), m.coding);
+}
+const FIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'a'
+}, 'b');
+function generate_fibonacci_word(k) {
+    return morphic_word(FIBONACCI_MORPHISM, k);
+}
+function prefix_fibonacci_word(length) {
+    return morphic_prefix(FIBONACCI_MORPHISM, length);
+}
+const TRIBONACCI_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'a'
+}, 'a');
+function generate_tribonacci_word(k) {
+    return morphic_word(TRIBONACCI_MORPHISM, k);
+}
+function prefix_tribonacci_word(length) {
+    return morphic_prefix(TRIBONACCI_MORPHISM, length);
+}
+const THUE_MORSE_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ba'
+}, 'a');
+function generate_thue_morse_word(k) {
+    return morphic_word(THUE_MORSE_MORPHISM, k);
+}
+function prefix_thue_morse_word(length) {
+    return morphic_prefix(THUE_MORSE_MORPHISM, length);
+}
+const MEPHISTO_WALTZ_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'bba'
+}, 'a');
+function generate_mephisto_waltz_word(k) {
+    return morphic_word(MEPHISTO_WALTZ_MORPHISM, k);
+}
+function prefix_mephisto_waltz_word(length) {
+    return morphic_prefix(MEPHISTO_WALTZ_MORPHISM, length);
+}
+const VTM_MORPHISM = create_morphism({
+    a: 'abc',
+    b: 'ac',
+    c: 'b'
+}, 'a');
+function generate_vtm_word(k) {
+    return morphic_word(VTM_MORPHISM, k);
+}
+function prefix_vtm_word(length) {
+    return morphic_prefix(VTM_MORPHISM, length);
+}
+const SIERPINSKI_MORPHISM = create_morphism({
+    a: 'aba',
+    b: 'bbb'
+}, 'a');
+function generate_sierpinski_word(k) {
+    return morphic_word(SIERPINSKI_MORPHISM, k);
+}
+function prefix_sierpinski_word(length) {
+    return morphic_prefix(SIERPINSKI_MORPHISM, length);
+}
+const PELL_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'a'
+}, 'a');
+function generate_pell_word(k) {
+    return morphic_word(PELL_MORPHISM, k);
+}
+function prefix_pell_word(length) {
+    return morphic_prefix(PELL_MORPHISM, length);
+}
+const CHACON_MORPHISM = create_morphism({
+    a: 'aaba',
+    b: 'b'
+}, 'a');
+function generate_chacon_word(k) {
+    return morphic_word(CHACON_MORPHISM, k);
+}
+function prefix_chacon_word(length) {
+    return morphic_prefix(CHACON_MORPHISM, length);
+}
+const VON_NEUMANN_MORPHISM = create_morphism({
+    a: 'aab',
+    b: 'b'
+}, 'a');
+function generate_von_neumann_word(k) {
+    return morphic_word(VON_NEUMANN_MORPHISM, k);
+}
+function prefix_von_neumann_word(length) {
+    return morphic_prefix(VON_NEUMANN_MORPHISM, length);
+}
+const RUDIN_SHAPIRO_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'ac',
+    c: 'db',
+    d: 'dc'
+}, 'a', {
+    a: 'a',
+    b: 'a',
+    c: 'b',
+    d: 'b'
+});
+function generate_rudin_shapiro_word(k) {
+    return morphic_word(RUDIN_SHAPIRO_MORPHISM, k);
+}
+function prefix_rudin_shapiro_word(length) {
+    return morphic_prefix(RUDIN_SHAPIRO_MORPHISM, length);
+}
+const BAUM_SWEET_MORPHISM = create_morphism({
+    a: 'ab',
+    b: 'cb',
+    c: 'bd',
+    d: 'dd'
+}, 'a', {
+    a: 'a',
+    b: 'b',
+    c: 'a',
+    d: 'a'
+});
+function generate_baum_sweet_word(k) {
+    return morphic_word(BAUM_SWEET_MORPHISM, k);
+}
+function prefix_baum_sweet_word(length) {
+    return morphic_prefix(BAUM_SWEET_MORPHISM, length);
+}
+function generate_kolakoski_word(k) {
+    let word = kolakoski_units(2);
+    for(let i = 0; i < k; ++i){
+        let length = 0;
+        for(let j = 0; j < word.length; ++j)length += word[j] == 97 ? 1 : 2;
+        word = kolakoski_units(length);
+    }
+    return units_to_string(word, null);
+}
+function kolakoski_units(length) {
+    const units = new Uint16Array(Math.max(0, length));
+    const seed = [
+        97,
+        98,
+        98
+    ];
+    let pos = 0;
+    for(; pos < units.length && pos < seed.length; ++pos)units[pos] = seed[pos];
+    for(let run = 2; pos < units.length; ++run){
+        const letter = run % 2 == 0 ? 97 : 98;
+        units[pos++] = letter;
+        if (units[run] == 98 && pos < units.length) units[pos++] = letter;
+    }
+    return units;
+}
+function prefix_kolakoski_word(length) {
+    return units_to_string(kolakoski_units(length), null);
+}
+const generator_lengths = {"fibonacci_word":[1,1,2,3,5,8,13,21,34,55,89,144,233,377,610,987,1597,2584,4181,6765,10946,17711,28657],"tribonacci_word":[1,2,4,7,13,24,44,81,149,274,504,927,1705,3136,5768,10609,19513],"thue_morse_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"mephisto_waltz_word":[1,3,9,27,81,243,729,2187,6561,19683],"vtm_word":[1,3,6,12,24,48,96,192,384,768,1536,3072,6144,12288,24576],"sierpinski_word":[1,3,9,27,81,243,729,2187,6561,19683],"pell_word":[1,3,7,17,41,99,239,577,1393,3363,8119,19601],"chacon_word":[1,4,13,40,121,364,1093,3280,9841,29524],"von_neumann_word":[1,3,7,15,31,63,127,255,511,1023,2047,4095,8191,16383,32767],"rudin_shapiro_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"baum_sweet_word":[1,2,4,8,16,32,64,128,256,512,1024,2048,4096,8192,16384,32768],"kolakoski_word":[2,3,5,7,10,15,23,34,50,75,113,170,255,382,574,863,1293,1937,2903,4353,6526,9789,14688,22029]};
+const string_generators = {
+	'fibonacci_word': generate_fibonacci_word,
+	'tribonacci_word': generate_tribonacci_word,
+	'thue_morse_word': generate_thue_morse_word,
+	'mephisto_waltz_word': generate_mephisto_waltz_word,
+	'vtm_word': generate_vtm_word,
+	'sierpinski_word': generate_sierpinski_word,
+	'pell_word': generate_pell_word,
+	'chacon_word': generate_chacon_word,
+	'von_neumann_word': generate_von_neumann_word,
+	'rudin_shapiro_word': generate_rudin_shapiro_word,
+	'baum_sweet_word': generate_baum_sweet_word,
+	'kolakoski_word': generate_kolakoski_word,
+};
+const string_generator_prefixes = {
+	'fibonacci_word': prefix_fibonacci_word,
+	'tribonacci_word': prefix_tribonacci_word,
+	'thue_morse_word': prefix_thue_morse_word,
+	'mephisto_waltz_word': prefix_mephisto_waltz_word,
+	'vtm_word': prefix_vtm_word,
+	'sierpinski_word': prefix_sierpinski_word,
+	'pell_word': prefix_pell_word,
+	'chacon_word': prefix_chacon_word,
+	'von_neumann_word': prefix_von_neumann_word,
+	'rudin_shapiro_word': prefix_rudin_shapiro_word,
+	'baum_sweet_word': prefix_baum_sweet_word,
+	'kolakoski_word': prefix_kolakoski_word,
+};
+function number_of_runs(text) {
+    if (!text) {
+        return 0;
+    }
+    let runs = 1;
+    let runchar = text[0];
+    for(let i = 1; i < text.length; ++i){
+        if (text[i] !== runchar) {
+            runs++;
+            runchar = text[i];
+        }
+    }
+    return runs;
+}
+function number_of_factors(factorization) {
+    if (!factorization) {
+        return 0;
+    }
+    let count = 0;
+    for(let i = 0; i < factorization.length; ++i){
+        if (factorization[i]) {
+            ++count;
+        }
+    }
+    return count;
+}
+function profile_now() {
+    return typeof performance !== 'undefined' ? performance.now() : Date.now();
+}
+function profile_heap() {
+    const env = globalThis;
+    if (env.process && typeof env.process.memoryUsage === 'function') {
+        return env.process.memoryUsage().heapUsed;
+    }
+    if (env.performance && env.performance.memory) {
+        return env.performance.memory.usedJSHeapSize;
+    }
+    return NaN;
+}
+function profile_record(profile, name, value, start_time, start_heap) {
+    const heap = profile_heap();
+    profile.push({
+        name: name,
+        time_ms: profile_now() - start_time,
+        length: value !== null && value !== undefined && typeof value.length === 'number' ? value.length : null,
+        heap_delta: isNaN(heap) || isNaN(start_heap) ? null : heap - start_heap
+    });
+}
+function text_hash(text) {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193;
+    for(let i = 0; i < text.length; ++i){
+        const c = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x01000193) ^ h2 >>> 15;
+    }
+    return text.length + ':' + (h1 >>> 0).toString(16) + (h2 >>> 0).toString(16);
+}
+function result_cache_create(capacity) {
+    return {
+        entries: new Map(),
+        size: 0,
+        capacity: capacity,
+        last_text: null,
+        last_key: ''
+    };
+}
+function result_cache_key(cache, text, name) {
+    if (cache.last_text !== text) {
+        cache.last_key = text_hash(text);
+        cache.last_text = text;
+    }
+    return cache.last_key + '\n' + name;
+}
+function result_cache_get(cache, text, name) {
+    const key = result_cache_key(cache, text, name);
+    const entry = cache.entries.get(key);
+    if (entry === undefined || entry.text !== text) {
+        return undefined;
+    }
+    cache.entries.delete(key);
+    cache.entries.set(key, entry);
+    return entry.value;
+}
+function result_cache_set(cache, text, name, value) {
+    if (value === undefined) {
+        return;
+    }
+    const key = result_cache_key(cache, text, name);
+    const size = value !== null && typeof value.length === 'number' ? Math.max(1, value.length) : 1;
+    const old = cache.entries.get(key);
+    if (old !== undefined) {
+        cache.entries.delete(key);
+        cache.size -= old.size;
+    }
+    if (size > cache.capacity) {
+        return;
+    }
+    while(cache.size + size > cache.capacity){
+        const oldest = cache.entries.keys().next().value;
+        cache.size -= cache.entries.get(oldest).size;
+        cache.entries.delete(oldest);
+    }
+    cache.entries.set(key, {
+        text: text,
+        value: value,
+        size: size
+    });
+    cache.size += size;
+}
+/**
+ * Shared text preparation logic used by the worker, both for single requests and for the worker pool.
+ *
+ * @param {Object} p
+ * @param {string|null} p.generatorName - Name of the string generator, or null for custom text
+ * @param {number|null} p.limit - Maximum string length for generated strings
+ * @param {boolean} [p.exact] - Whether to generate a prefix of exactly p.limit letters instead of the largest fitting order
+ * @param {string|null} p.customText - Custom text (when generatorName is null)
+ * @param {string} p.placeholder - Placeholder text when no text is available
+ * @param {string} p.transformSelection - Transform to apply ('none', 'custom', or a DS name)
+ * @param {boolean} p.customTransformActive - Whether custom transform is active
+ * @param {string|null} p.customFnSource - Source code for custom transform function
+ * @param {string} p.prepend - Text to prepend
+ * @param {string} p.append - Text to append
+ * @param {boolean} p.dollar - Whether to append null terminator
+ * @param {Object} [cache] - ResultCache reused for the transform, if given
+ * @returns {{ text: string, generator_order: number|null }}
+ */
+function prepare_text(p, cache) {
+	let text, generator_order = null;
+
+	// Step 1: Generate or use provided text
+	if (p.generatorName) {
+		const gen = string_generators[p.generatorName];
+		if (!gen) {
+			return { text: '', generator_order: null };
+		}
+		const prefix = string_generator_prefixes[p.generatorName];
+		if (p.exact && prefix) {
+			text = prefix(p.limit);
+		} else {
+			const lengths = generator_lengths[p.generatorName];
+			let order = -1;
+			if (lengths) {
+				for (let i = 0; i < lengths.length; i++) {
+					if (lengths[i] <= p.limit) order = i;
+					else break;
+				}
+			}
+			text = order >= 0 ? gen(order) : '';
+			generator_order = order;
+		}
+	} else {
+		text = p.customText || '';
+	}
+
+	if (!text) text = p.placeholder || '';
+
+	// Step 2: Apply transform
+	const sel = p.transformSelection;
+	if (sel && sel !== 'none' && sel !== 'custom') {
+		const tDS = build_ds(text, structure_flag_set([sel]), undefined, cache);
+		if (tDS && tDS[sel] !== undefined) text = tDS[sel];
+	} else if (sel === 'custom' && p.customTransformActive && p.customFnSource) {
+		var ret = '';
+		for (var i = 0; i < text.length; i++) {
+			try {
+				var ctx = { i: i, text: text };
+				var newchar = eval('with(ctx) { ' + p.customFnSource + ' }');
+				ret += newchar !== undefined ? newchar : text[i];
+			} catch (err) {
+				return { text: text, generator_order: generator_order, transformError: err.message };
+			}
+		}
+		text = ret;
+	}
+
+	if (text.length === 0) {
+		return { text: '', generator_order: generator_order };
+	}
+
+	// Step 3: Prepend, append, dollar
+	if (p.prepend) text = p.prepend + text;
+	if (p.append) text = text + p.append;
+	if (p.dollar) text += '\0';
+
+	return { text: text, generator_order: generator_order };
+}
+
+// Integer arrays and factorizations are posted as typed arrays whose buffers are transferred instead of
+// cloned element by element. Returns the value to post and its transfer list. With `shared`, integer
+// arrays are put into SharedArrayBuffers, which need no transfer; with `keep_factorizations`,
+// factorizations stay boolean arrays.
+function transport(value, shared, keep_factorizations) {
+    if (!Array.isArray(value) || value.length === 0) return [value, []];
+    if (typeof value[0] === 'boolean') {
+        if (keep_factorizations || !value.every((v) => typeof v === 'boolean')) return [value, []];
+        const bits = new Uint8Array(value.length);
+        for (let i = 0; i < value.length; i++) bits[i] = value[i] ? 1 : 0;
+        return [bits, [bits.buffer]];
+    }
+    for (let i = 0; i < value.length; i++) {
+        if (typeof value[i] !== 'number' || (value[i] | 0) !== value[i]) return [value, []];
+    }
+    if (shared) {
+        const ints = new Int32Array(new SharedArrayBuffer(4 * value.length));
+        ints.set(value);
+        return [ints, []];
+    }
+    const ints = Int32Array.from(value);
+    return [ints, [ints.buffer]];
+}
+
+// Built structures are kept across requests, so enabling one more structure or changing only
+// the output options rebuilds nothing that is still cached. The capacity counts array elements.
+const result_cache = result_cache_create(1 << 24);
+
+// With p.persist, requested structures of at least PERSIST_MIN_LENGTH elements are also stored
+// in IndexedDB, so reloading the page with the same text skips building them again.
+const PERSIST_MIN_LENGTH = 1 << 12;
+const PERSIST_MAX_ENTRIES = 256;
+var persist_db = null;
+var persisted_keys = new Set();
+
+// Resolves to the opened database, or to null where IndexedDB is unavailable.
+function persist_open() {
+    if (persist_db === null) {
+        persist_db = new Promise((resolve) => {
+            if (typeof indexedDB === 'undefined') { resolve(null); return; }
+            const request = indexedDB.open('quickarrays-results', 1);
+            request.onupgradeneeded = () => {
+                request.result.createObjectStore('results', { keyPath: 'key' }).createIndex('stored', 'stored');
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => resolve(null);
+        });
+    }
+    return persist_db;
+}
+
+// Moves the persisted structures among `names` of `text` into the result cache.
+function persist_load(text, names) {
+    return persist_open().then((db) => new Promise((resolve) => {
+        const missing = names.filter((name) => result_cache_get(result_cache, text, name) === undefined);
+        if (db === null || missing.length === 0) { resolve(); return; }
+        const hash = text_hash(text);
+        const transaction = db.transaction('results', 'readonly');
+        transaction.oncomplete = transaction.onerror = () => resolve();
+        const store = transaction.objectStore('results');
+        missing.forEach((name) => {
+            const request = store.get(hash + '\n' + name);
+            request.onsuccess = () => {
+                if (request.result === undefined) return;
+                persisted_keys.add(request.result.key);
+                result_cache_set(result_cache, text, name, request.result.value);
+            };
+        });
+    }));
+}
+
+// Stores the large structures of a result and drops the oldest entries beyond PERSIST_MAX_ENTRIES.
+function persist_store(text, result) {
+    persist_open().then((db) => {
+        if (db === null) return;
+        const hash = text_hash(text);
+        const transaction = db.transaction('results', 'readwrite');
+        const store = transaction.objectStore('results');
+        for (const name in result) {
+            const value = result[name];
+            const key = hash + '\n' + name;
+            if (name === 'text' || name.startsWith('__') || persisted_keys.has(key)) continue;
+            if (value === null || typeof value.length !== 'number' || value.length < PERSIST_MIN_LENGTH) continue;
+            store.put({ key: key, value: value, stored: Date.now() });
+            persisted_keys.add(key);
+        }
+        const count = store.count();
+        count.onsuccess = () => {
+            let excess = count.result - PERSIST_MAX_ENTRIES;
+            if (excess <= 0) return;
+            store.index('stored').openCursor().onsuccess = (event) => {
+                const cursor = event.target.result;
+                if (!cursor || excess-- <= 0) return;
+                persisted_keys.delete(cursor.value.key);
+                cursor.delete();
+                cursor.continue();
+            };
+        };
+    });
+}
+
+function structure_names(flags) {
+    return Object.keys(structure_flags).filter((name) => flags[structure_flags[name][0]] & structure_flags[name][1]);
+}
+
+// Requests carry a generation number. Only the newest request received so far is computed,
+// so a burst of requests while a computation runs collapses into a single follow-up computation.
+var pending_request = null;
+
+function run_pending_request() {
+    const p = pending_request;
+    pending_request = null;
+    if (p === null) return;
+    self.postMessage({ __started: p.generation });
+
+    const prepared = prepare_text(p, result_cache);
+
+    if (prepared.text.length === 0) {
+        self.postMessage({ text: '', __generator_order: prepared.generator_order, __generation: p.generation });
+        return;
+    }
+    if (!p.persist) {
+        build_request(p, prepared);
+        return;
+    }
+    persist_load(prepared.text, structure_names(structure_closure_of(p.enabled_flags))).then(() => {
+        // a newer request arrived while loading, so this one is stale
+        if (pending_request !== null) return;
+        persist_store(prepared.text, build_request(p, prepared));
+    });
+}
+
+// Builds and posts the structures of a request; returns the posted result.
+function build_request(p, prepared) {
+    // Each profile entry and each requested structure is posted as soon as it is ready, so the page
+    // renders results progressively and keeps the finished ones when a later structure times out.
+    const profile = p.profile ? [] : undefined;
+    if (profile) {
+        profile.push = function (entry) {
+            self.postMessage({ __profile_entry: entry, __generation: p.generation });
+            return Array.prototype.push.call(this, entry);
+        };
+    }
+    self.postMessage({ __text: prepared.text, __generation: p.generation });
+    const result = build_ds(prepared.text, p.enabled_flags, profile, result_cache, function (name, value) {
+        const [posted, transfer] = transport(value, false, false);
+        self.postMessage({ __result: name, value: posted, __generation: p.generation }, transfer);
+    });
+    // The structures were already posted; the final message only closes the request.
+    const finished = { text: prepared.text, __finished: true, __generator_order: prepared.generator_order, __generation: p.generation };
+    // a plain copy, since the overridden push is not cloneable
+    if (profile) finished['__profile'] = profile.slice();
+    if (prepared.transformError) finished['__transformError'] = prepared.transformError;
+    self.postMessage(finished);
+    return result;
+}
+
+// Parallel mode: the page has one worker of a pool prepare the text ({ __prepare: params, __generation }),
+// schedules the dependency graph over the pool and sends single structures as tasks { __task, __generation, text, inputs }. Task results that are integer
+// arrays go back in SharedArrayBuffer-backed Int32Arrays when the page is cross-origin isolated,
+// so the page and every later task read them without copying. Factorizations stay boolean arrays
+// since later tasks consume them.
+var task_text = null;
+var task_text_source = null;
+
+// The text arrives as a string or as UTF-16 code units in shared memory; decoded once per text.
+function decode_task_text(source) {
+    if (typeof source === 'string') return source;
+    if (source !== task_text_source) {
+        const chunks = [];
+        for (let i = 0; i < source.length; i += 8192) {
+            chunks.push(String.fromCharCode.apply(null, source.subarray(i, i + 8192)));
+        }
+        task_text = chunks.join('');
+        task_text_source = source;
+    }
+    return task_text;
+}
+
+function run_task(t) {
+    const text = decode_task_text(t.text);
+    const profile = [];
+    const start_time = profile_now(), start_heap = profile_heap();
+    const value = structure_builders[t.__task](text, text.length, t.inputs);
+    profile_record(profile, t.__task, value, start_time, start_heap);
+    const shared = self.crossOriginIsolated && typeof SharedArrayBuffer !== 'undefined';
+    const [posted, transfer] = transport(value, shared, true);
+    self.postMessage({ __task: t.__task, __generation: t.__generation, value: posted, __profile_entry: profile[0] }, transfer);
+}
+
+self.onmessage = function (e) {
+    if (e.data.__prepare !== undefined) {
+        // the text of a parallel request; counter_text is reported here since the page lacks number_of_runs
+        const prepared = prepare_text(e.data.__prepare, result_cache);
+        if (prepared.text.length > 0) prepared.counter_text = number_of_runs(prepared.text);
+        self.postMessage({ __prepared: prepared, __generation: e.data.__generation });
+        return;
+    }
+    if (e.data.__task !== undefined) {
+        run_task(e.data);
+        return;
+    }
+    const scheduled = pending_request !== null;
+    pending_request = e.data;
+    if (!scheduled) setTimeout(run_pending_request, 0);
+};
@@ -2,7 +2,6 @@
 """Generates algorithm pipeline JavaScript and HTML from TypeScript function annotations."""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
-import re
 import html as html_module
 from pathlib import Path
 from collections import defaultdict, deque
@@ -10,18 +9,14 @@ from collections import defaultdict, deque
 import typing
 import common as C
 
-FUNC_PATTERN = re.compile(r'function\s+([A-Za-z0-9_]+)\s*\(([^)]*)\)')
-
-def generate_algorithm(code):
+def generate_algorithm(ts_file):
 	enable_functions = []
 	disable_functions = []
-	for block, fname, _ in C.BLOCK_FUNC_RE.findall(code):
+	for fname, _, ann in C.annotated_functions(ts_file):
 		# Only consider compute_* or construct_* functions
 		if not fname.startswith("construct_"):
 			continue
 
-		ann = C.parse_annotation(block)
-
 		# Must have all three
 		if not all(k in ann for k in ("name", "kind", "type")):
 			continue
@@ -58,16 +53,14 @@ def generate_algorithm(code):
 	Path(C.ALGORITHM_DISABLE_HTML).write_text("\n".join(map(lambda x: x[0], disable_functions)), encoding='utf-8')
 
 
-def generate_counters_html(code : str):
+def generate_counters_html(ts_file):
 	count_funcs = []
 	factor_funcs = []
 	transform_funcs = []
 	annotations = {}  # fname → annotation fields
 
 	
-	for block, fname, argstr in C.BLOCK_FUNC_RE.findall(code):
-		args = parse_args(argstr)
-		ann = C.parse_annotation(block)
+	for fname, args, ann in C.annotated_functions(ts_file):
 		if ann:
 			annotations[fname] = ann
 
@@ -134,60 +127,29 @@ def generate_counters_html(code : str):
 	Path(C.COUNTERS_ENABLE_HTML).write_text("\n".join(map(lambda x: x[0], html_enable_items)), encoding='utf-8')
 
 
-def generate_counters_js(code : str) -> typing.List[str]:
-	count_funcs = []
-	factor_funcs = []
-	transform_funcs = []
-	annotations = {}  # fname → annotation fields
-
-	for block, fname, argstr in C.BLOCK_FUNC_RE.findall(code):
-		args = parse_args(argstr)
-		ann = C.parse_annotation(block)
-		if ann:
-			annotations[fname] = ann
+def counter_targets(ts_file) -> typing.List[typing.Tuple[str, str, str]]:
+	"""Returns the counters derived from factorizations and transforms as (counter name, JS function, source function) triples."""
+	counters = []
+	for fname, _, _ in C.annotated_functions(ts_file):
+		prop = C.short_prop(fname)
 
+		# ---- *_factorization → counter_XXX_factorization : number_of_factors(var_XXX_factorization)
 		if fname.endswith("_factorization") and fname.startswith("construct_"):
-			factor_funcs.append((fname, args))
+			counters.append((f"counter_{prop}", "number_of_factors", fname))
 			continue
 
+		# ---- *_transform → counter_XXX_transform : number_of_runs(var_XXX_transform)
 		if fname.endswith("_transform") and fname.startswith("construct_"):
-			transform_funcs.append((fname, args))
+			counters.append((f"counter_{prop}", "number_of_runs", fname))
 			continue
 
-	# ---------------- COUNTERS JAVASCRIPT ----------------
-
-	js = ["\t\tcounter_text : number_of_runs(var_text)"]
-
-	# ---- count_XXX → XXX : count_XXX(var_argument)
-	for fname, args in count_funcs:
-		prop = C.short_prop(fname)
-		arg = args[0] if args else ""
-		js.append(f"\t\t{prop} : {fname}(var_{arg})")
-
-	# ---- *_factorization → XXX_factorization : number_of_factors(var_XXX_factorization)
-	for fname, args in factor_funcs:
-		prop = C.short_prop(fname)
-		js.append(f"\t\tcounter_{prop} : number_of_factors(var_{prop})")
-
-	# ---- *_transform → XXX_transform : number_of_runs(var_XXX_transform)
-	for fname, args in transform_funcs:
-		prop = C.short_prop(fname)
-		js.append(f"\t\tcounter_{prop} : number_of_runs(var_{prop})")
-
-	return js
+	return counters
 
 
 
 def is_target(name):
 	return name.startswith("construct_") or name.startswith("count_")
 
-def parse_args(arglist):
-	return [
-		a.split(":")[0].strip()
-		for a in arglist.split(",")
-		if a.strip()
-	]
-
 def provider_for(arg):
 	if arg in ("text", "n"):
 		return None
@@ -203,12 +165,17 @@ def structure_name(f):
 def out_var(f):
 	return 'var_' + structure_name(f)
 
-def generate_algorithm_pipeline(code):
+def generate_algorithm_pipeline(ts_file):
 	funcs = {}
-	for m in FUNC_PATTERN.finditer(code):
-		name = m.group(1)
-		if is_target(name):
-			funcs[name] = parse_args(m.group(2))
+	for f in C.function_index(ts_file):
+		if is_target(f['name']):
+			funcs[f['name']] = f['args']
+
+	# the JS call computing each target, once on build_ds locals and once on the inputs of a structure builder
+	def input_var(a):
+		return 'var_' + a if a in ("text", "n") else 'inputs.' + a
+	calls = {f: f"{f}({', '.join(map(out_var, args))})" for f, args in funcs.items()}
+	input_calls = {f: f"{f}({', '.join(map(input_var, args))})" for f, args in funcs.items()}
 
 	# dependency graph
 	deps = defaultdict(list)
@@ -221,9 +188,19 @@ def generate_algorithm_pipeline(code):
 				deps[f].append(p)
 				rev[p].append(f)
 
+	# counters of factorizations and transforms are targets consuming their structure
+	for counter, js_func, source in counter_targets(ts_file):
+		if source not in funcs:
+			continue
+		calls[counter] = f"{js_func}({out_var(source)})"
+		input_calls[counter] = f"{js_func}(inputs.{structure_name(source)})"
+		deps[counter].append(source)
+		rev[source].append(counter)
+	targets = list(calls)
+
 	# topological sort
-	in_deg = {f: len(deps[f]) for f in funcs}
-	q = deque([f for f in funcs if in_deg[f] == 0])
+	in_deg = {f: len(deps[f]) for f in targets}
+	q = deque([f for f in targets if in_deg[f] == 0])
 	topo = []
 
 	while q:
@@ -234,38 +211,93 @@ def generate_algorithm_pipeline(code):
 			if in_deg[g] == 0:
 				q.append(g)
 
+	# transitive dependency closure of each target, including the target itself
+	closure = {}
+	for f in topo:
+		closure[f] = {f}
+		for d in deps[f]:
+			closure[f] |= closure[d]
+
+	# each target owns one bit in a word array; bit i lives in word i // 32
+	bit_of = {f: i for i, f in enumerate(topo)}
+	num_words = max(1, (len(topo) + 31) // 32)
+
+	def flag_words(targets):
+		words = [0] * num_words
+		for g in targets:
+			words[bit_of[g] // 32] |= 1 << (bit_of[g] % 32)
+		return "[" + ", ".join(f"0x{w:08x}" for w in words) + "]"
+
+	def flag_test(words_var, f):
+		return f"{words_var}[{bit_of[f] // 32}] & (1 << {bit_of[f] % 32})"
+
 	with open(C.ALGORITHM_PIPELINE_JS, "w", encoding="utf-8") as out_f:
 		# Flags
 		print("// === Structure flags ===", file=out_f)
+		print("// Each structure owns one bit of a word array: [word index, bit mask].", file=out_f)
+		print(f"var structure_flag_words = {num_words};", file=out_f)
 		print("var structure_flags = {", file=out_f)
 		for i, f in enumerate(topo):
 			name = structure_name(f)
 			comma = "," if i + 1 < len(topo) else ""
-			print(f"\t{name}: 1 << {i}{comma}", file=out_f)
+			print(f"\t{name}: [{i // 32}, 1 << {i % 32}]{comma}", file=out_f)
 		print("};", file=out_f)
 
-		# Builder
-		print("\n// === Builder ===", file=out_f)
-		print("function build_ds(text, flags = -1) {", file=out_f)
+		# Closure
+		print("\n// === Dependency closure: flag words of each structure and everything it is built from ===", file=out_f)
+		print("var structure_closure = {", file=out_f)
+		for i, f in enumerate(topo):
+			comma = "," if i + 1 < len(topo) else ""
+			print(f"\t{structure_name(f)}: {flag_words(closure[f])}{comma}", file=out_f)
+		print("};", file=out_f)
 
-		print("\tconst n = text.length;", file=out_f)
+		print("\n// Returns the flag words selecting the given structure names; unknown names are ignored.", file=out_f)
+		print("function structure_flag_set(names) {", file=out_f)
+		print(f"\tvar flags = {flag_words([])};", file=out_f)
+		print("\tfor (var i = 0; i < names.length; i++) {", file=out_f)
+		print("\t\tvar flag = structure_flags[names[i]];", file=out_f)
+		print("\t\tif (flag) flags[flag[0]] |= flag[1];", file=out_f)
+		print("\t}", file=out_f)
+		print("\treturn flags;", file=out_f)
+		print("}", file=out_f)
 
-		# need map (ES5 replacement for Set)
-		print("\tvar need = {};", file=out_f)
+		print("\n// Returns the flag words of the given structures together with everything they are built from.", file=out_f)
+		print("function structure_closure_of(flags) {", file=out_f)
+		print(f"\tvar need = {flag_words([])};", file=out_f)
+		print("\tfor (var name in structure_flags) {", file=out_f)
+		print("\t\tvar flag = structure_flags[name];", file=out_f)
+		print("\t\tif (!(flags[flag[0]] & flag[1])) continue;", file=out_f)
+		print("\t\tvar deps = structure_closure[name];", file=out_f)
+		print("\t\tfor (var w = 0; w < deps.length; w++) need[w] |= deps[w];", file=out_f)
+		print("\t}", file=out_f)
+		print("\treturn need;", file=out_f)
+		print("}", file=out_f)
 
-		for f in topo:
-			print(f"\tif (flags & structure_flags.{structure_name(f)}) need['{structure_name(f)}'] = true;", file=out_f)
+		# Single structures, for scheduling the graph across several workers
+		print("\n// === Direct dependencies of each structure, in construction order ===", file=out_f)
+		print("var structure_dependencies = {", file=out_f)
+		for i, f in enumerate(topo):
+			comma = "," if i + 1 < len(topo) else ""
+			names = ", ".join(f"'{structure_name(d)}'" for d in dict.fromkeys(deps[f]))
+			print(f"\t{structure_name(f)}: [{names}]{comma}", file=out_f)
+		print("};", file=out_f)
 
-		# dependency closure
-		print("\tvar changed = true;", file=out_f)
-		print("\twhile (changed) {", file=out_f)
-		print("\t\tchanged = false;", file=out_f)
-		for f in topo:
-			for d in deps[f]:
-				print(
-					f"\t\tif (need['{structure_name(f)}'] && !need['{structure_name(d)}']) {{ need['{structure_name(d)}'] = true; changed = true; }}", file=out_f
-				)
-		print("\t}", file=out_f)
+		print("\n// Builds one structure from the text and its direct dependencies, given by name in `inputs`.", file=out_f)
+		print("var structure_builders = {", file=out_f)
+		for i, f in enumerate(topo):
+			comma = "," if i + 1 < len(topo) else ""
+			print(f"\t{structure_name(f)}: function (var_text, var_n, inputs) {{ return {input_calls[f]}; }}{comma}", file=out_f)
+		print("};", file=out_f)
+
+		# Builder
+		print("\n// === Builder ===", file=out_f)
+		print("// flags: flag words from structure_flag_set; omitted to build all structures.", file=out_f)
+		print("// profile: optional array receiving the time, output length and heap delta of each construction.", file=out_f)
+		print("// cache: optional ResultCache; cached structures are reused, and their dependencies are not built.", file=out_f)
+		print("// on_result: optional callback receiving (name, value) of each requested structure as soon as it is ready.", file=out_f)
+		print("function build_ds(text, flags, profile, cache, on_result) {", file=out_f)
+
+		print("\tconst n = text.length;", file=out_f)
 
 		# storage
 		print("\n\t// storage", file=out_f)
@@ -274,34 +306,59 @@ def generate_algorithm_pipeline(code):
 		for f in topo:
 			print(f"\tvar {out_var(f)};", file=out_f)
 
-		# construction
+		# needed structures, from the consumers down to their dependencies
+		print("\n\t// a needed structure missing from the cache needs its direct dependencies", file=out_f)
+		print(f"\tvar need = flags === undefined ? {flag_words(topo)} : flags.slice();", file=out_f)
+		for f in reversed(topo):
+			print(f"\tif ({flag_test('need', f)}) {{", file=out_f)
+			print(f"\t\tif (cache) {out_var(f)} = result_cache_get(cache, text, '{structure_name(f)}');", file=out_f)
+			if deps[f]:
+				words = [0] * num_words
+				for d in deps[f]:
+					words[bit_of[d] // 32] |= 1 << (bit_of[d] % 32)
+				adds = " ".join(f"need[{w}] |= 0x{m:08x};" for w, m in enumerate(words) if m)
+				print(f"\t\tif ({out_var(f)} === undefined) {{ {adds} }}", file=out_f)
+			print("\t}", file=out_f)
+
+		# construction; each structure is dropped once no remaining consumer is needed
 		print("\n\t// construction", file=out_f)
+		print("\tvar requested = flags === undefined ? need : flags;", file=out_f)
+		print("\tvar result = { counter_text: number_of_runs(var_text) };", file=out_f)
+		print("\tif (on_result) on_result('counter_text', result.counter_text);", file=out_f)
+		print("\tvar start_time = 0, start_heap = 0;", file=out_f)
+		position = {f: i for i, f in enumerate(topo)}
 		for f in topo:
-			args = ", ".join(map(out_var, funcs[f]))
-			print(f"\tif (need['{structure_name(f)}']) {{", file=out_f)
-			print(f"\t\t{out_var(f)} = {f}({args});", file=out_f)
+			print(f"\tif ({flag_test('need', f)}) {{", file=out_f)
+			print(f"\t\tif ({out_var(f)} === undefined) {{", file=out_f)
+			print("\t\t\tif (profile) { start_time = profile_now(); start_heap = profile_heap(); }", file=out_f)
+			print(f"\t\t\t{out_var(f)} = {calls[f]};", file=out_f)
+			print(f"\t\t\tif (profile) profile_record(profile, '{structure_name(f)}', {out_var(f)}, start_time, start_heap);", file=out_f)
+			print(f"\t\t\tif (cache) result_cache_set(cache, text, '{structure_name(f)}', {out_var(f)});", file=out_f)
+			print("\t\t}", file=out_f)
+			print(f"\t\tif ({flag_test('requested', f)}) {{", file=out_f)
+			print(f"\t\t\tresult.{structure_name(f)} = {out_var(f)};", file=out_f)
+			print(f"\t\t\tif (on_result) on_result('{structure_name(f)}', {out_var(f)});", file=out_f)
+			print("\t\t}", file=out_f)
+			for d in dict.fromkeys(deps[f]):
+				later = [g for g in rev[d] if position[g] > position[f]]
+				if later:
+					live = " || ".join(f"({flag_test('need', g)})" for g in later)
+					print(f"\t\tif (!({live})) {out_var(d)} = undefined;", file=out_f)
+				else:
+					print(f"\t\t{out_var(d)} = undefined;", file=out_f)
 			print("\t}", file=out_f)
 
-		# return object
-		print("\n\treturn {", file=out_f)
-		print("\t\t", end="", file=out_f)
-		rows = []
-		for i, f in enumerate(topo):
-			rows.append(f"{structure_name(f)}: {out_var(f)}")
-		rows.extend(generate_counters_js(code))
-		print(",\n\t\t".join(rows), file=out_f)
-		print("\t};", file=out_f)
+		print("\treturn result;", file=out_f)
 		print("}", file=out_f)
 
 
-def generate_transform(code : str):
+def generate_transform(ts_file):
 	options = []
-	for block, fname, _ in C.BLOCK_FUNC_RE.findall(code):
+	for fname, _, ann in C.annotated_functions(ts_file):
 		if not fname.startswith("construct_"):
 			continue
 		# if not fname.endswith("_transform"):
 		# 	continue
-		ann = C.parse_annotation(block)
 		if "name" not in ann or "type" not in ann or ann["type"] != "string":
 			continue
 		short = fname[len("construct_"):]  # remove prefix
@@ -319,11 +376,10 @@ def generate_transform(code : str):
 
 
 def main():
-	code = Path(C.ALGORITHM_TS).read_text(encoding='utf-8')
-	generate_counters_html(code)
-	generate_algorithm(code)
-	generate_algorithm_pipeline(code)
-	generate_transform(code)
+	generate_counters_html(C.ALGORITHM_TS)
+	generate_algorithm(C.ALGORITHM_TS)
+	generate_algorithm_pipeline(C.ALGORITHM_TS)
+	generate_transform(C.ALGORITHM_TS)
 
 
 if __name__ == "__main__":
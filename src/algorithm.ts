@@ -1,18 +1,25 @@
 function assert_eq(a: any, b: any, message: string): void {
+    // Typed arrays compare like plain arrays, and an expected `true` or `false` matches a factor end marked by 1 or 0.
+    const is_list = (x: any) => Array.isArray(x) || ArrayBuffer.isView(x);
     let equal = false;
-    if (Array.isArray(a) && Array.isArray(b)) {
-        equal = a.length === b.length && a.every((v, i) => v === b[i]);
+    if (is_list(a) && is_list(b)) {
+        equal = a.length === b.length && Array.prototype.every.call(a, (v: any, i: number) => v === b[i] || (typeof b[i] === 'boolean' && v === +b[i]));
     } else {
         equal = a === b;
     }
 
     if (!equal) {
-        const aStr = Array.isArray(a) ? `[${a}]` : a;
-        const bStr = Array.isArray(b) ? `[${b}]` : b;
+        const aStr = is_list(a) ? `[${Array.from(a)}]` : a;
+        const bStr = is_list(b) ? `[${Array.from(b)}]` : b;
         throw new Error(`Assertion Failed: ${message}. Expected "${bStr}", but got "${aStr}"`);
     }
 }
 
+// Index and length arrays are built as Int32Array and factorizations as Uint8Array with 1 marking a factor end,
+// so the worker can hand their buffers to the page without copying. Inputs may also be plain arrays.
+type IntArrayLike = readonly number[] | Int32Array;
+type FactorizationLike = readonly boolean[] | Uint8Array;
+
 class AlgorithmError extends Error {
     constructor(
         message: string,
@@ -65,7 +72,7 @@ export function test_sigma() {
  * @tutorial The shortest period of a string is the smallest positive integer such that the string is a prefix of an infinite repetition of the prefix of that length. Concretely, the shortest period \(p\) of the text \(T\) is the length of the shortest prefix \(P\) of \(T\) such that \(T\) is a prefix of \(P^{k}\) for some integer \(k \geq 1\).
  * @wikipedia Periodic_sequence
  */
-function count_period(border_array: number[]): number {
+function count_period(border_array: IntArrayLike): number {
     if (!border_array || border_array.length === 0) { return 0; }
     const last_border = border_array[border_array.length - 1];
     return border_array.length - last_border;
@@ -87,7 +94,7 @@ export function test_period() {
  * @tutorial The exponent of a string is the division of the string's length by its shortest period, representing how many times the shortest period needs to be repeated to form the string. Formally, the exponent of the text \(T\) is defined as the length of \(T\) divided by the length of its shortest period \(p\), i.e., \(\frac{|T|}{p}\).
  * @wikipedia Periodic_sequence
  */
-function count_exponent(border_array: number[]): number {
+function count_exponent(border_array: IntArrayLike): number {
     if (!border_array || border_array.length === 0) { return 0; }
     const period = count_period(border_array);
     return border_array.length / period;
@@ -109,7 +116,7 @@ export function test_exponent() {
  * @structures border_array
  * @tutorial The regularity type of a string classifies it based on its periodic structure. A string can be categorized as unbordered, primitive, square, or non-primitive based on its borders and periods. Specifically, a string is unbordered if it has no proper border, primitive if it cannot be expressed as a repetition of a smaller substring, square if it is formed by repeating a substring exactly twice, and non-primitive if it can be expressed as a repetition of a smaller substring more than twice.
  */
-function count_regularity(border_array: number[]): string {
+function count_regularity(border_array: IntArrayLike): string {
     if (!border_array || border_array.length === 0) { return 'empty'; }
     const n = border_array.length;
     const last_border = border_array[n - 1];
@@ -136,6 +143,295 @@ export function test_regularity() {
     assert_eq(count_regularity([]), 'empty', "Regularity of empty string");
 }
 
+/**
+ * Maps the code units of a string to their ranks in the effective alphabet.
+ * For example, "banana" becomes [1, 0, 2, 0, 2, 0] with an alphabet size of 3.
+ *
+ * @param text The input string.
+ * @returns A pair of the rank array and the number of distinct code units.
+ */
+function effective_alphabet_ranks(text: string): [Int32Array, number] {
+    const n: number = text.length;
+    // the table spans only the code units up to the largest one present, so short texts stay cheap
+    let max_code: number = -1;
+    for (let i = 0; i < n; ++i) {
+        max_code = Math.max(max_code, text.charCodeAt(i));
+    }
+    const rank_of: Int32Array = new Int32Array(max_code + 1);
+    for (let i = 0; i < n; ++i) {
+        rank_of[text.charCodeAt(i)] = 1;
+    }
+    let sigma: number = 0;
+    for (let c = 0; c < rank_of.length; ++c) {
+        if (rank_of[c] !== 0) { rank_of[c] = sigma++; }
+    }
+    const ranks: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; ++i) {
+        ranks[i] = rank_of[text.charCodeAt(i)];
+    }
+    return [ranks, sigma];
+}
+
+export function test_effective_alphabet_ranks() {
+    const [ranks, sigma] = effective_alphabet_ranks("banana");
+    assert_eq(Array.from(ranks), [1, 0, 2, 0, 2, 0], "Ranks of 'banana'");
+    assert_eq(sigma, 3, "Alphabet size of 'banana'");
+    assert_eq(effective_alphabet_ranks("")[1], 0, "Alphabet size of empty string");
+    assert_eq(Array.from(effective_alphabet_ranks("b\0a")[0]), [2, 0, 1], "Ranks of 'b\\0a'");
+}
+
+/**
+ * Sorts the suffixes of an integer string with the SA-IS algorithm in linear time.
+ * Suffixes are compared by their integer values, and a proper prefix is smaller than the longer suffix.
+ *
+ * @param s The input string, with each value in [0..upper].
+ * @param upper The largest value that may occur in `s`.
+ * @returns The starting positions of all suffixes of `s` in lexicographical order.
+ */
+function suffix_sort(s: Int32Array, upper: number): Int32Array {
+    const n: number = s.length;
+    if (n === 0) { return new Int32Array(0); }
+    if (n === 1) { return Int32Array.of(0); }
+    if (n === 2) { return s[0] < s[1] ? Int32Array.of(0, 1) : Int32Array.of(1, 0); }
+
+    const sa: Int32Array = new Int32Array(n);
+    // is_s[i] = 1 iff suffix i is S-type; the last suffix is L-type with respect to the virtual sentinel.
+    const is_s: Uint8Array = new Uint8Array(n);
+    for (let i = n - 2; i >= 0; --i) {
+        is_s[i] = (s[i] === s[i + 1]) ? is_s[i + 1] : (s[i] < s[i + 1] ? 1 : 0);
+    }
+
+    // Bucket boundaries: sum_l[c] is the start of the L-bucket of c, sum_s[c] the start of the S-bucket of c.
+    const sum_l: Int32Array = new Int32Array(upper + 2);
+    const sum_s: Int32Array = new Int32Array(upper + 2);
+    for (let i = 0; i < n; ++i) {
+        if (is_s[i] === 0) { sum_s[s[i]]++; }
+        else { sum_l[s[i] + 1]++; }
+    }
+    for (let c = 0; c <= upper; ++c) {
+        sum_s[c] += sum_l[c];
+        if (c < upper) { sum_l[c + 1] += sum_s[c]; }
+    }
+
+    const buf: Int32Array = new Int32Array(upper + 2);
+    function induce(lms: Int32Array): void {
+        sa.fill(-1);
+        buf.set(sum_s);
+        for (let k = 0; k < lms.length; ++k) {
+            const d = lms[k];
+            if (d !== n) { sa[buf[s[d]]++] = d; }
+        }
+        buf.set(sum_l);
+        sa[buf[s[n - 1]]++] = n - 1;
+        for (let i = 0; i < n; ++i) {
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 0) { sa[buf[s[v - 1]]++] = v - 1; }
+        }
+        buf.set(sum_l);
+        for (let i = n - 1; i >= 0; --i) {
+            const v = sa[i];
+            if (v >= 1 && is_s[v - 1] === 1) { sa[--buf[s[v - 1] + 1]] = v - 1; }
+        }
+    }
+
+    // Collect the leftmost S-type (LMS) positions in text order.
+    const lms_map: Int32Array = new Int32Array(n + 1).fill(-1);
+    let m: number = 0;
+    for (let i = 1; i < n; ++i) {
+        if (is_s[i - 1] === 0 && is_s[i] === 1) { lms_map[i] = m++; }
+    }
+    const lms: Int32Array = new Int32Array(m);
+    for (let i = 1, k = 0; i < n; ++i) {
+        if (is_s[i - 1] === 0 && is_s[i] === 1) { lms[k++] = i; }
+    }
+
+    induce(lms);
+
+    if (m > 0) {
+        // Name the sorted LMS substrings and sort them recursively if names are not unique.
+        const sorted_lms: Int32Array = new Int32Array(m);
+        for (let i = 0, k = 0; i < n; ++i) {
+            if (lms_map[sa[i]] !== -1) { sorted_lms[k++] = sa[i]; }
+        }
+        const rec_s: Int32Array = new Int32Array(m);
+        let rec_upper: number = 0;
+        rec_s[lms_map[sorted_lms[0]]] = 0;
+        for (let i = 1; i < m; ++i) {
+            let l: number = sorted_lms[i - 1];
+            let r: number = sorted_lms[i];
+            const end_l: number = (lms_map[l] + 1 < m) ? lms[lms_map[l] + 1] : n;
+            const end_r: number = (lms_map[r] + 1 < m) ? lms[lms_map[r] + 1] : n;
+            let same: boolean = true;
+            if (end_l - l !== end_r - r) {
+                same = false;
+            } else {
+                while (l < end_l && s[l] === s[r]) {
+                    l++;
+                    r++;
+                }
+                if (l === n || s[l] !== s[r]) { same = false; }
+            }
+            if (!same) { rec_upper++; }
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper;
+        }
+        const rec_sa: Int32Array = suffix_sort(rec_s, rec_upper);
+        for (let i = 0; i < m; ++i) {
+            sorted_lms[i] = lms[rec_sa[i]];
+        }
+        induce(sorted_lms);
+    }
+    return sa;
+}
+
+export function test_suffix_sort() {
+    function naive_suffix_array(text: string): number[] {
+        return [...Array(text.length).keys()].sort((a, b) => {
+            const sa = text.substring(a);
+            const sb = text.substring(b);
+            return sa < sb ? -1 : (sa > sb ? 1 : 0);
+        });
+    }
+    function test_helper(text: string) {
+        const [ranks, sigma] = effective_alphabet_ranks(text);
+        assert_eq(Array.from(suffix_sort(ranks, Math.max(0, sigma - 1))), naive_suffix_array(text), `SA-IS of '${text}'`);
+    }
+    ["", "a", "aa", "ab", "ba", "banana", "abracadabra", "mississippi", "aaaaaaaaaa", "abababab", "Banana", "ab\0ba\0"].forEach(test_helper);
+    test_helper("abaababaabaababaababaabaababaabaab");
+    test_helper("abbabaabbaababbabaababbaabbabaab");
+    for (let i = 0; i < 50; ++i) {
+        test_helper(random_ternary_string(1 + i * 7));
+    }
+}
+
+/**
+ * Sorts the positions of a string by the infinite periodic strings starting at them, using prefix doubling.
+ * The permutation `next` partitions the positions into cycles, and position i starts the infinite string
+ * s[i] s[next[i]] s[next[next[i]]] ... . Positions starting equal infinite strings are ordered by position.
+ * With next[i] = (i+1) mod n, this sorts the rotations of `s`; with `next` cycling through each factor of
+ * a Lyndon factorization, it sorts the conjugates of the factors in omega order.
+ *
+ * @param s The input string, with each value in [0..sigma-1].
+ * @param sigma The alphabet size.
+ * @param next A permutation of [0..n-1] whose cycles define the periodic strings.
+ * @returns The positions of `s` sorted by their infinite periodic strings.
+ */
+function cyclic_sort(s: Int32Array, sigma: number, next: Int32Array): Int32Array {
+    const n: number = s.length;
+    if (n === 0) { return new Int32Array(0); }
+    const order: Int32Array = new Int32Array(n);
+    const count: Int32Array = new Int32Array(Math.max(n, sigma) + 1);
+    let rank: Int32Array = new Int32Array(n);
+    let buf: Int32Array = new Int32Array(n);
+
+    function sort_by_rank(input: Int32Array, classes: number): void {
+        count.fill(0, 0, classes + 1);
+        for (let i = 0; i < n; ++i) { count[rank[i] + 1]++; }
+        for (let c = 0; c < classes; ++c) { count[c + 1] += count[c]; }
+        for (let j = 0; j < n; ++j) {
+            const i = input[j];
+            order[count[rank[i]]++] = i;
+        }
+    }
+
+    // Rank the positions by their first character.
+    rank.set(s);
+    for (let i = 0; i < n; ++i) { buf[i] = i; }
+    sort_by_rank(buf, sigma);
+    let classes: number = 0;
+    for (let j = 0; j < n; ++j) {
+        if (j > 0 && s[order[j]] !== s[order[j - 1]]) { classes++; }
+        rank[order[j]] = classes;
+    }
+    classes++;
+
+    // jump = next^k and inv_jump = its inverse, where k is the length of the prefixes ranked so far.
+    let jump: Int32Array = Int32Array.from(next);
+    let inv_jump: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; ++i) { inv_jump[jump[i]] = i; }
+    let jump_buf: Int32Array = new Int32Array(n);
+
+    // Two infinite strings with periods p, q <= n are equal if they share a prefix of length p + q, hence k < 2n suffices.
+    for (let k = 1; classes < n && k < 2 * n; k <<= 1) {
+        // Order the positions by the rank of their k-th successor, then stably by their own rank.
+        for (let j = 0; j < n; ++j) { buf[j] = inv_jump[order[j]]; }
+        sort_by_rank(buf, classes);
+        let c: number = 0;
+        buf[order[0]] = 0;
+        for (let j = 1; j < n; ++j) {
+            const a = order[j - 1];
+            const b = order[j];
+            if (rank[a] !== rank[b] || rank[jump[a]] !== rank[jump[b]]) { c++; }
+            buf[b] = c;
+        }
+        classes = c + 1;
+        [rank, buf] = [buf, rank];
+
+        for (let i = 0; i < n; ++i) { jump_buf[i] = jump[jump[i]]; }
+        [jump, jump_buf] = [jump_buf, jump];
+        for (let i = 0; i < n; ++i) { inv_jump[jump[i]] = i; }
+    }
+
+    // Break ties between equal infinite strings by text position.
+    for (let i = 0; i < n; ++i) { buf[i] = i; }
+    sort_by_rank(buf, classes);
+    return order;
+}
+
+/**
+ * Computes the cyclic successor of each text position within its factor:
+ * the next position, or the starting position of the factor if the position ends the factor.
+ * A factor that is not terminated by a marker ends at the last text position.
+ *
+ * @param factorization A boolean array marking the last position of each factor.
+ * @param n The length of the text.
+ * @returns The successor permutation, whose cycles are the factors.
+ */
+function factor_successors(factorization: FactorizationLike, n: number): Int32Array {
+    const next: Int32Array = new Int32Array(n);
+    let factor_start: number = 0;
+    for (let i = 0; i < n; ++i) {
+        if (factorization[i] || i === n - 1) {
+            next[i] = factor_start;
+            factor_start = i + 1;
+        } else {
+            next[i] = i + 1;
+        }
+    }
+    return next;
+}
+
+export function test_cyclic_sort() {
+    function naive_rotation_array(text: string): number[] {
+        return [...Array(text.length).keys()].sort((a, b) => {
+            const ra = conjugate_string(text, a);
+            const rb = conjugate_string(text, b);
+            return ra < rb ? -1 : (ra > rb ? 1 : a - b);
+        });
+    }
+    function naive_circular_suffix_array(text: string, factorization: FactorizationLike): number[] {
+        const conjugates: [number, string][] = [];
+        let factor_start: number = 0;
+        for (const factor of phrases_from_factorizations(text, factorization)) {
+            for (let i = 0; i < factor.length; ++i) {
+                conjugates.push([factor_start + i, conjugate_string(factor, i)]);
+            }
+            factor_start += factor.length;
+        }
+        return conjugates.sort((a, b) => omega_order(a[1], b[1]) || a[0] - b[0]).map(c => c[0]);
+    }
+    function test_helper(text: string) {
+        assert_eq(construct_rotation_array(text), naive_rotation_array(text), `Rotation array of '${text}'`);
+        const lyndon_factorization = construct_lyndon_factorization(text, construct_inverse_suffix_array(construct_suffix_array(text)));
+        assert_eq(construct_circular_suffix_array(text, lyndon_factorization), naive_circular_suffix_array(text, lyndon_factorization), `CSA of '${text}'`);
+    }
+    ["a", "ab", "ba", "aa", "abab", "baba", "banana", "mississippi", "abcabcabc", "bababab", "aabaabaab"].forEach(test_helper);
+    for (let i = 0; i < 50; ++i) {
+        test_helper(random_ternary_string(1 + i * 5));
+    }
+    assert_eq(Array.from(factor_successors([false, true, false, false, true], 5)), [1, 0, 3, 4, 2], "Successors of two factors");
+    assert_eq(Array.from(factor_successors([false, false, false], 3)), [1, 2, 0], "Successors of an unterminated factor");
+}
+
 /**
  * @name SA
  * @kind enable
@@ -145,23 +441,10 @@ export function test_regularity() {
  * @cite manber93sa
  * @wikipedia Suffix_array
  */
-function construct_suffix_array(text: string): number[] {
-    if (!text) { return []; }
-
-    const n: number = text.length;
-
-    type RotationEntry = [number, string];
-
-    const rotations: RotationEntry[] = [...Array(n).keys()].map((num: number) => {
-        return [num, text.substring(num)];
-    });
-
-    // Sort the rotations array based on the lexicographical order of the conjugated strings (the second element of the tuple).
-    // The sort method modifies the array in-place.
-    rotations.sort((a: RotationEntry, b: RotationEntry) => a[1].localeCompare(b[1]));
-
-    // Map the sorted rotations back to an array containing only their original indices.
-    return rotations.map((rotation: RotationEntry) => rotation[0]);
+function construct_suffix_array(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return suffix_sort(ranks, sigma - 1);
 }
 
 export function test_suffix_array() {
@@ -182,10 +465,10 @@ export function test_suffix_array() {
  * @tutorial The border array of a string stores the lengths of the longest borders for each prefix of the string. A border of a string is defined as a substring that is both a proper prefix and a proper suffix. Formally, the border array \(\mathsf{B}\) for a text \(T[1..n]\) is an array where each entry \(\mathsf{B}[i]\) represents the length of the longest border of the prefix \(T[1..i]\), i.e., \(\mathsf{B}[i]\) is the largest integer \(k \le i-1\) such that \(T[1..k] = T[i-k+1..i]\). By definition, \(\mathsf{B}[0] = 0\).
  * @wikipedia Knuth–Morris–Pratt_algorithm
  */
-function construct_border_array(text: string): number[] {
-    if (!text) { return []; }
+function construct_border_array(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
     const n: number = text.length;
-    const border: number[] = new Array<number>(n);
+    const border: Int32Array = new Int32Array(n);
     border[0] = 0;
     for (let i = 1; i < n; i++) {
         let j = border[i - 1];
@@ -218,7 +501,7 @@ export function test_border_array() {
  * @wikipedia Burrows%E2%80%93Wheeler_transform
  * @cite burrows94bwt
  */
-function construct_bw_transform(text: string, rotation_array: number[]): string {
+function construct_bw_transform(text: string, rotation_array: IntArrayLike): string {
     if (!text) { return ""; }
     if (text.length !== rotation_array.length) {
         throw new AlgorithmError('Invalid input: text must be a string and rotation_array must be an array', 'BWT', { text, rotation_array });
@@ -273,9 +556,13 @@ export function test_first_array() {
  * @description Index Array
  * @tutorial The index array contains a sequence of integers from \(1\) to \(n\), where \(n\) is the length of the input text \(T[1..n]\). Formally, the index array \(\mathsf{i}\) is defined such that \(\mathsf{i}[j] = j\) for each \(j \in [1..n]\).
  */
-function construct_index_array(n: number): number[] {
-    if (!n || n <= 0) { return []; }
-    return Array.from(Array(n).keys());
+function construct_index_array(n: number): Int32Array {
+    if (!n || n <= 0) { return new Int32Array(0); }
+    const result: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; i++) {
+        result[i] = i;
+    }
+    return result;
 }
 
 export function test_index_array() {
@@ -292,23 +579,15 @@ export function test_index_array() {
  * @description Rotation Array
  * @tutorial The rotation array sorts the entry indices of a string based on the lexicographical order of their corresponding cyclic rotations. Formally, the rotation array \(\mathsf{Rot}\) of the text \(T[1..n]\) is an array of integers representing the starting indices of all the cyclic rotations of \(T\), sorted in lexicographical order. It obeys that \(T[\mathsf{Rot}[i]..n]T[1..\mathsf{Rot}[i]-1] \prec T[\mathsf{Rot}[i+1]..n]T[1..\mathsf{Rot}[i+1]-1]\) for all text positions \(i \in [1..n-1]\), where $\prec$ is a total order by assigning lower ranks to lexicographically smaller strings and uses the text position \(i\) for tie-breaking.
  */
-function construct_rotation_array(text: string): number[] {
-    if (!text) { return []; }
+function construct_rotation_array(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
     const n: number = text.length;
-    type RotationEntry = [number, string];
-    const rotations: RotationEntry[] = [...Array(n).keys()].map((num: number) => {
-        return [num, conjugate_string(text, num)];
-    });
-    // Sort the rotations array based on the lexicographical order of the conjugated strings (the second element of the tuple).
-    // The sort method modifies the array in-place.
-    rotations.sort((a: RotationEntry, b: RotationEntry) => {
-        const cmp = a[1].localeCompare(b[1]);
-        if (cmp !== 0) return cmp;
-        return a[0] - b[0]; // Stable sort: preserve original order for ties
-    });
-
-    // Map the sorted rotations back to an array containing only their original indices.
-    return rotations.map((rotation: RotationEntry) => rotation[0]);
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    const next: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; ++i) {
+        next[i] = (i + 1) % n;
+    }
+    return cyclic_sort(ranks, sigma, next);
 }
 
 export function test_rotation_array() {
@@ -331,9 +610,9 @@ export function test_rotation_array() {
  * @wikipedia Suffix_array
  * @cite manber93sa
  */
-function construct_inverse_suffix_array(suffix_array: readonly number[]): number[] {
-    if (!suffix_array) { return []; }
-    const result: number[] = new Array<number>(suffix_array.length);
+function construct_inverse_suffix_array(suffix_array: IntArrayLike): Int32Array {
+    if (!suffix_array) { return new Int32Array(0); }
+    const result: Int32Array = new Int32Array(suffix_array.length);
     for (let i = 0; i < suffix_array.length; i++) {
         result[suffix_array[i]] = i;
     }
@@ -357,9 +636,9 @@ export function test_inverse_suffix_array() {
  * @tutorial The Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically preceding suffix. Formally, given the suffix array \(\mathsf{SA}\) and the inverse suffix array \(\mathsf{ISA}\) of the text \(T[1..n]\), the Phi array \(\mathsf{\Phi}\) is defined such that \(\mathsf{\Phi}[i] = \mathsf{SA}[\mathsf{ISA}[i] - 1]\) if \(\mathsf{ISA}[i] > 0\), and \(\mathsf{\Phi}[i] = \bot\) if \(\mathsf{ISA}[i] = 0\), for each \(i \in [1..n]\).
  * @cite karkkainen09plcp
  */
-function construct_phi_array(suffix_array: number[], inverse_suffix_array: number[]): number[] {
+function construct_phi_array(suffix_array: IntArrayLike, inverse_suffix_array: IntArrayLike): Int32Array {
     const n: number = suffix_array.length;
-    const result: number[] = new Array<number>(n);
+    const result: Int32Array = new Int32Array(n);
 
     for (let i = 0; i < n; i++) {
         if (inverse_suffix_array[i] !== 0) {
@@ -372,7 +651,7 @@ function construct_phi_array(suffix_array: number[], inverse_suffix_array: numbe
 }
 
 export function test_phi_array() {
-    function test_helper(text: string): number[] {
+    function test_helper(text: string): Int32Array {
         const suffix_array = construct_suffix_array(text);
         const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
         const phi_array = construct_phi_array(suffix_array, inverse_suffix_array);
@@ -394,10 +673,10 @@ export function test_phi_array() {
  * @description Inverse Phi Array
  * @tutorial The inverse Phi array provides a mapping from each starting index of the suffixes of a string to the starting index of the lexicographically succeeding suffix. Formally, given the suffix array \(\mathsf{SA}\) and the inverse suffix array \(\mathsf{ISA}\) of the text \(T[1..n]\), the inverse Phi array \(\mathsf{\Phi}^{-1}\) is defined such that \(\mathsf{\Phi}^{-1}[i] = \mathsf{SA}[\mathsf{ISA}[i] + 1]\) if \(\mathsf{ISA}[i] \le n-1 \), and \(\mathsf{\Phi}^{-1}[i] = \bot\) if \(\mathsf{ISA}[i] = n \), for each \(i \in [1..n]\).
  */
-function construct_inverse_phi_array(suffix_array: number[], inverse_suffix_array: number[]): number[] {
-    if (!suffix_array || !inverse_suffix_array) { return []; }
+function construct_inverse_phi_array(suffix_array: IntArrayLike, inverse_suffix_array: IntArrayLike): Int32Array {
+    if (!suffix_array || !inverse_suffix_array) { return new Int32Array(0); }
     const n: number = suffix_array.length;
-    const result: number[] = new Array<number>(n);
+    const result: Int32Array = new Int32Array(n);
     for (let i: number = 0; i < n; ++i) {
         if (inverse_suffix_array[i] + 1 !== n) {
             result[i] = suffix_array[inverse_suffix_array[i] + 1];
@@ -409,7 +688,7 @@ function construct_inverse_phi_array(suffix_array: number[], inverse_suffix_arra
 }
 
 export function test_inverse_phi_array() {
-    function test_helper(text: string): number[] {
+    function test_helper(text: string): Int32Array {
         const suffix_array = construct_suffix_array(text);
         const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
         const inverse_phi_array = construct_inverse_phi_array(suffix_array, inverse_suffix_array);
@@ -459,6 +738,53 @@ export function test_lcp_query() {
     assert_eq(lcp_query("", 0, 0), 0, "LCP of suffixes in empty string");
 }
 
+/**
+ * Builds a sparse table answering range minimum queries over `values` in constant time.
+ * Level k stores the minima of all windows of length 2^k.
+ *
+ * @param values The array to index.
+ * @returns The levels of the sparse table, to pass to `range_min_query`.
+ */
+function build_range_min_table(values: ArrayLike<number>): Int32Array[] {
+    const n: number = values.length;
+    const levels: Int32Array[] = [Int32Array.from(values)];
+    for (let width = 1; 2 * width <= n; width *= 2) {
+        const prev: Int32Array = levels[levels.length - 1];
+        const level: Int32Array = new Int32Array(n - 2 * width + 1);
+        for (let i = 0; i < level.length; i++) {
+            level[i] = Math.min(prev[i], prev[i + width]);
+        }
+        levels.push(level);
+    }
+    return levels;
+}
+
+/**
+ * Returns the minimum of values[left..right] (both inclusive, left <= right) from a table built by `build_range_min_table`.
+ */
+function range_min_query(levels: readonly Int32Array[], left: number, right: number): number {
+    const level: number = 31 - Math.clz32(right - left + 1);
+    const table: Int32Array = levels[level];
+    return Math.min(table[left], table[right - (1 << level) + 1]);
+}
+
+export function test_range_min_query() {
+    function test_helper(values: number[]) {
+        const levels = build_range_min_table(values);
+        for (let left = 0; left < values.length; left++) {
+            for (let right = left; right < values.length; right++) {
+                assert_eq(range_min_query(levels, left, right), Math.min(...values.slice(left, right + 1)), `Minimum of [${left}..${right}] in [${values}]`);
+            }
+        }
+    }
+    test_helper([0]);
+    test_helper([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]);
+    test_helper([5, 4, 3, 2, 1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]);
+    for (let i = 0; i < 10; i++) {
+        test_helper([...random_ternary_string(1 + i * 7)].map(c => c.charCodeAt(0)));
+    }
+}
+
 /**
  * @name LCP
  * @kind disable
@@ -467,24 +793,46 @@ export function test_lcp_query() {
  * @tutorial The Longest Common Prefix (LCP) array stores the lengths of the longest common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given text \(T[1..n]\) and its suffix array \(\mathsf{SA}\), the LCP array \(\mathsf{LCP}[1..n]\) is defined such that \(\mathsf{LCP}[1] = 0\) and \(\mathsf{LCP}[i] = \text{lcp}(T[\mathsf{SA}[i]..n], T[\mathsf{SA}[i-1]..n])\) for each \(i \in [2..n]\), where \(\text{lcp}(S_1, S_2)\) denotes the length of the longest common prefix between the suffixes \(S_1\) and \(S_2\).
  * @wikipedia Longest_common_prefix_array
  */
-function construct_lcp_array(text: string, suffix_array: number[]): number[] {
-    if (!text || !suffix_array) { return []; }
-    const result: number[] = [0];
+function construct_lcp_array(text: string, suffix_array: IntArrayLike, inverse_suffix_array: IntArrayLike): Int32Array {
+    if (!text || !suffix_array || !inverse_suffix_array) { return new Int32Array(0); }
+    const n: number = suffix_array.length;
+    if (n === 0) { return new Int32Array(0); }
 
-    for (let i = 1; i < suffix_array.length; i++) {
-        result.push(lcp_query(text, suffix_array[i], suffix_array[i - 1]));
+    // Kasai et al.: visit the suffixes in text order, so each LCP value reuses all but one character of the previous one.
+    const result: Int32Array = new Int32Array(n);
+    let lcp: number = 0;
+    for (let i = 0; i < n; i++) {
+        const rank: number = inverse_suffix_array[i];
+        if (rank === 0) {
+            lcp = 0;
+            continue;
+        }
+        const j: number = suffix_array[rank - 1];
+        while (i + lcp < n && j + lcp < n && text.charCodeAt(i + lcp) === text.charCodeAt(j + lcp)) {
+            lcp++;
+        }
+        result[rank] = lcp;
+        if (lcp > 0) { lcp--; }
     }
-
     return result;
 }
 
 export function test_lcp_array() {
-    assert_eq(construct_lcp_array("banana", [5, 3, 1, 0, 4, 2]), [0, 1, 3, 0, 0, 2], "LCP array of 'banana'");
-    assert_eq(construct_lcp_array("abracadabra", [10, 7, 0, 3, 5, 8, 1, 4, 6, 9, 2]), [0, 1, 4, 1, 1, 0, 3, 0, 0, 0, 2], "LCP array of 'abracadabra'");
-    assert_eq(construct_lcp_array("", []), [], "LCP array of empty string");
-    assert_eq(construct_lcp_array("a", [0]), [0], "LCP array of 'a'");
-    assert_eq(construct_lcp_array("aaaaa", [4, 3, 2, 1, 0]), [0, 1, 2, 3, 4], "LCP array of 'aaaaa'");
-    assert_eq(construct_lcp_array("abcde", [0, 1, 2, 3, 4]), [0, 0, 0, 0, 0], "LCP array of 'abcde'");
+    function test_helper(text: string, suffix_array: IntArrayLike): Int32Array {
+        return construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array));
+    }
+    assert_eq(test_helper("banana", [5, 3, 1, 0, 4, 2]), [0, 1, 3, 0, 0, 2], "LCP array of 'banana'");
+    assert_eq(test_helper("abracadabra", [10, 7, 0, 3, 5, 8, 1, 4, 6, 9, 2]), [0, 1, 4, 1, 1, 0, 3, 0, 0, 0, 2], "LCP array of 'abracadabra'");
+    assert_eq(test_helper("", []), [], "LCP array of empty string");
+    assert_eq(test_helper("a", [0]), [0], "LCP array of 'a'");
+    assert_eq(test_helper("aaaaa", [4, 3, 2, 1, 0]), [0, 1, 2, 3, 4], "LCP array of 'aaaaa'");
+    assert_eq(test_helper("abcde", [0, 1, 2, 3, 4]), [0, 0, 0, 0, 0], "LCP array of 'abcde'");
+    for (let i = 0; i < 20; i++) {
+        const text = random_ternary_string(1 + i * 11);
+        const suffix_array = construct_suffix_array(text);
+        const naive = suffix_array.map((pos, rank) => rank === 0 ? 0 : lcp_query(text, pos, suffix_array[rank - 1]));
+        assert_eq(test_helper(text, suffix_array), naive, `LCP array of '${text}'`);
+    }
 }
 
 /**
@@ -494,9 +842,13 @@ export function test_lcp_array() {
  * @tutorial The sum of the Longest Common Prefix (LCP) array values provides a measure of the total length of common prefixes between consecutive suffixes in the suffix array of a string. Formally, for a given LCP array \(\mathsf{LCP}[1..n]\), the sum \(\Sigma \mathsf{LCP}\) is defined as \(\sum_{i=1}^{n} \mathsf{LCP}[i]\).
  * @wikipedia Longest_common_prefix_array
  */
-function count_lcp_array(lcp_array: number[]): number {
+function count_lcp_array(lcp_array: IntArrayLike): number {
     if (!lcp_array) { return 0; }
-    return lcp_array.reduce((a, b) => a + b, 0);
+    let sum: number = 0;
+    for (let i = 0; i < lcp_array.length; i++) {
+        sum += lcp_array[i];
+    }
+    return sum;
 }
 
 export function test_sum_lcp_array() {
@@ -518,20 +870,24 @@ export function test_sum_lcp_array() {
  * @wikipedia Longest_common_prefix_array
  * @cite karkkainen09plcp
  */
-function construct_plcp_array(inverse_suffix_array: number[], lcp_array: number[]): number[] {
-    if (!inverse_suffix_array || !lcp_array) { return []; }
+function construct_plcp_array(inverse_suffix_array: IntArrayLike, lcp_array: IntArrayLike): Int32Array {
+    if (!inverse_suffix_array || !lcp_array) { return new Int32Array(0); }
     if (inverse_suffix_array.length !== lcp_array.length) {
         throw new AlgorithmError("Inverse suffix array and LCP array must have the same length.", "PLCP", { inverse_suffix_array, lcp_array });
     }
-    const n = inverse_suffix_array.length;
-    return [...new Array(n).keys()].map(i => lcp_array[inverse_suffix_array[i]]);
+    const n: number = inverse_suffix_array.length;
+    const result: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; i++) {
+        result[i] = lcp_array[inverse_suffix_array[i]];
+    }
+    return result;
 }
 
 export function test_plcp_array() {
-    function test_helper(text: string): number[] {
+    function test_helper(text: string): Int32Array {
         const suffix_array = construct_suffix_array(text);
         const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
-        const lcp_array = construct_lcp_array(text, suffix_array);
+        const lcp_array = construct_lcp_array(text, suffix_array, inverse_suffix_array);
         return construct_plcp_array(inverse_suffix_array, lcp_array);
     }
     assert_eq(test_helper("banana"), [0, 3, 2, 1, 0, 0], "PLCP array of 'banana'");
@@ -551,16 +907,18 @@ export function test_plcp_array() {
  * @tutorial The Psi array provides a mapping inside the suffix array that advances by one text position. Formally, given the suffix array \(\mathsf{SA}\) and the inverse suffix array \(\mathsf{ISA}\) of the text \(T[1..n]\), the Psi array \(\mathsf{\Psi}\) is defined such that \(\mathsf{\Psi}[i] = \mathsf{ISA}[\mathsf{SA}[i] + 1]\) if \(\mathsf{SA}[i] + 1 < n\), and \(\mathsf{\Psi}[i] = \bot\) if \(\mathsf{SA}[i] + 1 = n\), for each \(i \in [1..n]\).
  * @cite grossi05csa
  */
-function construct_psi_array(suffix_array: number[], inverse_suffix_array: number[]): number[] {
-    if (!suffix_array || !inverse_suffix_array) { return []; }
-    const n = suffix_array.length;
-    return [...new Array(n).keys()].map(i =>
-        (suffix_array[i] + 1 < n) ? inverse_suffix_array[suffix_array[i] + 1] : n
-    );
+function construct_psi_array(suffix_array: IntArrayLike, inverse_suffix_array: IntArrayLike): Int32Array {
+    if (!suffix_array || !inverse_suffix_array) { return new Int32Array(0); }
+    const n: number = suffix_array.length;
+    const result: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; i++) {
+        result[i] = (suffix_array[i] + 1 < n) ? inverse_suffix_array[suffix_array[i] + 1] : n;
+    }
+    return result;
 }
 
 export function test_psi_array() {
-    function test_helper(text: string): number[] {
+    function test_helper(text: string): Int32Array {
         const suffix_array = construct_suffix_array(text);
         const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
         return construct_psi_array(suffix_array, inverse_suffix_array);
@@ -582,11 +940,11 @@ export function test_psi_array() {
  * @tutorial The Lyndon factorization of a string decomposes it into a sequence of Lyndon words in lexicographically non-increasing order, where a Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations.
  * @cite chen58lyndon
  */
-function construct_lyndon_factorization(text: string, inverse_suffix_array: number[]): boolean[] {
-    if (!text || !inverse_suffix_array) { return []; }
+function construct_lyndon_factorization(text: string, inverse_suffix_array: IntArrayLike): Uint8Array {
+    if (!text || !inverse_suffix_array) { return new Uint8Array(0); }
     const n: number = text.length;
-    if (n === 0) { return []; }
-    const result: boolean[] = new Array<boolean>(n).fill(false);
+    if (n === 0) { return new Uint8Array(0); }
+    const result: Uint8Array = new Uint8Array(n);
 
     if (inverse_suffix_array.length < n) {
         throw new AlgorithmError(`Inverse suffix array (inverse_suffix_array) must have a length of at least text.length (${n}), but got ${inverse_suffix_array.length}.`, "LynF", { text, inverse_suffix_array });
@@ -595,16 +953,16 @@ function construct_lyndon_factorization(text: string, inverse_suffix_array: numb
     let inverse_suffix_arrayval: number = inverse_suffix_array[0];
     for (let i = 0; i + 1 < n; ++i) {
         if (inverse_suffix_arrayval > inverse_suffix_array[i + 1]) {
-            result[i] = true;
+            result[i] = 1;
             inverse_suffix_arrayval = inverse_suffix_array[i + 1];
         }
     }
-    result[n - 1] = true;
+    result[n - 1] = 1;
     return result;
 }
 
 export function test_lyndon_factorization() {
-    function test_helper(text: string): boolean[] {
+    function test_helper(text: string): Uint8Array {
         const suffix_array = construct_suffix_array(text);
         const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
         return construct_lyndon_factorization(text, inverse_suffix_array);
@@ -615,7 +973,7 @@ export function test_lyndon_factorization() {
     assert_eq(test_helper("abcde"), [false, false, false, false, true], "Lyndon factorization of 'abcde'");
 }
 
-function delta(substring_complexity: number[]): [number, number] {
+function delta(substring_complexity: IntArrayLike): [number, number] {
     if (substring_complexity.length === 0) {
         throw new AlgorithmError("Input array 'substring_complexity' cannot be empty.", "delta", { substring_complexity });
     }
@@ -639,7 +997,7 @@ function delta(substring_complexity: number[]): [number, number] {
  * @tutorial The substring complexity measure quantifies the maximum ratio of substring complexity to length. Given an array of substring complexities for lengths \(1\) to \(n\), it computes the maximum value of \(\frac{\mathsf{SC}[k]}{k}\) for \(k \in [1..n]\), where \(\mathsf{SC}[k]\) is the substring complexity for length \(k\).
  * @cite raskhodnikova13sublinear
  */
-function count_delta(substring_complexity: number[]): number {
+function count_delta(substring_complexity: IntArrayLike): number {
     if (!substring_complexity) { return 0; }
     return delta(substring_complexity)[1];
 }
@@ -659,7 +1017,7 @@ export function test_delta() {
  * @tutorial The substring complexity measure length identifies the substring length that maximizes the ratio of substring complexity to length. Given an array of substring complexities for lengths \(1\) to \(n\), it computes the length \(k\) that maximizes \(\frac{\mathsf{SC}[k]}{k}\), where \(\mathsf{SC}[k]\) is the substring complexity for length \(k\).
  * @cite raskhodnikova13sublinear
  */
-function count_delta_argmax(substring_complexity: number[]): number {
+function count_delta_argmax(substring_complexity: IntArrayLike): number {
     if (!substring_complexity) { return 0; }
     return delta(substring_complexity)[0];
 }
@@ -680,15 +1038,15 @@ export function test_delta_argmax() {
  * @tutorial The substring complexity array quantifies the number of distinct substrings of various lengths within a string. Given the Longest Common Prefix (LCP) array of a string, the substring complexity array \(\mathsf{SC}[1..n]\) is defined such that for each length \(k \in [1..n]\), \(\mathsf{SC}[k]\) represents the count of distinct substrings of length \(k\). The computation leverages the LCP values to efficiently determine the number of new substrings introduced at each length.
  * @cite raskhodnikova13sublinear
  */
-function construct_substring_complexity(lcp_array: number[]): number[] {
-    if (!lcp_array) { return []; }
+function construct_substring_complexity(lcp_array: IntArrayLike): Int32Array {
+    if (!lcp_array) { return new Int32Array(0); }
     const n: number = lcp_array.length;
-    const ret: number[] = new Array<number>(n);
+    const ret: Int32Array = new Int32Array(n);
 
     const c = new Map<number, number>();
-    lcp_array.forEach((ele: number) => {
-        c.set(ele, (c.get(ele) || 0) + 1);
-    });
+    for (let i = 0; i < n; i++) {
+        c.set(lcp_array[i], (c.get(lcp_array[i]) || 0) + 1);
+    }
 
     let count: number = 0; // Accumulator for the current complexity value.
 
@@ -711,9 +1069,9 @@ function construct_substring_complexity(lcp_array: number[]): number[] {
 }
 
 export function test_substring_complexity() {
-    function test_helper(text: string): number[] {
+    function test_helper(text: string): Int32Array {
         const suffix_array = construct_rotation_array(text);
-        const lcp_array = construct_lcp_array(text, suffix_array);
+        const lcp_array = construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array));
         const substring_complexity = construct_substring_complexity(lcp_array);
         return substring_complexity;
     }
@@ -823,6 +1181,159 @@ export function test_rank_query() {
     assert_eq(rank_query("hello", "z", 5), 0, "Count of 'z' in 'hello'");
 }
 
+function popcount32(x: number): number {
+    x = x - ((x >>> 1) & 0x55555555);
+    x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+    x = (x + (x >>> 4)) & 0x0f0f0f0f;
+    return Math.imul(x, 0x01010101) >>> 24;
+}
+
+// Rank and select support for a boolean array, packed into 32-bit words with the number of set bits preceding each word.
+interface BitRankSelect {
+    words: Uint32Array;
+    word_ranks: Int32Array;
+}
+
+/**
+ * Builds constant-time rank and logarithmic-time select support for a boolean array such as a factorization.
+ *
+ * @param bits The boolean array.
+ * @returns The index to pass to `bit_rank` and `bit_select`.
+ */
+function build_bit_rank_select(bits: FactorizationLike): BitRankSelect {
+    const n: number = bits.length;
+    const words: Uint32Array = new Uint32Array((n + 31) >>> 5);
+    for (let i = 0; i < n; ++i) {
+        if (bits[i]) { words[i >>> 5] |= 1 << (i & 31); }
+    }
+    const word_ranks: Int32Array = new Int32Array(words.length + 1);
+    for (let w = 0; w < words.length; ++w) {
+        word_ranks[w + 1] = word_ranks[w] + popcount32(words[w]);
+    }
+    return { words, word_ranks };
+}
+
+/**
+ * Counts the set bits in the prefix bits[0..index-1], like `rank_query(bits, true, index)`.
+ */
+function bit_rank(rs: BitRankSelect, index: number): number {
+    if (index <= 0) { return 0; }
+    const word: number = index >>> 5;
+    if (word >= rs.words.length) { return rs.word_ranks[rs.words.length]; }
+    const offset: number = index & 31;
+    return rs.word_ranks[word] + (offset === 0 ? 0 : popcount32(rs.words[word] & (0xffffffff >>> (32 - offset))));
+}
+
+/**
+ * Finds the position of the nth set bit (1-based), like `select_query(bits, true, nth)`.
+ * Returns -1 if there are fewer than nth set bits.
+ */
+function bit_select(rs: BitRankSelect, nth: number): number {
+    const words: number = rs.words.length;
+    if (nth <= 0 || nth > rs.word_ranks[words]) { return -1; }
+    // Find the word containing the nth set bit, then the bit inside that word.
+    let low: number = 0;
+    let high: number = words - 1;
+    while (low < high) {
+        const mid: number = (low + high + 1) >>> 1;
+        if (rs.word_ranks[mid] < nth) { low = mid; } else { high = mid - 1; }
+    }
+    let word: number = rs.words[low];
+    for (let k = nth - rs.word_ranks[low]; k > 1; --k) {
+        word &= word - 1;
+    }
+    return (low << 5) + 31 - Math.clz32(word & -word);
+}
+
+// Rank and select support for the characters of a string: the positions of each character and the rank of each position among them.
+interface CharRankSelect {
+    occurrences: Map<string, number[]>;
+    // local_ranks[i] is the number of occurrences of text[i] in text[0..i-1].
+    local_ranks: Int32Array;
+}
+
+/**
+ * Builds rank and select support for the characters of a string in linear time.
+ * Select is constant time, rank at the position of a matching character is constant time, and rank in general is logarithmic.
+ *
+ * @param text The input string.
+ * @returns The index to pass to `char_rank` and `char_select`.
+ */
+function build_char_rank_select(text: string): CharRankSelect {
+    const n: number = text.length;
+    const occurrences: Map<string, number[]> = new Map();
+    const local_ranks: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; ++i) {
+        let positions: number[] | undefined = occurrences.get(text[i]);
+        if (positions === undefined) {
+            positions = [];
+            occurrences.set(text[i], positions);
+        }
+        local_ranks[i] = positions.length;
+        positions.push(i);
+    }
+    return { occurrences, local_ranks };
+}
+
+/**
+ * Counts the occurrences of the character c in the prefix text[0..index-1], like `rank_query(text, c, index)`.
+ */
+function char_rank(rs: CharRankSelect, c: string, index: number): number {
+    const positions: number[] | undefined = rs.occurrences.get(c);
+    if (positions === undefined) { return 0; }
+    let low: number = 0;
+    let high: number = positions.length;
+    while (low < high) {
+        const mid: number = (low + high) >>> 1;
+        if (positions[mid] < index) { low = mid + 1; } else { high = mid; }
+    }
+    return low;
+}
+
+/**
+ * Finds the position of the nth occurrence (1-based) of the character c, like `select_query(text, c, nth)`.
+ * Returns -1 if there are fewer than nth occurrences.
+ */
+function char_select(rs: CharRankSelect, c: string, nth: number): number {
+    const positions: number[] | undefined = rs.occurrences.get(c);
+    if (positions === undefined || nth <= 0 || nth > positions.length) { return -1; }
+    return positions[nth - 1];
+}
+
+export function test_rank_select_support() {
+    function test_bits(bits: boolean[]) {
+        const rs = build_bit_rank_select(bits);
+        for (let i = 0; i <= bits.length + 1; ++i) {
+            assert_eq(bit_rank(rs, i), rank_query(bits, true, i), `Bit rank ${i} of [${bits}]`);
+        }
+        for (let k = 1; k <= bits.length + 1; ++k) {
+            assert_eq(bit_select(rs, k), select_query(bits, true, k), `Bit select ${k} of [${bits}]`);
+        }
+    }
+    function test_chars(text: string) {
+        const rs = build_char_rank_select(text);
+        for (const c of ["a", "b", "c", "z"]) {
+            for (let i = 0; i <= text.length; ++i) {
+                assert_eq(char_rank(rs, c, i), rank_query(text, c, i), `Rank of '${c}' up to ${i} in '${text}'`);
+            }
+            for (let k = 1; k <= text.length + 1; ++k) {
+                assert_eq(char_select(rs, c, k), select_query(text, c, k), `Select ${k} of '${c}' in '${text}'`);
+            }
+        }
+        for (let i = 0; i < text.length; ++i) {
+            assert_eq(rs.local_ranks[i], rank_query(text, text[i], i), `Local rank ${i} in '${text}'`);
+        }
+    }
+    test_bits([]);
+    test_bits([false, false, false]);
+    test_bits([true, false, true, true, false]);
+    for (let k = 0; k < 10; ++k) {
+        test_bits([...random_ternary_string(1 + k * 13)].map(c => c === 'a'));
+        test_chars(random_ternary_string(k * 7));
+    }
+    assert_eq(popcount32(0xffffffff), 32, "Population count of a full word");
+}
+
 /**
  * @name LF
  * @kind disable
@@ -832,25 +1343,27 @@ export function test_rank_query() {
  * @wikipedia Burrows%E2%80%93Wheeler_transform
  * @cite burrows94bwt
  */
-function construct_lf_array(first_array: string, bw_transform: string): number[] {
-    if (!first_array || !bw_transform) { return []; }
+function construct_lf_array(first_array: string, bw_transform: string): Int32Array {
+    if (!first_array || !bw_transform) { return new Int32Array(0); }
     if (first_array.length !== bw_transform.length) {
         throw new AlgorithmError("First array and BWT must have the same length.", "LF", { first_array, bw_transform });
     }
 
     const n: number = first_array.length;
-    const result: number[] = new Array<number>(n);
+    const result: Int32Array = new Int32Array(n);
+    const bwt_rs: CharRankSelect = build_char_rank_select(bw_transform);
+    const first_rs: CharRankSelect = build_char_rank_select(first_array);
 
     for (let i = 0; i < n; ++i) {
         const c: string = bw_transform[i];
-        const crank: number = rank_query(bw_transform, c, i + 1);
-        result[i] = select_query(first_array, c, crank);
+        const crank: number = bwt_rs.local_ranks[i] + 1;
+        result[i] = char_select(first_rs, c, crank);
     }
     return result;
 }
 
 export function test_lf_array() {
-    function test_helper(text: string): number[] {
+    function test_helper(text: string): Int32Array {
         const rotation_array = construct_rotation_array(text);
         const bw_transform = construct_bw_transform(text, rotation_array);
         const first_array = construct_first_array(bw_transform);
@@ -911,32 +1424,61 @@ export function test_sl_string() {
  * @tutorial The Longest Previous Factor (LPF) array stores the length of the longest prefix of each suffix of a string that matches a substring starting at a prior position within the same string. Formally, for a given text \(T[1..n]\), the LPF array \(\mathsf{LPF}[1..n]\) is defined such that \(\mathsf{LPF}[i] = \max_{j \in [1..i-1]} \text{lcp}(T[i..n], T[j..n])\) for each \(i \in [1..n]\), where \(\text{lcp}(S_1, S_2)\) denotes the length of the longest common prefix between the suffixes \(S_1\) and \(S_2\).
  * @reference franek03lpf
  */
-function construct_lpf_array(text: string): number[] {
-    if (!text) { return []; }
-    const n: number = text.length;
-    const result: number[] = new Array<number>(n);
-    result[0] = 0;
-    for (let i = 1; i < n; i++) {
-        let maxLCP = 0;
-        for (let j = 0; j < i; j++) { // Check all positions before i
-            let lcp = 0; // Use incremental LCP computation
-            while (i + lcp < n && j + lcp < n && text[i + lcp] === text[j + lcp]) {
-                lcp++;
-            }
-            maxLCP = Math.max(maxLCP, lcp);
+function construct_lpf_array(suffix_array: IntArrayLike, lcp_array: IntArrayLike): Int32Array {
+    if (!suffix_array || !lcp_array) { return new Int32Array(0); }
+    const n: number = suffix_array.length;
+
+    // The longest previous factor at SA[r] is shared with one of the two ranks closest to r whose suffixes start before SA[r],
+    // the previous and next smaller values of SA[r] in SA. Each stack entry keeps the LCP with the entry below it.
+    const stack: Int32Array = new Int32Array(n);
+    const stack_lcp: Int32Array = new Int32Array(n);
+    const previous_lcp: Int32Array = new Int32Array(n);
+    let top: number = 0;
+    for (let r = 0; r < n; r++) {
+        let lcp: number = r > 0 ? lcp_array[r] : 0;
+        while (top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]) {
+            lcp = Math.min(lcp, stack_lcp[--top]);
         }
-        result[i] = maxLCP;
+        previous_lcp[r] = top > 0 ? lcp : 0;
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
+    }
+
+    const result: Int32Array = new Int32Array(n);
+    top = 0;
+    for (let r = n - 1; r >= 0; r--) {
+        let lcp: number = r + 1 < n ? lcp_array[r + 1] : 0;
+        while (top > 0 && suffix_array[stack[top - 1]] > suffix_array[r]) {
+            lcp = Math.min(lcp, stack_lcp[--top]);
+        }
+        result[suffix_array[r]] = Math.max(previous_lcp[r], top > 0 ? lcp : 0);
+        stack[top] = r;
+        stack_lcp[top++] = lcp;
     }
     return result;
 }
 
+/**
+ * Computes the LPF array of a text from its own suffix and LCP arrays, for texts outside the pipeline like the reversed text of the LNF array.
+ */
+function lpf_array_of(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
+    const suffix_array: Int32Array = construct_suffix_array(text);
+    return construct_lpf_array(suffix_array, construct_lcp_array(text, suffix_array, construct_inverse_suffix_array(suffix_array)));
+}
+
 export function test_lpf_array() {
-    assert_eq(construct_lpf_array("banana"), [0, 0, 0, 3, 2, 1], "LPF array of 'banana'");
-    assert_eq(construct_lpf_array("abracadabra"), [0, 0, 0, 1, 0, 1, 0, 4, 3, 2, 1], "LPF array of 'abracadabra'");
-    assert_eq(construct_lpf_array("aaaaa"), [0, 4, 3, 2, 1], "LPF array of 'aaaaa'");
-    assert_eq(construct_lpf_array(""), [], "LPF array of empty string");
-    assert_eq(construct_lpf_array("a"), [0], "LPF array of 'a'");
-    assert_eq(construct_lpf_array("abcde"), [0, 0, 0, 0, 0], "LPF array of 'abcde'");
+    assert_eq(lpf_array_of("banana"), [0, 0, 0, 3, 2, 1], "LPF array of 'banana'");
+    assert_eq(lpf_array_of("abracadabra"), [0, 0, 0, 1, 0, 1, 0, 4, 3, 2, 1], "LPF array of 'abracadabra'");
+    assert_eq(lpf_array_of("aaaaa"), [0, 4, 3, 2, 1], "LPF array of 'aaaaa'");
+    assert_eq(lpf_array_of(""), [], "LPF array of empty string");
+    assert_eq(lpf_array_of("a"), [0], "LPF array of 'a'");
+    assert_eq(lpf_array_of("abcde"), [0, 0, 0, 0, 0], "LPF array of 'abcde'");
+    for (let k = 0; k < 30; k++) {
+        const text = random_ternary_string(1 + k * 5);
+        const naive = [...text].map((_, i) => Math.max(0, ...[...Array(i).keys()].map(j => lcp_query(text, i, j))));
+        assert_eq(lpf_array_of(text), naive, `LPF array of '${text}'`);
+    }
 }
 
 /**
@@ -947,31 +1489,65 @@ export function test_lpf_array() {
  * @tutorial The Longest Previous Non-Overlapping Factor (LPnF) array stores the length of the longest prefix of each suffix of a string that matches a substring ending at a prior position within the same string. Formally, for a given text \(T[1..n]\), the LPnF array \(\mathsf{LPnF}[1..n]\) is defined such that \(\mathsf{LPnF}[i] = \max_{j \in [1..i-1]} \min(i-j,\text{lcp}(T[i..n], T[j..n]))\) for each \(i \in [1..n]\), where \(\text{lcp}(S_1, S_2)\) denotes the length of the longest common prefix between the suffixes \(S_1\) and \(S_2\).
  * @reference crochemore11computing
  */
-function construct_lpnf_array(text: string): number[] {
-    if (!text) { return []; }
-    const n: number = text.length;
-    const result: number[] = new Array<number>(n);
-    result[0] = 0;
-    for (let i = 1; i < n; i++) {
-        let maxLCP = 0;
-        for (let j = 0; j < i; j++) { // Check all positions before i
-            let lcp = 0; // Use incremental LCP computation
-            while (i + lcp < n && j + lcp < i && text[i + lcp] === text[j + lcp]) {
-                lcp++;
-            }
-            maxLCP = Math.max(maxLCP, lcp);
+function construct_lpnf_array(suffix_array: IntArrayLike, inverse_suffix_array: IntArrayLike, lcp_array: IntArrayLike): Int32Array {
+    if (!suffix_array || !inverse_suffix_array || !lcp_array) { return new Int32Array(0); }
+    const n: number = suffix_array.length;
+    const lcp_table: Int32Array[] = build_range_min_table(lcp_array);
+    const sa_table: Int32Array[] = build_range_min_table(suffix_array);
+
+    // Checks whether T[i..i+length-1] occurs at a position j <= i - length, i.e., whether the SA interval of
+    // suffixes sharing this prefix with T[i..n] contains a text position of at most i - length.
+    function has_previous_occurrence(i: number, length: number): boolean {
+        if (length > i || i + length > n) { return false; }
+        const rank: number = inverse_suffix_array[i];
+        let low: number = 0;
+        let high: number = rank;
+        while (low < high) {
+            const mid: number = (low + high) >>> 1;
+            if (range_min_query(lcp_table, mid + 1, rank) >= length) { high = mid; } else { low = mid + 1; }
+        }
+        const left: number = low;
+        low = rank;
+        high = n - 1;
+        while (low < high) {
+            const mid: number = (low + high + 1) >>> 1;
+            if (range_min_query(lcp_table, rank + 1, mid) >= length) { low = mid; } else { high = mid - 1; }
+        }
+        return range_min_query(sa_table, left, low) <= i - length;
+    }
+
+    // A non-overlapping previous factor of length l at i - 1 yields one of length l - 1 at i, so the lengths grow at most n times in total.
+    const result: Int32Array = new Int32Array(n);
+    let length: number = 0;
+    for (let i = 0; i < n; i++) {
+        length = Math.max(length - 1, 0);
+        while (has_previous_occurrence(i, length + 1)) {
+            length++;
         }
-        result[i] = maxLCP;
+        result[i] = length;
     }
     return result;
 }
+
+function lpnf_array_of(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
+    const suffix_array: Int32Array = construct_suffix_array(text);
+    const inverse_suffix_array: Int32Array = construct_inverse_suffix_array(suffix_array);
+    return construct_lpnf_array(suffix_array, inverse_suffix_array, construct_lcp_array(text, suffix_array, inverse_suffix_array));
+}
+
 export function test_lpnf_array() {
-    assert_eq(construct_lpnf_array("banana"), [0, 0, 0, 2, 2, 1], "LPnF array of 'banana'");
-    assert_eq(construct_lpnf_array("abracadabra"), [0, 0, 0, 1, 0, 1, 0, 4, 3, 2, 1], "LPnF array of 'abracadabra'");
-    assert_eq(construct_lpnf_array("aaaaa"), [0, 1, 2, 2, 1], "LPnF array of 'aaaaa'");
-    assert_eq(construct_lpnf_array(""), [], "LPnF array of empty string");
-    assert_eq(construct_lpnf_array("a"), [0], "LPnF array of 'a'");
-    assert_eq(construct_lpnf_array("abcde"), [0, 0, 0, 0, 0], "LPnF array of 'abcde'");
+    assert_eq(lpnf_array_of("banana"), [0, 0, 0, 2, 2, 1], "LPnF array of 'banana'");
+    assert_eq(lpnf_array_of("abracadabra"), [0, 0, 0, 1, 0, 1, 0, 4, 3, 2, 1], "LPnF array of 'abracadabra'");
+    assert_eq(lpnf_array_of("aaaaa"), [0, 1, 2, 2, 1], "LPnF array of 'aaaaa'");
+    assert_eq(lpnf_array_of(""), [], "LPnF array of empty string");
+    assert_eq(lpnf_array_of("a"), [0], "LPnF array of 'a'");
+    assert_eq(lpnf_array_of("abcde"), [0, 0, 0, 0, 0], "LPnF array of 'abcde'");
+    for (let k = 0; k < 30; k++) {
+        const text = random_ternary_string(1 + k * 5);
+        const naive = [...text].map((_, i) => Math.max(0, ...[...Array(i).keys()].map(j => Math.min(i - j, lcp_query(text, i, j)))));
+        assert_eq(lpnf_array_of(text), naive, `LPnF array of '${text}'`);
+    }
 }
 
 
@@ -983,13 +1559,12 @@ export function test_lpnf_array() {
  * @tutorial The Longest Next Factor (LNF) array is the LPF array of the reversed text.
  * @reference franek03lpf
  */
-function construct_lnf_array(text: string): number[] {
-    if (!text) { return []; }
+function construct_lnf_array(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
     const revtext: string = text.split('').reverse().join('');
-    const lpfarray: number[] = construct_lpf_array(revtext);
-
-    const n: number = lpfarray.length;
-    return [...new Array(n).keys()].map((i) => lpfarray[n - 1 - i]);
+    // the structures of the reversed text are not shared with the pipeline
+    const lpfarray: Int32Array = lpf_array_of(revtext);
+    return lpfarray.reverse();
 }
 
 export function test_lnf_array() {
@@ -1002,15 +1577,15 @@ export function test_lnf_array() {
 }
 
 
-function greedy_factorize(factor_array: readonly number[]): boolean[] {
-    if (!factor_array) { return []; }
+function greedy_factorize(factor_array: IntArrayLike): Uint8Array {
+    if (!factor_array) { return new Uint8Array(0); }
     const n: number = factor_array.length;
-    if (n === 0) { return []; }
-    const result: boolean[] = new Array<boolean>(n).fill(false);
+    if (n === 0) { return new Uint8Array(0); }
+    const result: Uint8Array = new Uint8Array(n);
     for (let i: number = 0; i < n;) {
         const currentFactor: number = factor_array[i];
         let distance = currentFactor === 0 ? 1 : currentFactor;
-        result[i + distance - 1] = true;
+        result[i + distance - 1] = 1;
         i += distance;
     }
     return result;
@@ -1026,13 +1601,13 @@ function greedy_factorize(factor_array: readonly number[]): boolean[] {
  * @tutorial The Lempel-Ziv-Storer-Szymanski (LZSS) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring with an earlier starting position. The factorization is constructed greedily by selecting the longest previous factor at each position in the string. Formally, given a text \(T[1..n]\) the length of the factor starting at position \(i\) is \(\max \{1\} \cup \{\text{lcp}(T[i..n], T[j..n]) \mid j \in [1..i-1] \}\).
  * @cite storer82lzss
  */
-function construct_lzss_factorization(lpf_array: readonly number[]): boolean[] {
+function construct_lzss_factorization(lpf_array: IntArrayLike): Uint8Array {
     return greedy_factorize(lpf_array);
 }
 
 export function test_lzss_factorization() {
     function test_helper(text: string, expected: boolean[]) {
-        const lpf_array = construct_lpf_array(text);
+        const lpf_array = lpf_array_of(text);
         const lzss_factorization = construct_lzss_factorization(lpf_array);
         assert_eq(lzss_factorization, expected, `LZSS factorization test for '${text}'`);
     }
@@ -1052,13 +1627,13 @@ export function test_lzss_factorization() {
  * @tutorial The Lempel-Ziv-Storer-Szymanski non-overlapping (LZSSno) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring ending at an earlier positition. The factorization is constructed greedily by selecting the longest previous non-overlapping factor at each position in the string. Formally, given a text \(T[1..n]\) the length of the factor starting at position \(i\) is \(\max \{1\} \cup \{\min(i-j, \text{lcp}(T[i..n], T[j..n])) \mid j \in [1..i-1] \}\).
  * @cite storer82lzss
  */
-function construct_lzssno_factorization(lpnf_array: readonly number[]): boolean[] {
+function construct_lzssno_factorization(lpnf_array: IntArrayLike): Uint8Array {
     return greedy_factorize(lpnf_array);
 }
 
 export function test_lzssno_factorization() {
     function test_helper(text: string, expected: boolean[]) {
-        const lpnf_array = construct_lpnf_array(text);
+        const lpnf_array = lpnf_array_of(text);
         const lzssno_factorization = construct_lzssno_factorization(lpnf_array);
         assert_eq(lzssno_factorization, expected, `LZSSno factorization test for '${text}'`);
     }
@@ -1071,15 +1646,15 @@ export function test_lzssno_factorization() {
 }
 
 
-function greedy_factorize_with_new_letter(factor_array: readonly number[]): boolean[] {
-    if (!factor_array) { return []; }
+function greedy_factorize_with_new_letter(factor_array: IntArrayLike): Uint8Array {
+    if (!factor_array) { return new Uint8Array(0); }
     const n: number = factor_array.length;
-    if (n === 0) { return []; }
-    const result: boolean[] = new Array<boolean>(n).fill(false);
+    if (n === 0) { return new Uint8Array(0); }
+    const result: Uint8Array = new Uint8Array(n);
     for (let i: number = 0; i < n;) {
         const currentFactor: number = factor_array[i];
         let distance = currentFactor === 0 ? 1 : Math.min(currentFactor + 1, n - i);
-        result[i + distance - 1] = true;
+        result[i + distance - 1] = 1;
         i += distance;
     }
     return result;
@@ -1093,12 +1668,12 @@ function greedy_factorize_with_new_letter(factor_array: readonly number[]): bool
  * @tutorial The Lempel-Ziv-77  (LZ77) factorization decomposes a string into a sequence of factors, where each factor is either a new character or a reference to a substring starting at a prior position within the same string. The factorization is constructed greedily by selecting the longest previous factor at each position in the string, with an additional character appended to the factor. Formally, given a text \(T[1..n]\) the length of the factor starting at position \(i\) is \(\max \{1\} \cup \{\text{lcp}(T[i..n], T[j..n]) + 1 \mid j \in [1..i-1] \}\).
  * @cite ziv77lz
  */
-function construct_lz77_factorization(lpf_array: readonly number[]): boolean[] {
+function construct_lz77_factorization(lpf_array: IntArrayLike): Uint8Array {
     return greedy_factorize_with_new_letter(lpf_array);
 }
 export function test_lz77_factorization() {
     function test_helper(text: string, expected: boolean[]) {
-        const lpf_array = construct_lpf_array(text);
+        const lpf_array = lpf_array_of(text);
         const lz77_factorization = construct_lz77_factorization(lpf_array);
         assert_eq(lz77_factorization, expected, `LZ77 factorization test for '${text}'`);
     }
@@ -1120,9 +1695,9 @@ export function test_lz77_factorization() {
  * @tutorial The Reverse Lempel-Ziv-Storer-Szymanski (rLZSS) factorization of a string is the LZSS factorization of the reversed string obtained by reading the string in reversed order.
  * @cite storer82lzss
  */
-function construct_reverse_lzss_factorization(lnf_array: readonly number[]): boolean[] {
-    if (!lnf_array) { return []; }
-    const copied_lnf_array = lnf_array.slice().reverse();
+function construct_reverse_lzss_factorization(lnf_array: IntArrayLike): Uint8Array {
+    if (!lnf_array) { return new Uint8Array(0); }
+    const copied_lnf_array: Int32Array = Int32Array.from(lnf_array).reverse();
     return greedy_factorize(copied_lnf_array);
 }
 
@@ -1149,7 +1724,7 @@ export function test_reverse_lzss_factorization() {
  * @tutorial The lexicographic parse (lexparse) decomposes a string into a sequence of factors based on the permuted longest common prefix (PLCP) array. Each factor is determined by the longest prefix of the suffix starting at the current position that matches a substring starting at a lexicographically smaller suffix position. Formally, for a given text \(T[1..n]\) and its PLCP array \(\mathsf{PLCP}[1..n]\), the length of the factor starting at position \(i\) is \(\mathsf{PLCP}[i]\) or 1 if \(\mathsf{PLCP}[i] = 0\).
  * @cite navarro21approximation
  */
-function construct_lexparse_factorization(plcp_array: readonly number[]): boolean[] {
+function construct_lexparse_factorization(plcp_array: IntArrayLike): Uint8Array {
     return greedy_factorize(plcp_array);
 }
 
@@ -1157,7 +1732,7 @@ export function test_lexparse_factorization() {
     function test_helper(text: string, expected: boolean[]) {
         const suffix_array = construct_suffix_array(text);
         const inverse_suffix_array = construct_inverse_suffix_array(suffix_array);
-        const lcp_array = construct_lcp_array(text, suffix_array);
+        const lcp_array = construct_lcp_array(text, suffix_array, inverse_suffix_array);
         const plcp_array = construct_plcp_array(inverse_suffix_array, lcp_array);
         const lexparse_factorization = construct_lexparse_factorization(plcp_array);
         assert_eq(lexparse_factorization, expected, `LexParse factorization test for '${text}'`);
@@ -1177,10 +1752,10 @@ export function test_lexparse_factorization() {
  * @description Next Smaller Suffix Array
  * @tutorial The Next Smaller Suffix (NSS) array identifies the subsequent suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \(\mathsf{ISA}\) of a text \(T[1..n]\), the NSS array \(\mathsf{NSS}[1..n]\) is defined such that \(\mathsf{NSS}[i] = \min \{ j > i \mid \mathsf{ISA}[j] < \mathsf{ISA}[i] \}\) if such a \(j\) exists, and \(\mathsf{NSS}[i] = \bot \) otherwise, for each \(i \in [1..n]\).
  */
-function construct_nss_array(inverse_suffix_array: readonly number[]): number[] {
-    if (!inverse_suffix_array) { return []; }
+function construct_nss_array(inverse_suffix_array: IntArrayLike): Int32Array {
+    if (!inverse_suffix_array) { return new Int32Array(0); }
     const n: number = inverse_suffix_array.length;
-    const result: number[] = new Array<number>(n);
+    const result: Int32Array = new Int32Array(n);
     for (let i = 0; i < n; ++i) {
         let nss: number = i + 1;
         while (nss < n && inverse_suffix_array[nss] > inverse_suffix_array[i]) {
@@ -1210,10 +1785,10 @@ export function test_nss_array() {
  * @description Previous Smaller Suffix Array
  * @tutorial The Previous Smaller Suffix (PSS) array identifies the preceding suffix in text order that is lexicographically smaller than the current suffix. Given the inverse suffix array \(\mathsf{ISA}\) of a text \(T[1..n]\), the PSS array \(\mathsf{PSS}[1..n]\) is defined such that \(\mathsf{PSS}[i] = \max \{ j < i \mid \mathsf{ISA}[j] < \mathsf{ISA}[i] \}\) if such a \(j\) exists, and \(\mathsf{PSS}[i] = \bot \) otherwise, for each \(i \in [1..n]\).
  */
-function construct_pss_array(inverse_suffix_array: readonly number[]): number[] {
-    if (!inverse_suffix_array) { return []; }
+function construct_pss_array(inverse_suffix_array: IntArrayLike): Int32Array {
+    if (!inverse_suffix_array) { return new Int32Array(0); }
     const n: number = inverse_suffix_array.length;
-    const result: number[] = new Array<number>(n);
+    const result: Int32Array = new Int32Array(n);
 
     for (let i = 0; i < n; ++i) {
         let pss: number = i - 1;
@@ -1244,10 +1819,10 @@ export function test_pss_array() {
  * @tutorial The Lyndon array stores the lengths of the longest Lyndon words starting at each position in a string. A Lyndon word is a non-empty string that is strictly smaller in lexicographical order than all of its non-trivial rotations. Given the Next Smaller Suffix (NSS) array \(\mathsf{NSS}[1..n]\) of a text \(T[1..n]\), the Lyndon array \(\mathsf{Lyndon}[1..n]\) is defined such that \(\mathsf{Lyndon}[i] = \mathsf{NSS}[i] - i\) if \(\mathsf{NSS}[i] \neq \bot\), and \(\mathsf{Lyndon}[i] = n - i + 1\) otherwise, for each \(i \in [1..n]\).
  * @cite franek16algorithms
  */
-function construct_lyndon_array(nss_array: readonly number[]): number[] {
-    if (!nss_array) { return []; }
+function construct_lyndon_array(nss_array: IntArrayLike): Int32Array {
+    if (!nss_array) { return new Int32Array(0); }
     const n: number = nss_array.length;
-    let result: number[] = new Array<number>(n);
+    const result: Int32Array = new Int32Array(n);
     for (let i = 0; i < n; ++i) {
         result[i] = (nss_array[i] === n) ? (n - i) : (nss_array[i] - i);
     }
@@ -1266,6 +1841,43 @@ export function test_lyndon_array() {
 }
 
 
+/**
+ * Finds the starting position of a lexicographically smallest rotation of a string in linear time,
+ * by comparing two candidate starting positions and discarding the one that loses together with the positions it dominates.
+ *
+ * @param text The input string.
+ * @returns The smallest position i such that T[i..n]T[1..i-1] is the smallest rotation, or 0 for the empty string.
+ */
+function least_rotation(text: string): number {
+    const n: number = text.length;
+    let i: number = 0;
+    let j: number = 1;
+    let k: number = 0;
+    while (i < n && j < n && k < n) {
+        const a: number = text.charCodeAt((i + k) % n);
+        const b: number = text.charCodeAt((j + k) % n);
+        if (a === b) {
+            ++k;
+            continue;
+        }
+        if (a > b) { i += k + 1; } else { j += k + 1; }
+        if (i === j) { ++j; }
+        k = 0;
+    }
+    return Math.min(i, j);
+}
+
+export function test_least_rotation() {
+    assert_eq(least_rotation(""), 0, "Least rotation of empty string");
+    assert_eq(least_rotation("a"), 0, "Least rotation of 'a'");
+    assert_eq(least_rotation("banana"), 5, "Least rotation of 'banana'");
+    assert_eq(least_rotation("baba"), 1, "Least rotation of 'baba'");
+    assert_eq(least_rotation("a".repeat(1000)), 0, "Least rotation of a unary string");
+    for (const text of ["abracadabra", "mississippi", "cabcab", "bbbab", "zyxzyxa"]) {
+        assert_eq(least_rotation(text), construct_rotation_array(text)[0], `Least rotation of '${text}'`);
+    }
+}
+
 /**
  * @name min-rot(T)
  * @transform_name Necklace
@@ -1276,16 +1888,7 @@ export function test_lyndon_array() {
  */
 function construct_necklace_conjugate_transform(text: string): string {
     if (!text) { return ""; }
-    const n: number = text.length;
-    let best_conj: string = text;
-
-    for (let i: number = 0; i < n; ++i) {
-        const conj: string = conjugate_string(text, i);
-        if (conj < best_conj) {
-            best_conj = conj;
-        }
-    }
-    return best_conj;
+    return conjugate_string(text, least_rotation(text));
 }
 
 export function test_necklace_conjugate_transform() {
@@ -1355,14 +1958,14 @@ export function test_revert_transform() {
     assert_eq(construct_revert_transform("a"), "a", "Revert transform of 'a'");
 }
 
-function phrases_from_factorizations(text: string, factorization: readonly boolean[]): string[] {
+function phrases_from_factorizations(text: string, factorization: FactorizationLike): string[] {
     if (!text || !factorization) { return []; }
     const n: number = text.length;
     const phrases: string[] = [];
 
     let old_pos: number = 0;
     for (let i = 0; i < n; ++i) {
-        if (factorization[i] === true) {
+        if (factorization[i]) {
             let factor: string = text.slice(old_pos, i + 1);
             old_pos = i + 1;
             phrases.push(factor);
@@ -1403,24 +2006,10 @@ export function test_omega_order() {
  * @tutorial The Circular Suffix Array (CSA) of a string is a permutation of text positions that assigns a rank to each cyclic rotation (conjugate) of the Lyndon factors of the string based on the omega order. Given a text \(T[1..n]\) and its Lyndon factorization, the CSA \(\mathsf{CSA}[1..n]\) is defined such that \(\mathsf{CSA}[i]\) gives the starting position in \(T\) of the \(i\)-th smallest conjugate in \(\omega\)-order among all conjugates of the Lyndon factors of \(T\).
  * @cite hon13spaceefficient
  */
-function construct_circular_suffix_array(text: string, lyndon_factorization: readonly boolean[]): number[] {
-    if (!text || !lyndon_factorization) { return []; }
-    interface Conjugate {
-        pos: number;
-        str: string;
-    }
-    const factors: string[] = phrases_from_factorizations(text, lyndon_factorization);
-    const conjugates: Conjugate[] = [];
-    let factor_starting_position: number = 0;
-    for (const factor of factors) {
-        const factor_length = factor.length;
-        for (let conj_it = 0; conj_it < factor_length; ++conj_it) {
-            conjugates.push({ pos: factor_starting_position + conj_it, str: conjugate_string(factor, conj_it) });
-        }
-        factor_starting_position += factor_length;
-    }
-    conjugates.sort((a, b) => omega_order(a.str, b.str));
-    return [...conjugates].map(conjugate => conjugate.pos);
+function construct_circular_suffix_array(text: string, lyndon_factorization: FactorizationLike): Int32Array {
+    if (!text || !lyndon_factorization) { return new Int32Array(0); }
+    const [ranks, sigma] = effective_alphabet_ranks(text);
+    return cyclic_sort(ranks, sigma, factor_successors(lyndon_factorization, text.length));
 }
 
 export function test_circular_suffix_array() {
@@ -1447,8 +2036,8 @@ export function test_circular_suffix_array() {
  * @tutorial The inverse circular suffix array (ICSA) is the reverse permutation of the circular suffix array (CSA). 
  * @cite hon13spaceefficient
  */
-function construct_inverse_circular_suffix_array(circular_suffix_array: readonly number[]): number[] {
-    if (!circular_suffix_array) { return []; }
+function construct_inverse_circular_suffix_array(circular_suffix_array: IntArrayLike): Int32Array {
+    if (!circular_suffix_array) { return new Int32Array(0); }
     return construct_inverse_suffix_array(circular_suffix_array);
 }
 
@@ -1469,18 +2058,20 @@ export function test_inverse_circular_suffix_array() {
  * @tutorial The Bijective Burrows-Wheeler Transform Indices (BBWTi) array stores the text positions of the circular sufix array (CSA) decremented by one, but mapping positions at the beginning of Lyndon factors to the end of the respective Lyndon factor.
  * @cite bannai25survey
  */
-function construct_bbw_indices(lyndon_factorization: readonly boolean[], circular_suffix_array: readonly number[]): number[] {
-    if (!lyndon_factorization || !circular_suffix_array) { return []; }
+function construct_bbw_indices(lyndon_factorization: FactorizationLike, circular_suffix_array: IntArrayLike): Int32Array {
+    if (!lyndon_factorization || !circular_suffix_array) { return new Int32Array(0); }
     const n: number = circular_suffix_array.length;
-    return [...circular_suffix_array].map(pos => {
-        var position: number;
-        if (pos == 0 || lyndon_factorization[pos - 1] == true) {
-            const rank = rank_query(lyndon_factorization, true, pos);
-            const selected_position = select_query(lyndon_factorization, true, 1 + rank);
-            position = (selected_position == -1) ? n - 1 : selected_position;
-        } else { position = pos - 1; }
-        return position;
-    });
+    // The preceding position of pos in its Lyndon factor, wrapping around from the factor start to the factor end.
+    const next: Int32Array = factor_successors(lyndon_factorization, n);
+    const previous: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; ++i) {
+        previous[next[i]] = i;
+    }
+    const result: Int32Array = new Int32Array(n);
+    for (let i = 0; i < n; ++i) {
+        result[i] = previous[circular_suffix_array[i]];
+    }
+    return result;
 }
 
 export function test_bbw_indices() {
@@ -1508,7 +2099,7 @@ export function test_bbw_indices() {
  * @tutorial The Bijective Burrows-Wheeler Transform (BBWT) of a string rearranges the characters of the original string based on the Bijective Burrows-Wheeler Transform Indices (BBWTi). Given a text \(T[1..n]\) and its BBWTi array \(\mathsf{BBWTi}[1..n]\), the BBWT \(\mathsf{BBWT}[1..n]\) is defined such that \(\mathsf{BBWT}[i] = T[\mathsf{BBWTi}[i]]\) for each \(i \in [1..n]\).
  * @cite bannai25survey
  */
-function construct_bbw_transform(text: string, bbw_indices: readonly number[]): string {
+function construct_bbw_transform(text: string, bbw_indices: IntArrayLike): string {
     if (!text || !bbw_indices) { return ""; }
     return [...bbw_indices].map(pos => text[pos]).join('');
 }
@@ -1542,6 +2133,8 @@ function construct_inverse_bbw_transform(bbw_transform: string): string {
     if (!bbw_transform) { return ""; }
     let n = bbw_transform.length;
     var farray = construct_first_array(bbw_transform);
+    const farray_rs: CharRankSelect = build_char_rank_select(farray);
+    const bbwt_rs: CharRankSelect = build_char_rank_select(bbw_transform);
     var marking: boolean[] = new Array(n).fill(0);
     var conjugates = [];
     for (let bbwt_init_position = 0; bbwt_init_position < n; ++bbwt_init_position) {
@@ -1554,17 +2147,15 @@ function construct_inverse_bbw_transform(bbw_transform: string): string {
             marking[pos] = true;
             conjugate.push(bbw_transform[pos]);
             let cur_char = farray[pos];
-            let character_number = rank_query(farray, cur_char, pos + 1);
-            if (character_number == 0) {
-                throw new AlgorithmError('character_number is zero in inverse BBWT', 'construct_inverse_bbw_transform', bbw_transform);
-            }
-            if (bbw_transform.split(cur_char).length + 1 <= character_number) {
+            let character_number = farray_rs.local_ranks[pos] + 1;
+            pos = char_select(bbwt_rs, cur_char, character_number);
+            if (pos === -1) {
                 throw new AlgorithmError('character_number exceeds occurrences in inverse BBWT', 'construct_inverse_bbw_transform', bbw_transform);
             }
-            pos = select_query(bbw_transform, cur_char, character_number);
         }
-        const finalConjugate = construct_necklace_conjugate_transform(conjugate.join(''))
-        conjugates.push(finalConjugate);
+        // each cycle is a conjugate of a Lyndon factor, which is its least rotation
+        const cycle = conjugate.join('');
+        conjugates.push(conjugate_string(cycle, least_rotation(cycle)));
     }
     conjugates.sort();
     conjugates.reverse();
@@ -1578,6 +2169,15 @@ export function test_inverse_bbw_transform() {
     assert_eq(construct_inverse_bbw_transform("a"), "a", "Inverse BBWT of 'a'");
     assert_eq(construct_inverse_bbw_transform("abcde"), "edcba", "Inverse BBWT of 'abcde'");
     assert_eq(construct_inverse_bbw_transform("eabcd"), "abcde", "Inverse BBWT of 'eabcd'");
+    // one cycle per character of a unary string, and many equal cycles of a periodic one
+    assert_eq(construct_inverse_bbw_transform("b".repeat(100000)), "b".repeat(100000), "Inverse BBWT of a long unary string");
+    for (const text of ["ab".repeat(20000), "aab".repeat(20000), "abaab".repeat(10000) + "a"]) {
+        const isa = construct_inverse_suffix_array(construct_suffix_array(text));
+        const lyndon_factorization = construct_lyndon_factorization(text, isa);
+        const csa = construct_circular_suffix_array(text, lyndon_factorization);
+        const bbw_transform = construct_bbw_transform(text, construct_bbw_indices(lyndon_factorization, csa));
+        assert_eq(construct_inverse_bbw_transform(bbw_transform), text, `Inverse BBWT of a long periodic string of length ${text.length}`);
+    }
 }
 
 
@@ -1794,7 +2394,7 @@ export function test_null_undefined_inputs() {
     assert_eq(construct_first_array(null as any), "", "construct_first_array with null");
     assert_eq(construct_rotation_array(null as any), [], "construct_rotation_array with null");
     assert_eq(construct_inverse_suffix_array(null as any), [], "construct_inverse_suffix_array with null");
-    assert_eq(construct_lcp_array(null as any, null as any), [], "construct_lcp_array with null");
+    assert_eq(construct_lcp_array(null as any, null as any, null as any), [], "construct_lcp_array with null");
     assert_eq(count_lcp_array(null as any), 0, "count_lcp_array with null");
     assert_eq(construct_plcp_array(null as any, null as any), [], "construct_plcp_array with null");
     assert_eq(construct_psi_array(null as any, null as any), [], "construct_psi_array with null");
@@ -1807,7 +2407,8 @@ export function test_null_undefined_inputs() {
     assert_eq(rank_query(null as any, "a", 0), 0, "rank_query with null");
     assert_eq(construct_lf_array(null as any, null as any), [], "construct_lf_array with null");
     assert_eq(construct_sl_string(null as any), [], "construct_sl_string with null");
-    assert_eq(construct_lpf_array(null as any), [], "construct_lpf_array with null");
+    assert_eq(construct_lpf_array(null as any, null as any), [], "construct_lpf_array with null");
+    assert_eq(construct_lpnf_array(null as any, null as any, null as any), [], "construct_lpnf_array with null");
     assert_eq(construct_lnf_array(null as any), [], "construct_lnf_array with null");
     assert_eq(construct_nss_array(null as any), [], "construct_nss_array with null");
     assert_eq(construct_pss_array(null as any), [], "construct_pss_array with null");
@@ -1832,7 +2433,7 @@ export function test_complex_integration() {
     const unicode = "café";
     const sa = construct_suffix_array(unicode);
     const isa = construct_inverse_suffix_array(sa);
-    const lcp = construct_lcp_array(unicode, sa);
+    const lcp = construct_lcp_array(unicode, sa, isa);
 
     assert_eq(sa.length, unicode.length, "SA length matches");
     assert_eq(isa.length, unicode.length, "ISA length matches");
@@ -1881,10 +2482,10 @@ export function test_complex_integration() {
  * @tutorial The Lempel-Ziv-78 (LZ78) factorization decomposes a string into a sequence of factors based on previously seen substrings. Each factor consists of a reference to the longest previously seen factor (or zero if none exists) followed by a new character. 
  * @cite ziv78lz
  */
-function construct_lz78_factorization(text: string): boolean[] {
-    if (!text) { return []; }
+function construct_lz78_factorization(text: string): Uint8Array {
+    if (!text) { return new Uint8Array(0); }
     const n: number = text.length;
-    const factorization: boolean[] = new Array(n).fill(false);
+    const factorization: Uint8Array = new Uint8Array(n);
     const dictionary: Map<string, number> = new Map();
     let currentIndex: number = 0;
     while (currentIndex < n) {
@@ -1901,7 +2502,7 @@ function construct_lz78_factorization(text: string): boolean[] {
         dictionary.set(newFactor, currentIndex);
 
         // Mark the end of the factor
-        factorization[currentIndex + newFactor.length - 1] = true;
+        factorization[currentIndex + newFactor.length - 1] = 1;
 
         // Move to the next position
         currentIndex += newFactor.length;
@@ -1929,12 +2530,12 @@ export function test_lz78_factorization() {
  * @tutorial The Lempel-Ziv-Welch (LZW) factorization decomposes a string into a sequence of factors by building a dictionary of previously seen substrings. Each factor is the longest prefix of the remaining text that exists in the dictionary, followed by the next character.
  * @cite welch84lzw
  */
-function construct_lzw_factorization(text: string): boolean[] {
+function construct_lzw_factorization(text: string): Uint8Array {
     if (!text) {
-        return [];
+        return new Uint8Array(0);
     }
     const n = text.length;
-    const factorization = new Array(n).fill(false);
+    const factorization: Uint8Array = new Uint8Array(n);
     const dictionary = new Map();
     // Initialize the dictionary with single characters
     for (let i = 0; i < n; i++) {
@@ -1955,7 +2556,7 @@ function construct_lzw_factorization(text: string): boolean[] {
         let endpos = i + s.length - 1;
         if (endpos >= n) {
             // Reached the end of the text
-            factorization[n - 1] = true;
+            factorization[n - 1] = 1;
             break;
         }
         if (s.length == 0) {
@@ -1963,7 +2564,7 @@ function construct_lzw_factorization(text: string): boolean[] {
                 text
             });
         }
-        factorization[endpos] = true;
+        factorization[endpos] = 1;
         // Add new substring to the dictionary
         if (i + s.length < n) { s += text[i + s.length]; }
         if (!dictionary.has(s)) {
@@ -2001,29 +2602,29 @@ export function test_lzw_factorization() {
  * @tutorial The Necklace factorization is the Lyndon factorization colliding all equal Lyndon factors to a single factor that is a necklace. The number of factors is the number of distinct Lyndon factors.
  * @cite chen58lyndon
  */
-function construct_necklace_factorization(text: string, lyndon_factorization: boolean[]): boolean[] {
-    if (!text || !lyndon_factorization) { return []; }
+function construct_necklace_factorization(text: string, lyndon_factorization: FactorizationLike): Uint8Array {
+    if (!text || !lyndon_factorization) { return new Uint8Array(0); }
     const n: number = text.length;
-    const necklace_factorization: boolean[] = new Array(n).fill(false);
+    const necklace_factorization: Uint8Array = new Uint8Array(n);
     let factor_start: number = 0;
     let last_factor = "";
     while (factor_start < n) {
         let factor_end: number = factor_start;
-        while (factor_end < n && lyndon_factorization[factor_end] == false) {
+        while (factor_end < n && !lyndon_factorization[factor_end]) {
             factor_end++;
         }
         // Now factor_end is at the end of the current Lyndon factor
         const current_factor = text.slice(factor_start, factor_end + 1);
         if (current_factor === last_factor) {
             // assert_eq(necklace_factorization[factor_start-1], true, "Previous factor end should be marked true for equal Lyndon factors");
-            necklace_factorization[factor_start - 1] = false;
-            necklace_factorization[factor_end] = true;
+            necklace_factorization[factor_start - 1] = 0;
+            necklace_factorization[factor_end] = 1;
             factor_start = factor_end + 1;
             continue;
         }
         last_factor = current_factor;
         // Mark the end of the necklace factor
-        necklace_factorization[factor_end] = true;
+        necklace_factorization[factor_end] = 1;
         // Move to the next factor
         factor_start = factor_end + 1;
     }
@@ -2054,10 +2655,10 @@ export function test_necklace_factorization() {
  * @tutorial The odd maximal palindromic length array (o-pali) stores at each position the length of the left arm of the longest odd-length palindromic substring centered at that position, excluding the position itself in the length measurement. Hence, a palindrome of length \(2k+1\) contributes \(k\) to the o-pali array at its center position.
  * @cite manacher75new
  */
-function construct_odd_maximal_palindromic_length_array(text: string): number[] {
-    if (!text) { return []; }
+function construct_odd_maximal_palindromic_length_array(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
     const n: number = text.length;
-    const o_pali: number[] = new Array(n).fill(0);
+    const o_pali: Int32Array = new Int32Array(n);
     let center: number = 0;
     let right: number = 0;
     for (let i = 0; i < n; i++) {
@@ -2093,10 +2694,10 @@ export function test_odd_maximal_palindromic_length_array() {
  * @tutorial The even maximal palindromic length array (e-pali) stores at each position the length of the longest even-length palindromic substring centered between that and its preding position.
  * @cite manacher75new
  */
-function construct_even_maximal_palindromic_length_array(text: string): number[] {
-    if (!text) { return []; }
+function construct_even_maximal_palindromic_length_array(text: string): Int32Array {
+    if (!text) { return new Int32Array(0); }
     const n: number = text.length;
-    const e_pali: number[] = new Array(n).fill(0);
+    const e_pali: Int32Array = new Int32Array(n);
     let center: number = 0;
     let right: number = 0;
     for (let i = 0; i < n; i++) {
@@ -2125,7 +2726,7 @@ export function test_even_maximal_palindromic_length_array() {
 }
 
 
-function get_lzend_reference(text: string, substring: string, factorization: boolean[]): number {
+function get_lzend_reference(text: string, substring: string, factorization: Uint8Array): number {
     let startIndex = 0;
     // Loop as long as an occurrence is found (indexOf returns -1 when no match)
     while ((startIndex = text.indexOf(substring, startIndex)) !== -1) {
@@ -2146,12 +2747,12 @@ function get_lzend_reference(text: string, substring: string, factorization: boo
  *
  * @cite kreft13lzend
  */
-function construct_lzend_factorization(text: string): boolean[] {
+function construct_lzend_factorization(text: string): Uint8Array {
     if (!text) {
-        return [];
+        return new Uint8Array(0);
     }
     const n = text.length;
-    const factorization = new Array(n).fill(false);
+    const factorization: Uint8Array = new Uint8Array(n);
     for (let i = 0; i < n;) {
         let factor = "";
         let s = "";
@@ -2170,10 +2771,10 @@ function construct_lzend_factorization(text: string): boolean[] {
 
         let endpos = i + factor.length - 1;
         if (endpos >= n) {
-            factorization[n - 1] = true;
+            factorization[n - 1] = 1;
             break;
         }
-        factorization[endpos] = true;
+        factorization[endpos] = 1;
         i = endpos + 1;
     }
     return factorization;
@@ -2189,7 +2790,11 @@ export function test_lzend_factorization() {
 
 function is_stringattractor(text: string, attractor: readonly number[]): boolean {
     const n = text.length;
-    const posSet = new Set(attractor);
+    const marked: boolean[] = new Array<boolean>(n).fill(false);
+    for (const p of attractor) {
+        if (p >= 0 && p < n) { marked[p] = true; }
+    }
+    const attractor_rs: BitRankSelect = build_bit_rank_select(marked);
 
     for (let i = 0; i < n; i++) {
         let s = '';
@@ -2199,13 +2804,8 @@ function is_stringattractor(text: string, attractor: readonly number[]): boolean
             // Check if at least one occurrence is hit
             let hit = false;
             for (let k = 0; k + s.length <= n; k++) {
-                if (text.slice(k, k + s.length) === s) {
-                    for (let p = k; p < k + s.length; p++) {
-                        if (posSet.has(p)) {
-                            hit = true;
-                            break;
-                        }
-                    }
+                if (text.slice(k, k + s.length) === s && bit_rank(attractor_rs, k + s.length) > bit_rank(attractor_rs, k)) {
+                    hit = true;
                 }
                 if (hit) break;
             }
@@ -2224,8 +2824,8 @@ function is_stringattractor(text: string, attractor: readonly number[]): boolean
  * @tutorial A string attractor is a set of positions in a string such that every distinct substring has at least one occurrence that crosses one of these positions. The smallest string attractor size is the minimum number of positions needed to form such a set. Here, \(\Gamma\) is the leftmost such smallest string attractor, i.e., the one that has the lexicographically smallest sequence of positions.
  * @cite kempa18stringattractors
  */
-function construct_gamma_factorization(text: string): boolean[] {
-    if (!text) { return []; }
+function construct_gamma_factorization(text: string): Uint8Array {
+    if (!text) { return new Uint8Array(0); }
     const n = text.length;
 
     // Count all substrings
@@ -2304,12 +2904,12 @@ function construct_gamma_factorization(text: string): boolean[] {
     }
 
     const ret = backtrack(0, new Set<number>(), new Set<number>());
-    const result: boolean[] = new Array<boolean>(n).fill(false);
-    ret.forEach((val) => result[val] = true);
+    const result: Uint8Array = new Uint8Array(n);
+    ret.forEach((val) => result[val] = 1);
     return result;
 }
 
-function factorization_to_positions(factorization: readonly boolean[]): number[] {
+function factorization_to_positions(factorization: FactorizationLike): number[] {
     const positions: number[] = [];
     for (let i = 0; i < factorization.length; i++) {
         if (factorization[i]) {
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Builds the page like `make`, running all stages in one driver process.
+
+Each stage is skipped if the SHA-256 of its inputs and its command are the same as in its last successful run
+and its outputs are unchanged since, so touching a file without changing it rebuilds nothing.
+Stages whose dependencies are done run concurrently in a pool of worker processes. A worker imports each script once,
+re-importing them only after a script changed, and keeps one Node process running Babel for all its transforms.
+Parcel runs as a subprocess.
+"""
+# pylint: disable=bad-indentation,line-too-long,invalid-name
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import common as C
+
+STAGE_CACHE = C.BUILD_DIR / 'cache' / 'stages.json'
+BABEL_CONFIG = C.REPOSITORY_DIR / 'babel.config.json'
+
+# Transforms the files of each line {"src", "out"} like `npx babel src --out-file out`, answering with a line {"error"}
+_BABEL_JS = r"""
+'use strict';
+const babel = require('@babel/core');
+const fs = require('fs');
+require('readline').createInterface({ input: process.stdin }).on('line', (line) => {
+	const { src, out } = JSON.parse(line);
+	let error = null;
+	try {
+		fs.writeFileSync(out, babel.transformFileSync(src, { presets: ['@babel/preset-typescript'] }).code + '\n');
+	} catch (e) {
+		error = e.message;
+	}
+	process.stdout.write(JSON.stringify({ error: error }) + '\n');
+});
+"""
+
+# State of a worker process: its Babel process, and the modification times of the scripts when they were imported
+_babel = None
+_script_mtimes = {path: path.stat().st_mtime_ns for path in C.SOURCE_DIR.glob('*.py')}
+
+
+class Stage:
+	"""A build step producing `outputs` from `inputs` once the stages named in `deps` are done.
+	`command` is ('python', module, argv), ('babel', ts_file, js_file), ('shell', argv) or ('links', [(target, link), ...])."""
+	def __init__(self, name, command, inputs, outputs, deps=()):
+		self.name = name
+		self.command = command
+		self.inputs = [Path(path) for path in inputs]
+		self.outputs = [Path(path) for path in outputs]
+		self.deps = list(deps)
+
+
+def python_stage(name, script, argv, inputs, outputs, deps=()):
+	# every script imports common
+	return Stage(name, ('python', Path(script).stem, [str(arg) for arg in argv]), [script, C.SOURCE_DIR / 'common.py', *inputs], outputs, deps)
+
+
+def stages(production):
+	"""Returns the stages of the build in the order of the Makefile."""
+	asset_js = sorted(C.ASSET_DIR.glob('*.js'))
+	asset_css = sorted(C.ASSET_DIR.glob('*.css'))
+	links = [(asset, C.JS_DIR / asset.name) for asset in asset_js] + [(asset, C.BUILD_DIR / 'css' / asset.name) for asset in asset_css]
+	external_js = [C.EXTERNAL_JS_DIR / C.external_filename(url) for url, _ in C.external_entries()]
+	html_fragments = [C.ALGORITHM_ENABLE_HTML, C.ALGORITHM_DISABLE_HTML, C.COUNTERS_HTML, C.COUNTERS_ENABLE_HTML, C.TRANSFORM_HTML]
+	babel = {ts_file: C.JS_GEN_DIR / (ts_file.stem + '.js') for ts_file in C.ALL_TS_FILES}
+
+	result = [Stage('assets', ('links', [(str(asset), str(link)) for asset, link in links]), [asset for asset, _ in links], [link for _, link in links])]
+	for ts_file, js_file in babel.items():
+		result.append(Stage(f'babel:{ts_file.stem}',
+			('babel', str(ts_file), str(js_file)),
+			[ts_file, C.TS_CONFIG, BABEL_CONFIG], [js_file]))
+	result += [
+		python_stage('algorithm', C.ALGORITHM_PY, [], [C.ALGORITHM_TS], [C.ALGORITHM_PIPELINE_JS, *html_fragments]),
+		python_stage('generator', C.GENERATOR_PY, [], [C.GENERATOR_TS], [C.GENERATOR_PIPELINE_JS, C.GENERATOR_HTML]),
+		python_stage('generator_lengths', C.SOURCE_DIR / 'generator_lengths.py', [],
+			[C.GENERATOR_TS, babel[C.GENERATOR_TS], C.GENERATOR_PIPELINE_JS], [C.GENERATOR_LENGTHS_JS], ['babel:generator', 'generator']),
+		python_stage('tutorial', C.TUTORIAL_PY, ['--prerender', C.GENERATOR_TS, C.ALGORITHM_TS], [C.GENERATOR_TS, C.ALGORITHM_TS], [C.TUTORIAL_JS]),
+		python_stage('citation', C.SOURCE_DIR / 'citation.py', [C.GENERATOR_TS, C.ALGORITHM_TS],
+			[C.GENERATOR_TS, C.ALGORITHM_TS, C.REFERENCES_BIBTEX_FILE, C.BIBIOLGRAPHY_STYLE_FILE], [C.CITATION_JS]),
+		python_stage('external', C.EXTERNAL_PY, [], [C.EXTERNAL_FILELIST], external_js),
+		python_stage('compile_javascript', C.COMPILE_JAVASCRIPT_PY, [], [*C.ALL_GEN_JS_FILES, *asset_js, C.SKELETON_HTML],
+			[C.GENERATED_JS, C.GENERATED_WORKER_JS, C.GENERATED_MAIN_JS],
+			[*(f'babel:{ts_file.stem}' for ts_file in babel), 'algorithm', 'generator', 'generator_lengths', 'tutorial', 'citation']),
+		python_stage('skeleton', C.SKELETON_PY, [], [C.SKELETON_HTML, C.GENERATOR_HTML, *html_fragments], [C.BUILD_HTML], ['algorithm', 'generator']),
+		python_stage('standalone', C.STANDALONE_PY, ['--production'] if production else [],
+			[C.SOURCE_DIR / 'minify.py', C.COMPILE_JAVASCRIPT_PY, C.SIZE_BUDGET_FILE, C.BUILD_HTML, C.GENERATED_WORKER_JS, C.GENERATED_MAIN_JS, *asset_js, *asset_css, *external_js],
+			[C.STANDALONE_HTML, C.CONCATENATED_HTML, C.CONCATENATED_JS, C.CONCATENATED_CSS, C.WORKER_JS],
+			['assets', 'external', 'compile_javascript', 'skeleton']),
+		Stage('dist', ('shell', ['npx', 'parcel', 'build', str(C.STANDALONE_HTML), '--public-url', './']),
+			[C.STANDALONE_HTML], [C.DIST_PACKED_HTML], ['standalone']),
+	]
+	return result
+
+
+def import_script(module):
+	"""Imports a build script; all scripts are imported anew if any of them changed since they were imported."""
+	global _script_mtimes # pylint: disable=global-statement
+	mtimes = {path: path.stat().st_mtime_ns for path in C.SOURCE_DIR.glob('*.py')}
+	if mtimes != _script_mtimes:
+		for name, loaded in list(sys.modules.items()):
+			path = getattr(loaded, '__file__', None)
+			if path and Path(path).parent == C.SOURCE_DIR and name not in ('__main__', '__mp_main__', 'build'):
+				del sys.modules[name]
+		_script_mtimes = mtimes
+	return importlib.import_module(module)
+
+
+def babel_transform(ts_file, js_file):
+	"""Compiles a TypeScript file with the Babel process of this worker; returns the error message, if any."""
+	global _babel # pylint: disable=global-statement
+	if _babel is None or _babel.poll() is not None:
+		_babel = subprocess.Popen(['node', '-e', _BABEL_JS], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=str(C.REPOSITORY_DIR))
+	_babel.stdin.write(json.dumps({'src': ts_file, 'out': js_file}) + '\n')
+	_babel.stdin.flush()
+	reply = _babel.stdout.readline()
+	if not reply:
+		_babel = None
+		return "the Babel process exited, is @babel/core installed?"
+	return json.loads(reply)['error']
+
+
+def run_stage(command):
+	"""Runs a stage command; returns None on success and the error message otherwise."""
+	kind = command[0]
+	try:
+		if kind == 'python':
+			_, module, argv = command
+			sys.argv = [module + '.py', *argv]
+			import_script(module).main()
+		elif kind == 'babel':
+			return babel_transform(command[1], command[2])
+		elif kind == 'shell':
+			result = subprocess.run(command[1], cwd=str(C.REPOSITORY_DIR), check=False)
+			if result.returncode != 0:
+				return f"{' '.join(command[1][:2])} exited with status {result.returncode}"
+		elif kind == 'links':
+			for target, link in command[1]:
+				link = Path(link)
+				if link.is_symlink() or link.exists():
+					continue
+				link.parent.mkdir(parents=True, exist_ok=True)
+				link.symlink_to(os.path.relpath(target, link.parent))
+	except SystemExit as e:
+		if e.code not in (None, 0):
+			return f"exited with status {e.code}"
+	except Exception: # pylint: disable=broad-exception-caught
+		return traceback.format_exc()
+	return None
+
+
+class Hashes:
+	"""SHA-256 of files, each read once until invalidated by the stage writing it."""
+	def __init__(self):
+		self.digests = {}
+
+	def file(self, path):
+		if path not in self.digests:
+			self.digests[path] = hashlib.sha256(path.read_bytes()).hexdigest() if path.is_file() else None
+		return self.digests[path]
+
+	def invalidate(self, paths):
+		for path in paths:
+			self.digests.pop(path, None)
+
+	def stage_key(self, stage):
+		h = hashlib.sha256(json.dumps(stage.command).encode('utf-8'))
+		for path in stage.inputs:
+			digest = self.file(path)
+			if digest is None:
+				raise FileNotFoundError(f"{stage.name}: input {path} does not exist")
+			h.update(f'\0{path}\0{digest}'.encode('utf-8'))
+		return h.hexdigest()
+
+
+def build(selected, production, force, pool):
+	"""Runs the selected stages and the stages they depend on in `pool`;
+	returns the names of the stages that changed their outputs and of those that failed."""
+	all_stages = {stage.name: stage for stage in stages(production)}
+	needed = set()
+	todo = list(selected or all_stages)
+	while todo:
+		name = todo.pop()
+		if name not in all_stages:
+			raise ValueError(f"unknown stage {name}; stages are {', '.join(all_stages)}")
+		if name not in needed:
+			needed.add(name)
+			todo.extend(all_stages[name].deps)
+
+	state = json.loads(STAGE_CACHE.read_text(encoding='utf-8')) if STAGE_CACHE.is_file() else {}
+	hashes = Hashes()
+	done = set()
+	running = {}
+	changed = []
+	failed = []
+	try:
+		while True:
+			ready = [name for name in all_stages if name in needed and name not in done and name not in running and all(dep in done for dep in all_stages[name].deps)]
+			for name in ([] if failed else ready):
+				stage = all_stages[name]
+				key = hashes.stage_key(stage)
+				recorded = state.get(name, {})
+				if not force and recorded.get('key') == key and all(hashes.file(path) == recorded.get('outputs', {}).get(str(path)) for path in stage.outputs):
+					done.add(name)
+					continue
+				running[name] = (pool.submit(run_stage, stage.command), key, time.monotonic())
+			if ready and not running and not failed:
+				# stages were skipped, so more may be ready now
+				continue
+			if not running:
+				break
+			finished, _ = wait([future for future, _, _ in running.values()], return_when=FIRST_COMPLETED)
+			for name in [name for name, (future, _, _) in running.items() if future in finished]:
+				future, key, start = running.pop(name)
+				stage = all_stages[name]
+				hashes.invalidate(stage.outputs)
+				error = future.result()
+				if error is None and any(hashes.file(path) is None for path in stage.outputs):
+					error = "not all outputs were written: " + ", ".join(str(path) for path in stage.outputs if hashes.file(path) is None)
+				if error is not None:
+					print(f"Error in stage {name}: {error}", file=sys.stderr)
+					state.pop(name, None)
+					failed.append(name)
+					continue
+				print(f"{name}: built in {time.monotonic() - start:.1f}s")
+				outputs = {str(path): hashes.file(path) for path in stage.outputs}
+				if outputs != state.get(name, {}).get('outputs'):
+					changed.append(name)
+				state[name] = {'key': key, 'outputs': outputs}
+				done.add(name)
+	finally:
+		for future, _, _ in running.values():
+			future.cancel()
+		wait([future for future, _, _ in running.values()])
+		STAGE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+		STAGE_CACHE.write_text(json.dumps(state, indent=1, sort_keys=True), encoding='utf-8')
+	return changed, failed
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Build the page, rebuilding only stages whose inputs changed")
+	parser.add_argument("stages", nargs="*", help="stages to build together with their dependencies (default: all)")
+	parser.add_argument("--production", action="store_true", help="build the standalone page in production mode")
+	parser.add_argument("--force", action="store_true", help="rebuild all selected stages")
+	parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+	args = parser.parse_args()
+
+	start = time.monotonic()
+	try:
+		# worker processes are only started once a stage has to run
+		with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+			_, failed = build(args.stages, args.production, args.force, pool)
+	except (ValueError, FileNotFoundError) as e:
+		print(f"Error: {e}", file=sys.stderr)
+		sys.exit(1)
+	print(f"Build {'failed' if failed else 'finished'} in {time.monotonic() - start:.2f}s")
+	if failed:
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
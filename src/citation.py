@@ -7,21 +7,35 @@ import sys
 from html.parser import HTMLParser
 import re
 import argparse
+import hashlib
+import json
 from pathlib import Path
 import common as C
 
+CITATION_CACHE = C.BUILD_DIR / 'cache' / 'citations.json'
+
+# Start of a BibTeX entry: @type{key,
+BIBTEX_ENTRY_RE = re.compile(r"^@\w+\s*\{\s*([^,\s]+)\s*,", re.MULTILINE)
+
 def js_escape(s):
 	return s.replace("\\", "\\\\").replace("'", "\\'").replace('\n', ' ')
 
 
 class CSLHTMLExtractor(HTMLParser):
+	"""Collects the formatted text of each bibliography entry, keyed by the id of its `ref-<key>` div."""
 	def __init__(self):
 		super().__init__()
 		self.capture = False
 		self.depth = 0
 		self.chunks = []
+		self.entries = {}
 
 	def handle_starttag(self, tag, attrs):
+		entry_id = dict(attrs).get("id") or ""
+		if tag == "div" and entry_id.startswith("ref-"):
+			self.chunks = self.entries.setdefault(entry_id[len("ref-"):], [])
+			return
+
 		if tag == "div" and ("class", "csl-right-inline") in attrs:
 			self.capture = True
 			self.depth = 1
@@ -52,23 +66,25 @@ class CSLHTMLExtractor(HTMLParser):
 		if self.capture:
 			self.chunks.append(f"&#{name};")
 
-	def get_html(self):
-		return "".join(self.chunks).strip()
+	def get_entries(self):
+		return {key: "".join(chunks).strip() for key, chunks in self.entries.items()}
 
 
-def get_reference_html(bib_id, bibfile, csl):
+def get_references_html(bib_ids, bibfile, csl):
+	"""Renders all given keys in a single pandoc run and returns the HTML of each entry by key."""
 	cmd = [
 		"pandoc",
 		"--citeproc",
 		f"--bibliography={bibfile}",
 		f"--csl={csl}",
-		"-M", f"nocite=@{bib_id}",
+		"-f", "markdown",
 		"-t", "html"
 	]
 
+	document = "---\nnocite: |\n  " + ", ".join("@" + bib_id for bib_id in bib_ids) + "\n---\n"
 	proc = subprocess.run(
 		cmd,
-		input=bib_id,
+		input=document,
 		text=True,
 		encoding="utf-8",
 		capture_output=True,
@@ -77,27 +93,53 @@ def get_reference_html(bib_id, bibfile, csl):
 
 	parser = CSLHTMLExtractor()
 	parser.feed(proc.stdout)
-	return parser.get_html()
+	return parser.get_entries()
+
+
+def bibtex_entries(bibfile):
+	"""Splits a BibTeX file into the source text of its entries by key."""
+	text = Path(bibfile).read_text(encoding="utf-8")
+	starts = list(BIBTEX_ENTRY_RE.finditer(text))
+	return {m.group(1): text[m.start():(starts[i + 1].start() if i + 1 < len(starts) else len(text))].strip() for i, m in enumerate(starts)}
+
+
+def render_citations(bib_ids, bibfile, csl):
+	"""Returns the HTML of each key, reusing the cached rendering of every BibTeX entry that is unchanged under the same CSL style."""
+	entries = bibtex_entries(bibfile)
+	csl_text = Path(csl).read_bytes()
+	digests = {bib_id: hashlib.sha256(csl_text + b"\0" + entries.get(bib_id, bib_id).encode("utf-8")).hexdigest() for bib_id in bib_ids}
+
+	cache = json.loads(CITATION_CACHE.read_text(encoding="utf-8")) if CITATION_CACHE.is_file() else {}
+	missing = [bib_id for bib_id in bib_ids if digests[bib_id] not in cache]
+	if missing:
+		rendered = get_references_html(missing, bibfile, csl)
+		for bib_id in missing:
+			if rendered.get(bib_id):
+				cache[digests[bib_id]] = rendered[bib_id]
+
+	# keep only the entries that are still cited
+	cache = {digest: html for digest, html in cache.items() if digest in digests.values()}
+	CITATION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+	CITATION_CACHE.write_text(json.dumps(cache, indent=1), encoding="utf-8")
+	return {bib_id: cache.get(digests[bib_id], "") for bib_id in bib_ids}
 
 def main():
 	parser = argparse.ArgumentParser(description="Generate tutorials JS entries")
 	parser.add_argument("files", nargs="+", help="TypeScript files")
 	args = parser.parse_args()
 
-	lines = ['const citations = {};']
+	bib_ids = []
 	for ts_file in args.files:
-		code = Path(ts_file).read_text(encoding="utf-8")
-
-		for block, _, _ in C.BLOCK_FUNC_RE.findall(code):
-			ann = C.parse_annotation(block)
-			if "cite" not in ann:
-				continue
-			bibID = ann['cite']
-			html_output = get_reference_html("@" + bibID, C.REFERENCES_BIBTEX_FILE, C.BIBIOLGRAPHY_STYLE_FILE)
-			if not html_output:
-				print(f"Warning: No output for citation {bibID}", file=sys.stderr)
-				continue
-			lines.append(f"citations['{bibID}'] = '{js_escape(html_output)}';")
+		for _, _, ann in C.annotated_functions(ts_file):
+			if "cite" in ann and ann['cite'] not in bib_ids:
+				bib_ids.append(ann['cite'])
+
+	lines = ['const citations = {};']
+	for bibID, html_output in render_citations(bib_ids, C.REFERENCES_BIBTEX_FILE, C.BIBIOLGRAPHY_STYLE_FILE).items():
+		if not html_output:
+			print(f"Warning: No output for citation {bibID}", file=sys.stderr)
+			continue
+		lines.append(f"citations['{bibID}'] = '{js_escape(html_output)}';")
 
 	Path(C.CITATION_JS).write_text("\n".join(lines), encoding="utf-8")
 
@@ -2,6 +2,9 @@
 """Common constants for TypeScript file processing"""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
+import hashlib
+import json
+import os
 import re
 from pathlib import Path
 
@@ -20,9 +23,12 @@ REFERENCES_BIBTEX_FILE = SOURCE_DIR / 'references.bib'
 BIBIOLGRAPHY_STYLE_FILE = SOURCE_DIR / 'plain.csl'
 
 BUILD_DIR = SOURCE_DIR.parent / 'build'
+INDEX_CACHE_DIR = BUILD_DIR / 'cache' / 'index'
 
 JS_DIR = BUILD_DIR / 'js'
 GENERATED_JS = JS_DIR / 'generated.js'
+GENERATED_WORKER_JS = JS_DIR / 'generated_worker.js'
+GENERATED_MAIN_JS = JS_DIR / 'generated_main.js'
 CONCATENATED_JS = BUILD_DIR / 'concatenated.js'
 WORKER_JS = BUILD_DIR / 'worker.js'
 
@@ -50,6 +56,7 @@ STANDALONE_HTML = BUILD_DIR / 'index.html'
 
 CONCATENATED_CSS = BUILD_DIR / "concatenated.css"
 CONCATENATED_HTML = BUILD_DIR / 'concatenated.html'
+SIZE_BUDGET_FILE = SOURCE_DIR / 'size_budget.json'
 
 DIST_DIR = SOURCE_DIR.parent / 'dist'
 DIST_PACKED_HTML = DIST_DIR / 'index.html'
@@ -68,12 +75,6 @@ assert(JS_DIR.is_dir()), f"JS directory not found: {JS_DIR}"
 
 
 
-# Matches annotation block + function definition
-BLOCK_FUNC_RE = re.compile(
-	r"/\*\*([\s\S]*?)\*/\s*function\s+([A-Za-z0-9_]+)\s*\(([^)]*)\)",
-	re.MULTILINE
-)
-
 def parse_annotation(block):
 	ann = {}
 	for line in block.split("\n"):
@@ -98,8 +99,76 @@ def parse_annotation(block):
 			ann["structures"] = line[len("@structures "):].strip()
 		elif line.startswith("@transform_name "):
 			ann["transform_name"] = line[len("@transform_name "):].strip()
+		elif line.startswith("@morphism "):
+			ann["morphism"] = line[len("@morphism "):].strip()
+		elif line.startswith("@start "):
+			ann["start"] = line[len("@start "):].strip()
 	return ann
 
+def parse_morphism(rule):
+	"""Parses the @morphism rule `a -> ab, b -> a` into a dictionary mapping each letter to its image."""
+	images = {}
+	for item in rule.split(','):
+		letter, image = (part.strip() for part in item.split('->'))
+		images[letter] = image
+	return images
+
+# Tokens of a single pass over a TypeScript source: annotation blocks and function definitions
+FUNCTION_TOKEN_RE = re.compile(
+	r"/\*\*([\s\S]*?)\*/|function\s+([A-Za-z0-9_]+)\s*\(([^)]*)\)",
+	re.MULTILINE
+)
+
+def scan_functions(code):
+	"""Lists the functions of a TypeScript source in order as {'name', 'args', 'annotation'} dictionaries.
+	'args' are the argument names without types; 'annotation' is the parsed annotation block directly preceding the function, or None if there is none."""
+	functions = []
+	block, block_end = None, -1
+	for m in FUNCTION_TOKEN_RE.finditer(code):
+		if m.group(2) is None:
+			block, block_end = m.group(1), m.end()
+			continue
+		fname, argstr = m.group(2), m.group(3)
+		documented = block_end >= 0 and not code[block_end:m.start()].strip()
+		functions.append({
+			'name': fname,
+			'args': [a.split(":")[0].strip() for a in argstr.split(",") if a.strip()],
+			'annotation': parse_annotation(block) if documented else None,
+		})
+	return functions
+
+_function_indices = {}
+
+def function_index(ts_file):
+	"""Returns scan_functions() of a TypeScript file, cached on disk by the hash of the file and of this module,
+	so that scripts rebuilding from unchanged sources read the manifest instead of parsing the source."""
+	ts_file = Path(ts_file)
+	content = ts_file.read_bytes()
+	digest = hashlib.sha256(Path(__file__).read_bytes() + b'\0' + content).hexdigest()
+	if digest in _function_indices:
+		return _function_indices[digest]
+	cache_file = INDEX_CACHE_DIR / f'{ts_file.stem}.{digest[:16]}.json'
+	if cache_file.is_file():
+		functions = json.loads(cache_file.read_text(encoding='utf-8'))
+	else:
+		functions = scan_functions(content.decode('utf-8'))
+		INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+		for stale in INDEX_CACHE_DIR.glob(f'{ts_file.stem}.*.json'):
+			if stale != cache_file:
+				stale.unlink(missing_ok=True)
+		# written under a unique name and renamed, since concurrent build stages index the same files
+		tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+		tmp_file.write_text(json.dumps(functions), encoding='utf-8')
+		tmp_file.replace(cache_file)
+	_function_indices[digest] = functions
+	return functions
+
+def annotated_functions(ts_file):
+	"""Yields (function name, argument names, annotation) for the functions of a TypeScript file that have an annotation block."""
+	for f in function_index(ts_file):
+		if f['annotation'] is not None:
+			yield f['name'], f['args'], f['annotation']
+
 def short_prop(fname):
 	# count_xxx → xxx
 	if fname.startswith("generate_"):
@@ -135,10 +204,25 @@ ASSET_DIR = SOURCE_DIR.parent / 'assets'
 
 STANDALONE_PY = SOURCE_DIR / 'standalone.py'
 
+EXTERNAL_CACHE_DIR = BUILD_DIR / 'cache' / 'external'
+
+
+def external_entries(filelist=EXTERNAL_URL):
+	"""Parses the lines `URL [SHA-256]` of the external file list into (url, pinned hash or None) pairs."""
+	entries = []
+	for line in Path(filelist).read_text(encoding='utf-8').splitlines():
+		fields = line.split()
+		if not fields or fields[0].startswith('#'):
+			continue
+		entries.append((fields[0], fields[1].lower() if len(fields) > 1 else None))
+	return entries
+
+def external_filename(url):
+	return Path(urlparse(url).path).name or "index.js"
+
 
 def generate_makefile() -> str:
-	with open(EXTERNAL_URL, 'r', encoding='utf-8') as f:
-		ext_basenames = map(lambda url: Path(urlparse(url).path).name, [line.strip() for line in f if line.strip() and not line.startswith('#')])
+	ext_basenames = [external_filename(url) for url, _ in external_entries()]
 	asset_css_files = list(Path.glob(ASSET_DIR, '*.css'))
 	asset_js_files  = list(Path.glob(ASSET_DIR, '*.js'))
 	buffer = []
@@ -157,7 +241,7 @@ def generate_makefile() -> str:
 	buffer.append('BUILD_DIR_ASSET_CSS := $(subst $(ASSETS_DIR),$(BUILD_DIR)/css,$(ASSET_CSS))')
 	buffer.append('BUILD_DIR_ASSET_JS := $(subst $(ASSETS_DIR),$(BUILD_DIR)/js,$(ASSET_JS))')
 
-	buffer.append('.PHONY: all check test clean')
+	buffer.append('.PHONY: all production check test clean')
 	buffer.append('all: $(BUILD_HTML) $(STANDALONE_HTML) $(DIST_PACKED_HTML)')
 
 	for asset_file in asset_css_files:
@@ -191,13 +275,13 @@ def generate_makefile() -> str:
 	buffer.append(f'\tpython3 {GENERATOR_PY}')
 
 	generator_js = JS_GEN_DIR / 'generator.js'
-	buffer.append(f'{GENERATOR_LENGTHS_JS}: {generator_js} {GENERATOR_PIPELINE_JS} {GENERATOR_LENGTHS_PY}')
+	buffer.append(f'{GENERATOR_LENGTHS_JS}: {GENERATOR_TS} {generator_js} {GENERATOR_PIPELINE_JS} {GENERATOR_LENGTHS_PY}')
 	buffer.append(f'\t@mkdir -p {GENERATOR_LENGTHS_JS.parent}')
 	buffer.append(f'\tpython3 {GENERATOR_LENGTHS_PY}')
 
 	buffer.append(f'{TUTORIAL_JS}: {GENERATOR_TS} {ALGORITHM_TS}  {TUTORIAL_PY}')
 	buffer.append(f'\t@mkdir -p {TUTORIAL_JS.parent}')
-	buffer.append(f'\tpython3 {TUTORIAL_PY} {GENERATOR_TS} {ALGORITHM_TS}')
+	buffer.append(f'\tpython3 {TUTORIAL_PY} --prerender {GENERATOR_TS} {ALGORITHM_TS}')
 
 	buffer.append(f'{CITATION_JS}: {GENERATOR_TS} {ALGORITHM_TS} {CITATION_PY}')
 	buffer.append(f'\t@mkdir -p {CITATION_JS.parent}')
@@ -210,13 +294,18 @@ def generate_makefile() -> str:
 	buffer.append(f'$(DIST_PACKED_HTML): $(STANDALONE_HTML)')
 	buffer.append(f'\t@npx parcel build $< --public-url ./')
 
-	buffer.append('$(GENERATED_JS): $(JS_GEN_FILES) ')
+	# the bundles keep what the asset scripts of the skeleton refer to
+	buffer.append(f'$(GENERATED_JS): $(JS_GEN_FILES) $(ASSET_JS) {SKELETON_HTML} {COMPILE_JAVASCRIPT_PY}')
 	buffer.append(f'\tpython3 {COMPILE_JAVASCRIPT_PY}')
 	
 	buffer.append(f'$(STANDALONE_HTML): $(BUILD_HTML) {STANDALONE_PY}')
 	buffer.append(f'\t@mkdir -p {STANDALONE_HTML.parent}')
 	buffer.append(f'\tpython3 {STANDALONE_PY}')
 
+	# minified and precompressed standalone page, failing if it exceeds the size budget
+	buffer.append(f'production: $(BUILD_HTML) {STANDALONE_PY} {SIZE_BUDGET_FILE}')
+	buffer.append(f'\tpython3 {STANDALONE_PY} --production')
+
 	buffer.append('check:')
 	buffer.append('\tnpx tsc -p .')
 	buffer.append('test:')
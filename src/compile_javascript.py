@@ -1,92 +1,306 @@
 #!/usr/bin/env python3
-"""Concatenates JavaScript files and strips test functions for production builds."""
+"""Concatenates JavaScript files and strips test functions for production builds.
+
+Each generated file is stripped on its own with a lightweight tokenizer that skips strings, template literals,
+regular expressions and comments, and the result is cached by the hash of the file, so that only changed files are re-stripped.
+
+Besides the full generated.js, two bundles keep only the top-level declarations reachable in the call graph
+from the scripts of skeleton.html that use them: generated_worker.js from the worker scripts (prepare_text, build_ds),
+and generated_main.js from the page scripts.
+"""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
+import hashlib
+import json
 import re
 import sys
 from pathlib import Path
 import common as C
 
-FUNC_RE = re.compile(
-	r"function\s+([A-Za-z0-9_]+)\s*\(",
-	re.MULTILINE
-)
+STRIP_CACHE_DIR = C.BUILD_DIR / 'cache' / 'strip'
+
+# Scripts of skeleton.html that are bundled; the worker scripts have type="text/js-worker"
+SKELETON_SCRIPT_RE = re.compile(r'<script\s+([^>]*)src="js/([^"/]+)"[^>]*class="concatenate"[^>]*></script>', re.IGNORECASE)
+DECLARATION_KEYWORDS = {'var', 'let', 'const'}
 
 REMOVE_LINE_RE = re.compile(
 	r'^\s*("use strict";|Object\.defineProperty\(exports|exports\.[A-Za-z0-9_]+\s*=).*',
 	re.MULTILINE
 )
 
-FUNC_START_RE = re.compile(
-	r"(export\s+)?function\s+([A-Za-z0-9_]+)\s*\(",
-	re.MULTILINE
-)
+# Tokens that need no context; '/', '`' and '}' are dispatched by the tokenizer
+TOKEN_RE = re.compile(r"""
+	(?P<space>\s+)
+	|(?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+	|(?P<string>"(?:[^"\\\n]|\\[\s\S])*"?|'(?:[^'\\\n]|\\[\s\S])*'?)
+	|(?P<name>[A-Za-z_$][\w$]*)
+	|(?P<number>\.?\d[\w.]*)
+	|(?P<punct>[^\s\w$"'`/}])
+""", re.VERBOSE)
+# Rest of a template literal up to its end or the next substitution
+TEMPLATE_RE = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*(?:`|\$\{|\Z)")
+REGEX_RE = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+# A '/' after these tokens divides, after anything else it starts a regular expression
+DIVISION_AFTER_PUNCT = {')', ']', '}'}
+REGEX_AFTER_NAMES = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else', 'yield', 'await'}
 
-def strip_functions(code, names_to_strip):
-	out = []
-	pos = 0
 
-	while True:
-		m = FUNC_START_RE.search(code, pos)
-		if not m:
-			out.append(code[pos:])
-			break
+def tokenize(code):
+	"""Returns the significant tokens of JavaScript code as (kind, text, start, end), skipping whitespace and comments.
+	A template literal yields 'template' tokens for its literal parts and the tokens of its substitutions in between;
+	a substitution opens with the punctuation '${' and closes with '}'."""
+	tokens = []
+	# one entry per open '{' or '${', telling whether a '}' closes a block or resumes a template
+	braces = []
+	pos = 0
+	while pos < len(code):
+		c = code[pos]
+		if c == '`' or (c == '}' and braces and braces[-1]):
+			if c == '}':
+				braces.pop()
+				tokens.append(('punct', '}', pos, pos + 1))
+			m = TEMPLATE_RE.match(code, pos + 1)
+			tokens.append(('template', code[pos:m.end()], pos, m.end()))
+			if m.group().endswith('${'):
+				braces.append(True)
+				tokens.append(('punct', '${', m.end() - 2, m.end()))
+			pos = m.end()
+			continue
+		if c == '}':
+			if braces:
+				braces.pop()
+			tokens.append(('punct', '}', pos, pos + 1))
+			pos += 1
+			continue
+		if c == '/':
+			m = TOKEN_RE.match(code, pos)
+			if m:
+				# a comment
+				pos = m.end()
+				continue
+			prev = tokens[-1] if tokens else None
+			divides = prev is not None and (prev[0] in ('number', 'string', 'template', 'regex') or (prev[0] == 'name' and prev[1] not in REGEX_AFTER_NAMES) or prev[1] in DIVISION_AFTER_PUNCT)
+			m = None if divides else REGEX_RE.match(code, pos)
+			if m:
+				tokens.append(('regex', m.group(), pos, m.end()))
+				pos = m.end()
+			else:
+				tokens.append(('punct', '/', pos, pos + 1))
+				pos += 1
+			continue
+		m = TOKEN_RE.match(code, pos)
+		if m.lastgroup not in ('space', 'comment'):
+			tokens.append((m.lastgroup, m.group(), pos, m.end()))
+			if m.group() == '{':
+				braces.append(False)
+		pos = m.end()
+	return tokens
 
-		fname = m.group(2)
 
-		# keep function if not to be stripped
-		if fname not in names_to_strip:
-			out.append(code[pos:m.end()])
-			pos = m.end()
+def matching(tokens, i, opening, closing):
+	"""Returns the index of the token closing the bracket opened at tokens[i]."""
+	depth = 0
+	for j in range(i, len(tokens)):
+		text = tokens[j][1]
+		if tokens[j][0] != 'punct':
 			continue
+		if text in opening:
+			depth += 1
+		elif text == closing:
+			depth -= 1
+			if depth == 0:
+				return j
+	return len(tokens) - 1
 
-		# drop everything from function start to matching closing brace
-		out.append(code[pos:m.start()])
 
-		i = m.end()
-		# find first '{'
-		while i < len(code) and code[i] != "{":
+def strip_functions(code, should_strip):
+	"""Removes the declarations (with a leading `export`) of all functions whose name satisfies `should_strip`.
+	Returns the remaining code and the names of all declared functions."""
+	tokens = tokenize(code)
+	out = []
+	functions = []
+	pos = 0
+	i = 0
+	while i + 2 < len(tokens):
+		if not (tokens[i][:2] == ('name', 'function') and tokens[i + 1][0] == 'name' and tokens[i + 2][1] == '('):
 			i += 1
+			continue
+		fname = tokens[i + 1][1]
+		functions.append(fname)
+		if not should_strip(fname):
+			i += 3
+			continue
+		start = tokens[i - 1][2] if i > 0 and tokens[i - 1][:2] == ('name', 'export') else tokens[i][2]
+		j = matching(tokens, i + 2, ('(',), ')')
+		while j < len(tokens) and tokens[j][1] != '{':
+			j += 1
+		j = matching(tokens, j, ('{', '${'), '}') if j < len(tokens) else len(tokens) - 1
+		out.append(code[pos:start])
+		pos = tokens[j][3]
+		i = j + 1
+	out.append(code[pos:])
+	return "".join(out), functions
+
+
+def references(tokens):
+	"""Returns the names a piece of code refers to, i.e., all names that are not accessed as a property."""
+	return {text for k, (kind, text, _, _) in enumerate(tokens) if kind == 'name' and (k == 0 or tokens[k - 1][1] != '.')}
 
-		if i == len(code):
-			pos = i
+
+def split_statements(code):
+	"""Splits code into its top-level statements as dictionaries {start, end, names, attach, refs}:
+	`start` includes the comments and whitespace before the statement, `names` are the names it declares,
+	`attach` is the name a statement like `tutorials['x'] = ...` starts with, and `refs` the names it refers to."""
+	tokens = tokenize(code)
+	statements = []
+	pos = 0
+	i = 0
+	while i < len(tokens):
+		kind, text = tokens[i][:2]
+		j = i + 1 if text == 'async' and i + 1 < len(tokens) and tokens[i + 1][1] == 'function' else i
+		names = []
+		attach = None
+		if tokens[j][1] in ('function', 'class') and tokens[j][0] == 'name':
+			k = j + 1
+			if k < len(tokens) and tokens[k][1] == '*':
+				k += 1
+			if k < len(tokens) and tokens[k][0] == 'name':
+				names.append(tokens[k][1])
+			while k < len(tokens) and tokens[k][1] != '{':
+				k = matching(tokens, k, ('(',), ')') + 1 if tokens[k][1] == '(' else k + 1
+			end = matching(tokens, k, ('{', '${'), '}') if k < len(tokens) else len(tokens) - 1
+		else:
+			depth = 0
+			end = i
+			expect_name = text in DECLARATION_KEYWORDS
+			while end < len(tokens):
+				t = tokens[end]
+				if t[0] == 'punct':
+					if t[1] in ('(', '[', '{', '${'):
+						depth += 1
+					elif t[1] in (')', ']', '}'):
+						depth -= 1
+					elif depth == 0 and t[1] == ';':
+						break
+					elif depth == 0 and t[1] == ',':
+						expect_name = text in DECLARATION_KEYWORDS
+						end += 1
+						continue
+				if end > i:
+					if expect_name and t[0] == 'name':
+						names.append(t[1])
+					expect_name = False
+				end += 1
+			end = min(end, len(tokens) - 1)
+			if kind == 'name' and text not in DECLARATION_KEYWORDS:
+				attach = text
+		# a stray ';' after a declaration belongs to it
+		if end + 1 < len(tokens) and tokens[end + 1][1] == ';' and tokens[end][1] != ';':
+			end += 1
+		statements.append({
+			'start': pos, 'end': tokens[end][3], 'names': names, 'attach': attach,
+			'refs': sorted(references(tokens[i:end + 1]) - set(names)),
+		})
+		pos = tokens[end][3]
+		i = end + 1
+	return statements
+
+
+def is_test_function(fname):
+	return fname.startswith("test_") or fname == "assert_eq"
+
+
+def strip_file(js_file):
+	"""Returns the stripped code, the declared functions and the top-level statements of a generated file,
+	cached by the hash of the file and of this script."""
+	content = js_file.read_bytes()
+	digest = hashlib.sha256(Path(__file__).read_bytes() + b'\0' + content).hexdigest()
+	cache_file = STRIP_CACHE_DIR / f'{js_file.stem}.{digest[:16]}.json'
+	if cache_file.is_file():
+		cached = json.loads(cache_file.read_text(encoding="utf-8"))
+		return cached['code'], cached['functions'], cached['statements']
+
+	# Strip non-browser-compatible lines
+	code = REMOVE_LINE_RE.sub("", content.decode("utf-8"))
+	code, functions = strip_functions(code, is_test_function)
+	statements = split_statements(code)
+
+	STRIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+	for stale in STRIP_CACHE_DIR.glob(f'{js_file.stem}.*.json'):
+		stale.unlink()
+	cache_file.write_text(json.dumps({'code': code, 'functions': functions, 'statements': statements}), encoding="utf-8")
+	return code, functions, statements
+
+
+def skeleton_roots():
+	"""Returns the names referred to by the worker scripts and by the page scripts of skeleton.html."""
+	roots = {'worker': set(), 'main': set()}
+	for attributes, filename in SKELETON_SCRIPT_RE.findall(C.SKELETON_HTML.read_text(encoding="utf-8")):
+		path = C.ASSET_DIR / filename
+		if not path.is_file():
+			# generated bundles and external libraries
 			continue
+		bundle = 'worker' if 'text/js-worker' in attributes else 'main'
+		roots[bundle] |= references(tokenize(path.read_text(encoding="utf-8")))
+	return roots
 
-		depth = 1
-		i += 1
 
-		while i < len(code) and depth > 0:
-			if code[i] == "{":
-				depth += 1
-			elif code[i] == "}":
-				depth -= 1
-			i += 1
+def reachable(files, roots):
+	"""Returns the set of (file index, statement index) reachable from the names `roots`.
+	Statements that declare nothing and are not assignments to a declared name are always kept."""
+	declared = {}
+	for f, (_, statements) in enumerate(files):
+		for s, statement in enumerate(statements):
+			for name in statement['names']:
+				declared.setdefault(name, []).append((f, s))
+	for f, (_, statements) in enumerate(files):
+		for s, statement in enumerate(statements):
+			if statement['attach'] in declared:
+				declared[statement['attach']].append((f, s))
+
+	kept = set()
+	stack = [(f, s) for f, (_, statements) in enumerate(files) for s, statement in enumerate(statements)
+		if not statement['names'] and statement['attach'] not in declared]
+	stack += [key for name in roots for key in declared.get(name, [])]
+	while stack:
+		key = stack.pop()
+		if key in kept:
+			continue
+		kept.add(key)
+		f, s = key
+		for name in files[f][1][s]['refs']:
+			stack.extend(declared.get(name, []))
+	return kept
 
-		pos = i
 
-	return "".join(out)
+def cleanup(code):
+	return "\n".join(line for line in code.splitlines() if line.strip())
 
 
+def write_bundle(path, files, kept, total_size):
+	"""Writes the kept statements of all files to `path` and prints the size of the bundle."""
+	parts = []
+	for f, (code, statements) in enumerate(files):
+		parts.append("".join(code[st['start']:st['end']] for s, st in enumerate(statements) if (f, s) in kept))
+	bundle = cleanup("\n".join(parts))
+	path.write_text(bundle, encoding="utf-8")
+	declarations = sum(1 for statements in (st for _, st in files) for st in statements if st['names'])
+	kept_declarations = sum(1 for f, s in kept if files[f][1][s]['names'])
+	size = len(bundle.encode("utf-8"))
+	print(f"{path.name}: {kept_declarations}/{declarations} declarations, {size / 1024:.1f} KiB ({100 * size / total_size:.0f}% of {C.GENERATED_JS.name})")
+
 
 def main():
 	all_code = []
 	all_functions = set()
-	test_functions = set()
+	files = []
 
-	# ---- Read and collect ----
+	# ---- Read, strip and collect ----
 	for js_file in sorted(C.JS_GEN_DIR.rglob("*.js")):
-		code = js_file.read_text()
-
-		# Strip non-browser-compatible lines
-		code = REMOVE_LINE_RE.sub("", code)
-
-		# Collect function names
-		for fname in FUNC_RE.findall(code):
-			all_functions.add(fname)
-			if fname.startswith("test_"):
-				test_functions.add(fname)
-
+		code, functions, statements = strip_file(js_file)
+		all_functions.update(functions)
 		all_code.append(code)
+		files.append((code, statements))
 
 	full_code = "\n".join(all_code)
 
@@ -95,25 +309,23 @@ def main():
 		if fname.startswith("construct_") or fname.startswith("generate_") or fname.startswith("count_"):
 			suffix = fname.split("_", 1)[1]
 			test_name = f"test_{suffix}"
-			if test_name not in test_functions:
+			if test_name not in all_functions:
 				print(
 					f"WARNING: missing test for {fname} (expected {test_name})",
 					file=sys.stderr
 				)
 
-	names_to_strip = set(test_functions)
-	names_to_strip.add("assert_eq")
-	full_code = strip_functions(full_code, names_to_strip)
-
 	# ---- Final cleanup ----
-	full_code = "\n".join(
-		line for line in full_code.splitlines()
-		if line.strip()
-	)
+	full_code = cleanup(full_code)
 
 	C.GENERATED_JS.parent.mkdir(parents=True, exist_ok=True)
 	C.GENERATED_JS.write_text(full_code, encoding="utf-8")
 
+	# ---- Bundles of the declarations reachable from the worker and the page ----
+	total_size = len(full_code.encode("utf-8"))
+	roots = skeleton_roots()
+	write_bundle(C.GENERATED_WORKER_JS, files, reachable(files, roots['worker']), total_size)
+	write_bundle(C.GENERATED_MAIN_JS, files, reachable(files, roots['main']), total_size)
+
 if __name__ == "__main__":
 	main()
-
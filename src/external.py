@@ -1,40 +1,180 @@
 #!/usr/bin/env python3
-"""   """
+"""Fetches the external JavaScript libraries listed in external.url into build/js/ext.
+
+Downloads run concurrently and land in a content-addressed cache (build/cache/external/<sha256>).
+A URL pinned to a SHA-256 in external.url is served from the cache without any request once its content is there;
+other URLs are revalidated with ETag/If-Modified-Since. With --offline, or if the network fails, only the cache is used.
+A download not matching its pin is rejected before it reaches the cache, and a cached file is used only if its content
+still hashes to its name.
+"""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urlparse
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 
 import common as C
 
+TIMEOUT = 60
+
+
+class FetchError(Exception):
+	pass
+
+
+class ExternalCache:
+	"""Content-addressed store of downloaded files, plus the validators and hash of the last response of each URL."""
+	def __init__(self, directory: Path):
+		self.directory = Path(directory)
+		self.index_file = self.directory / 'index.json'
+		self.index = json.loads(self.index_file.read_text(encoding='utf-8')) if self.index_file.is_file() else {}
+		self.lock = threading.Lock()
+		self.verified = set()
+
+	def blob(self, digest):
+		"""Returns the path of the cached file with the SHA-256 `digest`, or None if there is none.
+		A file whose content no longer hashes to its name is removed and counts as missing."""
+		if not digest:
+			return None
+		path = self.directory / digest
+		if not path.is_file():
+			return None
+		with self.lock:
+			if digest in self.verified:
+				return path
+		if hashlib.sha256(path.read_bytes()).hexdigest() != digest:
+			print(f"Warning: removing the corrupted cache file {path}", file=sys.stderr)
+			path.unlink(missing_ok=True)
+			return None
+		with self.lock:
+			self.verified.add(digest)
+		return path
+
+	def entry(self, url):
+		with self.lock:
+			return dict(self.index.get(url, {}))
+
+	def store(self, url, data, digest, headers):
+		self.directory.mkdir(parents=True, exist_ok=True)
+		if not self.blob(digest):
+			tmp = self.directory / f'{digest}.tmp'
+			tmp.write_bytes(data)
+			tmp.replace(self.directory / digest)
+		with self.lock:
+			self.verified.add(digest)
+			self.index[url] = {'sha256': digest, 'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+		return digest
+
+	def save(self):
+		self.directory.mkdir(parents=True, exist_ok=True)
+		self.index_file.write_text(json.dumps(self.index, indent=1, sort_keys=True), encoding='utf-8')
 
-def download(url: str) -> None:
-	parsed = urlparse(url)
-	filename = Path(parsed.path).name or "index.js"
-	out_path = C.EXTERNAL_JS_DIR / filename
 
-	with urlopen(url) as response:
-		data = response.read()
+def fetch(url: str, pin, cache: ExternalCache, offline: bool) -> str:
+	"""Returns the SHA-256 of the content of `url` in the cache, downloading it if needed."""
+	if cache.blob(pin):
+		return pin
 
+	cached = cache.entry(url)
+	cached_digest = cached.get('sha256') if cache.blob(cached.get('sha256')) else None
+	if offline:
+		if not cached_digest:
+			raise FetchError(f"{url} is not in the cache and --offline is given")
+		digest = cached_digest
+	else:
+		request = Request(url)
+		if cached_digest:
+			if cached.get('etag'):
+				request.add_header('If-None-Match', cached['etag'])
+			if cached.get('last_modified'):
+				request.add_header('If-Modified-Since', cached['last_modified'])
+		try:
+			with urlopen(request, timeout=TIMEOUT) as response:
+				data, headers = response.read(), response.headers
+			digest = hashlib.sha256(data).hexdigest()
+			# checked before storing, so that neither the cache nor its index ever holds content contradicting the pin
+			if pin and digest != pin:
+				raise FetchError(f"{url}: SHA-256 {digest} of the download does not match the pinned {pin}")
+			cache.store(url, data, digest, headers)
+			print(f"Downloaded {url}")
+		except HTTPError as e:
+			if e.code != 304 or not cached_digest:
+				raise FetchError(f"{url}: HTTP {e.code}") from e
+			digest = cached_digest
+		except (URLError, OSError) as e:
+			if not cached_digest:
+				raise FetchError(f"{url}: {e}") from e
+			print(f"Warning: using the cached copy of {url} ({e})", file=sys.stderr)
+			digest = cached_digest
+
+	if pin and digest != pin:
+		raise FetchError(f"{url}: SHA-256 {digest} does not match the pinned {pin}")
+	return digest
+
+
+def install(blob: Path, out_path: Path) -> None:
+	"""Copies a cached file to its output path, only touching the output if the content is unchanged."""
+	data = blob.read_bytes()
+	if out_path.is_file() and out_path.read_bytes() == data:
+		os.utime(out_path)
+		return
 	out_path.write_bytes(data)
-	print(f"Downloaded {url} -> {out_path}")
+	print(f"Installed {out_path}")
+
+
+def pin_hashes(filelist: Path, digests) -> None:
+	"""Rewrites the file list with the SHA-256 of each URL after it."""
+	lines = []
+	for line in filelist.read_text(encoding='utf-8').splitlines():
+		fields = line.split()
+		if fields and not fields[0].startswith('#') and fields[0] in digests:
+			line = f"{fields[0]} {digests[fields[0]]}"
+		lines.append(line)
+	filelist.write_text('\n'.join(lines) + '\n', encoding='utf-8')
 
 
 def main() -> None:
-	C.EXTERNAL_JS_DIR.mkdir(parents=True, exist_ok=True)
+	parser = argparse.ArgumentParser(description="Fetch the external JavaScript libraries")
+	parser.add_argument("--offline", action="store_true", help="use only the local cache")
+	parser.add_argument("--pin", action="store_true", help="write the SHA-256 of each fetched file into the file list")
+	parser.add_argument("--filelist", type=Path, default=C.EXTERNAL_FILELIST, help="list of URLs with optional SHA-256")
+	parser.add_argument("--cache-dir", type=Path, default=C.EXTERNAL_CACHE_DIR, help="content-addressed download cache")
+	parser.add_argument("--out-dir", type=Path, default=C.EXTERNAL_JS_DIR, help="directory receiving the files")
+	args = parser.parse_args()
+
+	entries = C.external_entries(args.filelist)
+	if not args.pin:
+		for url, pin in entries:
+			if not pin:
+				print(f"Warning: {url} has no SHA-256 pinned in {args.filelist}; run with --pin to add it", file=sys.stderr)
+	cache = ExternalCache(args.cache_dir)
+	args.out_dir.mkdir(parents=True, exist_ok=True)
 
-	lines = C.EXTERNAL_FILELIST.read_text(encoding="utf-8").splitlines()
-	urls = [
-		line.strip()
-		for line in lines
-		if line.strip() and not line.lstrip().startswith("#")
-	]
+	with ThreadPoolExecutor(max_workers=max(1, len(entries))) as pool:
+		futures = {url: pool.submit(fetch, url, None if args.pin else pin, cache, args.offline) for url, pin in entries}
+	cache.save()
 
-	for url in urls:
-		download(url)
+	digests = {}
+	for url, future in futures.items():
+		try:
+			digests[url] = future.result()
+		except FetchError as e:
+			print(f"Error: {e}", file=sys.stderr)
+	if len(digests) < len(entries):
+		sys.exit(1)
+
+	for url, digest in digests.items():
+		install(cache.blob(digest), args.out_dir / C.external_filename(url))
+	if args.pin:
+		pin_hashes(args.filelist, digests)
 
 
 if __name__ == "__main__":
 	main()
-
@@ -6,14 +6,33 @@ import re
 from pathlib import Path
 import common as C
 
+# `const NAME = create_morphism({ a: 'ab', b: 'a' }, 'b'` and the generators returning `morphic_word(NAME, k)`
+MORPHISM_CONSTANT_RE = re.compile(r"const\s+(\w+)\s*=\s*create_morphism\(\{([^}]*)\},\s*'(\w)'")
+MORPHIC_WORD_RE = re.compile(r"function\s+(\w+)\s*\([^)]*\)[^{]*\{\s*return\s+morphic_word\((\w+),")
+
+
+def check_morphisms(code, generators):
+	"""Raises ValueError if the @morphism and @start annotations of a generator disagree with the create_morphism() constant it iterates,
+	since generator_lengths.py computes the lengths of the orders from the annotations."""
+	constants = {}
+	for name, images, start in MORPHISM_CONSTANT_RE.findall(code):
+		constants[name] = (dict(re.findall(r"(\w+)\s*:\s*'([^']*)'", images)), start)
+	iterated = dict(MORPHIC_WORD_RE.findall(code))
+	for _, fname, ann in generators:
+		if "morphism" not in ann:
+			continue
+		constant = iterated.get(fname)
+		if constant not in constants:
+			raise ValueError(f"{fname} declares @morphism but does not return morphic_word() of a create_morphism() constant")
+		if constants[constant] != (C.parse_morphism(ann["morphism"]), ann.get("start", "a")):
+			raise ValueError(f"{fname}: @morphism {ann['morphism']} on @start {ann.get('start', 'a')} disagrees with {constant}")
 
-def main():
-	code = Path(C.GENERATOR_TS).read_text(encoding="utf-8")
 
+def main():
 	generators = []  # (short_name, func_name, ann)
+	functions = {f['name'] for f in C.function_index(C.GENERATOR_TS)}
 
-	for block, fname, _ in C.BLOCK_FUNC_RE.findall(code):
-		ann = C.parse_annotation(block)
+	for fname, _, ann in C.annotated_functions(C.GENERATOR_TS):
 		if "name" not in ann:
 			continue
 
@@ -21,6 +40,8 @@ def main():
 
 		generators.append((short, fname, ann))
 
+	check_morphisms(C.GENERATOR_TS.read_text(encoding="utf-8"), generators)
+
 	# ---------------- JS output ----------------
 
 	js_lines = []
@@ -28,6 +49,12 @@ def main():
 	for short, fname, ann in generators:
 		js_lines.append(f"\t'{short}': {fname},")
 	js_lines.append("};")
+	# generators with a prefix_ function can produce texts of arbitrary length
+	js_lines.append("const string_generator_prefixes = {")
+	for short, fname, ann in generators:
+		if f"prefix_{short}" in functions:
+			js_lines.append(f"\t'{short}': prefix_{short},")
+	js_lines.append("};")
 
 	Path(C.GENERATOR_PIPELINE_JS).write_text("\n".join(js_lines), encoding="utf-8")
 
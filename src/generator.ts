@@ -15,17 +15,134 @@ function assert_eq(a: any, b: any, message: string) {
 
 }
 
+// A substitution rule over code units: `images[c]` is the image of the letter with code unit `c`,
+// `coding` optionally maps the letters of an iterate to the letters of the generated word,
+// `orders[k]` memoizes the k-th iterate of the start letter, and from order `prolongable` on each iterate is a prefix of the next.
+interface Morphism {
+    images: Uint16Array[];
+    coding: number[] | null;
+    orders: Uint16Array[];
+    prolongable: number;
+}
+
+/**
+ * Compiles a substitution rule, given as the image of each letter, that is iterated on the letter `start`.
+ * The optional `coding` maps the letters of the iterates to the letters of the generated word.
+ */
+function create_morphism(images: { [letter: string]: string }, start: string, coding?: { [letter: string]: string }): Morphism {
+    const table: Uint16Array[] = [];
+    for (const letter in images) {
+        table[letter.charCodeAt(0)] = Uint16Array.from(images[letter].split(''), c => c.charCodeAt(0));
+    }
+    let coding_table: number[] | null = null;
+    if (coding) {
+        coding_table = [];
+        for (const letter in coding) coding_table[letter.charCodeAt(0)] = coding[letter].charCodeAt(0);
+    }
+    // the iterates grow along the first letters start, images[start][0], ... until a letter is the first of its own image
+    let first = start.charCodeAt(0);
+    let prolongable = 0;
+    while (table[first][0] != first && prolongable < table.length) {
+        first = table[first][0];
+        ++prolongable;
+    }
+    return { images: table, coding: coding_table, orders: [Uint16Array.of(start.charCodeAt(0))], prolongable: prolongable };
+}
+
+/**
+ * Applies the morphism to `word`, writing at most the first `limit` letters of the image into a preallocated buffer.
+ */
+function morphism_expand(m: Morphism, word: Uint16Array, limit: number): Uint16Array {
+    const images = m.images;
+    let length = 0;
+    let end = 0;
+    while (end < word.length && length < limit) length += images[word[end++]].length;
+    const result = new Uint16Array(Math.min(length, limit));
+    let pos = 0;
+    for (let i = 0; i < end; ++i) {
+        const image = images[word[i]];
+        for (let j = 0; j < image.length && pos < result.length; ++j) result[pos++] = image[j];
+    }
+    return result;
+}
+
+/**
+ * Returns the k-th iterate of the start letter, expanding iteratively from the largest memoized order.
+ */
+function morphism_order(m: Morphism, k: number): Uint16Array {
+    const orders = m.orders;
+    while (orders.length <= k) orders.push(morphism_expand(m, orders[orders.length - 1], Infinity));
+    return orders[Math.max(0, k)];
+}
+
+/**
+ * Returns the length-`length` prefix of the fixed point, taken from the first prolongable iterate that is at least that long.
+ * Iterates beyond the memoized ones are expanded only as far as they contribute to the prefix.
+ */
+function morphism_prefix(m: Morphism, length: number): Uint16Array {
+    morphism_order(m, m.prolongable);
+    const orders = m.orders;
+    for (let k = m.prolongable; k < orders.length; ++k) {
+        if (orders[k].length >= length) return orders[k].subarray(0, Math.max(0, length));
+    }
+    let word = orders[orders.length - 1];
+    // stop if the iterates no longer grow, e.g., for a letter whose image is itself
+    for (let stalled = 0; word.length < length && stalled < m.images.length;) {
+        const next = morphism_expand(m, word, length);
+        stalled = next.length > word.length ? 0 : stalled + 1;
+        word = next;
+    }
+    return word;
+}
+
+/**
+ * Decodes code units into a string, mapping each letter by `coding` if given.
+ */
+function units_to_string(units: Uint16Array, coding: number[] | null): string {
+    if (coding) {
+        const coded = new Uint16Array(units.length);
+        for (let i = 0; i < units.length; ++i) coded[i] = coding[units[i]];
+        units = coded;
+    }
+    const chunks: string[] = [];
+    // fromCharCode takes its letters as arguments, so decode in chunks that fit on the stack
+    for (let i = 0; i < units.length; i += 1 << 14) {
+        chunks.push(String.fromCharCode.apply(null, units.subarray(i, i + (1 << 14)) as any));
+    }
+    return chunks.join('');
+}
+
+/**
+ * Returns the k-th word generated by the morphism.
+ */
+function morphic_word(m: Morphism, k: number): string {
+    return units_to_string(morphism_order(m, k), m.coding);
+}
+
+/**
+ * Returns the length-`length` prefix of the word generated by the morphism.
+ */
+function morphic_prefix(m: Morphism, length: number): string {
+    return units_to_string(morphism_prefix(m, length), m.coding);
+}
+
+const FIBONACCI_MORPHISM = create_morphism({ a: 'ab', b: 'a' }, 'b');
+
 /**
  * @name Fibonacci
  * @description k-th Fibonacci Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to ab, b \to a \} \) on the letter 'b'
  * @wikipedia Fibonacci_word
  * @oeis A003849
+ * @morphism a -> ab, b -> a
+ * @start b
  */
 function generate_fibonacci_word(k: number): string {
-    if (k <= 0) return "b";
-    const prev = generate_fibonacci_word(k - 1);
-    return [...prev].map(c => (c == 'a') ? 'ab' : 'a').join('');
+    return morphic_word(FIBONACCI_MORPHISM, k);
+}
+
+function prefix_fibonacci_word(length: number): string {
+    return morphic_prefix(FIBONACCI_MORPHISM, length);
 }
 
 export function test_fibonacci_word() {
@@ -38,21 +155,23 @@ export function test_fibonacci_word() {
     assert_eq(generate_fibonacci_word(6), "abaababaabaab", "Fibonacci Word 6");
 }
 
+const TRIBONACCI_MORPHISM = create_morphism({ a: 'ab', b: 'ac', c: 'a' }, 'a');
+
 /**
  * @name Tribonacci
  * @description k-th Tribonacci Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to ab, b \to ac, c \to a \} \) on the letter 'a'
  * @oeis A080843
  * @wikipedia Tribonacci_word
+ * @morphism a -> ab, b -> ac, c -> a
+ * @start a
  */
 function generate_tribonacci_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_tribonacci_word(k - 1);
-    return [...prev].map(c => {
-        if (c == 'a') return 'ab';
-        if (c == 'b') return 'ac';
-        return 'a';
-    }).join('');
+    return morphic_word(TRIBONACCI_MORPHISM, k);
+}
+
+function prefix_tribonacci_word(length: number): string {
+    return morphic_prefix(TRIBONACCI_MORPHISM, length);
 }
 export function test_tribonacci_word() {
     assert_eq(generate_tribonacci_word(0), "a", "Tribonacci Word 0");
@@ -67,17 +186,23 @@ export function test_tribonacci_word() {
 
 }
 
+const THUE_MORSE_MORPHISM = create_morphism({ a: 'ab', b: 'ba' }, 'a');
+
 /**
  * @name Thue-Morse
  * @description k-th Thue-Morse Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to ab, b \to ba \} \) on the letter 'a'
  * @oeis A010060
  * @wikipedia Thue-Morse_sequence
+ * @morphism a -> ab, b -> ba
+ * @start a
  */
 function generate_thue_morse_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_thue_morse_word(k - 1);
-    return prev + [...prev].map(c => (c == 'a') ? 'b' : 'a').join('');
+    return morphic_word(THUE_MORSE_MORPHISM, k);
+}
+
+function prefix_thue_morse_word(length: number): string {
+    return morphic_prefix(THUE_MORSE_MORPHISM, length);
 }
 
 export function test_thue_morse_word() {
@@ -88,17 +213,23 @@ export function test_thue_morse_word() {
     assert_eq(generate_thue_morse_word(4), "abbabaabbaababba", "Thue-Morse Word 4");
 }
 
+const MEPHISTO_WALTZ_MORPHISM = create_morphism({ a: 'aab', b: 'bba' }, 'a');
+
 /**
  * @name Mephisto-Waltz
  * @description k-th Mephisto-Waltz Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to aab, b \to bba \} \) on the letter 'a'
  * @oeis A064990
  * @cite allouche03automatic
+ * @morphism a -> aab, b -> bba
+ * @start a
  */
 function generate_mephisto_waltz_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_mephisto_waltz_word(k - 1);
-    return [...prev].map(char => (char == 'a') ? 'aab' : 'bba').join('');
+    return morphic_word(MEPHISTO_WALTZ_MORPHISM, k);
+}
+
+function prefix_mephisto_waltz_word(length: number): string {
+    return morphic_prefix(MEPHISTO_WALTZ_MORPHISM, length);
 }
 
 export function test_mephisto_waltz_word() {
@@ -110,21 +241,23 @@ export function test_mephisto_waltz_word() {
 }
 
 
+const VTM_MORPHISM = create_morphism({ a: 'abc', b: 'ac', c: 'b' }, 'a');
+
 /**
  * @name vtm
  * @description variant ternary squarefree Thue–Morse word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to abc, b \to ac, c \to b \} \) on the letter 'a'
  * @oeis: A036580
  *
+ * @morphism a -> abc, b -> ac, c -> b
+ * @start a
  */
 function generate_vtm_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_vtm_word(k - 1);
-    return [...prev].map((c) => {
-        if (c == 'a') return 'abc';
-        if (c == 'b') return 'ac';
-        return 'b';
-    }).join('');
+    return morphic_word(VTM_MORPHISM, k);
+}
+
+function prefix_vtm_word(length: number): string {
+    return morphic_prefix(VTM_MORPHISM, length);
 }
 export function test_vtm_word() {
     assert_eq(generate_vtm_word(0), "a", "vtm Word 0");
@@ -135,16 +268,22 @@ export function test_vtm_word() {
     assert_eq(generate_vtm_word(5), "abcacbabcbacabcacbacabcbabcacbabcbacabcbabcacbac", "vtm Word 4");
 }
 
+const SIERPINSKI_MORPHISM = create_morphism({ a: 'aba', b: 'bbb' }, 'a');
+
 /**
  * @name Sierpinski
  * @description Sierpinski Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to aba, b \to bbb \} \) on the letter 'a'
  * @oeis A316829
+ * @morphism a -> aba, b -> bbb
+ * @start a
  */
 function generate_sierpinski_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_sierpinski_word(k - 1);
-    return [...prev].map(c => (c == 'a') ? 'aba' : 'bbb').join('');
+    return morphic_word(SIERPINSKI_MORPHISM, k);
+}
+
+function prefix_sierpinski_word(length: number): string {
+    return morphic_prefix(SIERPINSKI_MORPHISM, length);
 }
 
 export function test_sierpinski_word() {
@@ -155,17 +294,23 @@ export function test_sierpinski_word() {
     assert_eq(generate_sierpinski_word(4), "ababbbababbbbbbbbbababbbababbbbbbbbbbbbbbbbbbbbbbbbbbbababbbababbbbbbbbbababbbaba", "Sierpinski Word 4");
 }
 
+const PELL_MORPHISM = create_morphism({ a: 'aab', b: 'a' }, 'a');
+
 /**
  * @name Pell
  * @description k-th Pell Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to aab, b \to a \} \) on the letter 'a'
  * @oeis A171588
  * @wikipedia Pell_number
+ * @morphism a -> aab, b -> a
+ * @start a
  */
 function generate_pell_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_pell_word(k - 1);
-    return [...prev].map(c => (c == 'a') ? 'aab' : 'a').join('');
+    return morphic_word(PELL_MORPHISM, k);
+}
+
+function prefix_pell_word(length: number): string {
+    return morphic_prefix(PELL_MORPHISM, length);
 }
 export function test_pell_word() {
     assert_eq(generate_pell_word(0), "a", "Pell Word 0");
@@ -175,16 +320,22 @@ export function test_pell_word() {
     assert_eq(generate_pell_word(4), "aabaabaaabaabaaabaabaabaaabaabaaabaabaaba", "Pell Word 4");
 }
 
+const CHACON_MORPHISM = create_morphism({ a: 'aaba', b: 'b' }, 'a');
+
 /**
  * @name Chacon
  * @description k-th Chacon Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to aaba, b \to b \} \) on the letter 'a'
  * @oeis A049320
+ * @morphism a -> aaba, b -> b
+ * @start a
  */
 function generate_chacon_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_chacon_word(k - 1);
-    return [...prev].map(c => (c == 'a') ? 'aaba' : 'b').join('');
+    return morphic_word(CHACON_MORPHISM, k);
+}
+
+function prefix_chacon_word(length: number): string {
+    return morphic_prefix(CHACON_MORPHISM, length);
 }
 export function test_chacon_word() {
     assert_eq(generate_chacon_word(0), "a", "Chacon Word 0");
@@ -193,16 +344,22 @@ export function test_chacon_word() {
     assert_eq(generate_chacon_word(3), "aabaaababaabaaabaaababaababaabaaababaaba", "Chacon Word 3");
 }
 
+const VON_NEUMANN_MORPHISM = create_morphism({ a: 'aab', b: 'b' }, 'a');
+
 /**
  * @name Neumannn
  * @description von Neumann Word
  * @tutorial Pure morphic word generated by the morphism \( \{ a \to aab, b \to b \} \) on the letter 'a'
  * @oeis A308187
+ * @morphism a -> aab, b -> b
+ * @start a
  */
 function generate_von_neumann_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = generate_von_neumann_word(k - 1);
-    return [...prev].map(c => (c == 'a') ? 'aab' : 'b').join('');
+    return morphic_word(VON_NEUMANN_MORPHISM, k);
+}
+
+function prefix_von_neumann_word(length: number): string {
+    return morphic_prefix(VON_NEUMANN_MORPHISM, length);
 }
 export function test_von_neumann_word() {
     assert_eq(generate_von_neumann_word(0), "a", "von Neumann Word 0");
@@ -213,16 +370,7 @@ export function test_von_neumann_word() {
     assert_eq(generate_von_neumann_word(5), "aabaabbaabaabbbaabaabbaabaabbbbaabaabbaabaabbbaabaabbaabaabbbbb", "von Neumann Word 5");
 }
 
-function rudin_shapiro_preword(k: number): string {
-    if (k <= 0) return "a";
-    const prev = rudin_shapiro_preword(k - 1);
-    return [...prev].map(c => {
-        if (c == 'a') return 'ab';
-        if (c == 'b') return 'ac';
-        if (c == 'c') return 'db';
-        return 'dc';
-    }).join('');
-}
+const RUDIN_SHAPIRO_MORPHISM = create_morphism({ a: 'ab', b: 'ac', c: 'db', d: 'dc' }, 'a', { a: 'a', b: 'a', c: 'b', d: 'b' });
 
 /**
  * @name Rudin-Shapiro
@@ -230,11 +378,15 @@ function rudin_shapiro_preword(k: number): string {
  * @tutorial Morphic word generated by the morphism \( \{ a \to ab, b \to ac, c \to db, d \to dc \} \) followed by the coding \( \{ a,b \to a; c,d \to b \} \) on the letter 'a'
  * @oeis A020987
  * @wikipedia Rudin–Shapiro_sequence
+ * @morphism a -> ab, b -> ac, c -> db, d -> dc
+ * @start a
  */
 function generate_rudin_shapiro_word(k: number): string {
-    if (k <= 0) return "a";
-    const prev = rudin_shapiro_preword(k);
-    return [...prev].map(c => (c == 'a' || c == 'b') ? 'a' : 'b').join('');
+    return morphic_word(RUDIN_SHAPIRO_MORPHISM, k);
+}
+
+function prefix_rudin_shapiro_word(length: number): string {
+    return morphic_prefix(RUDIN_SHAPIRO_MORPHISM, length);
 }
 
 export function test_rudin_shapiro_word() {
@@ -246,16 +398,7 @@ export function test_rudin_shapiro_word() {
     assert_eq(generate_rudin_shapiro_word(5), "aaabaabaaaabbbabaaabaababbbaaaba", "Rudin-Shapiro Word 5");
 }
 
-function baum_sweet_preword(k: number): string {
-    if (k <= 0) return "a";
-    const prev = baum_sweet_preword(k - 1);
-    return [...prev].map(c => {
-        if (c == 'a') return 'ab';
-        if (c == 'b') return 'cb';
-        if (c == 'c') return 'bd';
-        return 'dd';
-    }).join('');
-}
+const BAUM_SWEET_MORPHISM = create_morphism({ a: 'ab', b: 'cb', c: 'bd', d: 'dd' }, 'a', { a: 'a', b: 'b', c: 'a', d: 'a' });
 
 /**
  * @name Baum-Sweet
@@ -263,12 +406,15 @@ function baum_sweet_preword(k: number): string {
  * @tutorial Word defined by setting the \(j\)-th letter to 'b' if the binary representation of \(j\) contains no block of consecutive 0s of odd length, and to 'a' otherwise.
  * @oeis A086747
  * @wikipedia Baum–Sweet_sequence
+ * @morphism a -> ab, b -> cb, c -> bd, d -> dd
+ * @start a
  */
 function generate_baum_sweet_word(k: number): string {
-    if (k <= 0) return "a";
-    // Alternatively, we can generate it using morphism and coding:
-    const prev = baum_sweet_preword(k);
-    return [...prev].map(c => (c == 'c' || c == 'd') ? 'a' : c).join('');
+    return morphic_word(BAUM_SWEET_MORPHISM, k);
+}
+
+function prefix_baum_sweet_word(length: number): string {
+    return morphic_prefix(BAUM_SWEET_MORPHISM, length);
 }
 export function test_baum_sweet_word() {
     assert_eq(generate_baum_sweet_word(0), "a", "Baum-Sweet Word 0");
@@ -286,17 +432,34 @@ export function test_baum_sweet_word() {
  * @wikipedia Kolakoski_sequence
  */
 function generate_kolakoski_word(k: number): string {
-    if (k <= 0) return "ab";
-    const prev = generate_kolakoski_word(k - 1);
-    let result = "";
-    for (let i = 0; i < prev.length; ++i) {
-        if (i % 2 == 0) {
-            result += (prev[i] == 'a') ? 'a' : 'aa';
-        } else {
-            result += (prev[i] == 'a') ? 'b' : 'bb';
-        }
+    // the k-th word lists the runs of the (k-1)-th word, so each word is a prefix of the next
+    let word = kolakoski_units(2);
+    for (let i = 0; i < k; ++i) {
+        let length = 0;
+        for (let j = 0; j < word.length; ++j) length += (word[j] == 97) ? 1 : 2;
+        word = kolakoski_units(length);
     }
-    return result;
+    return units_to_string(word, null);
+}
+
+/**
+ * Writes the first `length` letters of the Kolakoski sequence, generating each run from the letter it is described by.
+ */
+function kolakoski_units(length: number): Uint16Array {
+    const units = new Uint16Array(Math.max(0, length));
+    const seed = [97, 98, 98];
+    let pos = 0;
+    for (; pos < units.length && pos < seed.length; ++pos) units[pos] = seed[pos];
+    for (let run = 2; pos < units.length; ++run) {
+        const letter = (run % 2 == 0) ? 97 : 98;
+        units[pos++] = letter;
+        if (units[run] == 98 && pos < units.length) units[pos++] = letter;
+    }
+    return units;
+}
+
+function prefix_kolakoski_word(length: number): string {
+    return units_to_string(kolakoski_units(length), null);
 }
 export function test_kolakoski_word() {
     assert_eq(generate_kolakoski_word(0), "ab", "Kolakoski Word 0");
@@ -331,3 +494,31 @@ export function test_generator_edge_cases() {
     const thue5 = generate_thue_morse_word(5);
     assert_eq(thue5.length, 32, "Thue-Morse Word 5 has correct length");
 }
+
+export function test_generator_prefixes() {
+    const generators: [(k: number) => string, (length: number) => string][] = [
+        [generate_fibonacci_word, prefix_fibonacci_word],
+        [generate_tribonacci_word, prefix_tribonacci_word],
+        [generate_thue_morse_word, prefix_thue_morse_word],
+        [generate_mephisto_waltz_word, prefix_mephisto_waltz_word],
+        [generate_vtm_word, prefix_vtm_word],
+        [generate_sierpinski_word, prefix_sierpinski_word],
+        [generate_pell_word, prefix_pell_word],
+        [generate_chacon_word, prefix_chacon_word],
+        [generate_von_neumann_word, prefix_von_neumann_word],
+        [generate_rudin_shapiro_word, prefix_rudin_shapiro_word],
+        [generate_baum_sweet_word, prefix_baum_sweet_word],
+        [generate_kolakoski_word, prefix_kolakoski_word],
+    ];
+    for (const [generate, prefix] of generators) {
+        const word = generate(8);
+        for (const length of [0, 1, 2, 5, 17, word.length - 1, word.length]) {
+            assert_eq(prefix(length), word.substring(0, length), `Prefix of length ${length} of ${word.substring(0, 8)}`);
+        }
+    }
+    // prefixes beyond the memoized orders are expanded only partially
+    const long_prefix = prefix_thue_morse_word(1000);
+    assert_eq(long_prefix.length, 1000, "Thue-Morse prefix has the requested length");
+    assert_eq(long_prefix, generate_thue_morse_word(10).substring(0, 1000), "Thue-Morse prefix matches order 10");
+    assert_eq(generate_fibonacci_word(3), "aba", "Fibonacci Word 3 after memoizing higher orders");
+}
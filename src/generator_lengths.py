@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
-"""Precomputes order-to-length mappings for all string generators up to length 2^15."""
+"""Precomputes order-to-length mappings for all string generators up to a maximum length (2^15 by default).
+
+Lengths are computed exactly from the annotation block of a generator if it declares
+a substitution rule `@morphism a -> ab, b -> a` iterated on the letter `@start b`.
+Only generators declaring none are run in Node, each in its own process.
+"""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
+import argparse
+import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import common as C
 
+MAX_ORDER = 200
+
 
 _JS = r"""
 'use strict';
@@ -14,6 +24,7 @@ const fs = require('fs');
 const path = require('path');
 
 const repoDir = process.cwd();
+const [name, maxLength, maxOrder] = process.argv.slice(2);
 
 function loadStripped(file) {
 	const code = fs.readFileSync(file, 'utf8');
@@ -34,26 +45,41 @@ vm.createContext(context);
 vm.runInContext(loadStripped(path.join(repoDir, 'build/js/gen/generator.js')), context);
 vm.runInContext(loadStripped(path.join(repoDir, 'build/js/gen/generator_pipeline.js')), context);
 
-const MAX_LEN = 32768; // 2^15
-const result = {};
-
-for (const [name, gen] of Object.entries(context.string_generators)) {
-	const lengths = [];
-	for (let k = 0; k <= 200; k++) {
-		const text = gen(k);
-		if (text.length > MAX_LEN) break;
-		lengths.push(text.length);
+const gen = context.string_generators[name];
+const lengths = [];
+for (let k = 0; k <= Number(maxOrder); k++) {
+	let text;
+	try {
+		text = gen(k);
+	} catch (e) {
+		// orders beyond the longest string Node can hold cannot be generated in the browser either
+		if (e.name === 'RangeError') break;
+		throw e;
 	}
-	result[name] = lengths;
+	if (text.length > Number(maxLength)) break;
+	lengths.push(text.length);
 }
 
-process.stdout.write('const generator_lengths = ' + JSON.stringify(result) + ';\n');
+process.stdout.write(JSON.stringify(lengths));
 """
 
 
-def main():
+def morphism_lengths(images, start, max_length):
+	"""Lengths of the iterates of `start`, tracked as the letter counts of each iterate, i.e., a row vector times powers of the incidence matrix."""
+	letters = sorted(images)
+	matrix = [[images[x].count(y) for y in letters] for x in letters]
+	counts = [1 if x == start else 0 for x in letters]
+	lengths = []
+	while len(lengths) <= MAX_ORDER and sum(counts) <= max_length:
+		lengths.append(sum(counts))
+		counts = [sum(counts[i] * matrix[i][j] for i in range(len(letters))) for j in range(len(letters))]
+	return lengths
+
+
+def node_lengths(name, max_length):
+	"""Lengths measured by running the compiled generator in Node."""
 	result = subprocess.run(
-		['node', '--input-type=commonjs'],
+		['node', '--input-type=commonjs', '-', name, str(max_length), str(MAX_ORDER)],
 		input=_JS,
 		capture_output=True, text=True,
 		cwd=str(C.REPOSITORY_DIR)
@@ -61,7 +87,33 @@ def main():
 	if result.returncode != 0:
 		print(result.stderr, file=sys.stderr)
 		sys.exit(1)
-	C.GENERATOR_LENGTHS_JS.write_text(result.stdout, encoding='utf-8')
+	return json.loads(result.stdout)
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Precompute the lengths of the orders of all string generators")
+	parser.add_argument("--max-length", type=int, default=1 << 15, help="largest length to list (at most 2^31)")
+	args = parser.parse_args()
+	if not 0 < args.max_length <= 1 << 31:
+		parser.error("--max-length must be between 1 and 2^31")
+
+	result = {}
+	fallback = []
+	for fname, _, ann in C.annotated_functions(C.GENERATOR_TS):
+		if "name" not in ann:
+			continue
+		short = C.short_prop(fname)
+		if "morphism" in ann:
+			result[short] = morphism_lengths(C.parse_morphism(ann["morphism"]), ann.get("start", "a"), args.max_length)
+		else:
+			result[short] = None
+			fallback.append(short)
+
+	with ThreadPoolExecutor() as pool:
+		for short, lengths in zip(fallback, pool.map(lambda name: node_lengths(name, args.max_length), fallback)):
+			result[short] = lengths
+
+	C.GENERATOR_LENGTHS_JS.write_text('const generator_lengths = ' + json.dumps(result, separators=(',', ':')) + ';\n', encoding='utf-8')
 
 
 if __name__ == '__main__':
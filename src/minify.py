@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Minifies JavaScript and CSS for the production build of the standalone page.
+
+JavaScript is rewritten from the tokens of compile_javascript.tokenize: comments and indentation are dropped,
+line breaks are kept so that automatic semicolon insertion still applies, and a space stays only where two tokens would merge.
+CSS loses its comments and all whitespace that does not separate words.
+"""
+# pylint: disable=bad-indentation,line-too-long,invalid-name
+
+import re
+import compile_javascript as CJ
+
+# A space between these characters keeps two tokens apart, e.g., `a + +b`, `x / /re/` or `return x`
+WORD_CHAR_RE = re.compile(r'[\w$\\]')
+MERGING_PUNCT = {('+', '+'), ('-', '-'), ('/', '/'), ('/', '*'), ('<', '!'), ('-', '>')}
+
+CSS_TOKEN_RE = re.compile(r"""
+	(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+	|(?P<comment>/\*[\s\S]*?\*/)
+	|(?P<space>\s+)
+	|(?P<other>[^"'/\s]+|/)
+""", re.VERBOSE)
+# Whitespace next to these characters separates nothing
+CSS_TIGHT = set('{};,')
+
+
+def needs_space(left, right):
+	if WORD_CHAR_RE.match(left[-1]) and WORD_CHAR_RE.match(right[0]):
+		return True
+	# `1 .toFixed()` must not become the number `1.`
+	if left[-1].isdigit() and right[0] == '.':
+		return True
+	return (left[-1], right[0]) in MERGING_PUNCT
+
+
+def minify_js(code):
+	"""Returns `code` without comments and without whitespace that separates nothing."""
+	out = []
+	last = None
+	pos = 0
+	for _, _, start, end in CJ.tokenize(code):
+		if end <= pos:
+			continue
+		# a template literal resumed by '}' overlaps the '}' token
+		text = code[max(start, pos):end]
+		if last is not None and start > pos:
+			gap = code[pos:start]
+			if '\n' in gap:
+				out.append('\n')
+			elif needs_space(last, text):
+				out.append(' ')
+		out.append(text)
+		last = text
+		pos = end
+	return ''.join(out)
+
+
+def minify_css(code):
+	"""Returns `code` without comments and without whitespace that separates nothing."""
+	out = []
+	pending_space = False
+	for m in CSS_TOKEN_RE.finditer(code):
+		kind, text = m.lastgroup, m.group()
+		if kind == 'comment':
+			continue
+		if kind == 'space':
+			pending_space = bool(out)
+			continue
+		if pending_space and out[-1][-1] not in CSS_TIGHT and text[0] not in CSS_TIGHT:
+			out.append(' ')
+		pending_space = False
+		if kind == 'other':
+			if text[0] == '}' and out and out[-1].endswith(';'):
+				out[-1] = out[-1][:-1]
+			text = text.replace(';}', '}')
+		out.append(text)
+	return ''.join(out)
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
-"""   """
+"""Builds build/index.html with all concatenated CSS and JavaScript inlined, and build/concatenated.html referring to them.
+
+With --production, the inlined JavaScript and CSS are minified, index.html, concatenated.js and concatenated.css
+get precompressed .gz and .br siblings, and the build fails if a file exceeds its budget in size_budget.json.
+"""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
+import argparse
+import gzip
+import json
 from pathlib import Path
 import re
+import subprocess
 import sys
 import common as C
+import minify
 
 WORKER_SCRIPT_RE = re.compile(
 	r'<script\s+[^>]*type="text/js-worker"\s+src="([^"]+)"[^>]*class="concatenate"[^>]*></script>',
@@ -22,10 +31,58 @@ CSS_RE = re.compile(
 	re.IGNORECASE
 )
 
+# Brotli is not in the Python standard library, but in the zlib module of Node
+BROTLI_JS = r"""
+const zlib = require('zlib');
+const input = require('fs').readFileSync(0);
+process.stdout.write(zlib.brotliCompressSync(input, { params: {
+	[zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+	[zlib.constants.BROTLI_PARAM_SIZE_HINT]: input.length,
+} }));
+"""
+
 def warn(msg):
 	print(f"Warning: {msg}", file=sys.stderr)
 
-def main(html_output_filepath : Path, do_inplace: bool):
+def read_asset(path: Path, production: bool):
+	content = path.read_text(encoding="utf-8")
+	if not production:
+		return content
+	return minify.minify_css(content) if path.suffix == '.css' else minify.minify_js(content)
+
+def brotli_compress(data: bytes) -> bytes:
+	result = subprocess.run(['node', '-e', BROTLI_JS], input=data, capture_output=True, check=False)
+	if result.returncode != 0:
+		raise RuntimeError(f"brotli compression failed: {result.stderr.decode(errors='replace')}")
+	return result.stdout
+
+def compress(paths):
+	"""Writes the .gz and .br siblings of each file; returns the rows (name, size, gzip size, brotli size)."""
+	rows = []
+	for path in paths:
+		data = path.read_bytes()
+		# mtime=0 keeps the archive identical across builds of the same content
+		gz = gzip.compress(data, compresslevel=9, mtime=0)
+		br = brotli_compress(data)
+		path.with_name(path.name + '.gz').write_bytes(gz)
+		path.with_name(path.name + '.br').write_bytes(br)
+		rows.append((path.name, len(data), len(gz), len(br)))
+	return rows
+
+def print_sizes(rows):
+	print(f"{'asset':<20} {'size':>10} {'gzip':>10} {'ratio':>6} {'brotli':>10} {'ratio':>6}")
+	for name, size, gz, br in rows:
+		print(f"{name:<20} {size:>10} {gz:>10} {gz / size:>6.1%} {br:>10} {br / size:>6.1%}")
+
+def over_budget(rows, budget):
+	"""Returns a message for each file, e.g. `index.html.br`, larger than its budget in bytes."""
+	sizes = {}
+	for name, size, gz, br in rows:
+		sizes[name], sizes[name + '.gz'], sizes[name + '.br'] = size, gz, br
+	return [f"{name} has {sizes[name]} bytes, exceeding its budget of {limit} bytes"
+		for name, limit in budget.items() if name in sizes and sizes[name] > limit]
+
+def write_html(html_output_filepath : Path, do_inplace: bool, production: bool = False):
 	if not C.BUILD_HTML.exists():
 		print(f"Error: {C.BUILD_HTML} does not exist", file=sys.stderr)
 		sys.exit(1)
@@ -73,7 +130,7 @@ def main(html_output_filepath : Path, do_inplace: bool):
 		combined_js = []
 		for path in worker_js_list:
 			try:
-				combined_js.append(path.read_text(encoding="utf-8"))
+				combined_js.append(read_asset(path, production))
 			except Exception as e:
 				warn(f"Failed to read JS {path}: {e}")
 		C.WORKER_JS.write_text("\n".join(combined_js), encoding="utf-8")
@@ -85,7 +142,7 @@ def main(html_output_filepath : Path, do_inplace: bool):
 		combined_js = []
 		for path in js_list:
 			try:
-				combined_js.append(path.read_text(encoding="utf-8"))
+				combined_js.append(read_asset(path, production))
 			except Exception as e:
 				warn(f"Failed to read JS {path}: {e}")
 		C.CONCATENATED_JS.write_text("\n".join(combined_js), encoding="utf-8")
@@ -96,7 +153,7 @@ def main(html_output_filepath : Path, do_inplace: bool):
 		combined_css = []
 		for path in css_list:
 			try:
-				combined_css.append(path.read_text(encoding="utf-8"))
+				combined_css.append(read_asset(path, production))
 			except Exception as e:
 				warn(f"Failed to read CSS {path}: {e}")
 		C.CONCATENATED_CSS.write_text("\n".join(combined_css), encoding="utf-8")
@@ -131,6 +188,28 @@ def main(html_output_filepath : Path, do_inplace: bool):
 
 	html_output_filepath.write_text("".join(final_lines), encoding="utf-8")
 
+def main():
+	parser = argparse.ArgumentParser(description="Build the standalone HTML page")
+	parser.add_argument("--production", action="store_true", help="minify, precompress and check the size budget")
+	parser.add_argument("--budget", type=Path, default=C.SIZE_BUDGET_FILE, help="JSON file mapping output files to their maximum size in bytes")
+	args = parser.parse_args()
+
+	write_html(C.CONCATENATED_HTML, False, args.production)
+	write_html(C.STANDALONE_HTML, True, args.production)
+	outputs = [path for path in (C.STANDALONE_HTML, C.CONCATENATED_JS, C.CONCATENATED_CSS) if path.is_file()]
+	if not args.production:
+		# siblings of an earlier production build no longer match
+		for path in outputs:
+			for suffix in ('.gz', '.br'):
+				path.with_name(path.name + suffix).unlink(missing_ok=True)
+	else:
+		rows = compress(outputs)
+		print_sizes(rows)
+		errors = over_budget(rows, json.loads(args.budget.read_text(encoding="utf-8")))
+		for error in errors:
+			print(f"Error: {error}", file=sys.stderr)
+		if errors:
+			sys.exit(1)
+
 if __name__ == "__main__":
-	main(C.CONCATENATED_HTML, False)
-	main(C.STANDALONE_HTML, True)
+	main()
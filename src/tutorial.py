@@ -1,51 +1,142 @@
 #!/usr/bin/env python3
-"""Generates tutorial JavaScript entries from TypeScript annotation comments."""
+"""Generates tutorial JavaScript entries from TypeScript annotation comments.
+
+With --prerender, the TeX math of all tutorials, \\( inline \\) and \\[ display \\], is typeset to SVG at build time
+by MathJax in a single Node process (npm package mathjax-full), so that the page needs MathJax only for math
+that could not be prerendered. Renderings are cached by the hash of the TeX and of the Node script.
+"""
 # pylint: disable=bad-indentation,line-too-long,invalid-name
 
-import re
 import argparse
+import hashlib
+import json
+import re
+import subprocess
+import sys
 from pathlib import Path
 
 import common as C
 
+MATH_CACHE = C.BUILD_DIR / 'cache' / 'math.json'
+
+# \( inline math \) or \[ display math \]
+MATH_RE = re.compile(r"\\\((?P<inline>.+?)\\\)|\\\[(?P<display>.+?)\\\]", re.DOTALL)
+
+# Reads a JSON list of [tex, display] and writes the list of SVG renderings, with null for TeX that fails to parse
+_MATHJAX_JS = r"""
+'use strict';
+const { mathjax } = require('mathjax-full/js/mathjax.js');
+const { TeX } = require('mathjax-full/js/input/tex.js');
+const { SVG } = require('mathjax-full/js/output/svg.js');
+const { liteAdaptor } = require('mathjax-full/js/adaptors/liteAdaptor.js');
+const { RegisterHTMLHandler } = require('mathjax-full/js/handlers/html.js');
+const { AllPackages } = require('mathjax-full/js/input/tex/AllPackages.js');
+
+const adaptor = liteAdaptor();
+RegisterHTMLHandler(adaptor);
+const tex = new TeX({ packages: AllPackages, formatError: (jax, err) => { throw err; } });
+// each formula carries its own glyphs, since tutorials are shown one at a time
+const svg = new SVG({ fontCache: 'local' });
+const doc = mathjax.document('', { InputJax: tex, OutputJax: svg });
+
+const items = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify(items.map(([formula, display]) => {
+	try {
+		return adaptor.outerHTML(doc.convert(formula, { display: display }));
+	} catch (e) {
+		process.stderr.write(`Warning: cannot prerender ${formula}: ${e.message}\n`);
+		return null;
+	}
+})));
+"""
+
 def js_escape(s):
 	return s.replace("\\", "\\\\").replace("'", "\\'")
 
+def typeset(items):
+	"""Renders the (tex, display) items in one Node process; returns None if MathJax cannot be run."""
+	try:
+		result = subprocess.run(
+			['node', '-e', _MATHJAX_JS],
+			input=json.dumps(items),
+			capture_output=True, text=True, encoding="utf-8", check=False,
+			cwd=str(C.REPOSITORY_DIR)
+		)
+	except OSError as e:
+		print(f"Warning: cannot run node, math is left to MathJax in the browser ({e})", file=sys.stderr)
+		return None
+	warnings = [line for line in result.stderr.splitlines() if line.startswith("Warning:")]
+	if result.returncode != 0:
+		# typically, the npm package mathjax-full is not installed
+		errors = [line for line in result.stderr.splitlines() if 'Error' in line and line not in warnings]
+		print(f"Warning: cannot run MathJax, math is left to MathJax in the browser ({errors[0] if errors else result.returncode})", file=sys.stderr)
+		return None
+	for line in warnings:
+		print(line, file=sys.stderr)
+	return json.loads(result.stdout)
+
+def prerender_math(texts):
+	"""Returns the texts with every formula replaced by its SVG rendering, keeping the TeX of formulas that fail."""
+	formulas = {}
+	for text in texts:
+		for m in MATH_RE.finditer(text):
+			display = m.group("display") is not None
+			formula = m.group("display") if display else m.group("inline")
+			digest = hashlib.sha256(_MATHJAX_JS.encode("utf-8") + (b"\1" if display else b"\0") + formula.encode("utf-8")).hexdigest()
+			formulas[m.group()] = (digest, formula, display)
+
+	cache = json.loads(MATH_CACHE.read_text(encoding="utf-8")) if MATH_CACHE.is_file() else {}
+	missing = sorted({(digest, formula, display) for digest, formula, display in formulas.values() if digest not in cache})
+	if missing:
+		rendered = typeset([[formula, display] for _, formula, display in missing]) or []
+		for (digest, _, _), svg in zip(missing, rendered):
+			if svg is not None:
+				cache[digest] = svg.replace("\n", " ")
+
+	# keep only the formulas that still occur
+	digests = {digest for digest, _, _ in formulas.values()}
+	cache = {digest: svg for digest, svg in cache.items() if digest in digests}
+	MATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+	MATH_CACHE.write_text(json.dumps(cache, indent=1), encoding="utf-8")
+	return [MATH_RE.sub(lambda m: cache.get(formulas[m.group()][0], m.group()), text) for text in texts]
+
 def main():
 	parser = argparse.ArgumentParser(description="Generate tutorials JS entries")
 	parser.add_argument("files", nargs="+", help="TypeScript files")
+	parser.add_argument("--prerender", action="store_true", help="typeset the math to SVG with MathJax in Node")
 	args = parser.parse_args()
 
-	lines = ['const tutorials = {};']
-
+	entries = []
 	for ts_file in args.files:
-		code = Path(ts_file).read_text(encoding="utf-8")
-
-		for block, fname, _ in C.BLOCK_FUNC_RE.findall(code):
-			ann = C.parse_annotation(block)
-
+		for fname, _, ann in C.annotated_functions(ts_file):
 			# Required annotations
 			if not all(k in ann for k in ("name", "description", "tutorial")):
 				continue
+			entries.append((C.short_prop(fname), ann))
 
-			key = C.short_prop(fname)
+	contents = [ann['tutorial'] for _, ann in entries]
+	if args.prerender:
+		contents = prerender_math(contents)
+
+	lines = ['const tutorials = {};']
 
-			lines.append(f"tutorials['{key}'] = {{")
-			lines.append(f"\t'title' : '{js_escape(ann['name'])}',")
-			lines.append(f"\t'content' : '{js_escape(ann['tutorial'])}',")
+	for (key, ann), content in zip(entries, contents):
+		lines.append(f"tutorials['{key}'] = {{")
+		lines.append(f"\t'title' : '{js_escape(ann['name'])}',")
+		lines.append(f"\t'content' : '{js_escape(content)}',")
 
-			if "oeis" in ann:
-				lines.append(f"\t'oeis' : '{js_escape(ann['oeis'])}',")
-			if "cite" in ann:
-				lines.append(f"\t'cite' : '{js_escape(ann['cite'])}',")
-			if "wikipedia" in ann:
-				lines.append(f"\t'wikipedia' : '{js_escape(ann['wikipedia'])}',")
+		if "oeis" in ann:
+			lines.append(f"\t'oeis' : '{js_escape(ann['oeis'])}',")
+		if "cite" in ann:
+			lines.append(f"\t'cite' : '{js_escape(ann['cite'])}',")
+		if "wikipedia" in ann:
+			lines.append(f"\t'wikipedia' : '{js_escape(ann['wikipedia'])}',")
 
-			# remove trailing comma safely
-			if lines[-1].endswith(","):
-				lines[-1] = lines[-1][:-1]
+		# remove trailing comma safely
+		if lines[-1].endswith(","):
+			lines[-1] = lines[-1][:-1]
 
-			lines.append("};\n")
+		lines.append("};\n")
 
 	Path(C.TUTORIAL_JS).write_text("\n".join(lines), encoding="utf-8")
 
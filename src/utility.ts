@@ -58,16 +58,26 @@ export function test_number_of_runs(): void {
     assert_eq(number_of_runs("  a b  c"), 6, "Test 12: Multiple spaces and single characters."); 
 }
 
+// Index and length arrays are built as Int32Array, whose buffers the worker transfers to the page.
+type IntArrayLike = readonly number[] | Int32Array;
+
+// Factorizations are built as Uint8Array with 1 marking a factor end; boolean arrays are accepted as well.
+type FactorizationLike = readonly boolean[] | Uint8Array;
+
 /**
  * Calculates the size of a factorization.
  * Factor ends are marked with '1's (represented as `true` booleans) in the factorization.
  *
- * @param factorization An array of booleans representing the factorization, where `true` marks a factor end.
- * @returns The total count of `true` booleans (factor ends) found in the factorization.
+ * @param factorization An array of booleans or a Uint8Array representing the factorization, where `true` or 1 marks a factor end.
+ * @returns The total count of factor ends found in the factorization.
  */
-function number_of_factors(factorization: readonly boolean[]): number {
+function number_of_factors(factorization: FactorizationLike): number {
     if(!factorization) { return 0; }
-    return factorization.reduce((count, value) => count + (value ? 1 : 0), 0);
+    let count = 0;
+    for (let i = 0; i < factorization.length; ++i) {
+        if (factorization[i]) { ++count; }
+    }
+    return count;
 }
 
 
@@ -90,6 +100,10 @@ export function test_number_of_factors(): void {
     assert_eq(number_of_factors([false, false, false, false, true]), 1, "Test Case 9: True at the end of the array.");
     assert_eq(number_of_factors([false, true, false, false, false]), 1, "Test Case 10: True in the middle of the array.");
     assert_eq(number_of_factors([true, true, false, true, true, false, true]), 5, "Test Case 11: Multiple blocks of true values.");
+
+    // Typed factorizations
+    assert_eq(number_of_factors(Uint8Array.of(1, 0, 1, 1, 0)), 3, "Test Case 12: Uint8Array factorization.");
+    assert_eq(number_of_factors(new Uint8Array(0)), 0, "Test Case 13: Empty Uint8Array.");
 }
 
 /**
@@ -180,8 +194,8 @@ export function test_padFunctions(): void {
  * @param inc The amount by which to increment each number. Defaults to 1.
  * @returns A new array with each number incremented.
  */
-function increment_array(array: number[], inc: number = 1): number[] {
-    return array.map((x: number) => x + inc);
+function increment_array(array: IntArrayLike, inc: number = 1): number[] {
+    return Array.from(array, (x: number) => x + inc);
 }
 export function test_increment_array(): void {
     // Test case 1: Basic increment
@@ -217,6 +231,9 @@ export function test_increment_array(): void {
     
     // Test case 10: Array with only one element
     assert_eq(increment_array([7], 3), [10], "Test Case 10 Failed: Single element array");
+
+    // Test case 11: Typed array input yields a plain array
+    assert_eq(increment_array(Int32Array.of(0, 4, 2)), [1, 5, 3], "Test Case 11 Failed: Int32Array input");
 }
 
 
@@ -227,8 +244,8 @@ export function test_increment_array(): void {
  * @param max_length The maximum allowed value for elements in the array.
  * @returns A new array where invalid positions are replaced with a hyphen.
  */
-function replace_invalid_position(array: number[], max_length: number): (number | string)[] {
-    return array.map((x) => (x >= max_length) ? '-' : x);
+function replace_invalid_position(array: IntArrayLike, max_length: number): (number | string)[] {
+    return Array.from(array, (x: number) => (x >= max_length) ? '-' : x);
 }
 
 export function test_replace_invalid_position(): void {
@@ -261,6 +278,9 @@ export function test_replace_invalid_position(): void {
 
     // Test case 10: Large numbers
     assert_eq(replace_invalid_position([1000, 99999, 100000], 100000), [1000, 99999, '-'], "Test Case 10 Failed: Large numbers.");
+
+    // Test case 11: Typed array input
+    assert_eq(replace_invalid_position(Int32Array.of(3, 1, 0), 3), ['-', 1, 0], "Test Case 11 Failed: Int32Array input.");
 }
 
 /**
@@ -279,16 +299,18 @@ export function test_replace_invalid_position(): void {
  * @param {boolean} [doTabularize=true] If true, each character is padded to a uniform width
  *                                      and `sep` is used. If false, `sep` is ignored (becomes '')
  *                                      and no padding is applied (width becomes 0).
+ * @param {number} [length=text.length] The length of the whole row when `text` is a window of it,
+ *                                      so that windows are padded like the whole row.
  * @returns {string} The prettified string.
  */
-function prettify_string(text: string, sep: string = " ", base: number = 0, do_tabularize: boolean = true): string {
+function prettify_string(text: string, sep: string = " ", base: number = 0, do_tabularize: boolean = true, length: number = text.length): string {
     text = text.split('\0').join("$");
 
     // Calculate the width for padding.
-    // If do_tabularize is true, width is the length of the string representation of (text.length + base - 1).
+    // If do_tabularize is true, width is the length of the string representation of (length + base - 1).
     // If do_tabularize is false, width is 0, meaning no padding will be applied effectively.
-    // Example: if (text.length + base - 1) is 123, then String(123).length is 3. So width will be 3.
-    const width: number = do_tabularize ? String(text.length + base - 1).length : 0;
+    // Example: if (length + base - 1) is 123, then String(123).length is 3. So width will be 3.
+    const width: number = do_tabularize ? String(length + base - 1).length : 0;
 
     // Determine the effective separator. If do_tabularize is false, the separator is always an empty string.
     let effectiveSep: string = sep;
@@ -361,6 +383,9 @@ export function test_prettify_string(): void {
     // pad_left("a", ' ', 3) -> "  a"
     assert_eq(prettify_string("a", " ", -10, true), "  a", "Test Case 8 Failed: Single char, negative base, width=3");
 
+    // Test Case 9: A window of a longer row is padded like the whole row
+    assert_eq(prettify_string("bc", " ", 0, true, 11), " b  c", "Test Case 9 Failed: Window of a row of length 11");
+
 }
 
 /**
@@ -369,20 +394,22 @@ export function test_prettify_string(): void {
  * based on the number of digits in the largest possible index (array.length + base - 1).
  *
  * @template T The type of elements in the array, must be convertible to string.
- * @param array The array of values to prettify.
+ * @param array The array of values to prettify; typed arrays are accepted as well.
  * @param sep The separator string to use between prettified array elements. Defaults to a single space.
  * @param base The base offset for calculating the maximum index width. Defaults to 0.
  *             For example, if you want indices to start from 1, pass base = 1.
+ * @param length The length of the whole row when `array` is a window of it. Defaults to `array.length`.
  * @returns A string with the prettified and joined array elements.
  */
 function prettify_array<T extends { toString(): string }>(
-    array: T[],
+    array: ArrayLike<T>,
     sep: string = " ",
-    base: number = 0
+    base: number = 0,
+    length: number = array.length
 ): string {
-    const maxIndexValue = Math.max(0, array.length + base - 1);
+    const maxIndexValue = Math.max(0, length + base - 1);
     const width = ("" + maxIndexValue).toString().length;
-    return array.map((x) => pad_left("" + x, ' ', width)).join(sep);
+    return Array.from(array, (x) => pad_left("" + x, ' ', width)).join(sep);
 }
 
 /**
@@ -407,6 +434,9 @@ export function test_prettify_array(): void {
 
     assert_eq(prettify_array([123]), "123", "Test 6 Failed: Single element");
     assert_eq(prettify_array([5]), "5", "Test 6.1 Failed: Single digit single element");
+
+    assert_eq(prettify_array(Int32Array.of(1, 22, 333)), "1 22 333", "Test 7 Failed: Int32Array input");
+    assert_eq(prettify_array([4, 5], " ", 0, 100), " 4  5", "Test 8 Failed: Window of a row of length 100");
 }
 
 
@@ -418,29 +448,30 @@ export function test_prettify_array(): void {
  *
  * @param text An array of strings representing the factors or elements.
  *             The special string `'\0'` (null character) at the last position can be replaced by `'$'`.
- * @param factorization An array of booleans indicating where factors end.
- *                      `factorization[i] = true` means a factor ends at position `i`.
+ * @param factorization An array of booleans or a Uint8Array indicating where factors end.
+ *                      `factorization[i] = true` (or 1) means a factor ends at position `i`.
  * @param sep The default separator string to use between elements. Defaults to " ".
  *            When `factorization[i]` is true, the first character of `sep` is replaced by `'|'`,
  *            e.g., if `sep` is `" X"`, it becomes `"|X"`.
  *            If `sep` is an empty string `""`, `substring(1)` will correctly yield `""`.
  * @param base A base number used to influence the calculation of the padding width. Defaults to 0.
- *             The width is determined by the length of the string representation of `(factorization.length + base - 1)`.
+ *             The width is determined by the length of the string representation of `(length + base - 1)`.
+ * @param length The length of the whole row when `text` and `factorization` are a window of it. Defaults to `text.length`.
  * @returns A formatted string representing the prettified factorization.
  */
-function prettify_factorization(text: string[], factorization: boolean[], sep: string = " ", base: number = 0): string {
+function prettify_factorization(text: string[], factorization: FactorizationLike, sep: string = " ", base: number = 0, length: number = text.length): string {
     const n: number = text.length;
-    /* The width calculation ensures a minimum width of 1 (for String(0).length) even if n + base - 1 is negative. */
-    const width: number = String(Math.max(0, n + base - 1)).length;
+    /* The width calculation ensures a minimum width of 1 (for String(0).length) even if length + base - 1 is negative. */
+    const width: number = String(Math.max(0, length + base - 1)).length;
 
     let result: string = "";
     for (let i: number = 0; i < n; ++i) {
         // Determine the element to display. If it's the last element and the string '\0', replace with '$'.
         const elementToDisplay: string = (i === n - 1 && text[i] === '\0') ? '$' : text[i];
         result += pad_left(elementToDisplay, ' ', width);
-        // Append separator. If `factorization[i]` is true, use '|' followed by the rest of `sep`.
+        // Append separator. If a factor ends at `i`, use '|' followed by the rest of `sep`.
         // `sep.substring(1)` is safe even if `sep` is an empty string, returning `""`.
-        result += (factorization[i] === true) ? ('|' + sep.substring(1)) : sep;
+        result += factorization[i] ? ('|' + sep.substring(1)) : sep;
     }
     return result;
 }
@@ -478,6 +509,12 @@ export function test_prettify_factorization(): void {
 
     // Case 11: Empty separator
     assert_eq(prettify_factorization(["m", "n"], [false, true], ""), "mn|", "Case 11: Empty separator");
+
+    // Case 12: Uint8Array factorization
+    assert_eq(prettify_factorization(["a", "b", "c"], Uint8Array.of(0, 1, 0)), "a b|c ", "Case 12: Uint8Array factorization");
+
+    // Case 13: Window of a longer row
+    assert_eq(prettify_factorization(["a", "b"], [true, false], " ", 0, 20), " a| b ", "Case 13: Window of a row of length 20");
 }
 
 
@@ -669,7 +706,9 @@ function partitionsFromBool(boolArr: boolean[]): number[] {
 	return parts;
 }
 
-function export_latex(rows: Row[]): string {
+// Yields the LaTeX table of `rows` in pieces of at most `chunk_cells` cells, so large tables can be written
+// to a Blob without building one huge string; export_latex joins the pieces.
+function* export_latex_chunks(rows: Row[], chunk_cells: number = 4096): IterableIterator<string> {
 	const n = rows[0].data.length;
 
 	const tRow = rows.find(isStringRow);
@@ -678,12 +717,11 @@ function export_latex(rows: Row[]): string {
 	}
 	const T = tRow.data;
 
-	const out: string[] = [];
-	out.push(`\\begin{tabular}{l|${"c".repeat(n)}}`);
-	out.push("\\hline");
+	yield `\\begin{tabular}{l|${"c".repeat(n)}}\n\\hline`;
 
 	for (const row of rows) {
-		let line = `${escapeLatex(row.name)} & `;
+		let line = `\n${escapeLatex(row.name)} & `;
+		let cells = 0;
 
 		if (isBoolRow(row)) {
 			const parts = partitionsFromBool(row.data);
@@ -699,24 +737,29 @@ function export_latex(rows: Row[]): string {
 
 				line += `\\multicolumn{${k}}{c}{${text}}`;
 				if (p !== parts.length - 1) line += " & ";
+				cells += k;
+				if (cells >= chunk_cells) { yield line; line = ""; cells = 0; }
 			}
 		} else {
 			for (let i = 0; i < n; i++) {
 				line += escapeLatex(row.data[i]);
 				if (i !== n - 1) line += " & ";
+				if (++cells === chunk_cells) { yield line; line = ""; cells = 0; }
 			}
 		}
 
-		line += " \\\\";
-		out.push(line);
+		yield line + " \\\\";
 	}
 
-	out.push("\\hline");
-	out.push("\\end{tabular}");
-	return out.join("\n");
+	yield "\n\\hline\n\\end{tabular}";
 }
 
-function export_markdown(rows: Row[]): string {
+function export_latex(rows: Row[]): string {
+	return Array.from(export_latex_chunks(rows)).join("");
+}
+
+// Yields the markdown table of `rows` in pieces of at most `chunk_cells` cells; export_markdown joins them.
+function* export_markdown_chunks(rows: Row[], chunk_cells: number = 4096): IterableIterator<string> {
 	const n = rows[0].data.length;
 
 	const tRow = rows.find(isStringRow);
@@ -725,36 +768,37 @@ function export_markdown(rows: Row[]): string {
 	}
 	const T = tRow.data;
 
-	const out: string[] = [];
-
 	/* header */
-	const header: string[] = [" "];
+	let line = "| ";
 	for (let i = 0; i < n; i++) {
-		header.push(String(i + 1));
+		line += "|" + String(i + 1);
+		if ((i + 1) % chunk_cells === 0) { yield line; line = ""; }
 	}
-	out.push("|" + header.join("|") + "|");
-	out.push("|" + repeat("---|", n + 1));
+	yield line + "|\n|" + repeat("---|", n + 1);
 
 	for (const row of rows) {
-		const cells: string[] = [row.name];
+		line = "\n|" + row.name + "|";
 
 		if (isBoolRow(row)) {
-			let s = "";
 			for (let i = 0; i < n; i++) {
-				s += T[i];
-				if (row.data[i]) s += "|";
+				line += T[i];
+				if (row.data[i]) line += "|";
+				if ((i + 1) % chunk_cells === 0) { yield line; line = ""; }
 			}
-			cells.push(s);
+			line += "|";
 		} else {
 			for (let i = 0; i < n; i++) {
-				cells.push(String(row.data[i]));
+				line += String(row.data[i]) + "|";
+				if ((i + 1) % chunk_cells === 0) { yield line; line = ""; }
 			}
 		}
 
-		out.push("|" + cells.join("|") + "|");
+		yield line;
 	}
+}
 
-	return out.join("\n");
+function export_markdown(rows: Row[]): string {
+	return Array.from(export_markdown_chunks(rows)).join("");
 }
 
 function escape_csv(value: unknown): string {
@@ -765,24 +809,25 @@ function escape_csv(value: unknown): string {
 	return s;
 }
 
-
-
-function export_csv(rows: Row[]): string {
+// Yields the CSV lines of `rows` in pieces of at most `chunk_cells` cells; export_csv joins them.
+function* export_csv_chunks(rows: Row[], chunk_cells: number = 4096): IterableIterator<string> {
 	const n = rows[0].data.length;
 
-	const out: string[] = [];
-	for (const row of rows) {
-		const cells: string[] = [];
-		cells.push(row.name);
+	for (let r = 0; r < rows.length; r++) {
+		const row = rows[r];
+		let line = (r > 0 ? "\n" : "") + escape_csv(row.name);
 
-                for (let i = 0; i < n; i++) {
-                    cells.push(String(row.data[i]));
-                }
+		for (let i = 0; i < n; i++) {
+			line += "," + escape_csv(String(row.data[i]));
+			if ((i + 1) % chunk_cells === 0) { yield line; line = ""; }
+		}
 
-		out.push(cells.map(escape_csv).join(","));
+		yield line;
 	}
+}
 
-	return out.join("\n");
+function export_csv(rows: Row[]): string {
+	return Array.from(export_csv_chunks(rows)).join("");
 }
 export function test_export_formats(): void {
     const rows: Row[] = [
@@ -816,5 +861,197 @@ S,one,two,three,four,five`;
     assert_eq(export_latex(rows), expectedLatex, "LaTeX export failed");
     assert_eq(export_markdown(rows), expectedMarkdown, "Markdown export failed");
     assert_eq(export_csv(rows), expectedCSV, "CSV export failed");
+
+    // Chunked exports concatenate to the same tables
+    assert_eq(Array.from(export_latex_chunks(rows, 2)).join(""), expectedLatex, "Chunked LaTeX export failed");
+    assert_eq(Array.from(export_markdown_chunks(rows, 2)).join(""), expectedMarkdown, "Chunked markdown export failed");
+    assert_eq(Array.from(export_csv_chunks(rows, 2)).join(""), expectedCSV, "Chunked CSV export failed");
+    assert_eq(Array.from(export_csv_chunks(rows, 2)).length, 12, "CSV rows are split into chunks of two cells");
+}
+
+
+/**
+ * One entry of the per-structure profile that `build_ds` records when given a profile array.
+ */
+interface ProfileEntry {
+    name: string;
+    time_ms: number;
+    length: number | null;
+    heap_delta: number | null;
+}
+
+/**
+ * Returns a high-resolution timestamp in milliseconds.
+ */
+function profile_now(): number {
+    return typeof performance !== 'undefined' ? performance.now() : Date.now();
 }
 
+/**
+ * Returns the used JavaScript heap in bytes, or NaN if the runtime does not expose it.
+ * Node.js reports it via `process.memoryUsage()`, Chromium via `performance.memory`.
+ */
+function profile_heap(): number {
+    const env: any = globalThis;
+    if (env.process && typeof env.process.memoryUsage === 'function') {
+        return env.process.memoryUsage().heapUsed;
+    }
+    if (env.performance && env.performance.memory) {
+        return env.performance.memory.usedJSHeapSize;
+    }
+    return NaN;
+}
+
+/**
+ * Appends the cost of building one structure to a profile.
+ * The heap delta is approximate since garbage collection may run in between, and is null if the heap size is unavailable.
+ *
+ * @param profile The profile to append to.
+ * @param name The name of the structure.
+ * @param value The constructed structure, whose length is recorded if it has one.
+ * @param start_time The value of `profile_now()` before the construction.
+ * @param start_heap The value of `profile_heap()` before the construction.
+ */
+function profile_record(profile: ProfileEntry[], name: string, value: any, start_time: number, start_heap: number): void {
+    const heap: number = profile_heap();
+    profile.push({
+        name: name,
+        time_ms: profile_now() - start_time,
+        length: (value !== null && value !== undefined && typeof value.length === 'number') ? value.length : null,
+        heap_delta: (isNaN(heap) || isNaN(start_heap)) ? null : heap - start_heap,
+    });
+}
+
+/**
+ * Formats a profile as a table sorted by decreasing time, one structure per line.
+ */
+function format_profile(profile: readonly ProfileEntry[]): string {
+    const sorted: ProfileEntry[] = [...profile].sort((a, b) => b.time_ms - a.time_ms);
+    const pad: number = sorted.reduce((max, entry) => Math.max(max, entry.name.length), 0);
+    return sorted.map(entry => {
+        let line: string = pad_right(entry.name, ' ', pad) + ' ' + pad_left(entry.time_ms.toFixed(1), ' ', 8) + ' ms';
+        if (entry.length !== null) { line += '  len ' + entry.length; }
+        if (entry.heap_delta !== null) { line += '  heap ' + (entry.heap_delta >= 0 ? '+' : '') + (entry.heap_delta / 1024).toFixed(0) + ' KiB'; }
+        return line;
+    }).join('\n');
+}
+
+export function test_profile(): void {
+    const profile: ProfileEntry[] = [];
+    profile_record(profile, "suffix_array", [2, 1, 0], profile_now(), profile_heap());
+    profile_record(profile, "counter_n", 3, profile_now(), NaN);
+    assert_eq(profile.length, 2, "Two profile entries");
+    assert_eq(profile[0].length, 3, "Length of an array structure");
+    assert_eq(profile[1].length, null, "Length of a counter");
+    assert_eq(profile[1].heap_delta, null, "Heap delta without a start value");
+    assert_eq(profile[0].time_ms >= 0, true, "Non-negative time");
+
+    const formatted = format_profile([
+        { name: "n", time_ms: 0.04, length: null, heap_delta: null },
+        { name: "lpf_array", time_ms: 12.5, length: 100, heap_delta: 2048 },
+    ]);
+    assert_eq(formatted, "lpf_array     12.5 ms  len 100  heap +2 KiB\nn              0.0 ms", "Formatted profile");
+}
+
+// Least-recently-used store of built structures, addressed by the content of the text and the structure name.
+// Sizes are counted in elements: the length of an array or string, and 1 for a counter.
+interface ResultCache {
+    entries: Map<string, ResultCacheEntry>;
+    size: number;
+    capacity: number;
+    last_text: string | null;
+    last_key: string;
+}
+
+interface ResultCacheEntry {
+    text: string;
+    value: any;
+    size: number;
+}
+
+/**
+ * Returns a content address of a text: its length and two 32-bit FNV-1a hashes with different offsets.
+ */
+function text_hash(text: string): string {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193;
+    for (let i = 0; i < text.length; ++i) {
+        const c = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ c, 0x01000193);
+        h2 = Math.imul(h2 ^ c, 0x01000193) ^ (h2 >>> 15);
+    }
+    return text.length + ':' + (h1 >>> 0).toString(16) + (h2 >>> 0).toString(16);
+}
+
+/**
+ * @param capacity The maximum total size of the cached structures.
+ */
+function result_cache_create(capacity: number): ResultCache {
+    return { entries: new Map(), size: 0, capacity: capacity, last_text: null, last_key: '' };
+}
+
+function result_cache_key(cache: ResultCache, text: string, name: string): string {
+    if (cache.last_text !== text) {
+        cache.last_key = text_hash(text);
+        cache.last_text = text;
+    }
+    return cache.last_key + '\n' + name;
+}
+
+/**
+ * Returns the cached structure `name` of `text` and marks it as most recently used, or undefined if it is not cached.
+ */
+function result_cache_get(cache: ResultCache, text: string, name: string): any {
+    const key = result_cache_key(cache, text, name);
+    const entry = cache.entries.get(key);
+    if (entry === undefined || entry.text !== text) { return undefined; }
+    cache.entries.delete(key);
+    cache.entries.set(key, entry);
+    return entry.value;
+}
+
+/**
+ * Stores the structure `name` of `text`, evicting the least recently used structures until the cache fits its capacity.
+ * Structures larger than the whole capacity are not stored.
+ */
+function result_cache_set(cache: ResultCache, text: string, name: string, value: any): void {
+    if (value === undefined) { return; }
+    const key = result_cache_key(cache, text, name);
+    const size = (value !== null && typeof value.length === 'number') ? Math.max(1, value.length) : 1;
+    const old = cache.entries.get(key);
+    if (old !== undefined) {
+        cache.entries.delete(key);
+        cache.size -= old.size;
+    }
+    if (size > cache.capacity) { return; }
+    while (cache.size + size > cache.capacity) {
+        const oldest = cache.entries.keys().next().value as string;
+        cache.size -= (cache.entries.get(oldest) as ResultCacheEntry).size;
+        cache.entries.delete(oldest);
+    }
+    cache.entries.set(key, { text: text, value: value, size: size });
+    cache.size += size;
+}
+
+export function test_result_cache(): void {
+    assert_eq(text_hash("banana"), text_hash("ban" + "ana"), "Equal texts hash equally");
+    assert_eq(text_hash("banana") === text_hash("bananb"), false, "Different texts hash differently");
+
+    const cache = result_cache_create(9);
+    result_cache_set(cache, "banana", "suffix_array", [5, 3, 1, 0, 4, 2]);
+    result_cache_set(cache, "banana", "counter_n", 6);
+    assert_eq(result_cache_get(cache, "banana", "suffix_array"), [5, 3, 1, 0, 4, 2], "Cached structure");
+    assert_eq(result_cache_get(cache, "banana", "lcp_array"), undefined, "Missing structure");
+    assert_eq(result_cache_get(cache, "ananas", "suffix_array"), undefined, "Other text");
+    assert_eq(cache.size, 7, "Size counts elements");
+
+    // suffix_array was used last, so counter_n is evicted first
+    result_cache_set(cache, "banana", "border_array", [0, 0, 0]);
+    assert_eq(result_cache_get(cache, "banana", "counter_n"), undefined, "Least recently used is evicted");
+    assert_eq(result_cache_get(cache, "banana", "border_array"), [0, 0, 0], "New structure is cached");
+    result_cache_set(cache, "banana", "border_array", [0, 0]);
+    assert_eq(cache.size, 8, "Replacing a structure updates the size");
+    result_cache_set(cache, "banana", "lcp_array", new Array(10).fill(0));
+    assert_eq(result_cache_get(cache, "banana", "lcp_array"), undefined, "Oversized structures are not cached");
+    assert_eq(result_cache_get(cache, "banana", "suffix_array"), [5, 3, 1, 0, 4, 2], "Oversized structures evict nothing");
+}
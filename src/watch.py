@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Rebuilds the development page whenever a file in src/ or assets/ changes, and reloads it in the browser.
+
+Changes are reported by inotify (polling where it is unavailable) and rebuilt by build.py with a pool of worker processes
+that is kept across rebuilds, so only the stages whose inputs changed run, in workers that have imported the scripts already.
+A local server serves build/ with build/uncompressed.html as index, and tells every open page to reload
+through a server-sent event stream after each successful rebuild that changed an output.
+"""
+# pylint: disable=bad-indentation,line-too-long,invalid-name
+
+import argparse
+import ctypes
+import ctypes.util
+import functools
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import build
+import common as C
+
+WATCHED_DIRS = [C.SOURCE_DIR, C.ASSET_DIR]
+# Stages of the development page build/uncompressed.html
+PAGE_STAGES = ['assets', 'external', 'compile_javascript', 'skeleton']
+# Changes arriving within this time after the first one are rebuilt together
+DEBOUNCE_SECONDS = 0.05
+
+RELOAD_PATH = '/__reload'
+RELOAD_SCRIPT = f"<script>new EventSource('{RELOAD_PATH}').onmessage = () => location.reload();</script>\n"
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def ignored(name):
+	# editor swap and backup files
+	return name.startswith('.') or name.endswith(('~', '.swp', '.tmp'))
+
+
+class InotifyWatcher:
+	"""Reports the names of the files written, moved or deleted in the watched directories."""
+	def __init__(self, directories):
+		libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+		self.fd = libc.inotify_init1(IN_CLOEXEC)
+		if self.fd < 0:
+			raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+		self.directories = {}
+		for directory in directories:
+			wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE)
+			if wd < 0:
+				raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+			self.directories[wd] = directory
+
+	def changes(self, timeout):
+		"""Waits up to `timeout` seconds (forever if None) for changes; returns the changed paths."""
+		if not select.select([self.fd], [], [], timeout)[0]:
+			return set()
+		data = os.read(self.fd, 1 << 16)
+		changed = set()
+		offset = 0
+		while offset < len(data):
+			wd, _, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+			name = data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0').decode(errors='replace')
+			offset += INOTIFY_EVENT.size + length
+			if name and not ignored(name):
+				changed.add(self.directories[wd] / name)
+		return changed
+
+
+class PollingWatcher:
+	"""Fallback of InotifyWatcher comparing the modification times of the files every POLL_SECONDS."""
+	POLL_SECONDS = 0.2
+
+	def __init__(self, directories):
+		self.directories = directories
+		self.mtimes = self.scan()
+
+	def scan(self):
+		return {path: path.stat().st_mtime_ns for directory in self.directories for path in directory.iterdir() if path.is_file() and not ignored(path.name)}
+
+	def changes(self, timeout):
+		deadline = None if timeout is None else time.monotonic() + timeout
+		while True:
+			mtimes = self.scan()
+			changed = {path for path in mtimes.keys() | self.mtimes.keys() if mtimes.get(path) != self.mtimes.get(path)}
+			self.mtimes = mtimes
+			if changed or (deadline is not None and time.monotonic() >= deadline):
+				return changed
+			time.sleep(self.POLL_SECONDS if deadline is None else max(0, min(self.POLL_SECONDS, deadline - time.monotonic())))
+
+
+class ReloadHandler(SimpleHTTPRequestHandler):
+	"""Serves build/ without caching, adds the reload script to HTML pages and streams reload events."""
+	reloads = threading.Condition()
+	generation = 0
+
+	def end_headers(self):
+		self.send_header('Cache-Control', 'no-store')
+		super().end_headers()
+
+	def log_message(self, format, *args): # pylint: disable=redefined-builtin
+		pass
+
+	def do_GET(self):
+		path = self.path.split('?', 1)[0]
+		if path == RELOAD_PATH:
+			self.stream_reloads()
+			return
+		if path == '/':
+			path = '/' + C.BUILD_HTML.name
+		if not path.endswith('.html'):
+			super().do_GET()
+			return
+		file = C.BUILD_DIR / path.lstrip('/')
+		if '..' in path or not file.is_file():
+			self.send_error(404)
+			return
+		html = file.read_text(encoding='utf-8')
+		index = html.lower().rfind('</html>')
+		body = (html[:index] + RELOAD_SCRIPT + html[index:] if index >= 0 else html + RELOAD_SCRIPT).encode('utf-8')
+		self.send_response(200)
+		self.send_header('Content-Type', 'text/html; charset=utf-8')
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def stream_reloads(self):
+		self.send_response(200)
+		self.send_header('Content-Type', 'text/event-stream')
+		self.end_headers()
+		with self.reloads:
+			generation = ReloadHandler.generation
+		try:
+			while True:
+				with self.reloads:
+					# the comment line doubles as a check whether the page is still open
+					self.reloads.wait_for(lambda: ReloadHandler.generation != generation, timeout=15)
+					message = 'data: reload\n\n' if ReloadHandler.generation != generation else ': ping\n\n'
+					generation = ReloadHandler.generation
+				self.wfile.write(message.encode('utf-8'))
+				self.wfile.flush()
+		except (BrokenPipeError, ConnectionResetError):
+			pass
+
+	@classmethod
+	def reload(cls):
+		with cls.reloads:
+			cls.generation += 1
+			cls.reloads.notify_all()
+
+
+def rebuild(stages, pool, reason):
+	start = time.monotonic()
+	try:
+		changed, failed = build.build(stages, False, False, pool)
+	except (ValueError, FileNotFoundError) as e:
+		print(f"Error: {e}", file=sys.stderr)
+		return
+	if failed:
+		print(f"Build failed in {time.monotonic() - start:.2f}s, waiting for changes", file=sys.stderr)
+		return
+	if changed:
+		ReloadHandler.reload()
+		print(f"Rebuilt {', '.join(changed)} in {time.monotonic() - start:.2f}s {reason}, reloading the page")
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Rebuild the development page on changes and reload it in the browser")
+	parser.add_argument("stages", nargs="*", default=PAGE_STAGES, help="stages to keep up to date (default: the development page)")
+	parser.add_argument("--port", type=int, default=8000, help="port of the local server")
+	parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+	args = parser.parse_args()
+
+	try:
+		watcher = InotifyWatcher(WATCHED_DIRS)
+	except (OSError, AttributeError) as e:
+		print(f"Warning: inotify is not available ({e}), polling for changes", file=sys.stderr)
+		watcher = PollingWatcher(WATCHED_DIRS)
+
+	server = ThreadingHTTPServer(('127.0.0.1', args.port), functools.partial(ReloadHandler, directory=str(C.BUILD_DIR)))
+	server.daemon_threads = True
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+
+	with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+		rebuild(args.stages, pool, "at startup")
+		print(f"Serving http://127.0.0.1:{args.port}/ and watching {', '.join(str(d.relative_to(C.REPOSITORY_DIR)) for d in WATCHED_DIRS)}")
+		try:
+			while True:
+				changed = watcher.changes(None)
+				while more := watcher.changes(DEBOUNCE_SECONDS):
+					changed |= more
+				if changed:
+					rebuild(args.stages, pool, "after changes to " + ", ".join(sorted(path.name for path in changed)))
+		except KeyboardInterrupt:
+			pass
+		finally:
+			server.shutdown()
+
+
+if __name__ == "__main__":
+	main()